@@ -0,0 +1,253 @@
+"""
+Questo modulo mantiene in memoria una copia dell'albero delle Sedi.
+
+L'albero (poche migliaia di sedi) cambia raramente, mentre espansioni, discendenti e superiori
+ vengono richiesti migliaia di volte. AlberoSedi contiene, per ogni sede, solo pk, genitore,
+ lft/rght (MPTT), estensione e attiva, e risponde a queste richieste senza accedere al database,
+ ritornando liste di pk da usare come filtro pk__in.
+
+La copia e' locale al processo ed e' versionata:
+ - il contatore locale viene incrementato al salvataggio o alla cancellazione di una Sede
+   (vedi invalida_albero), e la copia viene ricostruita al successivo utilizzo. Dentro una
+   transazione l'incremento e' rimandato al commit, una volta sola per tutte le sedi modificate
+   (es. la disattivazione di una sede e delle sue sottosedi): fino ad allora albero_sedi ritorna
+   None ed il processo usa il database, che vede le modifiche non ancora confermate. Se la
+   transazione viene annullata, la copia resta valida;
+ - per le modifiche fatte da altri processi, ogni settings.SEDI_ALBERO_VERIFICA secondi viene
+   confrontata la versione del database (numero di sedi e ultima modifica). Le modifiche che non
+   passano da Sede.save (es. Sede.objects.rebuild(), update) devono chiamare
+   invalida_albero(tutti_i_processi=True).
+"""
+import threading
+import time
+from bisect import bisect_left
+
+from django.apps import apps
+from django.conf import settings
+from django.db import connection
+from django.db.models import Count, Max
+from django.db.transaction import on_commit
+from django.utils import timezone
+
+from anagrafica.costanti import NAZIONALE, REGIONALE, PROVINCIALE, LOCALE, TERRITORIALE
+
+COMITATI = (NAZIONALE, REGIONALE, PROVINCIALE, LOCALE)
+
+_lock = threading.Lock()
+_albero = None
+_versione_locale = 0
+
+
+class AlberoSedi(object):
+    """
+    Copia in memoria dell'albero delle sedi. Tutti i metodi ritornano pk (o liste di pk),
+     nell'ordine dell'albero (tree_id, lft), come i QuerySet di django-mptt.
+    """
+
+    def __init__(self, righe, versione_locale=0, versione_database=None):
+        """
+        :param righe: Iterabile di tuple (pk, genitore_id, tree_id, lft, rght, estensione, attiva),
+                      ordinate per (tree_id, lft).
+        """
+        righe = list(righe)
+        self.pk = [r[0] for r in righe]
+        self.indice = {pk: i for i, pk in enumerate(self.pk)}
+        self.genitore = [self.indice.get(r[1]) for r in righe]
+        self.estensione = [r[5] for r in righe]
+        self.attiva = [r[6] for r in righe]
+
+        # Come ModelloAlbero.filtro_attivi: attiva, e genitore assente o attivo
+        self.attivo = [a and (g is None or self.attiva[g]) for a, g in zip(self.attiva, self.genitore)]
+
+        # I discendenti di una sede sono contigui nell'ordine (tree_id, lft): fine[i] e' l'indice
+        #  successivo all'ultimo discendente.
+        chiavi = [(r[2], r[3]) for r in righe]
+        self.fine = [bisect_left(chiavi, (r[2], r[4]), i + 1) for i, r in enumerate(righe)]
+
+        self.figli = [[] for _ in righe]
+        for i, g in enumerate(self.genitore):
+            if g is not None:
+                self.figli[g].append(i)
+
+        self.versione_locale = versione_locale
+        self.versione_database = versione_database
+        self.verificato = time.time()
+
+    def __len__(self):
+        return len(self.pk)
+
+    def contiene(self, pks):
+        """
+        Verifica che tutte le sedi siano presenti nella copia (es. non create da un altro
+         processo dopo la sua costruzione). Altrimenti, il chiamante deve usare il database.
+        """
+        return all(pk in self.indice for pk in pks)
+
+    def _indici(self, pks):
+        return [self.indice[pk] for pk in pks if pk in self.indice]
+
+    def _pk(self, indici, solo_attivi=False, estensione=None):
+        return [self.pk[i] for i in sorted(indici)
+                if (not solo_attivi or self.attivo[i]) and (estensione is None or self.estensione[i] in estensione)]
+
+    def discendenti(self, pk, includimi=False, solo_attivi=True):
+        """
+        Come ModelloAlbero.ottieni_discendenti.
+        """
+        i = self.indice[pk]
+        return self._pk(range(i if includimi else i + 1, self.fine[i]), solo_attivi=solo_attivi)
+
+    def figli_di(self, pk, solo_attivi=True, estensione=None):
+        """
+        Come ModelloAlbero.ottieni_figli, opzionalmente filtrati per estensione (tupla).
+        """
+        return self._pk(self.figli[self.indice[pk]], solo_attivi=solo_attivi, estensione=estensione)
+
+    def superiori(self, pk, includimi=False, solo_attivi=True):
+        """
+        Come ModelloAlbero.ottieni_superiori.
+        """
+        i = self.indice[pk]
+        indici = [i] if includimi else []
+        g = self.genitore[i]
+        while g is not None:
+            indici.append(g)
+            g = self.genitore[g]
+        return self._pk(indici, solo_attivi=solo_attivi)
+
+    def superiore(self, pk, estensione=LOCALE):
+        """
+        Come Sede.superiore: il primo superiore con l'estensione specificata, o None.
+        """
+        g = self.genitore[self.indice[pk]]
+        while g is not None:
+            if self.estensione[g] == estensione:
+                return self.pk[g]
+            g = self.genitore[g]
+        return None
+
+    def comitato(self, pk):
+        """
+        Come Sede.comitato: la sede stessa se comitato, altrimenti il genitore.
+        """
+        i = self.indice[pk]
+        if self.estensione[i] in COMITATI:
+            return pk
+        g = self.genitore[i]
+        return self.pk[g] if g is not None else None
+
+    def espandi(self, pks, pubblici=False, ignora_disattive=True):
+        """
+        Come SedeQuerySet.espandi: le sedi, le unita' territoriali dei comitati provinciali e
+         locali e, se pubblici, tutti i discendenti dei comitati nazionali e regionali.
+        """
+        indici = set()
+        for i in self._indici(pks):
+            indici.add(i)
+            if self.estensione[i] in (PROVINCIALE, LOCALE):
+                indici.update(f for f in self.figli[i] if self.estensione[f] == TERRITORIALE)
+            elif pubblici and self.estensione[i] in (NAZIONALE, REGIONALE):
+                indici.update(range(i, self.fine[i]))
+        return [self.pk[i] for i in sorted(indici) if not ignora_disattive or self.attiva[i]]
+
+    def espandi_sede(self, pk, includi_me=False, pubblici=False, ignora_disattive=True):
+        """
+        Come Sede.espandi.
+        """
+        i = self.indice[pk]
+        if pubblici and self.estensione[i] in (NAZIONALE, REGIONALE):
+            pks = self.discendenti(pk, includimi=includi_me)
+        elif self.estensione[i] in (PROVINCIALE, LOCALE):
+            unita = [f for f in self.figli[i] if self.attivo[f] and self.estensione[f] == TERRITORIALE]
+            pks = self._pk(unita + [i])
+        elif includi_me:
+            pks = [pk]
+        else:
+            pks = []
+        return [x for x in pks if not ignora_disattive or self.attiva[self.indice[x]]]
+
+
+def _versione_database():
+    Sede = apps.get_model('anagrafica', 'Sede')
+    versione = Sede.objects.order_by().aggregate(numero=Count('pk'), ultima_modifica=Max('ultima_modifica'))
+    return versione['numero'], versione['ultima_modifica']
+
+
+def _costruisci(versione_locale):
+    Sede = apps.get_model('anagrafica', 'Sede')
+    versione_database = _versione_database()
+    righe = Sede.objects.order_by('tree_id', 'lft').values_list(
+        'pk', 'genitore_id', 'tree_id', 'lft', 'rght', 'estensione', 'attiva',
+    )
+    return AlberoSedi(righe, versione_locale=versione_locale, versione_database=versione_database)
+
+
+class _InvalidazioneAlCommit(object):
+    """
+    Invalidazione rimandata al commit della transazione che ha modificato le sedi.
+    """
+
+    def __init__(self):
+        self.eseguita = False
+
+    def __call__(self):
+        global _versione_locale
+        self.eseguita = True
+        with _lock:
+            _versione_locale += 1
+
+
+def _invalidazione_in_sospeso():
+    """
+    :return: L'invalidazione rimandata al commit della transazione in corso, o None.
+    """
+    for _, funzione in connection.run_on_commit:
+        if isinstance(funzione, _InvalidazioneAlCommit) and not funzione.eseguita:
+            return funzione
+    return None
+
+
+def albero_sedi():
+    """
+    Ritorna la copia in memoria dell'albero delle sedi, ricostruendola se non aggiornata.
+    :return: AlberoSedi, o None se disattivato (settings.SEDI_ALBERO_MEMORIA) o se le sedi sono
+             state modificate nella transazione in corso.
+    """
+    global _albero
+    if not settings.SEDI_ALBERO_MEMORIA or _invalidazione_in_sospeso() is not None:
+        return None
+
+    with _lock:
+        albero = _albero
+        if albero is not None and albero.versione_locale == _versione_locale \
+                and time.time() - albero.verificato > settings.SEDI_ALBERO_VERIFICA:
+            if _versione_database() == albero.versione_database:
+                albero.verificato = time.time()
+            else:
+                albero = None
+
+        if albero is None or albero.versione_locale != _versione_locale:
+            albero = _albero = _costruisci(_versione_locale)
+
+        return albero
+
+
+def invalida_albero(tutti_i_processi=False):
+    """
+    Invalida la copia in memoria dell'albero, che verra' ricostruita al prossimo utilizzo.
+     Dentro una transazione, l'invalidazione avviene al commit (una sola volta).
+    Chiamato automaticamente da Sede.save() e Sede.delete().
+    :param tutti_i_processi: Segnala la modifica anche agli altri processi, aggiornando l'ultima
+                             modifica di una sede. Da usare dopo modifiche all'albero che non
+                             passano da Sede.save() (es. Sede.objects.rebuild()).
+    """
+    if not connection.in_atomic_block:
+        _InvalidazioneAlCommit()()
+    elif _invalidazione_in_sospeso() is None:
+        on_commit(_InvalidazioneAlCommit())
+
+    if tutti_i_processi:
+        Sede = apps.get_model('anagrafica', 'Sede')
+        primo = Sede.objects.order_by('pk').values_list('pk', flat=True).first()
+        if primo is not None:
+            Sede.objects.filter(pk=primo).update(ultima_modifica=timezone.now())
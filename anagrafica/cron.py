@@ -4,6 +4,7 @@ from django_cron import CronJobBase, Schedule
 
 from anagrafica.costanti import NAZIONALE, REGIONALE, PROVINCIALE, LOCALE, TERRITORIALE
 from anagrafica.models import Sede
+from anagrafica.statistiche import aggiorna_statistiche
 from anagrafica.utils import termina_deleghe_giovani
 from base.files import Excel, FoglioExcel
 from base.utils import poco_fa
@@ -118,3 +119,17 @@ def CronTerminaNonGiovani(CronJobBase):
 
     def do(self):
         termina_deleghe_giovani()
+
+
+class CronStatistiche(CronJobBase):
+    """
+    Aggiorna le statistiche salvate del pannello di amministrazione (vedi anagrafica.statistiche).
+    """
+
+    RUN_EVERY_MINS = 60
+
+    schedule = Schedule(run_every_mins=RUN_EVERY_MINS)
+    code = 'anagrafica.statistiche'
+
+    def do(self):
+        aggiorna_statistiche()
@@ -1,12 +1,34 @@
+"""
+Questo modulo implementa l'importazione massiva dei volontari da file CSV.
+
+L'importazione avviene in due fasi:
+ - le tabelle di ricerca (sedi per nome, persone pre-esistenti per codice fiscale con le loro
+   appartenenze, utenze per email) vengono caricate con poche query per tutto il file
+   (vedi ContestoImportazione), invece che con alcune query per ogni riga;
+ - le righe vengono validate una alla volta e quelle valide vengono scritte a blocchi, ognuno
+   in una transazione, con bulk_create (vedi importa_volontari).
+
+Per ogni riga viene prodotto l'esito, che puo' essere salvato come rapporto Excel
+ (vedi rapporto_importazione). Vedi anche il comando importa_volontari.
+"""
+import codecs
+import csv
 import datetime
 import re
+from collections import defaultdict
 
 import codicefiscale
+import phonenumbers
+from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.core.validators import validate_email
+from django.db.models.functions import Lower
+from django.db.transaction import atomic
 
-from anagrafica.models import Persona, Sede, Appartenenza
+from anagrafica.models import Persona, Sede, Appartenenza, Telefono
 from autenticazione.models import Utenza
+from base.files import Excel
+from base.memoria import invalida_memoria
 from base.stringhe import normalizza_nome
 from base.utils import poco_fa
 from formazione.models import Aspirante
@@ -15,10 +37,117 @@ VALIDAZIONE_OK = "OK"
 VALIDAZIONE_AVVISO = "AVVISO"
 VALIDAZIONE_ERRORE = "ERRORE"
 
-def import_valida_volontario_riga(riga):
-
-    for i in range(0, len(riga)):
-        riga[i] = riga[i]
+DIMENSIONE_BLOCCO = 500
+
+
+def leggi_csv(nome_file, delimitatore=','):
+    """
+    Legge le righe di un file CSV in UTF-8, saltando l'intestazione.
+    :param nome_file: Il percorso del file.
+    :param delimitatore: Il delimitatore delle colonne.
+    :return: Generatore di liste di stringhe.
+    """
+    with codecs.open(nome_file, encoding="utf-8") as csvfile:
+        lettore = csv.reader(csvfile, delimiter=delimitatore)
+        next(lettore, None)
+        for riga in lettore:
+            yield riga
+
+
+def _blocchi(valori, dimensione=1000):
+    valori = list(valori)
+    for i in range(0, len(valori), dimensione):
+        yield valori[i:i + dimensione]
+
+
+class ContestoImportazione(object):
+    """
+    Tabelle di ricerca per la validazione e l'importazione, caricate una volta per tutto il file.
+    Tiene anche traccia dei codici fiscali e delle email delle righe gia' validate, per
+     riconoscere i duplicati all'interno del file.
+    """
+
+    def __init__(self, righe):
+        """
+        :param righe: Iterabile delle righe del file (viene letto una volta).
+        """
+        codici_fiscali, email = set(), set()
+        for riga in righe:
+            codici_fiscali.add(riga[4].upper())
+            indirizzo = riga[10] or riga[11]
+            if indirizzo:
+                email.add(indirizzo.lower())
+
+        self.sedi = defaultdict(list)
+        for sede in Sede.objects.all():
+            self.sedi[sede.nome.lower()].append(sede)
+
+        self.persone = {}
+        for blocco in _blocchi(codici_fiscali):
+            self.persone.update({p.codice_fiscale: p for p in Persona.objects.filter(codice_fiscale__in=blocco)})
+        persone = [p.pk for p in self.persone.values()]
+
+        self.appartenenze = defaultdict(list)
+        self.aspiranti = set()
+        self.con_utenza = set()
+        for blocco in _blocchi(persone):
+            for appartenenza in Appartenenza.objects.filter(Appartenenza.query_attuale().q, persona_id__in=blocco)\
+                    .select_related('sede', 'sede__genitore'):
+                self.appartenenze[appartenenza.persona_id].append(appartenenza)
+            self.aspiranti.update(Aspirante.objects.filter(persona_id__in=blocco).values_list('persona_id', flat=True))
+            self.con_utenza.update(Utenza.objects.filter(persona_id__in=blocco).values_list('persona_id', flat=True))
+
+        self.email_esistenti = set()
+        for blocco in _blocchi(email):
+            self.email_esistenti.update(Utenza.objects.annotate(email_minuscola=Lower('email'))
+                                        .filter(email_minuscola__in=blocco).values_list('email_minuscola', flat=True))
+
+        self.sedi_comitato = {}
+        self.codici_fiscali_file = {}
+        self.email_file = set()
+
+    def sede(self, nome):
+        """
+        Ritorna la sede con il nome specificato (senza distinzione tra maiuscole e minuscole).
+        :raises Sede.DoesNotExist, Sede.MultipleObjectsReturned:
+        """
+        sedi = self.sedi.get(nome.lower(), [])
+        if not sedi:
+            raise Sede.DoesNotExist
+        if len(sedi) > 1:
+            raise Sede.MultipleObjectsReturned
+        return sedi[0]
+
+    def espansione_comitato(self, sede):
+        """
+        Ritorna l'insieme dei pk di sede.comitato.espandi(includi_me=True), calcolato una volta per sede.
+        """
+        if sede.pk not in self.sedi_comitato:
+            self.sedi_comitato[sede.pk] = set(sede.comitato.espandi(includi_me=True).values_list('pk', flat=True))
+        return self.sedi_comitato[sede.pk]
+
+    def email_in_uso(self, email):
+        return email.lower() in self.email_esistenti or email.lower() in self.email_file
+
+    def registra(self, numero, codice_fiscale, email, crea_utenza):
+        """
+        Registra i dati di una riga valida.
+        """
+        self.codici_fiscali_file[codice_fiscale] = numero
+        if email and crea_utenza:
+            self.email_file.add(email.lower())
+
+
+def import_valida_volontario_riga(riga, contesto=None, numero=None):
+    """
+    Valida una riga del file.
+    :param riga: Lista delle colonne.
+    :param contesto: ContestoImportazione. Se non specificato, viene creato per la sola riga.
+    :param numero: Numero della riga nel file, per segnalare i duplicati.
+    :return: Lista di tuple (esito, messaggio o dati). Se la riga e' valida, l'ultima tupla e'
+             (VALIDAZIONE_OK, dati).
+    """
+    contesto = contesto or ContestoImportazione([riga])
 
     log = []
 
@@ -55,13 +184,19 @@ def import_valida_volontario_riga(riga):
     if not codicefiscale.isvalid(codice_fiscale):
         log += [(VALIDAZIONE_ERRORE, "Codice fiscale non valido")]
 
+    elif codice_fiscale in contesto.codici_fiscali_file:
+        log += [(VALIDAZIONE_ERRORE, "Codice fiscale ripetuto nel file (riga %s)" % (
+            contesto.codici_fiscali_file[codice_fiscale],))]
+
     sede = riga[15]
     try:
-        sede = Sede.objects.get(nome__iexact=sede)
+        sede = contesto.sede(sede)
     except Sede.DoesNotExist:
         log += [(VALIDAZIONE_ERRORE, "Sede non trovata: %s" % (sede,))]
         sede = None
-
+    except Sede.MultipleObjectsReturned:
+        log += [(VALIDAZIONE_ERRORE, "Esistono piu' sedi con il nome: %s" % (sede,))]
+        sede = None
 
     email = riga[10]
     email_2 = riga[11]
@@ -73,16 +208,18 @@ def import_valida_volontario_riga(riga):
         except ValidationError:
             log += [(VALIDAZIONE_ERRORE, "E-mail non valida")]
 
-
-    precedente = Persona.objects.filter(codice_fiscale=codice_fiscale).first()
+    crea_utenza = False
+    precedente = contesto.persone.get(codice_fiscale)
     if sede:
         if precedente:
 
-            presso_mia_sede = precedente.appartenenze_attuali().filter(sede__in=sede.comitato.espandi(includi_me=True)).first()
-            presso_qualche_sede = precedente.appartenenze_attuali().exists()
-            aspirante = Aspirante.objects.filter(persona=precedente).exists()
+            appartenenze = contesto.appartenenze[precedente.pk]
+            presso_mia_sede = [a for a in appartenenze if a.sede_id in contesto.espansione_comitato(sede)]
+            presso_qualche_sede = bool(appartenenze)
+            aspirante = precedente.pk in contesto.aspiranti
 
             if presso_mia_sede:
+                presso_mia_sede = presso_mia_sede[0]
                 log += [(VALIDAZIONE_ERRORE, "Già appartenente come %s presso %s" % (presso_mia_sede.get_membro_display(), presso_mia_sede.sede.nome_completo))]
 
             elif presso_qualche_sede:
@@ -95,11 +232,13 @@ def import_valida_volontario_riga(riga):
             else:
                 log += [(VALIDAZIONE_AVVISO, "Esiste in Gaia ma senza alcuna appartenenza")]
 
+            crea_utenza = email and precedente.pk not in contesto.con_utenza and not contesto.email_in_uso(email)
+
         else:
 
             # log += [(VALIDAZIONE_AVVISO, "Non pre-esistente in Gaia")]
 
-            if email and Utenza.objects.filter(email__iexact=email).exists():
+            if email and contesto.email_in_uso(email):
                 log += [(VALIDAZIONE_AVVISO, "Impossibile attivare credenziali automaticamente, email gia esistente (%s), "
                                              "sarà necessario attivare delle credenziali manualmente dal pannello credenziali"
                                              " della sua scheda." % (email,))]
@@ -109,8 +248,8 @@ def import_valida_volontario_riga(riga):
                              "sarà necessario attivare delle credenziali manualmente dal pannello credenziali"
                              " della sua scheda.")]
 
-
-
+            else:
+                crea_utenza = True
 
     indirizzo_residenza = "%s, %s" % (riga[5], riga[6])
     if indirizzo_residenza == ", ":
@@ -141,6 +280,7 @@ def import_valida_volontario_riga(riga):
         log += [(VALIDAZIONE_ERRORE, "Data di ingresso errata (prima del 1800)")]
 
     if not _ha_errore(log):
+        contesto.registra(numero, codice_fiscale, email, crea_utenza)
         log += [
             (VALIDAZIONE_OK,
              {
@@ -162,6 +302,8 @@ def import_valida_volontario_riga(riga):
                  "telefono_servizio": telefono_servizio,
                  "data_ingresso": data_ingresso,
                  "sede": sede,
+                 "persona": precedente,
+                 "crea_utenza": crea_utenza,
              }
              )
         ]
@@ -182,66 +324,165 @@ def _ottieni_dati(risultato):
     raise ValueError("Non ci sono dati qui")
 
 
-def import_valida_volontari(righe):
-    risultato = []
-    for riga in righe:
-        validazione = import_valida_volontario_riga(riga)
-        risultato += [validazione]
-    return risultato
-
-
-def import_import_volontari(risultato):
-    i = 0
-    for p in risultato:
-        if _ha_errore(p):
-            continue
-
-        dati = _ottieni_dati(p)
+def import_valida_volontari(righe, contesto=None):
+    """
+    Valida le righe del file.
+    :param righe: Lista delle righe.
+    :param contesto: ContestoImportazione. Se non specificato, viene creato per le righe.
+    :return: Lista dei risultati di import_valida_volontario_riga, uno per riga.
+    """
+    contesto = contesto or ContestoImportazione(righe)
+    return [import_valida_volontario_riga(riga, contesto, numero=i + 2)  # La riga 1 e' l'intestazione
+            for i, riga in enumerate(righe)]
 
-        dati_persona = {x: y for x, y in dati.items() if x in [
-            "nome", "cognome", "codice_fiscale", "data_nascita", "comune_nascita",
-            "provincia_nascita", "stato_nascita", "stato_residenza",
-            "cap_residenza", "indirizzo_residenza", "comune_residenza",
-            "email_contatto"
-        ]}
 
-        try:
-            persona = Persona.objects.get(codice_fiscale__iexact=dati_persona['codice_fiscale'])
-
-        except Persona.DoesNotExist:
-            persona = Persona(**dati_persona)
-            persona.save()
-
-        if dati['telefono']:
-            persona.aggiungi_numero_telefono(dati['telefono'], servizio=False)
-
-        if dati['telefono_servizio']:
-            persona.aggiungi_numero_telefono(dati['telefono_servizio'], servizio=True)
-
-        for app in persona.appartenenze_attuali():
-            app.fine = poco_fa()
-            app.save()
-
-        # Cancella aspirante associato
-        Aspirante.objects.filter(persona=persona).delete()
-
-        app = Appartenenza(
-            persona=persona,
-            sede=dati['sede'],
-            inizio=dati['data_ingresso'],
-            membro=Appartenenza.VOLONTARIO,
-        )
-        app.save()
-
-        if dati['email'] and not Utenza.objects.filter(persona=persona).exists():
-            # Non ha utenza
-            if not Utenza.objects.filter(email__iexact=dati['email']):
-                # Non esiste, prova a creare
-                u = Utenza(persona=persona, email=dati['email'])
-                u.save()
-                u.genera_credenziali()
-
-        i += 1
+def _numero_telefono(numero, paese="IT"):
+    """
+    Come Persona.aggiungi_numero_telefono: il numero in formato E164, o None se mal formattato.
+    """
+    try:
+        return phonenumbers.format_number(phonenumbers.parse(numero, paese), phonenumbers.PhoneNumberFormat.E164)
+    except phonenumbers.phonenumberutil.NumberParseException:
+        return None
+
+
+def _importa_blocco(blocco):
+    """
+    Importa un blocco di righe valide in una transazione.
+    :param blocco: Lista di dati validati (vedi import_valida_volontario_riga).
+    :return: Lista delle utenze create, a cui inviare le credenziali.
+    """
+    campi_persona = [
+        "nome", "cognome", "codice_fiscale", "data_nascita", "comune_nascita",
+        "provincia_nascita", "stato_nascita", "stato_residenza",
+        "cap_residenza", "indirizzo_residenza", "comune_residenza",
+        "email_contatto"
+    ]
+
+    with atomic():
+        nuove = [Persona(**{x: y for x, y in dati.items() if x in campi_persona})
+                 for dati in blocco if dati['persona'] is None]
+        Persona.objects.bulk_create(nuove)
+
+        # bulk_create non valorizza le chiavi primarie: le ricarica per codice fiscale
+        persone = {dati['codice_fiscale']: dati['persona'].pk for dati in blocco if dati['persona'] is not None}
+        persone.update(Persona.objects.filter(codice_fiscale__in=[p.codice_fiscale for p in nuove])
+                       .values_list('codice_fiscale', 'pk'))
+        esistenti = [dati['persona'].pk for dati in blocco if dati['persona'] is not None]
+        tutte = list(persone.values())
+
+        telefoni = []
+        for dati in blocco:
+            for campo, servizio in (('telefono', False), ('telefono_servizio', True)):
+                numero = _numero_telefono(dati[campo]) if dati[campo] else None
+                if numero:
+                    telefoni += [Telefono(persona_id=persone[dati['codice_fiscale']], numero=numero, servizio=servizio)]
+        Telefono.objects.bulk_create(telefoni)
+
+        Appartenenza.objects.filter(Appartenenza.query_attuale().q, persona_id__in=esistenti).update(fine=poco_fa())
+
+        # Cancella aspiranti associati
+        Aspirante.objects.filter(persona_id__in=tutte).delete()
+
+        Appartenenza.objects.bulk_create([
+            Appartenenza(
+                persona_id=persone[dati['codice_fiscale']],
+                sede=dati['sede'],
+                inizio=dati['data_ingresso'],
+                membro=Appartenenza.VOLONTARIO,
+            ) for dati in blocco
+        ])
+
+        utenze = [Utenza(persona_id=persone[dati['codice_fiscale']], email=dati['email'])
+                  for dati in blocco if dati['crea_utenza']]
+        Utenza.objects.bulk_create(utenze)
+
+        invalida_memoria()
+        if settings.SEGMENTI_PRECALCOLATI:
+            from segmenti.membri import aggiorna_segmenti
+            aggiorna_segmenti(Persona.objects.filter(pk__in=tutte))
+        # Le appartenenze sono state chiuse e create senza save(): aggiorna lo stato delle quote
+        from ufficio_soci.stato_quote import aggiorna_stato_persone, anni_aperti
+        aggiorna_stato_persone(tutte, anni=anni_aperti())
+
+    return list(Utenza.objects.filter(persona_id__in=[u.persona_id for u in utenze]).select_related('persona'))
+
+
+def importa_volontari(righe, contesto, importa=True, dimensione_blocco=DIMENSIONE_BLOCCO, progresso=None):
+    """
+    Valida le righe ed importa quelle valide, a blocchi. Le credenziali vengono generate
+     ed inviate dopo il salvataggio di ogni blocco.
+    :param righe: Iterabile delle righe del file, letto una volta.
+    :param contesto: ContestoImportazione, creato sulle stesse righe.
+    :param importa: Se False, valida solamente.
+    :param dimensione_blocco: Numero di righe valide importate per transazione.
+    :param progresso: Funzione chiamata dopo ogni blocco con (righe elaborate, righe importate).
+    :return: Generatore di tuple (numero riga, riga, risultato della validazione, importata).
+    """
+    elaborate, importate = 0, 0
+    in_attesa = []
+
+    def _svuota():
+        if importa and in_attesa:
+            for utenza in _importa_blocco([_ottieni_dati(log) for numero, riga, log in in_attesa if not _ha_errore(log)]):
+                utenza.genera_credenziali()
+        for numero, riga, log in in_attesa:
+            yield numero, riga, log, importa and not _ha_errore(log)
+        del in_attesa[:]
+
+    for i, riga in enumerate(righe):
+        numero = i + 2  # La riga 1 e' l'intestazione
+        log = import_valida_volontario_riga(riga, contesto, numero=numero)
+        in_attesa.append((numero, riga, log))
+        elaborate += 1
+        importate += 1 if importa and not _ha_errore(log) else 0
+
+        if sum(1 for x in in_attesa if not _ha_errore(x[2])) >= dimensione_blocco:
+            yield from _svuota()
+            if progresso:
+                progresso(elaborate, importate)
+
+    yield from _svuota()
+    if progresso:
+        progresso(elaborate, importate)
 
-    return i
 
+def import_import_volontari(risultato):
+    """
+    Importa le righe valide di un risultato di import_valida_volontari.
+    :return: Il numero di volontari importati.
+    """
+    validi = [_ottieni_dati(p) for p in risultato if not _ha_errore(p)]
+    for blocco in _blocchi(validi, DIMENSIONE_BLOCCO):
+        for utenza in _importa_blocco(blocco):
+            utenza.genera_credenziali()
+    return len(validi)
+
+
+def rapporto_importazione(risultati, richiedente=None, nome="Importazione volontari.xlsx"):
+    """
+    Salva il rapporto dell'importazione, con una riga per ogni riga del file.
+    :param risultati: Iterabile di tuple (numero riga, riga, risultato della validazione, importata),
+                      ad esempio il generatore di importa_volontari.
+    :param richiedente: Persona a cui collegare il file (opzionale).
+    :return: Allegato (file Excel).
+    """
+    def _righe():
+        for numero, riga, log, importata in risultati:
+            if _ha_errore(log):
+                esito = VALIDAZIONE_ERRORE
+            elif importata:
+                esito = "IMPORTATO"
+            else:
+                esito = VALIDAZIONE_OK
+            messaggi = " / ".join(messaggio for tipo, messaggio in log if tipo != VALIDAZIONE_OK)
+            colonne = [numero, riga[4].upper() if len(riga) > 4 else "", riga[1] if len(riga) > 1 else "",
+                       riga[0] if riga else "", riga[15] if len(riga) > 15 else "", esito, messaggi]
+            yield "Importazione", colonne
+
+    excel = Excel(oggetto=richiedente)
+    excel.genera_e_salva_streaming(
+        ("Riga", "Codice Fiscale", "Cognome", "Nome", "Sede", "Esito", "Messaggi"),
+        _righe(), nome=nome,
+    )
+    return excel
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import time
+
+from django.core.management.base import BaseCommand
+from django.test.utils import override_settings
+
+from anagrafica.albero import albero_sedi, invalida_albero
+from anagrafica.costanti import NAZIONALE
+from anagrafica.models import Sede
+
+
+class Command(BaseCommand):
+    help = 'Confronta i tempi di Sede.espandi sulla sede nazionale, con e senza l\'albero in memoria'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--ripetizioni', type=int, dest='ripetizioni', default=100,
+                            help='Numero di espansioni per ogni modalita\'')
+
+    def _misura(self, sede, ripetizioni):
+        inizio = time.time()
+        for _ in range(ripetizioni):
+            pks = list(sede.espandi(includi_me=True, pubblici=True).values_list('pk', flat=True))
+        return (time.time() - inizio) / ripetizioni, pks
+
+    def handle(self, *args, **options):
+        sede = Sede.objects.filter(estensione=NAZIONALE, genitore__isnull=True).first()
+        if sede is None:
+            print('Nessuna sede nazionale trovata')
+            return
+
+        ripetizioni = options['ripetizioni']
+
+        with override_settings(SEDI_ALBERO_MEMORIA=False):
+            database, pks_database = self._misura(sede, ripetizioni)
+        print('Database: %.2f ms per espansione, %d sedi' % (database * 1000, len(pks_database)))
+
+        with override_settings(SEDI_ALBERO_MEMORIA=True):
+            invalida_albero()
+            inizio = time.time()
+            albero_sedi()
+            costruzione = time.time() - inizio
+            memoria, pks_memoria = self._misura(sede, ripetizioni)
+        print('Albero in memoria: costruzione %.2f ms, %.2f ms per espansione, %d sedi' % (
+            costruzione * 1000, memoria * 1000, len(pks_memoria)
+        ))
+
+        if sorted(pks_database) != sorted(pks_memoria):
+            print('ATTENZIONE: i risultati non coincidono')
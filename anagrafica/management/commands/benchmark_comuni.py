@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from base.comuni import indice_comuni
+
+# Eseguito in un nuovo processo: tempo e memoria (picco, tracemalloc) dell'import e della prima ricerca
+SCRIPT = """
+import sys, time, tracemalloc
+sys.path.insert(0, %(cartella)r)
+import base.stringhe
+tracemalloc.start()
+inizio = time.perf_counter()
+import %(modulo)s as modulo
+importato = time.perf_counter() - inizio
+codice = modulo.COMUNI['roma']
+print(importato, time.perf_counter() - inizio, tracemalloc.get_traced_memory()[1])
+"""
+
+
+class Command(BaseCommand):
+    help = 'Confronta tempo di avvio e memoria dell\'indice dei comuni con il vecchio dizionario Python'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--ripetizioni', type=int, dest='ripetizioni', default=5,
+                            help='Numero di processi per ogni modalita\'')
+
+    def _misura(self, cartella, modulo, ripetizioni):
+        misure = []
+        for _ in range(ripetizioni):
+            uscita = subprocess.check_output(
+                [sys.executable, '-c', SCRIPT % {'cartella': cartella, 'modulo': modulo}],
+                cwd=settings.BASE_DIR or '.',
+            )
+            misure.append([float(x) for x in uscita.split()])
+        # Mediana di ogni misura
+        return [sorted(colonna)[len(colonna) // 2] for colonna in zip(*misure)]
+
+    def handle(self, *args, **options):
+        cartella = tempfile.mkdtemp()
+        try:
+            # Il vecchio base/comuni.py: un dizionario {nome in minuscolo: codice} nel sorgente
+            with open(os.path.join(cartella, 'comuni_dizionario.py'), 'w', encoding='utf-8') as f:
+                f.write("COMUNI = dict((\n")
+                for comune in indice_comuni():
+                    f.write("    (%r.lower(), %r),\n" % (comune.nome, comune.codice or 'N.D.'))
+                f.write("))\n")
+
+            for nome, modulo in (('Dizionario', 'comuni_dizionario'), ('Indice', 'base.comuni')):
+                importato, ricerca, memoria = self._misura(cartella, modulo, options['ripetizioni'])
+                print('%s: import %.1f ms, import e prima ricerca %.1f ms, memoria %.0f KB' % (
+                    nome, importato * 1000, ricerca * 1000, memoria / 1024))
+        finally:
+            shutil.rmtree(cartella)
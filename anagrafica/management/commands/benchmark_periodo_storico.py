@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+from django.core.management.base import BaseCommand, CommandError
+
+from base.storico import benchmark_periodo
+
+
+class Command(BaseCommand):
+    help = 'Confronta con EXPLAIN ANALYZE il filtro di attualita\' con inizio/fine e con periodo (GiST), ' \
+           'su una tabella temporanea di appartenenze sintetiche'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--righe', type=int, dest='righe', default=1000000,
+                            help='Numero di appartenenze sintetiche')
+        parser.add_argument('--ripetizioni', type=int, dest='ripetizioni', default=5,
+                            help='Numero di esecuzioni per ogni query')
+
+    def handle(self, *args, **options):
+        risultati = benchmark_periodo(righe=options['righe'], ripetizioni=options['ripetizioni'])
+
+        tempo_periodo, nodi_periodo = risultati['periodo']
+        tempo_inizio_fine, _ = risultati['inizio/fine']
+
+        if not any('Index' in nodo for nodo in nodi_periodo):
+            print('ATTENZIONE: il filtro su periodo non utilizza l\'indice GiST')
+
+        if tempo_periodo > tempo_inizio_fine:
+            raise CommandError('Il filtro su periodo e\' piu\' lento del filtro su inizio/fine')
+
+        print('Filtro su periodo %.1f volte piu\' veloce' % (tempo_inizio_fine / max(tempo_periodo, 0.0001)))
@@ -4,6 +4,7 @@ from __future__ import absolute_import, print_function, unicode_literals
 
 from django.core.management.base import NoArgsCommand
 
+from anagrafica.albero import invalida_albero
 from anagrafica.models import Sede
 
 
@@ -12,4 +13,5 @@ class Command(NoArgsCommand):
     def handle_noargs(self, **options):
         print('Inizio controllo albero delle sedi')
         Sede.objects.rebuild()
+        invalida_albero(tutti_i_processi=True)
         print('Albero delle sedi corretto')
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from anagrafica.importa import ContestoImportazione, importa_volontari, leggi_csv, rapporto_importazione, \
+    DIMENSIONE_BLOCCO, VALIDAZIONE_ERRORE
+
+
+class Command(BaseCommand):
+    help = 'Valida ed importa i volontari da un file CSV (stesso formato di /admin/import/volontari/)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('file_csv', help='Il file CSV da importare, in UTF-8 con intestazione')
+        parser.add_argument('--delimitatore', dest='delimitatore', default=',',
+                            help='Il delimitatore delle colonne (default: ",")')
+        parser.add_argument('--importa', action='store_true', dest='importa', default=False,
+                            help='Importa le righe valide (altrimenti valida solamente)')
+        parser.add_argument('--blocco', type=int, dest='blocco', default=DIMENSIONE_BLOCCO,
+                            help='Numero di righe importate per transazione')
+
+    def handle(self, *args, **options):
+        nome_file, delimitatore = options['file_csv'], options['delimitatore']
+        inizio = time.time()
+
+        try:
+            contesto = ContestoImportazione(leggi_csv(nome_file, delimitatore))
+        except IndexError:
+            raise CommandError('File non valido o delimitatore errato')
+        except IOError as e:
+            raise CommandError(str(e))
+        print('Tabelle di ricerca caricate in %.1fs: %d persone pre-esistenti, %d email in uso' % (
+            time.time() - inizio, len(contesto.persone), len(contesto.email_esistenti)))
+
+        def progresso(elaborate, importate):
+            print('%d righe elaborate, %d importate (%.1fs)' % (elaborate, importate, time.time() - inizio))
+
+        esiti = {'righe': 0, 'errori': 0, 'importate': 0}
+
+        def conta(risultati):
+            for numero, riga, log, importata in risultati:
+                esiti['righe'] += 1
+                esiti['errori'] += 1 if any(tipo == VALIDAZIONE_ERRORE for tipo, messaggio in log) else 0
+                esiti['importate'] += 1 if importata else 0
+                yield numero, riga, log, importata
+
+        righe = importa_volontari(leggi_csv(nome_file, delimitatore), contesto, importa=options['importa'],
+                                  dimensione_blocco=options['blocco'], progresso=progresso)
+        try:
+            rapporto = rapporto_importazione(conta(righe))
+        except IndexError:
+            raise CommandError('File non valido o delimitatore errato')
+
+        print('Terminato in %.1fs: %d righe, %d con errori, %d importate' % (
+            time.time() - inizio, esiti['righe'], esiti['errori'], esiti['importate']))
+        print('Rapporto: %s' % (rapporto.file.path,))
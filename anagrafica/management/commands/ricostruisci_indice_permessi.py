@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+from django.core.management.base import NoArgsCommand
+
+from anagrafica.permessi.indice import ricostruisci_indice
+
+
+class Command(NoArgsCommand):
+
+    def handle_noargs(self, **options):
+        print('Inizio ricostruzione indice dei permessi')
+
+        def progresso(numero, totale):
+            if numero % 500 == 0 or numero == totale:
+                print('%d/%d deleghe indicizzate' % (numero, totale))
+
+        righe = ricostruisci_indice(progresso=progresso)
+        print('Indice dei permessi ricostruito (%d righe)' % righe)
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import time
+
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+
+from base.geo import Locazione
+from base.geocodifica import costruisci_gazzettiere, rigeocodifica
+
+
+class Command(BaseCommand):
+    help = 'Cerca nuovamente l\'indirizzo delle locazioni di sedi e aspiranti, con un limite di chiamate al secondo'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sedi', action='store_true', dest='sedi', default=False,
+                            help='Solo le locazioni delle sedi')
+        parser.add_argument('--aspiranti', action='store_true', dest='aspiranti', default=False,
+                            help='Solo le locazioni degli aspiranti')
+        parser.add_argument('--al-secondo', type=float, dest='al_secondo', default=5,
+                            help='Numero massimo di chiamate al secondo al fornitore di geocodifica')
+        parser.add_argument('--usa-cache', action='store_true', dest='usa_cache', default=False,
+                            help='Usa anche le ricerche salvate')
+        parser.add_argument('--gazzettiere', action='store_true', dest='gazzettiere', default=False,
+                            help='Ricostruisce solo il gazzettiere locale dalle locazioni conosciute')
+
+    def handle(self, *args, **options):
+        if options['gazzettiere']:
+            print('Gazzettiere ricostruito con %d voci' % costruisci_gazzettiere())
+            return
+
+        filtro = Q()
+        if options['sedi']:
+            filtro |= Q(anagrafica_sede__isnull=False)
+        if options['aspiranti']:
+            filtro |= Q(formazione_aspirante__isnull=False)
+        if not (options['sedi'] or options['aspiranti']):
+            filtro = Q(anagrafica_sede__isnull=False) | Q(formazione_aspirante__isnull=False)
+        locazioni = Locazione.objects.filter(filtro).distinct()
+
+        def progresso(elaborate, totale):
+            if elaborate % 100 == 0 or elaborate == totale:
+                print('%d/%d locazioni' % (elaborate, totale))
+
+        inizio = time.time()
+        metriche = rigeocodifica(locazioni, al_secondo=options['al_secondo'], usa_cache=options['usa_cache'],
+                                 progresso=progresso)
+        metriche['secondi'] = time.time() - inizio
+        print('%(aggiornate)d aggiornate, %(non_trovate)d non trovate, %(chiamate)d chiamate al fornitore '
+              'in %(secondi).1fs' % metriche)
@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+from django.core.management.base import BaseCommand
+
+from base.esiti import modelli_con_autorizzazioni, verifica_esiti, ricalcola_esiti
+
+
+class Command(BaseCommand):
+    help = 'Confronta la colonna esito dei modelli con autorizzazioni con le autorizzazioni richieste'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--correggi', action='store_true', dest='correggi', default=False,
+                            help='Ricalcola l\'esito delle righe non coerenti')
+
+    def handle(self, *args, **options):
+        print('Inizio verifica esiti delle autorizzazioni')
+        totale = 0
+
+        for modello in modelli_con_autorizzazioni():
+            if options['correggi']:
+                righe = ricalcola_esiti(modello)
+            else:
+                righe = verifica_esiti(modello)
+            totale += righe
+            if righe:
+                print('%s: %d righe non coerenti' % (modello._meta.label, righe))
+
+        if not totale:
+            print('Esiti coerenti')
+        elif options['correggi']:
+            print('%d righe corrette' % totale)
+        else:
+            print('%d righe non coerenti, usa --correggi per ricalcolarle' % totale)
@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+from django.core.management.base import BaseCommand
+
+from anagrafica.permessi.indice import verifica_indice, aggiorna_indice_delega
+
+
+class Command(BaseCommand):
+    help = 'Confronta l\'indice dei permessi con la valutazione dinamica delle deleghe'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--correggi', action='store_true', dest='correggi', default=False,
+                            help='Ricalcola l\'indice per le deleghe non coerenti')
+
+    def handle(self, *args, **options):
+        print('Inizio verifica indice dei permessi')
+        differenze = verifica_indice()
+
+        for (delega, mancanti, in_eccesso) in differenze:
+            print('Delega %d (%s): %d righe mancanti, %d righe in eccesso' % (
+                delega.pk, delega.tipo, len(mancanti), len(in_eccesso)
+            ))
+            if options['correggi']:
+                aggiorna_indice_delega(delega)
+
+        if not differenze:
+            print('Indice dei permessi coerente')
+        elif options['correggi']:
+            print('%d deleghe corrette' % len(differenze))
+        else:
+            print('%d deleghe non coerenti, usa --correggi per ricalcolarle' % len(differenze))
@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.9.12 on 2017-06-12 10:24
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('anagrafica', '0045_auto_20170219_0916'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IndicePermesso',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('permesso', models.CharField(db_index=True, max_length=64)),
+                ('oggetto_id', models.PositiveIntegerField(blank=True, null=True)),
+                ('delega', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='indice_permessi', to='anagrafica.Delega')),
+                ('oggetto_tipo', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='contenttypes.ContentType')),
+                ('persona', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='indice_permessi', to='anagrafica.Persona')),
+            ],
+            options={
+                'verbose_name': 'Indice permessi',
+                'verbose_name_plural': 'Indice permessi',
+            },
+        ),
+        migrations.AlterIndexTogether(
+            name='indicepermesso',
+            index_together=set([('persona', 'permesso'), ('persona', 'permesso', 'oggetto_tipo', 'oggetto_id'), ('delega', 'oggetto_tipo')]),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.9.12 on 2017-03-03 11:40
+from __future__ import unicode_literals
+
+import django.contrib.postgres.fields.ranges
+from django.db import migrations
+
+from base.storico import operazioni_periodo
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('anagrafica', '0049_indicepermesso'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='appartenenza',
+            name='periodo',
+            field=django.contrib.postgres.fields.ranges.DateTimeRangeField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='delega',
+            name='periodo',
+            field=django.contrib.postgres.fields.ranges.DateTimeRangeField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='riserva',
+            name='periodo',
+            field=django.contrib.postgres.fields.ranges.DateTimeRangeField(blank=True, editable=False, null=True),
+        ),
+    ]
+    operations += operazioni_periodo('anagrafica_appartenenza')
+    operations += operazioni_periodo('anagrafica_delega')
+    operations += operazioni_periodo('anagrafica_riserva')
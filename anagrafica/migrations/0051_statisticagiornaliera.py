@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.9.12 on 2017-07-10 11:02
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('anagrafica', '0050_periodo_storico'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StatisticaGiornaliera',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('creazione', models.DateTimeField(db_index=True, default=django.utils.timezone.now)),
+                ('ultima_modifica', models.DateTimeField(auto_now=True, db_index=True)),
+                ('giorno', models.DateField(db_index=True)),
+                ('nome', models.CharField(max_length=64)),
+                ('valore', models.BigIntegerField(default=0)),
+                ('sede', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='statistiche', to='anagrafica.Sede')),
+            ],
+            options={
+                'verbose_name': 'Statistica giornaliera',
+                'verbose_name_plural': 'Statistiche giornaliere',
+            },
+        ),
+        migrations.AlterUniqueTogether(
+            name='statisticagiornaliera',
+            unique_together=set([('giorno', 'nome', 'sede')]),
+        ),
+        migrations.AlterIndexTogether(
+            name='statisticagiornaliera',
+            index_together=set([('nome', 'giorno')]),
+        ),
+    ]
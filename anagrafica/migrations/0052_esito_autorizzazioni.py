@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.9.12 on 2017-07-12 10:15
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+from base.esiti import operazioni_esito
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('anagrafica', '0051_statisticagiornaliera'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='appartenenza',
+            name='esito',
+            field=models.CharField(choices=[('Confermato', 'Confermato'), ('Negato', 'Negato'), ('Ritirata', 'Ritirata'), ('In attesa', 'In attesa')], db_index=True, default='Confermato', editable=False, max_length=16, verbose_name='Esito'),
+        ),
+        migrations.AddField(
+            model_name='estensione',
+            name='esito',
+            field=models.CharField(choices=[('Confermato', 'Confermato'), ('Negato', 'Negato'), ('Ritirata', 'Ritirata'), ('In attesa', 'In attesa')], db_index=True, default='Confermato', editable=False, max_length=16, verbose_name='Esito'),
+        ),
+        migrations.AddField(
+            model_name='fototessera',
+            name='esito',
+            field=models.CharField(choices=[('Confermato', 'Confermato'), ('Negato', 'Negato'), ('Ritirata', 'Ritirata'), ('In attesa', 'In attesa')], db_index=True, default='Confermato', editable=False, max_length=16, verbose_name='Esito'),
+        ),
+        migrations.AddField(
+            model_name='riserva',
+            name='esito',
+            field=models.CharField(choices=[('Confermato', 'Confermato'), ('Negato', 'Negato'), ('Ritirata', 'Ritirata'), ('In attesa', 'In attesa')], db_index=True, default='Confermato', editable=False, max_length=16, verbose_name='Esito'),
+        ),
+        migrations.AddField(
+            model_name='trasferimento',
+            name='esito',
+            field=models.CharField(choices=[('Confermato', 'Confermato'), ('Negato', 'Negato'), ('Ritirata', 'Ritirata'), ('In attesa', 'In attesa')], db_index=True, default='Confermato', editable=False, max_length=16, verbose_name='Esito'),
+        ),
+    ]
+    operations += operazioni_esito('anagrafica', 'appartenenza')
+    operations += operazioni_esito('anagrafica', 'estensione')
+    operations += operazioni_esito('anagrafica', 'fototessera')
+    operations += operazioni_esito('anagrafica', 'riserva')
+    operations += operazioni_esito('anagrafica', 'trasferimento')
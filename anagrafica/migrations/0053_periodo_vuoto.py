@@ -0,0 +1,19 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.9.12 on 2017-07-12 10:15
+from __future__ import unicode_literals
+
+from django.db import migrations
+
+from base.storico import operazioni_periodo_vuoto
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('anagrafica', '0052_esito_autorizzazioni'),
+    ]
+
+    operations = []
+    operations += operazioni_periodo_vuoto('anagrafica_appartenenza')
+    operations += operazioni_periodo_vuoto('anagrafica_delega')
+    operations += operazioni_periodo_vuoto('anagrafica_riserva')
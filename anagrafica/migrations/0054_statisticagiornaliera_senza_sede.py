@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.9.12 on 2017-07-12 10:15
+from __future__ import unicode_literals
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('anagrafica', '0053_periodo_vuoto'),
+    ]
+
+    operations = [
+        # Il vincolo (giorno, nome, sede) non vale per le righe senza sede (NULL): rimuove i duplicati,
+        #  tenendo la riga piu' recente, e crea un indice unico parziale
+        migrations.RunSQL(
+            "DELETE FROM anagrafica_statisticagiornaliera s USING anagrafica_statisticagiornaliera d "
+            "WHERE s.sede_id IS NULL AND d.sede_id IS NULL AND s.giorno = d.giorno AND s.nome = d.nome "
+            "AND s.id < d.id;",
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.RunSQL(
+            "CREATE UNIQUE INDEX anagrafica_statisticagiornaliera_senza_sede "
+            "ON anagrafica_statisticagiornaliera (giorno, nome) WHERE sede_id IS NULL;",
+            reverse_sql="DROP INDEX IF EXISTS anagrafica_statisticagiornaliera_senza_sede;",
+        ),
+    ]
@@ -31,6 +31,7 @@ from django_countries.fields import CountryField
 import phonenumbers
 from mptt.querysets import TreeQuerySet
 
+from anagrafica.albero import albero_sedi, invalida_albero
 from anagrafica.costanti import ESTENSIONE, TERRITORIALE, LOCALE, PROVINCIALE, REGIONALE, NAZIONALE
 
 from anagrafica.permessi.applicazioni import PRESIDENTE, PERMESSI_NOMI, PERMESSI_NOMI_DICT, UFFICIO_SOCI_UNITA, \
@@ -41,20 +42,22 @@ from anagrafica.permessi.applicazioni import UFFICIO_SOCI
 from anagrafica.permessi.costanti import GESTIONE_ATTIVITA, PERMESSI_OGGETTI_DICT, GESTIONE_SOCI, GESTIONE_CORSI_SEDE, GESTIONE_CORSO, \
     GESTIONE_SEDE, GESTIONE_AUTOPARCHI_SEDE, GESTIONE_CENTRALE_OPERATIVA_SEDE
 from anagrafica.permessi.delega import delega_permessi, delega_incarichi
+from anagrafica.permessi.indice import aggiorna_indice_delega, aggiorna_indice_sede, rimuovi_indice_sedi
 from anagrafica.permessi.incarichi import INCARICO_GESTIONE_APPARTENENZE, INCARICO_GESTIONE_TRASFERIMENTI, \
     INCARICO_GESTIONE_ESTENSIONI, INCARICO_GESTIONE_RISERVE, INCARICO_ASPIRANTE
 from anagrafica.permessi.persona import persona_ha_permesso, persona_oggetti_permesso, persona_permessi, \
-    persona_permessi_almeno, persona_ha_permessi
+    persona_permessi_almeno, persona_ha_permessi, persona_permessi_almeno_molti
 from anagrafica.validators import valida_codice_fiscale, ottieni_genere_da_codice_fiscale, \
     crea_validatore_dimensione_file, valida_dimensione_file_8mb, valida_dimensione_file_5mb, valida_almeno_14_anni, \
     valida_partita_iva, valida_iban, valida_email_personale
 from attivita.models import Turno, Partecipazione
 from base.files import PDF, Excel, FoglioExcel
 from base.geo import ConGeolocalizzazioneRaggio, ConGeolocalizzazione
+from base.memoria import memorizza_per_richiesta, invalida_memoria
 from base.models import ModelloSemplice, ModelloAlbero, ConAutorizzazioni, ConAllegati, \
     Autorizzazione, ConVecchioID
 from base.stringhe import normalizza_nome, GeneratoreNomeFile
-from base.tratti import ConMarcaTemporale, ConStorico, ConProtocollo, ConDelegati, ConPDF
+from base.tratti import ConMarcaTemporale, ConStorico, ConStoricoIndicizzato, ConProtocollo, ConDelegati, ConPDF
 from base.utils import is_list, sede_slugify, UpperCaseCharField, TitleCharField, poco_fa, mezzanotte_24_ieri, \
     mezzanotte_00, mezzanotte_24
 from autoslug import AutoSlugField
@@ -269,6 +272,7 @@ class Persona(ModelloSemplice, ConMarcaTemporale, ConAllegati, ConVecchioID):
             return numeri_servizio
         return self.numeri_telefono.all()
 
+    @memorizza_per_richiesta
     def deleghe_attuali(self, al_giorno=None, solo_attive=True, **kwargs):
         """
         Ritorna una ricerca per le deleghe che son attuali.
@@ -377,6 +381,7 @@ class Persona(ModelloSemplice, ConMarcaTemporale, ConAllegati, ConVecchioID):
         """
         return self.membro_di(self, sede, includi_figli=True, **kwargs)
 
+    @memorizza_per_richiesta
     def sedi_attuali(self, **kwargs):
         """
         Ottiene queryset di Sede di cui fa parte
@@ -594,6 +599,21 @@ class Persona(ModelloSemplice, ConMarcaTemporale, ConAllegati, ConVecchioID):
         return persona_permessi_almeno(self, oggetto, minimo=minimo, al_giorno=al_giorno,
                                        solo_deleghe_attive=solo_deleghe_attive)
 
+    def permessi_almeno_molti(self, oggetti, minimo, al_giorno=None, solo_deleghe_attive=True):
+        """
+        Calcola i permessi su molti oggetti dello stesso modello, con un numero di query
+         indipendente dal numero di oggetti.
+
+        :param oggetti: Lista o QuerySet di oggetti dello stesso modello.
+        :param minimo: Livello minimo di permesso.
+        :param al_giorno:  Data di verifica.
+        :param solo_deleghe_attive: True se deve usare solo le deleghe attive per il calcolo del permesso. False altrimenti.
+        :return: Dizionario {pk: livello}, dove livello >= minimo se e solo se permessi_almeno(oggetto, minimo).
+        """
+        return persona_permessi_almeno_molti(self, oggetti, minimo=minimo, al_giorno=al_giorno,
+                                             solo_deleghe_attive=solo_deleghe_attive)
+
+    @memorizza_per_richiesta
     def ha_permesso(self, permesso, al_giorno=None, solo_deleghe_attive=True):
         """
         Dato un permesso, ritorna true se il permesso e' posseduto.
@@ -777,6 +797,7 @@ class Persona(ModelloSemplice, ConMarcaTemporale, ConAllegati, ConVecchioID):
                 self.autorizzazioni_in_attesa().exists() or
                 INCARICO_ASPIRANTE in dict(self.incarichi()))
 
+    @memorizza_per_richiesta
     def incarichi(self):
 
         if hasattr(self, 'aspirante'):
@@ -832,6 +853,7 @@ class Persona(ModelloSemplice, ConMarcaTemporale, ConAllegati, ConVecchioID):
         """
         return self.autorizzazioni().filter(necessaria=True)
 
+    @memorizza_per_richiesta
     def autorizzazioni_in_attesa(self):
         """
         Ritorna tutte le autorizzazioni firmabili da qesto utente e in attesa di firma.
@@ -1187,6 +1209,17 @@ class Persona(ModelloSemplice, ConMarcaTemporale, ConAllegati, ConVecchioID):
 
         :return: elenco di condizioni di filtro (usabili come argomenti di un oggetto Q)
         """
+        if settings.SEGMENTI_PRECALCOLATI:
+            attivi = [{'segmento': 'A'}]
+            for segmento, sede, titolo in self.membri_segmenti.values_list('segmento', 'sede', 'titolo'):
+                if segmento == 'AA':
+                    attivi.append({'segmento': segmento, 'titolo': titolo})
+                elif sede is None:
+                    attivi.append({'segmento': segmento, 'sede__isnull': True})
+                else:
+                    attivi.append({'segmento': segmento, 'sede': sede})
+            return attivi
+
         from segmenti.segmenti import SEGMENTI
         utente = Persona.objects.filter(pk=self.pk)
         attivi = []
@@ -1295,7 +1328,7 @@ class Documento(ModelloSemplice, ConMarcaTemporale):
         )
 
 
-class Appartenenza(ModelloSemplice, ConStorico, ConMarcaTemporale, ConAutorizzazioni):
+class Appartenenza(ModelloSemplice, ConStoricoIndicizzato, ConMarcaTemporale, ConAutorizzazioni):
     """
     Rappresenta un'appartenenza di una Persona ad un Sede.
     """
@@ -1403,6 +1436,31 @@ class Appartenenza(ModelloSemplice, ConStorico, ConMarcaTemporale, ConAutorizzaz
 
     RICHIESTA_NOME = "Appartenenza"
 
+    def save(self, *args, **kwargs):
+        from segmenti.membri import aggiorna_segmenti_persona, SEGMENTI_APPARTENENZA
+        from ufficio_soci.stato_quote import aggiorna_stato_persona
+        super(Appartenenza, self).save(*args, **kwargs)
+        invalida_memoria()
+        aggiorna_segmenti_persona(self.persona_id, SEGMENTI_APPARTENENZA)
+        aggiorna_stato_persona(self.persona_id, anni=self._anni_stato_quote())
+
+    def delete(self, *args, **kwargs):
+        from segmenti.membri import aggiorna_segmenti_persona, SEGMENTI_APPARTENENZA
+        from ufficio_soci.stato_quote import aggiorna_stato_persona
+        invalida_memoria()
+        risultato = super(Appartenenza, self).delete(*args, **kwargs)
+        aggiorna_segmenti_persona(self.persona_id, SEGMENTI_APPARTENENZA)
+        aggiorna_stato_persona(self.persona_id, anni=self._anni_stato_quote())
+        return risultato
+
+    def _anni_stato_quote(self):
+        """
+        Gli anni dello stato delle quote su cui l'appartenenza puo' influire: i tesseramenti aperti
+         a partire dall'anno di inizio (gli anni chiusi vengono ricalcolati solo su richiesta).
+        """
+        from ufficio_soci.stato_quote import anni_aperti
+        return anni_aperti(dal_anno=self.inizio.year if self.inizio else None)
+
     @classmethod
     def membro_permesso(cls, estensione=REGIONALE, membro=ORDINARIO):
         """
@@ -1496,6 +1554,12 @@ class SedeQuerySet(TreeQuerySet):
         Filtra per comitati e ottiene i comitati dei presenti
         """
         presenti = self
+        albero = albero_sedi()
+        if albero is not None:
+            pks = list(presenti.values_list('pk', flat=True))
+            if albero.contiene(pks):
+                return Sede.objects.filter(pk__in=[albero.comitato(pk) for pk in pks])
+
         comitati_presenti = presenti.filter(estensione__in=[NAZIONALE, REGIONALE, PROVINCIALE, LOCALE])
         territoriali_presenti = presenti.filter(estensione=TERRITORIALE)
         comitati_dei_territoriali_presenti = Sede.objects.filter(figli__in=territoriali_presenti)
@@ -1510,6 +1574,13 @@ class SedeQuerySet(TreeQuerySet):
         :param ignora_disattivi: Ignora le sedi disattive.
         """
 
+        albero = albero_sedi()
+        if albero is not None:
+            pks = list(self.values_list('pk', flat=True))
+            if albero.contiene(pks):
+                return Sede.objects.filter(pk__in=albero.espandi(pks, pubblici=pubblici,
+                                                                  ignora_disattive=ignora_disattivi))
+
         qs = self | Sede.objects.filter(estensione=TERRITORIALE, genitore__in=(self.filter(estensione__in=[PROVINCIALE, LOCALE])))
 
         if pubblici:
@@ -1576,18 +1647,74 @@ class Sede(ModelloAlbero, ConMarcaTemporale, ConGeolocalizzazione, ConVecchioID,
 
     attiva = models.BooleanField("Attiva", default=True, db_index=True)
     __attiva_default = None
+    __albero_default = None
 
     def __init__(self, *args, **kwargs):
         super(Sede, self).__init__(*args, **kwargs)
         # Questo attributo a runtime ci serve per verificare durante il save se il flag "attiva" è stato modficato
         self.__attiva_default = self.attiva
+        # Come sopra, per verificare se la posizione della sede nell'albero e' cambiata (vedi IndicePermesso)
+        self.__albero_default = self._posizione_albero()
+
+    def _posizione_albero(self):
+        return self.pk, self.genitore_id, self.estensione, self.attiva
 
     def save(self, *args, **kwargs):
-        super(Sede, self).save(*args, **kwargs)
-        if self.__attiva_default is not None and not self.attiva and self.__attiva_default != self.attiva:
-            for sottosede in self.ottieni_figli(solo_attivi=False):
-                sottosede.attiva = False
-                sottosede.save()
+        # In una transazione: l'albero in memoria viene invalidato una volta sola al commit,
+        #  anche quando la disattivazione si propaga alle sottosedi
+        with atomic():
+            super(Sede, self).save(*args, **kwargs)
+            invalida_albero()
+            if self.__attiva_default is not None and not self.attiva and self.__attiva_default != self.attiva:
+                for sottosede in self.ottieni_figli(solo_attivi=False):
+                    sottosede.attiva = False
+                    sottosede.save()
+            precedente = self.__albero_default
+            if precedente != self._posizione_albero():
+                aggiorna_indice_sede(self)
+                # Spostata sotto un'altra sede: le deleghe superiori precedenti non la coprono piu'
+                if precedente[0] is not None and precedente[1] is not None and precedente[1] != self.genitore_id:
+                    aggiorna_indice_sede(Sede.objects.filter(pk=precedente[1]).first())
+                self.__albero_default = self._posizione_albero()
+
+    def delete(self, *args, **kwargs):
+        genitore_id = self.genitore_id
+        with atomic():
+            sedi = list(self.get_descendants(include_self=True).values_list('pk', flat=True))
+            risultato = super(Sede, self).delete(*args, **kwargs)
+            invalida_albero()
+            rimuovi_indice_sedi(sedi)
+            if genitore_id is not None:
+                aggiorna_indice_sede(Sede.objects.filter(pk=genitore_id).first())
+        return risultato
+
+    def _albero(self):
+        """
+        Ritorna la copia in memoria dell'albero delle sedi (vedi anagrafica.albero),
+         o None se disattivata o se la sede non e' ancora presente.
+        """
+        albero = albero_sedi()
+        if albero is not None and albero.contiene([self.pk]):
+            return albero
+        return None
+
+    def ottieni_superiori(self, includimi=False, solo_attivi=True):
+        albero = self._albero()
+        if albero is None:
+            return super(Sede, self).ottieni_superiori(includimi=includimi, solo_attivi=solo_attivi)
+        return Sede.objects.filter(pk__in=albero.superiori(self.pk, includimi=includimi, solo_attivi=solo_attivi))
+
+    def ottieni_figli(self, solo_attivi=True):
+        albero = self._albero()
+        if albero is None:
+            return super(Sede, self).ottieni_figli(solo_attivi=solo_attivi)
+        return Sede.objects.filter(pk__in=albero.figli_di(self.pk, solo_attivi=solo_attivi))
+
+    def ottieni_discendenti(self, includimi=False, solo_attivi=True):
+        albero = self._albero()
+        if albero is None:
+            return super(Sede, self).ottieni_discendenti(includimi=includimi, solo_attivi=solo_attivi)
+        return Sede.objects.filter(pk__in=albero.discendenti(self.pk, includimi=includimi, solo_attivi=solo_attivi))
 
     def sorgente_slug(self):
         if self.estensione == PROVINCIALE:
@@ -1786,6 +1913,11 @@ class Sede(ModelloAlbero, ConMarcaTemporale, ConGeolocalizzazione, ConVecchioID,
         :param estensione:
         :return:
         """
+        albero = self._albero()
+        if albero is not None:
+            pk = albero.superiore(self.pk, estensione=estensione)
+            return Sede.objects.get(pk=pk) if pk is not None else None
+
         x = self
         while True:
             try:
@@ -1797,14 +1929,30 @@ class Sede(ModelloAlbero, ConMarcaTemporale, ConGeolocalizzazione, ConVecchioID,
 
     @property
     def domanda_formativa(self):
+        if settings.DOMANDA_FORMATIVA_PRECALCOLATA:
+            from formazione.domanda import domanda_sede
+            return domanda_sede(self).aspiranti
         from formazione.models import Aspirante
         return self.circonferenze_contenenti(Aspirante.query_contattabili()).count()
 
     @property
     def domanda_formativa_raggio_medio(self):
+        if settings.DOMANDA_FORMATIVA_PRECALCOLATA:
+            from formazione.domanda import domanda_sede
+            return int(domanda_sede(self).raggio_medio)
         from formazione.models import Aspirante
         aspiranti = self.circonferenze_contenenti(Aspirante.query_contattabili())
-        return int(aspiranti.aggregate(raggio=Avg('raggio'))['raggio']) or 0
+        return int(aspiranti.aggregate(raggio=Avg('raggio'))['raggio'] or 0)
+
+    def post_locazione(self):
+        """
+        Aggiorna la domanda formativa precalcolata della sede ogni volta che viene impostata
+         una nuova locazione.
+        """
+        if settings.DOMANDA_FORMATIVA_PRECALCOLATA:
+            from formazione.domanda import aggiorna_domanda_formativa
+            aggiorna_domanda_formativa(sedi=[self.pk])
+        return super(Sede, self).post_locazione()
 
     def espandi(self, includi_me=False, pubblici=False, ignora_disattive=True):
         """
@@ -1816,6 +1964,12 @@ class Sede(ModelloAlbero, ConMarcaTemporale, ConGeolocalizzazione, ConVecchioID,
         :param ignora_disattive: Nasconde le sedi disattive.
         """
 
+        albero = self._albero()
+        if albero is not None:
+            return Sede.objects.filter(pk__in=albero.espandi_sede(
+                self.pk, includi_me=includi_me, pubblici=pubblici, ignora_disattive=ignora_disattive,
+            ))
+
         # Sede pubblica... ritorna tutto sotto di se.
         if pubblici and self.estensione in [NAZIONALE, REGIONALE]:
             queryset = self.ottieni_discendenti(includimi=includi_me)
@@ -1844,13 +1998,19 @@ class Sede(ModelloAlbero, ConMarcaTemporale, ConGeolocalizzazione, ConVecchioID,
         Ritorna un elenco di Comitati sottostanti.
         Es. Regionale -> QuerySet Provinciali
         """
+        albero = self._albero()
+        if albero is not None:
+            return Sede.objects.filter(pk__in=albero.figli_di(self.pk, estensione=(REGIONALE, PROVINCIALE, LOCALE)))
         return self.ottieni_figli().filter(estensione__in=(REGIONALE, PROVINCIALE, LOCALE))
 
     def unita_sottostanti(self):
+        albero = self._albero()
+        if albero is not None:
+            return Sede.objects.filter(pk__in=albero.figli_di(self.pk, estensione=(TERRITORIALE,)))
         return self.ottieni_figli().filter(estensione=TERRITORIALE)
 
 
-class Delega(ModelloSemplice, ConStorico, ConMarcaTemporale):
+class Delega(ModelloSemplice, ConStoricoIndicizzato, ConMarcaTemporale):
     """
     Rappresenta una delega ad una funzione.
 
@@ -1975,6 +2135,21 @@ class Delega(ModelloSemplice, ConStorico, ConMarcaTemporale):
             destinatari=[self.persona],
         )
 
+    def save(self, *args, **kwargs):
+        from segmenti.membri import aggiorna_segmenti_persona, SEGMENTI_DELEGA
+        super(Delega, self).save(*args, **kwargs)
+        invalida_memoria()
+        if settings.PERMESSI_INDICE_ATTIVO:
+            aggiorna_indice_delega(self)
+        aggiorna_segmenti_persona(self.persona_id, SEGMENTI_DELEGA)
+
+    def delete(self, *args, **kwargs):
+        from segmenti.membri import aggiorna_segmenti_persona, SEGMENTI_DELEGA
+        invalida_memoria()
+        risultato = super(Delega, self).delete(*args, **kwargs)
+        aggiorna_segmenti_persona(self.persona_id, SEGMENTI_DELEGA)
+        return risultato
+
     def termina(self, mittente=None, accoda=False, notifica=True, data=None):
         self.fine = mezzanotte_24(data)
         self.save()
@@ -2055,6 +2230,35 @@ class Delega(ModelloSemplice, ConStorico, ConMarcaTemporale):
         return numero_deleghe
 
 
+class IndicePermesso(ModelloSemplice):
+    """
+    Indice materializzato dei permessi conferiti dalle deleghe.
+
+    Ogni riga associa una Persona, tramite una Delega, ad un permesso (es. GESTIONE_SOCI) e ad un oggetto
+     coperto dal permesso. Una riga senza oggetto indica il possesso del permesso.
+    NON USARE DIRETTAMENTE. Vedi anagrafica.permessi.indice.
+    """
+
+    class Meta:
+        verbose_name = "Indice permessi"
+        verbose_name_plural = "Indice permessi"
+        app_label = 'anagrafica'
+        index_together = [
+            ['persona', 'permesso'],
+            ['persona', 'permesso', 'oggetto_tipo', 'oggetto_id'],
+            ['delega', 'oggetto_tipo'],
+        ]
+
+    persona = models.ForeignKey(Persona, related_name='indice_permessi', on_delete=models.CASCADE)
+    delega = models.ForeignKey(Delega, related_name='indice_permessi', on_delete=models.CASCADE)
+    permesso = models.CharField(max_length=64, db_index=True)
+    oggetto_tipo = models.ForeignKey(ContentType, null=True, blank=True, on_delete=models.CASCADE)
+    oggetto_id = models.PositiveIntegerField(null=True, blank=True)
+
+    def __str__(self):
+        return "%s di %s su %s" % (self.permesso, self.persona_id, self.oggetto_id)
+
+
 class Fototessera(ModelloSemplice, ConAutorizzazioni, ConMarcaTemporale):
     """
     Rappresenta una fototessera per la persona.
@@ -2283,7 +2487,7 @@ class Estensione(ModelloSemplice, ConMarcaTemporale, ConAutorizzazioni, ConPDF):
         return pdf
 
 
-class Riserva(ModelloSemplice, ConMarcaTemporale, ConStorico, ConProtocollo,
+class Riserva(ModelloSemplice, ConMarcaTemporale, ConStoricoIndicizzato, ConProtocollo,
               ConAutorizzazioni, ConPDF):
     """
     Rappresenta una pratica di riserva.
@@ -2518,3 +2722,30 @@ class Dimissione(ModelloSemplice, ConMarcaTemporale):
                     ]
                 )
 
+
+
+class StatisticaGiornaliera(ModelloSemplice, ConMarcaTemporale):
+    """
+    Valore giornaliero di una statistica aggregata, eventualmente riferito ad una sede.
+    NON USARE DIRETTAMENTE. Vedi anagrafica.statistiche.
+    """
+
+    class Meta:
+        verbose_name = "Statistica giornaliera"
+        verbose_name_plural = "Statistiche giornaliere"
+        app_label = 'anagrafica'
+        # Le righe senza sede sono uniche per giorno e nome con un indice parziale (vedi migrazione 0054)
+        unique_together = [
+            ['giorno', 'nome', 'sede'],
+        ]
+        index_together = [
+            ['nome', 'giorno'],
+        ]
+
+    giorno = models.DateField(db_index=True)
+    nome = models.CharField(max_length=64)
+    sede = models.ForeignKey(Sede, null=True, blank=True, related_name='statistiche', on_delete=models.CASCADE)
+    valore = models.BigIntegerField(default=0)
+
+    def __str__(self):
+        return "%s al %s: %s" % (self.nome, self.giorno, self.valore)
@@ -0,0 +1,252 @@
+"""
+Questo modulo gestisce l'indice materializzato dei permessi (anagrafica.IndicePermesso).
+
+Per ogni delega, l'indice contiene una riga per ogni oggetto coperto dai permessi
+ che scaturiscono dalla delega (vedi anagrafica.permessi.funzioni), oltre ad una riga
+ con il solo tipo di oggetto, che indica il possesso del permesso anche quando questo
+ non copre alcun oggetto.
+
+L'attualita' e lo stato della delega non sono materializzati: vengono verificati al momento
+ della lettura tramite join con la tabella delle deleghe. Ne segue che la terminazione,
+ la sospensione e la riattivazione delle deleghe non richiedono un aggiornamento dell'indice.
+"""
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import Q
+from django.db.transaction import atomic
+from django.utils import timezone
+
+from anagrafica.permessi.delega import delega_permessi
+
+__author__ = 'alfioemanuele'
+
+
+def indice_utilizzabile(al_giorno=None, solo_deleghe_attive=True):
+    """
+    Controlla se l'indice puo' essere usato per rispondere ad una verifica dei permessi.
+    L'indice rappresenta solo la situazione attuale delle deleghe attive.
+    """
+    return settings.PERMESSI_INDICE_ATTIVO and al_giorno is None and solo_deleghe_attive
+
+
+def righe_delega(delega, modelli=None):
+    """
+    Calcola le righe dell'indice per una delega, senza salvarle.
+    :param delega: La delega.
+    :param modelli: Se specificato, calcola solo le righe per oggetti di questi modelli.
+    :return: Lista di IndicePermesso non salvati.
+    """
+    from anagrafica.models import IndicePermesso
+
+    if delega.oggetto is None:
+        return []
+
+    chiavi = set()  # (permesso, tipo, pk): una stessa delega puo' conferire piu' volte lo stesso permesso
+    for (permesso, queryset) in delega_permessi(delega, solo_deleghe_attive=False):
+
+        if modelli is not None and queryset.model not in modelli:
+            continue
+
+        tipo = ContentType.objects.get_for_model(queryset.model)
+        chiavi.add((permesso, tipo.pk, None))
+        chiavi.update((permesso, tipo.pk, pk) for pk in queryset.values_list('pk', flat=True))
+
+    return [
+        IndicePermesso(persona_id=delega.persona_id, delega=delega, permesso=permesso,
+                       oggetto_tipo_id=tipo_id, oggetto_id=oggetto_id)
+        for (permesso, tipo_id, oggetto_id) in chiavi
+    ]
+
+
+def aggiorna_indice_delega(delega, modelli=None):
+    """
+    Ricalcola le righe dell'indice per una delega.
+    :param delega: La delega.
+    :param modelli: Se specificato, ricalcola solo le righe per oggetti di questi modelli.
+    """
+    from anagrafica.models import IndicePermesso
+
+    with atomic():
+        esistenti = IndicePermesso.objects.filter(delega=delega)
+        if modelli is not None:
+            esistenti = esistenti.filter(oggetto_tipo__in=[ContentType.objects.get_for_model(m) for m in modelli])
+        esistenti.delete()
+        IndicePermesso.objects.bulk_create(righe_delega(delega, modelli=modelli), batch_size=1000)
+
+
+def deleghe_da_indicizzare():
+    """
+    Ritorna le deleghe per le quali e' necessario mantenere l'indice (non ancora terminate).
+    :return: QuerySet<Delega>
+    """
+    from anagrafica.models import Delega
+    return Delega.objects.filter(Q(fine__isnull=True) | Q(fine__gt=timezone.now()))
+
+
+def aggiorna_indice_sede(sede, modelli=None, altri_oggetti=()):
+    """
+    Aggiorna l'indice per le deleghe che possono essere influenzate da una modifica
+     sotto una Sede: le deleghe sulla Sede stessa e su tutte le Sedi superiori.
+
+    :param sede: La Sede modificata (o la Sede di un oggetto creato, es. Attivita).
+    :param modelli: Se specificato, aggiorna solo le righe per oggetti di questi modelli.
+    :param altri_oggetti: Oggetti le cui deleghe vanno aggiornate (es. l'Area di una nuova Attivita).
+    """
+    from anagrafica.models import Sede
+    from attivita.models import Area, Attivita
+    from formazione.models import CorsoBase
+    from gruppi.models import Gruppo
+
+    if not settings.PERMESSI_INDICE_ATTIVO or sede is None:
+        return
+
+    superiori = Sede.objects.filter(pk__in=sede.get_ancestors(include_self=True).values('pk'))
+    deleghe = deleghe_da_indicizzare().filter(
+        oggetto_tipo=ContentType.objects.get_for_model(Sede),
+        oggetto_id__in=superiori.values('pk'),
+    )
+
+    # Se cambia l'albero, cambiano anche le espansioni delle deleghe sugli oggetti delle sedi superiori.
+    if modelli is None:
+        for modello in (Area, Attivita, CorsoBase, Gruppo):
+            deleghe |= deleghe_da_indicizzare().filter(
+                oggetto_tipo=ContentType.objects.get_for_model(modello),
+                oggetto_id__in=modello.objects.filter(sede__in=superiori).values('pk'),
+            )
+
+    for oggetto in altri_oggetti:
+        if oggetto is None:
+            continue
+        deleghe |= deleghe_da_indicizzare().filter(
+            oggetto_tipo=ContentType.objects.get_for_model(oggetto),
+            oggetto_id=oggetto.pk,
+        )
+
+    for delega in deleghe.distinct():
+        aggiorna_indice_delega(delega, modelli=modelli)
+
+
+def rimuovi_indice_sedi(sedi):
+    """
+    Rimuove dall'indice le righe relative a Sedi cancellate: quelle che le coprono e quelle
+     delle deleghe su di esse.
+    :param sedi: Elenco di pk di Sede.
+    """
+    from anagrafica.models import IndicePermesso, Sede
+
+    if not settings.PERMESSI_INDICE_ATTIVO or not sedi:
+        return
+
+    tipo = ContentType.objects.get_for_model(Sede)
+    IndicePermesso.objects.filter(
+        Q(oggetto_tipo=tipo, oggetto_id__in=sedi) | Q(delega__oggetto_tipo=tipo, delega__oggetto_id__in=sedi)
+    ).delete()
+
+
+def ricostruisci_indice(progresso=None):
+    """
+    Ricostruisce completamente l'indice dei permessi.
+    :param progresso: Funzione opzionale chiamata come progresso(numero, totale) dopo ogni delega.
+    :return: Il numero di righe inserite.
+    """
+    from anagrafica.models import IndicePermesso
+
+    deleghe = deleghe_da_indicizzare().order_by('pk')
+    totale = deleghe.count()
+    righe = 0
+
+    with atomic():
+        IndicePermesso.objects.all().delete()
+        for numero, delega in enumerate(deleghe.iterator(), start=1):
+            nuove = righe_delega(delega)
+            IndicePermesso.objects.bulk_create(nuove, batch_size=1000)
+            righe += len(nuove)
+            if progresso:
+                progresso(numero, totale)
+
+    return righe
+
+
+def verifica_indice(deleghe=None):
+    """
+    Confronta l'indice con la valutazione dinamica attuale dei permessi.
+    :param deleghe: Le deleghe da verificare. Default, tutte le deleghe non terminate.
+    :return: Lista di tuple (delega, righe mancanti, righe in eccesso), solo per le deleghe non coerenti.
+    """
+    from anagrafica.models import IndicePermesso
+
+    if deleghe is None:
+        deleghe = deleghe_da_indicizzare()
+
+    def _chiave(riga):
+        return riga.permesso, riga.oggetto_tipo_id, riga.oggetto_id
+
+    differenze = []
+    for delega in deleghe.order_by('pk').iterator():
+        attese = set(_chiave(r) for r in righe_delega(delega))
+        presenti = set(IndicePermesso.objects.filter(delega=delega).values_list(
+            'permesso', 'oggetto_tipo_id', 'oggetto_id'
+        ))
+        if attese != presenti:
+            differenze += [(delega, attese - presenti, presenti - attese)]
+
+    return differenze
+
+
+def indice_persona(persona):
+    """
+    Ritorna il QuerySet delle righe dell'indice relative alle deleghe attuali e attive della persona.
+    :return: QuerySet<IndicePermesso>
+    """
+    from anagrafica.models import IndicePermesso, Delega
+    return IndicePermesso.objects.filter(
+        Delega.query_attuale(stato=Delega.ATTIVA).via("delega"),
+        persona=persona,
+    )
+
+
+def _queryset_oggetti(righe, tipo_id):
+    tipo = ContentType.objects.get_for_id(tipo_id)
+    return tipo.model_class().objects.filter(
+        pk__in=righe.filter(oggetto_tipo_id=tipo_id, oggetto_id__isnull=False).values('oggetto_id')
+    )
+
+
+def indice_ha_permesso(persona, permesso):
+    """
+    Controlla tramite l'indice se almeno una delega attuale della persona conferisce il permesso.
+    """
+    return indice_persona(persona).filter(permesso=permesso).exists()
+
+
+def indice_oggetti_permesso(persona, permesso):
+    """
+    Ritorna il QuerySet degli oggetti coperti da un permesso tramite le deleghe attuali,
+     o None se il permesso non e' posseduto.
+    """
+    righe = indice_persona(persona).filter(permesso=permesso)
+    tipi = set(righe.values_list('oggetto_tipo_id', flat=True).distinct())
+
+    if not tipi:
+        return None
+
+    qs = None
+    for tipo_id in tipi:
+        oggetti = _queryset_oggetti(righe, tipo_id)
+        qs = oggetti if qs is None else qs | oggetti
+
+    return qs
+
+
+def indice_permessi(persona):
+    """
+    Ritorna l'elenco dei permessi che scaturiscono dalle deleghe attuali della persona,
+     nella stessa forma di Delega.permessi(), ie. [(PERMESSO, queryset), ...].
+    I queryset ritornati usano l'indice come sotto-query.
+    """
+    righe = indice_persona(persona)
+    coppie = righe.values_list('permesso', 'oggetto_tipo_id').distinct()
+    return [
+        (permesso, _queryset_oggetti(righe.filter(permesso=permesso), tipo_id))
+        for (permesso, tipo_id) in coppie
+    ]
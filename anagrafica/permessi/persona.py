@@ -4,6 +4,8 @@ from anagrafica.permessi.espansioni import ESPANDI_PERMESSI, espandi_persona
 from django.utils import timezone
 
 from anagrafica.permessi.funzioni import permessi_persona
+from anagrafica.permessi.indice import indice_utilizzabile, indice_oggetti_permesso, indice_permessi, \
+    indice_ha_permesso
 
 __author__ = 'alfioemanuele'
 
@@ -31,16 +33,22 @@ def persona_oggetti_permesso(persona, permesso, al_giorno=None, solo_deleghe_att
                 qs = qs | o
 
     # Permessi derivanti dalle deleghe
-    deleghe_attuali = persona.deleghe_attuali(al_giorno=al_giorno,
-                                              solo_attive=solo_deleghe_attive)
+    if indice_utilizzabile(al_giorno, solo_deleghe_attive):
+        o = indice_oggetti_permesso(persona, permesso)
+        if o is not None:
+            qs = o if qs is None else qs | o
 
-    for d in deleghe_attuali:
-        for (p, o) in d.permessi(solo_deleghe_attive=solo_deleghe_attive):
-            if p == permesso:
-                if qs is None:
-                    qs = o
-                else:
-                    qs = qs | o
+    else:
+        deleghe_attuali = persona.deleghe_attuali(al_giorno=al_giorno,
+                                                  solo_attive=solo_deleghe_attive)
+
+        for d in deleghe_attuali:
+            for (p, o) in d.permessi(solo_deleghe_attive=solo_deleghe_attive):
+                if p == permesso:
+                    if qs is None:
+                        qs = o
+                    else:
+                        qs = qs | o
 
     if qs is not None:
         return qs.distinct()
@@ -71,11 +79,16 @@ def persona_permessi(persona, oggetto, al_giorno=None,
         permessi += ESPANDI_PERMESSI[permesso][queryset]
 
     # Per ogni delega attuale, aggiungi i permessi
-    for d in persona.deleghe_attuali(al_giorno=al_giorno, solo_attive=solo_deleghe_attive):
-        ## [(permesso, oggetto), ...] = PERMESSI_DELEGA[d.tipo](d.oggetto)  # ie. ((
-        for (permesso, queryset) in d.permessi():
+    if indice_utilizzabile(al_giorno, solo_deleghe_attive):
+        for (permesso, queryset) in indice_permessi(persona):
             permessi += ESPANDI_PERMESSI[permesso](queryset)
 
+    else:
+        for d in persona.deleghe_attuali(al_giorno=al_giorno, solo_attive=solo_deleghe_attive):
+            ## [(permesso, oggetto), ...] = PERMESSI_DELEGA[d.tipo](d.oggetto)  # ie. ((
+            for (permesso, queryset) in d.permessi():
+                permessi += ESPANDI_PERMESSI[permesso](queryset)
+
     massimo = permesso_minimo(oggetto.__class__)  # ie. NESSUNO
     for (permesso, queryset) in permessi:  # p: (PERMESSO, queryset)
 
@@ -94,6 +107,35 @@ def persona_permessi(persona, oggetto, al_giorno=None,
     return massimo
 
 
+def _persona_espansioni(persona, al_giorno=None, solo_deleghe_attive=True):
+    """
+    Ritorna tutte le espansioni dei permessi di una persona: i permessi base, quelli derivanti
+     dalla persona e quelli derivanti dalle deleghe attuali.
+    :return: Lista di tuple (livello, queryset).
+    """
+    permessi = []
+
+    # I permessi base di ogni persona
+    permessi += espandi_persona(persona=persona, al_giorno=al_giorno)
+
+    # Permessi derivanti dalla persona
+    for (permesso, queryset) in permessi_persona(persona):
+        permessi += ESPANDI_PERMESSI[permesso](queryset)
+
+    # Per ogni delega attuale, aggiungi i permessi
+    if indice_utilizzabile(al_giorno, solo_deleghe_attive):
+        for (permesso, queryset) in indice_permessi(persona):
+            permessi += ESPANDI_PERMESSI[permesso](queryset)
+
+    else:
+        for d in persona.deleghe_attuali(al_giorno=al_giorno, solo_attive=solo_deleghe_attive):
+            ## [(permesso, oggetto), ...] = PERMESSI_DELEGA[d.tipo](d.oggetto)  # ie. ((
+            for (permesso, queryset) in d.permessi(solo_deleghe_attive=solo_deleghe_attive):
+                permessi += ESPANDI_PERMESSI[permesso](queryset)
+
+    return permessi
+
+
 def persona_permessi_almeno(persona, oggetto, minimo=LETTURA, al_giorno=None,
                             solo_deleghe_attive=True):
     """
@@ -113,20 +155,7 @@ def persona_permessi_almeno(persona, oggetto, minimo=LETTURA, al_giorno=None,
     #if persona.admin:
     #    return True
 
-    permessi = []
-
-    # I permessi base di ogni persona
-    permessi += espandi_persona(persona=persona, al_giorno=al_giorno)
-
-    # Permessi derivanti dalla persona
-    for (permesso, queryset) in permessi_persona(persona):
-        permessi += ESPANDI_PERMESSI[permesso](queryset)
-
-    # Per ogni delega attuale, aggiungi i permessi
-    for d in persona.deleghe_attuali(al_giorno=al_giorno, solo_attive=solo_deleghe_attive):
-        ## [(permesso, oggetto), ...] = PERMESSI_DELEGA[d.tipo](d.oggetto)  # ie. ((
-        for (permesso, queryset) in d.permessi(solo_deleghe_attive=solo_deleghe_attive):
-            permessi += ESPANDI_PERMESSI[permesso](queryset)
+    permessi = _persona_espansioni(persona, al_giorno=al_giorno, solo_deleghe_attive=solo_deleghe_attive)
 
     for (permesso, queryset) in permessi:  # p: (PERMESSO, queryset)
         # Non cerco tra oggetti di tipo diverso!
@@ -140,6 +169,47 @@ def persona_permessi_almeno(persona, oggetto, minimo=LETTURA, al_giorno=None,
     return False
 
 
+def persona_permessi_almeno_molti(persona, oggetti, minimo=LETTURA, al_giorno=None,
+                                  solo_deleghe_attive=True):
+    """
+    Come persona_permessi_almeno, per molti oggetti dello stesso modello (es. le righe di un elenco).
+
+    Per ogni espansione dei permessi viene eseguita al piu' una query (pk__in), indipendentemente
+     dal numero di oggetti. Le espansioni vengono controllate dal livello piu' alto, e ogni oggetto
+     viene cercato solo nelle espansioni che ne migliorerebbero il livello.
+
+    :param oggetti: Lista o QuerySet di oggetti dello stesso modello.
+    :param minimo: Livello minimo di permesso.
+    :param al_giorno:  Data di verifica.
+    :param solo_deleghe_attive: True se deve usare solo le deleghe attive per il calcolo del permesso. False altrimenti.
+    :return: Dizionario {pk: livello}. Il livello e' il massimo tra quelli >= minimo, o il permesso
+             minimo del modello. Quindi, per ogni oggetto, livello >= minimo se e solo se
+             persona_permessi_almeno(persona, oggetto, minimo) e' True.
+    """
+    oggetti = list(oggetti)
+    if not oggetti:
+        return {}
+
+    modello = oggetti[0].__class__
+    base = permesso_minimo(modello)
+    livelli = {oggetto.pk: base for oggetto in oggetti}
+    if base >= minimo:
+        return livelli
+
+    permessi = _persona_espansioni(persona, al_giorno=al_giorno, solo_deleghe_attive=solo_deleghe_attive)
+    permessi = sorted([(permesso, queryset) for (permesso, queryset) in permessi
+                       if permesso >= minimo and queryset.model == modello], key=lambda x: -x[0])
+
+    for (permesso, queryset) in permessi:
+        da_cercare = [pk for pk, livello in livelli.items() if livello < permesso]
+        if not da_cercare:
+            continue
+        for pk in queryset.filter(pk__in=da_cercare).values_list('pk', flat=True):
+            livelli[pk] = permesso
+
+    return livelli
+
+
 def persona_ha_permesso(persona, permesso, al_giorno=None,
                         solo_deleghe_attive=True):
     """
@@ -158,6 +228,9 @@ def persona_ha_permesso(persona, permesso, al_giorno=None,
             return True
 
     # Permessi derivanti dalle deleghe
+    if indice_utilizzabile(al_giorno, solo_deleghe_attive):
+        return indice_ha_permesso(persona, permesso)
+
     for d in persona.deleghe_attuali(al_giorno=al_giorno, solo_attive=solo_deleghe_attive):
         for (p, o) in d.permessi():
             if p == permesso:
@@ -0,0 +1,170 @@
+"""
+Questo modulo calcola le statistiche del pannello di amministrazione e le salva giornalmente
+ in StatisticaGiornaliera, aggiornate periodicamente da anagrafica.cron.CronStatistiche.
+Le viste (admin_statistiche, informazioni_statistiche) leggono solo poche righe salvate,
+ indipendentemente dal numero di soci.
+
+Ogni gruppo di statistiche viene calcolato con una sola query aggregata:
+ - i totali (persone, soci, sedi) con conteggi condizionali;
+ - i soci e volontari per regione con un GROUP BY sulle sedi regionali, i cui discendenti
+   sono individuati dall'intervallo MPTT (tree_id, lft, rght);
+ - le registrazioni degli aspiranti con un GROUP BY per giorno (vedi base.statistiche).
+
+Le righe sono uniche per giorno, nome e sede, anche senza sede (indice parziale): se due processi
+ calcolano insieme le statistiche, il secondo fallisce e le statistiche salvate sono quelle del primo.
+"""
+from datetime import date, timedelta
+
+from django.db import connection, IntegrityError
+from django.db.models import Case, Count, F, Q, When
+from django.db.transaction import atomic
+
+from anagrafica.costanti import REGIONALE, NAZIONALE, PROVINCIALE, LOCALE
+from anagrafica.models import Appartenenza, Persona, Sede, StatisticaGiornaliera
+from base.statistiche import conta_per_giorno
+
+PERSONE = 'persone'
+SOCI = 'soci'
+SOCI_GIOVANI_35 = 'soci_giovani_35'
+SEDI = 'sedi'
+COMITATI = 'comitati'
+REGIONE_SOCI = 'regione_soci'
+REGIONE_VOLONTARI = 'regione_volontari'
+ASPIRANTI_REGISTRAZIONI = 'aspiranti_registrazioni'
+
+TOTALI = (PERSONE, SOCI, SOCI_GIOVANI_35, SEDI, COMITATI)
+
+# Giorni della serie delle registrazioni ricalcolati ad ogni aggiornamento (53 settimane)
+GIORNI_SERIE = 53 * 7
+
+
+def regioni():
+    return Sede.objects.filter(estensione=REGIONALE).exclude(nome__contains='Provinciale Di Roma')
+
+
+def calcola_totali(oggi=None):
+    """
+    :return: Dizionario {nome statistica: valore} per le statistiche in TOTALI.
+    """
+    oggi = oggi or date.today()
+    nascita_minima_35 = date(oggi.year - 36, oggi.month, oggi.day)
+
+    soci = Persona.objects.filter(
+        Appartenenza.query_attuale(membro__in=Appartenenza.MEMBRO_SOCIO).via("appartenenze")
+    ).aggregate(
+        soci=Count('pk', distinct=True),
+        giovani=Count(Case(When(data_nascita__gt=nascita_minima_35, then=F('pk'))), distinct=True),
+    )
+    sedi = Sede.objects.filter(attiva=True).aggregate(
+        sedi=Count('pk'),
+        comitati=Count(Case(When(estensione__in=[NAZIONALE, REGIONALE, PROVINCIALE, LOCALE], then=F('pk')))),
+    )
+    return {
+        PERSONE: Persona.objects.count(),
+        SOCI: soci['soci'],
+        SOCI_GIOVANI_35: soci['giovani'],
+        SEDI: sedi['sedi'],
+        COMITATI: sedi['comitati'],
+    }
+
+
+def calcola_soci_volontari_regioni(al_giorno=None):
+    """
+    Conta i soci e i volontari attuali di ogni sede regionale e delle sedi discendenti attive
+     (come Sede.membri_attuali(figli=True)), con una sola query.
+    :return: Dizionario {pk regione: (soci, volontari)}. Le regioni senza soci non sono presenti.
+    """
+    appartenenze = Appartenenza.objects.filter(
+        Appartenenza.query_attuale(al_giorno=al_giorno, membro__in=Appartenenza.MEMBRO_SOCIO).q
+    ).order_by().values('persona_id', 'sede_id', 'membro')
+    sql_appartenenze, parametri_appartenenze = appartenenze.query.sql_with_params()
+
+    sql = """
+        SELECT r.id, COUNT(DISTINCT a.persona_id),
+               COUNT(DISTINCT CASE WHEN a.membro = %s THEN a.persona_id END)
+        FROM {sede} r
+        INNER JOIN {sede} s ON s.tree_id = r.tree_id AND s.lft BETWEEN r.lft AND r.rght
+        LEFT OUTER JOIN {sede} g ON g.id = s.genitore_id
+        INNER JOIN ({appartenenze}) a ON a.sede_id = s.id
+        WHERE r.estensione = %s AND s.attiva AND (g.id IS NULL OR g.attiva)
+        GROUP BY r.id
+    """.format(sede=Sede._meta.db_table, appartenenze=sql_appartenenze)
+    parametri = [Appartenenza.VOLONTARIO] + list(parametri_appartenenze) + [REGIONALE]
+
+    with connection.cursor() as cursor:
+        cursor.execute(sql, parametri)
+        return {pk: (soci, volontari) for pk, soci, volontari in cursor.fetchall()}
+
+
+def aggiorna_statistiche(oggi=None):
+    """
+    Calcola e salva le statistiche di oggi, sostituendo quelle gia' salvate, e la serie
+     giornaliera delle registrazioni degli aspiranti degli ultimi GIORNI_SERIE giorni.
+    :return: Il numero di righe salvate.
+    """
+    from formazione.models import Aspirante
+
+    oggi = oggi or date.today()
+    dal_giorno = oggi - timedelta(days=GIORNI_SERIE)
+
+    righe = [StatisticaGiornaliera(giorno=oggi, nome=nome, valore=valore)
+             for nome, valore in calcola_totali(oggi).items()]
+
+    regionali = calcola_soci_volontari_regioni()
+    for regione in regioni().values_list('pk', flat=True):
+        soci, volontari = regionali.get(regione, (0, 0))
+        righe += [StatisticaGiornaliera(giorno=oggi, nome=REGIONE_SOCI, sede_id=regione, valore=soci),
+                  StatisticaGiornaliera(giorno=oggi, nome=REGIONE_VOLONTARI, sede_id=regione, valore=volontari)]
+
+    righe += [StatisticaGiornaliera(giorno=giorno, nome=ASPIRANTI_REGISTRAZIONI, valore=numero)
+              for giorno, numero in conta_per_giorno(Aspirante.objects.all(), 'creazione', dal_giorno).items()]
+
+    with atomic():
+        StatisticaGiornaliera.objects.filter(
+            Q(giorno=oggi, nome__in=TOTALI + (REGIONE_SOCI, REGIONE_VOLONTARI)) |
+            Q(giorno__gte=dal_giorno, nome=ASPIRANTI_REGISTRAZIONI)
+        ).delete()
+        StatisticaGiornaliera.objects.bulk_create(righe)
+
+    return len(righe)
+
+
+def statistiche_attuali():
+    """
+    Ritorna le ultime statistiche salvate, calcolandole se non ancora disponibili per oggi.
+    :return: Dizionario con 'ora' (data del calcolo), i valori di TOTALI, e 'regioni',
+             lista di tuple (regione, soci, volontari) nell'ordine dell'albero.
+    """
+    ultima = StatisticaGiornaliera.objects.filter(nome=PERSONE).order_by('-giorno').first()
+    if ultima is None or ultima.giorno < date.today():
+        try:
+            aggiorna_statistiche()
+        except IntegrityError:  # Calcolate nel frattempo da un altro processo
+            pass
+        ultima = StatisticaGiornaliera.objects.filter(nome=PERSONE).order_by('-giorno').first()
+
+    righe = StatisticaGiornaliera.objects.filter(giorno=ultima.giorno).select_related('sede')
+    statistiche = {'ora': ultima.creazione}
+    regionali = {}
+    for riga in righe:
+        if riga.nome in TOTALI:
+            statistiche[riga.nome] = riga.valore
+        elif riga.nome == REGIONE_SOCI:
+            regionali.setdefault(riga.sede, [0, 0])[0] = riga.valore
+        elif riga.nome == REGIONE_VOLONTARI:
+            regionali.setdefault(riga.sede, [0, 0])[1] = riga.valore
+
+    statistiche['regioni'] = sorted([(regione, soci, volontari) for regione, (soci, volontari) in regionali.items()],
+                                    key=lambda x: (x[0].tree_id, x[0].lft))
+    return statistiche
+
+
+def registrazioni_aspiranti(dal_giorno):
+    """
+    Ritorna la serie salvata delle registrazioni degli aspiranti.
+    :return: Dizionario {date: numero}.
+    """
+    if not StatisticaGiornaliera.objects.filter(nome=PERSONE, giorno=date.today()).exists():
+        aggiorna_statistiche()
+    return dict(StatisticaGiornaliera.objects.filter(nome=ASPIRANTI_REGISTRAZIONI, giorno__gte=dal_giorno)
+                .values_list('giorno', 'valore'))
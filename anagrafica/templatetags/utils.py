@@ -132,21 +132,64 @@ def permessi_almeno(context, oggetto, minimo="lettura", deleghe="solo_attive"):
         return False
 
     solo_deleghe_attive = deleghe == "solo_attive"
+
+    # Usa i permessi precalcolati per la pagina, se presenti (vedi permessi_almeno_molti)
+    precalcolati = getattr(context.request, 'permessi_precalcolati', {})
+    for (modello, minimo_precalcolato, solo_attive), livelli in precalcolati.items():
+        if modello == oggetto.__class__ and minimo_precalcolato <= minimo_int \
+                and solo_attive == solo_deleghe_attive and oggetto.pk in livelli:
+            return livelli[oggetto.pk] >= minimo_int
+
     almeno = context.request.me.permessi_almeno(oggetto, minimo_int,
                                                 solo_deleghe_attive=solo_deleghe_attive)
 
     return almeno
 
 
+@register.simple_tag(takes_context=True)
+def permessi_almeno_molti(context, oggetti, minimo="lettura", deleghe="solo_attive"):
+    """
+    Precalcola i permessi dell'utente attuale su tutti gli oggetti (es. le righe di una pagina
+     di un elenco), con un numero di query indipendente dal numero di oggetti. I successivi
+     {% permessi_almeno %} sugli stessi oggetti non eseguono query. Non produce output.
+    """
+
+    if deleghe not in ("solo_attive", "tutte"):
+        raise ValueError("Valore per 'deleghe' non riconosciuto.")
+
+    if minimo not in PERMESSI_TESTO:
+        raise ValueError("Permesso '%s' non riconosciuto. Deve essere in 'PERMESSI_TESTO'." % (minimo,))
+
+    oggetti = list(oggetti)
+    if not oggetti or not getattr(context.request, 'me', None):
+        return ""
+
+    minimo_int = PERMESSI_TESTO[minimo]
+    solo_deleghe_attive = deleghe == "solo_attive"
+    livelli = context.request.me.permessi_almeno_molti(oggetti, minimo_int,
+                                                      solo_deleghe_attive=solo_deleghe_attive)
+
+    if not hasattr(context.request, 'permessi_precalcolati'):
+        context.request.permessi_precalcolati = {}
+    chiave = (oggetti[0].__class__, minimo_int, solo_deleghe_attive)
+    context.request.permessi_precalcolati.setdefault(chiave, {}).update(livelli)
+    return ""
+
+
 @register.assignment_tag(takes_context=True)
 def partecipazione(context, turno):
     """
     Controlla lo stato di partecipazione tra turno e attivita'.
+    Usa gli stati precalcolati dalla vista in 'stati_turni' (vedi Turno.stati_persona), se presenti.
     """
 
     if not hasattr(context.request, 'me'):
         return turno.TURNO_NON_PUOI_PARTECIPARE_ACCEDI
 
+    stati_turni = context.get('stati_turni') or {}
+    if turno.pk in stati_turni:
+        return stati_turni[turno.pk]
+
     return turno.persona(context.request.me)
 
 
@@ -6,19 +6,24 @@ from random import randint, choice
 import unicodecsv
 from django.core import mail
 from django.core.urlresolvers import reverse
+from django.db import connection, IntegrityError
+from django.db.transaction import atomic
 from django.test import Client
-from django.test import TestCase
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.utils.encoding import force_text
 from django.utils.six import text_type
 from django.utils.timezone import now
 from freezegun import freeze_time
 from lxml import html
 
+from anagrafica.albero import albero_sedi
 from anagrafica.costanti import LOCALE, PROVINCIALE, REGIONALE, NAZIONALE, TERRITORIALE
 from anagrafica.forms import ModuloCreazioneEstensione, ModuloNegaEstensione, ModuloProfiloModificaAnagrafica, \
     ModuloConsentiTrasferimento, ModuloConsentiEstensione, ModuloCreazioneTrasferimento, ModuloSpostaPersoneManuale,\
     ModuloSpostaPersoneDaCSV
-from anagrafica.models import Appartenenza, Documento, Delega, Dimissione, Estensione, Trasferimento, Riserva, Sede
+from anagrafica.models import Appartenenza, Documento, Delega, Dimissione, Estensione, Trasferimento, Riserva, Sede, \
+    Persona, StatisticaGiornaliera
 from anagrafica.permessi.applicazioni import PRESIDENTE, DELEGATO_OBIETTIVO_3, DELEGATO_OBIETTIVO_5, \
     DELEGATO_OBIETTIVO_6, UFFICIO_SOCI, UFFICIO_SOCI_UNITA, RESPONSABILE_AREA, REFERENTE, DIRETTORE_CORSO, \
     RESPONSABILE_AUTOPARCO
@@ -33,7 +38,7 @@ from autenticazione.utils_test import TestFunzionale
 from base.utils import poco_fa
 from base.utils_tests import crea_persona_sede_appartenenza, crea_persona, crea_sede, crea_appartenenza, \
     email_fittizzia, \
-    crea_utenza
+    crea_utenza, crea_area, crea_attivita
 from formazione.models import Aspirante, CorsoBase, PartecipazioneCorsoBase
 from posta.models import Messaggio, Autorizzazione
 from ufficio_soci.forms import ModuloElencoVolontari
@@ -1685,7 +1690,9 @@ class TestAnagrafica(TestCase):
         self.assertEqual(mail.outbox[1].to, [presidente2.email_contatto])
         mail.outbox = []
 
-        Autorizzazione.notifiche_richieste_in_attesa()
+        self.assertEqual(Autorizzazione.notifiche_richieste_in_attesa(), 2)
+        self.assertEqual(len(mail.outbox), 0, msg="I promemoria vengono accodati")
+        Messaggio.smaltisci_coda()
         self.assertEqual(len(mail.outbox), 2)
 
         for email in mail.outbox:
@@ -1915,6 +1922,191 @@ class TestAnagrafica(TestCase):
             msg="Il delegato Maletto puo gestire volontario"
         )
 
+    @override_settings(PERMESSI_INDICE_ATTIVO=True)
+    def test_indice_permessi(self):
+        from django.contrib.contenttypes.models import ContentType
+        from anagrafica.models import IndicePermesso
+        from anagrafica.permessi.indice import verifica_indice, indice_oggetti_permesso
+
+        presidente = crea_persona()
+        provinciale = crea_sede(presidente, estensione=PROVINCIALE)
+        locale = crea_sede(estensione=LOCALE, genitore=provinciale)
+        volontario = crea_persona()
+        crea_appartenenza(volontario, locale)
+
+        self.assertTrue(
+            presidente.indice_permessi.filter(permesso=GESTIONE_SOCI).exists(),
+            msg="La delega di presidenza viene indicizzata al salvataggio"
+        )
+        self.assertEqual(
+            set(indice_oggetti_permesso(presidente, GESTIONE_SOCI)),
+            {provinciale, locale},
+            msg="L'indice copre la sede e le sue sottosedi"
+        )
+        self.assertTrue(presidente.permessi_almeno(volontario, MODIFICA))
+
+        territoriale = crea_sede(estensione=TERRITORIALE, genitore=locale)
+        self.assertIn(
+            territoriale, presidente.oggetti_permesso(GESTIONE_SOCI),
+            msg="Le nuove sedi vengono aggiunte all'indice delle deleghe superiori"
+        )
+
+        area = crea_area(locale)
+        attivita = crea_attivita(locale, area)
+        self.assertTrue(presidente.permessi_almeno(attivita, MODIFICA))
+        self.assertEqual(verifica_indice(), [], msg="L'indice e' coerente con le deleghe")
+
+        # Spostamento sotto un'altra sede: il presidente precedente perde i permessi sulla sede
+        altro_presidente = crea_persona()
+        altra_provinciale = crea_sede(altro_presidente, estensione=PROVINCIALE)
+        locale.genitore = altra_provinciale
+        locale.save()
+        self.assertNotIn(locale, presidente.oggetti_permesso(GESTIONE_SOCI))
+        self.assertNotIn(territoriale, presidente.oggetti_permesso(GESTIONE_SOCI))
+        self.assertFalse(presidente.permessi_almeno(volontario, MODIFICA))
+        self.assertIn(locale, altro_presidente.oggetti_permesso(GESTIONE_SOCI))
+        self.assertEqual(verifica_indice(), [], msg="L'indice e' coerente dopo lo spostamento")
+
+        territoriale_pk = territoriale.pk
+        territoriale.delete()
+        self.assertFalse(
+            IndicePermesso.objects.filter(oggetto_tipo=ContentType.objects.get_for_model(Sede),
+                                          oggetto_id=territoriale_pk).exists(),
+            msg="Le sedi cancellate vengono rimosse dall'indice"
+        )
+
+        provinciale.sospendi_deleghe()
+        self.assertFalse(
+            presidente.ha_permesso(GESTIONE_SOCI),
+            msg="Le deleghe sospese non conferiscono permessi anche se indicizzate"
+        )
+        provinciale.attiva_deleghe()
+        self.assertTrue(presidente.ha_permesso(GESTIONE_SOCI))
+
+        presidente.deleghe.first().termina(notifica=False)
+        self.assertFalse(presidente.ha_permesso(GESTIONE_SOCI))
+        self.assertFalse(presidente.permessi_almeno(volontario, MODIFICA))
+
+    def test_periodo_storico(self):
+
+        persona, sede, _ = crea_persona_sede_appartenenza()
+        inizio = datetime.datetime(2015, 3, 1, 10, 0)
+        fine_mezzanotte = datetime.datetime(2016, 1, 1, 0, 0)
+        appartenenze = [
+            Appartenenza.objects.create(persona=persona, sede=sede, inizio=inizio, fine=None),
+            Appartenenza.objects.create(persona=persona, sede=sede, inizio=inizio, fine=fine_mezzanotte),
+            Appartenenza.objects.create(persona=persona, sede=sede, inizio=inizio, fine=inizio),
+            Appartenenza.objects.create(persona=persona, sede=sede, inizio=fine_mezzanotte, fine=inizio),  # Errata
+            # Trasferimento nello stesso giorno: fine alle 23:59:59 del giorno precedente all'inizio
+            Appartenenza.objects.create(persona=persona, sede=sede, inizio=datetime.datetime(2015, 6, 1, 10, 0),
+                                        fine=datetime.datetime(2015, 5, 31, 23, 59, 59)),
+            Appartenenza.objects.create(persona=persona, sede=sede, inizio=inizio, fine=fine_mezzanotte),
+        ]
+        # Il periodo e' mantenuto anche senza passare da save()
+        Appartenenza.objects.filter(pk=appartenenze[5].pk).update(fine=inizio)
+
+        filtri = [
+            lambda: Appartenenza.query_attuale(al_giorno=datetime.date(2015, 12, 31)),
+            lambda: Appartenenza.query_attuale(al_giorno=datetime.date(2016, 1, 1)),
+            lambda: Appartenenza.query_attuale(al_giorno=datetime.date(2015, 3, 1)),
+            lambda: Appartenenza.query_attuale(al_giorno=inizio),
+            lambda: Appartenenza.query_attuale(al_giorno=fine_mezzanotte),
+            lambda: Appartenenza.query_attuale(),
+            lambda: Appartenenza.query_attuale_tra_date(datetime.date(2016, 1, 1), datetime.date(2016, 2, 1)),
+            lambda: Appartenenza.query_attuale_tra_date(datetime.date(2014, 1, 1), datetime.date(2015, 3, 1)),
+            lambda: Appartenenza.query_attuale_in_anno(2016),
+            lambda: Appartenenza.query_attuale_in_anno(2014),
+            lambda: Appartenenza.query_attuale_tra_date(datetime.date(2015, 5, 1), datetime.date(2015, 6, 30)),
+            lambda: Appartenenza.query_attuale_in_anno(2015),
+            lambda: Appartenenza.query_attuale(al_giorno=datetime.date(2015, 6, 1)),
+            lambda: Persona.objects.filter(Appartenenza.query_attuale(al_giorno=datetime.date(2015, 7, 1)).via("appartenenze")),
+        ]
+
+        def _risultati():
+            return [sorted(f().filter(persona=persona).values_list('pk', flat=True))
+                    if f().model is Appartenenza else sorted(f().values_list('pk', flat=True))
+                    for f in filtri]
+
+        with self.settings(STORICO_PERIODO_INDICIZZATO=False):
+            inizio_fine = _risultati()
+        with self.settings(STORICO_PERIODO_INDICIZZATO=True):
+            self.assertIn('periodo', str(Appartenenza.query_attuale().query))
+            periodo = _risultati()
+
+        self.assertEqual(inizio_fine, periodo)
+        self.assertIn(appartenenze[1].pk, periodo[8], msg="Fine a mezzanotte del primo giorno dell'anno")
+        self.assertNotIn(appartenenze[3].pk, sum(periodo[:-1], []), msg="Appartenenza con fine precedente all'inizio")
+        # Le righe con periodo vuoto sono filtrate come con inizio e fine
+        self.assertEqual(Appartenenza.objects.filter(pk__in=[a.pk for a in appartenenze],
+                                                     periodo__isempty=True).count(), 4)
+        self.assertIn(appartenenze[2].pk, periodo[2], msg="Appartenenza di durata nulla")
+        self.assertIn(appartenenze[5].pk, periodo[2], msg="Appartenenza di durata nulla, con update()")
+        self.assertIn(appartenenze[4].pk, periodo[10], msg="Trasferimento nello stesso giorno")
+        self.assertIn(appartenenze[4].pk, periodo[11], msg="Trasferimento nello stesso giorno")
+
+    def test_albero_sedi(self):
+
+        nazionale = crea_sede(estensione=NAZIONALE)
+        regionale = crea_sede(estensione=REGIONALE, genitore=nazionale)
+        provinciale = crea_sede(estensione=PROVINCIALE, genitore=regionale)
+        locale = crea_sede(estensione=LOCALE, genitore=provinciale)
+        unita = crea_sede(estensione=TERRITORIALE, genitore=locale)
+        unita_disattiva = crea_sede(estensione=TERRITORIALE, genitore=locale)
+        unita_disattiva.attiva = False
+        unita_disattiva.save()
+
+        def _risultati():
+            return {
+                'espandi': [
+                    list(s.espandi(includi_me=includi_me, pubblici=pubblici, ignora_disattive=ignora)
+                         .values_list('pk', flat=True))
+                    for s in (nazionale, regionale, locale, unita)
+                    for includi_me in (True, False) for pubblici in (True, False) for ignora in (True, False)
+                ],
+                'espandi_queryset': [
+                    sorted(Sede.objects.filter(pk__in=pks).espandi(pubblici=pubblici).values_list('pk', flat=True))
+                    for pks in ([regionale.pk], [provinciale.pk, locale.pk], [unita.pk])
+                    for pubblici in (True, False)
+                ],
+                'discendenti': [list(s.ottieni_discendenti(includimi=True).values_list('pk', flat=True))
+                                for s in (nazionale, locale)],
+                'superiori': list(unita.ottieni_superiori().values_list('pk', flat=True)),
+                'superiore': [unita.superiore(estensione=e) for e in (LOCALE, REGIONALE, TERRITORIALE)],
+                'comitati_sottostanti': list(regionale.comitati_sottostanti().values_list('pk', flat=True)),
+                'unita_sottostanti': list(locale.unita_sottostanti().values_list('pk', flat=True)),
+                'comitati': sorted(Sede.objects.filter(pk__in=[unita.pk, provinciale.pk])
+                                   .ottieni_comitati().values_list('pk', flat=True)),
+            }
+
+        def _commit():
+            # Il test e' in una transazione: l'invalidazione dell'albero e' rimandata al commit
+            for _, funzione in connection.run_on_commit:
+                funzione()
+
+        with self.settings(SEDI_ALBERO_MEMORIA=False):
+            database = _risultati()
+        with self.settings(SEDI_ALBERO_MEMORIA=True):
+            self.assertIsNone(albero_sedi(), msg="Sedi modificate nella transazione: si usa il database")
+            _commit()
+            memoria = _risultati()
+            self.assertEqual(database, memoria, msg="L'albero in memoria risponde come il database")
+            self.assertEqual(memoria['superiore'], [locale, regionale, None])
+            self.assertEqual(memoria['unita_sottostanti'], [unita.pk])
+
+            # Nessuna query per l'espansione, oltre a quella dei risultati
+            with self.assertNumQueries(1):
+                list(nazionale.espandi(pubblici=True))
+
+            # La copia viene aggiornata al salvataggio di una sede, una volta sola al commit
+            nuova = crea_sede(estensione=TERRITORIALE, genitore=locale)
+            self.assertIn(nuova, locale.espandi())
+            locale.attiva = False
+            locale.save()
+            self.assertEqual(len([f for _, f in connection.run_on_commit if not getattr(f, 'eseguita', True)]), 1)
+            _commit()
+            self.assertIn(nuova.pk, albero_sedi().figli_di(locale.pk, solo_attivi=False))
+            self.assertNotIn(nuova.pk, albero_sedi().discendenti(provinciale.pk))
+
     def test_riserva_nel_passato(self):
 
         presidente = crea_persona()
@@ -2509,6 +2701,110 @@ class TestAnagrafica(TestCase):
         self.assertContains(response, persona_sede2)
         self.assertContains(response, persona_sede2b)
 
+    def test_importa_volontari(self):
+        from anagrafica.importa import ContestoImportazione, importa_volontari, VALIDAZIONE_ERRORE, \
+            VALIDAZIONE_AVVISO
+        presidente = crea_persona()
+        sede = crea_sede(presidente=presidente)
+        sede.nome = "Comitato di Importazione"
+        sede.save()
+
+        def riga(nome, cognome, codice_fiscale, email="", nome_sede=sede.nome):
+            return [nome, cognome, "01/01/1980", "Roma (RM)", codice_fiscale, "Via Roma", "1", "Roma", "RM",
+                    "00100", email, "", "+39 06 1234567", "", "01/01/2017", nome_sede]
+
+        email = email_fittizzia()
+        righe = [
+            riga("Mario", "Rossi", "RSSMRA80A01H501U", email=email),
+            riga("Giuseppe", "Verdi", "VRDGPP80A01H501U", email=email),
+            riga("Mario", "Rossi", "rssmra80a01h501u"),
+            riga("Luca", "Bianchi", "BNCLCU80A01H501Q", nome_sede="Sede inesistente"),
+        ]
+
+        risultati = list(importa_volontari(righe, ContestoImportazione(righe), dimensione_blocco=1))
+        self.assertEqual([x[3] for x in risultati], [True, True, False, False],
+                         msg="Solo le righe valide vengono importate")
+        self.assertIn((VALIDAZIONE_ERRORE, "Codice fiscale ripetuto nel file (riga 2)"), risultati[2][2])
+        self.assertIn((VALIDAZIONE_ERRORE, "Sede non trovata: Sede inesistente"), risultati[3][2])
+        self.assertTrue(any(tipo == VALIDAZIONE_AVVISO for tipo, messaggio in risultati[1][2]),
+                        msg="L'email gia' usata nel file non permette di creare le credenziali")
+
+        rossi = Persona.objects.get(codice_fiscale="RSSMRA80A01H501U")
+        verdi = Persona.objects.get(codice_fiscale="VRDGPP80A01H501U")
+        self.assertTrue(rossi.appartenenze_attuali().filter(sede=sede, membro=Appartenenza.VOLONTARIO).exists())
+        self.assertTrue(verdi.appartenenze_attuali().filter(sede=sede, membro=Appartenenza.VOLONTARIO).exists())
+        self.assertEqual(rossi.numeri_telefono.count(), 1)
+        self.assertEqual(Utenza.objects.get(email=email).persona, rossi)
+        self.assertFalse(Utenza.objects.filter(persona=verdi).exists())
+
+        # Una seconda importazione non duplica i volontari gia' presenti
+        risultati = list(importa_volontari(righe[:1], ContestoImportazione(righe[:1])))
+        self.assertFalse(risultati[0][3])
+        self.assertEqual(Persona.objects.filter(codice_fiscale="RSSMRA80A01H501U").count(), 1)
+
+    def test_statistiche(self):
+        from anagrafica.statistiche import calcola_soci_volontari_regioni, statistiche_attuali, SOCI, \
+            REGIONE_SOCI
+        regionale = crea_sede(estensione=REGIONALE)
+        locale = crea_sede(estensione=LOCALE, genitore=regionale)
+        disattivata = crea_sede(estensione=LOCALE, genitore=regionale)
+        altra_regione = crea_sede(estensione=REGIONALE)
+
+        volontario = crea_persona()
+        crea_appartenenza(volontario, locale)
+        crea_appartenenza(volontario, regionale)  # Contato una sola volta
+        ordinario = crea_persona()
+        crea_appartenenza(ordinario, regionale, tipo=Appartenenza.ORDINARIO)
+        crea_appartenenza(crea_persona(), disattivata)
+        disattivata.attiva = False
+        disattivata.save()
+
+        regioni = calcola_soci_volontari_regioni()
+        for regione in (regionale, altra_regione):
+            self.assertEqual(
+                regioni.get(regione.pk, (0, 0)),
+                (regione.membri_attuali(figli=True, membro__in=Appartenenza.MEMBRO_SOCIO).count(),
+                 regione.membri_attuali(figli=True, membro=Appartenenza.VOLONTARIO).count()),
+            )
+        self.assertEqual(regioni[regionale.pk], (2, 1))
+
+        statistiche = statistiche_attuali()
+        self.assertIn((regionale, 2, 1), statistiche['regioni'])
+        self.assertIn((altra_regione, 0, 0), statistiche['regioni'])
+        self.assertEqual(statistiche[SOCI], 2)
+        self.assertEqual(StatisticaGiornaliera.objects.filter(nome=REGIONE_SOCI).count(), 2)
+
+        # Le statistiche di oggi vengono lette senza essere ricalcolate
+        crea_appartenenza(crea_persona(), locale)
+        with self.assertNumQueries(2):
+            self.assertEqual(statistiche_attuali()[SOCI], 2)
+
+        # Anche le righe senza sede sono uniche per giorno e nome
+        with self.assertRaises(IntegrityError), atomic():
+            StatisticaGiornaliera.objects.create(giorno=datetime.date.today(), nome=SOCI, valore=3)
+
+    def test_permessi_almeno_molti(self):
+        presidente = crea_persona()
+        sede = crea_sede(presidente=presidente)
+        altra_sede = crea_sede()
+        volontari = [crea_persona() for _ in range(8)]
+        for i, volontario in enumerate(volontari):
+            crea_appartenenza(volontario, sede if i % 2 else altra_sede)
+
+        def query_per(persone):
+            with CaptureQueriesContext(connection) as query:
+                livelli = presidente.permessi_almeno_molti(persone, LETTURA)
+            return len(query), livelli
+
+        numero_2, _ = query_per(volontari[:2])
+        numero_8, livelli = query_per(volontari)
+        self.assertEqual(numero_2, numero_8, msg="Il numero di query non dipende dal numero di oggetti")
+
+        for volontario in volontari:
+            for minimo in (LETTURA, MODIFICA):
+                self.assertEqual(livelli[volontario.pk] >= minimo, presidente.permessi_almeno(volontario, minimo))
+        self.assertTrue(livelli[volontari[1].pk] >= MODIFICA)
+
 
 class TestFunzionaliAnagrafica(TestFunzionale):
 
@@ -1,5 +1,3 @@
-import codecs
-import csv
 import datetime
 from collections import OrderedDict
 from importlib import import_module
@@ -15,9 +13,8 @@ from django.template.loader import get_template
 
 # Le viste base vanno qui.
 from django.views.generic import ListView
-from django.utils import timezone
 
-from anagrafica.costanti import TERRITORIALE, REGIONALE
+from anagrafica.costanti import TERRITORIALE
 from anagrafica.elenchi import ElencoDelegati
 from anagrafica.forms import ModuloStepComitato, ModuloStepCredenziali, ModuloModificaAnagrafica, ModuloModificaAvatar, \
     ModuloCreazioneDocumento, ModuloModificaPassword, ModuloModificaEmailAccesso, ModuloModificaEmailContatto, \
@@ -30,7 +27,7 @@ from anagrafica.forms import ModuloStepCodiceFiscale
 from anagrafica.forms import ModuloStepAnagrafica
 
 # Tipi di registrazione permessi
-from anagrafica.importa import VALIDAZIONE_ERRORE, VALIDAZIONE_AVVISO, VALIDAZIONE_OK, import_import_volontari
+from anagrafica.importa import VALIDAZIONE_ERRORE, VALIDAZIONE_AVVISO, VALIDAZIONE_OK
 from anagrafica.models import Persona, Documento, Telefono, Estensione, Delega, Appartenenza, Trasferimento, \
     ProvvedimentoDisciplinare, Sede, Riserva
 from anagrafica.permessi.applicazioni import PRESIDENTE, UFFICIO_SOCI, PERMESSI_NOMI_DICT, DELEGATO_OBIETTIVO_1, \
@@ -470,9 +467,7 @@ def utente_documenti_zip(request, me):
     z = Zip(oggetto=me)
     for d in me.documenti.all():
         z.aggiungi_file(d.file.path)
-    z.comprimi_e_salva(nome='Documenti.zip')
-
-    return redirect(z.download_url)
+    return z.risposta_streaming(nome='Documenti.zip')
 
 @pagina_privata
 def utente_storico(request, me):
@@ -1706,45 +1701,37 @@ def handle_uploaded_file(f):
 
 @pagina_privata
 def admin_import_volontari(request, me):
-    from anagrafica.importa import import_valida_volontari
+    from anagrafica.importa import ContestoImportazione, importa_volontari, leggi_csv, rapporto_importazione
 
     if not me.utenza.is_superuser:
         return redirect(ERRORE_PERMESSI)
 
     risultati = []
     modulo = ModuloImportVolontari(request.POST or None, request.FILES or None)
-    righe = []
 
     importati = 0
-
-    def unicode_csv_reader(utf8_data, dialect=csv.excel, **kwargs):
-        csv_reader = csv.reader(utf8_data, dialect=dialect, **kwargs)
-        for row in csv_reader:
-            yield [cell.decode('UTF-8') if hasattr(cell, 'decode') else cell for cell in row]
+    rapporto = None
 
     if modulo.is_valid():
 
-
         nome_file = handle_uploaded_file(request.FILES['file_csv'])
-        with codecs.open(nome_file, encoding="utf-8") as csvfile:
-            riga = unicode_csv_reader(csvfile, delimiter=modulo.cleaned_data['delimitatore'])
-            intestazione = True
-            for r in riga:
-                if intestazione:
-                    intestazione = False
-                    continue
-                righe += [r]
+        delimitatore = modulo.cleaned_data['delimitatore']
 
         try:
-            risultati = import_valida_volontari(righe)
-            if modulo.cleaned_data['azione'] == modulo.IMPORTA:
-                importati = import_import_volontari(risultati)
+            contesto_importazione = ContestoImportazione(leggi_csv(nome_file, delimitatore))
+            righe = importa_volontari(leggi_csv(nome_file, delimitatore), contesto_importazione,
+                                      importa=modulo.cleaned_data['azione'] == modulo.IMPORTA)
+            risultati = [(riga, log, importata) for numero, riga, log, importata in righe]
 
         except IndexError:
             return errore_generico(request, me, titolo="Delimitatore errato",
                                    messaggio="File non valido o delimitatore errato")
 
-        risultati = zip(righe, risultati)
+        importati = len([x for x in risultati if x[2]])
+        rapporto = rapporto_importazione(((i + 2, riga, log, importata)
+                                          for i, (riga, log, importata) in enumerate(risultati)),
+                                         richiedente=me)
+
     contesto = {
         "modulo": modulo,
         "risultati": risultati,
@@ -1752,57 +1739,33 @@ def admin_import_volontari(request, me):
         "AVVISO": VALIDAZIONE_AVVISO,
         "OK": VALIDAZIONE_OK,
         "importati": importati,
+        "rapporto": rapporto,
     }
     return 'admin_import_volontari.html', contesto
 
 
 @pagina_privata
 def admin_statistiche(request, me):
+    from anagrafica.statistiche import statistiche_attuali, PERSONE, SOCI, SOCI_GIOVANI_35, SEDI, COMITATI
+
     if not me.utenza.is_staff:
         return redirect(ERRORE_PERMESSI)
 
-    oggi = datetime.date.today()
-    nascita_minima_35 = datetime.date(oggi.year - 36, oggi.month, oggi.day)
-    persone = Persona.objects.all()
-    soci = Persona.objects.filter(
-        Appartenenza.query_attuale(membro__in=Appartenenza.MEMBRO_SOCIO).via("appartenenze")
-    ).distinct('nome', 'cognome', 'codice_fiscale')
-    soci_giovani_35 = soci.filter(
-        data_nascita__gt=nascita_minima_35,
-    )
-    sedi = Sede.objects.filter(attiva=True)
-    comitati = sedi.comitati()
-    regionali = Sede.objects.filter(estensione=REGIONALE).exclude(nome__contains='Provinciale Di Roma')
-
-    totale_regione_soci = 0
-    totale_regione_volontari = 0
-
-    regione_soci_volontari = []
-    for regione in regionali:
-        regione_soci = int(regione.membri_attuali(figli=True, membro__in=Appartenenza.MEMBRO_SOCIO).count())
-        regione_volontari = int(regione.membri_attuali(figli=True, membro=Appartenenza.VOLONTARIO).count())
-        regione_soci_volontari += [
-            (
-                regione,
-                regione_soci,
-                regione_volontari,
-            ),
-        ]
-        totale_regione_soci += regione_soci
-        totale_regione_volontari += regione_volontari
+    statistiche = statistiche_attuali()
+    regione_soci_volontari = statistiche['regioni']
 
     contesto = {
-        "persone_numero": persone.count(),
-        "soci_numero": soci.count(),
-        "soci_percentuale": soci.count() / persone.count() * 100,
-        "soci_giovani_35_numero": soci_giovani_35.count(),
-        "soci_giovani_35_percentuale": soci_giovani_35.count() / soci.count() * 100,
-        "sedi_numero": sedi.count(),
-        "comitati_numero": comitati.count(),
-        "ora": timezone.now(),
+        "persone_numero": statistiche[PERSONE],
+        "soci_numero": statistiche[SOCI],
+        "soci_percentuale": statistiche[SOCI] / max(statistiche[PERSONE], 1) * 100,
+        "soci_giovani_35_numero": statistiche[SOCI_GIOVANI_35],
+        "soci_giovani_35_percentuale": statistiche[SOCI_GIOVANI_35] / max(statistiche[SOCI], 1) * 100,
+        "sedi_numero": statistiche[SEDI],
+        "comitati_numero": statistiche[COMITATI],
+        "ora": statistiche['ora'],
         "regione_soci_volontari": regione_soci_volontari,
-        "totale_regione_soci": totale_regione_soci,
-        "totale_regione_volontari": totale_regione_volontari,
+        "totale_regione_soci": sum(soci for regione, soci, volontari in regione_soci_volontari),
+        "totale_regione_volontari": sum(volontari for regione, soci, volontari in regione_soci_volontari),
     }
     return 'admin_statistiche.html', contesto
 
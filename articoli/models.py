@@ -2,7 +2,7 @@ from html import unescape
 
 from autoslug import AutoSlugField
 from django.core.urlresolvers import reverse
-from django.db import models, transaction
+from django.db import models
 from django.forms import Textarea
 from django.template.defaultfilters import slugify
 from django.utils import timezone
@@ -10,6 +10,7 @@ from django.utils.html import strip_tags
 
 from ckeditor.fields import RichTextField
 
+from base.contatori import incrementa
 from base.models import ModelloSemplice, ModelloAlbero, ConAutorizzazioni, ConAllegati
 from base.tratti import ConMarcaTemporale
 from segmenti.models import BaseSegmento
@@ -105,10 +106,11 @@ class Articolo(ModelloSemplice, ConMarcaTemporale, ConAllegati):
             return ", ".join([str(x) for x in segmenti])
         return "Pubblico (nessun segmento)"
 
-    @transaction.atomic
     def incrementa_visualizzazioni(self):
-        self.visualizzazioni += 1
-        self.save()
+        """
+        Incrementa le visualizzazioni, senza salvare l'articolo (vedi base.contatori).
+        """
+        incrementa(self, 'visualizzazioni')
 
 
 class ArticoloSegmento(BaseSegmento):
@@ -5,11 +5,12 @@ import string
 from django.conf import settings
 from django.core.files.temp import NamedTemporaryFile
 from django.core.urlresolvers import reverse
-from django.test import TestCase
+from django.test import TestCase, override_settings
 
 from anagrafica.models import Delega
 from anagrafica.permessi.applicazioni import PRESIDENTE, UFFICIO_SOCI
 from autenticazione.utils_test import TestFunzionale
+from base import contatori
 from base.files import Zip
 from base.utils_tests import crea_persona, crea_persona_sede_appartenenza
 
@@ -48,6 +49,31 @@ class ArticoliTests(TestCase):
 
         self.assertNotEqual(articolo_1.slug, articolo_2.slug)
 
+    @override_settings(CONTATORI_INTERVALLO=3600)
+    def test_visualizzazioni_contatori(self):
+        contatori.svuota()
+        pubblico = Articolo.objects.create(titolo='Pubblico', corpo=parola_casuale(100))
+        segmentato = Articolo.objects.create(titolo='Segmentato', corpo=parola_casuale(100))
+        ArticoloSegmento.objects.create(segmento='B', articolo=segmentato)
+
+        for _ in range(3):
+            Articolo.objects.get(pk=pubblico.pk).incrementa_visualizzazioni()
+        segmentato.incrementa_visualizzazioni()
+
+        # Gli incrementi restano in memoria fino allo svuotamento
+        self.assertEqual(segmentato.visualizzazioni, 1)
+        self.assertEqual(Articolo.objects.get(pk=pubblico.pk).visualizzazioni, 0)
+        self.assertEqual(contatori.svuota(), 2)
+        self.assertEqual(Articolo.objects.get(pk=pubblico.pk).visualizzazioni, 3)
+        self.assertEqual(Articolo.objects.get(pk=segmentato.pk).visualizzazioni, 1)
+
+        oggi = datetime.date.today()
+        pubblico.incrementa_visualizzazioni()
+        contatori.svuota()
+        self.assertEqual(contatori.serie_giornaliera(pubblico, 'visualizzazioni', oggi), {oggi: 4})
+        self.assertEqual(contatori.serie_per_segmento(Articolo, 'visualizzazioni', ArticoloSegmento, oggi),
+                         {None: {oggi: 4}, 'B': {oggi: 1}})
+
     def test_articolo(self):
 
         CONTENUTO_1 = "Lorem ipsum dolor sit amet, consectetur adipiscing elit.\n"
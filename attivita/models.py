@@ -9,7 +9,7 @@ from math import floor, ceil
 from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.db import models
-from django.db.models import Q, F, Sum
+from django.db.models import Q, F, Sum, Count
 from django.utils import timezone
 
 from anagrafica.permessi.applicazioni import REFERENTE, OBIETTIVI
@@ -20,12 +20,12 @@ from base.utils import concept, poco_fa
 from posta.models import Messaggio
 from social.models import ConGiudizio, ConCommenti
 from base.models import ModelloSemplice, ConAutorizzazioni, ConAllegati, ConVecchioID, Autorizzazione
-from base.tratti import ConMarcaTemporale, ConDelegati
+from base.tratti import ConMarcaTemporale, ConDelegati, ConIndicePermessi
 from base.geo import ConGeolocalizzazione
 
 
 class Attivita(ModelloSemplice, ConGeolocalizzazione, ConMarcaTemporale, ConGiudizio, ConCommenti,
-               ConAllegati, ConDelegati, ConVecchioID):
+               ConAllegati, ConDelegati, ConVecchioID, ConIndicePermessi):
 
     class Meta:
         verbose_name = "Attività"
@@ -97,9 +97,16 @@ class Attivita(ModelloSemplice, ConGeolocalizzazione, ConMarcaTemporale, ConGiud
     #  stato in qualche momento nel passato.
     chiusa_automaticamente = models.DateTimeField(default=None, null=True, blank=True)
 
+    CAMPI_INDICE_PERMESSI = ('sede_id', 'area_id',)
+
     def __str__(self):
         return self.nome
 
+    def oggetti_indice_permessi(self):
+        # Le deleghe sull'area, attuale e precedente, coprono l'attivita'
+        aree = [self.area_id, self._indice_permessi_default[2]]
+        return Area.objects.filter(pk__in=[a for a in aree if a is not None])
+
     def referenti_attuali(self, al_giorno=None):
         return self.delegati_attuali(tipo=REFERENTE, al_giorno=al_giorno)
 
@@ -423,17 +430,144 @@ class Turno(ModelloSemplice, ConMarcaTemporale, ConGiudizio):
         ## In tutti gli altri casi.
         return self.TURNO_PUOI_PARTECIPARE_PRENOTA
 
+    @classmethod
+    def stati_persona(cls, turni, persona):
+        """
+        Ritorna lo stato TURNO_ per la persona di ogni turno, con le stesse regole di Turno.persona
+         ma con un numero fisso di query, indipendente dal numero di turni (es. pagina dei turni):
+         ultime partecipazioni e relative autorizzazioni, attivita', sedi e partecipazioni confermate
+         vengono caricate in blocco. Il requisito di sede viene verificato una volta per estensione.
+        :param turni: Lista o QuerySet di turni (viene valutato).
+        :param persona: La persona.
+        :return: Dizionario {pk turno: stato TURNO_}.
+        """
+        turni = list(turni)
+        if not turni:
+            return {}
+
+        # Ultima richiesta di partecipazione per ogni turno
+        partecipazioni = {
+            p.turno_id: p for p in Partecipazione.objects.filter(
+                persona=persona, turno__in=turni,
+            ).order_by('turno_id', '-creazione').distinct('turno_id')
+        }
+        esiti = Partecipazione.esiti_in_blocco(partecipazioni.values())
+
+        attivita = {
+            pk: (apertura, estensione) for pk, apertura, estensione in Attivita.objects.filter(
+                pk__in={t.attivita_id for t in turni}
+            ).values_list('pk', 'apertura', 'estensione_id')
+        }
+
+        cls.precarica_confermate(turni)
+
+        requisiti = {}
+
+        def sede_valida(estensione):
+            if 'sedi' not in requisiti:
+                requisiti['sedi'] = cls._estensioni_valide(persona, {e for a, e in attivita.values()})
+            return estensione in requisiti['sedi']
+
+        def in_riserva():
+            if 'riserva' not in requisiti:
+                requisiti['riserva'] = persona.in_riserva
+            return requisiti['riserva']
+
+        adesso = timezone.now()
+        stati = {}
+        for turno in turni:
+            partecipazione = partecipazioni.get(turno.pk)
+            apertura, estensione = attivita[turno.attivita_id]
+
+            if partecipazione:
+                esito = esiti[partecipazione.pk]
+                if esito == Partecipazione.ESITO_OK:
+                    stato = cls.TURNO_PRENOTATO_NON_PUOI_RITIRARTI
+                elif esito == Partecipazione.ESITO_PENDING:
+                    stato = cls.TURNO_PRENOTATO_PUOI_RITIRARTI
+                elif esito == Partecipazione.ESITO_RITIRATA:
+                    stato = cls.TURNO_PUOI_PARTECIPARE_PRENOTA
+                else:
+                    stato = cls.TURNO_NON_PUOI_PARTECIPARE_NEGATO
+
+            elif not turno.fine > adesso:
+                stato = cls.TURNO_NON_PUOI_PARTECIPARE_PASSATO
+
+            elif turno.prenotazione and adesso > turno.prenotazione:
+                stato = cls.TURNO_NON_PUOI_PARTECIPARE_TROPPO_TARDI
+
+            elif apertura != Attivita.APERTA:
+                stato = cls.TURNO_NON_PUOI_PARTECIPARE_ATTIVITA_CHIUSA
+
+            elif not sede_valida(estensione):
+                stato = cls.TURNO_NON_PUOI_PARTECIPARE_FUORI_SEDE
+
+            elif in_riserva():
+                stato = cls.TURNO_NON_PUOI_PARTECIPARE_RISERVA
+
+            elif turno.pieno:
+                stato = cls.TURNO_PUOI_PARTECIPARE_DISPONIBILITA
+
+            else:
+                stato = cls.TURNO_PUOI_PARTECIPARE_PRENOTA
+
+            stati[turno.pk] = stato
+
+        return stati
+
+    @staticmethod
+    def _estensioni_valide(persona, estensioni):
+        """
+        Tra le estensioni date, ritorna quelle che contengono (o sono) una sede attiva di cui la
+         persona e' membro (come Sede.ottieni_discendenti(includimi=True)), usando gli intervalli
+         MPTT con due query.
+        :return: Insieme di pk di sedi.
+        """
+        from anagrafica.models import Appartenenza, Sede
+
+        estensioni = {e for e in estensioni if e is not None}
+        if not estensioni:
+            return set()
+
+        sedi = list(persona.sedi_attuali(membro__in=Appartenenza.MEMBRO_ATTIVITA).filter(
+            Sede.filtro_attivi
+        ).values_list('tree_id', 'lft'))
+        valide = set()
+        for pk, tree_id, lft, rght in Sede.objects.filter(pk__in=estensioni).values_list('pk', 'tree_id', 'lft', 'rght'):
+            if any(t == tree_id and lft <= l <= rght for t, l in sedi):
+                valide.add(pk)
+        return valide
+
+    @classmethod
+    def precarica_confermate(cls, turni):
+        """
+        Conta le partecipazioni confermate di tutti i turni con una sola query, e le memorizza
+         nei turni, per numero_partecipazioni_confermate, scoperto e pieno.
+        :param turni: Lista di turni.
+        """
+        numeri = dict(Partecipazione.con_esito_ok().filter(turno__in=turni).order_by()
+                      .values('turno_id').annotate(numero=Count('pk')).values_list('turno_id', 'numero'))
+        for turno in turni:
+            turno._numero_confermate = numeri.get(turno.pk, 0)
+
+    @property
+    def numero_partecipazioni_confermate(self):
+        numero = getattr(self, '_numero_confermate', None)
+        if numero is None:
+            return self.partecipazioni_confermate().count()
+        return numero
+
 
     def __str__(self):
         return "%s (%s)" % (self.nome, self.attivita.nome if self.attivita else "Nessuna attività")
 
     @property
     def scoperto(self):
-        return self.partecipazioni_confermate().count() < self.minimo
+        return self.numero_partecipazioni_confermate < self.minimo
 
     @property
     def pieno(self):
-        return self.massimo and self.partecipazioni_confermate().count() >= self.massimo
+        return self.massimo and self.numero_partecipazioni_confermate >= self.massimo
 
     @property
     def futuro(self):
@@ -661,7 +795,7 @@ def valida_numero_obiettivo(numero):
         raise ValidationError("Inserisci un numero di obiettivo (1, 2, 3, 4, 5 o 6).")
 
 
-class Area(ModelloSemplice, ConMarcaTemporale, ConDelegati):
+class Area(ModelloSemplice, ConMarcaTemporale, ConDelegati, ConIndicePermessi):
 
     sede = models.ForeignKey('anagrafica.Sede', related_name='aree', on_delete=models.PROTECT)
     nome = models.CharField(max_length=256, db_index=True, default='Generale', blank=False)
@@ -684,6 +818,13 @@ class Area(ModelloSemplice, ConMarcaTemporale, ConDelegati):
             self.nome,
         )
 
+    CAMPI_INDICE_PERMESSI = ('sede_id', 'obiettivo',)
+
+    def modelli_indice_permessi(self):
+        # Le deleghe di obiettivo coprono le aree, le relative attivita' e le sedi con aree
+        from anagrafica.models import Sede
+        return Area, Attivita, Sede,
+
     @property
     def codice_obiettivo(self):
         return OBIETTIVI[self.obiettivo]
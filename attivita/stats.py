@@ -1,8 +1,9 @@
-from datetime import timedelta, date, datetime, time
-from django.db.models import Count, F, Sum
-from attivita.models import Attivita, Turno, Partecipazione
+from datetime import timedelta, datetime, time
+from django.utils import timezone
+from attivita.models import Partecipazione
 import json
 
+from base.statistiche import periodi
 from base.utils import timedelta_ore
 
 
@@ -20,8 +21,6 @@ def statistiche_attivita_persona(persona, modulo):
     if not modulo.is_valid():
         return None
 
-    oggi = date.today()
-
     impostazioni = {
         # num_giorni: (nome, numero_periodi)
         modulo.SETTIMANA: ("sett.", 20),
@@ -31,34 +30,38 @@ def statistiche_attivita_persona(persona, modulo):
     }
 
     giorni = int(modulo.cleaned_data['periodo'])
-    etichetta, periodi = impostazioni[giorni]
+    etichetta, periodi_precedenti = impostazioni[giorni]
+
+    elenco_periodi = periodi(giorni, periodi_precedenti)
+
+    # Una sola query per tutti i periodi: i turni vengono poi assegnati ad ogni periodo con
+    #  cui si sovrappongono, come nel filtro inizio__lte=fine, fine__gte=inizio.
+    inizio_statistiche = datetime.combine(elenco_periodi[0][1], time(0, 0, 0))
+    turni = Partecipazione.con_esito_ok(persona=persona, turno__fine__gte=inizio_statistiche)\
+        .values_list('turno__inizio', 'turno__fine')
+    turni = [(timezone.localtime(inizio).replace(tzinfo=None), timezone.localtime(fine).replace(tzinfo=None))
+             for inizio, fine in turni]
 
     statistiche = []
     chart = {}
 
-    for periodo in range(periodi, -1, -1):
+    for periodo, inizio, fine in elenco_periodi:
 
         dati = {}
 
-        fine = oggi - timedelta(days=(giorni * periodo))
-        inizio = fine - timedelta(days=giorni - 1)
-
         fine = datetime.combine(fine, time(23, 59, 59))
         inizio = datetime.combine(inizio, time(0, 0, 0))
 
         dati['inizio'] = inizio
         dati['fine'] = fine
 
-        # Prima, ottiene tutti i queryset.
-        qs_turni = Turno.objects.filter(inizio__lte=fine, fine__gte=inizio)
-        qs_part = Partecipazione.con_esito_ok(turno__in=qs_turni, persona=persona)
-
-        ore_di_servizio = qs_part.annotate(durata=F('turno__fine') - F('turno__inizio'))\
-            .aggregate(totale_ore=Sum('durata'))['totale_ore'] or timedelta()
+        turni_periodo = [(turno_inizio, turno_fine) for turno_inizio, turno_fine in turni
+                         if turno_inizio <= fine and turno_fine >= inizio]
+        ore_di_servizio = sum((turno_fine - turno_inizio for turno_inizio, turno_fine in turni_periodo), timedelta())
 
         # Poi, associa al dizionario statistiche.
         dati['etichetta'] = "%d %s fa" % (periodo, etichetta,)
-        dati['num_turni'] = qs_part.count()
+        dati['num_turni'] = len(turni_periodo)
         dati['ore_di_servizio'] = ore_di_servizio
         dati['ore_di_servizio_int'] = round(ore_di_servizio.total_seconds() / 3600, 3)
 
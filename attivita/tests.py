@@ -3,8 +3,10 @@ from datetime import timedelta
 from unittest import skip
 from unittest.mock import patch
 from django.core import mail
+from django.db import connection
 from django.utils import timezone
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 
 from attivita.forms import ModuloOrganizzaAttivitaReferente
 from attivita.models import Attivita, Area, Turno, Partecipazione
@@ -12,11 +14,13 @@ from anagrafica.costanti import LOCALE
 from anagrafica.models import Sede, Persona, Appartenenza, Delega
 from anagrafica.permessi.applicazioni import REFERENTE, PRESIDENTE, DELEGATO_CO
 from anagrafica.permessi.costanti import GESTIONE_CENTRALE_OPERATIVA_SEDE
+from anagrafica.permessi.incarichi import INCARICO_GESTIONE_ATTIVITA_PARTECIPANTI, INCARICO_PRESIDENZA
 from autenticazione.utils_test import TestFunzionale
 from base.utils import poco_fa
 from base.utils_tests import crea_persona, crea_persona_sede_appartenenza, crea_area_attivita, crea_turno, crea_partecipazione, \
-    email_fittizzia, crea_appartenenza
+    email_fittizzia, crea_appartenenza, crea_sede
 from base.models import Autorizzazione
+from posta.models import Messaggio
 
 
 class TestAttivita(TestCase):
@@ -545,6 +549,107 @@ class TestAttivita(TestCase):
         self.assertEqual(autorizzazione.concessa, None)
         self.assertIn(partecipazione, Partecipazione.con_esito_no())
 
+    def test_autorizzazioni_automatiche_blocchi(self):
+        presidente = crea_persona()
+        persona, sede, app = crea_persona_sede_appartenenza(presidente=presidente)
+        persona.email_contatto = email_fittizzia()
+        persona.save()
+        area, attivita = crea_area_attivita(sede)
+        attivita.centrale_operativa = Attivita.CO_AUTO
+        attivita.save()
+
+        inizio = timezone.now() + timedelta(days=24)
+        partecipazioni = []
+        for _ in range(3):
+            turno = crea_turno(attivita, inizio=inizio, fine=inizio + timedelta(hours=2))
+            partecipazione = crea_partecipazione(persona, turno)
+            partecipazione.richiedi()
+            partecipazioni.append(partecipazione)
+        Autorizzazione.objects.update(scadenza=timezone.now() - timedelta(days=1))
+
+        metriche = Autorizzazione.gestisci_automatiche(blocco=2)
+        self.assertEqual(metriche['negate'], 3)
+        self.assertEqual(metriche['in_attesa'], 0)
+        self.assertEqual(metriche['messaggi'], 1, msg="Un solo messaggio per richiedente")
+        self.assertEqual(0, len(mail.outbox), msg="Il riepilogo viene accodato")
+        self.assertEqual(Messaggio.objects.filter(oggetto="Richieste gestite automaticamente").count(), 1)
+        for partecipazione in partecipazioni:
+            partecipazione.refresh_from_db()
+            self.assertEqual(partecipazione.esito, Partecipazione.ESITO_NO)
+            self.assertTrue(partecipazione.automatica)
+
+        self.assertEqual(Autorizzazione.gestisci_automatiche()['negate'], 0)
+
+    def test_autorizzazioni_automatiche_stesso_oggetto(self):
+        presidente = crea_persona()
+        persona, sede, app = crea_persona_sede_appartenenza(presidente=presidente)
+        area, attivita = crea_area_attivita(sede)
+        inizio = timezone.now() + timedelta(days=24)
+        turno = crea_turno(attivita, inizio=inizio, fine=inizio + timedelta(hours=2))
+        partecipazione = crea_partecipazione(persona, turno)
+
+        # Due firme alternative per il primo progressivo, una per il secondo
+        partecipazione.autorizzazione_richiedi(
+            persona, ((INCARICO_GESTIONE_ATTIVITA_PARTECIPANTI, attivita), (INCARICO_PRESIDENZA, sede)),
+            auto=Autorizzazione.AP_AUTO, notifiche_attive=False,
+        )
+        partecipazione.autorizzazione_richiedi(persona, (INCARICO_PRESIDENZA, sede),
+                                               auto=Autorizzazione.AP_AUTO, notifiche_attive=False)
+        Autorizzazione.objects.filter(progressivo=1).update(scadenza=timezone.now() - timedelta(days=1))
+        Autorizzazione.objects.filter(progressivo=2).update(scadenza=timezone.now() + timedelta(days=1))
+
+        metriche = Autorizzazione.gestisci_automatiche(blocco=1)
+        self.assertEqual(metriche['concesse'], 1, msg="Una sola firma per progressivo")
+        self.assertEqual(metriche['in_attesa'], 0)
+        partecipazione.refresh_from_db()
+        self.assertFalse(partecipazione.confermata)
+        self.assertFalse(partecipazione.automatica, msg="Richiesta non ancora conclusa")
+
+        Autorizzazione.objects.filter(progressivo=2).update(scadenza=timezone.now() - timedelta(days=1))
+        with patch.object(Partecipazione, 'autorizzazione_concessa') as concessa:
+            self.assertEqual(Autorizzazione.gestisci_automatiche()['concesse'], 1)
+        self.assertEqual(concessa.call_count, 1)
+        partecipazione.refresh_from_db()
+        self.assertTrue(partecipazione.confermata)
+        self.assertTrue(partecipazione.automatica)
+        self.assertEqual(Autorizzazione.gestisci_automatiche()['concesse'], 0)
+
+    def test_stati_persona(self):
+        presidente = crea_persona()
+        persona, sede, app = crea_persona_sede_appartenenza(presidente=presidente)
+        altra_sede = crea_sede(presidente)
+        area, attivita = crea_area_attivita(sede)
+        altra_area, altra_attivita = crea_area_attivita(altra_sede)
+
+        ora = timezone.now()
+        futuro = ora + timedelta(days=10)
+        prenotato = crea_turno(attivita, inizio=futuro, fine=futuro + timedelta(hours=2))
+        crea_partecipazione(persona, prenotato).richiedi()
+        passato = crea_turno(attivita, inizio=ora - timedelta(days=2), fine=ora - timedelta(days=1))
+        pieno = crea_turno(attivita, inizio=futuro, fine=futuro + timedelta(hours=2), massimo=1)
+        partecipazione = crea_partecipazione(crea_persona(), pieno)
+        partecipazione.confermata = True
+        partecipazione.save()
+        libero = crea_turno(attivita, inizio=futuro, fine=futuro + timedelta(hours=2))
+        fuori_sede = crea_turno(altra_attivita, inizio=futuro, fine=futuro + timedelta(hours=2))
+
+        turni = [prenotato, passato, pieno, libero, fuori_sede]
+        stati = Turno.stati_persona(Turno.objects.filter(pk__in=[t.pk for t in turni]), persona)
+        for turno in turni:
+            self.assertEqual(stati[turno.pk], turno.persona(persona),
+                             msg="Lo stato in blocco coincide con Turno.persona")
+        self.assertEqual(stati[pieno.pk], Turno.TURNO_PUOI_PARTECIPARE_DISPONIBILITA)
+        self.assertEqual(stati[fuori_sede.pk], Turno.TURNO_NON_PUOI_PARTECIPARE_FUORI_SEDE)
+
+        # Il numero di query non dipende dal numero di turni
+        for _ in range(5):
+            crea_turno(attivita, inizio=futuro, fine=futuro + timedelta(hours=2))
+        with CaptureQueriesContext(connection) as pochi:
+            Turno.stati_persona(Turno.objects.filter(pk__in=[prenotato.pk, libero.pk, fuori_sede.pk]), persona)
+        with CaptureQueriesContext(connection) as molti:
+            Turno.stati_persona(Turno.objects.all(), persona)
+        self.assertEqual(len(pochi), len(molti))
+
 
 class TestFunzionaleAttivita(TestFunzionale):
 
@@ -16,15 +16,12 @@ def unique(items):
 
 def turni_raggruppa_giorno(qs_turni):
     """
-    Da un elenco di turni (queryset), li raggruppa per giorno.
+    Da un elenco di turni (queryset), li raggruppa per giorno, in un solo passaggio.
     NB: Questo effettua l'evaluation del queryset.
     :param qs_turni: I turni.
-    :return:
-        """
-    giorni = unique([i.inizio.date() for i in qs_turni])
-    risultato = OrderedDict([(d, []) for d in giorni])
-    for d in giorni:
-        for i in qs_turni:
-            if i.inizio.date() == d:
-                risultato[d].append(i)
+    :return: OrderedDict {giorno: [turni]}, nell'ordine di prima apparizione dei giorni.
+    """
+    risultato = OrderedDict()
+    for turno in qs_turni:
+        risultato.setdefault(turno.inizio.date(), []).append(turno)
     return risultato
@@ -259,7 +259,9 @@ def attivita_calendario(request, me=None, inizio=None, fine=None, vista="calenda
 
 
     # Elenco
-    turni = me.calendario_turni(inizio, fine)
+    turni = list(me.calendario_turni(inizio, fine).select_related('attivita', 'attivita__sede',
+                                                                   'attivita__sede__genitore', 'attivita__locazione'))
+    Turno.precarica_confermate(turni)
     raggruppati = turni_raggruppa_giorno(turni)
 
     contesto = {
@@ -384,11 +386,15 @@ def attivita_scheda_turni(request, me=None, pk=None, pagina=None):
     p = Paginator(turni, Turno.PER_PAGINA)
     pg = p.page(pagina)
 
+    turni = list(pg.object_list)
+    stati_turni = Turno.stati_persona(turni, me) if me else {}
+
     contesto = {
         'pagina': pagina,
         'pagine': p.num_pages,
         'totale': p.count,
-        'turni': pg.object_list,
+        'turni': turni,
+        'stati_turni': stati_turni,
         'ha_precedente': pg.has_previous(),
         'ha_successivo': pg.has_next(),
         'pagina_precedente': pagina-1,
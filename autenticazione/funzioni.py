@@ -5,6 +5,7 @@ from django.template import RequestContext
 from django.utils.http import urlencode
 import functools
 from anagrafica.permessi.costanti import ERRORE_ORFANO, ERRORE_PERMESSI
+from base.memoria import memoria_richiesta
 from base.menu import menu
 from jorvik.settings import LOGIN_URL, DEBUG
 
@@ -22,6 +23,23 @@ def _spacchetta(pacchetto):
     return template, contesto, richiesta
 
 
+def _con_memoria(vista):
+    """
+    Esegue la vista con la memoria della richiesta attiva (vedi base.memoria).
+    In DEBUG, riporta i contatori della memoria nell'intestazione X-Memoria-Richiesta.
+    """
+
+    @functools.wraps(vista)
+    def _vista(request, *args, **kwargs):
+        with memoria_richiesta() as memoria:
+            risposta = vista(request, *args, **kwargs)
+        if DEBUG:
+            risposta['X-Memoria-Richiesta'] = str(memoria)
+        return risposta
+
+    return _vista
+
+
 def pagina_pubblica(funzione=None, permetti_embed=False):
     """
     Questa funzione attua da decoratore per le pagine accessibili sia a privati che pubblico.
@@ -127,7 +145,7 @@ def pagina_privata(funzione=None, pagina=LOGIN_URL, permessi=[]):
         contesto.update({"menu": menu(request)})
         return render_to_response(template, RequestContext(request, contesto))
 
-    return _pagina_privata
+    return _con_memoria(_pagina_privata)
 
 
 def pagina_privata_no_cambio_firma(funzione=None, pagina=LOGIN_URL, permessi=[]):
@@ -181,7 +199,7 @@ def pagina_privata_no_cambio_firma(funzione=None, pagina=LOGIN_URL, permessi=[])
         contesto.update({"menu": menu(request)})
         return render_to_response(template, RequestContext(request, contesto))
 
-    return _pagina_privata
+    return _con_memoria(_pagina_privata)
 
 
 class VistaDecorata(object):
@@ -0,0 +1,131 @@
+"""
+Questo modulo genera archivi ZIP in streaming (vedi Zip.risposta_streaming): l'archivio viene
+ prodotto un blocco alla volta, leggendo i file da disco mentre viene inviato, senza salvarlo
+ sotto MEDIA_ROOT e senza tenerlo in memoria.
+
+Ogni file viene:
+ - memorizzato senza compressione (STORED) se gia' compresso (es. PDF, immagini, vedi
+   ESTENSIONI_COMPRESSE): CRC e dimensione vengono calcolati con una prima lettura del file e
+   scritti nell'intestazione, come in un normale archivio;
+ - compresso (DEFLATED) altrimenti: CRC e dimensioni sono noti solo alla fine, e vengono scritti
+   dopo i dati (data descriptor), come fa zipfile per le scritture in streaming.
+
+Gli archivi non usano le estensioni ZIP64: oltre i 4 GB o i 65535 file viene sollevato
+ ValueError. Per archivi molto grandi va usato Zip.comprimi_e_salva, ad esempio in background.
+"""
+import os
+import struct
+import time
+import zlib
+from zipfile import ZIP_STORED, ZIP_DEFLATED
+
+BLOCCO = 64 * 1024
+
+ESTENSIONI_COMPRESSE = (
+    '.pdf', '.jpg', '.jpeg', '.png', '.gif', '.zip', '.gz', '.bz2', '.7z', '.rar',
+    '.docx', '.xlsx', '.pptx', '.odt', '.ods', '.mp3', '.mp4',
+)
+
+LIMITE_ZIP32 = 0xFFFFFFFF
+
+_FLAG_DESCRITTORE = 0x08
+_FLAG_UTF8 = 0x800
+
+
+def compressione(nome_file):
+    """
+    :return: ZIP_STORED per i file gia' compressi, ZIP_DEFLATED altrimenti.
+    """
+    return ZIP_STORED if os.path.splitext(nome_file)[1].lower() in ESTENSIONI_COMPRESSE else ZIP_DEFLATED
+
+
+def _data_dos(timestamp):
+    t = time.localtime(timestamp)
+    anno = max(t.tm_year, 1980)
+    return (t.tm_hour << 11) | (t.tm_min << 5) | (t.tm_sec // 2), \
+        ((anno - 1980) << 9) | (t.tm_mon << 5) | t.tm_mday
+
+
+def _leggi(percorso):
+    with open(percorso, 'rb') as f:
+        while True:
+            dati = f.read(BLOCCO)
+            if not dati:
+                return
+            yield dati
+
+
+def _crc(percorso):
+    crc = 0
+    for dati in _leggi(percorso):
+        crc = zlib.crc32(dati, crc)
+    return crc & 0xFFFFFFFF
+
+
+def _verifica(valore):
+    if valore > LIMITE_ZIP32:
+        raise ValueError("Archivio troppo grande per lo streaming: usare Zip.comprimi_e_salva")
+    return valore
+
+
+def genera_zip(file_da_aggiungere):
+    """
+    Genera un archivio ZIP un blocco alla volta.
+    :param file_da_aggiungere: Lista di tuple (percorso del file, nome nell'archivio).
+    :return: Generatore di bytes.
+    """
+    if len(file_da_aggiungere) > 0xFFFF:
+        raise ValueError("Troppi file per lo streaming: usare Zip.comprimi_e_salva")
+
+    posizione = 0
+    centrale = []
+
+    for percorso, nome in file_da_aggiungere:
+        stato = os.stat(percorso)
+        ora, data = _data_dos(stato.st_mtime)
+        metodo = compressione(nome)
+        nome_bytes = nome.encode('utf-8')
+        inizio = posizione
+
+        if metodo == ZIP_STORED:
+            flag = _FLAG_UTF8
+            crc, compressi, originali = _crc(percorso), _verifica(stato.st_size), stato.st_size
+        else:
+            flag = _FLAG_UTF8 | _FLAG_DESCRITTORE
+            crc, compressi, originali = 0, 0, 0
+
+        intestazione = struct.pack('<IHHHHHIIIHH', 0x04034b50, 20, flag, metodo, ora, data,
+                                   crc, compressi, originali, len(nome_bytes), 0) + nome_bytes
+        posizione += len(intestazione)
+        yield intestazione
+
+        if metodo == ZIP_STORED:
+            for dati in _leggi(percorso):
+                posizione += len(dati)
+                yield dati
+        else:
+            compressore = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -15)
+            for dati in _leggi(percorso):
+                crc = zlib.crc32(dati, crc)
+                originali += len(dati)
+                dati = compressore.compress(dati)
+                if dati:
+                    compressi += len(dati)
+                    posizione += len(dati)
+                    yield dati
+            dati = compressore.flush()
+            compressi += len(dati)
+            posizione += len(dati)
+            crc &= 0xFFFFFFFF
+            descrittore = struct.pack('<IIII', 0x08074b50, crc, _verifica(compressi), _verifica(originali))
+            posizione += len(descrittore)
+            yield dati + descrittore
+
+        centrale.append(struct.pack(
+            '<IHHHHHHIIIHHHHHII', 0x02014b50, 20, 20, flag, metodo, ora, data, crc, compressi, originali,
+            len(nome_bytes), 0, 0, 0, 0, (stato.st_mode & 0xFFFF) << 16, _verifica(inizio),
+        ) + nome_bytes)
+
+    centrale = b''.join(centrale)
+    yield centrale + struct.pack('<IHHHHIIH', 0x06054b50, 0, 0, len(file_da_aggiungere),
+                                 len(file_da_aggiungere), len(centrale), _verifica(posizione), 0)
@@ -0,0 +1,204 @@
+"""
+Questo modulo gestisce le autorizzazioni automatiche scadute (vedi Autorizzazione.automatizza),
+ eseguito periodicamente da base.cron.CronApprovaNegaAuto.
+
+Le autorizzazioni da gestire vengono prenotate a blocchi con SELECT ... FOR UPDATE SKIP LOCKED
+ (su PostgreSQL precedente alla 9.5, senza SKIP LOCKED: attende i blocchi degli altri processi),
+ una sola per oggetto (la prima per scadenza e progressivo, con DISTINCT ON): firmarla modifica
+ anche le altre autorizzazioni dello stesso oggetto, che quindi non vengono mai prenotate da un
+ altro processo nello stesso momento. Piu' processi possono lavorare contemporaneamente senza
+ elaborare due volte lo stesso oggetto. Vengono prenotate solo le autorizzazioni ancora necessarie:
+ quelle dello stesso progressivo di una gia' concessa, o di una richiesta negata, non vanno firmate.
+Per ogni blocco, in una transazione:
+ - gli oggetti collegati vengono caricati con una query per tipo di oggetto;
+ - ogni autorizzazione viene firmata (Autorizzazione.firma), raccogliendo le notifiche;
+ - il flag automatica viene impostato, con un UPDATE per tipo di oggetto, solo sugli oggetti la cui
+   richiesta e' stata conclusa dalla firma (negata, o senza altre autorizzazioni necessarie).
+ Le autorizzazioni successive dello stesso oggetto (progressivo maggiore) vengono prenotate nei
+ blocchi seguenti, se scadute.
+Dopo il commit, le notifiche vengono raggruppate per richiedente: un solo messaggio per persona,
+ con il riepilogo delle richieste gestite se piu' di una.
+"""
+import logging
+import time
+from collections import defaultdict
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection
+from django.db.transaction import atomic
+from django.utils.timezone import now
+
+from base.models import Autorizzazione
+
+logger = logging.getLogger(__name__)
+
+DIMENSIONE_BLOCCO = 200
+
+SQL_PRENOTA = """
+    SELECT id FROM {tabella}
+    WHERE id IN (
+        SELECT DISTINCT ON (oggetto_tipo_id, oggetto_id) id FROM {tabella}
+        WHERE concessa IS NULL AND necessaria AND scadenza IS NOT NULL AND scadenza <= %s
+          AND tipo_gestione IN (%s, %s) AND NOT (id = ANY(%s))
+        ORDER BY oggetto_tipo_id, oggetto_id, scadenza, progressivo, id
+    )
+    ORDER BY scadenza
+    LIMIT %s
+    FOR UPDATE{salta}
+"""
+
+
+def _prenota(adesso, escluse, blocco):
+    """
+    Prenota (blocca fino alla fine della transazione) un blocco di autorizzazioni scadute,
+     al massimo una per oggetto.
+    :return: Lista di pk.
+    """
+    # SKIP LOCKED e' disponibile da PostgreSQL 9.5; prima, attende i blocchi degli altri processi.
+    salta = " SKIP LOCKED" if getattr(connection, 'pg_version', 0) >= 90500 else ""
+    with connection.cursor() as cursor:
+        cursor.execute(SQL_PRENOTA.format(tabella=Autorizzazione._meta.db_table, salta=salta),
+                       [adesso, Autorizzazione.AP_AUTO, Autorizzazione.NG_AUTO, list(escluse), blocco])
+        return [riga[0] for riga in cursor.fetchall()]
+
+
+def _carica_oggetti(autorizzazioni):
+    """
+    Carica gli oggetti delle autorizzazioni con una query per tipo, e li assegna alle autorizzazioni.
+    Le autorizzazioni dello stesso oggetto condividono la stessa istanza.
+    """
+    per_tipo = defaultdict(set)
+    for autorizzazione in autorizzazioni:
+        per_tipo[autorizzazione.oggetto_tipo_id].add(autorizzazione.oggetto_id)
+
+    oggetti = {}
+    for tipo_id, pks in per_tipo.items():
+        modello = ContentType.objects.get_for_id(tipo_id).model_class()
+        for pk, oggetto in modello.objects.in_bulk(list(pks)).items():
+            oggetti[(tipo_id, pk)] = oggetto
+
+    for autorizzazione in autorizzazioni:
+        oggetto = oggetti.get((autorizzazione.oggetto_tipo_id, autorizzazione.oggetto_id))
+        if oggetto is not None:
+            autorizzazione.oggetto = oggetto
+    return oggetti
+
+
+def _in_attesa(autorizzazione):
+    """
+    :return: I pk delle autorizzazioni in attesa dello stesso oggetto (compresa questa).
+    """
+    return set(Autorizzazione.objects.filter(
+        oggetto_tipo_id=autorizzazione.oggetto_tipo_id, oggetto_id=autorizzazione.oggetto_id, concessa__isnull=True,
+    ).values_list('pk', flat=True)) | {autorizzazione.pk}
+
+
+def _elabora_blocco(pks, metriche):
+    """
+    Firma le autorizzazioni prenotate. Da eseguire nella transazione della prenotazione.
+    :return: Tupla (pk delle autorizzazioni da non riprendere, notifiche da inviare).
+    """
+    autorizzazioni = list(Autorizzazione.objects.filter(pk__in=pks).order_by('scadenza', 'progressivo'))
+    oggetti = _carica_oggetti(autorizzazioni)
+    adesso = now()
+
+    escluse, notifiche, automatici = set(), [], defaultdict(set)
+    for autorizzazione in autorizzazioni:
+        oggetto = oggetti.get((autorizzazione.oggetto_tipo_id, autorizzazione.oggetto_id))
+        if oggetto is None or oggetto.ritirata:
+            # Come controlla_concedi/nega_automatico: restano in attesa, non vanno riprese
+            escluse |= _in_attesa(autorizzazione)
+            metriche['saltate'] += 1
+            continue
+
+        concedi = autorizzazione.tipo_gestione == Autorizzazione.AP_AUTO
+        try:
+            with atomic():
+                autorizzazione.firma(None, concedi, auto=True, notifiche=notifiche)
+        except Exception:
+            # Un errore nella firma (es. oggetto non valido) non deve fermare il blocco:
+            #  l'autorizzazione resta in attesa e non viene ripresa in questa esecuzione.
+            logger.exception("Errore nella gestione dell'autorizzazione %d" % (autorizzazione.pk,))
+            escluse |= _in_attesa(autorizzazione)
+            metriche['errori'] += 1
+            continue
+
+        # Come _invia_notifica: automatica solo se la richiesta e' conclusa
+        if not oggetto.autorizzazioni_set().filter(necessaria=True).exists():
+            automatici[autorizzazione.oggetto_tipo_id].add(autorizzazione.oggetto_id)
+        metriche['concesse' if concedi else 'negate'] += 1
+        metriche['ritardo_massimo'] = max(metriche['ritardo_massimo'],
+                                          (adesso - autorizzazione.scadenza).total_seconds())
+
+    for tipo_id, pks_oggetti in automatici.items():
+        ContentType.objects.get_for_id(tipo_id).model_class().objects.filter(
+            pk__in=pks_oggetti
+        ).update(automatica=True)
+
+    return escluse, notifiche
+
+
+def invia_notifiche(notifiche):
+    """
+    Invia le notifiche raccolte, un messaggio per richiedente: la notifica abituale se una sola,
+     altrimenti un riepilogo accodato.
+    :param notifiche: Lista di tuple (autorizzazione, concessa).
+    :return: Il numero di messaggi.
+    """
+    from posta.models import Messaggio
+
+    per_richiedente = defaultdict(list)
+    for autorizzazione, concessa in notifiche:
+        per_richiedente[autorizzazione.richiedente_id].append((autorizzazione, concessa))
+
+    for richieste in per_richiedente.values():
+        if len(richieste) == 1:
+            autorizzazione, concessa = richieste[0]
+            if concessa:
+                autorizzazione.notifica_concessa(auto=True)
+            else:
+                autorizzazione.notifica_negata(auto=True)
+            continue
+
+        Messaggio.costruisci_e_accoda(
+            oggetto="Richieste gestite automaticamente",
+            modello="email_autorizzazioni_automatiche_riepilogo.html",
+            corpo={"richieste": richieste},
+            destinatari=[richieste[0][0].richiedente],
+        )
+
+    return len(per_richiedente)
+
+
+def gestisci_automatiche(blocco=DIMENSIONE_BLOCCO, progresso=None):
+    """
+    Concede o nega le autorizzazioni automatiche scadute, a blocchi.
+    :param blocco: Numero di autorizzazioni prenotate per transazione.
+    :param progresso: Funzione chiamata dopo ogni blocco con le metriche parziali.
+    :return: Dizionario con le metriche: concesse, negate, saltate, errori, messaggi, secondi,
+             al_secondo, ritardo_massimo (secondi dalla scadenza alla firma), in_attesa (rimaste).
+    """
+    inizio = time.time()
+    adesso = now()
+    metriche = {'concesse': 0, 'negate': 0, 'saltate': 0, 'errori': 0, 'messaggi': 0, 'ritardo_massimo': 0}
+    escluse = set()
+
+    while True:
+        with atomic():
+            pks = _prenota(adesso, escluse, blocco)
+            if not pks:
+                break
+            nuove_escluse, notifiche = _elabora_blocco(pks, metriche)
+        escluse |= nuove_escluse
+        metriche['messaggi'] += invia_notifiche(notifiche)
+        if progresso:
+            progresso(metriche)
+
+    metriche['secondi'] = time.time() - inizio
+    elaborate = metriche['concesse'] + metriche['negate']
+    metriche['al_secondo'] = elaborate / metriche['secondi'] if metriche['secondi'] else 0
+    metriche['in_attesa'] = Autorizzazione.objects.filter(
+        concessa__isnull=True, necessaria=True, scadenza__isnull=False, scadenza__lte=adesso,
+        tipo_gestione__in=[Autorizzazione.AP_AUTO, Autorizzazione.NG_AUTO],
+    ).exclude(pk__in=escluse).count()
+    return metriche
@@ -1,7985 +1,148 @@
-COMUNI = dict((
-    ("Agliè".lower(), "A074"),
-    ("Airasca".lower(), "A109"),
-    ("Ala di Stura".lower(), "A117"),
-    ("Albiano d'Ivrea".lower(), "A157"),
-    ("Alice Superiore".lower(), "A199"),
-    ("Almese".lower(), "A218"),
-    ("Alpette".lower(), "A221"),
-    ("Alpignano".lower(), "A222"),
-    ("Andezeno".lower(), "A275"),
-    ("Andrate".lower(), "A282"),
-    ("Angrogna".lower(), "A295"),
-    ("Arignano".lower(), "A405"),
-    ("Avigliana".lower(), "A518"),
-    ("Azeglio".lower(), "A525"),
-    ("Bairo".lower(), "A584"),
-    ("Balangero".lower(), "A587"),
-    ("Baldissero Canavese".lower(), "A590"),
-    ("Baldissero Torinese".lower(), "A591"),
-    ("Balme".lower(), "A599"),
-    ("Banchette".lower(), "A607"),
-    ("Barbania".lower(), "A625"),
-    ("Bardonecchia".lower(), "A651"),
-    ("Barone Canavese".lower(), "A673"),
-    ("Beinasco".lower(), "A734"),
-    ("Bibiana".lower(), "A853"),
-    ("Bobbio Pellice".lower(), "A910"),
-    ("Bollengo".lower(), "A941"),
-    ("Borgaro Torinese".lower(), "A990"),
-    ("Borgiallo".lower(), "B003"),
-    ("Borgofranco d'Ivrea".lower(), "B015"),
-    ("Borgomasino".lower(), "B021"),
-    ("Borgone Susa".lower(), "B024"),
-    ("Bosconero".lower(), "B075"),
-    ("Brandizzo".lower(), "B121"),
-    ("Bricherasio".lower(), "B171"),
-    ("Brosso".lower(), "B205"),
-    ("Brozolo".lower(), "B209"),
-    ("Bruino".lower(), "B216"),
-    ("Brusasco".lower(), "B225"),
-    ("Bruzolo".lower(), "B232"),
-    ("Buriasco".lower(), "B278"),
-    ("Burolo".lower(), "B279"),
-    ("Busano".lower(), "B284"),
-    ("Bussoleno".lower(), "B297"),
-    ("Buttigliera Alta".lower(), "B305"),
-    ("Cafasse".lower(), "B350"),
-    ("Caluso".lower(), "B435"),
-    ("Cambiano".lower(), "B462"),
-    ("Campiglione Fenile".lower(), "B512"),
-    ("Candia Canavese".lower(), "B588"),
-    ("Candiolo".lower(), "B592"),
-    ("Canischio".lower(), "B605"),
-    ("Cantalupa".lower(), "B628"),
-    ("Cantoira".lower(), "B637"),
-    ("Caprie".lower(), "B705"),
-    ("Caravino".lower(), "B733"),
-    ("Carema".lower(), "B762"),
-    ("Carignano".lower(), "B777"),
-    ("Carmagnola".lower(), "B791"),
-    ("Casalborgone".lower(), "B867"),
-    ("Cascinette d'Ivrea".lower(), "B953"),
-    ("Caselette".lower(), "B955"),
-    ("Caselle Torinese".lower(), "B960"),
-    ("Castagneto Po".lower(), "C045"),
-    ("Castagnole Piemonte".lower(), "C048"),
-    ("Castellamonte".lower(), "C133"),
-    ("Castelnuovo Nigra".lower(), "C241"),
-    ("Castiglione Torinese".lower(), "C307"),
-    ("Cavagnolo".lower(), "C369"),
-    ("Cavour".lower(), "C404"),
-    ("Cercenasco".lower(), "C487"),
-    ("Ceres".lower(), "C497"),
-    ("Ceresole Reale".lower(), "C505"),
-    ("Cesana Torinese".lower(), "C564"),
-    ("Chialamberto".lower(), "C604"),
-    ("Chianocco".lower(), "C610"),
-    ("Chiaverano".lower(), "C624"),
-    ("Chieri".lower(), "C627"),
-    ("Chiesanuova".lower(), "C629"),
-    ("Chiomonte".lower(), "C639"),
-    ("Chiusa di San Michele".lower(), "C655"),
-    ("Chivasso".lower(), "C665"),
-    ("Ciconio".lower(), "C679"),
-    ("Cintano".lower(), "C711"),
-    ("Cinzano".lower(), "C715"),
-    ("Ciriè".lower(), "C722"),
-    ("Claviere".lower(), "C793"),
-    ("Coassolo Torinese".lower(), "C801"),
-    ("Coazze".lower(), "C803"),
-    ("Collegno".lower(), "C860"),
-    ("Colleretto Castelnuovo".lower(), "C867"),
-    ("Colleretto Giacosa".lower(), "C868"),
-    ("Condove".lower(), "C955"),
-    ("Corio".lower(), "D008"),
-    ("Cossano Canavese".lower(), "D092"),
-    ("Cuceglio".lower(), "D197"),
-    ("Cumiana".lower(), "D202"),
-    ("Cuorgnè".lower(), "D208"),
-    ("Druento".lower(), "D373"),
-    ("Exilles".lower(), "D433"),
-    ("Favria".lower(), "D520"),
-    ("Feletto".lower(), "D524"),
-    ("Fenestrelle".lower(), "D532"),
-    ("Fiano".lower(), "D562"),
-    ("Fiorano Canavese".lower(), "D608"),
-    ("Foglizzo".lower(), "D646"),
-    ("Forno Canavese".lower(), "D725"),
-    ("Frassinetto".lower(), "D781"),
-    ("Front".lower(), "D805"),
-    ("Frossasco".lower(), "D812"),
-    ("Garzigliana".lower(), "D931"),
-    ("Gassino Torinese".lower(), "D933"),
-    ("Germagnano".lower(), "D983"),
-    ("Giaglione".lower(), "E009"),
-    ("Giaveno".lower(), "E020"),
-    ("Givoletto".lower(), "E067"),
-    ("Gravere".lower(), "E154"),
-    ("Groscavallo".lower(), "E199"),
-    ("Grosso".lower(), "E203"),
-    ("Grugliasco".lower(), "E216"),
-    ("Ingria".lower(), "E301"),
-    ("Inverso Pinasca".lower(), "E311"),
-    ("Isolabella".lower(), "E345"),
-    ("Issiglio".lower(), "E368"),
-    ("Ivrea".lower(), "E379"),
-    ("La Cassa".lower(), "E394"),
-    ("La Loggia".lower(), "E423"),
-    ("Lanzo Torinese".lower(), "E445"),
-    ("Lauriano".lower(), "E484"),
-    ("Leini".lower(), "E518"),
-    ("Lemie".lower(), "E520"),
-    ("Lessolo".lower(), "E551"),
-    ("Levone".lower(), "E566"),
-    ("Locana".lower(), "E635"),
-    ("Lombardore".lower(), "E660"),
-    ("Lombriasco".lower(), "E661"),
-    ("Loranzè".lower(), "E683"),
-    ("Lugnacco".lower(), "E727"),
-    ("Luserna San Giovanni".lower(), "E758"),
-    ("Lusernetta".lower(), "E759"),
-    ("Lusigliè".lower(), "E763"),
-    ("Macello".lower(), "E782"),
-    ("Maglione".lower(), "E817"),
-    ("Marentino".lower(), "E941"),
-    ("Massello".lower(), "F041"),
-    ("Mathi".lower(), "F053"),
-    ("Mattie".lower(), "F058"),
-    ("Mazzè".lower(), "F067"),
-    ("Meana di Susa".lower(), "F074"),
-    ("Mercenasco".lower(), "F140"),
-    ("Meugliano".lower(), "F164"),
-    ("Mezzenile".lower(), "F182"),
-    ("Mombello di Torino".lower(), "F315"),
-    ("Mompantero".lower(), "F318"),
-    ("Monastero di Lanzo".lower(), "F327"),
-    ("Moncalieri".lower(), "F335"),
-    ("Moncenisio".lower(), "D553"),
-    ("Montaldo Torinese".lower(), "F407"),
-    ("Montalenghe".lower(), "F411"),
-    ("Montalto Dora".lower(), "F420"),
-    ("Montanaro".lower(), "F422"),
-    ("Monteu da Po".lower(), "F651"),
-    ("Moriondo Torinese".lower(), "F733"),
-    ("Nichelino".lower(), "F889"),
-    ("Noasca".lower(), "F906"),
-    ("Nole".lower(), "F925"),
-    ("Nomaglio".lower(), "F927"),
-    ("None".lower(), "F931"),
-    ("Novalesa".lower(), "F948"),
-    ("Oglianico".lower(), "G010"),
-    ("Orbassano".lower(), "G087"),
-    ("Orio Canavese".lower(), "G109"),
-    ("Osasco".lower(), "G151"),
-    ("Osasio".lower(), "G152"),
-    ("Oulx".lower(), "G196"),
-    ("Ozegna".lower(), "G202"),
-    ("Palazzo Canavese".lower(), "G262"),
-    ("Pancalieri".lower(), "G303"),
-    ("Parella".lower(), "G330"),
-    ("Pavarolo".lower(), "G387"),
-    ("Pavone Canavese".lower(), "G392"),
-    ("Pecco".lower(), "G396"),
-    ("Pecetto Torinese".lower(), "G398"),
-    ("Perosa Argentina".lower(), "G463"),
-    ("Perosa Canavese".lower(), "G462"),
-    ("Perrero".lower(), "G465"),
-    ("Pertusio".lower(), "G477"),
-    ("Pessinetto".lower(), "G505"),
-    ("Pianezza".lower(), "G559"),
-    ("Pinasca".lower(), "G672"),
-    ("Pinerolo".lower(), "G674"),
-    ("Pino Torinese".lower(), "G678"),
-    ("Piobesi Torinese".lower(), "G684"),
-    ("Piossasco".lower(), "G691"),
-    ("Piscina".lower(), "G705"),
-    ("Piverone".lower(), "G719"),
-    ("Poirino".lower(), "G777"),
-    ("Pomaretto".lower(), "G805"),
-    ("Pont-Canavese".lower(), "G826"),
-    ("Porte".lower(), "G900"),
-    ("Pragelato".lower(), "G973"),
-    ("Prali".lower(), "G978"),
-    ("Pralormo".lower(), "G979"),
-    ("Pramollo".lower(), "G982"),
-    ("Prarostino".lower(), "G986"),
-    ("Prascorsano".lower(), "G988"),
-    ("Pratiglione".lower(), "G997"),
-    ("Quagliuzzo".lower(), "H100"),
-    ("Quassolo".lower(), "H120"),
-    ("Quincinetto".lower(), "H127"),
-    ("Reano".lower(), "H207"),
-    ("Ribordone".lower(), "H270"),
-    ("Rivalba".lower(), "H333"),
-    ("Rivalta di Torino".lower(), "H335"),
-    ("Riva presso Chieri".lower(), "H337"),
-    ("Rivara".lower(), "H338"),
-    ("Rivarolo Canavese".lower(), "H340"),
-    ("Rivarossa".lower(), "H344"),
-    ("Rivoli".lower(), "H355"),
-    ("Robassomero".lower(), "H367"),
-    ("Rocca Canavese".lower(), "H386"),
-    ("Roletto".lower(), "H498"),
-    ("Romano Canavese".lower(), "H511"),
-    ("Ronco Canavese".lower(), "H539"),
-    ("Rondissone".lower(), "H547"),
-    ("Rorà".lower(), "H554"),
-    ("Roure".lower(), "H555"),
-    ("Rosta".lower(), "H583"),
-    ("Rubiana".lower(), "H627"),
-    ("Rueglio".lower(), "H631"),
-    ("Salassa".lower(), "H691"),
-    ("Salbertrand".lower(), "H684"),
-    ("Salerano Canavese".lower(), "H702"),
-    ("Salza di Pinerolo".lower(), "H734"),
-    ("Samone".lower(), "H753"),
-    ("San Benigno Canavese".lower(), "H775"),
-    ("San Carlo Canavese".lower(), "H789"),
-    ("San Colombano Belmonte".lower(), "H804"),
-    ("San Didero".lower(), "H820"),
-    ("San Francesco al Campo".lower(), "H847"),
-    ("Sangano".lower(), "H855"),
-    ("San Germano Chisone".lower(), "H862"),
-    ("San Gillio".lower(), "H873"),
-    ("San Giorgio Canavese".lower(), "H890"),
-    ("San Giorio di Susa".lower(), "H900"),
-    ("San Giusto Canavese".lower(), "H936"),
-    ("San Martino Canavese".lower(), "H997"),
-    ("San Maurizio Canavese".lower(), "I024"),
-    ("San Mauro Torinese".lower(), "I030"),
-    ("San Pietro Val Lemina".lower(), "I090"),
-    ("San Ponso".lower(), "I126"),
-    ("San Raffaele Cimena".lower(), "I137"),
-    ("San Sebastiano da Po".lower(), "I152"),
-    ("San Secondo di Pinerolo".lower(), "I154"),
-    ("Sant'Ambrogio di Torino".lower(), "I258"),
-    ("Sant'Antonino di Susa".lower(), "I296"),
-    ("Santena".lower(), "I327"),
-    ("Sauze di Cesana".lower(), "I465"),
-    ("Sauze d'Oulx".lower(), "I466"),
-    ("Scalenghe".lower(), "I490"),
-    ("Scarmagno".lower(), "I511"),
-    ("Sciolze".lower(), "I539"),
-    ("Sestriere".lower(), "I692"),
-    ("Settimo Rottaro".lower(), "I701"),
-    ("Settimo Torinese".lower(), "I703"),
-    ("Settimo Vittone".lower(), "I702"),
-    ("Sparone".lower(), "I886"),
-    ("Strambinello".lower(), "I969"),
-    ("Strambino".lower(), "I970"),
-    ("Susa".lower(), "L013"),
-    ("Tavagnasco".lower(), "L066"),
-    ("Torino".lower(), "L219"),
-    ("Torrazza Piemonte".lower(), "L238"),
-    ("Torre Canavese".lower(), "L247"),
-    ("Torre Pellice".lower(), "L277"),
-    ("Trana".lower(), "L327"),
-    ("Trausella".lower(), "L338"),
-    ("Traversella".lower(), "L345"),
-    ("Traves".lower(), "L340"),
-    ("Trofarello".lower(), "L445"),
-    ("Usseaux".lower(), "L515"),
-    ("Usseglio".lower(), "L516"),
-    ("Vaie".lower(), "L538"),
-    ("Val della Torre".lower(), "L555"),
-    ("Valgioie".lower(), "L578"),
-    ("Vallo Torinese".lower(), "L629"),
-    ("Valperga".lower(), "L644"),
-    ("Valprato Soana".lower(), "B510"),
-    ("Varisella".lower(), "L685"),
-    ("Vauda Canavese".lower(), "L698"),
-    ("Venaus".lower(), "L726"),
-    ("Venaria Reale".lower(), "L727"),
-    ("Verolengo".lower(), "L779"),
-    ("Verrua Savoia".lower(), "L787"),
-    ("Vestignè".lower(), "L811"),
-    ("Vialfrè".lower(), "L830"),
-    ("Vico Canavese".lower(), "L548"),
-    ("Vidracco".lower(), "L857"),
-    ("Vigone".lower(), "L898"),
-    ("Villafranca Piemonte".lower(), "L948"),
-    ("Villanova Canavese".lower(), "L982"),
-    ("Villarbasse".lower(), "M002"),
-    ("Villar Dora".lower(), "L999"),
-    ("Villareggia".lower(), "M004"),
-    ("Villar Focchiardo".lower(), "M007"),
-    ("Villar Pellice".lower(), "M013"),
-    ("Villar Perosa".lower(), "M014"),
-    ("Villastellone".lower(), "M027"),
-    ("Vinovo".lower(), "M060"),
-    ("Virle Piemonte".lower(), "M069"),
-    ("Vische".lower(), "M071"),
-    ("Vistrorio".lower(), "M080"),
-    ("Viù".lower(), "M094"),
-    ("Volpiano".lower(), "M122"),
-    ("Volvera".lower(), "M133"),
-    ("Alagna Valsesia".lower(), "A119"),
-    ("Albano Vercellese".lower(), "A130"),
-    ("Alice Castello".lower(), "A198"),
-    ("Arborio".lower(), "A358"),
-    ("Asigliano Vercellese".lower(), "A466"),
-    ("Balmuccia".lower(), "A600"),
-    ("Balocco".lower(), "A601"),
-    ("Bianzè".lower(), "A847"),
-    ("Boccioleto".lower(), "A914"),
-    ("Borgo d'Ale".lower(), "B009"),
-    ("Borgosesia".lower(), "B041"),
-    ("Borgo Vercelli".lower(), "B046"),
-    ("Breia".lower(), "B136"),
-    ("Buronzo".lower(), "B280"),
-    ("Campertogno".lower(), "B505"),
-    ("Carcoforo".lower(), "B752"),
-    ("Caresana".lower(), "B767"),
-    ("Caresanablot".lower(), "B768"),
-    ("Carisio".lower(), "B782"),
-    ("Casanova Elvo".lower(), "B928"),
-    ("San Giacomo Vercellese".lower(), "B952"),
-    ("Cellio".lower(), "C450"),
-    ("Cervatto".lower(), "C548"),
-    ("Cigliano".lower(), "C680"),
-    ("Civiasco".lower(), "C757"),
-    ("Collobiano".lower(), "C884"),
-    ("Costanzana".lower(), "D113"),
-    ("Cravagliana".lower(), "D132"),
-    ("Crescentino".lower(), "D154"),
-    ("Crova".lower(), "D187"),
-    ("Desana".lower(), "D281"),
-    ("Fobello".lower(), "D641"),
-    ("Fontanetto Po".lower(), "D676"),
-    ("Formigliana".lower(), "D712"),
-    ("Gattinara".lower(), "D938"),
-    ("Ghislarengo".lower(), "E007"),
-    ("Greggio".lower(), "E163"),
-    ("Guardabosone".lower(), "E237"),
-    ("Lamporo".lower(), "E433"),
-    ("Lenta".lower(), "E528"),
-    ("Lignana".lower(), "E583"),
-    ("Livorno Ferraris".lower(), "E626"),
-    ("Lozzolo".lower(), "E711"),
-    ("Mollia".lower(), "F297"),
-    ("Moncrivello".lower(), "F342"),
-    ("Motta de' Conti".lower(), "F774"),
-    ("Olcenengo".lower(), "G016"),
-    ("Oldenico".lower(), "G018"),
-    ("Palazzolo Vercellese".lower(), "G266"),
-    ("Pertengo".lower(), "G471"),
-    ("Pezzana".lower(), "G528"),
-    ("Pila".lower(), "G666"),
-    ("Piode".lower(), "G685"),
-    ("Postua".lower(), "G940"),
-    ("Prarolo".lower(), "G985"),
-    ("Quarona".lower(), "H108"),
-    ("Quinto Vercellese".lower(), "H132"),
-    ("Rassa".lower(), "H188"),
-    ("Rima San Giuseppe".lower(), "H291"),
-    ("Rimasco".lower(), "H292"),
-    ("Rimella".lower(), "H293"),
-    ("Riva Valdobbia".lower(), "H329"),
-    ("Rive".lower(), "H346"),
-    ("Roasio".lower(), "H365"),
-    ("Ronsecco".lower(), "H549"),
-    ("Rossa".lower(), "H577"),
-    ("Rovasenda".lower(), "H364"),
-    ("Sabbia".lower(), "H648"),
-    ("Salasco".lower(), "H690"),
-    ("Sali Vercellese".lower(), "H707"),
-    ("Saluggia".lower(), "H725"),
-    ("San Germano Vercellese".lower(), "H861"),
-    ("Santhià".lower(), "I337"),
-    ("Scopa".lower(), "I544"),
-    ("Scopello".lower(), "I545"),
-    ("Serravalle Sesia".lower(), "I663"),
-    ("Stroppiana".lower(), "I984"),
-    ("Tricerro".lower(), "L420"),
-    ("Trino".lower(), "L429"),
-    ("Tronzano Vercellese".lower(), "L451"),
-    ("Valduggia".lower(), "L566"),
-    ("Varallo".lower(), "L669"),
-    ("Vercelli".lower(), "L750"),
-    ("Villarboit".lower(), "M003"),
-    ("Villata".lower(), "M028"),
-    ("Vocca".lower(), "M106"),
-    ("Agrate Conturbia".lower(), "A088"),
-    ("Ameno".lower(), "A264"),
-    ("Armeno".lower(), "A414"),
-    ("Arona".lower(), "A429"),
-    ("Barengo".lower(), "A653"),
-    ("Bellinzago Novarese".lower(), "A752"),
-    ("Biandrate".lower(), "A844"),
-    ("Boca".lower(), "A911"),
-    ("Bogogno".lower(), "A929"),
-    ("Bolzano Novarese".lower(), "A953"),
-    ("Borgolavezzaro".lower(), "B016"),
-    ("Borgomanero".lower(), "B019"),
-    ("Borgo Ticino".lower(), "B043"),
-    ("Briga Novarese".lower(), "B176"),
-    ("Briona".lower(), "B183"),
-    ("Caltignaga".lower(), "B431"),
-    ("Cameri".lower(), "B473"),
-    ("Carpignano Sesia".lower(), "B823"),
-    ("Casalbeltrame".lower(), "B864"),
-    ("Casaleggio Novara".lower(), "B883"),
-    ("Casalino".lower(), "B897"),
-    ("Casalvolone".lower(), "B920"),
-    ("Castellazzo Novarese".lower(), "C149"),
-    ("Castelletto sopra Ticino".lower(), "C166"),
-    ("Cavaglietto".lower(), "C364"),
-    ("Cavaglio d'Agogna".lower(), "C365"),
-    ("Cavallirio".lower(), "C378"),
-    ("Cerano".lower(), "C483"),
-    ("Colazza".lower(), "C829"),
-    ("Comignago".lower(), "C926"),
-    ("Cressa".lower(), "D162"),
-    ("Cureggio".lower(), "D216"),
-    ("Divignano".lower(), "D309"),
-    ("Dormelletto".lower(), "D347"),
-    ("Fara Novarese".lower(), "D492"),
-    ("Fontaneto d'Agogna".lower(), "D675"),
-    ("Galliate".lower(), "D872"),
-    ("Garbagna Novarese".lower(), "D911"),
-    ("Gargallo".lower(), "D921"),
-    ("Gattico".lower(), "D937"),
-    ("Ghemme".lower(), "E001"),
-    ("Gozzano".lower(), "E120"),
-    ("Granozzo con Monticello".lower(), "E143"),
-    ("Grignasco".lower(), "E177"),
-    ("Invorio".lower(), "E314"),
-    ("Landiona".lower(), "E436"),
-    ("Lesa".lower(), "E544"),
-    ("Maggiora".lower(), "E803"),
-    ("Mandello Vitta".lower(), "E880"),
-    ("Marano Ticino".lower(), "E907"),
-    ("Massino Visconti".lower(), "F047"),
-    ("Meina".lower(), "F093"),
-    ("Mezzomerico".lower(), "F188"),
-    ("Miasino".lower(), "F191"),
-    ("Momo".lower(), "F317"),
-    ("Nebbiuno".lower(), "F859"),
-    ("Nibbiola".lower(), "F886"),
-    ("Novara".lower(), "F952"),
-    ("Oleggio".lower(), "G019"),
-    ("Oleggio Castello".lower(), "G020"),
-    ("Orta San Giulio".lower(), "G134"),
-    ("Paruzzaro".lower(), "G349"),
-    ("Pella".lower(), "G421"),
-    ("Pettenasco".lower(), "G520"),
-    ("Pisano".lower(), "G703"),
-    ("Pogno".lower(), "G775"),
-    ("Pombia".lower(), "G809"),
-    ("Prato Sesia".lower(), "H001"),
-    ("Recetto".lower(), "H213"),
-    ("Romagnano Sesia".lower(), "H502"),
-    ("Romentino".lower(), "H518"),
-    ("San Maurizio d'Opaglio".lower(), "I025"),
-    ("San Nazzaro Sesia".lower(), "I052"),
-    ("San Pietro Mosezzo".lower(), "I116"),
-    ("Sillavengo".lower(), "I736"),
-    ("Sizzano".lower(), "I767"),
-    ("Soriso".lower(), "I857"),
-    ("Sozzago".lower(), "I880"),
-    ("Suno".lower(), "L007"),
-    ("Terdobbiate".lower(), "L104"),
-    ("Tornaco".lower(), "L223"),
-    ("Trecate".lower(), "L356"),
-    ("Vaprio d'Agogna".lower(), "L668"),
-    ("Varallo Pombia".lower(), "L670"),
-    ("Veruno".lower(), "L798"),
-    ("Vespolate".lower(), "L808"),
-    ("Vicolungo".lower(), "L847"),
-    ("Vinzaglio".lower(), "M062"),
-    ("Acceglio".lower(), "A016"),
-    ("Aisone".lower(), "A113"),
-    ("Alba".lower(), "A124"),
-    ("Albaretto della Torre".lower(), "A139"),
-    ("Alto".lower(), "A238"),
-    ("Argentera".lower(), "A394"),
-    ("Arguello".lower(), "A396"),
-    ("Bagnasco".lower(), "A555"),
-    ("Bagnolo Piemonte".lower(), "A571"),
-    ("Baldissero d'Alba".lower(), "A589"),
-    ("Barbaresco".lower(), "A629"),
-    ("Barge".lower(), "A660"),
-    ("Barolo".lower(), "A671"),
-    ("Bastia Mondovì".lower(), "A709"),
-    ("Battifollo".lower(), "A716"),
-    ("Beinette".lower(), "A735"),
-    ("Bellino".lower(), "A750"),
-    ("Belvedere Langhe".lower(), "A774"),
-    ("Bene Vagienna".lower(), "A779"),
-    ("Benevello".lower(), "A782"),
-    ("Bergolo".lower(), "A798"),
-    ("Bernezzo".lower(), "A805"),
-    ("Bonvicino".lower(), "A979"),
-    ("Borgomale".lower(), "B018"),
-    ("Borgo San Dalmazzo".lower(), "B033"),
-    ("Bosia".lower(), "B079"),
-    ("Bossolasco".lower(), "B084"),
-    ("Boves".lower(), "B101"),
-    ("Bra".lower(), "B111"),
-    ("Briaglia".lower(), "B167"),
-    ("Briga Alta".lower(), "B175"),
-    ("Brondello".lower(), "B200"),
-    ("Brossasco".lower(), "B204"),
-    ("Busca".lower(), "B285"),
-    ("Camerana".lower(), "B467"),
-    ("Camo".lower(), "B489"),
-    ("Canale".lower(), "B573"),
-    ("Canosio".lower(), "B621"),
-    ("Caprauna".lower(), "B692"),
-    ("Caraglio".lower(), "B719"),
-    ("Caramagna Piemonte".lower(), "B720"),
-    ("Cardè".lower(), "B755"),
-    ("Carrù".lower(), "B841"),
-    ("Cartignano".lower(), "B845"),
-    ("Casalgrasso".lower(), "B894"),
-    ("Castagnito".lower(), "C046"),
-    ("Casteldelfino".lower(), "C081"),
-    ("Castellar".lower(), "C140"),
-    ("Castelletto Stura".lower(), "C165"),
-    ("Castelletto Uzzone".lower(), "C167"),
-    ("Castellinaldo d'Alba".lower(), "C173"),
-    ("Castellino Tanaro".lower(), "C176"),
-    ("Castelmagno".lower(), "C205"),
-    ("Castelnuovo di Ceva".lower(), "C214"),
-    ("Castiglione Falletto".lower(), "C314"),
-    ("Castiglione Tinella".lower(), "C317"),
-    ("Castino".lower(), "C323"),
-    ("Cavallerleone".lower(), "C375"),
-    ("Cavallermaggiore".lower(), "C376"),
-    ("Celle di Macra".lower(), "C441"),
-    ("Centallo".lower(), "C466"),
-    ("Ceresole Alba".lower(), "C504"),
-    ("Cerretto Langhe".lower(), "C530"),
-    ("Cervasca".lower(), "C547"),
-    ("Cervere".lower(), "C550"),
-    ("Ceva".lower(), "C589"),
-    ("Cherasco".lower(), "C599"),
-    ("Chiusa di Pesio".lower(), "C653"),
-    ("Cigliè".lower(), "C681"),
-    ("Cissone".lower(), "C738"),
-    ("Clavesana".lower(), "C792"),
-    ("Corneliano d'Alba".lower(), "D022"),
-    ("Cortemilia".lower(), "D062"),
-    ("Cossano Belbo".lower(), "D093"),
-    ("Costigliole Saluzzo".lower(), "D120"),
-    ("Cravanzana".lower(), "D133"),
-    ("Crissolo".lower(), "D172"),
-    ("Cuneo".lower(), "D205"),
-    ("Demonte".lower(), "D271"),
-    ("Diano d'Alba".lower(), "D291"),
-    ("Dogliani".lower(), "D314"),
-    ("Dronero".lower(), "D372"),
-    ("Elva".lower(), "D401"),
-    ("Entracque".lower(), "D410"),
-    ("Envie".lower(), "D412"),
-    ("Farigliano".lower(), "D499"),
-    ("Faule".lower(), "D511"),
-    ("Feisoglio".lower(), "D523"),
-    ("Fossano".lower(), "D742"),
-    ("Frabosa Soprana".lower(), "D751"),
-    ("Frabosa Sottana".lower(), "D752"),
-    ("Frassino".lower(), "D782"),
-    ("Gaiola".lower(), "D856"),
-    ("Gambasca".lower(), "D894"),
-    ("Garessio".lower(), "D920"),
-    ("Genola".lower(), "D967"),
-    ("Gorzegno".lower(), "E111"),
-    ("Gottasecca".lower(), "E115"),
-    ("Govone".lower(), "E118"),
-    ("Grinzane Cavour".lower(), "E182"),
-    ("Guarene".lower(), "E251"),
-    ("Igliano".lower(), "E282"),
-    ("Isasca".lower(), "E327"),
-    ("Lagnasco".lower(), "E406"),
-    ("La Morra".lower(), "E430"),
-    ("Lequio Berria".lower(), "E540"),
-    ("Lequio Tanaro".lower(), "E539"),
-    ("Lesegno".lower(), "E546"),
-    ("Levice".lower(), "E564"),
-    ("Limone Piemonte".lower(), "E597"),
-    ("Lisio".lower(), "E615"),
-    ("Macra".lower(), "E789"),
-    ("Magliano Alfieri".lower(), "E809"),
-    ("Magliano Alpi".lower(), "E808"),
-    ("Mango".lower(), "E887"),
-    ("Manta".lower(), "E894"),
-    ("Marene".lower(), "E939"),
-    ("Margarita".lower(), "E945"),
-    ("Marmora".lower(), "E963"),
-    ("Marsaglia".lower(), "E973"),
-    ("Martiniana Po".lower(), "E988"),
-    ("Melle".lower(), "F114"),
-    ("Moiola".lower(), "F279"),
-    ("Mombarcaro".lower(), "F309"),
-    ("Mombasiglio".lower(), "F312"),
-    ("Monastero di Vasco".lower(), "F326"),
-    ("Monasterolo Casotto".lower(), "F329"),
-    ("Monasterolo di Savigliano".lower(), "F330"),
-    ("Monchiero".lower(), "F338"),
-    ("Mondovì".lower(), "F351"),
-    ("Monesiglio".lower(), "F355"),
-    ("Monforte d'Alba".lower(), "F358"),
-    ("Montà".lower(), "F385"),
-    ("Montaldo di Mondovì".lower(), "F405"),
-    ("Montaldo Roero".lower(), "F408"),
-    ("Montanera".lower(), "F424"),
-    ("Montelupo Albese".lower(), "F550"),
-    ("Montemale di Cuneo".lower(), "F558"),
-    ("Monterosso Grana".lower(), "F608"),
-    ("Monteu Roero".lower(), "F654"),
-    ("Montezemolo".lower(), "F666"),
-    ("Monticello d'Alba".lower(), "F669"),
-    ("Moretta".lower(), "F723"),
-    ("Morozzo".lower(), "F743"),
-    ("Murazzano".lower(), "F809"),
-    ("Murello".lower(), "F811"),
-    ("Narzole".lower(), "F846"),
-    ("Neive".lower(), "F863"),
-    ("Neviglie".lower(), "F883"),
-    ("Niella Belbo".lower(), "F894"),
-    ("Niella Tanaro".lower(), "F895"),
-    ("Novello".lower(), "F961"),
-    ("Nucetto".lower(), "F972"),
-    ("Oncino".lower(), "G066"),
-    ("Ormea".lower(), "G114"),
-    ("Ostana".lower(), "G183"),
-    ("Paesana".lower(), "G228"),
-    ("Pagno".lower(), "G240"),
-    ("Pamparato".lower(), "G302"),
-    ("Paroldo".lower(), "G339"),
-    ("Perletto".lower(), "G457"),
-    ("Perlo".lower(), "G458"),
-    ("Peveragno".lower(), "G526"),
-    ("Pezzolo Valle Uzzone".lower(), "G532"),
-    ("Pianfei".lower(), "G561"),
-    ("Piasco".lower(), "G575"),
-    ("Pietraporzio".lower(), "G625"),
-    ("Piobesi d'Alba".lower(), "G683"),
-    ("Piozzo".lower(), "G697"),
-    ("Pocapaglia".lower(), "G742"),
-    ("Polonghera".lower(), "G800"),
-    ("Pontechianale".lower(), "G837"),
-    ("Pradleves".lower(), "G970"),
-    ("Prazzo".lower(), "H011"),
-    ("Priero".lower(), "H059"),
-    ("Priocca".lower(), "H068"),
-    ("Priola".lower(), "H069"),
-    ("Prunetto".lower(), "H085"),
-    ("Racconigi".lower(), "H150"),
-    ("Revello".lower(), "H247"),
-    ("Rifreddo".lower(), "H285"),
-    ("Rittana".lower(), "H326"),
-    ("Roaschia".lower(), "H362"),
-    ("Roascio".lower(), "H363"),
-    ("Robilante".lower(), "H377"),
-    ("Roburent".lower(), "H378"),
-    ("Roccabruna".lower(), "H385"),
-    ("Rocca Cigliè".lower(), "H391"),
-    ("Rocca de' Baldi".lower(), "H395"),
-    ("Roccaforte Mondovì".lower(), "H407"),
-    ("Roccasparvera".lower(), "H447"),
-    ("Roccavione".lower(), "H453"),
-    ("Rocchetta Belbo".lower(), "H462"),
-    ("Roddi".lower(), "H472"),
-    ("Roddino".lower(), "H473"),
-    ("Rodello".lower(), "H474"),
-    ("Rossana".lower(), "H578"),
-    ("Ruffia".lower(), "H633"),
-    ("Sale delle Langhe".lower(), "H695"),
-    ("Sale San Giovanni".lower(), "H704"),
-    ("Saliceto".lower(), "H710"),
-    ("Salmour".lower(), "H716"),
-    ("Saluzzo".lower(), "H727"),
-    ("Sambuco".lower(), "H746"),
-    ("Sampeyre".lower(), "H755"),
-    ("San Benedetto Belbo".lower(), "H770"),
-    ("San Damiano Macra".lower(), "H812"),
-    ("Sanfrè".lower(), "H851"),
-    ("Sanfront".lower(), "H852"),
-    ("San Michele Mondovì".lower(), "I037"),
-    ("Sant'Albano Stura".lower(), "I210"),
-    ("Santa Vittoria d'Alba".lower(), "I316"),
-    ("Santo Stefano Belbo".lower(), "I367"),
-    ("Santo Stefano Roero".lower(), "I372"),
-    ("Savigliano".lower(), "I470"),
-    ("Scagnello".lower(), "I484"),
-    ("Scarnafigi".lower(), "I512"),
-    ("Serralunga d'Alba".lower(), "I646"),
-    ("Serravalle Langhe".lower(), "I659"),
-    ("Sinio".lower(), "I750"),
-    ("Somano".lower(), "I817"),
-    ("Sommariva del Bosco".lower(), "I822"),
-    ("Sommariva Perno".lower(), "I823"),
-    ("Stroppo".lower(), "I985"),
-    ("Tarantasca".lower(), "L048"),
-    ("Torre Bormida".lower(), "L252"),
-    ("Torre Mondovì".lower(), "L241"),
-    ("Torre San Giorgio".lower(), "L278"),
-    ("Torresina".lower(), "L281"),
-    ("Treiso".lower(), "L367"),
-    ("Trezzo Tinella".lower(), "L410"),
-    ("Trinità".lower(), "L427"),
-    ("Valdieri".lower(), "L558"),
-    ("Valgrana".lower(), "L580"),
-    ("Valloriate".lower(), "L631"),
-    ("Valmala".lower(), "L636"),
-    ("Venasca".lower(), "L729"),
-    ("Verduno".lower(), "L758"),
-    ("Vernante".lower(), "L771"),
-    ("Verzuolo".lower(), "L804"),
-    ("Vezza d'Alba".lower(), "L817"),
-    ("Vicoforte".lower(), "L841"),
-    ("Vignolo".lower(), "L888"),
-    ("Villafalletto".lower(), "L942"),
-    ("Villanova Mondovì".lower(), "L974"),
-    ("Villanova Solaro".lower(), "L990"),
-    ("Villar San Costanzo".lower(), "M015"),
-    ("Vinadio".lower(), "M055"),
-    ("Viola".lower(), "M063"),
-    ("Vottignasco".lower(), "M136"),
-    ("Agliano Terme".lower(), "A072"),
-    ("Albugnano".lower(), "A173"),
-    ("Antignano".lower(), "A312"),
-    ("Aramengo".lower(), "A352"),
-    ("Asti".lower(), "A479"),
-    ("Azzano d'Asti".lower(), "A527"),
-    ("Baldichieri d'Asti".lower(), "A588"),
-    ("Belveglio".lower(), "A770"),
-    ("Berzano di San Pietro".lower(), "A812"),
-    ("Bruno".lower(), "B221"),
-    ("Bubbio".lower(), "B236"),
-    ("Buttigliera d'Asti".lower(), "B306"),
-    ("Calamandrana".lower(), "B376"),
-    ("Calliano".lower(), "B418"),
-    ("Calosso".lower(), "B425"),
-    ("Camerano Casasco".lower(), "B469"),
-    ("Canelli".lower(), "B594"),
-    ("Cantarana".lower(), "B633"),
-    ("Capriglio".lower(), "B707"),
-    ("Casorzo".lower(), "B991"),
-    ("Cassinasco".lower(), "C022"),
-    ("Castagnole delle Lanze".lower(), "C049"),
-    ("Castagnole Monferrato".lower(), "C047"),
-    ("Castel Boglione".lower(), "C064"),
-    ("Castell'Alfero".lower(), "C127"),
-    ("Castellero".lower(), "C154"),
-    ("Castelletto Molina".lower(), "C161"),
-    ("Castello di Annone".lower(), "A300"),
-    ("Castelnuovo Belbo".lower(), "C226"),
-    ("Castelnuovo Calcea".lower(), "C230"),
-    ("Castelnuovo Don Bosco".lower(), "C232"),
-    ("Castel Rocchero".lower(), "C253"),
-    ("Cellarengo".lower(), "C438"),
-    ("Celle Enomondo".lower(), "C440"),
-    ("Cerreto d'Asti".lower(), "C528"),
-    ("Cerro Tanaro".lower(), "C533"),
-    ("Cessole".lower(), "C583"),
-    ("Chiusano d'Asti".lower(), "C658"),
-    ("Cinaglio".lower(), "C701"),
-    ("Cisterna d'Asti".lower(), "C739"),
-    ("Coazzolo".lower(), "C804"),
-    ("Cocconato".lower(), "C807"),
-    ("Corsione".lower(), "D046"),
-    ("Cortandone".lower(), "D050"),
-    ("Cortanze".lower(), "D051"),
-    ("Cortazzone".lower(), "D052"),
-    ("Cortiglione".lower(), "D072"),
-    ("Cossombrato".lower(), "D101"),
-    ("Costigliole d'Asti".lower(), "D119"),
-    ("Cunico".lower(), "D207"),
-    ("Dusino San Michele".lower(), "D388"),
-    ("Ferrere".lower(), "D554"),
-    ("Fontanile".lower(), "D678"),
-    ("Frinco".lower(), "D802"),
-    ("Grana".lower(), "E134"),
-    ("Grazzano Badoglio".lower(), "E159"),
-    ("Incisa Scapaccino".lower(), "E295"),
-    ("Isola d'Asti".lower(), "E338"),
-    ("Loazzolo".lower(), "E633"),
-    ("Maranzana".lower(), "E917"),
-    ("Maretto".lower(), "E944"),
-    ("Moasca".lower(), "F254"),
-    ("Mombaldone".lower(), "F308"),
-    ("Mombaruzzo".lower(), "F311"),
-    ("Mombercelli".lower(), "F316"),
-    ("Monale".lower(), "F323"),
-    ("Monastero Bormida".lower(), "F325"),
-    ("Moncalvo".lower(), "F336"),
-    ("Moncucco Torinese".lower(), "F343"),
-    ("Mongardino".lower(), "F361"),
-    ("Montabone".lower(), "F386"),
-    ("Montafia".lower(), "F390"),
-    ("Montaldo Scarampi".lower(), "F409"),
-    ("Montechiaro d'Asti".lower(), "F468"),
-    ("Montegrosso d'Asti".lower(), "F527"),
-    ("Montemagno".lower(), "F556"),
-    ("Moransengo".lower(), "F709"),
-    ("Nizza Monferrato".lower(), "F902"),
-    ("Olmo Gentile".lower(), "G048"),
-    ("Passerano Marmorito".lower(), "G358"),
-    ("Penango".lower(), "G430"),
-    ("Piea".lower(), "G593"),
-    ("Pino d'Asti".lower(), "G676"),
-    ("Piovà Massaia".lower(), "G692"),
-    ("Portacomaro".lower(), "G894"),
-    ("Quaranti".lower(), "H102"),
-    ("Refrancore".lower(), "H219"),
-    ("Revigliasco d'Asti".lower(), "H250"),
-    ("Roatto".lower(), "H366"),
-    ("Robella".lower(), "H376"),
-    ("Rocca d'Arazzo".lower(), "H392"),
-    ("Roccaverano".lower(), "H451"),
-    ("Rocchetta Palafea".lower(), "H466"),
-    ("Rocchetta Tanaro".lower(), "H468"),
-    ("San Damiano d'Asti".lower(), "H811"),
-    ("San Giorgio Scarampi".lower(), "H899"),
-    ("San Martino Alfieri".lower(), "H987"),
-    ("San Marzano Oliveto".lower(), "I017"),
-    ("San Paolo Solbrito".lower(), "I076"),
-    ("Scurzolengo".lower(), "I555"),
-    ("Serole".lower(), "I637"),
-    ("Sessame".lower(), "I678"),
-    ("Settime".lower(), "I698"),
-    ("Soglio".lower(), "I781"),
-    ("Tigliole".lower(), "L168"),
-    ("Tonco".lower(), "L203"),
-    ("Tonengo".lower(), "L204"),
-    ("Vaglio Serra".lower(), "L531"),
-    ("Valfenera".lower(), "L574"),
-    ("Vesime".lower(), "L807"),
-    ("Viale".lower(), "L829"),
-    ("Viarigi".lower(), "L834"),
-    ("Vigliano d'Asti".lower(), "L879"),
-    ("Villafranca d'Asti".lower(), "L945"),
-    ("Villanova d'Asti".lower(), "L984"),
-    ("Villa San Secondo".lower(), "M019"),
-    ("Vinchio".lower(), "M058"),
-    ("Montiglio Monferrato".lower(), "M302"),
-    ("Acqui Terme".lower(), "A052"),
-    ("Albera Ligure".lower(), "A146"),
-    ("Alessandria".lower(), "A182"),
-    ("Alfiano Natta".lower(), "A189"),
-    ("Alice Bel Colle".lower(), "A197"),
-    ("Alluvioni Cambiò".lower(), "A211"),
-    ("Altavilla Monferrato".lower(), "A227"),
-    ("Alzano Scrivia".lower(), "A245"),
-    ("Arquata Scrivia".lower(), "A436"),
-    ("Avolasca".lower(), "A523"),
-    ("Balzola".lower(), "A605"),
-    ("Basaluzzo".lower(), "A689"),
-    ("Bassignana".lower(), "A708"),
-    ("Belforte Monferrato".lower(), "A738"),
-    ("Bergamasco".lower(), "A793"),
-    ("Berzano di Tortona".lower(), "A813"),
-    ("Bistagno".lower(), "A889"),
-    ("Borghetto di Borbera".lower(), "A998"),
-    ("Borgoratto Alessandrino".lower(), "B029"),
-    ("Borgo San Martino".lower(), "B037"),
-    ("Bosco Marengo".lower(), "B071"),
-    ("Bosio".lower(), "B080"),
-    ("Bozzole".lower(), "B109"),
-    ("Brignano-Frascata".lower(), "B179"),
-    ("Cabella Ligure".lower(), "B311"),
-    ("Camagna Monferrato".lower(), "B453"),
-    ("Camino".lower(), "B482"),
-    ("Cantalupo Ligure".lower(), "B629"),
-    ("Capriata d'Orba".lower(), "B701"),
-    ("Carbonara Scrivia".lower(), "B736"),
-    ("Carentino".lower(), "B765"),
-    ("Carezzano".lower(), "B769"),
-    ("Carpeneto".lower(), "B818"),
-    ("Carrega Ligure".lower(), "B836"),
-    ("Carrosio".lower(), "B840"),
-    ("Cartosio".lower(), "B847"),
-    ("Casal Cermelli".lower(), "B870"),
-    ("Casaleggio Boiro".lower(), "B882"),
-    ("Casale Monferrato".lower(), "B885"),
-    ("Casalnoceto".lower(), "B902"),
-    ("Casasco".lower(), "B941"),
-    ("Cassano Spinola".lower(), "C005"),
-    ("Cassine".lower(), "C027"),
-    ("Cassinelle".lower(), "C030"),
-    ("Castellania".lower(), "C137"),
-    ("Castellar Guidobono".lower(), "C142"),
-    ("Castellazzo Bormida".lower(), "C148"),
-    ("Castelletto d'Erro".lower(), "C156"),
-    ("Castelletto d'Orba".lower(), "C158"),
-    ("Castelletto Merli".lower(), "C160"),
-    ("Castelletto Monferrato".lower(), "C162"),
-    ("Castelnuovo Bormida".lower(), "C229"),
-    ("Castelnuovo Scrivia".lower(), "C243"),
-    ("Castelspina".lower(), "C274"),
-    ("Cavatore".lower(), "C387"),
-    ("Cella Monte".lower(), "C432"),
-    ("Cereseto".lower(), "C503"),
-    ("Cerreto Grue".lower(), "C507"),
-    ("Cerrina Monferrato".lower(), "C531"),
-    ("Coniolo".lower(), "C962"),
-    ("Conzano".lower(), "C977"),
-    ("Costa Vescovato".lower(), "D102"),
-    ("Cremolino".lower(), "D149"),
-    ("Cuccaro Monferrato".lower(), "D194"),
-    ("Denice".lower(), "D272"),
-    ("Dernice".lower(), "D277"),
-    ("Fabbrica Curone".lower(), "D447"),
-    ("Felizzano".lower(), "D528"),
-    ("Fraconalto".lower(), "D559"),
-    ("Francavilla Bisio".lower(), "D759"),
-    ("Frascaro".lower(), "D770"),
-    ("Frassinello Monferrato".lower(), "D777"),
-    ("Frassineto Po".lower(), "D780"),
-    ("Fresonara".lower(), "D797"),
-    ("Frugarolo".lower(), "D813"),
-    ("Fubine".lower(), "D814"),
-    ("Gabiano".lower(), "D835"),
-    ("Gamalero".lower(), "D890"),
-    ("Garbagna".lower(), "D910"),
-    ("Gavazzana".lower(), "D941"),
-    ("Gavi".lower(), "D944"),
-    ("Giarole".lower(), "E015"),
-    ("Gremiasco".lower(), "E164"),
-    ("Grognardo".lower(), "E188"),
-    ("Grondona".lower(), "E191"),
-    ("Guazzora".lower(), "E255"),
-    ("Isola Sant'Antonio".lower(), "E360"),
-    ("Lerma".lower(), "E543"),
-    ("Lu".lower(), "E712"),
-    ("Malvicino".lower(), "E870"),
-    ("Masio".lower(), "F015"),
-    ("Melazzo".lower(), "F096"),
-    ("Merana".lower(), "F131"),
-    ("Mirabello Monferrato".lower(), "F232"),
-    ("Molare".lower(), "F281"),
-    ("Molino dei Torti".lower(), "F293"),
-    ("Mombello Monferrato".lower(), "F313"),
-    ("Momperone".lower(), "F320"),
-    ("Moncestino".lower(), "F337"),
-    ("Mongiardino Ligure".lower(), "F365"),
-    ("Monleale".lower(), "F374"),
-    ("Montacuto".lower(), "F387"),
-    ("Montaldeo".lower(), "F403"),
-    ("Montaldo Bormida".lower(), "F404"),
-    ("Montecastello".lower(), "F455"),
-    ("Montechiaro d'Acqui".lower(), "F469"),
-    ("Montegioco".lower(), "F518"),
-    ("Montemarzino".lower(), "F562"),
-    ("Morano sul Po".lower(), "F707"),
-    ("Morbello".lower(), "F713"),
-    ("Mornese".lower(), "F737"),
-    ("Morsasco".lower(), "F751"),
-    ("Murisengo".lower(), "F814"),
-    ("Novi Ligure".lower(), "F965"),
-    ("Occimiano".lower(), "F995"),
-    ("Odalengo Grande".lower(), "F997"),
-    ("Odalengo Piccolo".lower(), "F998"),
-    ("Olivola".lower(), "G042"),
-    ("Orsara Bormida".lower(), "G124"),
-    ("Ottiglio".lower(), "G193"),
-    ("Ovada".lower(), "G197"),
-    ("Oviglio".lower(), "G199"),
-    ("Ozzano Monferrato".lower(), "G204"),
-    ("Paderna".lower(), "G215"),
-    ("Pareto".lower(), "G334"),
-    ("Parodi Ligure".lower(), "G338"),
-    ("Pasturana".lower(), "G367"),
-    ("Pecetto di Valenza".lower(), "G397"),
-    ("Pietra Marazzi".lower(), "G619"),
-    ("Piovera".lower(), "G695"),
-    ("Pomaro Monferrato".lower(), "G807"),
-    ("Pontecurone".lower(), "G839"),
-    ("Pontestura".lower(), "G858"),
-    ("Ponti".lower(), "G861"),
-    ("Ponzano Monferrato".lower(), "G872"),
-    ("Ponzone".lower(), "G877"),
-    ("Pozzol Groppo".lower(), "G960"),
-    ("Pozzolo Formigaro".lower(), "G961"),
-    ("Prasco".lower(), "G987"),
-    ("Predosa".lower(), "H021"),
-    ("Quargnento".lower(), "H104"),
-    ("Quattordio".lower(), "H121"),
-    ("Ricaldone".lower(), "H272"),
-    ("Rivalta Bormida".lower(), "H334"),
-    ("Rivarone".lower(), "H343"),
-    ("Roccaforte Ligure".lower(), "H406"),
-    ("Rocca Grimalda".lower(), "H414"),
-    ("Rocchetta Ligure".lower(), "H465"),
-    ("Rosignano Monferrato".lower(), "H569"),
-    ("Sala Monferrato".lower(), "H677"),
-    ("Sale".lower(), "H694"),
-    ("San Cristoforo".lower(), "H810"),
-    ("San Giorgio Monferrato".lower(), "H878"),
-    ("San Salvatore Monferrato".lower(), "I144"),
-    ("San Sebastiano Curone".lower(), "I150"),
-    ("Sant'Agata Fossili".lower(), "I190"),
-    ("Sardigliano".lower(), "I429"),
-    ("Sarezzano".lower(), "I432"),
-    ("Serralunga di Crea".lower(), "I645"),
-    ("Serravalle Scrivia".lower(), "I657"),
-    ("Sezzadio".lower(), "I711"),
-    ("Silvano d'Orba".lower(), "I738"),
-    ("Solero".lower(), "I798"),
-    ("Solonghello".lower(), "I808"),
-    ("Spigno Monferrato".lower(), "I901"),
-    ("Spineto Scrivia".lower(), "I911"),
-    ("Stazzano".lower(), "I941"),
-    ("Strevi".lower(), "I977"),
-    ("Tagliolo Monferrato".lower(), "L027"),
-    ("Tassarolo".lower(), "L059"),
-    ("Terruggia".lower(), "L139"),
-    ("Terzo".lower(), "L143"),
-    ("Ticineto".lower(), "L165"),
-    ("Tortona".lower(), "L304"),
-    ("Treville".lower(), "L403"),
-    ("Trisobbio".lower(), "L432"),
-    ("Valenza".lower(), "L570"),
-    ("Valmacca".lower(), "L633"),
-    ("Vignale Monferrato".lower(), "L881"),
-    ("Vignole Borbera".lower(), "L887"),
-    ("Viguzzolo".lower(), "L904"),
-    ("Villadeati".lower(), "L931"),
-    ("Villalvernia".lower(), "L963"),
-    ("Villamiroglio".lower(), "L970"),
-    ("Villanova Monferrato".lower(), "L972"),
-    ("Villaromagnano".lower(), "M009"),
-    ("Visone".lower(), "M077"),
-    ("Volpedo".lower(), "M120"),
-    ("Volpeglino".lower(), "M121"),
-    ("Voltaggio".lower(), "M123"),
-    ("Ailoche".lower(), "A107"),
-    ("Andorno Micca".lower(), "A280"),
-    ("Benna".lower(), "A784"),
-    ("Biella".lower(), "A859"),
-    ("Bioglio".lower(), "A876"),
-    ("Borriana".lower(), "B058"),
-    ("Brusnengo".lower(), "B229"),
-    ("Callabiana".lower(), "B417"),
-    ("Camandona".lower(), "B457"),
-    ("Camburzano".lower(), "B465"),
-    ("Candelo".lower(), "B586"),
-    ("Caprile".lower(), "B708"),
-    ("Casapinta".lower(), "B933"),
-    ("Castelletto Cervo".lower(), "C155"),
-    ("Cavaglià".lower(), "C363"),
-    ("Cerreto Castello".lower(), "C526"),
-    ("Cerrione".lower(), "C532"),
-    ("Coggiola".lower(), "C819"),
-    ("Cossato".lower(), "D094"),
-    ("Crevacuore".lower(), "D165"),
-    ("Curino".lower(), "D219"),
-    ("Donato".lower(), "D339"),
-    ("Dorzano".lower(), "D350"),
-    ("Gaglianico".lower(), "D848"),
-    ("Gifflenga".lower(), "E024"),
-    ("Graglia".lower(), "E130"),
-    ("Magnano".lower(), "E821"),
-    ("Massazza".lower(), "F037"),
-    ("Masserano".lower(), "F042"),
-    ("Mezzana Mortigliengo".lower(), "F167"),
-    ("Miagliano".lower(), "F189"),
-    ("Mongrando".lower(), "F369"),
-    ("Mottalciata".lower(), "F776"),
-    ("Muzzano".lower(), "F833"),
-    ("Netro".lower(), "F878"),
-    ("Occhieppo Inferiore".lower(), "F992"),
-    ("Occhieppo Superiore".lower(), "F993"),
-    ("Pettinengo".lower(), "G521"),
-    ("Piatto".lower(), "G577"),
-    ("Piedicavallo".lower(), "G594"),
-    ("Pollone".lower(), "G798"),
-    ("Ponderano".lower(), "G820"),
-    ("Portula".lower(), "G927"),
-    ("Pralungo".lower(), "G980"),
-    ("Pray".lower(), "G974"),
-    ("Quaregna".lower(), "H103"),
-    ("Ronco Biellese".lower(), "H538"),
-    ("Roppolo".lower(), "H553"),
-    ("Rosazza".lower(), "H561"),
-    ("Sagliano Micca".lower(), "H662"),
-    ("Sala Biellese".lower(), "H681"),
-    ("Salussola".lower(), "H726"),
-    ("Sandigliano".lower(), "H821"),
-    ("Soprana".lower(), "I835"),
-    ("Sordevolo".lower(), "I847"),
-    ("Sostegno".lower(), "I868"),
-    ("Strona".lower(), "I980"),
-    ("Tavigliano".lower(), "L075"),
-    ("Ternengo".lower(), "L116"),
-    ("Tollegno".lower(), "L193"),
-    ("Torrazzo".lower(), "L239"),
-    ("Trivero".lower(), "L436"),
-    ("Valdengo".lower(), "L556"),
-    ("Vallanzengo".lower(), "L586"),
-    ("Valle Mosso".lower(), "L606"),
-    ("Valle San Nicolao".lower(), "L620"),
-    ("Veglio".lower(), "L712"),
-    ("Verrone".lower(), "L785"),
-    ("Vigliano Biellese".lower(), "L880"),
-    ("Villa del Bosco".lower(), "L933"),
-    ("Villanova Biellese".lower(), "L978"),
-    ("Viverone".lower(), "M098"),
-    ("Zimone".lower(), "M179"),
-    ("Zubiena".lower(), "M196"),
-    ("Zumaglia".lower(), "M201"),
-    ("Mosso".lower(), "M304"),
-    ("Lessona".lower(), "M371"),
-    ("Campiglia Cervo".lower(), "M373"),
-    ("Antrona Schieranco".lower(), "A317"),
-    ("Anzola d'Ossola".lower(), "A325"),
-    ("Arizzano".lower(), "A409"),
-    ("Arola".lower(), "A427"),
-    ("Aurano".lower(), "A497"),
-    ("Baceno".lower(), "A534"),
-    ("Bannio Anzino".lower(), "A610"),
-    ("Baveno".lower(), "A725"),
-    ("Bee".lower(), "A733"),
-    ("Belgirate".lower(), "A742"),
-    ("Beura-Cardezza".lower(), "A834"),
-    ("Bognanco".lower(), "A925"),
-    ("Brovello-Carpugnino".lower(), "B207"),
-    ("Calasca-Castiglione".lower(), "B380"),
-    ("Cambiasca".lower(), "B463"),
-    ("Cannero Riviera".lower(), "B610"),
-    ("Cannobio".lower(), "B615"),
-    ("Caprezzo".lower(), "B694"),
-    ("Casale Corte Cerro".lower(), "B876"),
-    ("Cavaglio-Spoccia".lower(), "C367"),
-    ("Ceppo Morelli".lower(), "C478"),
-    ("Cesara".lower(), "C567"),
-    ("Cossogno".lower(), "D099"),
-    ("Craveggia".lower(), "D134"),
-    ("Crevoladossola".lower(), "D168"),
-    ("Crodo".lower(), "D177"),
-    ("Cursolo-Orasso".lower(), "D225"),
-    ("Domodossola".lower(), "D332"),
-    ("Druogno".lower(), "D374"),
-    ("Falmenta".lower(), "D481"),
-    ("Formazza".lower(), "D706"),
-    ("Germagno".lower(), "D984"),
-    ("Ghiffa".lower(), "E003"),
-    ("Gignese".lower(), "E028"),
-    ("Gravellona Toce".lower(), "E153"),
-    ("Gurro".lower(), "E269"),
-    ("Intragna".lower(), "E304"),
-    ("Loreglia".lower(), "E685"),
-    ("Macugnaga".lower(), "E790"),
-    ("Madonna del Sasso".lower(), "E795"),
-    ("Malesco".lower(), "E853"),
-    ("Masera".lower(), "F010"),
-    ("Massiola".lower(), "F048"),
-    ("Mergozzo".lower(), "F146"),
-    ("Miazzina".lower(), "F192"),
-    ("Montecrestese".lower(), "F483"),
-    ("Montescheno".lower(), "F639"),
-    ("Nonio".lower(), "F932"),
-    ("Oggebbio".lower(), "G007"),
-    ("Omegna".lower(), "G062"),
-    ("Ornavasso".lower(), "G117"),
-    ("Pallanzeno".lower(), "G280"),
-    ("Piedimulera".lower(), "G600"),
-    ("Pieve Vergonte".lower(), "G658"),
-    ("Premeno".lower(), "H030"),
-    ("Premia".lower(), "H033"),
-    ("Premosello-Chiovenda".lower(), "H037"),
-    ("Quarna Sopra".lower(), "H106"),
-    ("Quarna Sotto".lower(), "H107"),
-    ("Re".lower(), "H203"),
-    ("San Bernardino Verbano".lower(), "H777"),
-    ("Santa Maria Maggiore".lower(), "I249"),
-    ("Stresa".lower(), "I976"),
-    ("Toceno".lower(), "L187"),
-    ("Trarego Viggiona".lower(), "L333"),
-    ("Trasquera".lower(), "L336"),
-    ("Trontano".lower(), "L450"),
-    ("Valstrona".lower(), "L651"),
-    ("Vanzone con San Carlo".lower(), "L666"),
-    ("Varzo".lower(), "L691"),
-    ("Verbania".lower(), "L746"),
-    ("Vignone".lower(), "L889"),
-    ("Villadossola".lower(), "L906"),
-    ("Villette".lower(), "M042"),
-    ("Vogogna".lower(), "M111"),
-    ("Borgomezzavalle".lower(), "M370"),
-    ("Allein".lower(), "A205"),
-    ("Antey-Saint-André".lower(), "A305"),
-    ("Aosta".lower(), "A326"),
-    ("Arnad".lower(), "A424"),
-    ("Arvier".lower(), "A452"),
-    ("Avise".lower(), "A521"),
-    ("Ayas".lower(), "A094"),
-    ("Aymavilles".lower(), "A108"),
-    ("Bard".lower(), "A643"),
-    ("Bionaz".lower(), "A877"),
-    ("Brissogne".lower(), "B192"),
-    ("Brusson".lower(), "B230"),
-    ("Challand-Saint-Anselme".lower(), "C593"),
-    ("Challand-Saint-Victor".lower(), "C594"),
-    ("Chambave".lower(), "C595"),
-    ("Chamois".lower(), "B491"),
-    ("Champdepraz".lower(), "C596"),
-    ("Champorcher".lower(), "B540"),
-    ("Charvensod".lower(), "C598"),
-    ("Châtillon".lower(), "C294"),
-    ("Cogne".lower(), "C821"),
-    ("Courmayeur".lower(), "D012"),
-    ("Donnas".lower(), "D338"),
-    ("Doues".lower(), "D356"),
-    ("Emarèse".lower(), "D402"),
-    ("Etroubles".lower(), "D444"),
-    ("Fénis".lower(), "D537"),
-    ("Fontainemore".lower(), "D666"),
-    ("Gaby".lower(), "D839"),
-    ("Gignod".lower(), "E029"),
-    ("Gressan".lower(), "E165"),
-    ("Gressoney-La-Trinité".lower(), "E167"),
-    ("Gressoney-Saint-Jean".lower(), "E168"),
-    ("Hône".lower(), "E273"),
-    ("Introd".lower(), "E306"),
-    ("Issime".lower(), "E369"),
-    ("Issogne".lower(), "E371"),
-    ("Jovençan".lower(), "E391"),
-    ("La Magdeleine".lower(), "A308"),
-    ("La Salle".lower(), "E458"),
-    ("La Thuile".lower(), "E470"),
-    ("Lillianes".lower(), "E587"),
-    ("Montjovet".lower(), "F367"),
-    ("Morgex".lower(), "F726"),
-    ("Nus".lower(), "F987"),
-    ("Ollomont".lower(), "G045"),
-    ("Oyace".lower(), "G012"),
-    ("Perloz".lower(), "G459"),
-    ("Pollein".lower(), "G794"),
-    ("Pontboset".lower(), "G545"),
-    ("Pontey".lower(), "G860"),
-    ("Pont-Saint-Martin".lower(), "G854"),
-    ("Pré-Saint-Didier".lower(), "H042"),
-    ("Quart".lower(), "H110"),
-    ("Rhêmes-Notre-Dame".lower(), "H262"),
-    ("Rhêmes-Saint-Georges".lower(), "H263"),
-    ("Roisan".lower(), "H497"),
-    ("Saint-Christophe".lower(), "H669"),
-    ("Saint-Denis".lower(), "H670"),
-    ("Saint-Marcel".lower(), "H671"),
-    ("Saint-Nicolas".lower(), "H672"),
-    ("Saint-Oyen".lower(), "H673"),
-    ("Saint-Pierre".lower(), "H674"),
-    ("Saint-Rhémy-en-Bosses".lower(), "H675"),
-    ("Saint-Vincent".lower(), "H676"),
-    ("Sarre".lower(), "I442"),
-    ("Torgnon".lower(), "L217"),
-    ("Valgrisenche".lower(), "L582"),
-    ("Valpelline".lower(), "L643"),
-    ("Valsavarenche".lower(), "L647"),
-    ("Valtournenche".lower(), "L654"),
-    ("Verrayes".lower(), "L783"),
-    ("Verrès".lower(), "C282"),
-    ("Villeneuve".lower(), "L981"),
-    ("Agra".lower(), "A085"),
-    ("Albizzate".lower(), "A167"),
-    ("Angera".lower(), "A290"),
-    ("Arcisate".lower(), "A371"),
-    ("Arsago Seprio".lower(), "A441"),
-    ("Azzate".lower(), "A531"),
-    ("Azzio".lower(), "A532"),
-    ("Barasso".lower(), "A619"),
-    ("Bardello".lower(), "A645"),
-    ("Bedero Valcuvia".lower(), "A728"),
-    ("Besano".lower(), "A819"),
-    ("Besnate".lower(), "A825"),
-    ("Besozzo".lower(), "A826"),
-    ("Biandronno".lower(), "A845"),
-    ("Bisuschio".lower(), "A891"),
-    ("Bodio Lomnago".lower(), "A918"),
-    ("Brebbia".lower(), "B126"),
-    ("Bregano".lower(), "B131"),
-    ("Brenta".lower(), "B150"),
-    ("Brezzo di Bedero".lower(), "B166"),
-    ("Brinzio".lower(), "B182"),
-    ("Brissago-Valtravaglia".lower(), "B191"),
-    ("Brunello".lower(), "B219"),
-    ("Brusimpiano".lower(), "B228"),
-    ("Buguggiate".lower(), "B258"),
-    ("Busto Arsizio".lower(), "B300"),
-    ("Cadegliano-Viconago".lower(), "B326"),
-    ("Cadrezzate".lower(), "B347"),
-    ("Cairate".lower(), "B368"),
-    ("Cantello".lower(), "B634"),
-    ("Caravate".lower(), "B732"),
-    ("Cardano al Campo".lower(), "B754"),
-    ("Carnago".lower(), "B796"),
-    ("Caronno Pertusella".lower(), "B805"),
-    ("Caronno Varesino".lower(), "B807"),
-    ("Casale Litta".lower(), "B875"),
-    ("Casalzuigno".lower(), "B921"),
-    ("Casciago".lower(), "B949"),
-    ("Casorate Sempione".lower(), "B987"),
-    ("Cassano Magnago".lower(), "C004"),
-    ("Cassano Valcuvia".lower(), "B999"),
-    ("Castellanza".lower(), "C139"),
-    ("Castello Cabiaglio".lower(), "B312"),
-    ("Castelseprio".lower(), "C273"),
-    ("Castelveccana".lower(), "C181"),
-    ("Castiglione Olona".lower(), "C300"),
-    ("Castronno".lower(), "C343"),
-    ("Cavaria con Premezzo".lower(), "C382"),
-    ("Cazzago Brabbia".lower(), "C409"),
-    ("Cislago".lower(), "C732"),
-    ("Cittiglio".lower(), "C751"),
-    ("Clivio".lower(), "C796"),
-    ("Cocquio-Trevisago".lower(), "C810"),
-    ("Comabbio".lower(), "C911"),
-    ("Comerio".lower(), "C922"),
-    ("Cremenaga".lower(), "D144"),
-    ("Crosio della Valle".lower(), "D185"),
-    ("Cuasso al Monte".lower(), "D192"),
-    ("Cugliate-Fabiasco".lower(), "D199"),
-    ("Cunardo".lower(), "D204"),
-    ("Curiglia con Monteviasco".lower(), "D217"),
-    ("Cuveglio".lower(), "D238"),
-    ("Cuvio".lower(), "D239"),
-    ("Daverio".lower(), "D256"),
-    ("Dumenza".lower(), "D384"),
-    ("Duno".lower(), "D385"),
-    ("Fagnano Olona".lower(), "D467"),
-    ("Ferno".lower(), "D543"),
-    ("Ferrera di Varese".lower(), "D551"),
-    ("Gallarate".lower(), "D869"),
-    ("Galliate Lombardo".lower(), "D871"),
-    ("Gavirate".lower(), "D946"),
-    ("Gazzada Schianno".lower(), "D951"),
-    ("Gemonio".lower(), "D963"),
-    ("Gerenzano".lower(), "D981"),
-    ("Germignaga".lower(), "D987"),
-    ("Golasecca".lower(), "E079"),
-    ("Gorla Maggiore".lower(), "E101"),
-    ("Gorla Minore".lower(), "E102"),
-    ("Gornate Olona".lower(), "E104"),
-    ("Grantola".lower(), "E144"),
-    ("Inarzo".lower(), "E292"),
-    ("Induno Olona".lower(), "E299"),
-    ("Ispra".lower(), "E367"),
-    ("Jerago con Orago".lower(), "E386"),
-    ("Lavena Ponte Tresa".lower(), "E494"),
-    ("Laveno-Mombello".lower(), "E496"),
-    ("Leggiuno".lower(), "E510"),
-    ("Lonate Ceppino".lower(), "E665"),
-    ("Lonate Pozzolo".lower(), "E666"),
-    ("Lozza".lower(), "E707"),
-    ("Luino".lower(), "E734"),
-    ("Luvinate".lower(), "E769"),
-    ("Malgesso".lower(), "E856"),
-    ("Malnate".lower(), "E863"),
-    ("Marchirolo".lower(), "E929"),
-    ("Marnate".lower(), "E965"),
-    ("Marzio".lower(), "F002"),
-    ("Masciago Primo".lower(), "F007"),
-    ("Mercallo".lower(), "F134"),
-    ("Mesenzana".lower(), "F154"),
-    ("Montegrino Valtravaglia".lower(), "F526"),
-    ("Monvalle".lower(), "F703"),
-    ("Morazzone".lower(), "F711"),
-    ("Mornago".lower(), "F736"),
-    ("Oggiona con Santo Stefano".lower(), "G008"),
-    ("Olgiate Olona".lower(), "G028"),
-    ("Origgio".lower(), "G103"),
-    ("Orino".lower(), "G105"),
-    ("Osmate".lower(), "E529"),
-    ("Porto Ceresio".lower(), "G906"),
-    ("Porto Valtravaglia".lower(), "G907"),
-    ("Rancio Valcuvia".lower(), "H173"),
-    ("Ranco".lower(), "H174"),
-    ("Saltrio".lower(), "H723"),
-    ("Samarate".lower(), "H736"),
-    ("Saronno".lower(), "I441"),
-    ("Sesto Calende".lower(), "I688"),
-    ("Solbiate Arno".lower(), "I793"),
-    ("Solbiate Olona".lower(), "I794"),
-    ("Somma Lombardo".lower(), "I819"),
-    ("Sumirago".lower(), "L003"),
-    ("Taino".lower(), "L032"),
-    ("Ternate".lower(), "L115"),
-    ("Tradate".lower(), "L319"),
-    ("Travedona-Monate".lower(), "L342"),
-    ("Tronzano Lago Maggiore".lower(), "A705"),
-    ("Uboldo".lower(), "L480"),
-    ("Valganna".lower(), "L577"),
-    ("Varano Borghi".lower(), "L671"),
-    ("Varese".lower(), "L682"),
-    ("Vedano Olona".lower(), "L703"),
-    ("Venegono Inferiore".lower(), "L733"),
-    ("Venegono Superiore".lower(), "L734"),
-    ("Vergiate".lower(), "L765"),
-    ("Viggiù".lower(), "L876"),
-    ("Vizzola Ticino".lower(), "M101"),
-    ("Sangiano".lower(), "H872"),
-    ("Maccagno con Pino e Veddasca".lower(), "M339"),
-    ("Albavilla".lower(), "A143"),
-    ("Albese con Cassano".lower(), "A153"),
-    ("Albiolo".lower(), "A164"),
-    ("Alserio".lower(), "A224"),
-    ("Alzate Brianza".lower(), "A249"),
-    ("Anzano del Parco".lower(), "A319"),
-    ("Appiano Gentile".lower(), "A333"),
-    ("Argegno".lower(), "A391"),
-    ("Arosio".lower(), "A430"),
-    ("Asso".lower(), "A476"),
-    ("Barni".lower(), "A670"),
-    ("Bene Lario".lower(), "A778"),
-    ("Beregazzo con Figliaro".lower(), "A791"),
-    ("Binago".lower(), "A870"),
-    ("Bizzarone".lower(), "A898"),
-    ("Blessagno".lower(), "A904"),
-    ("Blevio".lower(), "A905"),
-    ("Bregnano".lower(), "B134"),
-    ("Brenna".lower(), "B144"),
-    ("Brienno".lower(), "B172"),
-    ("Brunate".lower(), "B218"),
-    ("Bulgarograsso".lower(), "B262"),
-    ("Cabiate".lower(), "B313"),
-    ("Cadorago".lower(), "B346"),
-    ("Caglio".lower(), "B355"),
-    ("Cagno".lower(), "B359"),
-    ("Campione d'Italia".lower(), "B513"),
-    ("Cantù".lower(), "B639"),
-    ("Canzo".lower(), "B641"),
-    ("Capiago Intimiano".lower(), "B653"),
-    ("Carate Urio".lower(), "B730"),
-    ("Carbonate".lower(), "B742"),
-    ("Carimate".lower(), "B778"),
-    ("Carlazzo".lower(), "B785"),
-    ("Carugo".lower(), "B851"),
-    ("Casasco d'Intelvi".lower(), "B942"),
-    ("Caslino d'Erba".lower(), "B974"),
-    ("Casnate con Bernate".lower(), "B977"),
-    ("Cassina Rizzardi".lower(), "C020"),
-    ("Castelmarte".lower(), "C206"),
-    ("Castelnuovo Bozzente".lower(), "C220"),
-    ("Castiglione d'Intelvi".lower(), "C299"),
-    ("Cavargna".lower(), "C381"),
-    ("Cerano d'Intelvi".lower(), "C482"),
-    ("Cermenate".lower(), "C516"),
-    ("Cernobbio".lower(), "C520"),
-    ("Cirimido".lower(), "C724"),
-    ("Claino con Osteno".lower(), "C787"),
-    ("Colonno".lower(), "C902"),
-    ("Como".lower(), "C933"),
-    ("Corrido".lower(), "D041"),
-    ("Cremia".lower(), "D147"),
-    ("Cucciago".lower(), "D196"),
-    ("Cusino".lower(), "D232"),
-    ("Dizzasco".lower(), "D310"),
-    ("Domaso".lower(), "D329"),
-    ("Dongo".lower(), "D341"),
-    ("Dosso del Liro".lower(), "D355"),
-    ("Erba".lower(), "D416"),
-    ("Eupilio".lower(), "D445"),
-    ("Faggeto Lario".lower(), "D462"),
-    ("Faloppio".lower(), "D482"),
-    ("Fenegrò".lower(), "D531"),
-    ("Figino Serenza".lower(), "D579"),
-    ("Fino Mornasco".lower(), "D605"),
-    ("Garzeno".lower(), "D930"),
-    ("Gera Lario".lower(), "D974"),
-    ("Grandate".lower(), "E139"),
-    ("Grandola ed Uniti".lower(), "E141"),
-    ("Griante".lower(), "E172"),
-    ("Guanzate".lower(), "E235"),
-    ("Inverigo".lower(), "E309"),
-    ("Laglio".lower(), "E405"),
-    ("Laino".lower(), "E416"),
-    ("Lambrugo".lower(), "E428"),
-    ("Lasnigo".lower(), "E462"),
-    ("Lezzeno".lower(), "E569"),
-    ("Limido Comasco".lower(), "E593"),
-    ("Lipomo".lower(), "E607"),
-    ("Livo".lower(), "E623"),
-    ("Locate Varesino".lower(), "E638"),
-    ("Lomazzo".lower(), "E659"),
-    ("Longone al Segrino".lower(), "E679"),
-    ("Luisago".lower(), "E735"),
-    ("Lurago d'Erba".lower(), "E749"),
-    ("Lurago Marinone".lower(), "E750"),
-    ("Lurate Caccivio".lower(), "E753"),
-    ("Magreglio".lower(), "E830"),
-    ("Mariano Comense".lower(), "E951"),
-    ("Maslianico".lower(), "F017"),
-    ("Menaggio".lower(), "F120"),
-    ("Merone".lower(), "F151"),
-    ("Moltrasio".lower(), "F305"),
-    ("Monguzzo".lower(), "F372"),
-    ("Montano Lucino".lower(), "F427"),
-    ("Montemezzo".lower(), "F564"),
-    ("Montorfano".lower(), "F688"),
-    ("Mozzate".lower(), "F788"),
-    ("Musso".lower(), "F828"),
-    ("Nesso".lower(), "F877"),
-    ("Novedrate".lower(), "F958"),
-    ("Olgiate Comasco".lower(), "G025"),
-    ("Oltrona di San Mamette".lower(), "G056"),
-    ("Orsenigo".lower(), "G126"),
-    ("Peglio".lower(), "G415"),
-    ("Pianello del Lario".lower(), "G556"),
-    ("Pigra".lower(), "G665"),
-    ("Plesio".lower(), "G737"),
-    ("Pognana Lario".lower(), "G773"),
-    ("Ponna".lower(), "G821"),
-    ("Ponte Lambro".lower(), "G847"),
-    ("Porlezza".lower(), "G889"),
-    ("Proserpio".lower(), "H074"),
-    ("Pusiano".lower(), "H094"),
-    ("Rezzago".lower(), "H255"),
-    ("Rodero".lower(), "H478"),
-    ("Ronago".lower(), "H521"),
-    ("Rovellasca".lower(), "H601"),
-    ("Rovello Porro".lower(), "H602"),
-    ("Sala Comacina".lower(), "H679"),
-    ("San Bartolomeo Val Cavargna".lower(), "H760"),
-    ("San Fedele Intelvi".lower(), "H830"),
-    ("San Fermo della Battaglia".lower(), "H840"),
-    ("San Nazzaro Val Cavargna".lower(), "I051"),
-    ("Schignano".lower(), "I529"),
-    ("Senna Comasco".lower(), "I611"),
-    ("Solbiate".lower(), "I792"),
-    ("Sorico".lower(), "I856"),
-    ("Sormano".lower(), "I860"),
-    ("Stazzona".lower(), "I943"),
-    ("Tavernerio".lower(), "L071"),
-    ("Torno".lower(), "L228"),
-    ("Trezzone".lower(), "L413"),
-    ("Turate".lower(), "L470"),
-    ("Uggiate-Trevano".lower(), "L487"),
-    ("Valbrona".lower(), "L547"),
-    ("Valmorea".lower(), "L640"),
-    ("Val Rezzo".lower(), "H259"),
-    ("Valsolda".lower(), "C936"),
-    ("Veleso".lower(), "L715"),
-    ("Veniano".lower(), "L737"),
-    ("Vercana".lower(), "L748"),
-    ("Vertemate con Minoprio".lower(), "L792"),
-    ("Villa Guardia".lower(), "L956"),
-    ("Zelbio".lower(), "M156"),
-    ("San Siro".lower(), "I162"),
-    ("Gravedona ed Uniti".lower(), "M315"),
-    ("Bellagio".lower(), "M335"),
-    ("Colverde".lower(), "M336"),
-    ("Tremezzina".lower(), "M341"),
-    ("Alta Valle Intelvi".lower(), "N.D."),
-    ("Albaredo per San Marco".lower(), "A135"),
-    ("Albosaggia".lower(), "A172"),
-    ("Andalo Valtellino".lower(), "A273"),
-    ("Aprica".lower(), "A337"),
-    ("Ardenno".lower(), "A382"),
-    ("Bema".lower(), "A777"),
-    ("Berbenno di Valtellina".lower(), "A787"),
-    ("Bianzone".lower(), "A848"),
-    ("Bormio".lower(), "B049"),
-    ("Buglio in Monte".lower(), "B255"),
-    ("Caiolo".lower(), "B366"),
-    ("Campodolcino".lower(), "B530"),
-    ("Caspoggio".lower(), "B993"),
-    ("Castello dell'Acqua".lower(), "C186"),
-    ("Castione Andevenno".lower(), "C325"),
-    ("Cedrasco".lower(), "C418"),
-    ("Cercino".lower(), "C493"),
-    ("Chiavenna".lower(), "C623"),
-    ("Chiesa in Valmalenco".lower(), "C628"),
-    ("Chiuro".lower(), "C651"),
-    ("Cino".lower(), "C709"),
-    ("Civo".lower(), "C785"),
-    ("Colorina".lower(), "C903"),
-    ("Cosio Valtellino".lower(), "D088"),
-    ("Dazio".lower(), "D258"),
-    ("Delebio".lower(), "D266"),
-    ("Dubino".lower(), "D377"),
-    ("Faedo Valtellino".lower(), "D456"),
-    ("Forcola".lower(), "D694"),
-    ("Fusine".lower(), "D830"),
-    ("Gerola Alta".lower(), "D990"),
-    ("Gordona".lower(), "E090"),
-    ("Grosio".lower(), "E200"),
-    ("Grosotto".lower(), "E201"),
-    ("Madesimo".lower(), "E342"),
-    ("Lanzada".lower(), "E443"),
-    ("Livigno".lower(), "E621"),
-    ("Lovero".lower(), "E705"),
-    ("Mantello".lower(), "E896"),
-    ("Mazzo di Valtellina".lower(), "F070"),
-    ("Mello".lower(), "F115"),
-    ("Mese".lower(), "F153"),
-    ("Montagna in Valtellina".lower(), "F393"),
-    ("Morbegno".lower(), "F712"),
-    ("Novate Mezzola".lower(), "F956"),
-    ("Pedesina".lower(), "G410"),
-    ("Piantedo".lower(), "G572"),
-    ("Piateda".lower(), "G576"),
-    ("Piuro".lower(), "G718"),
-    ("Poggiridenti".lower(), "G431"),
-    ("Ponte in Valtellina".lower(), "G829"),
-    ("Postalesio".lower(), "G937"),
-    ("Prata Camportaccio".lower(), "G993"),
-    ("Rasura".lower(), "H192"),
-    ("Rogolo".lower(), "H493"),
-    ("Samolaco".lower(), "H752"),
-    ("San Giacomo Filippo".lower(), "H868"),
-    ("Sernio".lower(), "I636"),
-    ("Sondalo".lower(), "I828"),
-    ("Sondrio".lower(), "I829"),
-    ("Spriana".lower(), "I928"),
-    ("Talamona".lower(), "L035"),
-    ("Tartano".lower(), "L056"),
-    ("Teglio".lower(), "L084"),
-    ("Tirano".lower(), "L175"),
-    ("Torre di Santa Maria".lower(), "L244"),
-    ("Tovo di Sant'Agata".lower(), "L316"),
-    ("Traona".lower(), "L330"),
-    ("Tresivio".lower(), "L392"),
-    ("Valdidentro".lower(), "L557"),
-    ("Valdisotto".lower(), "L563"),
-    ("Valfurva".lower(), "L576"),
-    ("Val Masino".lower(), "L638"),
-    ("Verceia".lower(), "L749"),
-    ("Vervio".lower(), "L799"),
-    ("Villa di Chiavenna".lower(), "L907"),
-    ("Villa di Tirano".lower(), "L908"),
-    ("Abbiategrasso".lower(), "A010"),
-    ("Albairate".lower(), "A127"),
-    ("Arconate".lower(), "A375"),
-    ("Arese".lower(), "A389"),
-    ("Arluno".lower(), "A413"),
-    ("Assago".lower(), "A473"),
-    ("Bareggio".lower(), "A652"),
-    ("Basiano".lower(), "A697"),
-    ("Basiglio".lower(), "A699"),
-    ("Bellinzago Lombardo".lower(), "A751"),
-    ("Bernate Ticino".lower(), "A804"),
-    ("Besate".lower(), "A820"),
-    ("Binasco".lower(), "A872"),
-    ("Boffalora sopra Ticino".lower(), "A920"),
-    ("Bollate".lower(), "A940"),
-    ("Bresso".lower(), "B162"),
-    ("Bubbiano".lower(), "B235"),
-    ("Buccinasco".lower(), "B240"),
-    ("Buscate".lower(), "B286"),
-    ("Bussero".lower(), "B292"),
-    ("Busto Garolfo".lower(), "B301"),
-    ("Calvignasco".lower(), "B448"),
-    ("Cambiago".lower(), "B461"),
-    ("Canegrate".lower(), "B593"),
-    ("Carpiano".lower(), "B820"),
-    ("Carugate".lower(), "B850"),
-    ("Casarile".lower(), "B938"),
-    ("Casorezzo".lower(), "B989"),
-    ("Cassano d'Adda".lower(), "C003"),
-    ("Cassina de' Pecchi".lower(), "C014"),
-    ("Cassinetta di Lugagnano".lower(), "C033"),
-    ("Castano Primo".lower(), "C052"),
-    ("Cernusco sul Naviglio".lower(), "C523"),
-    ("Cerro al Lambro".lower(), "C536"),
-    ("Cerro Maggiore".lower(), "C537"),
-    ("Cesano Boscone".lower(), "C565"),
-    ("Cesate".lower(), "C569"),
-    ("Cinisello Balsamo".lower(), "C707"),
-    ("Cisliano".lower(), "C733"),
-    ("Cologno Monzese".lower(), "C895"),
-    ("Colturano".lower(), "C908"),
-    ("Corbetta".lower(), "C986"),
-    ("Cormano".lower(), "D013"),
-    ("Cornaredo".lower(), "D018"),
-    ("Corsico".lower(), "D045"),
-    ("Cuggiono".lower(), "D198"),
-    ("Cusago".lower(), "D229"),
-    ("Cusano Milanino".lower(), "D231"),
-    ("Dairago".lower(), "D244"),
-    ("Dresano".lower(), "D367"),
-    ("Gaggiano".lower(), "D845"),
-    ("Garbagnate Milanese".lower(), "D912"),
-    ("Gessate".lower(), "D995"),
-    ("Gorgonzola".lower(), "E094"),
-    ("Grezzago".lower(), "E170"),
-    ("Gudo Visconti".lower(), "E258"),
-    ("Inveruno".lower(), "E313"),
-    ("Inzago".lower(), "E317"),
-    ("Lacchiarella".lower(), "E395"),
-    ("Lainate".lower(), "E415"),
-    ("Legnano".lower(), "E514"),
-    ("Liscate".lower(), "E610"),
-    ("Locate di Triulzi".lower(), "E639"),
-    ("Magenta".lower(), "E801"),
-    ("Magnago".lower(), "E819"),
-    ("Marcallo con Casone".lower(), "E921"),
-    ("Masate".lower(), "F003"),
-    ("Mediglia".lower(), "F084"),
-    ("Melegnano".lower(), "F100"),
-    ("Melzo".lower(), "F119"),
-    ("Mesero".lower(), "F155"),
-    ("Milano".lower(), "F205"),
-    ("Morimondo".lower(), "D033"),
-    ("Motta Visconti".lower(), "F783"),
-    ("Nerviano".lower(), "F874"),
-    ("Nosate".lower(), "F939"),
-    ("Novate Milanese".lower(), "F955"),
-    ("Noviglio".lower(), "F968"),
-    ("Opera".lower(), "G078"),
-    ("Ossona".lower(), "G181"),
-    ("Ozzero".lower(), "G206"),
-    ("Paderno Dugnano".lower(), "G220"),
-    ("Pantigliate".lower(), "G316"),
-    ("Parabiago".lower(), "G324"),
-    ("Paullo".lower(), "G385"),
-    ("Pero".lower(), "C013"),
-    ("Peschiera Borromeo".lower(), "G488"),
-    ("Pessano con Bornago".lower(), "G502"),
-    ("Pieve Emanuele".lower(), "G634"),
-    ("Pioltello".lower(), "G686"),
-    ("Pogliano Milanese".lower(), "G772"),
-    ("Pozzo d'Adda".lower(), "G955"),
-    ("Pozzuolo Martesana".lower(), "G965"),
-    ("Pregnana Milanese".lower(), "H026"),
-    ("Rescaldina".lower(), "H240"),
-    ("Rho".lower(), "H264"),
-    ("Robecchetto con Induno".lower(), "H371"),
-    ("Robecco sul Naviglio".lower(), "H373"),
-    ("Rodano".lower(), "H470"),
-    ("Rosate".lower(), "H560"),
-    ("Rozzano".lower(), "H623"),
-    ("San Colombano al Lambro".lower(), "H803"),
-    ("San Donato Milanese".lower(), "H827"),
-    ("San Giorgio su Legnano".lower(), "H884"),
-    ("San Giuliano Milanese".lower(), "H930"),
-    ("Santo Stefano Ticino".lower(), "I361"),
-    ("San Vittore Olona".lower(), "I409"),
-    ("San Zenone al Lambro".lower(), "I415"),
-    ("Sedriano".lower(), "I566"),
-    ("Segrate".lower(), "I577"),
-    ("Senago".lower(), "I602"),
-    ("Sesto San Giovanni".lower(), "I690"),
-    ("Settala".lower(), "I696"),
-    ("Settimo Milanese".lower(), "I700"),
-    ("Solaro".lower(), "I786"),
-    ("Trezzano Rosa".lower(), "L408"),
-    ("Trezzano sul Naviglio".lower(), "L409"),
-    ("Trezzo sull'Adda".lower(), "L411"),
-    ("Tribiano".lower(), "L415"),
-    ("Truccazzano".lower(), "L454"),
-    ("Turbigo".lower(), "L471"),
-    ("Vanzago".lower(), "L665"),
-    ("Vaprio d'Adda".lower(), "L667"),
-    ("Vermezzo".lower(), "L768"),
-    ("Vernate".lower(), "L773"),
-    ("Vignate".lower(), "L883"),
-    ("Vimodrone".lower(), "M053"),
-    ("Vittuone".lower(), "M091"),
-    ("Vizzolo Predabissi".lower(), "M102"),
-    ("Zelo Surrigone".lower(), "M160"),
-    ("Zibido San Giacomo".lower(), "M176"),
-    ("Villa Cortese".lower(), "L928"),
-    ("Vanzaghello".lower(), "L664"),
-    ("Baranzate".lower(), "A618"),
-    ("Adrara San Martino".lower(), "A057"),
-    ("Adrara San Rocco".lower(), "A058"),
-    ("Albano Sant'Alessandro".lower(), "A129"),
-    ("Albino".lower(), "A163"),
-    ("Almè".lower(), "A214"),
-    ("Almenno San Bartolomeo".lower(), "A216"),
-    ("Almenno San Salvatore".lower(), "A217"),
-    ("Alzano Lombardo".lower(), "A246"),
-    ("Ambivere".lower(), "A259"),
-    ("Antegnate".lower(), "A304"),
-    ("Arcene".lower(), "A365"),
-    ("Ardesio".lower(), "A383"),
-    ("Arzago d'Adda".lower(), "A440"),
-    ("Averara".lower(), "A511"),
-    ("Aviatico".lower(), "A517"),
-    ("Azzano San Paolo".lower(), "A528"),
-    ("Azzone".lower(), "A533"),
-    ("Bagnatica".lower(), "A557"),
-    ("Barbata".lower(), "A631"),
-    ("Bariano".lower(), "A664"),
-    ("Barzana".lower(), "A684"),
-    ("Bedulita".lower(), "A732"),
-    ("Berbenno".lower(), "A786"),
-    ("Bergamo".lower(), "A794"),
-    ("Berzo San Fermo".lower(), "A815"),
-    ("Bianzano".lower(), "A846"),
-    ("Blello".lower(), "A903"),
-    ("Bolgare".lower(), "A937"),
-    ("Boltiere".lower(), "A950"),
-    ("Bonate Sopra".lower(), "A963"),
-    ("Bonate Sotto".lower(), "A962"),
-    ("Borgo di Terzo".lower(), "B010"),
-    ("Bossico".lower(), "B083"),
-    ("Bottanuco".lower(), "B088"),
-    ("Bracca".lower(), "B112"),
-    ("Branzi".lower(), "B123"),
-    ("Brembate".lower(), "B137"),
-    ("Brembate di Sopra".lower(), "B138"),
-    ("Brignano Gera d'Adda".lower(), "B178"),
-    ("Brumano".lower(), "B217"),
-    ("Brusaporto".lower(), "B223"),
-    ("Calcinate".lower(), "B393"),
-    ("Calcio".lower(), "B395"),
-    ("Calusco d'Adda".lower(), "B434"),
-    ("Calvenzano".lower(), "B442"),
-    ("Camerata Cornello".lower(), "B471"),
-    ("Canonica d'Adda".lower(), "B618"),
-    ("Capizzone".lower(), "B661"),
-    ("Capriate San Gervasio".lower(), "B703"),
-    ("Caprino Bergamasco".lower(), "B710"),
-    ("Caravaggio".lower(), "B731"),
-    ("Carobbio degli Angeli".lower(), "B801"),
-    ("Carona".lower(), "B803"),
-    ("Carvico".lower(), "B854"),
-    ("Casazza".lower(), "B947"),
-    ("Casirate d'Adda".lower(), "B971"),
-    ("Casnigo".lower(), "B978"),
-    ("Cassiglio".lower(), "C007"),
-    ("Castelli Calepio".lower(), "C079"),
-    ("Castel Rozzone".lower(), "C255"),
-    ("Castione della Presolana".lower(), "C324"),
-    ("Castro".lower(), "C337"),
-    ("Cavernago".lower(), "C396"),
-    ("Cazzano Sant'Andrea".lower(), "C410"),
-    ("Cenate Sopra".lower(), "C456"),
-    ("Cenate Sotto".lower(), "C457"),
-    ("Cene".lower(), "C459"),
-    ("Cerete".lower(), "C506"),
-    ("Chignolo d'Isola".lower(), "C635"),
-    ("Chiuduno".lower(), "C649"),
-    ("Cisano Bergamasco".lower(), "C728"),
-    ("Ciserano".lower(), "C730"),
-    ("Cividate al Piano".lower(), "C759"),
-    ("Clusone".lower(), "C800"),
-    ("Colere".lower(), "C835"),
-    ("Cologno al Serio".lower(), "C894"),
-    ("Colzate".lower(), "C910"),
-    ("Comun Nuovo".lower(), "C937"),
-    ("Corna Imagna".lower(), "D015"),
-    ("Cortenuova".lower(), "D066"),
-    ("Costa di Mezzate".lower(), "D110"),
-    ("Costa Valle Imagna".lower(), "D103"),
-    ("Costa Volpino".lower(), "D117"),
-    ("Covo".lower(), "D126"),
-    ("Credaro".lower(), "D139"),
-    ("Curno".lower(), "D221"),
-    ("Cusio".lower(), "D233"),
-    ("Dalmine".lower(), "D245"),
-    ("Dossena".lower(), "D352"),
-    ("Endine Gaiano".lower(), "D406"),
-    ("Entratico".lower(), "D411"),
-    ("Fara Gera d'Adda".lower(), "D490"),
-    ("Fara Olivana con Sola".lower(), "D491"),
-    ("Filago".lower(), "D588"),
-    ("Fino del Monte".lower(), "D604"),
-    ("Fiorano al Serio".lower(), "D606"),
-    ("Fontanella".lower(), "D672"),
-    ("Fonteno".lower(), "D684"),
-    ("Foppolo".lower(), "D688"),
-    ("Foresto Sparso".lower(), "D697"),
-    ("Fornovo San Giovanni".lower(), "D727"),
-    ("Fuipiano Valle Imagna".lower(), "D817"),
-    ("Gandellino".lower(), "D903"),
-    ("Gandino".lower(), "D905"),
-    ("Gandosso".lower(), "D906"),
-    ("Gaverina Terme".lower(), "D943"),
-    ("Gazzaniga".lower(), "D952"),
-    ("Ghisalba".lower(), "E006"),
-    ("Gorlago".lower(), "E100"),
-    ("Gorle".lower(), "E103"),
-    ("Gorno".lower(), "E106"),
-    ("Grassobbio".lower(), "E148"),
-    ("Gromo".lower(), "E189"),
-    ("Grone".lower(), "E192"),
-    ("Grumello del Monte".lower(), "E219"),
-    ("Isola di Fondra".lower(), "E353"),
-    ("Isso".lower(), "E370"),
-    ("Lallio".lower(), "E422"),
-    ("Leffe".lower(), "E509"),
-    ("Lenna".lower(), "E524"),
-    ("Levate".lower(), "E562"),
-    ("Locatello".lower(), "E640"),
-    ("Lovere".lower(), "E704"),
-    ("Lurano".lower(), "E751"),
-    ("Luzzana".lower(), "E770"),
-    ("Madone".lower(), "E794"),
-    ("Mapello".lower(), "E901"),
-    ("Martinengo".lower(), "E987"),
-    ("Mezzoldo".lower(), "F186"),
-    ("Misano di Gera d'Adda".lower(), "F243"),
-    ("Moio de' Calvi".lower(), "F276"),
-    ("Monasterolo del Castello".lower(), "F328"),
-    ("Montello".lower(), "F547"),
-    ("Morengo".lower(), "F720"),
-    ("Mornico al Serio".lower(), "F738"),
-    ("Mozzanica".lower(), "F786"),
-    ("Mozzo".lower(), "F791"),
-    ("Nembro".lower(), "F864"),
-    ("Olmo al Brembo".lower(), "G049"),
-    ("Oltre il Colle".lower(), "G050"),
-    ("Oltressenda Alta".lower(), "G054"),
-    ("Oneta".lower(), "G068"),
-    ("Onore".lower(), "G075"),
-    ("Orio al Serio".lower(), "G108"),
-    ("Ornica".lower(), "G118"),
-    ("Osio Sopra".lower(), "G159"),
-    ("Osio Sotto".lower(), "G160"),
-    ("Pagazzano".lower(), "G233"),
-    ("Paladina".lower(), "G249"),
-    ("Palazzago".lower(), "G259"),
-    ("Palosco".lower(), "G295"),
-    ("Parre".lower(), "G346"),
-    ("Parzanica".lower(), "G350"),
-    ("Pedrengo".lower(), "G412"),
-    ("Peia".lower(), "G418"),
-    ("Pianico".lower(), "G564"),
-    ("Piario".lower(), "G574"),
-    ("Piazza Brembana".lower(), "G579"),
-    ("Piazzatorre".lower(), "G583"),
-    ("Piazzolo".lower(), "G588"),
-    ("Pognano".lower(), "G774"),
-    ("Ponte Nossa".lower(), "F941"),
-    ("Ponteranica".lower(), "G853"),
-    ("Ponte San Pietro".lower(), "G856"),
-    ("Pontida".lower(), "G864"),
-    ("Pontirolo Nuovo".lower(), "G867"),
-    ("Pradalunga".lower(), "G968"),
-    ("Predore".lower(), "H020"),
-    ("Premolo".lower(), "H036"),
-    ("Presezzo".lower(), "H046"),
-    ("Pumenengo".lower(), "H091"),
-    ("Ranica".lower(), "H176"),
-    ("Ranzanico".lower(), "H177"),
-    ("Riva di Solto".lower(), "H331"),
-    ("Rogno".lower(), "H492"),
-    ("Romano di Lombardia".lower(), "H509"),
-    ("Roncobello".lower(), "H535"),
-    ("Roncola".lower(), "H544"),
-    ("Rota d'Imagna".lower(), "H584"),
-    ("Rovetta".lower(), "H615"),
-    ("San Giovanni Bianco".lower(), "H910"),
-    ("San Paolo d'Argon".lower(), "B310"),
-    ("San Pellegrino Terme".lower(), "I079"),
-    ("Santa Brigida".lower(), "I168"),
-    ("Sarnico".lower(), "I437"),
-    ("Scanzorosciate".lower(), "I506"),
-    ("Schilpario".lower(), "I530"),
-    ("Sedrina".lower(), "I567"),
-    ("Selvino".lower(), "I597"),
-    ("Seriate".lower(), "I628"),
-    ("Serina".lower(), "I629"),
-    ("Solto Collina".lower(), "I812"),
-    ("Songavazzo".lower(), "I830"),
-    ("Sorisole".lower(), "I858"),
-    ("Sotto il Monte Giovanni XXIII".lower(), "I869"),
-    ("Sovere".lower(), "I873"),
-    ("Spinone al Lago".lower(), "I916"),
-    ("Spirano".lower(), "I919"),
-    ("Stezzano".lower(), "I951"),
-    ("Strozza".lower(), "I986"),
-    ("Suisio".lower(), "I997"),
-    ("Taleggio".lower(), "L037"),
-    ("Tavernola Bergamasca".lower(), "L073"),
-    ("Telgate".lower(), "L087"),
-    ("Terno d'Isola".lower(), "L118"),
-    ("Torre Boldone".lower(), "L251"),
-    ("Torre de' Roveri".lower(), "L265"),
-    ("Torre Pallavicina".lower(), "L276"),
-    ("Trescore Balneario".lower(), "L388"),
-    ("Treviglio".lower(), "L400"),
-    ("Treviolo".lower(), "L404"),
-    ("Ubiale Clanezzo".lower(), "C789"),
-    ("Urgnano".lower(), "L502"),
-    ("Valbondione".lower(), "L544"),
-    ("Valbrembo".lower(), "L545"),
-    ("Valgoglio".lower(), "L579"),
-    ("Valleve".lower(), "L623"),
-    ("Valnegra".lower(), "L642"),
-    ("Valtorta".lower(), "L655"),
-    ("Vedeseta".lower(), "L707"),
-    ("Verdellino".lower(), "L752"),
-    ("Verdello".lower(), "L753"),
-    ("Vertova".lower(), "L795"),
-    ("Viadanica".lower(), "L827"),
-    ("Vigano San Martino".lower(), "L865"),
-    ("Vigolo".lower(), "L894"),
-    ("Villa d'Adda".lower(), "L929"),
-    ("Villa d'Almè".lower(), "A215"),
-    ("Villa di Serio".lower(), "L936"),
-    ("Villa d'Ogna".lower(), "L938"),
-    ("Villongo".lower(), "M045"),
-    ("Vilminore di Scalve".lower(), "M050"),
-    ("Zandobbio".lower(), "M144"),
-    ("Zanica".lower(), "M147"),
-    ("Zogno".lower(), "M184"),
-    ("Costa Serina".lower(), "D111"),
-    ("Algua".lower(), "A193"),
-    ("Cornalba".lower(), "D016"),
-    ("Medolago".lower(), "F085"),
-    ("Solza".lower(), "I813"),
-    ("Sant'Omobono Terme".lower(), "M333"),
-    ("Val Brembilla".lower(), "M334"),
-    ("Acquafredda".lower(), "A034"),
-    ("Adro".lower(), "A060"),
-    ("Agnosine".lower(), "A082"),
-    ("Alfianello".lower(), "A188"),
-    ("Anfo".lower(), "A288"),
-    ("Angolo Terme".lower(), "A293"),
-    ("Artogne".lower(), "A451"),
-    ("Azzano Mella".lower(), "A529"),
-    ("Bagnolo Mella".lower(), "A569"),
-    ("Bagolino".lower(), "A578"),
-    ("Barbariga".lower(), "A630"),
-    ("Barghe".lower(), "A661"),
-    ("Bassano Bresciano".lower(), "A702"),
-    ("Bedizzole".lower(), "A729"),
-    ("Berlingo".lower(), "A799"),
-    ("Berzo Demo".lower(), "A816"),
-    ("Berzo Inferiore".lower(), "A817"),
-    ("Bienno".lower(), "A861"),
-    ("Bione".lower(), "A878"),
-    ("Borgo San Giacomo".lower(), "B035"),
-    ("Borgosatollo".lower(), "B040"),
-    ("Borno".lower(), "B054"),
-    ("Botticino".lower(), "B091"),
-    ("Bovegno".lower(), "B100"),
-    ("Bovezzo".lower(), "B102"),
-    ("Brandico".lower(), "B120"),
-    ("Braone".lower(), "B124"),
-    ("Breno".lower(), "B149"),
-    ("Brescia".lower(), "B157"),
-    ("Brione".lower(), "B184"),
-    ("Caino".lower(), "B365"),
-    ("Calcinato".lower(), "B394"),
-    ("Calvagese della Riviera".lower(), "B436"),
-    ("Calvisano".lower(), "B450"),
-    ("Capo di Ponte".lower(), "B664"),
-    ("Capovalle".lower(), "B676"),
-    ("Capriano del Colle".lower(), "B698"),
-    ("Capriolo".lower(), "B711"),
-    ("Carpenedolo".lower(), "B817"),
-    ("Castegnato".lower(), "C055"),
-    ("Castelcovati".lower(), "C072"),
-    ("Castel Mella".lower(), "C208"),
-    ("Castenedolo".lower(), "C293"),
-    ("Casto".lower(), "C330"),
-    ("Castrezzato".lower(), "C332"),
-    ("Cazzago San Martino".lower(), "C408"),
-    ("Cedegolo".lower(), "C417"),
-    ("Cellatica".lower(), "C439"),
-    ("Cerveno".lower(), "C549"),
-    ("Ceto".lower(), "C585"),
-    ("Cevo".lower(), "C591"),
-    ("Chiari".lower(), "C618"),
-    ("Cigole".lower(), "C685"),
-    ("Cimbergo".lower(), "C691"),
-    ("Cividate Camuno".lower(), "C760"),
-    ("Coccaglio".lower(), "C806"),
-    ("Collebeato".lower(), "C850"),
-    ("Collio".lower(), "C883"),
-    ("Cologne".lower(), "C893"),
-    ("Comezzano-Cizzago".lower(), "C925"),
-    ("Concesio".lower(), "C948"),
-    ("Corte Franca".lower(), "D058"),
-    ("Corteno Golgi".lower(), "D064"),
-    ("Corzano".lower(), "D082"),
-    ("Darfo Boario Terme".lower(), "D251"),
-    ("Dello".lower(), "D270"),
-    ("Desenzano del Garda".lower(), "D284"),
-    ("Edolo".lower(), "D391"),
-    ("Erbusco".lower(), "D421"),
-    ("Esine".lower(), "D434"),
-    ("Fiesse".lower(), "D576"),
-    ("Flero".lower(), "D634"),
-    ("Gambara".lower(), "D891"),
-    ("Gardone Riviera".lower(), "D917"),
-    ("Gardone Val Trompia".lower(), "D918"),
-    ("Gargnano".lower(), "D924"),
-    ("Gavardo".lower(), "D940"),
-    ("Ghedi".lower(), "D999"),
-    ("Gianico".lower(), "E010"),
-    ("Gottolengo".lower(), "E116"),
-    ("Gussago".lower(), "E271"),
-    ("Idro".lower(), "E280"),
-    ("Incudine".lower(), "E297"),
-    ("Irma".lower(), "E325"),
-    ("Iseo".lower(), "E333"),
-    ("Isorella".lower(), "E364"),
-    ("Lavenone".lower(), "E497"),
-    ("Leno".lower(), "E526"),
-    ("Limone sul Garda".lower(), "E596"),
-    ("Lodrino".lower(), "E652"),
-    ("Lograto".lower(), "E654"),
-    ("Lonato del Garda".lower(), "M312"),
-    ("Longhena".lower(), "E673"),
-    ("Losine".lower(), "E698"),
-    ("Lozio".lower(), "E706"),
-    ("Lumezzane".lower(), "E738"),
-    ("Maclodio".lower(), "E787"),
-    ("Magasa".lower(), "E800"),
-    ("Mairano".lower(), "E841"),
-    ("Malegno".lower(), "E851"),
-    ("Malonno".lower(), "E865"),
-    ("Manerba del Garda".lower(), "E883"),
-    ("Manerbio".lower(), "E884"),
-    ("Marcheno".lower(), "E928"),
-    ("Marmentino".lower(), "E961"),
-    ("Marone".lower(), "E967"),
-    ("Mazzano".lower(), "F063"),
-    ("Milzano".lower(), "F216"),
-    ("Moniga del Garda".lower(), "F373"),
-    ("Monno".lower(), "F375"),
-    ("Monte Isola".lower(), "F532"),
-    ("Monticelli Brusati".lower(), "F672"),
-    ("Montichiari".lower(), "F471"),
-    ("Montirone".lower(), "F680"),
-    ("Mura".lower(), "F806"),
-    ("Muscoline".lower(), "F820"),
-    ("Nave".lower(), "F851"),
-    ("Niardo".lower(), "F884"),
-    ("Nuvolento".lower(), "F989"),
-    ("Nuvolera".lower(), "F990"),
-    ("Odolo".lower(), "G001"),
-    ("Offlaga".lower(), "G006"),
-    ("Ome".lower(), "G061"),
-    ("Ono San Pietro".lower(), "G074"),
-    ("Orzinuovi".lower(), "G149"),
-    ("Orzivecchi".lower(), "G150"),
-    ("Ospitaletto".lower(), "G170"),
-    ("Ossimo".lower(), "G179"),
-    ("Padenghe sul Garda".lower(), "G213"),
-    ("Paderno Franciacorta".lower(), "G217"),
-    ("Paisco Loveno".lower(), "G247"),
-    ("Paitone".lower(), "G248"),
-    ("Palazzolo sull'Oglio".lower(), "G264"),
-    ("Paratico".lower(), "G327"),
-    ("Paspardo".lower(), "G354"),
-    ("Passirano".lower(), "G361"),
-    ("Pavone del Mella".lower(), "G391"),
-    ("San Paolo".lower(), "G407"),
-    ("Pertica Alta".lower(), "G474"),
-    ("Pertica Bassa".lower(), "G475"),
-    ("Pezzaze".lower(), "G529"),
-    ("Pian Camuno".lower(), "G546"),
-    ("Pisogne".lower(), "G710"),
-    ("Polaveno".lower(), "G779"),
-    ("Polpenazze del Garda".lower(), "G801"),
-    ("Pompiano".lower(), "G815"),
-    ("Poncarale".lower(), "G818"),
-    ("Ponte di Legno".lower(), "G844"),
-    ("Pontevico".lower(), "G859"),
-    ("Pontoglio".lower(), "G869"),
-    ("Pozzolengo".lower(), "G959"),
-    ("Pralboino".lower(), "G977"),
-    ("Preseglie".lower(), "H043"),
-    ("Prevalle".lower(), "H055"),
-    ("Provaglio d'Iseo".lower(), "H078"),
-    ("Provaglio Val Sabbia".lower(), "H077"),
-    ("Puegnago sul Garda".lower(), "H086"),
-    ("Quinzano d'Oglio".lower(), "H140"),
-    ("Remedello".lower(), "H230"),
-    ("Rezzato".lower(), "H256"),
-    ("Roccafranca".lower(), "H410"),
-    ("Rodengo Saiano".lower(), "H477"),
-    ("Roè Volciano".lower(), "H484"),
-    ("Roncadelle".lower(), "H525"),
-    ("Rovato".lower(), "H598"),
-    ("Rudiano".lower(), "H630"),
-    ("Sabbio Chiese".lower(), "H650"),
-    ("Sale Marasino".lower(), "H699"),
-    ("Salò".lower(), "H717"),
-    ("San Felice del Benaco".lower(), "H838"),
-    ("San Gervasio Bresciano".lower(), "H865"),
-    ("San Zeno Naviglio".lower(), "I412"),
-    ("Sarezzo".lower(), "I433"),
-    ("Saviore dell'Adamello".lower(), "I476"),
-    ("Sellero".lower(), "I588"),
-    ("Seniga".lower(), "I607"),
-    ("Serle".lower(), "I631"),
-    ("Sirmione".lower(), "I633"),
-    ("Soiano del Lago".lower(), "I782"),
-    ("Sonico".lower(), "I831"),
-    ("Sulzano".lower(), "L002"),
-    ("Tavernole sul Mella".lower(), "C698"),
-    ("Temù".lower(), "L094"),
-    ("Tignale".lower(), "L169"),
-    ("Torbole Casaglia".lower(), "L210"),
-    ("Toscolano-Maderno".lower(), "L312"),
-    ("Travagliato".lower(), "L339"),
-    ("Tremosine sul Garda".lower(), "L372"),
-    ("Trenzano".lower(), "L380"),
-    ("Treviso Bresciano".lower(), "L406"),
-    ("Urago d'Oglio".lower(), "L494"),
-    ("Vallio Terme".lower(), "L626"),
-    ("Valvestino".lower(), "L468"),
-    ("Verolanuova".lower(), "L777"),
-    ("Verolavecchia".lower(), "L778"),
-    ("Vestone".lower(), "L812"),
-    ("Vezza d'Oglio".lower(), "L816"),
-    ("Villa Carcina".lower(), "L919"),
-    ("Villachiara".lower(), "L923"),
-    ("Villanuova sul Clisi".lower(), "L995"),
-    ("Vione".lower(), "M065"),
-    ("Visano".lower(), "M070"),
-    ("Vobarno".lower(), "M104"),
-    ("Zone".lower(), "M188"),
-    ("Piancogno".lower(), "G549"),
-    ("Alagna".lower(), "A118"),
-    ("Albaredo Arnaboldi".lower(), "A134"),
-    ("Albonese".lower(), "A171"),
-    ("Albuzzano".lower(), "A175"),
-    ("Arena Po".lower(), "A387"),
-    ("Badia Pavese".lower(), "A538"),
-    ("Bagnaria".lower(), "A550"),
-    ("Barbianello".lower(), "A634"),
-    ("Bascapè".lower(), "A690"),
-    ("Bastida Pancarana".lower(), "A712"),
-    ("Battuda".lower(), "A718"),
-    ("Belgioioso".lower(), "A741"),
-    ("Bereguardo".lower(), "A792"),
-    ("Borgarello".lower(), "A989"),
-    ("Borgo Priolo".lower(), "B028"),
-    ("Borgoratto Mormorolo".lower(), "B030"),
-    ("Borgo San Siro".lower(), "B038"),
-    ("Bornasco".lower(), "B051"),
-    ("Bosnasco".lower(), "B082"),
-    ("Brallo di Pregola".lower(), "B117"),
-    ("Breme".lower(), "B142"),
-    ("Bressana Bottarone".lower(), "B159"),
-    ("Broni".lower(), "B201"),
-    ("Calvignano".lower(), "B447"),
-    ("Campospinoso".lower(), "B567"),
-    ("Candia Lomellina".lower(), "B587"),
-    ("Canevino".lower(), "B599"),
-    ("Canneto Pavese".lower(), "B613"),
-    ("Carbonara al Ticino".lower(), "B741"),
-    ("Casanova Lonati".lower(), "B929"),
-    ("Casatisma".lower(), "B945"),
-    ("Casei Gerola".lower(), "B954"),
-    ("Casorate Primo".lower(), "B988"),
-    ("Cassolnovo".lower(), "C038"),
-    ("Castana".lower(), "C050"),
-    ("Casteggio".lower(), "C053"),
-    ("Castelletto di Branduzzo".lower(), "C157"),
-    ("Castello d'Agogna".lower(), "C184"),
-    ("Castelnovetto".lower(), "C213"),
-    ("Cava Manara".lower(), "C360"),
-    ("Cecima".lower(), "C414"),
-    ("Ceranova".lower(), "C484"),
-    ("Ceretto Lomellina".lower(), "C508"),
-    ("Cergnago".lower(), "C509"),
-    ("Certosa di Pavia".lower(), "C541"),
-    ("Cervesina".lower(), "C551"),
-    ("Chignolo Po".lower(), "C637"),
-    ("Cigognola".lower(), "C684"),
-    ("Cilavegna".lower(), "C686"),
-    ("Codevilla".lower(), "C813"),
-    ("Confienza".lower(), "C958"),
-    ("Copiano".lower(), "C979"),
-    ("Corana".lower(), "C982"),
-    ("Corvino San Quirico".lower(), "D081"),
-    ("Costa de' Nobili".lower(), "D109"),
-    ("Cozzo".lower(), "D127"),
-    ("Cura Carpignano".lower(), "B824"),
-    ("Dorno".lower(), "D348"),
-    ("Ferrera Erbognone".lower(), "D552"),
-    ("Filighera".lower(), "D594"),
-    ("Fortunago".lower(), "D732"),
-    ("Frascarolo".lower(), "D771"),
-    ("Galliavola".lower(), "D873"),
-    ("Gambarana".lower(), "D892"),
-    ("Gambolò".lower(), "D901"),
-    ("Garlasco".lower(), "D925"),
-    ("Gerenzago".lower(), "D980"),
-    ("Giussago".lower(), "E062"),
-    ("Godiasco Salice Terme".lower(), "E072"),
-    ("Golferenzo".lower(), "E081"),
-    ("Gravellona Lomellina".lower(), "E152"),
-    ("Gropello Cairoli".lower(), "E195"),
-    ("Inverno e Monteleone".lower(), "E310"),
-    ("Landriano".lower(), "E437"),
-    ("Langosco".lower(), "E439"),
-    ("Lardirago".lower(), "E454"),
-    ("Linarolo".lower(), "E600"),
-    ("Lirio".lower(), "E608"),
-    ("Lomello".lower(), "E662"),
-    ("Lungavilla".lower(), "B387"),
-    ("Magherno".lower(), "E804"),
-    ("Marcignago".lower(), "E934"),
-    ("Marzano".lower(), "E999"),
-    ("Mede".lower(), "F080"),
-    ("Menconico".lower(), "F122"),
-    ("Mezzana Bigli".lower(), "F170"),
-    ("Mezzana Rabattone".lower(), "F171"),
-    ("Mezzanino".lower(), "F175"),
-    ("Miradolo Terme".lower(), "F238"),
-    ("Montalto Pavese".lower(), "F417"),
-    ("Montebello della Battaglia".lower(), "F440"),
-    ("Montecalvo Versiggia".lower(), "F449"),
-    ("Montescano".lower(), "F638"),
-    ("Montesegale".lower(), "F644"),
-    ("Monticelli Pavese".lower(), "F670"),
-    ("Montù Beccaria".lower(), "F701"),
-    ("Mornico Losana".lower(), "F739"),
-    ("Mortara".lower(), "F754"),
-    ("Nicorvo".lower(), "F891"),
-    ("Olevano di Lomellina".lower(), "G021"),
-    ("Oliva Gessi".lower(), "G032"),
-    ("Ottobiano".lower(), "G194"),
-    ("Palestro".lower(), "G275"),
-    ("Pancarana".lower(), "G304"),
-    ("Parona".lower(), "G342"),
-    ("Pavia".lower(), "G388"),
-    ("Pietra de' Giorgi".lower(), "G612"),
-    ("Pieve Albignola".lower(), "G635"),
-    ("Pieve del Cairo".lower(), "G639"),
-    ("Pieve Porto Morone".lower(), "G650"),
-    ("Pinarolo Po".lower(), "G671"),
-    ("Pizzale".lower(), "G720"),
-    ("Ponte Nizza".lower(), "G851"),
-    ("Portalbera".lower(), "G895"),
-    ("Rea".lower(), "H204"),
-    ("Redavalle".lower(), "H216"),
-    ("Retorbido".lower(), "H246"),
-    ("Rivanazzano Terme".lower(), "H336"),
-    ("Robbio".lower(), "H369"),
-    ("Robecco Pavese".lower(), "H375"),
-    ("Rocca de' Giorgi".lower(), "H396"),
-    ("Rocca Susella".lower(), "H450"),
-    ("Rognano".lower(), "H491"),
-    ("Romagnese".lower(), "H505"),
-    ("Roncaro".lower(), "H527"),
-    ("Rosasco".lower(), "H559"),
-    ("Rovescala".lower(), "H614"),
-    ("Ruino".lower(), "H637"),
-    ("San Cipriano Po".lower(), "H799"),
-    ("San Damiano al Colle".lower(), "H814"),
-    ("San Genesio ed Uniti".lower(), "H859"),
-    ("San Giorgio di Lomellina".lower(), "H885"),
-    ("San Martino Siccomario".lower(), "I014"),
-    ("Sannazzaro de' Burgondi".lower(), "I048"),
-    ("Santa Cristina e Bissone".lower(), "I175"),
-    ("Santa Giuletta".lower(), "I203"),
-    ("Sant'Alessio con Vialone".lower(), "I213"),
-    ("Santa Margherita di Staffora".lower(), "I230"),
-    ("Santa Maria della Versa".lower(), "I237"),
-    ("Sant'Angelo Lomellina".lower(), "I276"),
-    ("San Zenone al Po".lower(), "I416"),
-    ("Sartirana Lomellina".lower(), "I447"),
-    ("Scaldasole".lower(), "I487"),
-    ("Semiana".lower(), "I599"),
-    ("Silvano Pietra".lower(), "I739"),
-    ("Siziano".lower(), "E265"),
-    ("Sommo".lower(), "I825"),
-    ("Spessa".lower(), "I894"),
-    ("Stradella".lower(), "I968"),
-    ("Suardi".lower(), "B014"),
-    ("Torrazza Coste".lower(), "L237"),
-    ("Torre Beretti e Castellaro".lower(), "L250"),
-    ("Torre d'Arese".lower(), "L256"),
-    ("Torre de' Negri".lower(), "L262"),
-    ("Torre d'Isola".lower(), "L269"),
-    ("Torrevecchia Pia".lower(), "L285"),
-    ("Torricella Verzate".lower(), "L292"),
-    ("Travacò Siccomario".lower(), "I236"),
-    ("Trivolzio".lower(), "L440"),
-    ("Tromello".lower(), "L449"),
-    ("Trovo".lower(), "L453"),
-    ("Val di Nizza".lower(), "L562"),
-    ("Valeggio".lower(), "L568"),
-    ("Valle Lomellina".lower(), "L593"),
-    ("Valle Salimbene".lower(), "L617"),
-    ("Valverde".lower(), "L659"),
-    ("Varzi".lower(), "L690"),
-    ("Velezzo Lomellina".lower(), "L716"),
-    ("Vellezzo Bellini".lower(), "L720"),
-    ("Verretto".lower(), "L784"),
-    ("Verrua Po".lower(), "L788"),
-    ("Vidigulfo".lower(), "L854"),
-    ("Vigevano".lower(), "L872"),
-    ("Villa Biscossi".lower(), "L917"),
-    ("Villanova d'Ardenghi".lower(), "L983"),
-    ("Villanterio".lower(), "L994"),
-    ("Vistarino".lower(), "M079"),
-    ("Voghera".lower(), "M109"),
-    ("Volpara".lower(), "M119"),
-    ("Zavattarello".lower(), "M150"),
-    ("Zeccone".lower(), "M152"),
-    ("Zeme".lower(), "M161"),
-    ("Zenevredo".lower(), "M162"),
-    ("Zerbo".lower(), "M166"),
-    ("Zerbolò".lower(), "M167"),
-    ("Zinasco".lower(), "M180"),
-    ("Cornale e Bastida".lower(), "M338"),
-    ("Corteolona e Genzone".lower(), "M372"),
-    ("Acquanegra Cremonese".lower(), "A039"),
-    ("Agnadello".lower(), "A076"),
-    ("Annicco".lower(), "A299"),
-    ("Azzanello".lower(), "A526"),
-    ("Bagnolo Cremasco".lower(), "A570"),
-    ("Bonemerse".lower(), "A972"),
-    ("Bordolano".lower(), "A986"),
-    ("Ca' d'Andrea".lower(), "B320"),
-    ("Calvatone".lower(), "B439"),
-    ("Camisano".lower(), "B484"),
-    ("Campagnola Cremasca".lower(), "B498"),
-    ("Capergnanica".lower(), "B650"),
-    ("Cappella Cantone".lower(), "B679"),
-    ("Cappella de' Picenardi".lower(), "B680"),
-    ("Capralba".lower(), "B686"),
-    ("Casalbuttano ed Uniti".lower(), "B869"),
-    ("Casale Cremasco-Vidolasco".lower(), "B881"),
-    ("Casaletto Ceredano".lower(), "B889"),
-    ("Casaletto di Sopra".lower(), "B890"),
-    ("Casaletto Vaprio".lower(), "B891"),
-    ("Casalmaggiore".lower(), "B898"),
-    ("Casalmorano".lower(), "B900"),
-    ("Casteldidone".lower(), "C089"),
-    ("Castel Gabbiano".lower(), "C115"),
-    ("Castelleone".lower(), "C153"),
-    ("Castelverde".lower(), "B129"),
-    ("Castelvisconti".lower(), "C290"),
-    ("Cella Dati".lower(), "C435"),
-    ("Chieve".lower(), "C634"),
-    ("Cicognolo".lower(), "C678"),
-    ("Cingia de' Botti".lower(), "C703"),
-    ("Corte de' Cortesi con Cignone".lower(), "D056"),
-    ("Corte de' Frati".lower(), "D057"),
-    ("Credera Rubbiano".lower(), "D141"),
-    ("Crema".lower(), "D142"),
-    ("Cremona".lower(), "D150"),
-    ("Cremosano".lower(), "D151"),
-    ("Crotta d'Adda".lower(), "D186"),
-    ("Cumignano sul Naviglio".lower(), "D203"),
-    ("Derovere".lower(), "D278"),
-    ("Dovera".lower(), "D358"),
-    ("Drizzona".lower(), "D370"),
-    ("Fiesco".lower(), "D574"),
-    ("Formigara".lower(), "D710"),
-    ("Gabbioneta-Binanuova".lower(), "D834"),
-    ("Gadesco-Pieve Delmona".lower(), "D841"),
-    ("Genivolta".lower(), "D966"),
-    ("Gerre de' Caprioli".lower(), "D993"),
-    ("Gombito".lower(), "E082"),
-    ("Grontardo".lower(), "E193"),
-    ("Grumello Cremonese ed Uniti".lower(), "E217"),
-    ("Gussola".lower(), "E272"),
-    ("Isola Dovarese".lower(), "E356"),
-    ("Izano".lower(), "E380"),
-    ("Madignano".lower(), "E793"),
-    ("Malagnino".lower(), "E843"),
-    ("Martignana di Po".lower(), "E983"),
-    ("Monte Cremasco".lower(), "F434"),
-    ("Montodine".lower(), "F681"),
-    ("Moscazzano".lower(), "F761"),
-    ("Motta Baluffi".lower(), "F771"),
-    ("Offanengo".lower(), "G004"),
-    ("Olmeneta".lower(), "G047"),
-    ("Ostiano".lower(), "G185"),
-    ("Paderno Ponchielli".lower(), "G222"),
-    ("Palazzo Pignano".lower(), "G260"),
-    ("Pandino".lower(), "G306"),
-    ("Persico Dosimo".lower(), "G469"),
-    ("Pescarolo ed Uniti".lower(), "G483"),
-    ("Pessina Cremonese".lower(), "G504"),
-    ("Piadena".lower(), "G536"),
-    ("Pianengo".lower(), "G558"),
-    ("Pieranica".lower(), "G603"),
-    ("Pieve d'Olmi".lower(), "G647"),
-    ("Pieve San Giacomo".lower(), "G651"),
-    ("Pizzighettone".lower(), "G721"),
-    ("Pozzaglio ed Uniti".lower(), "B914"),
-    ("Quintano".lower(), "H130"),
-    ("Ricengo".lower(), "H276"),
-    ("Ripalta Arpina".lower(), "H314"),
-    ("Ripalta Cremasca".lower(), "H315"),
-    ("Ripalta Guerina".lower(), "H316"),
-    ("Rivarolo del Re ed Uniti".lower(), "H341"),
-    ("Rivolta d'Adda".lower(), "H357"),
-    ("Robecco d'Oglio".lower(), "H372"),
-    ("Romanengo".lower(), "H508"),
-    ("Salvirola".lower(), "H731"),
-    ("San Bassano".lower(), "H767"),
-    ("San Daniele Po".lower(), "H815"),
-    ("San Giovanni in Croce".lower(), "H918"),
-    ("San Martino del Lago".lower(), "I007"),
-    ("Scandolara Ravara".lower(), "I497"),
-    ("Scandolara Ripa d'Oglio".lower(), "I498"),
-    ("Sergnano".lower(), "I627"),
-    ("Sesto ed Uniti".lower(), "I683"),
-    ("Solarolo Rainerio".lower(), "I790"),
-    ("Soncino".lower(), "I827"),
-    ("Soresina".lower(), "I849"),
-    ("Sospiro".lower(), "I865"),
-    ("Spinadesco".lower(), "I906"),
-    ("Spineda".lower(), "I909"),
-    ("Spino d'Adda".lower(), "I914"),
-    ("Stagno Lombardo".lower(), "I935"),
-    ("Ticengo".lower(), "L164"),
-    ("Torlino Vimercati".lower(), "L221"),
-    ("Tornata".lower(), "L225"),
-    ("Torre de' Picenardi".lower(), "L258"),
-    ("Torricella del Pizzo".lower(), "L296"),
-    ("Trescore Cremasco".lower(), "L389"),
-    ("Trigolo".lower(), "L426"),
-    ("Vaiano Cremasco".lower(), "L535"),
-    ("Vailate".lower(), "L539"),
-    ("Vescovato".lower(), "L806"),
-    ("Volongo".lower(), "M116"),
-    ("Voltido".lower(), "M127"),
-    ("Acquanegra sul Chiese".lower(), "A038"),
-    ("Asola".lower(), "A470"),
-    ("Bagnolo San Vito".lower(), "A575"),
-    ("Bigarello".lower(), "A866"),
-    ("Borgofranco sul Po".lower(), "B013"),
-    ("Bozzolo".lower(), "B110"),
-    ("Canneto sull'Oglio".lower(), "B612"),
-    ("Carbonara di Po".lower(), "B739"),
-    ("Casalmoro".lower(), "B901"),
-    ("Casaloldo".lower(), "B907"),
-    ("Casalromano".lower(), "B911"),
-    ("Castelbelforte".lower(), "C059"),
-    ("Castel d'Ario".lower(), "C076"),
-    ("Castel Goffredo".lower(), "C118"),
-    ("Castellucchio".lower(), "C195"),
-    ("Castiglione delle Stiviere".lower(), "C312"),
-    ("Cavriana".lower(), "C406"),
-    ("Ceresara".lower(), "C502"),
-    ("Commessaggio".lower(), "C930"),
-    ("Curtatone".lower(), "D227"),
-    ("Dosolo".lower(), "D351"),
-    ("Felonica".lower(), "D529"),
-    ("Gazoldo degli Ippoliti".lower(), "D949"),
-    ("Gazzuolo".lower(), "D959"),
-    ("Goito".lower(), "E078"),
-    ("Gonzaga".lower(), "E089"),
-    ("Guidizzolo".lower(), "E261"),
-    ("Magnacavallo".lower(), "E818"),
-    ("Mantova".lower(), "E897"),
-    ("Marcaria".lower(), "E922"),
-    ("Mariana Mantovana".lower(), "E949"),
-    ("Marmirolo".lower(), "E962"),
-    ("Medole".lower(), "F086"),
-    ("Moglia".lower(), "F267"),
-    ("Monzambano".lower(), "F705"),
-    ("Motteggiana".lower(), "B012"),
-    ("Ostiglia".lower(), "G186"),
-    ("Pegognaga".lower(), "G417"),
-    ("Pieve di Coriano".lower(), "G633"),
-    ("Piubega".lower(), "G717"),
-    ("Poggio Rusco".lower(), "G753"),
-    ("Pomponesco".lower(), "G816"),
-    ("Ponti sul Mincio".lower(), "G862"),
-    ("Porto Mantovano".lower(), "G917"),
-    ("Quingentole".lower(), "H129"),
-    ("Quistello".lower(), "H143"),
-    ("Redondesco".lower(), "H218"),
-    ("Revere".lower(), "H248"),
-    ("Rivarolo Mantovano".lower(), "H342"),
-    ("Rodigo".lower(), "H481"),
-    ("Roncoferraro".lower(), "H541"),
-    ("Roverbella".lower(), "H604"),
-    ("Sabbioneta".lower(), "H652"),
-    ("San Benedetto Po".lower(), "H771"),
-    ("San Giacomo delle Segnate".lower(), "H870"),
-    ("San Giorgio di Mantova".lower(), "H883"),
-    ("San Giovanni del Dosso".lower(), "H912"),
-    ("San Martino dall'Argine".lower(), "I005"),
-    ("Schivenoglia".lower(), "I532"),
-    ("Sermide".lower(), "I632"),
-    ("Serravalle a Po".lower(), "I662"),
-    ("Solferino".lower(), "I801"),
-    ("Sustinente".lower(), "L015"),
-    ("Suzzara".lower(), "L020"),
-    ("Viadana".lower(), "L826"),
-    ("Villa Poma".lower(), "F804"),
-    ("Villimpenta".lower(), "M044"),
-    ("Volta Mantovana".lower(), "M125"),
-    ("Borgo Virgilio".lower(), "M340"),
-    ("Abbadia Lariana".lower(), "A005"),
-    ("Airuno".lower(), "A112"),
-    ("Annone di Brianza".lower(), "A301"),
-    ("Ballabio".lower(), "A594"),
-    ("Barzago".lower(), "A683"),
-    ("Barzanò".lower(), "A686"),
-    ("Barzio".lower(), "A687"),
-    ("Bellano".lower(), "A745"),
-    ("Bosisio Parini".lower(), "B081"),
-    ("Brivio".lower(), "B194"),
-    ("Bulciago".lower(), "B261"),
-    ("Calco".lower(), "B396"),
-    ("Calolziocorte".lower(), "B423"),
-    ("Carenno".lower(), "B763"),
-    ("Casargo".lower(), "B937"),
-    ("Casatenovo".lower(), "B943"),
-    ("Cassago Brianza".lower(), "B996"),
-    ("Cassina Valsassina".lower(), "C024"),
-    ("Castello di Brianza".lower(), "C187"),
-    ("Cernusco Lombardone".lower(), "C521"),
-    ("Cesana Brianza".lower(), "C563"),
-    ("Civate".lower(), "C752"),
-    ("Colico".lower(), "C839"),
-    ("Colle Brianza".lower(), "C851"),
-    ("Cortenova".lower(), "D065"),
-    ("Costa Masnaga".lower(), "D112"),
-    ("Crandola Valsassina".lower(), "D131"),
-    ("Cremella".lower(), "D143"),
-    ("Cremeno".lower(), "D145"),
-    ("Dervio".lower(), "D280"),
-    ("Dolzago".lower(), "D327"),
-    ("Dorio".lower(), "D346"),
-    ("Ello".lower(), "D398"),
-    ("Erve".lower(), "D428"),
-    ("Esino Lario".lower(), "D436"),
-    ("Galbiate".lower(), "D865"),
-    ("Garbagnate Monastero".lower(), "D913"),
-    ("Garlate".lower(), "D926"),
-    ("Imbersago".lower(), "E287"),
-    ("Introbio".lower(), "E305"),
-    ("Introzzo".lower(), "E308"),
-    ("Lecco".lower(), "E507"),
-    ("Lierna".lower(), "E581"),
-    ("Lomagna".lower(), "E656"),
-    ("Malgrate".lower(), "E858"),
-    ("Mandello del Lario".lower(), "E879"),
-    ("Margno".lower(), "E947"),
-    ("Merate".lower(), "F133"),
-    ("Missaglia".lower(), "F248"),
-    ("Moggio".lower(), "F265"),
-    ("Molteno".lower(), "F304"),
-    ("Monte Marenzo".lower(), "F561"),
-    ("Montevecchia".lower(), "F657"),
-    ("Monticello Brianza".lower(), "F674"),
-    ("Morterone".lower(), "F758"),
-    ("Nibionno".lower(), "F887"),
-    ("Oggiono".lower(), "G009"),
-    ("Olgiate Molgora".lower(), "G026"),
-    ("Olginate".lower(), "G030"),
-    ("Oliveto Lario".lower(), "G040"),
-    ("Osnago".lower(), "G161"),
-    ("Paderno d'Adda".lower(), "G218"),
-    ("Pagnona".lower(), "G241"),
-    ("Parlasco".lower(), "G336"),
-    ("Pasturo".lower(), "G368"),
-    ("Perledo".lower(), "G456"),
-    ("Pescate".lower(), "G485"),
-    ("Premana".lower(), "H028"),
-    ("Primaluna".lower(), "H063"),
-    ("Robbiate".lower(), "G223"),
-    ("Rogeno".lower(), "H486"),
-    ("Santa Maria Hoè".lower(), "I243"),
-    ("Sirone".lower(), "I759"),
-    ("Sirtori".lower(), "I761"),
-    ("Sueglio".lower(), "I994"),
-    ("Suello".lower(), "I996"),
-    ("Taceno".lower(), "L022"),
-    ("Torre de' Busi".lower(), "L257"),
-    ("Tremenico".lower(), "L368"),
-    ("Valgreghentino".lower(), "L581"),
-    ("Valmadrera".lower(), "L634"),
-    ("Varenna".lower(), "L680"),
-    ("Vendrogno".lower(), "L731"),
-    ("Vercurago".lower(), "L751"),
-    ("Vestreno".lower(), "L813"),
-    ("Viganò".lower(), "L866"),
-    ("Verderio".lower(), "M337"),
-    ("La Valletta Brianza".lower(), "M348"),
-    ("Abbadia Cerreto".lower(), "A004"),
-    ("Bertonico".lower(), "A811"),
-    ("Boffalora d'Adda".lower(), "A919"),
-    ("Borghetto Lodigiano".lower(), "A995"),
-    ("Borgo San Giovanni".lower(), "B017"),
-    ("Brembio".lower(), "B141"),
-    ("Camairago".lower(), "B456"),
-    ("Casaletto Lodigiano".lower(), "B887"),
-    ("Casalmaiocco".lower(), "B899"),
-    ("Casalpusterlengo".lower(), "B910"),
-    ("Caselle Landi".lower(), "B961"),
-    ("Caselle Lurani".lower(), "B958"),
-    ("Castelnuovo Bocca d'Adda".lower(), "C228"),
-    ("Castiglione d'Adda".lower(), "C304"),
-    ("Castiraga Vidardo".lower(), "C329"),
-    ("Cavacurta".lower(), "C362"),
-    ("Cavenago d'Adda".lower(), "C394"),
-    ("Cervignano d'Adda".lower(), "C555"),
-    ("Codogno".lower(), "C816"),
-    ("Comazzo".lower(), "C917"),
-    ("Cornegliano Laudense".lower(), "D021"),
-    ("Corno Giovine".lower(), "D028"),
-    ("Cornovecchio".lower(), "D029"),
-    ("Corte Palasio".lower(), "D068"),
-    ("Crespiatica".lower(), "D159"),
-    ("Fombio".lower(), "D660"),
-    ("Galgagnano".lower(), "D868"),
-    ("Graffignana".lower(), "E127"),
-    ("Guardamiglio".lower(), "E238"),
-    ("Livraga".lower(), "E627"),
-    ("Lodi".lower(), "E648"),
-    ("Lodi Vecchio".lower(), "E651"),
-    ("Maccastorna".lower(), "E777"),
-    ("Mairago".lower(), "E840"),
-    ("Maleo".lower(), "E852"),
-    ("Marudo".lower(), "E994"),
-    ("Massalengo".lower(), "F028"),
-    ("Meleti".lower(), "F102"),
-    ("Merlino".lower(), "F149"),
-    ("Montanaso Lombardo".lower(), "F423"),
-    ("Mulazzano".lower(), "F801"),
-    ("Orio Litta".lower(), "G107"),
-    ("Ospedaletto Lodigiano".lower(), "G166"),
-    ("Ossago Lodigiano".lower(), "G171"),
-    ("Pieve Fissiraga".lower(), "G096"),
-    ("Salerano sul Lambro".lower(), "H701"),
-    ("San Fiorano".lower(), "H844"),
-    ("San Martino in Strada".lower(), "I012"),
-    ("San Rocco al Porto".lower(), "I140"),
-    ("Sant'Angelo Lodigiano".lower(), "I274"),
-    ("Santo Stefano Lodigiano".lower(), "I362"),
-    ("Secugnago".lower(), "I561"),
-    ("Senna Lodigiana".lower(), "I612"),
-    ("Somaglia".lower(), "I815"),
-    ("Sordio".lower(), "I848"),
-    ("Tavazzano con Villavesco".lower(), "F260"),
-    ("Terranova dei Passerini".lower(), "L125"),
-    ("Turano Lodigiano".lower(), "L469"),
-    ("Valera Fratta".lower(), "L572"),
-    ("Villanova del Sillaro".lower(), "L977"),
-    ("Zelo Buon Persico".lower(), "M158"),
-    ("Agrate Brianza".lower(), "A087"),
-    ("Aicurzio".lower(), "A096"),
-    ("Albiate".lower(), "A159"),
-    ("Arcore".lower(), "A376"),
-    ("Barlassina".lower(), "A668"),
-    ("Bellusco".lower(), "A759"),
-    ("Bernareggio".lower(), "A802"),
-    ("Besana in Brianza".lower(), "A818"),
-    ("Biassono".lower(), "A849"),
-    ("Bovisio-Masciago".lower(), "B105"),
-    ("Briosco".lower(), "B187"),
-    ("Brugherio".lower(), "B212"),
-    ("Burago di Molgora".lower(), "B272"),
-    ("Camparada".lower(), "B501"),
-    ("Carate Brianza".lower(), "B729"),
-    ("Carnate".lower(), "B798"),
-    ("Cavenago di Brianza".lower(), "C395"),
-    ("Ceriano Laghetto".lower(), "C512"),
-    ("Cesano Maderno".lower(), "C566"),
-    ("Cogliate".lower(), "C820"),
-    ("Concorezzo".lower(), "C952"),
-    ("Correzzana".lower(), "D038"),
-    ("Desio".lower(), "D286"),
-    ("Giussano".lower(), "E063"),
-    ("Lazzate".lower(), "E504"),
-    ("Lesmo".lower(), "E550"),
-    ("Limbiate".lower(), "E591"),
-    ("Lissone".lower(), "E617"),
-    ("Macherio".lower(), "E786"),
-    ("Meda".lower(), "F078"),
-    ("Mezzago".lower(), "F165"),
-    ("Misinto".lower(), "F247"),
-    ("Monza".lower(), "F704"),
-    ("Muggiò".lower(), "F797"),
-    ("Nova Milanese".lower(), "F944"),
-    ("Ornago".lower(), "G116"),
-    ("Renate".lower(), "H233"),
-    ("Ronco Briantino".lower(), "H537"),
-    ("Seregno".lower(), "I625"),
-    ("Seveso".lower(), "I709"),
-    ("Sovico".lower(), "I878"),
-    ("Sulbiate".lower(), "I998"),
-    ("Triuggio".lower(), "L434"),
-    ("Usmate Velate".lower(), "L511"),
-    ("Varedo".lower(), "L677"),
-    ("Vedano al Lambro".lower(), "L704"),
-    ("Veduggio con Colzano".lower(), "L709"),
-    ("Verano Brianza".lower(), "L744"),
-    ("Villasanta".lower(), "M017"),
-    ("Vimercate".lower(), "M052"),
-    ("Busnago".lower(), "B289"),
-    ("Caponago".lower(), "B671"),
-    ("Cornate d'Adda".lower(), "D019"),
-    ("Lentate sul Seveso".lower(), "E530"),
-    ("Roncello".lower(), "H529"),
-    ("Aldino".lower(), "A179"),
-    ("Andriano".lower(), "A286"),
-    ("Anterivo".lower(), "A306"),
-    ("Appiano sulla strada del vino".lower(), "A332"),
-    ("Avelengo".lower(), "A507"),
-    ("Badia".lower(), "A537"),
-    ("Barbiano".lower(), "A635"),
-    ("Bolzano".lower(), "A952"),
-    ("Braies".lower(), "B116"),
-    ("Brennero".lower(), "B145"),
-    ("Bressanone".lower(), "B160"),
-    ("Bronzolo".lower(), "B203"),
-    ("Brunico".lower(), "B220"),
-    ("Caines".lower(), "B364"),
-    ("Caldaro sulla strada del vino".lower(), "B397"),
-    ("Campo di Trens".lower(), "B529"),
-    ("Campo Tures".lower(), "B570"),
-    ("Castelbello-Ciardes".lower(), "C062"),
-    ("Castelrotto".lower(), "C254"),
-    ("Cermes".lower(), "A022"),
-    ("Chienes".lower(), "C625"),
-    ("Chiusa".lower(), "C652"),
-    ("Cornedo all'Isarco".lower(), "B799"),
-    ("Cortaccia sulla strada del vino".lower(), "D048"),
-    ("Cortina sulla strada del vino".lower(), "D075"),
-    ("Corvara in Badia".lower(), "D079"),
-    ("Curon Venosta".lower(), "D222"),
-    ("Dobbiaco".lower(), "D311"),
-    ("Egna".lower(), "D392"),
-    ("Falzes".lower(), "D484"),
-    ("Fiè allo Sciliar".lower(), "D571"),
-    ("Fortezza".lower(), "D731"),
-    ("Funes".lower(), "D821"),
-    ("Gais".lower(), "D860"),
-    ("Gargazzone".lower(), "D923"),
-    ("Glorenza".lower(), "E069"),
-    ("Laces".lower(), "E398"),
-    ("Lagundo".lower(), "E412"),
-    ("Laion".lower(), "E420"),
-    ("Laives".lower(), "E421"),
-    ("Lana".lower(), "E434"),
-    ("Lasa".lower(), "E457"),
-    ("Lauregno".lower(), "E481"),
-    ("Luson".lower(), "E764"),
-    ("Magrè sulla strada del vino".lower(), "E829"),
-    ("Malles Venosta".lower(), "E862"),
-    ("Marebbe".lower(), "E938"),
-    ("Marlengo".lower(), "E959"),
-    ("Martello".lower(), "E981"),
-    ("Meltina".lower(), "F118"),
-    ("Merano".lower(), "F132"),
-    ("Monguelfo-Tesido".lower(), "F371"),
-    ("Montagna".lower(), "F392"),
-    ("Moso in Passiria".lower(), "F766"),
-    ("Nalles".lower(), "F836"),
-    ("Naturno".lower(), "F849"),
-    ("Naz-Sciaves".lower(), "F856"),
-    ("Nova Levante".lower(), "F949"),
-    ("Nova Ponente".lower(), "F950"),
-    ("Ora".lower(), "G083"),
-    ("Ortisei".lower(), "G140"),
-    ("Parcines".lower(), "G328"),
-    ("Perca".lower(), "G443"),
-    ("Plaus".lower(), "G299"),
-    ("Ponte Gardena".lower(), "G830"),
-    ("Postal".lower(), "G936"),
-    ("Prato allo Stelvio".lower(), "H004"),
-    ("Predoi".lower(), "H019"),
-    ("Proves".lower(), "H081"),
-    ("Racines".lower(), "H152"),
-    ("Rasun-Anterselva".lower(), "H189"),
-    ("Renon".lower(), "H236"),
-    ("Rifiano".lower(), "H284"),
-    ("Rio di Pusteria".lower(), "H299"),
-    ("Rodengo".lower(), "H475"),
-    ("Salorno".lower(), "H719"),
-    ("San Candido".lower(), "H786"),
-    ("San Genesio Atesino".lower(), "H858"),
-    ("San Leonardo in Passiria".lower(), "H952"),
-    ("San Lorenzo di Sebato".lower(), "H956"),
-    ("San Martino in Badia".lower(), "H988"),
-    ("San Martino in Passiria".lower(), "H989"),
-    ("San Pancrazio".lower(), "I065"),
-    ("Santa Cristina Valgardena".lower(), "I173"),
-    ("Sarentino".lower(), "I431"),
-    ("Scena".lower(), "I519"),
-    ("Selva dei Molini".lower(), "I593"),
-    ("Selva di Val Gardena".lower(), "I591"),
-    ("Senales".lower(), "I604"),
-    ("Sesto".lower(), "I687"),
-    ("Silandro".lower(), "I729"),
-    ("Sluderno".lower(), "I771"),
-    ("Stelvio".lower(), "I948"),
-    ("Terento".lower(), "L106"),
-    ("Terlano".lower(), "L108"),
-    ("Termeno sulla strada del vino".lower(), "L111"),
-    ("Tesimo".lower(), "L149"),
-    ("Tires".lower(), "L176"),
-    ("Tirolo".lower(), "L178"),
-    ("Trodena nel parco naturale".lower(), "L444"),
-    ("Tubre".lower(), "L455"),
-    ("Ultimo".lower(), "L490"),
-    ("Vadena".lower(), "L527"),
-    ("Valdaora".lower(), "L552"),
-    ("Val di Vizze".lower(), "L564"),
-    ("Valle Aurina".lower(), "L595"),
-    ("Valle di Casies".lower(), "L601"),
-    ("Vandoies".lower(), "L660"),
-    ("Varna".lower(), "L687"),
-    ("Verano".lower(), "L745"),
-    ("Villabassa".lower(), "L915"),
-    ("Villandro".lower(), "L971"),
-    ("Vipiteno".lower(), "M067"),
-    ("Velturno".lower(), "L724"),
-    ("La Valle".lower(), "E491"),
-    ("Senale-San Felice".lower(), "I603"),
-    ("Ala".lower(), "A116"),
-    ("Albiano".lower(), "A158"),
-    ("Aldeno".lower(), "A178"),
-    ("Andalo".lower(), "A274"),
-    ("Arco".lower(), "A372"),
-    ("Avio".lower(), "A520"),
-    ("Baselga di Pinè".lower(), "A694"),
-    ("Bedollo".lower(), "A730"),
-    ("Besenello".lower(), "A821"),
-    ("Bieno".lower(), "A863"),
-    ("Bleggio Superiore".lower(), "A902"),
-    ("Bocenago".lower(), "A916"),
-    ("Bondone".lower(), "A968"),
-    ("Borgo Valsugana".lower(), "B006"),
-    ("Brentonico".lower(), "B153"),
-    ("Bresimo".lower(), "B158"),
-    ("Brez".lower(), "B165"),
-    ("Caderzone Terme".lower(), "B335"),
-    ("Cagnò".lower(), "B360"),
-    ("Calceranica al Lago".lower(), "B389"),
-    ("Caldes".lower(), "B400"),
-    ("Caldonazzo".lower(), "B404"),
-    ("Calliano".lower(), "B419"),
-    ("Campitello di Fassa".lower(), "B514"),
-    ("Campodenno".lower(), "B525"),
-    ("Canal San Bovo".lower(), "B577"),
-    ("Canazei".lower(), "B579"),
-    ("Capriana".lower(), "B697"),
-    ("Carano".lower(), "B723"),
-    ("Carisolo".lower(), "B783"),
-    ("Carzano".lower(), "B856"),
-    ("Castel Condino".lower(), "C183"),
-    ("Castelfondo".lower(), "C103"),
-    ("Castello-Molina di Fiemme".lower(), "C189"),
-    ("Castello Tesino".lower(), "C194"),
-    ("Castelnuovo".lower(), "C216"),
-    ("Cavalese".lower(), "C372"),
-    ("Cavareno".lower(), "C380"),
-    ("Cavedago".lower(), "C392"),
-    ("Cavedine".lower(), "C393"),
-    ("Cavizzana".lower(), "C400"),
-    ("Cimone".lower(), "C700"),
-    ("Cinte Tesino".lower(), "C712"),
-    ("Cis".lower(), "C727"),
-    ("Civezzano".lower(), "C756"),
-    ("Cles".lower(), "C794"),
-    ("Cloz".lower(), "C797"),
-    ("Commezzadura".lower(), "C931"),
-    ("Croviana".lower(), "D188"),
-    ("Daiano".lower(), "D243"),
-    ("Dambel".lower(), "D246"),
-    ("Denno".lower(), "D273"),
-    ("Drena".lower(), "D365"),
-    ("Dro".lower(), "D371"),
-    ("Faedo".lower(), "D457"),
-    ("Fai della Paganella".lower(), "D468"),
-    ("Fiavè".lower(), "D565"),
-    ("Fierozzo".lower(), "D573"),
-    ("Folgaria".lower(), "D651"),
-    ("Fondo".lower(), "D663"),
-    ("Fornace".lower(), "D714"),
-    ("Frassilongo".lower(), "D775"),
-    ("Garniga Terme".lower(), "D928"),
-    ("Giovo".lower(), "E048"),
-    ("Giustino".lower(), "E065"),
-    ("Grigno".lower(), "E178"),
-    ("Imer".lower(), "E288"),
-    ("Isera".lower(), "E334"),
-    ("Lavarone".lower(), "E492"),
-    ("Lavis".lower(), "E500"),
-    ("Levico Terme".lower(), "E565"),
-    ("Livo".lower(), "E624"),
-    ("Lona-Lases".lower(), "E664"),
-    ("Luserna".lower(), "E757"),
-    ("Malè".lower(), "E850"),
-    ("Malosco".lower(), "E866"),
-    ("Massimeno".lower(), "F045"),
-    ("Mazzin".lower(), "F068"),
-    ("Mezzana".lower(), "F168"),
-    ("Mezzano".lower(), "F176"),
-    ("Mezzocorona".lower(), "F183"),
-    ("Mezzolombardo".lower(), "F187"),
-    ("Moena".lower(), "F263"),
-    ("Molveno".lower(), "F307"),
-    ("Mori".lower(), "F728"),
-    ("Nago-Torbole".lower(), "F835"),
-    ("Nave San Rocco".lower(), "F853"),
-    ("Nogaredo".lower(), "F920"),
-    ("Nomi".lower(), "F929"),
-    ("Novaledo".lower(), "F947"),
-    ("Ospedaletto".lower(), "G168"),
-    ("Ossana".lower(), "G173"),
-    ("Palù del Fersina".lower(), "G296"),
-    ("Panchià".lower(), "G305"),
-    ("Ronzo-Chienis".lower(), "M303"),
-    ("Peio".lower(), "G419"),
-    ("Pellizzano".lower(), "G428"),
-    ("Pelugo".lower(), "G429"),
-    ("Pergine Valsugana".lower(), "G452"),
-    ("Pieve Tesino".lower(), "G656"),
-    ("Pinzolo".lower(), "G681"),
-    ("Pomarolo".lower(), "G808"),
-    ("Pozza di Fassa".lower(), "G950"),
-    ("Predazzo".lower(), "H018"),
-    ("Rabbi".lower(), "H146"),
-    ("Revò".lower(), "H254"),
-    ("Riva del Garda".lower(), "H330"),
-    ("Romallo".lower(), "H506"),
-    ("Romeno".lower(), "H517"),
-    ("Roncegno Terme".lower(), "H528"),
-    ("Ronchi Valsugana".lower(), "H532"),
-    ("Ronzone".lower(), "H552"),
-    ("Roverè della Luna".lower(), "H607"),
-    ("Rovereto".lower(), "H612"),
-    ("Ruffrè-Mendola".lower(), "H634"),
-    ("Rumo".lower(), "H639"),
-    ("Sagron Mis".lower(), "H666"),
-    ("Samone".lower(), "H754"),
-    ("San Michele all'Adige".lower(), "I042"),
-    ("Sant'Orsola Terme".lower(), "I354"),
-    ("Sanzeno".lower(), "I411"),
-    ("Sarnonico".lower(), "I439"),
-    ("Scurelle".lower(), "I554"),
-    ("Segonzano".lower(), "I576"),
-    ("Sfruz".lower(), "I714"),
-    ("Soraga".lower(), "I839"),
-    ("Sover".lower(), "I871"),
-    ("Spiazzo".lower(), "I899"),
-    ("Spormaggiore".lower(), "I924"),
-    ("Sporminore".lower(), "I925"),
-    ("Stenico".lower(), "I949"),
-    ("Storo".lower(), "I964"),
-    ("Strembo".lower(), "I975"),
-    ("Telve".lower(), "L089"),
-    ("Telve di Sopra".lower(), "L090"),
-    ("Tenna".lower(), "L096"),
-    ("Tenno".lower(), "L097"),
-    ("Terragnolo".lower(), "L121"),
-    ("Terzolas".lower(), "L145"),
-    ("Tesero".lower(), "L147"),
-    ("Tione di Trento".lower(), "L174"),
-    ("Ton".lower(), "L200"),
-    ("Torcegno".lower(), "L211"),
-    ("Trambileno".lower(), "L322"),
-    ("Trento".lower(), "L378"),
-    ("Valfloriana".lower(), "L575"),
-    ("Vallarsa".lower(), "L588"),
-    ("Varena".lower(), "L678"),
-    ("Vermiglio".lower(), "L769"),
-    ("Vignola-Falesina".lower(), "L886"),
-    ("Vigo di Fassa".lower(), "L893"),
-    ("Villa Lagarina".lower(), "L957"),
-    ("Volano".lower(), "M113"),
-    ("Zambana".lower(), "M142"),
-    ("Ziano di Fiemme".lower(), "M173"),
-    ("Comano Terme".lower(), "M314"),
-    ("Ledro".lower(), "M313"),
-    ("Predaia".lower(), "M344"),
-    ("San Lorenzo Dorsino".lower(), "M345"),
-    ("Valdaone".lower(), "M343"),
-    ("Dimaro Folgarida".lower(), "M366"),
-    ("Pieve di Bono-Prezzo".lower(), "M365"),
-    ("Altavalle".lower(), "M349"),
-    ("Altopiano della Vigolana".lower(), "M350"),
-    ("Amblar-Don".lower(), "M351"),
-    ("Borgo Chiese".lower(), "M352"),
-    ("Borgo Lares".lower(), "M353"),
-    ("Castel Ivano".lower(), "M354"),
-    ("Cembra Lisignago".lower(), "M355"),
-    ("Contà".lower(), "M356"),
-    ("Madruzzo".lower(), "M357"),
-    ("Porte di Rendena".lower(), "M358"),
-    ("Primiero San Martino di Castrozza".lower(), "M359"),
-    ("Sella Giudicarie".lower(), "M360"),
-    ("Tre Ville".lower(), "M361"),
-    ("Vallelaghi".lower(), "M362"),
-    ("Ville d'Anaunia".lower(), "M363"),
-    ("Affi".lower(), "A061"),
-    ("Albaredo d'Adige".lower(), "A137"),
-    ("Angiari".lower(), "A292"),
-    ("Arcole".lower(), "A374"),
-    ("Badia Calavena".lower(), "A540"),
-    ("Bardolino".lower(), "A650"),
-    ("Belfiore".lower(), "A737"),
-    ("Bevilacqua".lower(), "A837"),
-    ("Bonavigo".lower(), "A964"),
-    ("Boschi Sant'Anna".lower(), "B070"),
-    ("Bosco Chiesanuova".lower(), "B073"),
-    ("Bovolone".lower(), "B107"),
-    ("Brentino Belluno".lower(), "B152"),
-    ("Brenzone sul Garda".lower(), "B154"),
-    ("Bussolengo".lower(), "B296"),
-    ("Buttapietra".lower(), "B304"),
-    ("Caldiero".lower(), "B402"),
-    ("Caprino Veronese".lower(), "B709"),
-    ("Casaleone".lower(), "B886"),
-    ("Castagnaro".lower(), "C041"),
-    ("Castel d'Azzano".lower(), "C078"),
-    ("Castelnuovo del Garda".lower(), "C225"),
-    ("Cavaion Veronese".lower(), "C370"),
-    ("Cazzano di Tramigna".lower(), "C412"),
-    ("Cerea".lower(), "C498"),
-    ("Cerro Veronese".lower(), "C538"),
-    ("Cologna Veneta".lower(), "C890"),
-    ("Colognola ai Colli".lower(), "C897"),
-    ("Concamarise".lower(), "C943"),
-    ("Costermano sul Garda".lower(), "D118"),
-    ("Dolcè".lower(), "D317"),
-    ("Erbè".lower(), "D419"),
-    ("Erbezzo".lower(), "D420"),
-    ("Ferrara di Monte Baldo".lower(), "D549"),
-    ("Fumane".lower(), "D818"),
-    ("Garda".lower(), "D915"),
-    ("Gazzo Veronese".lower(), "D957"),
-    ("Grezzana".lower(), "E171"),
-    ("Illasi".lower(), "E284"),
-    ("Isola della Scala".lower(), "E349"),
-    ("Isola Rizza".lower(), "E358"),
-    ("Lavagno".lower(), "E489"),
-    ("Lazise".lower(), "E502"),
-    ("Legnago".lower(), "E512"),
-    ("Malcesine".lower(), "E848"),
-    ("Marano di Valpolicella".lower(), "E911"),
-    ("Mezzane di Sotto".lower(), "F172"),
-    ("Minerbe".lower(), "F218"),
-    ("Montecchia di Crosara".lower(), "F461"),
-    ("Monteforte d'Alpone".lower(), "F508"),
-    ("Mozzecane".lower(), "F789"),
-    ("Negrar".lower(), "F861"),
-    ("Nogara".lower(), "F918"),
-    ("Nogarole Rocca".lower(), "F921"),
-    ("Oppeano".lower(), "G080"),
-    ("Palù".lower(), "G297"),
-    ("Pastrengo".lower(), "G365"),
-    ("Pescantina".lower(), "G481"),
-    ("Peschiera del Garda".lower(), "G489"),
-    ("Povegliano Veronese".lower(), "G945"),
-    ("Pressana".lower(), "H048"),
-    ("Rivoli Veronese".lower(), "H356"),
-    ("Roncà".lower(), "H522"),
-    ("Ronco all'Adige".lower(), "H540"),
-    ("Roverchiara".lower(), "H606"),
-    ("Roveredo di Guà".lower(), "H610"),
-    ("Roverè Veronese".lower(), "H608"),
-    ("Salizzole".lower(), "H714"),
-    ("San Bonifacio".lower(), "H783"),
-    ("San Giovanni Ilarione".lower(), "H916"),
-    ("San Giovanni Lupatoto".lower(), "H924"),
-    ("Sanguinetto".lower(), "H944"),
-    ("San Martino Buon Albergo".lower(), "I003"),
-    ("San Mauro di Saline".lower(), "H712"),
-    ("San Pietro di Morubio".lower(), "I105"),
-    ("San Pietro in Cariano".lower(), "I109"),
-    ("Sant'Ambrogio di Valpolicella".lower(), "I259"),
-    ("Sant'Anna d'Alfaedo".lower(), "I292"),
-    ("San Zeno di Montagna".lower(), "I414"),
-    ("Selva di Progno".lower(), "I594"),
-    ("Soave".lower(), "I775"),
-    ("Sommacampagna".lower(), "I821"),
-    ("Sona".lower(), "I826"),
-    ("Sorgà".lower(), "I850"),
-    ("Terrazzo".lower(), "L136"),
-    ("Torri del Benaco".lower(), "L287"),
-    ("Tregnago".lower(), "L364"),
-    ("Trevenzuolo".lower(), "L396"),
-    ("Valeggio sul Mincio".lower(), "L567"),
-    ("Velo Veronese".lower(), "L722"),
-    ("Verona".lower(), "L781"),
-    ("Veronella".lower(), "D193"),
-    ("Vestenanova".lower(), "L810"),
-    ("Vigasio".lower(), "L869"),
-    ("Villa Bartolomea".lower(), "L912"),
-    ("Villafranca di Verona".lower(), "L949"),
-    ("Zevio".lower(), "M172"),
-    ("Zimella".lower(), "M178"),
-    ("Agugliaro".lower(), "A093"),
-    ("Albettone".lower(), "A154"),
-    ("Alonte".lower(), "A220"),
-    ("Altavilla Vicentina".lower(), "A231"),
-    ("Altissimo".lower(), "A236"),
-    ("Arcugnano".lower(), "A377"),
-    ("Arsiero".lower(), "A444"),
-    ("Arzignano".lower(), "A459"),
-    ("Asiago".lower(), "A465"),
-    ("Asigliano Veneto".lower(), "A467"),
-    ("Barbarano Vicentino".lower(), "A627"),
-    ("Bassano del Grappa".lower(), "A703"),
-    ("Bolzano Vicentino".lower(), "A954"),
-    ("Breganze".lower(), "B132"),
-    ("Brendola".lower(), "B143"),
-    ("Bressanvido".lower(), "B161"),
-    ("Brogliano".lower(), "B196"),
-    ("Caldogno".lower(), "B403"),
-    ("Caltrano".lower(), "B433"),
-    ("Calvene".lower(), "B441"),
-    ("Camisano Vicentino".lower(), "B485"),
-    ("Campiglia dei Berici".lower(), "B511"),
-    ("Campolongo sul Brenta".lower(), "B547"),
-    ("Carrè".lower(), "B835"),
-    ("Cartigliano".lower(), "B844"),
-    ("Cassola".lower(), "C037"),
-    ("Castegnero".lower(), "C056"),
-    ("Castelgomberto".lower(), "C119"),
-    ("Chiampo".lower(), "C605"),
-    ("Chiuppano".lower(), "C650"),
-    ("Cismon del Grappa".lower(), "C734"),
-    ("Cogollo del Cengio".lower(), "C824"),
-    ("Conco".lower(), "C949"),
-    ("Cornedo Vicentino".lower(), "D020"),
-    ("Costabissara".lower(), "D107"),
-    ("Creazzo".lower(), "D136"),
-    ("Crespadoro".lower(), "D156"),
-    ("Dueville".lower(), "D379"),
-    ("Enego".lower(), "D407"),
-    ("Fara Vicentino".lower(), "D496"),
-    ("Foza".lower(), "D750"),
-    ("Gallio".lower(), "D882"),
-    ("Gambellara".lower(), "D897"),
-    ("Gambugliano".lower(), "D902"),
-    ("Grancona".lower(), "E138"),
-    ("Grisignano di Zocco".lower(), "E184"),
-    ("Grumolo delle Abbadesse".lower(), "E226"),
-    ("Isola Vicentina".lower(), "E354"),
-    ("Laghi".lower(), "E403"),
-    ("Lastebasse".lower(), "E465"),
-    ("Longare".lower(), "E671"),
-    ("Lonigo".lower(), "E682"),
-    ("Lugo di Vicenza".lower(), "E731"),
-    ("Lusiana".lower(), "E762"),
-    ("Malo".lower(), "E864"),
-    ("Marano Vicentino".lower(), "E912"),
-    ("Marostica".lower(), "E970"),
-    ("Mason Vicentino".lower(), "F019"),
-    ("Molvena".lower(), "F306"),
-    ("Montebello Vicentino".lower(), "F442"),
-    ("Montecchio Maggiore".lower(), "F464"),
-    ("Montecchio Precalcino".lower(), "F465"),
-    ("Monte di Malo".lower(), "F486"),
-    ("Montegalda".lower(), "F514"),
-    ("Montegaldella".lower(), "F515"),
-    ("Monteviale".lower(), "F662"),
-    ("Monticello Conte Otto".lower(), "F675"),
-    ("Montorso Vicentino".lower(), "F696"),
-    ("Mossano".lower(), "F768"),
-    ("Mussolente".lower(), "F829"),
-    ("Nanto".lower(), "F838"),
-    ("Nogarole Vicentino".lower(), "F922"),
-    ("Nove".lower(), "F957"),
-    ("Noventa Vicentina".lower(), "F964"),
-    ("Orgiano".lower(), "G095"),
-    ("Pedemonte".lower(), "G406"),
-    ("Pianezze".lower(), "G560"),
-    ("Piovene Rocchette".lower(), "G694"),
-    ("Pojana Maggiore".lower(), "G776"),
-    ("Posina".lower(), "G931"),
-    ("Pove del Grappa".lower(), "G943"),
-    ("Pozzoleone".lower(), "G957"),
-    ("Quinto Vicentino".lower(), "H134"),
-    ("Recoaro Terme".lower(), "H214"),
-    ("Roana".lower(), "H361"),
-    ("Romano d'Ezzelino".lower(), "H512"),
-    ("Rosà".lower(), "H556"),
-    ("Rossano Veneto".lower(), "H580"),
-    ("Rotzo".lower(), "H594"),
-    ("Salcedo".lower(), "F810"),
-    ("Sandrigo".lower(), "H829"),
-    ("San Germano dei Berici".lower(), "H863"),
-    ("San Nazario".lower(), "I047"),
-    ("San Pietro Mussolino".lower(), "I117"),
-    ("Santorso".lower(), "I353"),
-    ("San Vito di Leguzzano".lower(), "I401"),
-    ("Sarcedo".lower(), "I425"),
-    ("Sarego".lower(), "I430"),
-    ("Schiavon".lower(), "I527"),
-    ("Schio".lower(), "I531"),
-    ("Solagna".lower(), "I783"),
-    ("Sossano".lower(), "I867"),
-    ("Sovizzo".lower(), "I879"),
-    ("Tezze sul Brenta".lower(), "L156"),
-    ("Thiene".lower(), "L157"),
-    ("Tonezza del Cimone".lower(), "D717"),
-    ("Torrebelvicino".lower(), "L248"),
-    ("Torri di Quartesolo".lower(), "L297"),
-    ("Trissino".lower(), "L433"),
-    ("Valdagno".lower(), "L551"),
-    ("Valdastico".lower(), "L554"),
-    ("Valli del Pasubio".lower(), "L624"),
-    ("Valstagna".lower(), "L650"),
-    ("Velo d'Astico".lower(), "L723"),
-    ("Vicenza".lower(), "L840"),
-    ("Villaga".lower(), "L952"),
-    ("Villaverla".lower(), "M032"),
-    ("Zanè".lower(), "M145"),
-    ("Zermeghedo".lower(), "M170"),
-    ("Zovencedo".lower(), "M194"),
-    ("Zugliano".lower(), "M199"),
-    ("Agordo".lower(), "A083"),
-    ("Alano di Piave".lower(), "A121"),
-    ("Alleghe".lower(), "A206"),
-    ("Arsiè".lower(), "A443"),
-    ("Auronzo di Cadore".lower(), "A501"),
-    ("Belluno".lower(), "A757"),
-    ("Borca di Cadore".lower(), "A982"),
-    ("Calalzo di Cadore".lower(), "B375"),
-    ("Cencenighe Agordino".lower(), "C458"),
-    ("Cesiomaggiore".lower(), "C577"),
-    ("Chies d'Alpago".lower(), "C630"),
-    ("Cibiana di Cadore".lower(), "C672"),
-    ("Colle Santa Lucia".lower(), "C872"),
-    ("Comelico Superiore".lower(), "C920"),
-    ("Cortina d'Ampezzo".lower(), "A266"),
-    ("Danta di Cadore".lower(), "D247"),
-    ("Domegge di Cadore".lower(), "D330"),
-    ("Falcade".lower(), "D470"),
-    ("Feltre".lower(), "D530"),
-    ("Fonzaso".lower(), "D686"),
-    ("Canale d'Agordo".lower(), "B574"),
-    ("Gosaldo".lower(), "E113"),
-    ("Lamon".lower(), "E429"),
-    ("La Valle Agordina".lower(), "E490"),
-    ("Lentiai".lower(), "C562"),
-    ("Limana".lower(), "E588"),
-    ("Livinallongo del Col di Lana".lower(), "E622"),
-    ("Lorenzago di Cadore".lower(), "E687"),
-    ("Lozzo di Cadore".lower(), "E708"),
-    ("Mel".lower(), "F094"),
-    ("Ospitale di Cadore".lower(), "G169"),
-    ("Pedavena".lower(), "G404"),
-    ("Perarolo di Cadore".lower(), "G442"),
-    ("Pieve di Cadore".lower(), "G642"),
-    ("Ponte nelle Alpi".lower(), "B662"),
-    ("Rivamonte Agordino".lower(), "H327"),
-    ("Rocca Pietore".lower(), "H379"),
-    ("San Gregorio nelle Alpi".lower(), "H938"),
-    ("San Nicolò di Comelico".lower(), "I063"),
-    ("San Pietro di Cadore".lower(), "I088"),
-    ("Santa Giustina".lower(), "I206"),
-    ("San Tomaso Agordino".lower(), "I347"),
-    ("Santo Stefano di Cadore".lower(), "C919"),
-    ("San Vito di Cadore".lower(), "I392"),
-    ("Sappada".lower(), "I421"),
-    ("Sedico".lower(), "I563"),
-    ("Selva di Cadore".lower(), "I592"),
-    ("Seren del Grappa".lower(), "I626"),
-    ("Sospirolo".lower(), "I866"),
-    ("Soverzene".lower(), "I876"),
-    ("Sovramonte".lower(), "I673"),
-    ("Taibon Agordino".lower(), "L030"),
-    ("Tambre".lower(), "L040"),
-    ("Trichiana".lower(), "L422"),
-    ("Vallada Agordina".lower(), "L584"),
-    ("Valle di Cadore".lower(), "L590"),
-    ("Vigo di Cadore".lower(), "L890"),
-    ("Vodo Cadore".lower(), "M108"),
-    ("Voltago Agordino".lower(), "M124"),
-    ("Zoppè di Cadore".lower(), "M189"),
-    ("Quero Vas".lower(), "M332"),
-    ("Longarone".lower(), "M342"),
-    ("Alpago".lower(), "M375"),
-    ("Val di Zoldo".lower(), "M374"),
-    ("Altivole".lower(), "A237"),
-    ("Arcade".lower(), "A360"),
-    ("Asolo".lower(), "A471"),
-    ("Borso del Grappa".lower(), "B061"),
-    ("Breda di Piave".lower(), "B128"),
-    ("Caerano di San Marco".lower(), "B349"),
-    ("Cappella Maggiore".lower(), "B678"),
-    ("Carbonera".lower(), "B744"),
-    ("Casale sul Sile".lower(), "B879"),
-    ("Casier".lower(), "B965"),
-    ("Castelcucco".lower(), "C073"),
-    ("Castelfranco Veneto".lower(), "C111"),
-    ("Castello di Godego".lower(), "C190"),
-    ("Cavaso del Tomba".lower(), "C384"),
-    ("Cessalto".lower(), "C580"),
-    ("Chiarano".lower(), "C614"),
-    ("Cimadolmo".lower(), "C689"),
-    ("Cison di Valmarino".lower(), "C735"),
-    ("Codognè".lower(), "C815"),
-    ("Colle Umberto".lower(), "C848"),
-    ("Conegliano".lower(), "C957"),
-    ("Cordignano".lower(), "C992"),
-    ("Cornuda".lower(), "D030"),
-    ("Crespano del Grappa".lower(), "D157"),
-    ("Crocetta del Montello".lower(), "C670"),
-    ("Farra di Soligo".lower(), "D505"),
-    ("Follina".lower(), "D654"),
-    ("Fontanelle".lower(), "D674"),
-    ("Fonte".lower(), "D680"),
-    ("Fregona".lower(), "D794"),
-    ("Gaiarine".lower(), "D854"),
-    ("Giavera del Montello".lower(), "E021"),
-    ("Godega di Sant'Urbano".lower(), "E071"),
-    ("Gorgo al Monticano".lower(), "E092"),
-    ("Istrana".lower(), "E373"),
-    ("Loria".lower(), "E692"),
-    ("Mansuè".lower(), "E893"),
-    ("Mareno di Piave".lower(), "E940"),
-    ("Maser".lower(), "F009"),
-    ("Maserada sul Piave".lower(), "F012"),
-    ("Meduna di Livenza".lower(), "F088"),
-    ("Miane".lower(), "F190"),
-    ("Mogliano Veneto".lower(), "F269"),
-    ("Monastier di Treviso".lower(), "F332"),
-    ("Monfumo".lower(), "F360"),
-    ("Montebelluna".lower(), "F443"),
-    ("Morgano".lower(), "F725"),
-    ("Moriago della Battaglia".lower(), "F729"),
-    ("Motta di Livenza".lower(), "F770"),
-    ("Nervesa della Battaglia".lower(), "F872"),
-    ("Oderzo".lower(), "F999"),
-    ("Ormelle".lower(), "G115"),
-    ("Orsago".lower(), "G123"),
-    ("Paderno del Grappa".lower(), "G221"),
-    ("Paese".lower(), "G229"),
-    ("Pederobba".lower(), "G408"),
-    ("Pieve di Soligo".lower(), "G645"),
-    ("Ponte di Piave".lower(), "G846"),
-    ("Ponzano Veneto".lower(), "G875"),
-    ("Portobuffolè".lower(), "G909"),
-    ("Possagno".lower(), "G933"),
-    ("Povegliano".lower(), "G944"),
-    ("Preganziol".lower(), "H022"),
-    ("Quinto di Treviso".lower(), "H131"),
-    ("Refrontolo".lower(), "H220"),
-    ("Resana".lower(), "H238"),
-    ("Revine Lago".lower(), "H253"),
-    ("Riese Pio X".lower(), "H280"),
-    ("Roncade".lower(), "H523"),
-    ("Salgareda".lower(), "H706"),
-    ("San Biagio di Callalta".lower(), "H781"),
-    ("San Fior".lower(), "H843"),
-    ("San Pietro di Feletto".lower(), "I103"),
-    ("San Polo di Piave".lower(), "I124"),
-    ("Santa Lucia di Piave".lower(), "I221"),
-    ("San Vendemiano".lower(), "I382"),
-    ("San Zenone degli Ezzelini".lower(), "I417"),
-    ("Sarmede".lower(), "I435"),
-    ("Segusino".lower(), "I578"),
-    ("Sernaglia della Battaglia".lower(), "I635"),
-    ("Silea".lower(), "F116"),
-    ("Spresiano".lower(), "I927"),
-    ("Susegana".lower(), "L014"),
-    ("Tarzo".lower(), "L058"),
-    ("Trevignano".lower(), "L402"),
-    ("Treviso".lower(), "L407"),
-    ("Valdobbiadene".lower(), "L565"),
-    ("Vazzola".lower(), "L700"),
-    ("Vedelago".lower(), "L706"),
-    ("Vidor".lower(), "L856"),
-    ("Villorba".lower(), "M048"),
-    ("Vittorio Veneto".lower(), "M089"),
-    ("Volpago del Montello".lower(), "M118"),
-    ("Zenson di Piave".lower(), "M163"),
-    ("Zero Branco".lower(), "M171"),
-    ("Annone Veneto".lower(), "A302"),
-    ("Campagna Lupia".lower(), "B493"),
-    ("Campolongo Maggiore".lower(), "B546"),
-    ("Camponogara".lower(), "B554"),
-    ("Caorle".lower(), "B642"),
-    ("Cavarzere".lower(), "C383"),
-    ("Ceggia".lower(), "C422"),
-    ("Chioggia".lower(), "C638"),
-    ("Cinto Caomaggiore".lower(), "C714"),
-    ("Cona".lower(), "C938"),
-    ("Concordia Sagittaria".lower(), "C950"),
-    ("Dolo".lower(), "D325"),
-    ("Eraclea".lower(), "D415"),
-    ("Fiesso d'Artico".lower(), "D578"),
-    ("Fossalta di Piave".lower(), "D740"),
-    ("Fossalta di Portogruaro".lower(), "D741"),
-    ("Fossò".lower(), "D748"),
-    ("Gruaro".lower(), "E215"),
-    ("Jesolo".lower(), "C388"),
-    ("Marcon".lower(), "E936"),
-    ("Martellago".lower(), "E980"),
-    ("Meolo".lower(), "F130"),
-    ("Mira".lower(), "F229"),
-    ("Mirano".lower(), "F241"),
-    ("Musile di Piave".lower(), "F826"),
-    ("Noale".lower(), "F904"),
-    ("Noventa di Piave".lower(), "F963"),
-    ("Pianiga".lower(), "G565"),
-    ("Portogruaro".lower(), "G914"),
-    ("Pramaggiore".lower(), "G981"),
-    ("Quarto d'Altino".lower(), "H117"),
-    ("Salzano".lower(), "H735"),
-    ("San Donà di Piave".lower(), "H823"),
-    ("San Michele al Tagliamento".lower(), "I040"),
-    ("Santa Maria di Sala".lower(), "I242"),
-    ("San Stino di Livenza".lower(), "I373"),
-    ("Scorzè".lower(), "I551"),
-    ("Spinea".lower(), "I908"),
-    ("Stra".lower(), "I965"),
-    ("Teglio Veneto".lower(), "L085"),
-    ("Torre di Mosto".lower(), "L267"),
-    ("Venezia".lower(), "L736"),
-    ("Vigonovo".lower(), "L899"),
-    ("Cavallino-Treporti".lower(), "M308"),
-    ("Abano Terme".lower(), "A001"),
-    ("Agna".lower(), "A075"),
-    ("Albignasego".lower(), "A161"),
-    ("Anguillara Veneta".lower(), "A296"),
-    ("Arquà Petrarca".lower(), "A434"),
-    ("Arre".lower(), "A438"),
-    ("Arzergrande".lower(), "A458"),
-    ("Bagnoli di Sopra".lower(), "A568"),
-    ("Baone".lower(), "A613"),
-    ("Barbona".lower(), "A637"),
-    ("Battaglia Terme".lower(), "A714"),
-    ("Boara Pisani".lower(), "A906"),
-    ("Borgoricco".lower(), "B031"),
-    ("Bovolenta".lower(), "B106"),
-    ("Brugine".lower(), "B213"),
-    ("Cadoneghe".lower(), "B345"),
-    ("Campodarsego".lower(), "B524"),
-    ("Campodoro".lower(), "B531"),
-    ("Camposampiero".lower(), "B563"),
-    ("Campo San Martino".lower(), "B564"),
-    ("Candiana".lower(), "B589"),
-    ("Carceri".lower(), "B749"),
-    ("Carmignano di Brenta".lower(), "B795"),
-    ("Cartura".lower(), "B848"),
-    ("Casale di Scodosia".lower(), "B877"),
-    ("Casalserugo".lower(), "B912"),
-    ("Castelbaldo".lower(), "C057"),
-    ("Cervarese Santa Croce".lower(), "C544"),
-    ("Cinto Euganeo".lower(), "C713"),
-    ("Cittadella".lower(), "C743"),
-    ("Codevigo".lower(), "C812"),
-    ("Conselve".lower(), "C964"),
-    ("Correzzola".lower(), "D040"),
-    ("Curtarolo".lower(), "D226"),
-    ("Este".lower(), "D442"),
-    ("Fontaniva".lower(), "D679"),
-    ("Galliera Veneta".lower(), "D879"),
-    ("Galzignano Terme".lower(), "D889"),
-    ("Gazzo".lower(), "D956"),
-    ("Grantorto".lower(), "E145"),
-    ("Granze".lower(), "E146"),
-    ("Legnaro".lower(), "E515"),
-    ("Limena".lower(), "E592"),
-    ("Loreggia".lower(), "E684"),
-    ("Lozzo Atestino".lower(), "E709"),
-    ("Maserà di Padova".lower(), "F011"),
-    ("Masi".lower(), "F013"),
-    ("Massanzago".lower(), "F033"),
-    ("Megliadino San Fidenzio".lower(), "F091"),
-    ("Megliadino San Vitale".lower(), "F092"),
-    ("Merlara".lower(), "F148"),
-    ("Mestrino".lower(), "F161"),
-    ("Monselice".lower(), "F382"),
-    ("Montagnana".lower(), "F394"),
-    ("Montegrotto Terme".lower(), "F529"),
-    ("Noventa Padovana".lower(), "F962"),
-    ("Ospedaletto Euganeo".lower(), "G167"),
-    ("Padova".lower(), "G224"),
-    ("Pernumia".lower(), "G461"),
-    ("Piacenza d'Adige".lower(), "G534"),
-    ("Piazzola sul Brenta".lower(), "G587"),
-    ("Piombino Dese".lower(), "G688"),
-    ("Piove di Sacco".lower(), "G693"),
-    ("Polverara".lower(), "G802"),
-    ("Ponso".lower(), "G823"),
-    ("Pontelongo".lower(), "G850"),
-    ("Ponte San Nicolò".lower(), "G855"),
-    ("Pozzonovo".lower(), "G963"),
-    ("Rovolon".lower(), "H622"),
-    ("Rubano".lower(), "H625"),
-    ("Saccolongo".lower(), "H655"),
-    ("Saletto".lower(), "H705"),
-    ("San Giorgio delle Pertiche".lower(), "H893"),
-    ("San Giorgio in Bosco".lower(), "H897"),
-    ("San Martino di Lupari".lower(), "I008"),
-    ("San Pietro in Gu".lower(), "I107"),
-    ("San Pietro Viminario".lower(), "I120"),
-    ("Santa Giustina in Colle".lower(), "I207"),
-    ("Santa Margherita d'Adige".lower(), "I226"),
-    ("Sant'Angelo di Piove di Sacco".lower(), "I275"),
-    ("Sant'Elena".lower(), "I319"),
-    ("Sant'Urbano".lower(), "I375"),
-    ("Saonara".lower(), "I418"),
-    ("Selvazzano Dentro".lower(), "I595"),
-    ("Solesino".lower(), "I799"),
-    ("Stanghella".lower(), "I938"),
-    ("Teolo".lower(), "L100"),
-    ("Terrassa Padovana".lower(), "L132"),
-    ("Tombolo".lower(), "L199"),
-    ("Torreglia".lower(), "L270"),
-    ("Trebaseleghe".lower(), "L349"),
-    ("Tribano".lower(), "L414"),
-    ("Urbana".lower(), "L497"),
-    ("Veggiano".lower(), "L710"),
-    ("Vescovana".lower(), "L805"),
-    ("Vighizzolo d'Este".lower(), "L878"),
-    ("Vigodarzere".lower(), "L892"),
-    ("Vigonza".lower(), "L900"),
-    ("Villa del Conte".lower(), "L934"),
-    ("Villa Estense".lower(), "L937"),
-    ("Villafranca Padovana".lower(), "L947"),
-    ("Villanova di Camposampiero".lower(), "L979"),
-    ("Vo'".lower(), "M103"),
-    ("Due Carrare".lower(), "M300"),
-    ("Adria".lower(), "A059"),
-    ("Ariano nel Polesine".lower(), "A400"),
-    ("Arquà Polesine".lower(), "A435"),
-    ("Badia Polesine".lower(), "A539"),
-    ("Bagnolo di Po".lower(), "A574"),
-    ("Bergantino".lower(), "A795"),
-    ("Bosaro".lower(), "B069"),
-    ("Calto".lower(), "B432"),
-    ("Canaro".lower(), "B578"),
-    ("Canda".lower(), "B582"),
-    ("Castelguglielmo".lower(), "C122"),
-    ("Castelmassa".lower(), "C207"),
-    ("Castelnovo Bariano".lower(), "C215"),
-    ("Ceneselli".lower(), "C461"),
-    ("Ceregnano".lower(), "C500"),
-    ("Corbola".lower(), "C987"),
-    ("Costa di Rovigo".lower(), "D105"),
-    ("Crespino".lower(), "D161"),
-    ("Ficarolo".lower(), "D568"),
-    ("Fiesso Umbertiano".lower(), "D577"),
-    ("Frassinelle Polesine".lower(), "D776"),
-    ("Fratta Polesine".lower(), "D788"),
-    ("Gaiba".lower(), "D855"),
-    ("Gavello".lower(), "D942"),
-    ("Giacciano con Baruchella".lower(), "E008"),
-    ("Guarda Veneta".lower(), "E240"),
-    ("Lendinara".lower(), "E522"),
-    ("Loreo".lower(), "E689"),
-    ("Lusia".lower(), "E761"),
-    ("Melara".lower(), "F095"),
-    ("Occhiobello".lower(), "F994"),
-    ("Papozze".lower(), "G323"),
-    ("Pettorazza Grimani".lower(), "G525"),
-    ("Pincara".lower(), "G673"),
-    ("Polesella".lower(), "G782"),
-    ("Pontecchio Polesine".lower(), "G836"),
-    ("Porto Tolle".lower(), "G923"),
-    ("Rosolina".lower(), "H573"),
-    ("Rovigo".lower(), "H620"),
-    ("Salara".lower(), "H689"),
-    ("San Bellino".lower(), "H768"),
-    ("San Martino di Venezze".lower(), "H996"),
-    ("Stienta".lower(), "I953"),
-    ("Taglio di Po".lower(), "L026"),
-    ("Trecenta".lower(), "L359"),
-    ("Villadose".lower(), "L939"),
-    ("Villamarzana".lower(), "L967"),
-    ("Villanova del Ghebbo".lower(), "L985"),
-    ("Villanova Marchesana".lower(), "L988"),
-    ("Porto Viro".lower(), "G926"),
-    ("Aiello del Friuli".lower(), "A103"),
-    ("Amaro".lower(), "A254"),
-    ("Ampezzo".lower(), "A267"),
-    ("Aquileia".lower(), "A346"),
-    ("Arta Terme".lower(), "A447"),
-    ("Artegna".lower(), "A448"),
-    ("Attimis".lower(), "A491"),
-    ("Bagnaria Arsa".lower(), "A553"),
-    ("Basiliano".lower(), "A700"),
-    ("Bertiolo".lower(), "A810"),
-    ("Bicinicco".lower(), "A855"),
-    ("Bordano".lower(), "A983"),
-    ("Buja".lower(), "B259"),
-    ("Buttrio".lower(), "B309"),
-    ("Camino al Tagliamento".lower(), "B483"),
-    ("Campoformido".lower(), "B536"),
-    ("Carlino".lower(), "B788"),
-    ("Cassacco".lower(), "B994"),
-    ("Castions di Strada".lower(), "C327"),
-    ("Cavazzo Carnico".lower(), "C389"),
-    ("Cercivento".lower(), "C494"),
-    ("Cervignano del Friuli".lower(), "C556"),
-    ("Chiopris-Viscone".lower(), "C641"),
-    ("Chiusaforte".lower(), "C656"),
-    ("Cividale del Friuli".lower(), "C758"),
-    ("Codroipo".lower(), "C817"),
-    ("Colloredo di Monte Albano".lower(), "C885"),
-    ("Comeglians".lower(), "C918"),
-    ("Corno di Rosazzo".lower(), "D027"),
-    ("Coseano".lower(), "D085"),
-    ("Dignano".lower(), "D300"),
-    ("Dogna".lower(), "D316"),
-    ("Drenchia".lower(), "D366"),
-    ("Enemonzo".lower(), "D408"),
-    ("Faedis".lower(), "D455"),
-    ("Fagagna".lower(), "D461"),
-    ("Fiumicello".lower(), "D627"),
-    ("Flaibano".lower(), "D630"),
-    ("Forni Avoltri".lower(), "D718"),
-    ("Forni di Sopra".lower(), "D719"),
-    ("Forni di Sotto".lower(), "D720"),
-    ("Gemona del Friuli".lower(), "D962"),
-    ("Gonars".lower(), "E083"),
-    ("Grimacco".lower(), "E179"),
-    ("Latisana".lower(), "E473"),
-    ("Lauco".lower(), "E476"),
-    ("Lestizza".lower(), "E553"),
-    ("Lignano Sabbiadoro".lower(), "E584"),
-    ("Ligosullo".lower(), "E586"),
-    ("Lusevera".lower(), "E760"),
-    ("Magnano in Riviera".lower(), "E820"),
-    ("Majano".lower(), "E833"),
-    ("Malborghetto Valbruna".lower(), "E847"),
-    ("Manzano".lower(), "E899"),
-    ("Marano Lagunare".lower(), "E910"),
-    ("Martignacco".lower(), "E982"),
-    ("Mereto di Tomba".lower(), "F144"),
-    ("Moggio Udinese".lower(), "F266"),
-    ("Moimacco".lower(), "F275"),
-    ("Montenars".lower(), "F574"),
-    ("Mortegliano".lower(), "F756"),
-    ("Moruzzo".lower(), "F760"),
-    ("Muzzana del Turgnano".lower(), "F832"),
-    ("Nimis".lower(), "F898"),
-    ("Osoppo".lower(), "G163"),
-    ("Ovaro".lower(), "G198"),
-    ("Pagnacco".lower(), "G238"),
-    ("Palazzolo dello Stella".lower(), "G268"),
-    ("Palmanova".lower(), "G284"),
-    ("Paluzza".lower(), "G300"),
-    ("Pasian di Prato".lower(), "G352"),
-    ("Paularo".lower(), "G381"),
-    ("Pavia di Udine".lower(), "G389"),
-    ("Pocenia".lower(), "G743"),
-    ("Pontebba".lower(), "G831"),
-    ("Porpetto".lower(), "G891"),
-    ("Povoletto".lower(), "G949"),
-    ("Pozzuolo del Friuli".lower(), "G966"),
-    ("Pradamano".lower(), "G969"),
-    ("Prato Carnico".lower(), "H002"),
-    ("Precenicco".lower(), "H014"),
-    ("Premariacco".lower(), "H029"),
-    ("Preone".lower(), "H038"),
-    ("Prepotto".lower(), "H040"),
-    ("Pulfero".lower(), "H089"),
-    ("Ragogna".lower(), "H161"),
-    ("Ravascletto".lower(), "H196"),
-    ("Raveo".lower(), "H200"),
-    ("Reana del Rojale".lower(), "H206"),
-    ("Remanzacco".lower(), "H229"),
-    ("Resia".lower(), "H242"),
-    ("Resiutta".lower(), "H244"),
-    ("Rigolato".lower(), "H289"),
-    ("Rive d'Arcano".lower(), "H347"),
-    ("Ronchis".lower(), "H533"),
-    ("Ruda".lower(), "H629"),
-    ("San Daniele del Friuli".lower(), "H816"),
-    ("San Giorgio di Nogaro".lower(), "H895"),
-    ("San Giovanni al Natisone".lower(), "H906"),
-    ("San Leonardo".lower(), "H951"),
-    ("San Pietro al Natisone".lower(), "I092"),
-    ("Santa Maria la Longa".lower(), "I248"),
-    ("San Vito al Torre".lower(), "I404"),
-    ("San Vito di Fagagna".lower(), "I405"),
-    ("Sauris".lower(), "I464"),
-    ("Savogna".lower(), "I478"),
-    ("Sedegliano".lower(), "I562"),
-    ("Socchieve".lower(), "I777"),
-    ("Stregna".lower(), "I974"),
-    ("Sutrio".lower(), "L018"),
-    ("Taipana".lower(), "G736"),
-    ("Talmassons".lower(), "L039"),
-    ("Tarcento".lower(), "L050"),
-    ("Tarvisio".lower(), "L057"),
-    ("Tavagnacco".lower(), "L065"),
-    ("Terzo d'Aquileia".lower(), "L144"),
-    ("Tolmezzo".lower(), "L195"),
-    ("Torreano".lower(), "L246"),
-    ("Torviscosa".lower(), "L309"),
-    ("Trasaghis".lower(), "L335"),
-    ("Treppo Carnico".lower(), "L381"),
-    ("Treppo Grande".lower(), "L382"),
-    ("Tricesimo".lower(), "L421"),
-    ("Trivignano Udinese".lower(), "L438"),
-    ("Udine".lower(), "L483"),
-    ("Varmo".lower(), "L686"),
-    ("Venzone".lower(), "L743"),
-    ("Verzegnis".lower(), "L801"),
-    ("Villa Santina".lower(), "L909"),
-    ("Villa Vicentina".lower(), "M034"),
-    ("Visco".lower(), "M073"),
-    ("Zuglio".lower(), "M200"),
-    ("Forgaria nel Friuli".lower(), "D700"),
-    ("Campolongo Tapogliano".lower(), "M311"),
-    ("Rivignano Teor".lower(), "M317"),
-    ("Capriva del Friuli".lower(), "B712"),
-    ("Cormons".lower(), "D014"),
-    ("Doberdò del Lago".lower(), "D312"),
-    ("Dolegna del Collio".lower(), "D321"),
-    ("Farra d'Isonzo".lower(), "D504"),
-    ("Fogliano Redipuglia".lower(), "D645"),
-    ("Gorizia".lower(), "E098"),
-    ("Gradisca d'Isonzo".lower(), "E124"),
-    ("Grado".lower(), "E125"),
-    ("Mariano del Friuli".lower(), "E952"),
-    ("Medea".lower(), "F081"),
-    ("Monfalcone".lower(), "F356"),
-    ("Moraro".lower(), "F710"),
-    ("Mossa".lower(), "F767"),
-    ("Romans d'Isonzo".lower(), "H514"),
-    ("Ronchi dei Legionari".lower(), "H531"),
-    ("Sagrado".lower(), "H665"),
-    ("San Canzian d'Isonzo".lower(), "H787"),
-    ("San Floriano del Collio".lower(), "H845"),
-    ("San Lorenzo Isontino".lower(), "H964"),
-    ("San Pier d'Isonzo".lower(), "I082"),
-    ("Savogna d'Isonzo".lower(), "I479"),
-    ("Staranzano".lower(), "I939"),
-    ("Turriaco".lower(), "L474"),
-    ("Villesse".lower(), "M043"),
-    ("Duino-Aurisina".lower(), "D383"),
-    ("Monrupino".lower(), "F378"),
-    ("Muggia".lower(), "F795"),
-    ("San Dorligo della Valle-Dolina".lower(), "D324"),
-    ("Sgonico".lower(), "I715"),
-    ("Trieste".lower(), "L424"),
-    ("Andreis".lower(), "A283"),
-    ("Arba".lower(), "A354"),
-    ("Aviano".lower(), "A516"),
-    ("Azzano Decimo".lower(), "A530"),
-    ("Barcis".lower(), "A640"),
-    ("Brugnera".lower(), "B215"),
-    ("Budoia".lower(), "B247"),
-    ("Caneva".lower(), "B598"),
-    ("Casarsa della Delizia".lower(), "B940"),
-    ("Castelnovo del Friuli".lower(), "C217"),
-    ("Cavasso Nuovo".lower(), "C385"),
-    ("Chions".lower(), "C640"),
-    ("Cimolais".lower(), "C699"),
-    ("Claut".lower(), "C790"),
-    ("Clauzetto".lower(), "C791"),
-    ("Cordenons".lower(), "C991"),
-    ("Cordovado".lower(), "C993"),
-    ("Erto e Casso".lower(), "D426"),
-    ("Fanna".lower(), "D487"),
-    ("Fiume Veneto".lower(), "D621"),
-    ("Fontanafredda".lower(), "D670"),
-    ("Frisanco".lower(), "D804"),
-    ("Maniago".lower(), "E889"),
-    ("Meduno".lower(), "F089"),
-    ("Montereale Valcellina".lower(), "F596"),
-    ("Morsano al Tagliamento".lower(), "F750"),
-    ("Pasiano di Pordenone".lower(), "G353"),
-    ("Pinzano al Tagliamento".lower(), "G680"),
-    ("Polcenigo".lower(), "G780"),
-    ("Porcia".lower(), "G886"),
-    ("Pordenone".lower(), "G888"),
-    ("Prata di Pordenone".lower(), "G994"),
-    ("Pravisdomini".lower(), "H010"),
-    ("Roveredo in Piano".lower(), "H609"),
-    ("Sacile".lower(), "H657"),
-    ("San Giorgio della Richinvelda".lower(), "H891"),
-    ("San Martino al Tagliamento".lower(), "H999"),
-    ("San Quirino".lower(), "I136"),
-    ("San Vito al Tagliamento".lower(), "I403"),
-    ("Sequals".lower(), "I621"),
-    ("Sesto al Reghena".lower(), "I686"),
-    ("Spilimbergo".lower(), "I904"),
-    ("Tramonti di Sopra".lower(), "L324"),
-    ("Tramonti di Sotto".lower(), "L325"),
-    ("Travesio".lower(), "L347"),
-    ("Vito d'Asio".lower(), "M085"),
-    ("Vivaro".lower(), "M096"),
-    ("Zoppola".lower(), "M190"),
-    ("Vajont".lower(), "M265"),
-    ("Valvasone Arzene".lower(), "M346"),
-    ("Airole".lower(), "A111"),
-    ("Apricale".lower(), "A338"),
-    ("Aquila d'Arroscia".lower(), "A344"),
-    ("Armo".lower(), "A418"),
-    ("Aurigo".lower(), "A499"),
-    ("Badalucco".lower(), "A536"),
-    ("Bajardo".lower(), "A581"),
-    ("Bordighera".lower(), "A984"),
-    ("Borghetto d'Arroscia".lower(), "A993"),
-    ("Borgomaro".lower(), "B020"),
-    ("Camporosso".lower(), "B559"),
-    ("Caravonica".lower(), "B734"),
-    ("Carpasio".lower(), "B814"),
-    ("Castellaro".lower(), "C143"),
-    ("Castel Vittorio".lower(), "C110"),
-    ("Ceriana".lower(), "C511"),
-    ("Cervo".lower(), "C559"),
-    ("Cesio".lower(), "C578"),
-    ("Chiusanico".lower(), "C657"),
-    ("Chiusavecchia".lower(), "C660"),
-    ("Cipressa".lower(), "C718"),
-    ("Civezza".lower(), "C755"),
-    ("Cosio d'Arroscia".lower(), "D087"),
-    ("Costarainera".lower(), "D114"),
-    ("Diano Arentino".lower(), "D293"),
-    ("Diano Castello".lower(), "D296"),
-    ("Diano Marina".lower(), "D297"),
-    ("Diano San Pietro".lower(), "D298"),
-    ("Dolceacqua".lower(), "D318"),
-    ("Dolcedo".lower(), "D319"),
-    ("Imperia".lower(), "E290"),
-    ("Isolabona".lower(), "E346"),
-    ("Lucinasco".lower(), "E719"),
-    ("Mendatica".lower(), "F123"),
-    ("Molini di Triora".lower(), "F290"),
-    ("Montalto Ligure".lower(), "F406"),
-    ("Montegrosso Pian Latte".lower(), "F528"),
-    ("Olivetta San Michele".lower(), "G041"),
-    ("Ospedaletti".lower(), "G164"),
-    ("Perinaldo".lower(), "G454"),
-    ("Pietrabruna".lower(), "G607"),
-    ("Pieve di Teco".lower(), "G632"),
-    ("Pigna".lower(), "G660"),
-    ("Pompeiana".lower(), "G814"),
-    ("Pontedassio".lower(), "G840"),
-    ("Pornassio".lower(), "G890"),
-    ("Prelà".lower(), "H027"),
-    ("Ranzo".lower(), "H180"),
-    ("Rezzo".lower(), "H257"),
-    ("Riva Ligure".lower(), "H328"),
-    ("Rocchetta Nervina".lower(), "H460"),
-    ("San Bartolomeo al Mare".lower(), "H763"),
-    ("San Biagio della Cima".lower(), "H780"),
-    ("San Lorenzo al Mare".lower(), "H957"),
-    ("Sanremo".lower(), "I138"),
-    ("Santo Stefano al Mare".lower(), "I365"),
-    ("Seborga".lower(), "I556"),
-    ("Soldano".lower(), "I796"),
-    ("Taggia".lower(), "L024"),
-    ("Terzorio".lower(), "L146"),
-    ("Triora".lower(), "L430"),
-    ("Vallebona".lower(), "L596"),
-    ("Vallecrosia".lower(), "L599"),
-    ("Vasia".lower(), "L693"),
-    ("Ventimiglia".lower(), "L741"),
-    ("Vessalico".lower(), "L809"),
-    ("Villa Faraldi".lower(), "L943"),
-    ("Alassio".lower(), "A122"),
-    ("Albenga".lower(), "A145"),
-    ("Albissola Marina".lower(), "A165"),
-    ("Albisola Superiore".lower(), "A166"),
-    ("Altare".lower(), "A226"),
-    ("Andora".lower(), "A278"),
-    ("Arnasco".lower(), "A422"),
-    ("Balestrino".lower(), "A593"),
-    ("Bardineto".lower(), "A647"),
-    ("Bergeggi".lower(), "A796"),
-    ("Boissano".lower(), "A931"),
-    ("Borghetto Santo Spirito".lower(), "A999"),
-    ("Borgio Verezzi".lower(), "B005"),
-    ("Bormida".lower(), "B048"),
-    ("Cairo Montenotte".lower(), "B369"),
-    ("Calice Ligure".lower(), "B409"),
-    ("Calizzano".lower(), "B416"),
-    ("Carcare".lower(), "B748"),
-    ("Casanova Lerrone".lower(), "B927"),
-    ("Castelbianco".lower(), "C063"),
-    ("Castelvecchio di Rocca Barbena".lower(), "C276"),
-    ("Celle Ligure".lower(), "C443"),
-    ("Cengio".lower(), "C463"),
-    ("Ceriale".lower(), "C510"),
-    ("Cisano sul Neva".lower(), "C729"),
-    ("Cosseria".lower(), "D095"),
-    ("Dego".lower(), "D264"),
-    ("Erli".lower(), "D424"),
-    ("Finale Ligure".lower(), "D600"),
-    ("Garlenda".lower(), "D927"),
-    ("Giustenice".lower(), "E064"),
-    ("Giusvalla".lower(), "E066"),
-    ("Laigueglia".lower(), "E414"),
-    ("Loano".lower(), "E632"),
-    ("Magliolo".lower(), "E816"),
-    ("Mallare".lower(), "E860"),
-    ("Massimino".lower(), "F046"),
-    ("Millesimo".lower(), "F213"),
-    ("Mioglia".lower(), "F226"),
-    ("Murialdo".lower(), "F813"),
-    ("Nasino".lower(), "F847"),
-    ("Noli".lower(), "F926"),
-    ("Onzo".lower(), "G076"),
-    ("Orco Feglino".lower(), "D522"),
-    ("Ortovero".lower(), "G144"),
-    ("Osiglia".lower(), "G155"),
-    ("Pallare".lower(), "G281"),
-    ("Piana Crixia".lower(), "G542"),
-    ("Pietra Ligure".lower(), "G605"),
-    ("Plodio".lower(), "G741"),
-    ("Pontinvrea".lower(), "G866"),
-    ("Quiliano".lower(), "H126"),
-    ("Rialto".lower(), "H266"),
-    ("Roccavignale".lower(), "H452"),
-    ("Sassello".lower(), "I453"),
-    ("Savona".lower(), "I480"),
-    ("Spotorno".lower(), "I926"),
-    ("Stella".lower(), "I946"),
-    ("Stellanello".lower(), "I947"),
-    ("Testico".lower(), "L152"),
-    ("Toirano".lower(), "L190"),
-    ("Tovo San Giacomo".lower(), "L315"),
-    ("Urbe".lower(), "L499"),
-    ("Vado Ligure".lower(), "L528"),
-    ("Varazze".lower(), "L675"),
-    ("Vendone".lower(), "L730"),
-    ("Vezzi Portio".lower(), "L823"),
-    ("Villanova d'Albenga".lower(), "L975"),
-    ("Zuccarello".lower(), "M197"),
-    ("Arenzano".lower(), "A388"),
-    ("Avegno".lower(), "A506"),
-    ("Bargagli".lower(), "A658"),
-    ("Bogliasco".lower(), "A922"),
-    ("Borzonasca".lower(), "B067"),
-    ("Busalla".lower(), "B282"),
-    ("Camogli".lower(), "B490"),
-    ("Campo Ligure".lower(), "B538"),
-    ("Campomorone".lower(), "B551"),
-    ("Carasco".lower(), "B726"),
-    ("Casarza Ligure".lower(), "B939"),
-    ("Casella".lower(), "B956"),
-    ("Castiglione Chiavarese".lower(), "C302"),
-    ("Ceranesi".lower(), "C481"),
-    ("Chiavari".lower(), "C621"),
-    ("Cicagna".lower(), "C673"),
-    ("Cogoleto".lower(), "C823"),
-    ("Cogorno".lower(), "C826"),
-    ("Coreglia Ligure".lower(), "C995"),
-    ("Crocefieschi".lower(), "D175"),
-    ("Davagna".lower(), "D255"),
-    ("Fascia".lower(), "D509"),
-    ("Favale di Malvaro".lower(), "D512"),
-    ("Fontanigorda".lower(), "D677"),
-    ("Genova".lower(), "D969"),
-    ("Gorreto".lower(), "E109"),
-    ("Isola del Cantone".lower(), "E341"),
-    ("Lavagna".lower(), "E488"),
-    ("Leivi".lower(), "E519"),
-    ("Lorsica".lower(), "E695"),
-    ("Lumarzo".lower(), "E737"),
-    ("Masone".lower(), "F020"),
-    ("Mele".lower(), "F098"),
-    ("Mezzanego".lower(), "F173"),
-    ("Mignanego".lower(), "F202"),
-    ("Moconesi".lower(), "F256"),
-    ("Moneglia".lower(), "F354"),
-    ("Montebruno".lower(), "F445"),
-    ("Montoggio".lower(), "F682"),
-    ("Ne".lower(), "F858"),
-    ("Neirone".lower(), "F862"),
-    ("Orero".lower(), "G093"),
-    ("Pieve Ligure".lower(), "G646"),
-    ("Portofino".lower(), "G913"),
-    ("Propata".lower(), "H073"),
-    ("Rapallo".lower(), "H183"),
-    ("Recco".lower(), "H212"),
-    ("Rezzoaglio".lower(), "H258"),
-    ("Ronco Scrivia".lower(), "H536"),
-    ("Rondanina".lower(), "H546"),
-    ("Rossiglione".lower(), "H581"),
-    ("Rovegno".lower(), "H599"),
-    ("San Colombano Certenoli".lower(), "H802"),
-    ("Santa Margherita Ligure".lower(), "I225"),
-    ("Sant'Olcese".lower(), "I346"),
-    ("Santo Stefano d'Aveto".lower(), "I368"),
-    ("Savignone".lower(), "I475"),
-    ("Serra Riccò".lower(), "I640"),
-    ("Sestri Levante".lower(), "I693"),
-    ("Sori".lower(), "I852"),
-    ("Tiglieto".lower(), "L167"),
-    ("Torriglia".lower(), "L298"),
-    ("Tribogna".lower(), "L416"),
-    ("Uscio".lower(), "L507"),
-    ("Valbrevenna".lower(), "L546"),
-    ("Vobbia".lower(), "M105"),
-    ("Zoagli".lower(), "M182"),
-    ("Ameglia".lower(), "A261"),
-    ("Arcola".lower(), "A373"),
-    ("Beverino".lower(), "A836"),
-    ("Bolano".lower(), "A932"),
-    ("Bonassola".lower(), "A961"),
-    ("Borghetto di Vara".lower(), "A992"),
-    ("Brugnato".lower(), "B214"),
-    ("Calice al Cornoviglio".lower(), "B410"),
-    ("Carro".lower(), "B838"),
-    ("Carrodano".lower(), "B839"),
-    ("Castelnuovo Magra".lower(), "C240"),
-    ("Deiva Marina".lower(), "D265"),
-    ("Follo".lower(), "D655"),
-    ("Framura".lower(), "D758"),
-    ("La Spezia".lower(), "E463"),
-    ("Lerici".lower(), "E542"),
-    ("Levanto".lower(), "E560"),
-    ("Maissana".lower(), "E842"),
-    ("Monterosso al Mare".lower(), "F609"),
-    ("Ortonovo".lower(), "G143"),
-    ("Pignone".lower(), "G664"),
-    ("Portovenere".lower(), "G925"),
-    ("Riccò del Golfo di Spezia".lower(), "H275"),
-    ("Riomaggiore".lower(), "H304"),
-    ("Rocchetta di Vara".lower(), "H461"),
-    ("Santo Stefano di Magra".lower(), "I363"),
-    ("Sarzana".lower(), "I449"),
-    ("Sesta Godano".lower(), "E070"),
-    ("Varese Ligure".lower(), "L681"),
-    ("Vernazza".lower(), "L774"),
-    ("Vezzano Ligure".lower(), "L819"),
-    ("Zignago".lower(), "M177"),
-    ("Agazzano".lower(), "A067"),
-    ("Alseno".lower(), "A223"),
-    ("Besenzone".lower(), "A823"),
-    ("Bettola".lower(), "A831"),
-    ("Bobbio".lower(), "A909"),
-    ("Borgonovo Val Tidone".lower(), "B025"),
-    ("Cadeo".lower(), "B332"),
-    ("Calendasco".lower(), "B405"),
-    ("Caminata".lower(), "B479"),
-    ("Caorso".lower(), "B643"),
-    ("Carpaneto Piacentino".lower(), "B812"),
-    ("Castell'Arquato".lower(), "C145"),
-    ("Castel San Giovanni".lower(), "C261"),
-    ("Castelvetro Piacentino".lower(), "C288"),
-    ("Cerignale".lower(), "C513"),
-    ("Coli".lower(), "C838"),
-    ("Corte Brugnatella".lower(), "D054"),
-    ("Cortemaggiore".lower(), "D061"),
-    ("Farini".lower(), "D502"),
-    ("Ferriere".lower(), "D555"),
-    ("Fiorenzuola d'Arda".lower(), "D611"),
-    ("Gazzola".lower(), "D958"),
-    ("Gossolengo".lower(), "E114"),
-    ("Gragnano Trebbiense".lower(), "E132"),
-    ("Gropparello".lower(), "E196"),
-    ("Lugagnano Val d'Arda".lower(), "E726"),
-    ("Monticelli d'Ongina".lower(), "F671"),
-    ("Morfasso".lower(), "F724"),
-    ("Nibbiano".lower(), "F885"),
-    ("Ottone".lower(), "G195"),
-    ("Pecorara".lower(), "G399"),
-    ("Piacenza".lower(), "G535"),
-    ("Pianello Val Tidone".lower(), "G557"),
-    ("Piozzano".lower(), "G696"),
-    ("Podenzano".lower(), "G747"),
-    ("Ponte dell'Olio".lower(), "G842"),
-    ("Pontenure".lower(), "G852"),
-    ("Rivergaro".lower(), "H350"),
-    ("Rottofreno".lower(), "H593"),
-    ("San Giorgio Piacentino".lower(), "H887"),
-    ("San Pietro in Cerro".lower(), "G788"),
-    ("Sarmato".lower(), "I434"),
-    ("Travo".lower(), "L348"),
-    ("Vernasca".lower(), "L772"),
-    ("Vigolzone".lower(), "L897"),
-    ("Villanova sull'Arda".lower(), "L980"),
-    ("Zerba".lower(), "M165"),
-    ("Ziano Piacentino".lower(), "L848"),
-    ("Albareto".lower(), "A138"),
-    ("Bardi".lower(), "A646"),
-    ("Bedonia".lower(), "A731"),
-    ("Berceto".lower(), "A788"),
-    ("Bore".lower(), "A987"),
-    ("Borgo Val di Taro".lower(), "B042"),
-    ("Busseto".lower(), "B293"),
-    ("Calestano".lower(), "B408"),
-    ("Collecchio".lower(), "C852"),
-    ("Colorno".lower(), "C904"),
-    ("Compiano".lower(), "C934"),
-    ("Corniglio".lower(), "D026"),
-    ("Felino".lower(), "D526"),
-    ("Fidenza".lower(), "B034"),
-    ("Fontanellato".lower(), "D673"),
-    ("Fontevivo".lower(), "D685"),
-    ("Fornovo di Taro".lower(), "D728"),
-    ("Langhirano".lower(), "E438"),
-    ("Lesignano de' Bagni".lower(), "E547"),
-    ("Medesano".lower(), "F082"),
-    ("Mezzani".lower(), "F174"),
-    ("Monchio delle Corti".lower(), "F340"),
-    ("Montechiarugolo".lower(), "F473"),
-    ("Neviano degli Arduini".lower(), "F882"),
-    ("Noceto".lower(), "F914"),
-    ("Palanzano".lower(), "G255"),
-    ("Parma".lower(), "G337"),
-    ("Pellegrino Parmense".lower(), "G424"),
-    ("Roccabianca".lower(), "H384"),
-    ("Sala Baganza".lower(), "H682"),
-    ("Salsomaggiore Terme".lower(), "H720"),
-    ("San Secondo Parmense".lower(), "I153"),
-    ("Solignano".lower(), "I803"),
-    ("Soragna".lower(), "I840"),
-    ("Sorbolo".lower(), "I845"),
-    ("Terenzo".lower(), "E548"),
-    ("Tizzano Val Parma".lower(), "L183"),
-    ("Tornolo".lower(), "L229"),
-    ("Torrile".lower(), "L299"),
-    ("Traversetolo".lower(), "L346"),
-    ("Valmozzola".lower(), "L641"),
-    ("Varano de' Melegari".lower(), "L672"),
-    ("Varsi".lower(), "L689"),
-    ("Sissa Trecasali".lower(), "M325"),
-    ("Polesine Zibello".lower(), "M367"),
-    ("Albinea".lower(), "A162"),
-    ("Bagnolo in Piano".lower(), "A573"),
-    ("Baiso".lower(), "A586"),
-    ("Bibbiano".lower(), "A850"),
-    ("Boretto".lower(), "A988"),
-    ("Brescello".lower(), "B156"),
-    ("Cadelbosco di Sopra".lower(), "B328"),
-    ("Campagnola Emilia".lower(), "B499"),
-    ("Campegine".lower(), "B502"),
-    ("Carpineti".lower(), "B825"),
-    ("Casalgrande".lower(), "B893"),
-    ("Casina".lower(), "B967"),
-    ("Castellarano".lower(), "C141"),
-    ("Castelnovo di Sotto".lower(), "C218"),
-    ("Castelnovo ne' Monti".lower(), "C219"),
-    ("Cavriago".lower(), "C405"),
-    ("Canossa".lower(), "C669"),
-    ("Correggio".lower(), "D037"),
-    ("Fabbrico".lower(), "D450"),
-    ("Gattatico".lower(), "D934"),
-    ("Gualtieri".lower(), "E232"),
-    ("Guastalla".lower(), "E253"),
-    ("Luzzara".lower(), "E772"),
-    ("Montecchio Emilia".lower(), "F463"),
-    ("Novellara".lower(), "F960"),
-    ("Poviglio".lower(), "G947"),
-    ("Quattro Castella".lower(), "H122"),
-    ("Reggiolo".lower(), "H225"),
-    ("Reggio nell'Emilia".lower(), "H223"),
-    ("Rio Saliceto".lower(), "H298"),
-    ("Rolo".lower(), "H500"),
-    ("Rubiera".lower(), "H628"),
-    ("San Martino in Rio".lower(), "I011"),
-    ("San Polo d'Enza".lower(), "I123"),
-    ("Sant'Ilario d'Enza".lower(), "I342"),
-    ("Scandiano".lower(), "I496"),
-    ("Toano".lower(), "L184"),
-    ("Vetto".lower(), "L815"),
-    ("Vezzano sul Crostolo".lower(), "L820"),
-    ("Viano".lower(), "L831"),
-    ("Villa Minozzo".lower(), "L969"),
-    ("Ventasso".lower(), "M364"),
-    ("Bastiglia".lower(), "A713"),
-    ("Bomporto".lower(), "A959"),
-    ("Campogalliano".lower(), "B539"),
-    ("Camposanto".lower(), "B566"),
-    ("Carpi".lower(), "B819"),
-    ("Castelfranco Emilia".lower(), "C107"),
-    ("Castelnuovo Rangone".lower(), "C242"),
-    ("Castelvetro di Modena".lower(), "C287"),
-    ("Cavezzo".lower(), "C398"),
-    ("Concordia sulla Secchia".lower(), "C951"),
-    ("Fanano".lower(), "D486"),
-    ("Finale Emilia".lower(), "D599"),
-    ("Fiorano Modenese".lower(), "D607"),
-    ("Fiumalbo".lower(), "D617"),
-    ("Formigine".lower(), "D711"),
-    ("Frassinoro".lower(), "D783"),
-    ("Guiglia".lower(), "E264"),
-    ("Lama Mocogno".lower(), "E426"),
-    ("Maranello".lower(), "E904"),
-    ("Marano sul Panaro".lower(), "E905"),
-    ("Medolla".lower(), "F087"),
-    ("Mirandola".lower(), "F240"),
-    ("Modena".lower(), "F257"),
-    ("Montecreto".lower(), "F484"),
-    ("Montefiorino".lower(), "F503"),
-    ("Montese".lower(), "F642"),
-    ("Nonantola".lower(), "F930"),
-    ("Novi di Modena".lower(), "F966"),
-    ("Palagano".lower(), "G250"),
-    ("Pavullo nel Frignano".lower(), "G393"),
-    ("Pievepelago".lower(), "G649"),
-    ("Polinago".lower(), "G789"),
-    ("Prignano sulla Secchia".lower(), "H061"),
-    ("Ravarino".lower(), "H195"),
-    ("Riolunato".lower(), "H303"),
-    ("San Cesario sul Panaro".lower(), "H794"),
-    ("San Felice sul Panaro".lower(), "H835"),
-    ("San Possidonio".lower(), "I128"),
-    ("San Prospero".lower(), "I133"),
-    ("Sassuolo".lower(), "I462"),
-    ("Savignano sul Panaro".lower(), "I473"),
-    ("Serramazzoni".lower(), "F357"),
-    ("Sestola".lower(), "I689"),
-    ("Soliera".lower(), "I802"),
-    ("Spilamberto".lower(), "I903"),
-    ("Vignola".lower(), "L885"),
-    ("Zocca".lower(), "M183"),
-    ("Anzola dell'Emilia".lower(), "A324"),
-    ("Argelato".lower(), "A392"),
-    ("Baricella".lower(), "A665"),
-    ("Bentivoglio".lower(), "A785"),
-    ("Bologna".lower(), "A944"),
-    ("Borgo Tossignano".lower(), "B044"),
-    ("Budrio".lower(), "B249"),
-    ("Calderara di Reno".lower(), "B399"),
-    ("Camugnano".lower(), "B572"),
-    ("Casalecchio di Reno".lower(), "B880"),
-    ("Casalfiumanese".lower(), "B892"),
-    ("Castel d'Aiano".lower(), "C075"),
-    ("Castel del Rio".lower(), "C086"),
-    ("Castel di Casio".lower(), "B969"),
-    ("Castel Guelfo di Bologna".lower(), "C121"),
-    ("Castello d'Argile".lower(), "C185"),
-    ("Castel Maggiore".lower(), "C204"),
-    ("Castel San Pietro Terme".lower(), "C265"),
-    ("Castenaso".lower(), "C292"),
-    ("Castiglione dei Pepoli".lower(), "C296"),
-    ("Crevalcore".lower(), "D166"),
-    ("Dozza".lower(), "D360"),
-    ("Fontanelice".lower(), "D668"),
-    ("Gaggio Montano".lower(), "D847"),
-    ("Galliera".lower(), "D878"),
-    ("Granarolo dell'Emilia".lower(), "E136"),
-    ("Grizzana Morandi".lower(), "E187"),
-    ("Imola".lower(), "E289"),
-    ("Lizzano in Belvedere".lower(), "A771"),
-    ("Loiano".lower(), "E655"),
-    ("Malalbergo".lower(), "E844"),
-    ("Marzabotto".lower(), "B689"),
-    ("Medicina".lower(), "F083"),
-    ("Minerbio".lower(), "F219"),
-    ("Molinella".lower(), "F288"),
-    ("Monghidoro".lower(), "F363"),
-    ("Monterenzio".lower(), "F597"),
-    ("Monte San Pietro".lower(), "F627"),
-    ("Monzuno".lower(), "F706"),
-    ("Mordano".lower(), "F718"),
-    ("Ozzano dell'Emilia".lower(), "G205"),
-    ("Pianoro".lower(), "G570"),
-    ("Pieve di Cento".lower(), "G643"),
-    ("Sala Bolognese".lower(), "H678"),
-    ("San Benedetto Val di Sambro".lower(), "G566"),
-    ("San Giorgio di Piano".lower(), "H896"),
-    ("San Giovanni in Persiceto".lower(), "G467"),
-    ("San Lazzaro di Savena".lower(), "H945"),
-    ("San Pietro in Casale".lower(), "I110"),
-    ("Sant'Agata Bolognese".lower(), "I191"),
-    ("Sasso Marconi".lower(), "G972"),
-    ("Vergato".lower(), "L762"),
-    ("Zola Predosa".lower(), "M185"),
-    ("Valsamoggia".lower(), "M320"),
-    ("Alto Reno Terme".lower(), "M369"),
-    ("Argenta".lower(), "A393"),
-    ("Berra".lower(), "A806"),
-    ("Bondeno".lower(), "A965"),
-    ("Cento".lower(), "C469"),
-    ("Codigoro".lower(), "C814"),
-    ("Comacchio".lower(), "C912"),
-    ("Copparo".lower(), "C980"),
-    ("Ferrara".lower(), "D548"),
-    ("Formignana".lower(), "D713"),
-    ("Jolanda di Savoia".lower(), "E320"),
-    ("Lagosanto".lower(), "E410"),
-    ("Masi Torello".lower(), "F016"),
-    ("Mesola".lower(), "F156"),
-    ("Ostellato".lower(), "G184"),
-    ("Poggio Renatico".lower(), "G768"),
-    ("Portomaggiore".lower(), "G916"),
-    ("Ro".lower(), "H360"),
-    ("Vigarano Mainarda".lower(), "L868"),
-    ("Voghiera".lower(), "M110"),
-    ("Tresigallo".lower(), "L390"),
-    ("Goro".lower(), "E107"),
-    ("Fiscaglia".lower(), "M323"),
-    ("Terre del Reno".lower(), "M381"),
-    ("Alfonsine".lower(), "A191"),
-    ("Bagnacavallo".lower(), "A547"),
-    ("Bagnara di Romagna".lower(), "A551"),
-    ("Brisighella".lower(), "B188"),
-    ("Casola Valsenio".lower(), "B982"),
-    ("Castel Bolognese".lower(), "C065"),
-    ("Cervia".lower(), "C553"),
-    ("Conselice".lower(), "C963"),
-    ("Cotignola".lower(), "D121"),
-    ("Faenza".lower(), "D458"),
-    ("Fusignano".lower(), "D829"),
-    ("Lugo".lower(), "E730"),
-    ("Massa Lombarda".lower(), "F029"),
-    ("Ravenna".lower(), "H199"),
-    ("Riolo Terme".lower(), "H302"),
-    ("Russi".lower(), "H642"),
-    ("Sant'Agata sul Santerno".lower(), "I196"),
-    ("Solarolo".lower(), "I787"),
-    ("Bagno di Romagna".lower(), "A565"),
-    ("Bertinoro".lower(), "A809"),
-    ("Borghi".lower(), "B001"),
-    ("Castrocaro Terme e Terra del Sole".lower(), "C339"),
-    ("Cesena".lower(), "C573"),
-    ("Cesenatico".lower(), "C574"),
-    ("Civitella di Romagna".lower(), "C777"),
-    ("Dovadola".lower(), "D357"),
-    ("Forlì".lower(), "D704"),
-    ("Forlimpopoli".lower(), "D705"),
-    ("Galeata".lower(), "D867"),
-    ("Gambettola".lower(), "D899"),
-    ("Gatteo".lower(), "D935"),
-    ("Longiano".lower(), "E675"),
-    ("Meldola".lower(), "F097"),
-    ("Mercato Saraceno".lower(), "F139"),
-    ("Modigliana".lower(), "F259"),
-    ("Montiano".lower(), "F668"),
-    ("Portico e San Benedetto".lower(), "G904"),
-    ("Predappio".lower(), "H017"),
-    ("Premilcuore".lower(), "H034"),
-    ("Rocca San Casciano".lower(), "H437"),
-    ("Roncofreddo".lower(), "H542"),
-    ("San Mauro Pascoli".lower(), "I027"),
-    ("Santa Sofia".lower(), "I310"),
-    ("Sarsina".lower(), "I444"),
-    ("Savignano sul Rubicone".lower(), "I472"),
-    ("Sogliano al Rubicone".lower(), "I779"),
-    ("Tredozio".lower(), "L361"),
-    ("Verghereto".lower(), "L764"),
-    ("Bellaria-Igea Marina".lower(), "A747"),
-    ("Cattolica".lower(), "C357"),
-    ("Coriano".lower(), "D004"),
-    ("Gemmano".lower(), "D961"),
-    ("Misano Adriatico".lower(), "F244"),
-    ("Mondaino".lower(), "F346"),
-    ("Montefiore Conca".lower(), "F502"),
-    ("Montegridolfo".lower(), "F523"),
-    ("Morciano di Romagna".lower(), "F715"),
-    ("Riccione".lower(), "H274"),
-    ("Rimini".lower(), "H294"),
-    ("Saludecio".lower(), "H724"),
-    ("San Clemente".lower(), "H801"),
-    ("San Giovanni in Marignano".lower(), "H921"),
-    ("Santarcangelo di Romagna".lower(), "I304"),
-    ("Verucchio".lower(), "L797"),
-    ("Casteldelci".lower(), "C080"),
-    ("Maiolo".lower(), "E838"),
-    ("Novafeltria".lower(), "F137"),
-    ("Pennabilli".lower(), "G433"),
-    ("San Leo".lower(), "H949"),
-    ("Sant'Agata Feltria".lower(), "I201"),
-    ("Talamello".lower(), "L034"),
-    ("Poggio Torriana".lower(), "M324"),
-    ("Montescudo - Monte Colombo".lower(), "M368"),
-    ("Aulla".lower(), "A496"),
-    ("Bagnone".lower(), "A576"),
-    ("Carrara".lower(), "B832"),
-    ("Casola in Lunigiana".lower(), "B979"),
-    ("Comano".lower(), "C914"),
-    ("Filattiera".lower(), "D590"),
-    ("Fivizzano".lower(), "D629"),
-    ("Fosdinovo".lower(), "D735"),
-    ("Licciana Nardi".lower(), "E574"),
-    ("Massa".lower(), "F023"),
-    ("Montignoso".lower(), "F679"),
-    ("Mulazzo".lower(), "F802"),
-    ("Podenzana".lower(), "G746"),
-    ("Pontremoli".lower(), "G870"),
-    ("Tresana".lower(), "L386"),
-    ("Villafranca in Lunigiana".lower(), "L946"),
-    ("Zeri".lower(), "M169"),
-    ("Altopascio".lower(), "A241"),
-    ("Bagni di Lucca".lower(), "A560"),
-    ("Barga".lower(), "A657"),
-    ("Borgo a Mozzano".lower(), "B007"),
-    ("Camaiore".lower(), "B455"),
-    ("Camporgiano".lower(), "B557"),
-    ("Capannori".lower(), "B648"),
-    ("Careggine".lower(), "B760"),
-    ("Castelnuovo di Garfagnana".lower(), "C236"),
-    ("Castiglione di Garfagnana".lower(), "C303"),
-    ("Coreglia Antelminelli".lower(), "C996"),
-    ("Forte dei Marmi".lower(), "D730"),
-    ("Fosciandora".lower(), "D734"),
-    ("Gallicano".lower(), "D874"),
-    ("Lucca".lower(), "E715"),
-    ("Massarosa".lower(), "F035"),
-    ("Minucciano".lower(), "F225"),
-    ("Molazzana".lower(), "F283"),
-    ("Montecarlo".lower(), "F452"),
-    ("Pescaglia".lower(), "G480"),
-    ("Piazza al Serchio".lower(), "G582"),
-    ("Pietrasanta".lower(), "G628"),
-    ("Pieve Fosciana".lower(), "G648"),
-    ("Porcari".lower(), "G882"),
-    ("San Romano in Garfagnana".lower(), "I142"),
-    ("Seravezza".lower(), "I622"),
-    ("Stazzema".lower(), "I942"),
-    ("Vagli Sotto".lower(), "L533"),
-    ("Viareggio".lower(), "L833"),
-    ("Villa Basilica".lower(), "L913"),
-    ("Villa Collemandina".lower(), "L926"),
-    ("Fabbriche di Vergemoli".lower(), "M319"),
-    ("Sillano Giuncugnano".lower(), "M347"),
-    ("Agliana".lower(), "A071"),
-    ("Buggiano".lower(), "B251"),
-    ("Lamporecchio".lower(), "E432"),
-    ("Larciano".lower(), "E451"),
-    ("Marliana".lower(), "E960"),
-    ("Massa e Cozzile".lower(), "F025"),
-    ("Monsummano Terme".lower(), "F384"),
-    ("Montale".lower(), "F410"),
-    ("Montecatini-Terme".lower(), "A561"),
-    ("Pescia".lower(), "G491"),
-    ("Pieve a Nievole".lower(), "G636"),
-    ("Pistoia".lower(), "G713"),
-    ("Ponte Buggianese".lower(), "G833"),
-    ("Quarrata".lower(), "H109"),
-    ("Sambuca Pistoiese".lower(), "H744"),
-    ("Serravalle Pistoiese".lower(), "I660"),
-    ("Uzzano".lower(), "L522"),
-    ("Chiesina Uzzanese".lower(), "C631"),
-    ("Abetone Cutigliano".lower(), "M376"),
-    ("San Marcello Piteglio".lower(), "M377"),
-    ("Bagno a Ripoli".lower(), "A564"),
-    ("Barberino di Mugello".lower(), "A632"),
-    ("Barberino Val d'Elsa".lower(), "A633"),
-    ("Borgo San Lorenzo".lower(), "B036"),
-    ("Calenzano".lower(), "B406"),
-    ("Campi Bisenzio".lower(), "B507"),
-    ("Capraia e Limite".lower(), "B684"),
-    ("Castelfiorentino".lower(), "C101"),
-    ("Cerreto Guidi".lower(), "C529"),
-    ("Certaldo".lower(), "C540"),
-    ("Dicomano".lower(), "D299"),
-    ("Empoli".lower(), "D403"),
-    ("Fiesole".lower(), "D575"),
-    ("Firenze".lower(), "D612"),
-    ("Firenzuola".lower(), "D613"),
-    ("Fucecchio".lower(), "D815"),
-    ("Gambassi Terme".lower(), "D895"),
-    ("Greve in Chianti".lower(), "E169"),
-    ("Impruneta".lower(), "E291"),
-    ("Lastra a Signa".lower(), "E466"),
-    ("Londa".lower(), "E668"),
-    ("Marradi".lower(), "E971"),
-    ("Montaione".lower(), "F398"),
-    ("Montelupo Fiorentino".lower(), "F551"),
-    ("Montespertoli".lower(), "F648"),
-    ("Palazzuolo sul Senio".lower(), "G270"),
-    ("Pelago".lower(), "G420"),
-    ("Pontassieve".lower(), "G825"),
-    ("Reggello".lower(), "H222"),
-    ("Rignano sull'Arno".lower(), "H286"),
-    ("Rufina".lower(), "H635"),
-    ("San Casciano in Val di Pesa".lower(), "H791"),
-    ("San Godenzo".lower(), "H937"),
-    ("Scandicci".lower(), "B962"),
-    ("Sesto Fiorentino".lower(), "I684"),
-    ("Signa".lower(), "I728"),
-    ("Tavarnelle Val di Pesa".lower(), "L067"),
-    ("Vaglia".lower(), "L529"),
-    ("Vicchio".lower(), "L838"),
-    ("Vinci".lower(), "M059"),
-    ("Figline e Incisa Valdarno".lower(), "M321"),
-    ("Scarperia e San Piero".lower(), "M326"),
-    ("Bibbona".lower(), "A852"),
-    ("Campiglia Marittima".lower(), "B509"),
-    ("Campo nell'Elba".lower(), "B553"),
-    ("Capoliveri".lower(), "B669"),
-    ("Capraia Isola".lower(), "B685"),
-    ("Castagneto Carducci".lower(), "C044"),
-    ("Cecina".lower(), "C415"),
-    ("Collesalvetti".lower(), "C869"),
-    ("Livorno".lower(), "E625"),
-    ("Marciana".lower(), "E930"),
-    ("Marciana Marina".lower(), "E931"),
-    ("Piombino".lower(), "G687"),
-    ("Porto Azzurro".lower(), "E680"),
-    ("Portoferraio".lower(), "G912"),
-    ("Rio Marina".lower(), "H305"),
-    ("Rio nell'Elba".lower(), "H297"),
-    ("Rosignano Marittimo".lower(), "H570"),
-    ("San Vincenzo".lower(), "I390"),
-    ("Sassetta".lower(), "I454"),
-    ("Suvereto".lower(), "L019"),
-    ("Bientina".lower(), "A864"),
-    ("Buti".lower(), "B303"),
-    ("Calci".lower(), "B390"),
-    ("Calcinaia".lower(), "B392"),
-    ("Capannoli".lower(), "B647"),
-    ("Casale Marittimo".lower(), "B878"),
-    ("Cascina".lower(), "B950"),
-    ("Castelfranco di Sotto".lower(), "C113"),
-    ("Castellina Marittima".lower(), "C174"),
-    ("Castelnuovo di Val di Cecina".lower(), "C244"),
-    ("Chianni".lower(), "C609"),
-    ("Fauglia".lower(), "D510"),
-    ("Guardistallo".lower(), "E250"),
-    ("Lajatico".lower(), "E413"),
-    ("Montecatini Val di Cecina".lower(), "F458"),
-    ("Montescudaio".lower(), "F640"),
-    ("Monteverdi Marittimo".lower(), "F661"),
-    ("Montopoli in Val d'Arno".lower(), "F686"),
-    ("Orciano Pisano".lower(), "G090"),
-    ("Palaia".lower(), "G254"),
-    ("Peccioli".lower(), "G395"),
-    ("Pisa".lower(), "G702"),
-    ("Pomarance".lower(), "G804"),
-    ("Ponsacco".lower(), "G822"),
-    ("Pontedera".lower(), "G843"),
-    ("Riparbella".lower(), "H319"),
-    ("San Giuliano Terme".lower(), "A562"),
-    ("San Miniato".lower(), "I046"),
-    ("Santa Croce sull'Arno".lower(), "I177"),
-    ("Santa Luce".lower(), "I217"),
-    ("Santa Maria a Monte".lower(), "I232"),
-    ("Terricciola".lower(), "L138"),
-    ("Vecchiano".lower(), "L702"),
-    ("Vicopisano".lower(), "L850"),
-    ("Volterra".lower(), "M126"),
-    ("Casciana Terme Lari".lower(), "M327"),
-    ("Crespina Lorenzana".lower(), "M328"),
-    ("Anghiari".lower(), "A291"),
-    ("Arezzo".lower(), "A390"),
-    ("Badia Tedalda".lower(), "A541"),
-    ("Bibbiena".lower(), "A851"),
-    ("Bucine".lower(), "B243"),
-    ("Capolona".lower(), "B670"),
-    ("Caprese Michelangelo".lower(), "B693"),
-    ("Castel Focognano".lower(), "C102"),
-    ("Castel San Niccolò".lower(), "C263"),
-    ("Castiglion Fibocchi".lower(), "C318"),
-    ("Castiglion Fiorentino".lower(), "C319"),
-    ("Cavriglia".lower(), "C407"),
-    ("Chitignano".lower(), "C648"),
-    ("Chiusi della Verna".lower(), "C663"),
-    ("Civitella in Val di Chiana".lower(), "C774"),
-    ("Cortona".lower(), "D077"),
-    ("Foiano della Chiana".lower(), "D649"),
-    ("Laterina".lower(), "E468"),
-    ("Loro Ciuffenna".lower(), "E693"),
-    ("Lucignano".lower(), "E718"),
-    ("Marciano della Chiana".lower(), "E933"),
-    ("Montemignaio".lower(), "F565"),
-    ("Monterchi".lower(), "F594"),
-    ("Monte San Savino".lower(), "F628"),
-    ("Montevarchi".lower(), "F656"),
-    ("Ortignano Raggiolo".lower(), "G139"),
-    ("Pergine Valdarno".lower(), "G451"),
-    ("Pieve Santo Stefano".lower(), "G653"),
-    ("Poppi".lower(), "G879"),
-    ("San Giovanni Valdarno".lower(), "H901"),
-    ("Sansepolcro".lower(), "I155"),
-    ("Sestino".lower(), "I681"),
-    ("Subbiano".lower(), "I991"),
-    ("Talla".lower(), "L038"),
-    ("Terranuova Bracciolini".lower(), "L123"),
-    ("Castelfranco Piandiscò".lower(), "M322"),
-    ("Pratovecchio Stia".lower(), "M329"),
-    ("Abbadia San Salvatore".lower(), "A006"),
-    ("Asciano".lower(), "A461"),
-    ("Buonconvento".lower(), "B269"),
-    ("Casole d'Elsa".lower(), "B984"),
-    ("Castellina in Chianti".lower(), "C172"),
-    ("Castelnuovo Berardenga".lower(), "C227"),
-    ("Castiglione d'Orcia".lower(), "C313"),
-    ("Cetona".lower(), "C587"),
-    ("Chianciano Terme".lower(), "C608"),
-    ("Chiusdino".lower(), "C661"),
-    ("Chiusi".lower(), "C662"),
-    ("Colle di Val d'Elsa".lower(), "C847"),
-    ("Gaiole in Chianti".lower(), "D858"),
-    ("Montepulciano".lower(), "F592"),
-    ("Monteriggioni".lower(), "F598"),
-    ("Monteroni d'Arbia".lower(), "F605"),
-    ("Monticiano".lower(), "F676"),
-    ("Murlo".lower(), "F815"),
-    ("Piancastagnaio".lower(), "G547"),
-    ("Pienza".lower(), "G602"),
-    ("Poggibonsi".lower(), "G752"),
-    ("Radda in Chianti".lower(), "H153"),
-    ("Radicofani".lower(), "H156"),
-    ("Radicondoli".lower(), "H157"),
-    ("Rapolano Terme".lower(), "H185"),
-    ("San Casciano dei Bagni".lower(), "H790"),
-    ("San Gimignano".lower(), "H875"),
-    ("San Quirico d'Orcia".lower(), "I135"),
-    ("Sarteano".lower(), "I445"),
-    ("Siena".lower(), "I726"),
-    ("Sinalunga".lower(), "A468"),
-    ("Sovicille".lower(), "I877"),
-    ("Torrita di Siena".lower(), "L303"),
-    ("Trequanda".lower(), "L384"),
-    ("Montalcino".lower(), "M378"),
-    ("Arcidosso".lower(), "A369"),
-    ("Campagnatico".lower(), "B497"),
-    ("Capalbio".lower(), "B646"),
-    ("Castel del Piano".lower(), "C085"),
-    ("Castell'Azzara".lower(), "C147"),
-    ("Castiglione della Pescaia".lower(), "C310"),
-    ("Cinigiano".lower(), "C705"),
-    ("Civitella Paganico".lower(), "C782"),
-    ("Follonica".lower(), "D656"),
-    ("Gavorrano".lower(), "D948"),
-    ("Grosseto".lower(), "E202"),
-    ("Isola del Giglio".lower(), "E348"),
-    ("Magliano in Toscana".lower(), "E810"),
-    ("Manciano".lower(), "E875"),
-    ("Massa Marittima".lower(), "F032"),
-    ("Monte Argentario".lower(), "F437"),
-    ("Montieri".lower(), "F677"),
-    ("Orbetello".lower(), "G088"),
-    ("Pitigliano".lower(), "G716"),
-    ("Roccalbegna".lower(), "H417"),
-    ("Roccastrada".lower(), "H449"),
-    ("Santa Fiora".lower(), "I187"),
-    ("Scansano".lower(), "I504"),
-    ("Scarlino".lower(), "I510"),
-    ("Seggiano".lower(), "I571"),
-    ("Sorano".lower(), "I841"),
-    ("Monterotondo Marittimo".lower(), "F612"),
-    ("Semproniano".lower(), "I601"),
-    ("Cantagallo".lower(), "B626"),
-    ("Carmignano".lower(), "B794"),
-    ("Montemurlo".lower(), "F572"),
-    ("Poggio a Caiano".lower(), "G754"),
-    ("Prato".lower(), "G999"),
-    ("Vaiano".lower(), "L537"),
-    ("Vernio".lower(), "L775"),
-    ("Assisi".lower(), "A475"),
-    ("Bastia Umbra".lower(), "A710"),
-    ("Bettona".lower(), "A832"),
-    ("Bevagna".lower(), "A835"),
-    ("Campello sul Clitunno".lower(), "B504"),
-    ("Cannara".lower(), "B609"),
-    ("Cascia".lower(), "B948"),
-    ("Castel Ritaldi".lower(), "C252"),
-    ("Castiglione del Lago".lower(), "C309"),
-    ("Cerreto di Spoleto".lower(), "C527"),
-    ("Citerna".lower(), "C742"),
-    ("Città della Pieve".lower(), "C744"),
-    ("Città di Castello".lower(), "C745"),
-    ("Collazzone".lower(), "C845"),
-    ("Corciano".lower(), "C990"),
-    ("Costacciaro".lower(), "D108"),
-    ("Deruta".lower(), "D279"),
-    ("Foligno".lower(), "D653"),
-    ("Fossato di Vico".lower(), "D745"),
-    ("Fratta Todina".lower(), "D787"),
-    ("Giano dell'Umbria".lower(), "E012"),
-    ("Gualdo Cattaneo".lower(), "E229"),
-    ("Gualdo Tadino".lower(), "E230"),
-    ("Gubbio".lower(), "E256"),
-    ("Lisciano Niccone".lower(), "E613"),
-    ("Magione".lower(), "E805"),
-    ("Marsciano".lower(), "E975"),
-    ("Massa Martana".lower(), "F024"),
-    ("Monte Castello di Vibio".lower(), "F456"),
-    ("Montefalco".lower(), "F492"),
-    ("Monteleone di Spoleto".lower(), "F540"),
-    ("Monte Santa Maria Tiberina".lower(), "F629"),
-    ("Montone".lower(), "F685"),
-    ("Nocera Umbra".lower(), "F911"),
-    ("Norcia".lower(), "F935"),
-    ("Paciano".lower(), "G212"),
-    ("Panicale".lower(), "G308"),
-    ("Passignano sul Trasimeno".lower(), "G359"),
-    ("Perugia".lower(), "G478"),
-    ("Piegaro".lower(), "G601"),
-    ("Pietralunga".lower(), "G618"),
-    ("Poggiodomo".lower(), "G758"),
-    ("Preci".lower(), "H015"),
-    ("San Giustino".lower(), "H935"),
-    ("Sant'Anatolia di Narco".lower(), "I263"),
-    ("Scheggia e Pascelupo".lower(), "I522"),
-    ("Scheggino".lower(), "I523"),
-    ("Sellano".lower(), "I585"),
-    ("Sigillo".lower(), "I727"),
-    ("Spello".lower(), "I888"),
-    ("Spoleto".lower(), "I921"),
-    ("Todi".lower(), "L188"),
-    ("Torgiano".lower(), "L216"),
-    ("Trevi".lower(), "L397"),
-    ("Tuoro sul Trasimeno".lower(), "L466"),
-    ("Umbertide".lower(), "D786"),
-    ("Valfabbrica".lower(), "L573"),
-    ("Vallo di Nera".lower(), "L627"),
-    ("Valtopina".lower(), "L653"),
-    ("Acquasparta".lower(), "A045"),
-    ("Allerona".lower(), "A207"),
-    ("Alviano".lower(), "A242"),
-    ("Amelia".lower(), "A262"),
-    ("Arrone".lower(), "A439"),
-    ("Attigliano".lower(), "A490"),
-    ("Baschi".lower(), "A691"),
-    ("Calvi dell'Umbria".lower(), "B446"),
-    ("Castel Giorgio".lower(), "C117"),
-    ("Castel Viscardo".lower(), "C289"),
-    ("Fabro".lower(), "D454"),
-    ("Ferentillo".lower(), "D538"),
-    ("Ficulle".lower(), "D570"),
-    ("Giove".lower(), "E045"),
-    ("Guardea".lower(), "E241"),
-    ("Lugnano in Teverina".lower(), "E729"),
-    ("Montecastrilli".lower(), "F457"),
-    ("Montecchio".lower(), "F462"),
-    ("Montefranco".lower(), "F510"),
-    ("Montegabbione".lower(), "F513"),
-    ("Monteleone d'Orvieto".lower(), "F543"),
-    ("Narni".lower(), "F844"),
-    ("Orvieto".lower(), "G148"),
-    ("Otricoli".lower(), "G189"),
-    ("Parrano".lower(), "G344"),
-    ("Penna in Teverina".lower(), "G432"),
-    ("Polino".lower(), "G790"),
-    ("Porano".lower(), "G881"),
-    ("San Gemini".lower(), "H857"),
-    ("San Venanzo".lower(), "I381"),
-    ("Stroncone".lower(), "I981"),
-    ("Terni".lower(), "L117"),
-    ("Avigliano Umbro".lower(), "M258"),
-    ("Acqualagna".lower(), "A035"),
-    ("Apecchio".lower(), "A327"),
-    ("Auditore".lower(), "A493"),
-    ("Belforte all'Isauro".lower(), "A740"),
-    ("Borgo Pace".lower(), "B026"),
-    ("Cagli".lower(), "B352"),
-    ("Cantiano".lower(), "B636"),
-    ("Carpegna".lower(), "B816"),
-    ("Cartoceto".lower(), "B846"),
-    ("Fano".lower(), "D488"),
-    ("Fermignano".lower(), "D541"),
-    ("Fossombrone".lower(), "D749"),
-    ("Fratte Rosa".lower(), "D791"),
-    ("Frontino".lower(), "D807"),
-    ("Frontone".lower(), "D808"),
-    ("Gabicce Mare".lower(), "D836"),
-    ("Gradara".lower(), "E122"),
-    ("Isola del Piano".lower(), "E351"),
-    ("Lunano".lower(), "E743"),
-    ("Macerata Feltria".lower(), "E785"),
-    ("Mercatello sul Metauro".lower(), "F135"),
-    ("Mercatino Conca".lower(), "F136"),
-    ("Mombaroccio".lower(), "F310"),
-    ("Mondavio".lower(), "F347"),
-    ("Mondolfo".lower(), "F348"),
-    ("Montecalvo in Foglia".lower(), "F450"),
-    ("Monte Cerignone".lower(), "F467"),
-    ("Monteciccardo".lower(), "F474"),
-    ("Montecopiolo".lower(), "F478"),
-    ("Montefelcino".lower(), "F497"),
-    ("Monte Grimano Terme".lower(), "F524"),
-    ("Montelabbate".lower(), "F533"),
-    ("Monte Porzio".lower(), "F589"),
-    ("Peglio".lower(), "G416"),
-    ("Pergola".lower(), "G453"),
-    ("Pesaro".lower(), "G479"),
-    ("Petriano".lower(), "G514"),
-    ("Piandimeleto".lower(), "G551"),
-    ("Pietrarubbia".lower(), "G627"),
-    ("Piobbico".lower(), "G682"),
-    ("San Costanzo".lower(), "H809"),
-    ("San Lorenzo in Campo".lower(), "H958"),
-    ("Sant'Angelo in Vado".lower(), "I287"),
-    ("Sant'Ippolito".lower(), "I344"),
-    ("Sassocorvaro".lower(), "I459"),
-    ("Sassofeltrio".lower(), "I460"),
-    ("Serra Sant'Abbondio".lower(), "I654"),
-    ("Tavoleto".lower(), "L078"),
-    ("Tavullia".lower(), "L081"),
-    ("Urbania".lower(), "L498"),
-    ("Urbino".lower(), "L500"),
-    ("Vallefoglia".lower(), "M331"),
-    ("Colli al Metauro".lower(), "M380"),
-    ("Terre Roveresche".lower(), "M379"),
-    ("Agugliano".lower(), "A092"),
-    ("Ancona".lower(), "A271"),
-    ("Arcevia".lower(), "A366"),
-    ("Barbara".lower(), "A626"),
-    ("Belvedere Ostrense".lower(), "A769"),
-    ("Camerano".lower(), "B468"),
-    ("Camerata Picena".lower(), "B470"),
-    ("Castelbellino".lower(), "C060"),
-    ("Castelfidardo".lower(), "C100"),
-    ("Castelleone di Suasa".lower(), "C152"),
-    ("Castelplanio".lower(), "C248"),
-    ("Cerreto d'Esi".lower(), "C524"),
-    ("Chiaravalle".lower(), "C615"),
-    ("Corinaldo".lower(), "D007"),
-    ("Cupramontana".lower(), "D211"),
-    ("Fabriano".lower(), "D451"),
-    ("Falconara Marittima".lower(), "D472"),
-    ("Filottrano".lower(), "D597"),
-    ("Genga".lower(), "D965"),
-    ("Jesi".lower(), "E388"),
-    ("Loreto".lower(), "E690"),
-    ("Maiolati Spontini".lower(), "E837"),
-    ("Mergo".lower(), "F145"),
-    ("Monsano".lower(), "F381"),
-    ("Montecarotto".lower(), "F453"),
-    ("Montemarciano".lower(), "F560"),
-    ("Monte Roberto".lower(), "F600"),
-    ("Monte San Vito".lower(), "F634"),
-    ("Morro d'Alba".lower(), "F745"),
-    ("Numana".lower(), "F978"),
-    ("Offagna".lower(), "G003"),
-    ("Osimo".lower(), "G157"),
-    ("Ostra".lower(), "F401"),
-    ("Ostra Vetere".lower(), "F581"),
-    ("Poggio San Marcello".lower(), "G771"),
-    ("Polverigi".lower(), "G803"),
-    ("Rosora".lower(), "H575"),
-    ("San Marcello".lower(), "H979"),
-    ("San Paolo di Jesi".lower(), "I071"),
-    ("Santa Maria Nuova".lower(), "I251"),
-    ("Sassoferrato".lower(), "I461"),
-    ("Senigallia".lower(), "I608"),
-    ("Serra de' Conti".lower(), "I643"),
-    ("Serra San Quirico".lower(), "I653"),
-    ("Sirolo".lower(), "I758"),
-    ("Staffolo".lower(), "I932"),
-    ("Trecastelli".lower(), "M318"),
-    ("Apiro".lower(), "A329"),
-    ("Appignano".lower(), "A334"),
-    ("Belforte del Chienti".lower(), "A739"),
-    ("Bolognola".lower(), "A947"),
-    ("Caldarola".lower(), "B398"),
-    ("Camerino".lower(), "B474"),
-    ("Camporotondo di Fiastrone".lower(), "B562"),
-    ("Castelraimondo".lower(), "C251"),
-    ("Castelsantangelo sul Nera".lower(), "C267"),
-    ("Cessapalombo".lower(), "C582"),
-    ("Cingoli".lower(), "C704"),
-    ("Civitanova Marche".lower(), "C770"),
-    ("Colmurano".lower(), "C886"),
-    ("Corridonia".lower(), "D042"),
-    ("Esanatoglia".lower(), "D429"),
-    ("Fiastra".lower(), "D564"),
-    ("Fiuminata".lower(), "D628"),
-    ("Gagliole".lower(), "D853"),
-    ("Gualdo".lower(), "E228"),
-    ("Loro Piceno".lower(), "E694"),
-    ("Macerata".lower(), "E783"),
-    ("Matelica".lower(), "F051"),
-    ("Mogliano".lower(), "F268"),
-    ("Montecassiano".lower(), "F454"),
-    ("Monte Cavallo".lower(), "F460"),
-    ("Montecosaro".lower(), "F482"),
-    ("Montefano".lower(), "F496"),
-    ("Montelupone".lower(), "F552"),
-    ("Monte San Giusto".lower(), "F621"),
-    ("Monte San Martino".lower(), "F622"),
-    ("Morrovalle".lower(), "F749"),
-    ("Muccia".lower(), "F793"),
-    ("Penna San Giovanni".lower(), "G436"),
-    ("Petriolo".lower(), "G515"),
-    ("Pieve Torina".lower(), "G657"),
-    ("Pioraco".lower(), "G690"),
-    ("Poggio San Vicino".lower(), "D566"),
-    ("Pollenza".lower(), "F567"),
-    ("Porto Recanati".lower(), "G919"),
-    ("Potenza Picena".lower(), "F632"),
-    ("Recanati".lower(), "H211"),
-    ("Ripe San Ginesio".lower(), "H323"),
-    ("San Ginesio".lower(), "H876"),
-    ("San Severino Marche".lower(), "I156"),
-    ("Sant'Angelo in Pontano".lower(), "I286"),
-    ("Sarnano".lower(), "I436"),
-    ("Sefro".lower(), "I569"),
-    ("Serrapetrona".lower(), "I651"),
-    ("Serravalle di Chienti".lower(), "I661"),
-    ("Tolentino".lower(), "L191"),
-    ("Treia".lower(), "L366"),
-    ("Urbisaglia".lower(), "L501"),
-    ("Ussita".lower(), "L517"),
-    ("Visso".lower(), "M078"),
-    ("Valfornace".lower(), "N.D"),
-    ("Acquasanta Terme".lower(), "A044"),
-    ("Acquaviva Picena".lower(), "A047"),
-    ("Appignano del Tronto".lower(), "A335"),
-    ("Arquata del Tronto".lower(), "A437"),
-    ("Ascoli Piceno".lower(), "A462"),
-    ("Carassai".lower(), "B727"),
-    ("Castel di Lama".lower(), "C093"),
-    ("Castignano".lower(), "C321"),
-    ("Castorano".lower(), "C331"),
-    ("Colli del Tronto".lower(), "C877"),
-    ("Comunanza".lower(), "C935"),
-    ("Cossignano".lower(), "D096"),
-    ("Cupra Marittima".lower(), "D210"),
-    ("Folignano".lower(), "D652"),
-    ("Force".lower(), "D691"),
-    ("Grottammare".lower(), "E207"),
-    ("Maltignano".lower(), "E868"),
-    ("Massignano".lower(), "F044"),
-    ("Monsampolo del Tronto".lower(), "F380"),
-    ("Montalto delle Marche".lower(), "F415"),
-    ("Montedinove".lower(), "F487"),
-    ("Montefiore dell'Aso".lower(), "F501"),
-    ("Montegallo".lower(), "F516"),
-    ("Montemonaco".lower(), "F570"),
-    ("Monteprandone".lower(), "F591"),
-    ("Offida".lower(), "G005"),
-    ("Palmiano".lower(), "G289"),
-    ("Ripatransone".lower(), "H321"),
-    ("Roccafluvione".lower(), "H390"),
-    ("Rotella".lower(), "H588"),
-    ("San Benedetto del Tronto".lower(), "H769"),
-    ("Spinetoli".lower(), "I912"),
-    ("Venarotta".lower(), "L728"),
-    ("Altidona".lower(), "A233"),
-    ("Amandola".lower(), "A252"),
-    ("Belmonte Piceno".lower(), "A760"),
-    ("Campofilone".lower(), "B534"),
-    ("Falerone".lower(), "D477"),
-    ("Fermo".lower(), "D542"),
-    ("Francavilla d'Ete".lower(), "D760"),
-    ("Grottazzolina".lower(), "E208"),
-    ("Lapedona".lower(), "E447"),
-    ("Magliano di Tenna".lower(), "E807"),
-    ("Massa Fermana".lower(), "F021"),
-    ("Monsampietro Morico".lower(), "F379"),
-    ("Montappone".lower(), "F428"),
-    ("Montefalcone Appennino".lower(), "F493"),
-    ("Montefortino".lower(), "F509"),
-    ("Monte Giberto".lower(), "F517"),
-    ("Montegiorgio".lower(), "F520"),
-    ("Montegranaro".lower(), "F522"),
-    ("Monteleone di Fermo".lower(), "F536"),
-    ("Montelparo".lower(), "F549"),
-    ("Monte Rinaldo".lower(), "F599"),
-    ("Monterubbiano".lower(), "F614"),
-    ("Monte San Pietrangeli".lower(), "F626"),
-    ("Monte Urano".lower(), "F653"),
-    ("Monte Vidon Combatte".lower(), "F664"),
-    ("Monte Vidon Corrado".lower(), "F665"),
-    ("Montottone".lower(), "F697"),
-    ("Moresco".lower(), "F722"),
-    ("Ortezzano".lower(), "G137"),
-    ("Pedaso".lower(), "G403"),
-    ("Petritoli".lower(), "G516"),
-    ("Ponzano di Fermo".lower(), "G873"),
-    ("Porto San Giorgio".lower(), "G920"),
-    ("Porto Sant'Elpidio".lower(), "G921"),
-    ("Rapagnano".lower(), "H182"),
-    ("Santa Vittoria in Matenano".lower(), "I315"),
-    ("Sant'Elpidio a Mare".lower(), "I324"),
-    ("Servigliano".lower(), "C070"),
-    ("Smerillo".lower(), "I774"),
-    ("Torre San Patrizio".lower(), "L279"),
-    ("Acquapendente".lower(), "A040"),
-    ("Arlena di Castro".lower(), "A412"),
-    ("Bagnoregio".lower(), "A577"),
-    ("Barbarano Romano".lower(), "A628"),
-    ("Bassano Romano".lower(), "A704"),
-    ("Bassano in Teverina".lower(), "A706"),
-    ("Blera".lower(), "A857"),
-    ("Bolsena".lower(), "A949"),
-    ("Bomarzo".lower(), "A955"),
-    ("Calcata".lower(), "B388"),
-    ("Canepina".lower(), "B597"),
-    ("Canino".lower(), "B604"),
-    ("Capodimonte".lower(), "B663"),
-    ("Capranica".lower(), "B688"),
-    ("Caprarola".lower(), "B691"),
-    ("Carbognano".lower(), "B735"),
-    ("Castel Sant'Elia".lower(), "C269"),
-    ("Castiglione in Teverina".lower(), "C315"),
-    ("Celleno".lower(), "C446"),
-    ("Cellere".lower(), "C447"),
-    ("Civita Castellana".lower(), "C765"),
-    ("Civitella d'Agliano".lower(), "C780"),
-    ("Corchiano".lower(), "C988"),
-    ("Fabrica di Roma".lower(), "D452"),
-    ("Faleria".lower(), "D475"),
-    ("Farnese".lower(), "D503"),
-    ("Gallese".lower(), "D870"),
-    ("Gradoli".lower(), "E126"),
-    ("Graffignano".lower(), "E128"),
-    ("Grotte di Castro".lower(), "E210"),
-    ("Ischia di Castro".lower(), "E330"),
-    ("Latera".lower(), "E467"),
-    ("Lubriano".lower(), "E713"),
-    ("Marta".lower(), "E978"),
-    ("Montalto di Castro".lower(), "F419"),
-    ("Montefiascone".lower(), "F499"),
-    ("Monte Romano".lower(), "F603"),
-    ("Monterosi".lower(), "F606"),
-    ("Nepi".lower(), "F868"),
-    ("Onano".lower(), "G065"),
-    ("Oriolo Romano".lower(), "G111"),
-    ("Orte".lower(), "G135"),
-    ("Piansano".lower(), "G571"),
-    ("Proceno".lower(), "H071"),
-    ("Ronciglione".lower(), "H534"),
-    ("Villa San Giovanni in Tuscia".lower(), "H913"),
-    ("San Lorenzo Nuovo".lower(), "H969"),
-    ("Soriano nel Cimino".lower(), "I855"),
-    ("Sutri".lower(), "L017"),
-    ("Tarquinia".lower(), "D024"),
-    ("Tessennano".lower(), "L150"),
-    ("Tuscania".lower(), "L310"),
-    ("Valentano".lower(), "L569"),
-    ("Vallerano".lower(), "L612"),
-    ("Vasanello".lower(), "A701"),
-    ("Vejano".lower(), "L713"),
-    ("Vetralla".lower(), "L814"),
-    ("Vignanello".lower(), "L882"),
-    ("Viterbo".lower(), "M082"),
-    ("Vitorchiano".lower(), "M086"),
-    ("Accumoli".lower(), "A019"),
-    ("Amatrice".lower(), "A258"),
-    ("Antrodoco".lower(), "A315"),
-    ("Ascrea".lower(), "A464"),
-    ("Belmonte in Sabina".lower(), "A765"),
-    ("Borbona".lower(), "A981"),
-    ("Borgorose".lower(), "B008"),
-    ("Borgo Velino".lower(), "A996"),
-    ("Cantalice".lower(), "B627"),
-    ("Cantalupo in Sabina".lower(), "B631"),
-    ("Casaprota".lower(), "B934"),
-    ("Casperia".lower(), "A472"),
-    ("Castel di Tora".lower(), "C098"),
-    ("Castelnuovo di Farfa".lower(), "C224"),
-    ("Castel Sant'Angelo".lower(), "C268"),
-    ("Cittaducale".lower(), "C746"),
-    ("Cittareale".lower(), "C749"),
-    ("Collalto Sabino".lower(), "C841"),
-    ("Colle di Tora".lower(), "C857"),
-    ("Collegiove".lower(), "C859"),
-    ("Collevecchio".lower(), "C876"),
-    ("Colli sul Velino".lower(), "C880"),
-    ("Concerviano".lower(), "C946"),
-    ("Configni".lower(), "C959"),
-    ("Contigliano".lower(), "C969"),
-    ("Cottanello".lower(), "D124"),
-    ("Fara in Sabina".lower(), "D493"),
-    ("Fiamignano".lower(), "D560"),
-    ("Forano".lower(), "D689"),
-    ("Frasso Sabino".lower(), "D785"),
-    ("Greccio".lower(), "E160"),
-    ("Labro".lower(), "E393"),
-    ("Leonessa".lower(), "E535"),
-    ("Longone Sabino".lower(), "E681"),
-    ("Magliano Sabina".lower(), "E812"),
-    ("Marcetelli".lower(), "E927"),
-    ("Micigliano".lower(), "F193"),
-    ("Mompeo".lower(), "F319"),
-    ("Montasola".lower(), "F430"),
-    ("Montebuono".lower(), "F446"),
-    ("Monteleone Sabino".lower(), "F541"),
-    ("Montenero Sabino".lower(), "F579"),
-    ("Monte San Giovanni in Sabina".lower(), "F619"),
-    ("Montopoli di Sabina".lower(), "F687"),
-    ("Morro Reatino".lower(), "F746"),
-    ("Nespolo".lower(), "F876"),
-    ("Orvinio".lower(), "B595"),
-    ("Paganico Sabino".lower(), "G232"),
-    ("Pescorocchiano".lower(), "G498"),
-    ("Petrella Salto".lower(), "G513"),
-    ("Poggio Bustone".lower(), "G756"),
-    ("Poggio Catino".lower(), "G757"),
-    ("Poggio Mirteto".lower(), "G763"),
-    ("Poggio Moiano".lower(), "G764"),
-    ("Poggio Nativo".lower(), "G765"),
-    ("Poggio San Lorenzo".lower(), "G770"),
-    ("Posta".lower(), "G934"),
-    ("Pozzaglia Sabina".lower(), "G951"),
-    ("Rieti".lower(), "H282"),
-    ("Rivodutri".lower(), "H354"),
-    ("Roccantica".lower(), "H427"),
-    ("Rocca Sinibalda".lower(), "H446"),
-    ("Salisano".lower(), "H713"),
-    ("Scandriglia".lower(), "I499"),
-    ("Selci".lower(), "I581"),
-    ("Stimigliano".lower(), "I959"),
-    ("Tarano".lower(), "L046"),
-    ("Toffia".lower(), "L189"),
-    ("Torricella in Sabina".lower(), "L293"),
-    ("Torri in Sabina".lower(), "L286"),
-    ("Turania".lower(), "G507"),
-    ("Vacone".lower(), "L525"),
-    ("Varco Sabino".lower(), "L676"),
-    ("Affile".lower(), "A062"),
-    ("Agosta".lower(), "A084"),
-    ("Albano Laziale".lower(), "A132"),
-    ("Allumiere".lower(), "A210"),
-    ("Anguillara Sabazia".lower(), "A297"),
-    ("Anticoli Corrado".lower(), "A309"),
-    ("Anzio".lower(), "A323"),
-    ("Arcinazzo Romano".lower(), "A370"),
-    ("Ariccia".lower(), "A401"),
-    ("Arsoli".lower(), "A446"),
-    ("Artena".lower(), "A449"),
-    ("Bellegra".lower(), "A749"),
-    ("Bracciano".lower(), "B114"),
-    ("Camerata Nuova".lower(), "B472"),
-    ("Campagnano di Roma".lower(), "B496"),
-    ("Canale Monterano".lower(), "B576"),
-    ("Canterano".lower(), "B635"),
-    ("Capena".lower(), "B649"),
-    ("Capranica Prenestina".lower(), "B687"),
-    ("Carpineto Romano".lower(), "B828"),
-    ("Casape".lower(), "B932"),
-    ("Castel Gandolfo".lower(), "C116"),
-    ("Castel Madama".lower(), "C203"),
-    ("Castelnuovo di Porto".lower(), "C237"),
-    ("Castel San Pietro Romano".lower(), "C266"),
-    ("Cave".lower(), "C390"),
-    ("Cerreto Laziale".lower(), "C518"),
-    ("Cervara di Roma".lower(), "C543"),
-    ("Cerveteri".lower(), "C552"),
-    ("Ciciliano".lower(), "C677"),
-    ("Cineto Romano".lower(), "C702"),
-    ("Civitavecchia".lower(), "C773"),
-    ("Civitella San Paolo".lower(), "C784"),
-    ("Colleferro".lower(), "C858"),
-    ("Colonna".lower(), "C900"),
-    ("Fiano Romano".lower(), "D561"),
-    ("Filacciano".lower(), "D586"),
-    ("Formello".lower(), "D707"),
-    ("Frascati".lower(), "D773"),
-    ("Gallicano nel Lazio".lower(), "D875"),
-    ("Gavignano".lower(), "D945"),
-    ("Genazzano".lower(), "D964"),
-    ("Genzano di Roma".lower(), "D972"),
-    ("Gerano".lower(), "D978"),
-    ("Gorga".lower(), "E091"),
-    ("Grottaferrata".lower(), "E204"),
-    ("Guidonia Montecelio".lower(), "E263"),
-    ("Jenne".lower(), "E382"),
-    ("Labico".lower(), "E392"),
-    ("Lanuvio".lower(), "C767"),
-    ("Licenza".lower(), "E576"),
-    ("Magliano Romano".lower(), "E813"),
-    ("Mandela".lower(), "B632"),
-    ("Manziana".lower(), "E900"),
-    ("Marano Equo".lower(), "E908"),
-    ("Marcellina".lower(), "E924"),
-    ("Marino".lower(), "E958"),
-    ("Mazzano Romano".lower(), "F064"),
-    ("Mentana".lower(), "F127"),
-    ("Monte Compatri".lower(), "F477"),
-    ("Monteflavio".lower(), "F504"),
-    ("Montelanico".lower(), "F534"),
-    ("Montelibretti".lower(), "F545"),
-    ("Monte Porzio Catone".lower(), "F590"),
-    ("Monterotondo".lower(), "F611"),
-    ("Montorio Romano".lower(), "F692"),
-    ("Moricone".lower(), "F730"),
-    ("Morlupo".lower(), "F734"),
-    ("Nazzano".lower(), "F857"),
-    ("Nemi".lower(), "F865"),
-    ("Nerola".lower(), "F871"),
-    ("Nettuno".lower(), "F880"),
-    ("Olevano Romano".lower(), "G022"),
-    ("Palestrina".lower(), "G274"),
-    ("Palombara Sabina".lower(), "G293"),
-    ("Percile".lower(), "G444"),
-    ("Pisoniano".lower(), "G704"),
-    ("Poli".lower(), "G784"),
-    ("Pomezia".lower(), "G811"),
-    ("Ponzano Romano".lower(), "G874"),
-    ("Riano".lower(), "H267"),
-    ("Rignano Flaminio".lower(), "H288"),
-    ("Riofreddo".lower(), "H300"),
-    ("Rocca Canterano".lower(), "H387"),
-    ("Rocca di Cave".lower(), "H401"),
-    ("Rocca di Papa".lower(), "H404"),
-    ("Roccagiovine".lower(), "H411"),
-    ("Rocca Priora".lower(), "H432"),
-    ("Rocca Santo Stefano".lower(), "H441"),
-    ("Roiate".lower(), "H494"),
-    ("Roma".lower(), "H501"),
-    ("Roviano".lower(), "H618"),
-    ("Sacrofano".lower(), "H658"),
-    ("Sambuci".lower(), "H745"),
-    ("San Gregorio da Sassola".lower(), "H942"),
-    ("San Polo dei Cavalieri".lower(), "I125"),
-    ("Santa Marinella".lower(), "I255"),
-    ("Sant'Angelo Romano".lower(), "I284"),
-    ("Sant'Oreste".lower(), "I352"),
-    ("San Vito Romano".lower(), "I400"),
-    ("Saracinesco".lower(), "I424"),
-    ("Segni".lower(), "I573"),
-    ("Subiaco".lower(), "I992"),
-    ("Tivoli".lower(), "L182"),
-    ("Tolfa".lower(), "L192"),
-    ("Torrita Tiberina".lower(), "L302"),
-    ("Trevignano Romano".lower(), "L401"),
-    ("Vallepietra".lower(), "L611"),
-    ("Vallinfreda".lower(), "L625"),
-    ("Valmontone".lower(), "L639"),
-    ("Velletri".lower(), "L719"),
-    ("Vicovaro".lower(), "L851"),
-    ("Vivaro Romano".lower(), "M095"),
-    ("Zagarolo".lower(), "M141"),
-    ("Lariano".lower(), "M207"),
-    ("Ladispoli".lower(), "M212"),
-    ("Ardea".lower(), "M213"),
-    ("Ciampino".lower(), "M272"),
-    ("San Cesareo".lower(), "M295"),
-    ("Fiumicino".lower(), "M297"),
-    ("Fonte Nuova".lower(), "M309"),
-    ("Aprilia".lower(), "A341"),
-    ("Bassiano".lower(), "A707"),
-    ("Campodimele".lower(), "B527"),
-    ("Castelforte".lower(), "C104"),
-    ("Cisterna di Latina".lower(), "C740"),
-    ("Cori".lower(), "D003"),
-    ("Fondi".lower(), "D662"),
-    ("Formia".lower(), "D708"),
-    ("Gaeta".lower(), "D843"),
-    ("Itri".lower(), "E375"),
-    ("Latina".lower(), "E472"),
-    ("Lenola".lower(), "E527"),
-    ("Maenza".lower(), "E798"),
-    ("Minturno".lower(), "F224"),
-    ("Monte San Biagio".lower(), "F616"),
-    ("Norma".lower(), "F937"),
-    ("Pontinia".lower(), "G865"),
-    ("Ponza".lower(), "G871"),
-    ("Priverno".lower(), "G698"),
-    ("Prossedi".lower(), "H076"),
-    ("Roccagorga".lower(), "H413"),
-    ("Rocca Massima".lower(), "H421"),
-    ("Roccasecca dei Volsci".lower(), "H444"),
-    ("Sabaudia".lower(), "H647"),
-    ("San Felice Circeo".lower(), "H836"),
-    ("Santi Cosma e Damiano".lower(), "I339"),
-    ("Sermoneta".lower(), "I634"),
-    ("Sezze".lower(), "I712"),
-    ("Sonnino".lower(), "I832"),
-    ("Sperlonga".lower(), "I892"),
-    ("Spigno Saturnia".lower(), "I902"),
-    ("Terracina".lower(), "L120"),
-    ("Ventotene".lower(), "L742"),
-    ("Acquafondata".lower(), "A032"),
-    ("Acuto".lower(), "A054"),
-    ("Alatri".lower(), "A123"),
-    ("Alvito".lower(), "A244"),
-    ("Amaseno".lower(), "A256"),
-    ("Anagni".lower(), "A269"),
-    ("Aquino".lower(), "A348"),
-    ("Arce".lower(), "A363"),
-    ("Arnara".lower(), "A421"),
-    ("Arpino".lower(), "A433"),
-    ("Atina".lower(), "A486"),
-    ("Ausonia".lower(), "A502"),
-    ("Belmonte Castello".lower(), "A763"),
-    ("Boville Ernica".lower(), "A720"),
-    ("Broccostella".lower(), "B195"),
-    ("Campoli Appennino".lower(), "B543"),
-    ("Casalattico".lower(), "B862"),
-    ("Casalvieri".lower(), "B919"),
-    ("Cassino".lower(), "C034"),
-    ("Castelliri".lower(), "C177"),
-    ("Castelnuovo Parano".lower(), "C223"),
-    ("Castrocielo".lower(), "C340"),
-    ("Castro dei Volsci".lower(), "C338"),
-    ("Ceccano".lower(), "C413"),
-    ("Ceprano".lower(), "C479"),
-    ("Cervaro".lower(), "C545"),
-    ("Colfelice".lower(), "C836"),
-    ("Collepardo".lower(), "C864"),
-    ("Colle San Magno".lower(), "C870"),
-    ("Coreno Ausonio".lower(), "C998"),
-    ("Esperia".lower(), "D440"),
-    ("Falvaterra".lower(), "D483"),
-    ("Ferentino".lower(), "D539"),
-    ("Filettino".lower(), "D591"),
-    ("Fiuggi".lower(), "A310"),
-    ("Fontana Liri".lower(), "D667"),
-    ("Fontechiari".lower(), "D682"),
-    ("Frosinone".lower(), "D810"),
-    ("Fumone".lower(), "D819"),
-    ("Gallinaro".lower(), "D881"),
-    ("Giuliano di Roma".lower(), "E057"),
-    ("Guarcino".lower(), "E236"),
-    ("Isola del Liri".lower(), "E340"),
-    ("Monte San Giovanni Campano".lower(), "F620"),
-    ("Morolo".lower(), "F740"),
-    ("Paliano".lower(), "G276"),
-    ("Pastena".lower(), "G362"),
-    ("Patrica".lower(), "G374"),
-    ("Pescosolido".lower(), "G500"),
-    ("Picinisco".lower(), "G591"),
-    ("Pico".lower(), "G592"),
-    ("Piedimonte San Germano".lower(), "G598"),
-    ("Piglio".lower(), "G659"),
-    ("Pignataro Interamna".lower(), "G662"),
-    ("Pofi".lower(), "G749"),
-    ("Pontecorvo".lower(), "G838"),
-    ("Posta Fibreno".lower(), "G935"),
-    ("Ripi".lower(), "H324"),
-    ("Rocca d'Arce".lower(), "H393"),
-    ("Roccasecca".lower(), "H443"),
-    ("San Biagio Saracinisco".lower(), "H779"),
-    ("San Donato Val di Comino".lower(), "H824"),
-    ("San Giorgio a Liri".lower(), "H880"),
-    ("San Giovanni Incarico".lower(), "H917"),
-    ("Sant'Ambrogio sul Garigliano".lower(), "I256"),
-    ("Sant'Andrea del Garigliano".lower(), "I265"),
-    ("Sant'Apollinare".lower(), "I302"),
-    ("Sant'Elia Fiumerapido".lower(), "I321"),
-    ("Santopadre".lower(), "I351"),
-    ("San Vittore del Lazio".lower(), "I408"),
-    ("Serrone".lower(), "I669"),
-    ("Settefrati".lower(), "I697"),
-    ("Sgurgola".lower(), "I716"),
-    ("Sora".lower(), "I838"),
-    ("Strangolagalli".lower(), "I973"),
-    ("Supino".lower(), "L009"),
-    ("Terelle".lower(), "L105"),
-    ("Torre Cajetani".lower(), "L243"),
-    ("Torrice".lower(), "L290"),
-    ("Trevi nel Lazio".lower(), "L398"),
-    ("Trivigliano".lower(), "L437"),
-    ("Vallecorsa".lower(), "L598"),
-    ("Vallemaio".lower(), "L605"),
-    ("Vallerotonda".lower(), "L614"),
-    ("Veroli".lower(), "L780"),
-    ("Vicalvi".lower(), "L836"),
-    ("Vico nel Lazio".lower(), "L843"),
-    ("Villa Latina".lower(), "A081"),
-    ("Villa Santa Lucia".lower(), "L905"),
-    ("Villa Santo Stefano".lower(), "I364"),
-    ("Viticuso".lower(), "M083"),
-    ("Acciano".lower(), "A018"),
-    ("Aielli".lower(), "A100"),
-    ("Alfedena".lower(), "A187"),
-    ("Anversa degli Abruzzi".lower(), "A318"),
-    ("Ateleta".lower(), "A481"),
-    ("Avezzano".lower(), "A515"),
-    ("Balsorano".lower(), "A603"),
-    ("Barete".lower(), "A656"),
-    ("Barisciano".lower(), "A667"),
-    ("Barrea".lower(), "A678"),
-    ("Bisegna".lower(), "A884"),
-    ("Bugnara".lower(), "B256"),
-    ("Cagnano Amiterno".lower(), "B358"),
-    ("Calascio".lower(), "B382"),
-    ("Campo di Giove".lower(), "B526"),
-    ("Campotosto".lower(), "B569"),
-    ("Canistro".lower(), "B606"),
-    ("Cansano".lower(), "B624"),
-    ("Capestrano".lower(), "B651"),
-    ("Capistrello".lower(), "B656"),
-    ("Capitignano".lower(), "B658"),
-    ("Caporciano".lower(), "B672"),
-    ("Cappadocia".lower(), "B677"),
-    ("Carapelle Calvisio".lower(), "B725"),
-    ("Carsoli".lower(), "B842"),
-    ("Castel del Monte".lower(), "C083"),
-    ("Castel di Ieri".lower(), "C090"),
-    ("Castel di Sangro".lower(), "C096"),
-    ("Castellafiume".lower(), "C126"),
-    ("Castelvecchio Calvisio".lower(), "C278"),
-    ("Castelvecchio Subequo".lower(), "C279"),
-    ("Celano".lower(), "C426"),
-    ("Cerchio".lower(), "C492"),
-    ("Civita d'Antino".lower(), "C766"),
-    ("Civitella Alfedena".lower(), "C778"),
-    ("Civitella Roveto".lower(), "C783"),
-    ("Cocullo".lower(), "C811"),
-    ("Collarmele".lower(), "C844"),
-    ("Collelongo".lower(), "C862"),
-    ("Collepietro".lower(), "C866"),
-    ("Corfinio".lower(), "C999"),
-    ("Fagnano Alto".lower(), "D465"),
-    ("Fontecchio".lower(), "D681"),
-    ("Fossa".lower(), "D736"),
-    ("Gagliano Aterno".lower(), "D850"),
-    ("Gioia dei Marsi".lower(), "E040"),
-    ("Goriano Sicoli".lower(), "E096"),
-    ("Introdacqua".lower(), "E307"),
-    ("L'Aquila".lower(), "A345"),
-    ("Lecce nei Marsi".lower(), "E505"),
-    ("Luco dei Marsi".lower(), "E723"),
-    ("Lucoli".lower(), "E724"),
-    ("Magliano de' Marsi".lower(), "E811"),
-    ("Massa d'Albe".lower(), "F022"),
-    ("Molina Aterno".lower(), "M255"),
-    ("Montereale".lower(), "F595"),
-    ("Morino".lower(), "F732"),
-    ("Navelli".lower(), "F852"),
-    ("Ocre".lower(), "F996"),
-    ("Ofena".lower(), "G002"),
-    ("Opi".lower(), "G079"),
-    ("Oricola".lower(), "G102"),
-    ("Ortona dei Marsi".lower(), "G142"),
-    ("Ortucchio".lower(), "G145"),
-    ("Ovindoli".lower(), "G200"),
-    ("Pacentro".lower(), "G210"),
-    ("Pereto".lower(), "G449"),
-    ("Pescasseroli".lower(), "G484"),
-    ("Pescina".lower(), "G492"),
-    ("Pescocostanzo".lower(), "G493"),
-    ("Pettorano sul Gizio".lower(), "G524"),
-    ("Pizzoli".lower(), "G726"),
-    ("Poggio Picenze".lower(), "G766"),
-    ("Prata d'Ansidonia".lower(), "G992"),
-    ("Pratola Peligna".lower(), "H007"),
-    ("Prezza".lower(), "H056"),
-    ("Raiano".lower(), "H166"),
-    ("Rivisondoli".lower(), "H353"),
-    ("Roccacasale".lower(), "H389"),
-    ("Rocca di Botte".lower(), "H399"),
-    ("Rocca di Cambio".lower(), "H400"),
-    ("Rocca di Mezzo".lower(), "H402"),
-    ("Rocca Pia".lower(), "H429"),
-    ("Roccaraso".lower(), "H434"),
-    ("San Benedetto dei Marsi".lower(), "H772"),
-    ("San Benedetto in Perillis".lower(), "H773"),
-    ("San Demetrio ne' Vestini".lower(), "H819"),
-    ("San Pio delle Camere".lower(), "I121"),
-    ("Sante Marie".lower(), "I326"),
-    ("Sant'Eusanio Forconese".lower(), "I336"),
-    ("Santo Stefano di Sessanio".lower(), "I360"),
-    ("San Vincenzo Valle Roveto".lower(), "I389"),
-    ("Scanno".lower(), "I501"),
-    ("Scontrone".lower(), "I543"),
-    ("Scoppito".lower(), "I546"),
-    ("Scurcola Marsicana".lower(), "I553"),
-    ("Secinaro".lower(), "I558"),
-    ("Sulmona".lower(), "I804"),
-    ("Tagliacozzo".lower(), "L025"),
-    ("Tione degli Abruzzi".lower(), "L173"),
-    ("Tornimparte".lower(), "L227"),
-    ("Trasacco".lower(), "L334"),
-    ("Villalago".lower(), "L958"),
-    ("Villa Santa Lucia degli Abruzzi".lower(), "M021"),
-    ("Villa Sant'Angelo".lower(), "M023"),
-    ("Villavallelonga".lower(), "M031"),
-    ("Villetta Barrea".lower(), "M041"),
-    ("Vittorito".lower(), "M090"),
-    ("Alba Adriatica".lower(), "A125"),
-    ("Ancarano".lower(), "A270"),
-    ("Arsita".lower(), "A445"),
-    ("Atri".lower(), "A488"),
-    ("Basciano".lower(), "A692"),
-    ("Bellante".lower(), "A746"),
-    ("Bisenti".lower(), "A885"),
-    ("Campli".lower(), "B515"),
-    ("Canzano".lower(), "B640"),
-    ("Castel Castagna".lower(), "C040"),
-    ("Castellalto".lower(), "C128"),
-    ("Castelli".lower(), "C169"),
-    ("Castiglione Messer Raimondo".lower(), "C316"),
-    ("Castilenti".lower(), "C322"),
-    ("Cellino Attanasio".lower(), "C449"),
-    ("Cermignano".lower(), "C517"),
-    ("Civitella del Tronto".lower(), "C781"),
-    ("Colledara".lower(), "C311"),
-    ("Colonnella".lower(), "C901"),
-    ("Controguerra".lower(), "C972"),
-    ("Corropoli".lower(), "D043"),
-    ("Cortino".lower(), "D076"),
-    ("Crognaleto".lower(), "D179"),
-    ("Fano Adriano".lower(), "D489"),
-    ("Giulianova".lower(), "E058"),
-    ("Isola del Gran Sasso d'Italia".lower(), "E343"),
-    ("Montefino".lower(), "F500"),
-    ("Montorio al Vomano".lower(), "F690"),
-    ("Morro d'Oro".lower(), "F747"),
-    ("Mosciano Sant'Angelo".lower(), "F764"),
-    ("Nereto".lower(), "F870"),
-    ("Notaresco".lower(), "F942"),
-    ("Penna Sant'Andrea".lower(), "G437"),
-    ("Pietracamela".lower(), "G608"),
-    ("Pineto".lower(), "F831"),
-    ("Rocca Santa Maria".lower(), "H440"),
-    ("Roseto degli Abruzzi".lower(), "F585"),
-    ("Sant'Egidio alla Vibrata".lower(), "I318"),
-    ("Sant'Omero".lower(), "I348"),
-    ("Silvi".lower(), "I741"),
-    ("Teramo".lower(), "L103"),
-    ("Torano Nuovo".lower(), "L207"),
-    ("Torricella Sicura".lower(), "L295"),
-    ("Tortoreto".lower(), "L307"),
-    ("Tossicia".lower(), "L314"),
-    ("Valle Castellana".lower(), "L597"),
-    ("Martinsicuro".lower(), "E989"),
-    ("Abbateggio".lower(), "A008"),
-    ("Alanno".lower(), "A120"),
-    ("Bolognano".lower(), "A945"),
-    ("Brittoli".lower(), "B193"),
-    ("Bussi sul Tirino".lower(), "B294"),
-    ("Cappelle sul Tavo".lower(), "B681"),
-    ("Caramanico Terme".lower(), "B722"),
-    ("Carpineto della Nora".lower(), "B827"),
-    ("Castiglione a Casauria".lower(), "C308"),
-    ("Catignano".lower(), "C354"),
-    ("Cepagatti".lower(), "C474"),
-    ("Città Sant'Angelo".lower(), "C750"),
-    ("Civitaquana".lower(), "C771"),
-    ("Civitella Casanova".lower(), "C779"),
-    ("Collecorvino".lower(), "C853"),
-    ("Corvara".lower(), "D078"),
-    ("Cugnoli".lower(), "D201"),
-    ("Elice".lower(), "D394"),
-    ("Farindola".lower(), "D501"),
-    ("Lettomanoppello".lower(), "E558"),
-    ("Loreto Aprutino".lower(), "E691"),
-    ("Manoppello".lower(), "E892"),
-    ("Montebello di Bertona".lower(), "F441"),
-    ("Montesilvano".lower(), "F646"),
-    ("Moscufo".lower(), "F765"),
-    ("Nocciano".lower(), "F908"),
-    ("Penne".lower(), "G438"),
-    ("Pescara".lower(), "G482"),
-    ("Pescosansonesco".lower(), "G499"),
-    ("Pianella".lower(), "G555"),
-    ("Picciano".lower(), "G589"),
-    ("Pietranico".lower(), "G621"),
-    ("Popoli".lower(), "G878"),
-    ("Roccamorice".lower(), "H425"),
-    ("Rosciano".lower(), "H562"),
-    ("Salle".lower(), "H715"),
-    ("Sant'Eufemia a Maiella".lower(), "I332"),
-    ("San Valentino in Abruzzo Citeriore".lower(), "I376"),
-    ("Scafa".lower(), "I482"),
-    ("Serramonacesca".lower(), "I649"),
-    ("Spoltore".lower(), "I922"),
-    ("Tocco da Casauria".lower(), "L186"),
-    ("Torre de' Passeri".lower(), "L263"),
-    ("Turrivalignani".lower(), "L475"),
-    ("Vicoli".lower(), "L846"),
-    ("Villa Celiera".lower(), "L922"),
-    ("Altino".lower(), "A235"),
-    ("Archi".lower(), "A367"),
-    ("Ari".lower(), "A398"),
-    ("Arielli".lower(), "A402"),
-    ("Atessa".lower(), "A485"),
-    ("Bomba".lower(), "A956"),
-    ("Borrello".lower(), "B057"),
-    ("Bucchianico".lower(), "B238"),
-    ("Montebello sul Sangro".lower(), "B268"),
-    ("Canosa Sannita".lower(), "B620"),
-    ("Carpineto Sinello".lower(), "B826"),
-    ("Carunchio".lower(), "B853"),
-    ("Casacanditella".lower(), "B859"),
-    ("Casalanguida".lower(), "B861"),
-    ("Casalbordino".lower(), "B865"),
-    ("Casalincontrada".lower(), "B896"),
-    ("Casoli".lower(), "B985"),
-    ("Castel Frentano".lower(), "C114"),
-    ("Castelguidone".lower(), "C123"),
-    ("Castiglione Messer Marino".lower(), "C298"),
-    ("Celenza sul Trigno".lower(), "C428"),
-    ("Chieti".lower(), "C632"),
-    ("Civitaluparella".lower(), "C768"),
-    ("Civitella Messer Raimondo".lower(), "C776"),
-    ("Colledimacine".lower(), "C855"),
-    ("Colledimezzo".lower(), "C856"),
-    ("Crecchio".lower(), "D137"),
-    ("Cupello".lower(), "D209"),
-    ("Dogliola".lower(), "D315"),
-    ("Fara Filiorum Petri".lower(), "D494"),
-    ("Fara San Martino".lower(), "D495"),
-    ("Filetto".lower(), "D592"),
-    ("Fossacesia".lower(), "D738"),
-    ("Fraine".lower(), "D757"),
-    ("Francavilla al Mare".lower(), "D763"),
-    ("Fresagrandinaria".lower(), "D796"),
-    ("Frisa".lower(), "D803"),
-    ("Furci".lower(), "D823"),
-    ("Gamberale".lower(), "D898"),
-    ("Gessopalena".lower(), "D996"),
-    ("Gissi".lower(), "E052"),
-    ("Giuliano Teatino".lower(), "E056"),
-    ("Guardiagrele".lower(), "E243"),
-    ("Guilmi".lower(), "E266"),
-    ("Lama dei Peligni".lower(), "E424"),
-    ("Lanciano".lower(), "E435"),
-    ("Lentella".lower(), "E531"),
-    ("Lettopalena".lower(), "E559"),
-    ("Liscia".lower(), "E611"),
-    ("Miglianico".lower(), "F196"),
-    ("Montazzoli".lower(), "F433"),
-    ("Monteferrante".lower(), "F498"),
-    ("Montelapiano".lower(), "F535"),
-    ("Montenerodomo".lower(), "F578"),
-    ("Monteodorisio".lower(), "F582"),
-    ("Mozzagrogna".lower(), "F785"),
-    ("Orsogna".lower(), "G128"),
-    ("Ortona".lower(), "G141"),
-    ("Paglieta".lower(), "G237"),
-    ("Palena".lower(), "G271"),
-    ("Palmoli".lower(), "G290"),
-    ("Palombaro".lower(), "G294"),
-    ("Pennadomo".lower(), "G434"),
-    ("Pennapiedimonte".lower(), "G435"),
-    ("Perano".lower(), "G441"),
-    ("Pizzoferrato".lower(), "G724"),
-    ("Poggiofiorito".lower(), "G760"),
-    ("Pollutri".lower(), "G799"),
-    ("Pretoro".lower(), "H052"),
-    ("Quadri".lower(), "H098"),
-    ("Rapino".lower(), "H184"),
-    ("Ripa Teatina".lower(), "H320"),
-    ("Roccamontepiano".lower(), "H424"),
-    ("Rocca San Giovanni".lower(), "H439"),
-    ("Roccascalegna".lower(), "H442"),
-    ("Roccaspinalveti".lower(), "H448"),
-    ("Roio del Sangro".lower(), "H495"),
-    ("Rosello".lower(), "H566"),
-    ("San Buono".lower(), "H784"),
-    ("San Giovanni Lipioni".lower(), "H923"),
-    ("San Giovanni Teatino".lower(), "D690"),
-    ("San Martino sulla Marrucina".lower(), "H991"),
-    ("San Salvo".lower(), "I148"),
-    ("Santa Maria Imbaro".lower(), "I244"),
-    ("Sant'Eusanio del Sangro".lower(), "I335"),
-    ("San Vito Chietino".lower(), "I394"),
-    ("Scerni".lower(), "I520"),
-    ("Schiavi di Abruzzo".lower(), "I526"),
-    ("Taranta Peligna".lower(), "L047"),
-    ("Tollo".lower(), "L194"),
-    ("Torino di Sangro".lower(), "L218"),
-    ("Tornareccio".lower(), "L224"),
-    ("Torrebruna".lower(), "L253"),
-    ("Torrevecchia Teatina".lower(), "L284"),
-    ("Torricella Peligna".lower(), "L291"),
-    ("Treglio".lower(), "L363"),
-    ("Tufillo".lower(), "L459"),
-    ("Vacri".lower(), "L526"),
-    ("Vasto".lower(), "E372"),
-    ("Villalfonsina".lower(), "L961"),
-    ("Villamagna".lower(), "L964"),
-    ("Villa Santa Maria".lower(), "M022"),
-    ("Pietraferrazzana".lower(), "G613"),
-    ("Fallo".lower(), "D480"),
-    ("Acquaviva Collecroce".lower(), "A050"),
-    ("Baranello".lower(), "A616"),
-    ("Bojano".lower(), "A930"),
-    ("Bonefro".lower(), "A971"),
-    ("Busso".lower(), "B295"),
-    ("Campobasso".lower(), "B519"),
-    ("Campochiaro".lower(), "B522"),
-    ("Campodipietra".lower(), "B528"),
-    ("Campolieto".lower(), "B544"),
-    ("Campomarino".lower(), "B550"),
-    ("Casacalenda".lower(), "B858"),
-    ("Casalciprano".lower(), "B871"),
-    ("Castelbottaccio".lower(), "C066"),
-    ("Castellino del Biferno".lower(), "C175"),
-    ("Castelmauro".lower(), "C197"),
-    ("Castropignano".lower(), "C346"),
-    ("Cercemaggiore".lower(), "C486"),
-    ("Cercepiccola".lower(), "C488"),
-    ("Civitacampomarano".lower(), "C764"),
-    ("Colle d'Anchise".lower(), "C854"),
-    ("Colletorto".lower(), "C875"),
-    ("Duronia".lower(), "C772"),
-    ("Ferrazzano".lower(), "D550"),
-    ("Fossalto".lower(), "D737"),
-    ("Gambatesa".lower(), "D896"),
-    ("Gildone".lower(), "E030"),
-    ("Guardialfiera".lower(), "E244"),
-    ("Guardiaregia".lower(), "E248"),
-    ("Guglionesi".lower(), "E259"),
-    ("Jelsi".lower(), "E381"),
-    ("Larino".lower(), "E456"),
-    ("Limosano".lower(), "E599"),
-    ("Lucito".lower(), "E722"),
-    ("Lupara".lower(), "E748"),
-    ("Macchia Valfortore".lower(), "E780"),
-    ("Mafalda".lower(), "E799"),
-    ("Matrice".lower(), "F055"),
-    ("Mirabello Sannitico".lower(), "F233"),
-    ("Molise".lower(), "F294"),
-    ("Monacilioni".lower(), "F322"),
-    ("Montagano".lower(), "F391"),
-    ("Montecilfone".lower(), "F475"),
-    ("Montefalcone nel Sannio".lower(), "F495"),
-    ("Montelongo".lower(), "F548"),
-    ("Montemitro".lower(), "F569"),
-    ("Montenero di Bisaccia".lower(), "F576"),
-    ("Montorio nei Frentani".lower(), "F689"),
-    ("Morrone del Sannio".lower(), "F748"),
-    ("Oratino".lower(), "G086"),
-    ("Palata".lower(), "G257"),
-    ("Petacciato".lower(), "G506"),
-    ("Petrella Tifernina".lower(), "G512"),
-    ("Pietracatella".lower(), "G609"),
-    ("Pietracupa".lower(), "G610"),
-    ("Portocannone".lower(), "G910"),
-    ("Provvidenti".lower(), "H083"),
-    ("Riccia".lower(), "H273"),
-    ("Ripabottoni".lower(), "H311"),
-    ("Ripalimosani".lower(), "H313"),
-    ("Roccavivara".lower(), "H454"),
-    ("Rotello".lower(), "H589"),
-    ("Salcito".lower(), "H693"),
-    ("San Biase".lower(), "H782"),
-    ("San Felice del Molise".lower(), "H833"),
-    ("San Giacomo degli Schiavoni".lower(), "H867"),
-    ("San Giovanni in Galdo".lower(), "H920"),
-    ("San Giuliano del Sannio".lower(), "H928"),
-    ("San Giuliano di Puglia".lower(), "H929"),
-    ("San Martino in Pensilis".lower(), "H990"),
-    ("San Massimo".lower(), "I023"),
-    ("San Polo Matese".lower(), "I122"),
-    ("Santa Croce di Magliano".lower(), "I181"),
-    ("Sant'Angelo Limosano".lower(), "I289"),
-    ("Sant'Elia a Pianisi".lower(), "I320"),
-    ("Sepino".lower(), "I618"),
-    ("Spinete".lower(), "I910"),
-    ("Tavenna".lower(), "L069"),
-    ("Termoli".lower(), "L113"),
-    ("Torella del Sannio".lower(), "L215"),
-    ("Toro".lower(), "L230"),
-    ("Trivento".lower(), "L435"),
-    ("Tufara".lower(), "L458"),
-    ("Ururi".lower(), "L505"),
-    ("Vinchiaturo".lower(), "M057"),
-    ("Acquaviva d'Isernia".lower(), "A051"),
-    ("Agnone".lower(), "A080"),
-    ("Bagnoli del Trigno".lower(), "A567"),
-    ("Belmonte del Sannio".lower(), "A761"),
-    ("Cantalupo nel Sannio".lower(), "B630"),
-    ("Capracotta".lower(), "B682"),
-    ("Carovilli".lower(), "B810"),
-    ("Carpinone".lower(), "B830"),
-    ("Castel del Giudice".lower(), "C082"),
-    ("Castelpetroso".lower(), "C246"),
-    ("Castelpizzuto".lower(), "C247"),
-    ("Castel San Vincenzo".lower(), "C270"),
-    ("Castelverrino".lower(), "C200"),
-    ("Cerro al Volturno".lower(), "C534"),
-    ("Chiauci".lower(), "C620"),
-    ("Civitanova del Sannio".lower(), "C769"),
-    ("Colli a Volturno".lower(), "C878"),
-    ("Conca Casale".lower(), "C941"),
-    ("Filignano".lower(), "D595"),
-    ("Forlì del Sannio".lower(), "D703"),
-    ("Fornelli".lower(), "D715"),
-    ("Frosolone".lower(), "D811"),
-    ("Isernia".lower(), "E335"),
-    ("Longano".lower(), "E669"),
-    ("Macchia d'Isernia".lower(), "E778"),
-    ("Macchiagodena".lower(), "E779"),
-    ("Miranda".lower(), "F239"),
-    ("Montaquila".lower(), "F429"),
-    ("Montenero Val Cocchiara".lower(), "F580"),
-    ("Monteroduni".lower(), "F601"),
-    ("Pesche".lower(), "G486"),
-    ("Pescolanciano".lower(), "G495"),
-    ("Pescopennataro".lower(), "G497"),
-    ("Pettoranello del Molise".lower(), "G523"),
-    ("Pietrabbondante".lower(), "G606"),
-    ("Pizzone".lower(), "G727"),
-    ("Poggio Sannita".lower(), "B317"),
-    ("Pozzilli".lower(), "G954"),
-    ("Rionero Sannitico".lower(), "H308"),
-    ("Roccamandolfi".lower(), "H420"),
-    ("Roccasicura".lower(), "H445"),
-    ("Rocchetta a Volturno".lower(), "H458"),
-    ("San Pietro Avellana".lower(), "I096"),
-    ("Sant'Agapito".lower(), "I189"),
-    ("Santa Maria del Molise".lower(), "I238"),
-    ("Sant'Angelo del Pesco".lower(), "I282"),
-    ("Sant'Elena Sannita".lower(), "B466"),
-    ("Scapoli".lower(), "I507"),
-    ("Sessano del Molise".lower(), "I679"),
-    ("Sesto Campano".lower(), "I682"),
-    ("Vastogirardi".lower(), "L696"),
-    ("Venafro".lower(), "L725"),
-    ("Ailano".lower(), "A106"),
-    ("Alife".lower(), "A200"),
-    ("Alvignano".lower(), "A243"),
-    ("Arienzo".lower(), "A403"),
-    ("Aversa".lower(), "A512"),
-    ("Baia e Latina".lower(), "A579"),
-    ("Bellona".lower(), "A755"),
-    ("Caianello".lower(), "B361"),
-    ("Caiazzo".lower(), "B362"),
-    ("Calvi Risorta".lower(), "B445"),
-    ("Camigliano".lower(), "B477"),
-    ("Cancello ed Arnone".lower(), "B581"),
-    ("Capodrise".lower(), "B667"),
-    ("Capriati a Volturno".lower(), "B704"),
-    ("Capua".lower(), "B715"),
-    ("Carinaro".lower(), "B779"),
-    ("Carinola".lower(), "B781"),
-    ("Casagiove".lower(), "B860"),
-    ("Casal di Principe".lower(), "B872"),
-    ("Casaluce".lower(), "B916"),
-    ("Casapulla".lower(), "B935"),
-    ("Caserta".lower(), "B963"),
-    ("Castel Campagnano".lower(), "B494"),
-    ("Castel di Sasso".lower(), "C097"),
-    ("Castello del Matese".lower(), "C178"),
-    ("Castel Morrone".lower(), "C211"),
-    ("Castel Volturno".lower(), "C291"),
-    ("Cervino".lower(), "C558"),
-    ("Cesa".lower(), "C561"),
-    ("Ciorlano".lower(), "C716"),
-    ("Conca della Campania".lower(), "C939"),
-    ("Curti".lower(), "D228"),
-    ("Dragoni".lower(), "D361"),
-    ("Fontegreca".lower(), "D683"),
-    ("Formicola".lower(), "D709"),
-    ("Francolise".lower(), "D769"),
-    ("Frignano".lower(), "D799"),
-    ("Gallo Matese".lower(), "D884"),
-    ("Galluccio".lower(), "D886"),
-    ("Giano Vetusto".lower(), "E011"),
-    ("Gioia Sannitica".lower(), "E039"),
-    ("Grazzanise".lower(), "E158"),
-    ("Gricignano di Aversa".lower(), "E173"),
-    ("Letino".lower(), "E554"),
-    ("Liberi".lower(), "E570"),
-    ("Lusciano".lower(), "E754"),
-    ("Macerata Campania".lower(), "E784"),
-    ("Maddaloni".lower(), "E791"),
-    ("Marcianise".lower(), "E932"),
-    ("Marzano Appio".lower(), "E998"),
-    ("Mignano Monte Lungo".lower(), "F203"),
-    ("Mondragone".lower(), "F352"),
-    ("Orta di Atella".lower(), "G130"),
-    ("Parete".lower(), "G333"),
-    ("Pastorano".lower(), "G364"),
-    ("Piana di Monte Verna".lower(), "G541"),
-    ("Piedimonte Matese".lower(), "G596"),
-    ("Pietramelara".lower(), "G620"),
-    ("Pietravairano".lower(), "G630"),
-    ("Pignataro Maggiore".lower(), "G661"),
-    ("Pontelatone".lower(), "G849"),
-    ("Portico di Caserta".lower(), "G903"),
-    ("Prata Sannita".lower(), "G991"),
-    ("Pratella".lower(), "G995"),
-    ("Presenzano".lower(), "H045"),
-    ("Raviscanina".lower(), "H202"),
-    ("Recale".lower(), "H210"),
-    ("Riardo".lower(), "H268"),
-    ("Rocca d'Evandro".lower(), "H398"),
-    ("Roccamonfina".lower(), "H423"),
-    ("Roccaromana".lower(), "H436"),
-    ("Rocchetta e Croce".lower(), "H459"),
-    ("Ruviano".lower(), "H165"),
-    ("San Cipriano d'Aversa".lower(), "H798"),
-    ("San Felice a Cancello".lower(), "H834"),
-    ("San Gregorio Matese".lower(), "H939"),
-    ("San Marcellino".lower(), "H978"),
-    ("San Nicola la Strada".lower(), "I056"),
-    ("San Pietro Infine".lower(), "I113"),
-    ("San Potito Sannitico".lower(), "I130"),
-    ("San Prisco".lower(), "I131"),
-    ("Santa Maria a Vico".lower(), "I233"),
-    ("Santa Maria Capua Vetere".lower(), "I234"),
-    ("Santa Maria la Fossa".lower(), "I247"),
-    ("San Tammaro".lower(), "I261"),
-    ("Sant'Angelo d'Alife".lower(), "I273"),
-    ("Sant'Arpino".lower(), "I306"),
-    ("Sessa Aurunca".lower(), "I676"),
-    ("Sparanise".lower(), "I885"),
-    ("Succivo".lower(), "I993"),
-    ("Teano".lower(), "L083"),
-    ("Teverola".lower(), "L155"),
-    ("Tora e Piccilli".lower(), "L205"),
-    ("Trentola-Ducenta".lower(), "L379"),
-    ("Vairano Patenora".lower(), "L540"),
-    ("Valle Agricola".lower(), "L594"),
-    ("Valle di Maddaloni".lower(), "L591"),
-    ("Villa di Briano".lower(), "D801"),
-    ("Villa Literno".lower(), "L844"),
-    ("Vitulazio".lower(), "M092"),
-    ("Falciano del Massico".lower(), "D471"),
-    ("Cellole".lower(), "M262"),
-    ("Casapesenna".lower(), "M260"),
-    ("San Marco Evangelista".lower(), "F043"),
-    ("Airola".lower(), "A110"),
-    ("Amorosi".lower(), "A265"),
-    ("Apice".lower(), "A328"),
-    ("Apollosa".lower(), "A330"),
-    ("Arpaia".lower(), "A431"),
-    ("Arpaise".lower(), "A432"),
-    ("Baselice".lower(), "A696"),
-    ("Benevento".lower(), "A783"),
-    ("Bonea".lower(), "A970"),
-    ("Bucciano".lower(), "B239"),
-    ("Buonalbergo".lower(), "B267"),
-    ("Calvi".lower(), "B444"),
-    ("Campolattaro".lower(), "B541"),
-    ("Campoli del Monte Taburno".lower(), "B542"),
-    ("Casalduni".lower(), "B873"),
-    ("Castelfranco in Miscano".lower(), "C106"),
-    ("Castelpagano".lower(), "C245"),
-    ("Castelpoto".lower(), "C250"),
-    ("Castelvenere".lower(), "C280"),
-    ("Castelvetere in Val Fortore".lower(), "C284"),
-    ("Cautano".lower(), "C359"),
-    ("Ceppaloni".lower(), "C476"),
-    ("Cerreto Sannita".lower(), "C525"),
-    ("Circello".lower(), "C719"),
-    ("Colle Sannita".lower(), "C846"),
-    ("Cusano Mutri".lower(), "D230"),
-    ("Dugenta".lower(), "D380"),
-    ("Durazzano".lower(), "D386"),
-    ("Faicchio".lower(), "D469"),
-    ("Foglianise".lower(), "D644"),
-    ("Foiano di Val Fortore".lower(), "D650"),
-    ("Forchia".lower(), "D693"),
-    ("Fragneto l'Abate".lower(), "D755"),
-    ("Fragneto Monforte".lower(), "D756"),
-    ("Frasso Telesino".lower(), "D784"),
-    ("Ginestra degli Schiavoni".lower(), "E034"),
-    ("Guardia Sanframondi".lower(), "E249"),
-    ("Limatola".lower(), "E589"),
-    ("Melizzano".lower(), "F113"),
-    ("Moiano".lower(), "F274"),
-    ("Molinara".lower(), "F287"),
-    ("Montefalcone di Val Fortore".lower(), "F494"),
-    ("Montesarchio".lower(), "F636"),
-    ("Morcone".lower(), "F717"),
-    ("Paduli".lower(), "G227"),
-    ("Pago Veiano".lower(), "G243"),
-    ("Pannarano".lower(), "G311"),
-    ("Paolisi".lower(), "G318"),
-    ("Paupisi".lower(), "G386"),
-    ("Pesco Sannita".lower(), "G494"),
-    ("Pietraroja".lower(), "G626"),
-    ("Pietrelcina".lower(), "G631"),
-    ("Ponte".lower(), "G827"),
-    ("Pontelandolfo".lower(), "G848"),
-    ("Puglianello".lower(), "H087"),
-    ("Reino".lower(), "H227"),
-    ("San Bartolomeo in Galdo".lower(), "H764"),
-    ("San Giorgio del Sannio".lower(), "H894"),
-    ("San Giorgio La Molara".lower(), "H898"),
-    ("San Leucio del Sannio".lower(), "H953"),
-    ("San Lorenzello".lower(), "H955"),
-    ("San Lorenzo Maggiore".lower(), "H967"),
-    ("San Lupo".lower(), "H973"),
-    ("San Marco dei Cavoti".lower(), "H984"),
-    ("San Martino Sannita".lower(), "I002"),
-    ("San Nazzaro".lower(), "I049"),
-    ("San Nicola Manfredi".lower(), "I062"),
-    ("San Salvatore Telesino".lower(), "I145"),
-    ("Santa Croce del Sannio".lower(), "I179"),
-    ("Sant'Agata de' Goti".lower(), "I197"),
-    ("Sant'Angelo a Cupolo".lower(), "I277"),
-    ("Sassinoro".lower(), "I455"),
-    ("Solopaca".lower(), "I809"),
-    ("Telese Terme".lower(), "L086"),
-    ("Tocco Caudio".lower(), "L185"),
-    ("Torrecuso".lower(), "L254"),
-    ("Vitulano".lower(), "M093"),
-    ("Sant'Arcangelo Trimonte".lower(), "F557"),
-    ("Acerra".lower(), "A024"),
-    ("Afragola".lower(), "A064"),
-    ("Agerola".lower(), "A068"),
-    ("Anacapri".lower(), "A268"),
-    ("Arzano".lower(), "A455"),
-    ("Bacoli".lower(), "A535"),
-    ("Barano d'Ischia".lower(), "A617"),
-    ("Boscoreale".lower(), "B076"),
-    ("Boscotrecase".lower(), "B077"),
-    ("Brusciano".lower(), "B227"),
-    ("Caivano".lower(), "B371"),
-    ("Calvizzano".lower(), "B452"),
-    ("Camposano".lower(), "B565"),
-    ("Capri".lower(), "B696"),
-    ("Carbonara di Nola".lower(), "B740"),
-    ("Cardito".lower(), "B759"),
-    ("Casalnuovo di Napoli".lower(), "B905"),
-    ("Casamarciano".lower(), "B922"),
-    ("Casamicciola Terme".lower(), "B924"),
-    ("Casandrino".lower(), "B925"),
-    ("Casavatore".lower(), "B946"),
-    ("Casola di Napoli".lower(), "B980"),
-    ("Casoria".lower(), "B990"),
-    ("Castellammare di Stabia".lower(), "C129"),
-    ("Castello di Cisterna".lower(), "C188"),
-    ("Cercola".lower(), "C495"),
-    ("Cicciano".lower(), "C675"),
-    ("Cimitile".lower(), "C697"),
-    ("Comiziano".lower(), "C929"),
-    ("Crispano".lower(), "D170"),
-    ("Forio".lower(), "D702"),
-    ("Frattamaggiore".lower(), "D789"),
-    ("Frattaminore".lower(), "D790"),
-    ("Giugliano in Campania".lower(), "E054"),
-    ("Gragnano".lower(), "E131"),
-    ("Grumo Nevano".lower(), "E224"),
-    ("Ischia".lower(), "E329"),
-    ("Lacco Ameno".lower(), "E396"),
-    ("Lettere".lower(), "E557"),
-    ("Liveri".lower(), "E620"),
-    ("Marano di Napoli".lower(), "E906"),
-    ("Mariglianella".lower(), "E954"),
-    ("Marigliano".lower(), "E955"),
-    ("Massa Lubrense".lower(), "F030"),
-    ("Melito di Napoli".lower(), "F111"),
-    ("Meta".lower(), "F162"),
-    ("Monte di Procida".lower(), "F488"),
-    ("Mugnano di Napoli".lower(), "F799"),
-    ("Napoli".lower(), "F839"),
-    ("Nola".lower(), "F924"),
-    ("Ottaviano".lower(), "G190"),
-    ("Palma Campania".lower(), "G283"),
-    ("Piano di Sorrento".lower(), "G568"),
-    ("Pimonte".lower(), "G670"),
-    ("Poggiomarino".lower(), "G762"),
-    ("Pollena Trocchia".lower(), "G795"),
-    ("Pomigliano d'Arco".lower(), "G812"),
-    ("Pompei".lower(), "G813"),
-    ("Portici".lower(), "G902"),
-    ("Pozzuoli".lower(), "G964"),
-    ("Procida".lower(), "H072"),
-    ("Qualiano".lower(), "H101"),
-    ("Quarto".lower(), "H114"),
-    ("Ercolano".lower(), "H243"),
-    ("Roccarainola".lower(), "H433"),
-    ("San Gennaro Vesuviano".lower(), "H860"),
-    ("San Giorgio a Cremano".lower(), "H892"),
-    ("San Giuseppe Vesuviano".lower(), "H931"),
-    ("San Paolo Bel Sito".lower(), "I073"),
-    ("San Sebastiano al Vesuvio".lower(), "I151"),
-    ("Sant'Agnello".lower(), "I208"),
-    ("Sant'Anastasia".lower(), "I262"),
-    ("Sant'Antimo".lower(), "I293"),
-    ("Sant'Antonio Abate".lower(), "I300"),
-    ("San Vitaliano".lower(), "I391"),
-    ("Saviano".lower(), "I469"),
-    ("Scisciano".lower(), "I540"),
-    ("Serrara Fontana".lower(), "I652"),
-    ("Somma Vesuviana".lower(), "I820"),
-    ("Sorrento".lower(), "I862"),
-    ("Striano".lower(), "I978"),
-    ("Terzigno".lower(), "L142"),
-    ("Torre Annunziata".lower(), "L245"),
-    ("Torre del Greco".lower(), "L259"),
-    ("Tufino".lower(), "L460"),
-    ("Vico Equense".lower(), "L845"),
-    ("Villaricca".lower(), "G309"),
-    ("Visciano".lower(), "M072"),
-    ("Volla".lower(), "M115"),
-    ("Santa Maria la Carità".lower(), "M273"),
-    ("Trecase".lower(), "M280"),
-    ("Massa di Somma".lower(), "M289"),
-    ("Aiello del Sabato".lower(), "A101"),
-    ("Altavilla Irpina".lower(), "A228"),
-    ("Andretta".lower(), "A284"),
-    ("Aquilonia".lower(), "A347"),
-    ("Ariano Irpino".lower(), "A399"),
-    ("Atripalda".lower(), "A489"),
-    ("Avella".lower(), "A508"),
-    ("Avellino".lower(), "A509"),
-    ("Bagnoli Irpino".lower(), "A566"),
-    ("Baiano".lower(), "A580"),
-    ("Bisaccia".lower(), "A881"),
-    ("Bonito".lower(), "A975"),
-    ("Cairano".lower(), "B367"),
-    ("Calabritto".lower(), "B374"),
-    ("Calitri".lower(), "B415"),
-    ("Candida".lower(), "B590"),
-    ("Caposele".lower(), "B674"),
-    ("Capriglia Irpina".lower(), "B706"),
-    ("Carife".lower(), "B776"),
-    ("Casalbore".lower(), "B866"),
-    ("Cassano Irpino".lower(), "B997"),
-    ("Castel Baronia".lower(), "C058"),
-    ("Castelfranci".lower(), "C105"),
-    ("Castelvetere sul Calore".lower(), "C283"),
-    ("Cervinara".lower(), "C557"),
-    ("Cesinali".lower(), "C576"),
-    ("Chianche".lower(), "C606"),
-    ("Chiusano di San Domenico".lower(), "C659"),
-    ("Contrada".lower(), "C971"),
-    ("Conza della Campania".lower(), "C976"),
-    ("Domicella".lower(), "D331"),
-    ("Flumeri".lower(), "D638"),
-    ("Fontanarosa".lower(), "D671"),
-    ("Forino".lower(), "D701"),
-    ("Frigento".lower(), "D798"),
-    ("Gesualdo".lower(), "D998"),
-    ("Greci".lower(), "E161"),
-    ("Grottaminarda".lower(), "E206"),
-    ("Grottolella".lower(), "E214"),
-    ("Guardia Lombardi".lower(), "E245"),
-    ("Lacedonia".lower(), "E397"),
-    ("Lapio".lower(), "E448"),
-    ("Lauro".lower(), "E487"),
-    ("Lioni".lower(), "E605"),
-    ("Luogosano".lower(), "E746"),
-    ("Manocalzati".lower(), "E891"),
-    ("Marzano di Nola".lower(), "E997"),
-    ("Melito Irpino".lower(), "F110"),
-    ("Mercogliano".lower(), "F141"),
-    ("Mirabella Eclano".lower(), "F230"),
-    ("Montaguto".lower(), "F397"),
-    ("Montecalvo Irpino".lower(), "F448"),
-    ("Montefalcione".lower(), "F491"),
-    ("Monteforte Irpino".lower(), "F506"),
-    ("Montefredane".lower(), "F511"),
-    ("Montefusco".lower(), "F512"),
-    ("Montella".lower(), "F546"),
-    ("Montemarano".lower(), "F559"),
-    ("Montemiletto".lower(), "F566"),
-    ("Monteverde".lower(), "F660"),
-    ("Morra De Sanctis".lower(), "F744"),
-    ("Moschiano".lower(), "F762"),
-    ("Mugnano del Cardinale".lower(), "F798"),
-    ("Nusco".lower(), "F988"),
-    ("Ospedaletto d'Alpinolo".lower(), "G165"),
-    ("Pago del Vallo di Lauro".lower(), "G242"),
-    ("Parolise".lower(), "G340"),
-    ("Paternopoli".lower(), "G370"),
-    ("Petruro Irpino".lower(), "G519"),
-    ("Pietradefusi".lower(), "G611"),
-    ("Pietrastornina".lower(), "G629"),
-    ("Prata di Principato Ultra".lower(), "G990"),
-    ("Pratola Serra".lower(), "H006"),
-    ("Quadrelle".lower(), "H097"),
-    ("Quindici".lower(), "H128"),
-    ("Roccabascerana".lower(), "H382"),
-    ("Rocca San Felice".lower(), "H438"),
-    ("Rotondi".lower(), "H592"),
-    ("Salza Irpina".lower(), "H733"),
-    ("San Mango sul Calore".lower(), "H975"),
-    ("San Martino Valle Caudina".lower(), "I016"),
-    ("San Michele di Serino".lower(), "I034"),
-    ("San Nicola Baronia".lower(), "I061"),
-    ("San Potito Ultra".lower(), "I129"),
-    ("San Sossio Baronia".lower(), "I163"),
-    ("Santa Lucia di Serino".lower(), "I219"),
-    ("Sant'Andrea di Conza".lower(), "I264"),
-    ("Sant'Angelo all'Esca".lower(), "I279"),
-    ("Sant'Angelo a Scala".lower(), "I280"),
-    ("Sant'Angelo dei Lombardi".lower(), "I281"),
-    ("Santa Paolina".lower(), "I301"),
-    ("Santo Stefano del Sole".lower(), "I357"),
-    ("Savignano Irpino".lower(), "I471"),
-    ("Scampitella".lower(), "I493"),
-    ("Senerchia".lower(), "I606"),
-    ("Serino".lower(), "I630"),
-    ("Sirignano".lower(), "I756"),
-    ("Solofra".lower(), "I805"),
-    ("Sorbo Serpico".lower(), "I843"),
-    ("Sperone".lower(), "I893"),
-    ("Sturno".lower(), "I990"),
-    ("Summonte".lower(), "L004"),
-    ("Taurano".lower(), "L061"),
-    ("Taurasi".lower(), "L062"),
-    ("Teora".lower(), "L102"),
-    ("Torella dei Lombardi".lower(), "L214"),
-    ("Torre Le Nocelle".lower(), "L272"),
-    ("Torrioni".lower(), "L301"),
-    ("Trevico".lower(), "L399"),
-    ("Tufo".lower(), "L461"),
-    ("Vallata".lower(), "L589"),
-    ("Vallesaccarda".lower(), "L616"),
-    ("Venticano".lower(), "L739"),
-    ("Villamaina".lower(), "L965"),
-    ("Villanova del Battista".lower(), "L973"),
-    ("Volturara Irpina".lower(), "M130"),
-    ("Zungoli".lower(), "M203"),
-    ("Montoro".lower(), "M330"),
-    ("Acerno".lower(), "A023"),
-    ("Agropoli".lower(), "A091"),
-    ("Albanella".lower(), "A128"),
-    ("Alfano".lower(), "A186"),
-    ("Altavilla Silentina".lower(), "A230"),
-    ("Amalfi".lower(), "A251"),
-    ("Angri".lower(), "A294"),
-    ("Aquara".lower(), "A343"),
-    ("Ascea".lower(), "A460"),
-    ("Atena Lucana".lower(), "A484"),
-    ("Atrani".lower(), "A487"),
-    ("Auletta".lower(), "A495"),
-    ("Baronissi".lower(), "A674"),
-    ("Battipaglia".lower(), "A717"),
-    ("Bellosguardo".lower(), "A756"),
-    ("Bracigliano".lower(), "B115"),
-    ("Buccino".lower(), "B242"),
-    ("Buonabitacolo".lower(), "B266"),
-    ("Caggiano".lower(), "B351"),
-    ("Calvanico".lower(), "B437"),
-    ("Camerota".lower(), "B476"),
-    ("Campagna".lower(), "B492"),
-    ("Campora".lower(), "B555"),
-    ("Cannalonga".lower(), "B608"),
-    ("Capaccio Paestum".lower(), "B644"),
-    ("Casalbuono".lower(), "B868"),
-    ("Casaletto Spartano".lower(), "B888"),
-    ("Casal Velino".lower(), "B895"),
-    ("Caselle in Pittari".lower(), "B959"),
-    ("Castelcivita".lower(), "C069"),
-    ("Castellabate".lower(), "C125"),
-    ("Castelnuovo Cilento".lower(), "C231"),
-    ("Castelnuovo di Conza".lower(), "C235"),
-    ("Castel San Giorgio".lower(), "C259"),
-    ("Castel San Lorenzo".lower(), "C262"),
-    ("Castiglione del Genovesi".lower(), "C306"),
-    ("Cava de' Tirreni".lower(), "C361"),
-    ("Celle di Bulgheria".lower(), "C444"),
-    ("Centola".lower(), "C470"),
-    ("Ceraso".lower(), "C485"),
-    ("Cetara".lower(), "C584"),
-    ("Cicerale".lower(), "C676"),
-    ("Colliano".lower(), "C879"),
-    ("Conca dei Marini".lower(), "C940"),
-    ("Controne".lower(), "C973"),
-    ("Contursi Terme".lower(), "C974"),
-    ("Corbara".lower(), "C984"),
-    ("Corleto Monforte".lower(), "D011"),
-    ("Cuccaro Vetere".lower(), "D195"),
-    ("Eboli".lower(), "D390"),
-    ("Felitto".lower(), "D527"),
-    ("Fisciano".lower(), "D615"),
-    ("Furore".lower(), "D826"),
-    ("Futani".lower(), "D832"),
-    ("Giffoni Sei Casali".lower(), "E026"),
-    ("Giffoni Valle Piana".lower(), "E027"),
-    ("Gioi".lower(), "E037"),
-    ("Giungano".lower(), "E060"),
-    ("Ispani".lower(), "E365"),
-    ("Laureana Cilento".lower(), "E480"),
-    ("Laurino".lower(), "E485"),
-    ("Laurito".lower(), "E486"),
-    ("Laviano".lower(), "E498"),
-    ("Lustra".lower(), "E767"),
-    ("Magliano Vetere".lower(), "E814"),
-    ("Maiori".lower(), "E839"),
-    ("Mercato San Severino".lower(), "F138"),
-    ("Minori".lower(), "F223"),
-    ("Moio della Civitella".lower(), "F278"),
-    ("Montano Antilia".lower(), "F426"),
-    ("Montecorice".lower(), "F479"),
-    ("Montecorvino Pugliano".lower(), "F480"),
-    ("Montecorvino Rovella".lower(), "F481"),
-    ("Monteforte Cilento".lower(), "F507"),
-    ("Monte San Giacomo".lower(), "F618"),
-    ("Montesano sulla Marcellana".lower(), "F625"),
-    ("Morigerati".lower(), "F731"),
-    ("Nocera Inferiore".lower(), "F912"),
-    ("Nocera Superiore".lower(), "F913"),
-    ("Novi Velia".lower(), "F967"),
-    ("Ogliastro Cilento".lower(), "G011"),
-    ("Olevano sul Tusciano".lower(), "G023"),
-    ("Oliveto Citra".lower(), "G039"),
-    ("Omignano".lower(), "G063"),
-    ("Orria".lower(), "G121"),
-    ("Ottati".lower(), "G192"),
-    ("Padula".lower(), "G226"),
-    ("Pagani".lower(), "G230"),
-    ("Palomonte".lower(), "G292"),
-    ("Pellezzano".lower(), "G426"),
-    ("Perdifumo".lower(), "G447"),
-    ("Perito".lower(), "G455"),
-    ("Pertosa".lower(), "G476"),
-    ("Petina".lower(), "G509"),
-    ("Piaggine".lower(), "G538"),
-    ("Pisciotta".lower(), "G707"),
-    ("Polla".lower(), "G793"),
-    ("Pollica".lower(), "G796"),
-    ("Pontecagnano Faiano".lower(), "G834"),
-    ("Positano".lower(), "G932"),
-    ("Postiglione".lower(), "G939"),
-    ("Praiano".lower(), "G976"),
-    ("Prignano Cilento".lower(), "H062"),
-    ("Ravello".lower(), "H198"),
-    ("Ricigliano".lower(), "H277"),
-    ("Roccadaspide".lower(), "H394"),
-    ("Roccagloriosa".lower(), "H412"),
-    ("Roccapiemonte".lower(), "H431"),
-    ("Rofrano".lower(), "H485"),
-    ("Romagnano al Monte".lower(), "H503"),
-    ("Roscigno".lower(), "H564"),
-    ("Rutino".lower(), "H644"),
-    ("Sacco".lower(), "H654"),
-    ("Sala Consilina".lower(), "H683"),
-    ("Salento".lower(), "H686"),
-    ("Salerno".lower(), "H703"),
-    ("Salvitelle".lower(), "H732"),
-    ("San Cipriano Picentino".lower(), "H800"),
-    ("San Giovanni a Piro".lower(), "H907"),
-    ("San Gregorio Magno".lower(), "H943"),
-    ("San Mango Piemonte".lower(), "H977"),
-    ("San Marzano sul Sarno".lower(), "I019"),
-    ("San Mauro Cilento".lower(), "I031"),
-    ("San Mauro la Bruca".lower(), "I032"),
-    ("San Pietro al Tanagro".lower(), "I089"),
-    ("San Rufo".lower(), "I143"),
-    ("Santa Marina".lower(), "I253"),
-    ("Sant'Angelo a Fasanella".lower(), "I278"),
-    ("Sant'Arsenio".lower(), "I307"),
-    ("Sant'Egidio del Monte Albino".lower(), "I317"),
-    ("Santomenna".lower(), "I260"),
-    ("San Valentino Torio".lower(), "I377"),
-    ("Sanza".lower(), "I410"),
-    ("Sapri".lower(), "I422"),
-    ("Sarno".lower(), "I438"),
-    ("Sassano".lower(), "I451"),
-    ("Scafati".lower(), "I483"),
-    ("Scala".lower(), "I486"),
-    ("Serramezzana".lower(), "I648"),
-    ("Serre".lower(), "I666"),
-    ("Sessa Cilento".lower(), "I677"),
-    ("Siano".lower(), "I720"),
-    ("Sicignano degli Alburni".lower(), "M253"),
-    ("Stella Cilento".lower(), "G887"),
-    ("Stio".lower(), "I960"),
-    ("Teggiano".lower(), "D292"),
-    ("Torchiara".lower(), "L212"),
-    ("Torraca".lower(), "L233"),
-    ("Torre Orsaia".lower(), "L274"),
-    ("Tortorella".lower(), "L306"),
-    ("Tramonti".lower(), "L323"),
-    ("Trentinara".lower(), "L377"),
-    ("Valle dell'Angelo".lower(), "G540"),
-    ("Vallo della Lucania".lower(), "L628"),
-    ("Valva".lower(), "L656"),
-    ("Vibonati".lower(), "L835"),
-    ("Vietri sul Mare".lower(), "L860"),
-    ("Bellizzi".lower(), "M294"),
-    ("Accadia".lower(), "A015"),
-    ("Alberona".lower(), "A150"),
-    ("Anzano di Puglia".lower(), "A320"),
-    ("Apricena".lower(), "A339"),
-    ("Ascoli Satriano".lower(), "A463"),
-    ("Biccari".lower(), "A854"),
-    ("Bovino".lower(), "B104"),
-    ("Cagnano Varano".lower(), "B357"),
-    ("Candela".lower(), "B584"),
-    ("Carapelle".lower(), "B724"),
-    ("Carlantino".lower(), "B784"),
-    ("Carpino".lower(), "B829"),
-    ("Casalnuovo Monterotaro".lower(), "B904"),
-    ("Casalvecchio di Puglia".lower(), "B917"),
-    ("Castelluccio dei Sauri".lower(), "C198"),
-    ("Castelluccio Valmaggiore".lower(), "C202"),
-    ("Castelnuovo della Daunia".lower(), "C222"),
-    ("Celenza Valfortore".lower(), "C429"),
-    ("Celle di San Vito".lower(), "C442"),
-    ("Cerignola".lower(), "C514"),
-    ("Chieuti".lower(), "C633"),
-    ("Deliceto".lower(), "D269"),
-    ("Faeto".lower(), "D459"),
-    ("Foggia".lower(), "D643"),
-    ("Ischitella".lower(), "E332"),
-    ("Isole Tremiti".lower(), "E363"),
-    ("Lesina".lower(), "E549"),
-    ("Lucera".lower(), "E716"),
-    ("Manfredonia".lower(), "E885"),
-    ("Mattinata".lower(), "F059"),
-    ("Monteleone di Puglia".lower(), "F538"),
-    ("Monte Sant'Angelo".lower(), "F631"),
-    ("Motta Montecorvino".lower(), "F777"),
-    ("Orsara di Puglia".lower(), "G125"),
-    ("Orta Nova".lower(), "G131"),
-    ("Panni".lower(), "G312"),
-    ("Peschici".lower(), "G487"),
-    ("Pietramontecorvino".lower(), "G604"),
-    ("Poggio Imperiale".lower(), "G761"),
-    ("Rignano Garganico".lower(), "H287"),
-    ("Rocchetta Sant'Antonio".lower(), "H467"),
-    ("Rodi Garganico".lower(), "H480"),
-    ("Roseto Valfortore".lower(), "H568"),
-    ("San Giovanni Rotondo".lower(), "H926"),
-    ("San Marco in Lamis".lower(), "H985"),
-    ("San Marco la Catola".lower(), "H986"),
-    ("San Nicandro Garganico".lower(), "I054"),
-    ("San Paolo di Civitate".lower(), "I072"),
-    ("San Severo".lower(), "I158"),
-    ("Sant'Agata di Puglia".lower(), "I193"),
-    ("Serracapriola".lower(), "I641"),
-    ("Stornara".lower(), "I962"),
-    ("Stornarella".lower(), "I963"),
-    ("Torremaggiore".lower(), "L273"),
-    ("Troia".lower(), "L447"),
-    ("Vico del Gargano".lower(), "L842"),
-    ("Vieste".lower(), "L858"),
-    ("Volturara Appula".lower(), "M131"),
-    ("Volturino".lower(), "M132"),
-    ("Ordona".lower(), "M266"),
-    ("Zapponeta".lower(), "M267"),
-    ("Acquaviva delle Fonti".lower(), "A048"),
-    ("Adelfia".lower(), "A055"),
-    ("Alberobello".lower(), "A149"),
-    ("Altamura".lower(), "A225"),
-    ("Bari".lower(), "A662"),
-    ("Binetto".lower(), "A874"),
-    ("Bitetto".lower(), "A892"),
-    ("Bitonto".lower(), "A893"),
-    ("Bitritto".lower(), "A894"),
-    ("Capurso".lower(), "B716"),
-    ("Casamassima".lower(), "B923"),
-    ("Cassano delle Murge".lower(), "B998"),
-    ("Castellana Grotte".lower(), "C134"),
-    ("Cellamare".lower(), "C436"),
-    ("Conversano".lower(), "C975"),
-    ("Corato".lower(), "C983"),
-    ("Gioia del Colle".lower(), "E038"),
-    ("Giovinazzo".lower(), "E047"),
-    ("Gravina in Puglia".lower(), "E155"),
-    ("Grumo Appula".lower(), "E223"),
-    ("Locorotondo".lower(), "E645"),
-    ("Modugno".lower(), "F262"),
-    ("Mola di Bari".lower(), "F280"),
-    ("Molfetta".lower(), "F284"),
-    ("Monopoli".lower(), "F376"),
-    ("Noci".lower(), "F915"),
-    ("Noicattaro".lower(), "F923"),
-    ("Palo del Colle".lower(), "G291"),
-    ("Poggiorsini".lower(), "G769"),
-    ("Polignano a Mare".lower(), "G787"),
-    ("Putignano".lower(), "H096"),
-    ("Rutigliano".lower(), "H643"),
-    ("Ruvo di Puglia".lower(), "H645"),
-    ("Sammichele di Bari".lower(), "H749"),
-    ("Sannicandro di Bari".lower(), "I053"),
-    ("Santeramo in Colle".lower(), "I330"),
-    ("Terlizzi".lower(), "L109"),
-    ("Toritto".lower(), "L220"),
-    ("Triggiano".lower(), "L425"),
-    ("Turi".lower(), "L472"),
-    ("Valenzano".lower(), "L571"),
-    ("Avetrana".lower(), "A514"),
-    ("Carosino".lower(), "B808"),
-    ("Castellaneta".lower(), "C136"),
-    ("Crispiano".lower(), "D171"),
-    ("Faggiano".lower(), "D463"),
-    ("Fragagnano".lower(), "D754"),
-    ("Ginosa".lower(), "E036"),
-    ("Grottaglie".lower(), "E205"),
-    ("Laterza".lower(), "E469"),
-    ("Leporano".lower(), "E537"),
-    ("Lizzano".lower(), "E630"),
-    ("Manduria".lower(), "E882"),
-    ("Martina Franca".lower(), "E986"),
-    ("Maruggio".lower(), "E995"),
-    ("Massafra".lower(), "F027"),
-    ("Monteiasi".lower(), "F531"),
-    ("Montemesola".lower(), "F563"),
-    ("Monteparano".lower(), "F587"),
-    ("Mottola".lower(), "F784"),
-    ("Palagianello".lower(), "G251"),
-    ("Palagiano".lower(), "G252"),
-    ("Pulsano".lower(), "H090"),
-    ("Roccaforzata".lower(), "H409"),
-    ("San Giorgio Ionico".lower(), "H882"),
-    ("San Marzano di San Giuseppe".lower(), "I018"),
-    ("Sava".lower(), "I467"),
-    ("Taranto".lower(), "L049"),
-    ("Torricella".lower(), "L294"),
-    ("Statte".lower(), "M298"),
-    ("Brindisi".lower(), "B180"),
-    ("Carovigno".lower(), "B809"),
-    ("Ceglie Messapica".lower(), "C424"),
-    ("Cellino San Marco".lower(), "C448"),
-    ("Cisternino".lower(), "C741"),
-    ("Erchie".lower(), "D422"),
-    ("Fasano".lower(), "D508"),
-    ("Francavilla Fontana".lower(), "D761"),
-    ("Latiano".lower(), "E471"),
-    ("Mesagne".lower(), "F152"),
-    ("Oria".lower(), "G098"),
-    ("Ostuni".lower(), "G187"),
-    ("San Donaci".lower(), "H822"),
-    ("San Michele Salentino".lower(), "I045"),
-    ("San Pancrazio Salentino".lower(), "I066"),
-    ("San Pietro Vernotico".lower(), "I119"),
-    ("San Vito dei Normanni".lower(), "I396"),
-    ("Torchiarolo".lower(), "L213"),
-    ("Torre Santa Susanna".lower(), "L280"),
-    ("Villa Castelli".lower(), "L920"),
-    ("Acquarica del Capo".lower(), "A042"),
-    ("Alessano".lower(), "A184"),
-    ("Alezio".lower(), "A185"),
-    ("Alliste".lower(), "A208"),
-    ("Andrano".lower(), "A281"),
-    ("Aradeo".lower(), "A350"),
-    ("Arnesano".lower(), "A425"),
-    ("Bagnolo del Salento".lower(), "A572"),
-    ("Botrugno".lower(), "B086"),
-    ("Calimera".lower(), "B413"),
-    ("Campi Salentina".lower(), "B506"),
-    ("Cannole".lower(), "B616"),
-    ("Caprarica di Lecce".lower(), "B690"),
-    ("Carmiano".lower(), "B792"),
-    ("Carpignano Salentino".lower(), "B822"),
-    ("Casarano".lower(), "B936"),
-    ("Castri di Lecce".lower(), "C334"),
-    ("Castrignano de' Greci".lower(), "C335"),
-    ("Castrignano del Capo".lower(), "C336"),
-    ("Cavallino".lower(), "C377"),
-    ("Collepasso".lower(), "C865"),
-    ("Copertino".lower(), "C978"),
-    ("Corigliano d'Otranto".lower(), "D006"),
-    ("Corsano".lower(), "D044"),
-    ("Cursi".lower(), "D223"),
-    ("Cutrofiano".lower(), "D237"),
-    ("Diso".lower(), "D305"),
-    ("Gagliano del Capo".lower(), "D851"),
-    ("Galatina".lower(), "D862"),
-    ("Galatone".lower(), "D863"),
-    ("Gallipoli".lower(), "D883"),
-    ("Giuggianello".lower(), "E053"),
-    ("Giurdignano".lower(), "E061"),
-    ("Guagnano".lower(), "E227"),
-    ("Lecce".lower(), "E506"),
-    ("Lequile".lower(), "E538"),
-    ("Leverano".lower(), "E563"),
-    ("Lizzanello".lower(), "E629"),
-    ("Maglie".lower(), "E815"),
-    ("Martano".lower(), "E979"),
-    ("Martignano".lower(), "E984"),
-    ("Matino".lower(), "F054"),
-    ("Melendugno".lower(), "F101"),
-    ("Melissano".lower(), "F109"),
-    ("Melpignano".lower(), "F117"),
-    ("Miggiano".lower(), "F194"),
-    ("Minervino di Lecce".lower(), "F221"),
-    ("Monteroni di Lecce".lower(), "F604"),
-    ("Montesano Salentino".lower(), "F623"),
-    ("Morciano di Leuca".lower(), "F716"),
-    ("Muro Leccese".lower(), "F816"),
-    ("Nardò".lower(), "F842"),
-    ("Neviano".lower(), "F881"),
-    ("Nociglia".lower(), "F916"),
-    ("Novoli".lower(), "F970"),
-    ("Ortelle".lower(), "G136"),
-    ("Otranto".lower(), "G188"),
-    ("Palmariggi".lower(), "G285"),
-    ("Parabita".lower(), "G325"),
-    ("Patù".lower(), "G378"),
-    ("Poggiardo".lower(), "G751"),
-    ("Presicce".lower(), "H047"),
-    ("Racale".lower(), "H147"),
-    ("Ruffano".lower(), "H632"),
-    ("Salice Salentino".lower(), "H708"),
-    ("Salve".lower(), "H729"),
-    ("Sanarica".lower(), "H757"),
-    ("San Cesario di Lecce".lower(), "H793"),
-    ("San Donato di Lecce".lower(), "H826"),
-    ("Sannicola".lower(), "I059"),
-    ("San Pietro in Lama".lower(), "I115"),
-    ("Santa Cesarea Terme".lower(), "I172"),
-    ("Scorrano".lower(), "I549"),
-    ("Seclì".lower(), "I559"),
-    ("Sogliano Cavour".lower(), "I780"),
-    ("Soleto".lower(), "I800"),
-    ("Specchia".lower(), "I887"),
-    ("Spongano".lower(), "I923"),
-    ("Squinzano".lower(), "I930"),
-    ("Sternatia".lower(), "I950"),
-    ("Supersano".lower(), "L008"),
-    ("Surano".lower(), "L010"),
-    ("Surbo".lower(), "L011"),
-    ("Taurisano".lower(), "L064"),
-    ("Taviano".lower(), "L074"),
-    ("Tiggiano".lower(), "L166"),
-    ("Trepuzzi".lower(), "L383"),
-    ("Tricase".lower(), "L419"),
-    ("Tuglie".lower(), "L462"),
-    ("Ugento".lower(), "L484"),
-    ("Uggiano la Chiesa".lower(), "L485"),
-    ("Veglie".lower(), "L711"),
-    ("Vernole".lower(), "L776"),
-    ("Zollino".lower(), "M187"),
-    ("San Cassiano".lower(), "M264"),
-    ("Castro".lower(), "M261"),
-    ("Porto Cesareo".lower(), "M263"),
-    ("Andria".lower(), "A285"),
-    ("Barletta".lower(), "A669"),
-    ("Bisceglie".lower(), "A883"),
-    ("Canosa di Puglia".lower(), "B619"),
-    ("Margherita di Savoia".lower(), "E946"),
-    ("Minervino Murge".lower(), "F220"),
-    ("San Ferdinando di Puglia".lower(), "H839"),
-    ("Spinazzola".lower(), "I907"),
-    ("Trani".lower(), "L328"),
-    ("Trinitapoli".lower(), "B915"),
-    ("Abriola".lower(), "A013"),
-    ("Acerenza".lower(), "A020"),
-    ("Albano di Lucania".lower(), "A131"),
-    ("Anzi".lower(), "A321"),
-    ("Armento".lower(), "A415"),
-    ("Atella".lower(), "A482"),
-    ("Avigliano".lower(), "A519"),
-    ("Balvano".lower(), "A604"),
-    ("Banzi".lower(), "A612"),
-    ("Baragiano".lower(), "A615"),
-    ("Barile".lower(), "A666"),
-    ("Bella".lower(), "A743"),
-    ("Brienza".lower(), "B173"),
-    ("Brindisi Montagna".lower(), "B181"),
-    ("Calvello".lower(), "B440"),
-    ("Calvera".lower(), "B443"),
-    ("Campomaggiore".lower(), "B549"),
-    ("Cancellara".lower(), "B580"),
-    ("Carbone".lower(), "B743"),
-    ("San Paolo Albanese".lower(), "B906"),
-    ("Castelgrande".lower(), "C120"),
-    ("Castelluccio Inferiore".lower(), "C199"),
-    ("Castelluccio Superiore".lower(), "C201"),
-    ("Castelmezzano".lower(), "C209"),
-    ("Castelsaraceno".lower(), "C271"),
-    ("Castronuovo di Sant'Andrea".lower(), "C345"),
-    ("Cersosimo".lower(), "C539"),
-    ("Chiaromonte".lower(), "C619"),
-    ("Corleto Perticara".lower(), "D010"),
-    ("Episcopia".lower(), "D414"),
-    ("Fardella".lower(), "D497"),
-    ("Filiano".lower(), "D593"),
-    ("Forenza".lower(), "D696"),
-    ("Francavilla in Sinni".lower(), "D766"),
-    ("Gallicchio".lower(), "D876"),
-    ("Genzano di Lucania".lower(), "D971"),
-    ("Grumento Nova".lower(), "E221"),
-    ("Guardia Perticara".lower(), "E246"),
-    ("Lagonegro".lower(), "E409"),
-    ("Latronico".lower(), "E474"),
-    ("Laurenzana".lower(), "E482"),
-    ("Lauria".lower(), "E483"),
-    ("Lavello".lower(), "E493"),
-    ("Maratea".lower(), "E919"),
-    ("Marsico Nuovo".lower(), "E976"),
-    ("Marsicovetere".lower(), "E977"),
-    ("Maschito".lower(), "F006"),
-    ("Melfi".lower(), "F104"),
-    ("Missanello".lower(), "F249"),
-    ("Moliterno".lower(), "F295"),
-    ("Montemilone".lower(), "F568"),
-    ("Montemurro".lower(), "F573"),
-    ("Muro Lucano".lower(), "F817"),
-    ("Nemoli".lower(), "F866"),
-    ("Noepoli".lower(), "F917"),
-    ("Oppido Lucano".lower(), "G081"),
-    ("Palazzo San Gervasio".lower(), "G261"),
-    ("Pescopagano".lower(), "G496"),
-    ("Picerno".lower(), "G590"),
-    ("Pietragalla".lower(), "G616"),
-    ("Pietrapertosa".lower(), "G623"),
-    ("Pignola".lower(), "G663"),
-    ("Potenza".lower(), "G942"),
-    ("Rapolla".lower(), "H186"),
-    ("Rapone".lower(), "H187"),
-    ("Rionero in Vulture".lower(), "H307"),
-    ("Ripacandida".lower(), "H312"),
-    ("Rivello".lower(), "H348"),
-    ("Roccanova".lower(), "H426"),
-    ("Rotonda".lower(), "H590"),
-    ("Ruoti".lower(), "H641"),
-    ("Ruvo del Monte".lower(), "H646"),
-    ("San Chirico Nuovo".lower(), "H795"),
-    ("San Chirico Raparo".lower(), "H796"),
-    ("San Costantino Albanese".lower(), "H808"),
-    ("San Fele".lower(), "H831"),
-    ("San Martino d'Agri".lower(), "H994"),
-    ("San Severino Lucano".lower(), "I157"),
-    ("Sant'Angelo Le Fratte".lower(), "I288"),
-    ("Sant'Arcangelo".lower(), "I305"),
-    ("Sarconi".lower(), "I426"),
-    ("Sasso di Castalda".lower(), "I457"),
-    ("Satriano di Lucania".lower(), "G614"),
-    ("Savoia di Lucania".lower(), "H730"),
-    ("Senise".lower(), "I610"),
-    ("Spinoso".lower(), "I917"),
-    ("Teana".lower(), "L082"),
-    ("Terranova di Pollino".lower(), "L126"),
-    ("Tito".lower(), "L181"),
-    ("Tolve".lower(), "L197"),
-    ("Tramutola".lower(), "L326"),
-    ("Trecchina".lower(), "L357"),
-    ("Trivigno".lower(), "L439"),
-    ("Vaglio Basilicata".lower(), "L532"),
-    ("Venosa".lower(), "L738"),
-    ("Vietri di Potenza".lower(), "L859"),
-    ("Viggianello".lower(), "L873"),
-    ("Viggiano".lower(), "L874"),
-    ("Ginestra".lower(), "E033"),
-    ("Paterno".lower(), "M269"),
-    ("Accettura".lower(), "A017"),
-    ("Aliano".lower(), "A196"),
-    ("Bernalda".lower(), "A801"),
-    ("Calciano".lower(), "B391"),
-    ("Cirigliano".lower(), "C723"),
-    ("Colobraro".lower(), "C888"),
-    ("Craco".lower(), "D128"),
-    ("Ferrandina".lower(), "D547"),
-    ("Garaguso".lower(), "D909"),
-    ("Gorgoglione".lower(), "E093"),
-    ("Grassano".lower(), "E147"),
-    ("Grottole".lower(), "E213"),
-    ("Irsina".lower(), "E326"),
-    ("Matera".lower(), "F052"),
-    ("Miglionico".lower(), "F201"),
-    ("Montalbano Jonico".lower(), "F399"),
-    ("Montescaglioso".lower(), "F637"),
-    ("Nova Siri".lower(), "A942"),
-    ("Oliveto Lucano".lower(), "G037"),
-    ("Pisticci".lower(), "G712"),
-    ("Policoro".lower(), "G786"),
-    ("Pomarico".lower(), "G806"),
-    ("Rotondella".lower(), "H591"),
-    ("Salandra".lower(), "H687"),
-    ("San Giorgio Lucano".lower(), "H888"),
-    ("San Mauro Forte".lower(), "I029"),
-    ("Stigliano".lower(), "I954"),
-    ("Tricarico".lower(), "L418"),
-    ("Tursi".lower(), "L477"),
-    ("Valsinni".lower(), "D513"),
-    ("Scanzano Jonico".lower(), "M256"),
-    ("Acquaformosa".lower(), "A033"),
-    ("Acquappesa".lower(), "A041"),
-    ("Acri".lower(), "A053"),
-    ("Aiello Calabro".lower(), "A102"),
-    ("Aieta".lower(), "A105"),
-    ("Albidona".lower(), "A160"),
-    ("Alessandria del Carretto".lower(), "A183"),
-    ("Altilia".lower(), "A234"),
-    ("Altomonte".lower(), "A240"),
-    ("Amantea".lower(), "A253"),
-    ("Amendolara".lower(), "A263"),
-    ("Aprigliano".lower(), "A340"),
-    ("Belmonte Calabro".lower(), "A762"),
-    ("Belsito".lower(), "A768"),
-    ("Belvedere Marittimo".lower(), "A773"),
-    ("Bianchi".lower(), "A842"),
-    ("Bisignano".lower(), "A887"),
-    ("Bocchigliero".lower(), "A912"),
-    ("Bonifati".lower(), "A973"),
-    ("Buonvicino".lower(), "B270"),
-    ("Calopezzati".lower(), "B424"),
-    ("Caloveto".lower(), "B426"),
-    ("Campana".lower(), "B500"),
-    ("Canna".lower(), "B607"),
-    ("Cariati".lower(), "B774"),
-    ("Carolei".lower(), "B802"),
-    ("Carpanzano".lower(), "B813"),
-    ("Casole Bruzio".lower(), "B983"),
-    ("Cassano all'Ionio".lower(), "C002"),
-    ("Castiglione Cosentino".lower(), "C301"),
-    ("Castrolibero".lower(), "C108"),
-    ("Castroregio".lower(), "C348"),
-    ("Castrovillari".lower(), "C349"),
-    ("Celico".lower(), "C430"),
-    ("Cellara".lower(), "C437"),
-    ("Cerchiara di Calabria".lower(), "C489"),
-    ("Cerisano".lower(), "C515"),
-    ("Cervicati".lower(), "C554"),
-    ("Cerzeto".lower(), "C560"),
-    ("Cetraro".lower(), "C588"),
-    ("Civita".lower(), "C763"),
-    ("Cleto".lower(), "C795"),
-    ("Colosimi".lower(), "C905"),
-    ("Corigliano Calabro".lower(), "D005"),
-    ("Cosenza".lower(), "D086"),
-    ("Cropalati".lower(), "D180"),
-    ("Crosia".lower(), "D184"),
-    ("Diamante".lower(), "D289"),
-    ("Dipignano".lower(), "D304"),
-    ("Domanico".lower(), "D328"),
-    ("Fagnano Castello".lower(), "D464"),
-    ("Falconara Albanese".lower(), "D473"),
-    ("Figline Vegliaturo".lower(), "D582"),
-    ("Firmo".lower(), "D614"),
-    ("Fiumefreddo Bruzio".lower(), "D624"),
-    ("Francavilla Marittima".lower(), "D764"),
-    ("Frascineto".lower(), "D774"),
-    ("Fuscaldo".lower(), "D828"),
-    ("Grimaldi".lower(), "E180"),
-    ("Grisolia".lower(), "E185"),
-    ("Guardia Piemontese".lower(), "E242"),
-    ("Lago".lower(), "E407"),
-    ("Laino Borgo".lower(), "E417"),
-    ("Laino Castello".lower(), "E419"),
-    ("Lappano".lower(), "E450"),
-    ("Lattarico".lower(), "E475"),
-    ("Longobardi".lower(), "E677"),
-    ("Longobucco".lower(), "E678"),
-    ("Lungro".lower(), "E745"),
-    ("Luzzi".lower(), "E773"),
-    ("Maierà".lower(), "E835"),
-    ("Malito".lower(), "E859"),
-    ("Malvito".lower(), "E872"),
-    ("Mandatoriccio".lower(), "E878"),
-    ("Mangone".lower(), "E888"),
-    ("Marano Marchesato".lower(), "E914"),
-    ("Marano Principato".lower(), "E915"),
-    ("Marzi".lower(), "F001"),
-    ("Mendicino".lower(), "F125"),
-    ("Mongrassano".lower(), "F370"),
-    ("Montalto Uffugo".lower(), "F416"),
-    ("Montegiordano".lower(), "F519"),
-    ("Morano Calabro".lower(), "F708"),
-    ("Mormanno".lower(), "F735"),
-    ("Mottafollone".lower(), "F775"),
-    ("Nocara".lower(), "F907"),
-    ("Oriolo".lower(), "G110"),
-    ("Orsomarso".lower(), "G129"),
-    ("Paludi".lower(), "G298"),
-    ("Panettieri".lower(), "G307"),
-    ("Paola".lower(), "G317"),
-    ("Papasidero".lower(), "G320"),
-    ("Parenti".lower(), "G331"),
-    ("Paterno Calabro".lower(), "G372"),
-    ("Pedace".lower(), "G400"),
-    ("Pedivigliano".lower(), "G411"),
-    ("Piane Crati".lower(), "G553"),
-    ("Pietrafitta".lower(), "G615"),
-    ("Pietrapaola".lower(), "G622"),
-    ("Plataci".lower(), "G733"),
-    ("Praia a Mare".lower(), "G975"),
-    ("Rende".lower(), "H235"),
-    ("Rocca Imperiale".lower(), "H416"),
-    ("Roggiano Gravina".lower(), "H488"),
-    ("Rogliano".lower(), "H490"),
-    ("Rose".lower(), "H565"),
-    ("Roseto Capo Spulico".lower(), "H572"),
-    ("Rossano".lower(), "H579"),
-    ("Rota Greca".lower(), "H585"),
-    ("Rovito".lower(), "H621"),
-    ("San Basile".lower(), "H765"),
-    ("San Benedetto Ullano".lower(), "H774"),
-    ("San Cosmo Albanese".lower(), "H806"),
-    ("San Demetrio Corone".lower(), "H818"),
-    ("San Donato di Ninea".lower(), "H825"),
-    ("San Fili".lower(), "H841"),
-    ("Sangineto".lower(), "H877"),
-    ("San Giorgio Albanese".lower(), "H881"),
-    ("San Giovanni in Fiore".lower(), "H919"),
-    ("San Lorenzo Bellizzi".lower(), "H961"),
-    ("San Lorenzo del Vallo".lower(), "H962"),
-    ("San Lucido".lower(), "H971"),
-    ("San Marco Argentano".lower(), "H981"),
-    ("San Martino di Finita".lower(), "H992"),
-    ("San Nicola Arcella".lower(), "I060"),
-    ("San Pietro in Amantea".lower(), "I108"),
-    ("San Pietro in Guarano".lower(), "I114"),
-    ("San Sosti".lower(), "I165"),
-    ("Santa Caterina Albanese".lower(), "I171"),
-    ("Santa Domenica Talao".lower(), "I183"),
-    ("Sant'Agata di Esaro".lower(), "I192"),
-    ("Santa Maria del Cedro".lower(), "C717"),
-    ("Santa Sofia d'Epiro".lower(), "I309"),
-    ("Santo Stefano di Rogliano".lower(), "I359"),
-    ("San Vincenzo La Costa".lower(), "I388"),
-    ("Saracena".lower(), "I423"),
-    ("Scala Coeli".lower(), "I485"),
-    ("Scalea".lower(), "I489"),
-    ("Scigliano".lower(), "D290"),
-    ("Serra d'Aiello".lower(), "I642"),
-    ("Serra Pedace".lower(), "I650"),
-    ("Spezzano Albanese".lower(), "I895"),
-    ("Spezzano della Sila".lower(), "I896"),
-    ("Spezzano Piccolo".lower(), "I898"),
-    ("Tarsia".lower(), "L055"),
-    ("Terranova da Sibari".lower(), "L124"),
-    ("Terravecchia".lower(), "L134"),
-    ("Torano Castello".lower(), "L206"),
-    ("Tortora".lower(), "L305"),
-    ("Trebisacce".lower(), "L353"),
-    ("Trenta".lower(), "L375"),
-    ("Vaccarizzo Albanese".lower(), "L524"),
-    ("Verbicaro".lower(), "L747"),
-    ("Villapiana".lower(), "B903"),
-    ("Zumpano".lower(), "M202"),
-    ("Albi".lower(), "A155"),
-    ("Amaroni".lower(), "A255"),
-    ("Amato".lower(), "A257"),
-    ("Andali".lower(), "A272"),
-    ("Argusto".lower(), "A397"),
-    ("Badolato".lower(), "A542"),
-    ("Belcastro".lower(), "A736"),
-    ("Borgia".lower(), "B002"),
-    ("Botricello".lower(), "B085"),
-    ("Caraffa di Catanzaro".lower(), "B717"),
-    ("Cardinale".lower(), "B758"),
-    ("Carlopoli".lower(), "B790"),
-    ("Catanzaro".lower(), "C352"),
-    ("Cenadi".lower(), "C453"),
-    ("Centrache".lower(), "C472"),
-    ("Cerva".lower(), "C542"),
-    ("Chiaravalle Centrale".lower(), "C616"),
-    ("Cicala".lower(), "C674"),
-    ("Conflenti".lower(), "C960"),
-    ("Cortale".lower(), "D049"),
-    ("Cropani".lower(), "D181"),
-    ("Curinga".lower(), "D218"),
-    ("Davoli".lower(), "D257"),
-    ("Decollatura".lower(), "D261"),
-    ("Falerna".lower(), "D476"),
-    ("Feroleto Antico".lower(), "D544"),
-    ("Fossato Serralta".lower(), "D744"),
-    ("Gagliato".lower(), "D852"),
-    ("Gasperina".lower(), "D932"),
-    ("Gimigliano".lower(), "E031"),
-    ("Girifalco".lower(), "E050"),
-    ("Gizzeria".lower(), "E068"),
-    ("Guardavalle".lower(), "E239"),
-    ("Isca sullo Ionio".lower(), "E328"),
-    ("Jacurso".lower(), "E274"),
-    ("Magisano".lower(), "E806"),
-    ("Maida".lower(), "E834"),
-    ("Marcedusa".lower(), "E923"),
-    ("Marcellinara".lower(), "E925"),
-    ("Martirano".lower(), "E990"),
-    ("Martirano Lombardo".lower(), "E991"),
-    ("Miglierina".lower(), "F200"),
-    ("Montauro".lower(), "F432"),
-    ("Montepaone".lower(), "F586"),
-    ("Motta Santa Lucia".lower(), "F780"),
-    ("Nocera Terinese".lower(), "F910"),
-    ("Olivadi".lower(), "G034"),
-    ("Palermiti".lower(), "G272"),
-    ("Pentone".lower(), "G439"),
-    ("Petrizzi".lower(), "G517"),
-    ("Petronà".lower(), "G518"),
-    ("Pianopoli".lower(), "D546"),
-    ("Platania".lower(), "G734"),
-    ("San Floro".lower(), "H846"),
-    ("San Mango d'Aquino".lower(), "H976"),
-    ("San Pietro a Maida".lower(), "I093"),
-    ("San Pietro Apostolo".lower(), "I095"),
-    ("San Sostene".lower(), "I164"),
-    ("Santa Caterina dello Ionio".lower(), "I170"),
-    ("Sant'Andrea Apostolo dello Ionio".lower(), "I266"),
-    ("San Vito sullo Ionio".lower(), "I393"),
-    ("Satriano".lower(), "I463"),
-    ("Sellia".lower(), "I589"),
-    ("Sellia Marina".lower(), "I590"),
-    ("Serrastretta".lower(), "I655"),
-    ("Sersale".lower(), "I671"),
-    ("Settingiano".lower(), "I704"),
-    ("Simeri Crichi".lower(), "I745"),
-    ("Sorbo San Basile".lower(), "I844"),
-    ("Soverato".lower(), "I872"),
-    ("Soveria Mannelli".lower(), "I874"),
-    ("Soveria Simeri".lower(), "I875"),
-    ("Squillace".lower(), "I929"),
-    ("Stalettì".lower(), "I937"),
-    ("Taverna".lower(), "L070"),
-    ("Tiriolo".lower(), "L177"),
-    ("Torre di Ruggiero".lower(), "L240"),
-    ("Vallefiorita".lower(), "I322"),
-    ("Zagarise".lower(), "M140"),
-    ("Lamezia Terme".lower(), "M208"),
-    ("Africo".lower(), "A065"),
-    ("Agnana Calabra".lower(), "A077"),
-    ("Anoia".lower(), "A303"),
-    ("Antonimina".lower(), "A314"),
-    ("Ardore".lower(), "A385"),
-    ("Bagaladi".lower(), "A544"),
-    ("Bagnara Calabra".lower(), "A552"),
-    ("Benestare".lower(), "A780"),
-    ("Bianco".lower(), "A843"),
-    ("Bivongi".lower(), "A897"),
-    ("Bova".lower(), "B097"),
-    ("Bovalino".lower(), "B098"),
-    ("Bova Marina".lower(), "B099"),
-    ("Brancaleone".lower(), "B118"),
-    ("Bruzzano Zeffirio".lower(), "B234"),
-    ("Calanna".lower(), "B379"),
-    ("Camini".lower(), "B481"),
-    ("Campo Calabro".lower(), "B516"),
-    ("Candidoni".lower(), "B591"),
-    ("Canolo".lower(), "B617"),
-    ("Caraffa del Bianco".lower(), "B718"),
-    ("Cardeto".lower(), "B756"),
-    ("Careri".lower(), "B766"),
-    ("Casignana".lower(), "B966"),
-    ("Caulonia".lower(), "C285"),
-    ("Ciminà".lower(), "C695"),
-    ("Cinquefrondi".lower(), "C710"),
-    ("Cittanova".lower(), "C747"),
-    ("Condofuri".lower(), "C954"),
-    ("Cosoleto".lower(), "D089"),
-    ("Delianuova".lower(), "D268"),
-    ("Feroleto della Chiesa".lower(), "D545"),
-    ("Ferruzzano".lower(), "D557"),
-    ("Fiumara".lower(), "D619"),
-    ("Galatro".lower(), "D864"),
-    ("Gerace".lower(), "D975"),
-    ("Giffone".lower(), "E025"),
-    ("Gioia Tauro".lower(), "E041"),
-    ("Gioiosa Ionica".lower(), "E044"),
-    ("Grotteria".lower(), "E212"),
-    ("Laganadi".lower(), "E402"),
-    ("Laureana di Borrello".lower(), "E479"),
-    ("Locri".lower(), "D976"),
-    ("Mammola".lower(), "E873"),
-    ("Marina di Gioiosa Ionica".lower(), "E956"),
-    ("Maropati".lower(), "E968"),
-    ("Martone".lower(), "E993"),
-    ("Melicuccà".lower(), "F105"),
-    ("Melicucco".lower(), "F106"),
-    ("Melito di Porto Salvo".lower(), "F112"),
-    ("Molochio".lower(), "F301"),
-    ("Monasterace".lower(), "F324"),
-    ("Montebello Ionico".lower(), "D746"),
-    ("Motta San Giovanni".lower(), "F779"),
-    ("Oppido Mamertina".lower(), "G082"),
-    ("Palizzi".lower(), "G277"),
-    ("Palmi".lower(), "G288"),
-    ("Pazzano".lower(), "G394"),
-    ("Placanica".lower(), "G729"),
-    ("Platì".lower(), "G735"),
-    ("Polistena".lower(), "G791"),
-    ("Portigliola".lower(), "G905"),
-    ("Reggio di Calabria".lower(), "H224"),
-    ("Riace".lower(), "H265"),
-    ("Rizziconi".lower(), "H359"),
-    ("Roccaforte del Greco".lower(), "H408"),
-    ("Roccella Ionica".lower(), "H456"),
-    ("Roghudi".lower(), "H489"),
-    ("Rosarno".lower(), "H558"),
-    ("Samo".lower(), "H013"),
-    ("San Giorgio Morgeto".lower(), "H889"),
-    ("San Giovanni di Gerace".lower(), "H903"),
-    ("San Lorenzo".lower(), "H959"),
-    ("San Luca".lower(), "H970"),
-    ("San Pietro di Caridà".lower(), "I102"),
-    ("San Procopio".lower(), "I132"),
-    ("San Roberto".lower(), "I139"),
-    ("Santa Cristina d'Aspromonte".lower(), "I176"),
-    ("Sant'Agata del Bianco".lower(), "I198"),
-    ("Sant'Alessio in Aspromonte".lower(), "I214"),
-    ("Sant'Eufemia d'Aspromonte".lower(), "I333"),
-    ("Sant'Ilario dello Ionio".lower(), "I341"),
-    ("Santo Stefano in Aspromonte".lower(), "I371"),
-    ("Scido".lower(), "I536"),
-    ("Scilla".lower(), "I537"),
-    ("Seminara".lower(), "I600"),
-    ("Serrata".lower(), "I656"),
-    ("Siderno".lower(), "I725"),
-    ("Sinopoli".lower(), "I753"),
-    ("Staiti".lower(), "I936"),
-    ("Stignano".lower(), "I955"),
-    ("Stilo".lower(), "I956"),
-    ("Taurianova".lower(), "L063"),
-    ("Terranova Sappo Minulio".lower(), "L127"),
-    ("Varapodio".lower(), "L673"),
-    ("Villa San Giovanni".lower(), "M018"),
-    ("San Ferdinando".lower(), "M277"),
-    ("Belvedere di Spinello".lower(), "A772"),
-    ("Caccuri".lower(), "B319"),
-    ("Carfizzi".lower(), "B771"),
-    ("Casabona".lower(), "B857"),
-    ("Castelsilano".lower(), "B968"),
-    ("Cerenzia".lower(), "C501"),
-    ("Cirò".lower(), "C725"),
-    ("Cirò Marina".lower(), "C726"),
-    ("Cotronei".lower(), "D123"),
-    ("Crotone".lower(), "D122"),
-    ("Crucoli".lower(), "D189"),
-    ("Cutro".lower(), "D236"),
-    ("Isola di Capo Rizzuto".lower(), "E339"),
-    ("Melissa".lower(), "F108"),
-    ("Mesoraca".lower(), "F157"),
-    ("Pallagorio".lower(), "G278"),
-    ("Petilia Policastro".lower(), "G508"),
-    ("Roccabernarda".lower(), "H383"),
-    ("Rocca di Neto".lower(), "H403"),
-    ("San Mauro Marchesato".lower(), "I026"),
-    ("San Nicola dell'Alto".lower(), "I057"),
-    ("Santa Severina".lower(), "I308"),
-    ("Savelli".lower(), "I468"),
-    ("Scandale".lower(), "I494"),
-    ("Strongoli".lower(), "I982"),
-    ("Umbriatico".lower(), "L492"),
-    ("Verzino".lower(), "L802"),
-    ("Acquaro".lower(), "A043"),
-    ("Arena".lower(), "A386"),
-    ("Briatico".lower(), "B169"),
-    ("Brognaturo".lower(), "B197"),
-    ("Capistrano".lower(), "B655"),
-    ("Cessaniti".lower(), "C581"),
-    ("Dasà".lower(), "D253"),
-    ("Dinami".lower(), "D303"),
-    ("Drapia".lower(), "D364"),
-    ("Fabrizia".lower(), "D453"),
-    ("Filadelfia".lower(), "D587"),
-    ("Filandari".lower(), "D589"),
-    ("Filogaso".lower(), "D596"),
-    ("Francavilla Angitola".lower(), "D762"),
-    ("Francica".lower(), "D767"),
-    ("Gerocarne".lower(), "D988"),
-    ("Ionadi".lower(), "E321"),
-    ("Joppolo".lower(), "E389"),
-    ("Limbadi".lower(), "E590"),
-    ("Maierato".lower(), "E836"),
-    ("Mileto".lower(), "F207"),
-    ("Mongiana".lower(), "F364"),
-    ("Monterosso Calabro".lower(), "F607"),
-    ("Nardodipace".lower(), "F843"),
-    ("Nicotera".lower(), "F893"),
-    ("Parghelia".lower(), "G335"),
-    ("Pizzo".lower(), "G722"),
-    ("Pizzoni".lower(), "G728"),
-    ("Polia".lower(), "G785"),
-    ("Ricadi".lower(), "H271"),
-    ("Rombiolo".lower(), "H516"),
-    ("San Calogero".lower(), "H785"),
-    ("San Costantino Calabro".lower(), "H807"),
-    ("San Gregorio d'Ippona".lower(), "H941"),
-    ("San Nicola da Crissa".lower(), "I058"),
-    ("Sant'Onofrio".lower(), "I350"),
-    ("Serra San Bruno".lower(), "I639"),
-    ("Simbario".lower(), "I744"),
-    ("Sorianello".lower(), "I853"),
-    ("Soriano Calabro".lower(), "I854"),
-    ("Spadola".lower(), "I884"),
-    ("Spilinga".lower(), "I905"),
-    ("Stefanaconi".lower(), "I945"),
-    ("Tropea".lower(), "L452"),
-    ("Vallelonga".lower(), "L607"),
-    ("Vazzano".lower(), "L699"),
-    ("Vibo Valentia".lower(), "F537"),
-    ("Zaccanopoli".lower(), "M138"),
-    ("Zambrone".lower(), "M143"),
-    ("Zungri".lower(), "M204"),
-    ("Alcamo".lower(), "A176"),
-    ("Buseto Palizzolo".lower(), "B288"),
-    ("Calatafimi-Segesta".lower(), "B385"),
-    ("Campobello di Mazara".lower(), "B521"),
-    ("Castellammare del Golfo".lower(), "C130"),
-    ("Castelvetrano".lower(), "C286"),
-    ("Custonaci".lower(), "D234"),
-    ("Erice".lower(), "D423"),
-    ("Favignana".lower(), "D518"),
-    ("Gibellina".lower(), "E023"),
-    ("Marsala".lower(), "E974"),
-    ("Mazara del Vallo".lower(), "F061"),
-    ("Paceco".lower(), "G208"),
-    ("Pantelleria".lower(), "G315"),
-    ("Partanna".lower(), "G347"),
-    ("Poggioreale".lower(), "G767"),
-    ("Salaparuta".lower(), "H688"),
-    ("Salemi".lower(), "H700"),
-    ("Santa Ninfa".lower(), "I291"),
-    ("San Vito Lo Capo".lower(), "I407"),
-    ("Trapani".lower(), "L331"),
-    ("Valderice".lower(), "G319"),
-    ("Vita".lower(), "M081"),
-    ("Petrosino".lower(), "M281"),
-    ("Alia".lower(), "A195"),
-    ("Alimena".lower(), "A202"),
-    ("Aliminusa".lower(), "A203"),
-    ("Altavilla Milicia".lower(), "A229"),
-    ("Altofonte".lower(), "A239"),
-    ("Bagheria".lower(), "A546"),
-    ("Balestrate".lower(), "A592"),
-    ("Baucina".lower(), "A719"),
-    ("Belmonte Mezzagno".lower(), "A764"),
-    ("Bisacquino".lower(), "A882"),
-    ("Bolognetta".lower(), "A946"),
-    ("Bompietro".lower(), "A958"),
-    ("Borgetto".lower(), "A991"),
-    ("Caccamo".lower(), "B315"),
-    ("Caltavuturo".lower(), "B430"),
-    ("Campofelice di Fitalia".lower(), "B533"),
-    ("Campofelice di Roccella".lower(), "B532"),
-    ("Campofiorito".lower(), "B535"),
-    ("Camporeale".lower(), "B556"),
-    ("Capaci".lower(), "B645"),
-    ("Carini".lower(), "B780"),
-    ("Castelbuono".lower(), "C067"),
-    ("Casteldaccia".lower(), "C074"),
-    ("Castellana Sicula".lower(), "C135"),
-    ("Castronovo di Sicilia".lower(), "C344"),
-    ("Cefalà Diana".lower(), "C420"),
-    ("Cefalù".lower(), "C421"),
-    ("Cerda".lower(), "C496"),
-    ("Chiusa Sclafani".lower(), "C654"),
-    ("Ciminna".lower(), "C696"),
-    ("Cinisi".lower(), "C708"),
-    ("Collesano".lower(), "C871"),
-    ("Contessa Entellina".lower(), "C968"),
-    ("Corleone".lower(), "D009"),
-    ("Ficarazzi".lower(), "D567"),
-    ("Gangi".lower(), "D907"),
-    ("Geraci Siculo".lower(), "D977"),
-    ("Giardinello".lower(), "E013"),
-    ("Giuliana".lower(), "E055"),
-    ("Godrano".lower(), "E074"),
-    ("Gratteri".lower(), "E149"),
-    ("Isnello".lower(), "E337"),
-    ("Isola delle Femmine".lower(), "E350"),
-    ("Lascari".lower(), "E459"),
-    ("Lercara Friddi".lower(), "E541"),
-    ("Marineo".lower(), "E957"),
-    ("Mezzojuso".lower(), "F184"),
-    ("Misilmeri".lower(), "F246"),
-    ("Monreale".lower(), "F377"),
-    ("Montelepre".lower(), "F544"),
-    ("Montemaggiore Belsito".lower(), "F553"),
-    ("Palazzo Adriano".lower(), "G263"),
-    ("Palermo".lower(), "G273"),
-    ("Partinico".lower(), "G348"),
-    ("Petralia Soprana".lower(), "G510"),
-    ("Petralia Sottana".lower(), "G511"),
-    ("Piana degli Albanesi".lower(), "G543"),
-    ("Polizzi Generosa".lower(), "G792"),
-    ("Pollina".lower(), "G797"),
-    ("Prizzi".lower(), "H070"),
-    ("Roccamena".lower(), "H422"),
-    ("Roccapalumba".lower(), "H428"),
-    ("San Cipirello".lower(), "H797"),
-    ("San Giuseppe Jato".lower(), "H933"),
-    ("San Mauro Castelverde".lower(), "I028"),
-    ("Santa Cristina Gela".lower(), "I174"),
-    ("Santa Flavia".lower(), "I188"),
-    ("Sciara".lower(), "I534"),
-    ("Sclafani Bagni".lower(), "I541"),
-    ("Termini Imerese".lower(), "L112"),
-    ("Terrasini".lower(), "L131"),
-    ("Torretta".lower(), "L282"),
-    ("Trabia".lower(), "L317"),
-    ("Trappeto".lower(), "L332"),
-    ("Ustica".lower(), "L519"),
-    ("Valledolmo".lower(), "L603"),
-    ("Ventimiglia di Sicilia".lower(), "L740"),
-    ("Vicari".lower(), "L837"),
-    ("Villabate".lower(), "L916"),
-    ("Villafrati".lower(), "L951"),
-    ("Scillato".lower(), "I538"),
-    ("Blufi".lower(), "M268"),
-    ("Alcara li Fusi".lower(), "A177"),
-    ("Alì".lower(), "A194"),
-    ("Alì Terme".lower(), "A201"),
-    ("Antillo".lower(), "A313"),
-    ("Barcellona Pozzo di Gotto".lower(), "A638"),
-    ("Basicò".lower(), "A698"),
-    ("Brolo".lower(), "B198"),
-    ("Capizzi".lower(), "B660"),
-    ("Capo d'Orlando".lower(), "B666"),
-    ("Capri Leone".lower(), "B695"),
-    ("Caronia".lower(), "B804"),
-    ("Casalvecchio Siculo".lower(), "B918"),
-    ("Castel di Lucio".lower(), "C094"),
-    ("Castell'Umberto".lower(), "C051"),
-    ("Castelmola".lower(), "C210"),
-    ("Castroreale".lower(), "C347"),
-    ("Cesarò".lower(), "C568"),
-    ("Condrò".lower(), "C956"),
-    ("Falcone".lower(), "D474"),
-    ("Ficarra".lower(), "D569"),
-    ("Fiumedinisi".lower(), "D622"),
-    ("Floresta".lower(), "D635"),
-    ("Fondachelli-Fantina".lower(), "D661"),
-    ("Forza d'Agrò".lower(), "D733"),
-    ("Francavilla di Sicilia".lower(), "D765"),
-    ("Frazzanò".lower(), "D793"),
-    ("Furci Siculo".lower(), "D824"),
-    ("Furnari".lower(), "D825"),
-    ("Gaggi".lower(), "D844"),
-    ("Galati Mamertino".lower(), "D861"),
-    ("Gallodoro".lower(), "D885"),
-    ("Giardini-Naxos".lower(), "E014"),
-    ("Gioiosa Marea".lower(), "E043"),
-    ("Graniti".lower(), "E142"),
-    ("Gualtieri Sicaminò".lower(), "E233"),
-    ("Itala".lower(), "E374"),
-    ("Leni".lower(), "E523"),
-    ("Letojanni".lower(), "E555"),
-    ("Librizzi".lower(), "E571"),
-    ("Limina".lower(), "E594"),
-    ("Lipari".lower(), "E606"),
-    ("Longi".lower(), "E674"),
-    ("Malfa".lower(), "E855"),
-    ("Malvagna".lower(), "E869"),
-    ("Mandanici".lower(), "E876"),
-    ("Mazzarrà Sant'Andrea".lower(), "F066"),
-    ("Merì".lower(), "F147"),
-    ("Messina".lower(), "F158"),
-    ("Milazzo".lower(), "F206"),
-    ("Militello Rosmarino".lower(), "F210"),
-    ("Mirto".lower(), "F242"),
-    ("Mistretta".lower(), "F251"),
-    ("Moio Alcantara".lower(), "F277"),
-    ("Monforte San Giorgio".lower(), "F359"),
-    ("Mongiuffi Melia".lower(), "F368"),
-    ("Montagnareale".lower(), "F395"),
-    ("Montalbano Elicona".lower(), "F400"),
-    ("Motta Camastra".lower(), "F772"),
-    ("Motta d'Affermo".lower(), "F773"),
-    ("Naso".lower(), "F848"),
-    ("Nizza di Sicilia".lower(), "F901"),
-    ("Novara di Sicilia".lower(), "F951"),
-    ("Oliveri".lower(), "G036"),
-    ("Pace del Mela".lower(), "G209"),
-    ("Pagliara".lower(), "G234"),
-    ("Patti".lower(), "G377"),
-    ("Pettineo".lower(), "G522"),
-    ("Piraino".lower(), "G699"),
-    ("Raccuja".lower(), "H151"),
-    ("Reitano".lower(), "H228"),
-    ("Roccafiorita".lower(), "H405"),
-    ("Roccalumera".lower(), "H418"),
-    ("Roccavaldina".lower(), "H380"),
-    ("Roccella Valdemone".lower(), "H455"),
-    ("Rodì Milici".lower(), "H479"),
-    ("Rometta".lower(), "H519"),
-    ("San Filippo del Mela".lower(), "H842"),
-    ("San Fratello".lower(), "H850"),
-    ("San Marco d'Alunzio".lower(), "H982"),
-    ("San Pier Niceto".lower(), "I084"),
-    ("San Piero Patti".lower(), "I086"),
-    ("San Salvatore di Fitalia".lower(), "I147"),
-    ("Santa Domenica Vittoria".lower(), "I184"),
-    ("Sant'Agata di Militello".lower(), "I199"),
-    ("Sant'Alessio Siculo".lower(), "I215"),
-    ("Santa Lucia del Mela".lower(), "I220"),
-    ("Santa Marina Salina".lower(), "I254"),
-    ("Sant'Angelo di Brolo".lower(), "I283"),
-    ("Santa Teresa di Riva".lower(), "I311"),
-    ("San Teodoro".lower(), "I328"),
-    ("Santo Stefano di Camastra".lower(), "I370"),
-    ("Saponara".lower(), "I420"),
-    ("Savoca".lower(), "I477"),
-    ("Scaletta Zanclea".lower(), "I492"),
-    ("Sinagra".lower(), "I747"),
-    ("Spadafora".lower(), "I881"),
-    ("Taormina".lower(), "L042"),
-    ("Torregrotta".lower(), "L271"),
-    ("Tortorici".lower(), "L308"),
-    ("Tripi".lower(), "L431"),
-    ("Tusa".lower(), "L478"),
-    ("Ucria".lower(), "L482"),
-    ("Valdina".lower(), "L561"),
-    ("Venetico".lower(), "L735"),
-    ("Villafranca Tirrena".lower(), "L950"),
-    ("Terme Vigliatore".lower(), "M210"),
-    ("Acquedolci".lower(), "M211"),
-    ("Torrenova".lower(), "M286"),
-    ("Agrigento".lower(), "A089"),
-    ("Alessandria della Rocca".lower(), "A181"),
-    ("Aragona".lower(), "A351"),
-    ("Bivona".lower(), "A896"),
-    ("Burgio".lower(), "B275"),
-    ("Calamonaci".lower(), "B377"),
-    ("Caltabellotta".lower(), "B427"),
-    ("Camastra".lower(), "B460"),
-    ("Cammarata".lower(), "B486"),
-    ("Campobello di Licata".lower(), "B520"),
-    ("Canicattì".lower(), "B602"),
-    ("Casteltermini".lower(), "C275"),
-    ("Castrofilippo".lower(), "C341"),
-    ("Cattolica Eraclea".lower(), "C356"),
-    ("Cianciana".lower(), "C668"),
-    ("Comitini".lower(), "C928"),
-    ("Favara".lower(), "D514"),
-    ("Grotte".lower(), "E209"),
-    ("Joppolo Giancaxio".lower(), "E390"),
-    ("Lampedusa e Linosa".lower(), "E431"),
-    ("Licata".lower(), "E573"),
-    ("Lucca Sicula".lower(), "E714"),
-    ("Menfi".lower(), "F126"),
-    ("Montallegro".lower(), "F414"),
-    ("Montevago".lower(), "F655"),
-    ("Naro".lower(), "F845"),
-    ("Palma di Montechiaro".lower(), "G282"),
-    ("Porto Empedocle".lower(), "F299"),
-    ("Racalmuto".lower(), "H148"),
-    ("Raffadali".lower(), "H159"),
-    ("Ravanusa".lower(), "H194"),
-    ("Realmonte".lower(), "H205"),
-    ("Ribera".lower(), "H269"),
-    ("Sambuca di Sicilia".lower(), "H743"),
-    ("San Biagio Platani".lower(), "H778"),
-    ("San Giovanni Gemini".lower(), "H914"),
-    ("Santa Elisabetta".lower(), "I185"),
-    ("Santa Margherita di Belice".lower(), "I224"),
-    ("Sant'Angelo Muxaro".lower(), "I290"),
-    ("Santo Stefano Quisquina".lower(), "I356"),
-    ("Sciacca".lower(), "I533"),
-    ("Siculiana".lower(), "I723"),
-    ("Villafranca Sicula".lower(), "L944"),
-    ("Acquaviva Platani".lower(), "A049"),
-    ("Bompensiere".lower(), "A957"),
-    ("Butera".lower(), "B302"),
-    ("Caltanissetta".lower(), "B429"),
-    ("Campofranco".lower(), "B537"),
-    ("Delia".lower(), "D267"),
-    ("Gela".lower(), "D960"),
-    ("Marianopoli".lower(), "E953"),
-    ("Mazzarino".lower(), "F065"),
-    ("Milena".lower(), "E618"),
-    ("Montedoro".lower(), "F489"),
-    ("Mussomeli".lower(), "F830"),
-    ("Niscemi".lower(), "F899"),
-    ("Resuttano".lower(), "H245"),
-    ("Riesi".lower(), "H281"),
-    ("San Cataldo".lower(), "H792"),
-    ("Santa Caterina Villarmosa".lower(), "I169"),
-    ("Serradifalco".lower(), "I644"),
-    ("Sommatino".lower(), "I824"),
-    ("Sutera".lower(), "L016"),
-    ("Vallelunga Pratameno".lower(), "L609"),
-    ("Villalba".lower(), "L959"),
-    ("Agira".lower(), "A070"),
-    ("Aidone".lower(), "A098"),
-    ("Assoro".lower(), "A478"),
-    ("Barrafranca".lower(), "A676"),
-    ("Calascibetta".lower(), "B381"),
-    ("Catenanuova".lower(), "C353"),
-    ("Centuripe".lower(), "C471"),
-    ("Cerami".lower(), "C480"),
-    ("Enna".lower(), "C342"),
-    ("Gagliano Castelferrato".lower(), "D849"),
-    ("Leonforte".lower(), "E536"),
-    ("Nicosia".lower(), "F892"),
-    ("Nissoria".lower(), "F900"),
-    ("Piazza Armerina".lower(), "G580"),
-    ("Pietraperzia".lower(), "G624"),
-    ("Regalbuto".lower(), "H221"),
-    ("Sperlinga".lower(), "I891"),
-    ("Troina".lower(), "L448"),
-    ("Valguarnera Caropepe".lower(), "L583"),
-    ("Villarosa".lower(), "M011"),
-    ("Aci Bonaccorsi".lower(), "A025"),
-    ("Aci Castello".lower(), "A026"),
-    ("Aci Catena".lower(), "A027"),
-    ("Acireale".lower(), "A028"),
-    ("Aci Sant'Antonio".lower(), "A029"),
-    ("Adrano".lower(), "A056"),
-    ("Belpasso".lower(), "A766"),
-    ("Biancavilla".lower(), "A841"),
-    ("Bronte".lower(), "B202"),
-    ("Calatabiano".lower(), "B384"),
-    ("Caltagirone".lower(), "B428"),
-    ("Camporotondo Etneo".lower(), "B561"),
-    ("Castel di Iudica".lower(), "C091"),
-    ("Castiglione di Sicilia".lower(), "C297"),
-    ("Catania".lower(), "C351"),
-    ("Fiumefreddo di Sicilia".lower(), "D623"),
-    ("Giarre".lower(), "E017"),
-    ("Grammichele".lower(), "E133"),
-    ("Gravina di Catania".lower(), "E156"),
-    ("Licodia Eubea".lower(), "E578"),
-    ("Linguaglossa".lower(), "E602"),
-    ("Maletto".lower(), "E854"),
-    ("Mascali".lower(), "F004"),
-    ("Mascalucia".lower(), "F005"),
-    ("Militello in Val di Catania".lower(), "F209"),
-    ("Milo".lower(), "F214"),
-    ("Mineo".lower(), "F217"),
-    ("Mirabella Imbaccari".lower(), "F231"),
-    ("Misterbianco".lower(), "F250"),
-    ("Motta Sant'Anastasia".lower(), "F781"),
-    ("Nicolosi".lower(), "F890"),
-    ("Palagonia".lower(), "G253"),
-    ("Paternò".lower(), "G371"),
-    ("Pedara".lower(), "G402"),
-    ("Piedimonte Etneo".lower(), "G597"),
-    ("Raddusa".lower(), "H154"),
-    ("Ramacca".lower(), "H168"),
-    ("Randazzo".lower(), "H175"),
-    ("Riposto".lower(), "H325"),
-    ("San Cono".lower(), "H805"),
-    ("San Giovanni la Punta".lower(), "H922"),
-    ("San Gregorio di Catania".lower(), "H940"),
-    ("San Michele di Ganzaria".lower(), "I035"),
-    ("San Pietro Clarenza".lower(), "I098"),
-    ("Sant'Agata li Battiati".lower(), "I202"),
-    ("Sant'Alfio".lower(), "I216"),
-    ("Santa Maria di Licodia".lower(), "I240"),
-    ("Santa Venerina".lower(), "I314"),
-    ("Scordia".lower(), "I548"),
-    ("Trecastagni".lower(), "L355"),
-    ("Tremestieri Etneo".lower(), "L369"),
-    ("Valverde".lower(), "L658"),
-    ("Viagrande".lower(), "L828"),
-    ("Vizzini".lower(), "M100"),
-    ("Zafferana Etnea".lower(), "M139"),
-    ("Mazzarrone".lower(), "M271"),
-    ("Maniace".lower(), "M283"),
-    ("Ragalna".lower(), "M287"),
-    ("Acate".lower(), "A014"),
-    ("Chiaramonte Gulfi".lower(), "C612"),
-    ("Comiso".lower(), "C927"),
-    ("Giarratana".lower(), "E016"),
-    ("Ispica".lower(), "E366"),
-    ("Modica".lower(), "F258"),
-    ("Monterosso Almo".lower(), "F610"),
-    ("Pozzallo".lower(), "G953"),
-    ("Ragusa".lower(), "H163"),
-    ("Santa Croce Camerina".lower(), "I178"),
-    ("Scicli".lower(), "I535"),
-    ("Vittoria".lower(), "M088"),
-    ("Augusta".lower(), "A494"),
-    ("Avola".lower(), "A522"),
-    ("Buccheri".lower(), "B237"),
-    ("Buscemi".lower(), "B287"),
-    ("Canicattini Bagni".lower(), "B603"),
-    ("Carlentini".lower(), "B787"),
-    ("Cassaro".lower(), "C006"),
-    ("Ferla".lower(), "D540"),
-    ("Floridia".lower(), "D636"),
-    ("Francofonte".lower(), "D768"),
-    ("Lentini".lower(), "E532"),
-    ("Melilli".lower(), "F107"),
-    ("Noto".lower(), "F943"),
-    ("Pachino".lower(), "G211"),
-    ("Palazzolo Acreide".lower(), "G267"),
-    ("Rosolini".lower(), "H574"),
-    ("Siracusa".lower(), "I754"),
-    ("Solarino".lower(), "I785"),
-    ("Sortino".lower(), "I864"),
-    ("Portopalo di Capo Passero".lower(), "M257"),
-    ("Priolo Gargallo".lower(), "M279"),
-    ("Aggius".lower(), "A069"),
-    ("Alà dei Sardi".lower(), "A115"),
-    ("Alghero".lower(), "A192"),
-    ("Anela".lower(), "A287"),
-    ("Ardara".lower(), "A379"),
-    ("Arzachena".lower(), "A453"),
-    ("Banari".lower(), "A606"),
-    ("Benetutti".lower(), "A781"),
-    ("Berchidda".lower(), "A789"),
-    ("Bessude".lower(), "A827"),
-    ("Bonnanaro".lower(), "A976"),
-    ("Bono".lower(), "A977"),
-    ("Bonorva".lower(), "A978"),
-    ("Bortigiadas".lower(), "B063"),
-    ("Borutta".lower(), "B064"),
-    ("Bottidda".lower(), "B094"),
-    ("Buddusò".lower(), "B246"),
-    ("Bultei".lower(), "B264"),
-    ("Bulzi".lower(), "B265"),
-    ("Burgos".lower(), "B276"),
-    ("Calangianus".lower(), "B378"),
-    ("Cargeghe".lower(), "B772"),
-    ("Castelsardo".lower(), "C272"),
-    ("Cheremule".lower(), "C600"),
-    ("Chiaramonti".lower(), "C613"),
-    ("Codrongianos".lower(), "C818"),
-    ("Cossoine".lower(), "D100"),
-    ("Esporlatu".lower(), "D441"),
-    ("Florinas".lower(), "D637"),
-    ("Giave".lower(), "E019"),
-    ("Illorai".lower(), "E285"),
-    ("Ittireddu".lower(), "E376"),
-    ("Ittiri".lower(), "E377"),
-    ("Laerru".lower(), "E401"),
-    ("La Maddalena".lower(), "E425"),
-    ("Luogosanto".lower(), "E747"),
-    ("Luras".lower(), "E752"),
-    ("Mara".lower(), "E902"),
-    ("Martis".lower(), "E992"),
-    ("Monteleone Rocca Doria".lower(), "F542"),
-    ("Monti".lower(), "F667"),
-    ("Mores".lower(), "F721"),
-    ("Muros".lower(), "F818"),
-    ("Nughedu San Nicolò".lower(), "F975"),
-    ("Nule".lower(), "F976"),
-    ("Nulvi".lower(), "F977"),
-    ("Olbia".lower(), "G015"),
-    ("Olmedo".lower(), "G046"),
-    ("Oschiri".lower(), "G153"),
-    ("Osilo".lower(), "G156"),
-    ("Ossi".lower(), "G178"),
-    ("Ozieri".lower(), "G203"),
-    ("Padria".lower(), "G225"),
-    ("Palau".lower(), "G258"),
-    ("Pattada".lower(), "G376"),
-    ("Perfugas".lower(), "G450"),
-    ("Ploaghe".lower(), "G740"),
-    ("Porto Torres".lower(), "G924"),
-    ("Pozzomaggiore".lower(), "G962"),
-    ("Putifigari".lower(), "H095"),
-    ("Romana".lower(), "H507"),
-    ("Aglientu".lower(), "H848"),
-    ("Santa Teresa Gallura".lower(), "I312"),
-    ("Sassari".lower(), "I452"),
-    ("Sedini".lower(), "I565"),
-    ("Semestene".lower(), "I598"),
-    ("Sennori".lower(), "I614"),
-    ("Siligo".lower(), "I732"),
-    ("Sorso".lower(), "I863"),
-    ("Tempio Pausania".lower(), "L093"),
-    ("Thiesi".lower(), "L158"),
-    ("Tissi".lower(), "L180"),
-    ("Torralba".lower(), "L235"),
-    ("Trinità d'Agultu e Vignola".lower(), "L428"),
-    ("Tula".lower(), "L464"),
-    ("Uri".lower(), "L503"),
-    ("Usini".lower(), "L509"),
-    ("Villanova Monteleone".lower(), "L989"),
-    ("Valledoria".lower(), "L604"),
-    ("Telti".lower(), "L088"),
-    ("Badesi".lower(), "M214"),
-    ("Viddalba".lower(), "M259"),
-    ("Golfo Aranci".lower(), "M274"),
-    ("Loiri Porto San Paolo".lower(), "M275"),
-    ("Sant'Antonio di Gallura".lower(), "M276"),
-    ("Tergu".lower(), "M282"),
-    ("Santa Maria Coghinas".lower(), "M284"),
-    ("Erula".lower(), "M292"),
-    ("Stintino".lower(), "M290"),
-    ("Padru".lower(), "M301"),
-    ("Budoni".lower(), "B248"),
-    ("San Teodoro".lower(), "I329"),
-    ("Aritzo".lower(), "A407"),
-    ("Arzana".lower(), "A454"),
-    ("Atzara".lower(), "A492"),
-    ("Austis".lower(), "A503"),
-    ("Bari Sardo".lower(), "A663"),
-    ("Baunei".lower(), "A722"),
-    ("Belvì".lower(), "A776"),
-    ("Birori".lower(), "A880"),
-    ("Bitti".lower(), "A895"),
-    ("Bolotana".lower(), "A948"),
-    ("Borore".lower(), "B056"),
-    ("Bortigali".lower(), "B062"),
-    ("Desulo".lower(), "D287"),
-    ("Dorgali".lower(), "D345"),
-    ("Dualchi".lower(), "D376"),
-    ("Elini".lower(), "D395"),
-    ("Fonni".lower(), "D665"),
-    ("Gadoni".lower(), "D842"),
-    ("Gairo".lower(), "D859"),
-    ("Galtellì".lower(), "D888"),
-    ("Gavoi".lower(), "D947"),
-    ("Girasole".lower(), "E049"),
-    ("Ilbono".lower(), "E283"),
-    ("Irgoli".lower(), "E323"),
-    ("Jerzu".lower(), "E387"),
-    ("Lanusei".lower(), "E441"),
-    ("Lei".lower(), "E517"),
-    ("Loceri".lower(), "E644"),
-    ("Loculi".lower(), "E646"),
-    ("Lodè".lower(), "E647"),
-    ("Lotzorai".lower(), "E700"),
-    ("Lula".lower(), "E736"),
-    ("Macomer".lower(), "E788"),
-    ("Mamoiada".lower(), "E874"),
-    ("Meana Sardo".lower(), "F073"),
-    ("Noragugume".lower(), "F933"),
-    ("Nuoro".lower(), "F979"),
-    ("Oliena".lower(), "G031"),
-    ("Ollolai".lower(), "G044"),
-    ("Olzai".lower(), "G058"),
-    ("Onanì".lower(), "G064"),
-    ("Onifai".lower(), "G070"),
-    ("Oniferi".lower(), "G071"),
-    ("Orani".lower(), "G084"),
-    ("Orgosolo".lower(), "G097"),
-    ("Orosei".lower(), "G119"),
-    ("Orotelli".lower(), "G120"),
-    ("Ortueri".lower(), "G146"),
-    ("Orune".lower(), "G147"),
-    ("Osidda".lower(), "G154"),
-    ("Osini".lower(), "G158"),
-    ("Ottana".lower(), "G191"),
-    ("Ovodda".lower(), "G201"),
-    ("Perdasdefogu".lower(), "G445"),
-    ("Posada".lower(), "G929"),
-    ("Sarule".lower(), "I448"),
-    ("Silanus".lower(), "I730"),
-    ("Sindia".lower(), "I748"),
-    ("Siniscola".lower(), "I751"),
-    ("Sorgono".lower(), "I851"),
-    ("Talana".lower(), "L036"),
-    ("Tertenia".lower(), "L140"),
-    ("Teti".lower(), "L153"),
-    ("Tiana".lower(), "L160"),
-    ("Tonara".lower(), "L202"),
-    ("Torpè".lower(), "L231"),
-    ("Tortolì".lower(), "A355"),
-    ("Triei".lower(), "L423"),
-    ("Ulassai".lower(), "L489"),
-    ("Urzulei".lower(), "L506"),
-    ("Ussassai".lower(), "L514"),
-    ("Villagrande Strisaili".lower(), "L953"),
-    ("Cardedu".lower(), "M285"),
-    ("Lodine".lower(), "E649"),
-    ("Assemini".lower(), "A474"),
-    ("Cagliari".lower(), "B354"),
-    ("Capoterra".lower(), "B675"),
-    ("Decimomannu".lower(), "D259"),
-    ("Maracalagonis".lower(), "E903"),
-    ("Pula".lower(), "H088"),
-    ("Quartu Sant'Elena".lower(), "H118"),
-    ("Sarroch".lower(), "I443"),
-    ("Selargius".lower(), "I580"),
-    ("Sestu".lower(), "I695"),
-    ("Settimo San Pietro".lower(), "I699"),
-    ("Sinnai".lower(), "I752"),
-    ("Uta".lower(), "L521"),
-    ("Villa San Pietro".lower(), "I118"),
-    ("Quartucciu".lower(), "H119"),
-    ("Elmas".lower(), "D399"),
-    ("Monserrato".lower(), "F383"),
-    ("Abbasanta".lower(), "A007"),
-    ("Aidomaggiore".lower(), "A097"),
-    ("Albagiara".lower(), "A126"),
-    ("Ales".lower(), "A180"),
-    ("Allai".lower(), "A204"),
-    ("Arborea".lower(), "A357"),
-    ("Ardauli".lower(), "A380"),
-    ("Assolo".lower(), "A477"),
-    ("Asuni".lower(), "A480"),
-    ("Baradili".lower(), "A614"),
-    ("Baratili San Pietro".lower(), "A621"),
-    ("Baressa".lower(), "A655"),
-    ("Bauladu".lower(), "A721"),
-    ("Bidonì".lower(), "A856"),
-    ("Bonarcado".lower(), "A960"),
-    ("Boroneddu".lower(), "B055"),
-    ("Busachi".lower(), "B281"),
-    ("Cabras".lower(), "B314"),
-    ("Cuglieri".lower(), "D200"),
-    ("Fordongianus".lower(), "D695"),
-    ("Ghilarza".lower(), "E004"),
-    ("Gonnoscodina".lower(), "E087"),
-    ("Gonnosnò".lower(), "D585"),
-    ("Gonnostramatza".lower(), "E088"),
-    ("Marrubiu".lower(), "E972"),
-    ("Masullas".lower(), "F050"),
-    ("Milis".lower(), "F208"),
-    ("Mogorella".lower(), "F270"),
-    ("Mogoro".lower(), "F272"),
-    ("Morgongiori".lower(), "F727"),
-    ("Narbolia".lower(), "F840"),
-    ("Neoneli".lower(), "F867"),
-    ("Norbello".lower(), "F934"),
-    ("Nughedu Santa Vittoria".lower(), "F974"),
-    ("Nurachi".lower(), "F980"),
-    ("Nureci".lower(), "F985"),
-    ("Ollastra".lower(), "G043"),
-    ("Oristano".lower(), "G113"),
-    ("Palmas Arborea".lower(), "G286"),
-    ("Pau".lower(), "G379"),
-    ("Paulilatino".lower(), "G384"),
-    ("Pompu".lower(), "G817"),
-    ("Riola Sardo".lower(), "H301"),
-    ("Ruinas".lower(), "F271"),
-    ("Samugheo".lower(), "H756"),
-    ("San Nicolò d'Arcidano".lower(), "A368"),
-    ("Santa Giusta".lower(), "I205"),
-    ("Villa Sant'Antonio".lower(), "I298"),
-    ("Santu Lussurgiu".lower(), "I374"),
-    ("San Vero Milis".lower(), "I384"),
-    ("Scano di Montiferro".lower(), "I503"),
-    ("Sedilo".lower(), "I564"),
-    ("Seneghe".lower(), "I605"),
-    ("Senis".lower(), "I609"),
-    ("Sennariolo".lower(), "I613"),
-    ("Siamaggiore".lower(), "I717"),
-    ("Siamanna".lower(), "I718"),
-    ("Simala".lower(), "I742"),
-    ("Simaxis".lower(), "I743"),
-    ("Sini".lower(), "I749"),
-    ("Siris".lower(), "I757"),
-    ("Solarussa".lower(), "I791"),
-    ("Sorradile".lower(), "I861"),
-    ("Tadasuni".lower(), "L023"),
-    ("Terralba".lower(), "L122"),
-    ("Tramatza".lower(), "L321"),
-    ("Tresnuraghes".lower(), "L393"),
-    ("Ulà Tirso".lower(), "L488"),
-    ("Uras".lower(), "L496"),
-    ("Usellus".lower(), "L508"),
-    ("Villanova Truschedu".lower(), "L991"),
-    ("Villaurbana".lower(), "M030"),
-    ("Villa Verde".lower(), "A609"),
-    ("Zeddiani".lower(), "M153"),
-    ("Zerfaliu".lower(), "M168"),
-    ("Siapiccia".lower(), "I721"),
-    ("Curcuris".lower(), "D214"),
-    ("Soddì".lower(), "I778"),
-    ("Bosa".lower(), "B068"),
-    ("Flussio".lower(), "D640"),
-    ("Laconi".lower(), "E400"),
-    ("Magomadas".lower(), "E825"),
-    ("Modolo".lower(), "F261"),
-    ("Montresta".lower(), "F698"),
-    ("Sagama".lower(), "H661"),
-    ("Suni".lower(), "L006"),
-    ("Tinnura".lower(), "L172"),
-    ("Arbus".lower(), "A359"),
-    ("Armungia".lower(), "A419"),
-    ("Ballao".lower(), "A597"),
-    ("Barrali".lower(), "A677"),
-    ("Barumini".lower(), "A681"),
-    ("Buggerru".lower(), "B250"),
-    ("Burcei".lower(), "B274"),
-    ("Calasetta".lower(), "B383"),
-    ("Carbonia".lower(), "B745"),
-    ("Carloforte".lower(), "B789"),
-    ("Castiadas".lower(), "M288"),
-    ("Collinas".lower(), "C882"),
-    ("Decimoputzu".lower(), "D260"),
-    ("Dolianova".lower(), "D323"),
-    ("Domus de Maria".lower(), "D333"),
-    ("Domusnovas".lower(), "D334"),
-    ("Donori".lower(), "D344"),
-    ("Escalaplano".lower(), "D430"),
-    ("Escolca".lower(), "D431"),
-    ("Esterzili".lower(), "D443"),
-    ("Fluminimaggiore".lower(), "D639"),
-    ("Furtei".lower(), "D827"),
-    ("Genoni".lower(), "D968"),
-    ("Genuri".lower(), "D970"),
-    ("Gergei".lower(), "D982"),
-    ("Gesico".lower(), "D994"),
-    ("Gesturi".lower(), "D997"),
-    ("Giba".lower(), "E022"),
-    ("Goni".lower(), "E084"),
-    ("Gonnesa".lower(), "E086"),
-    ("Gonnosfanadiga".lower(), "E085"),
-    ("Guamaggiore".lower(), "E234"),
-    ("Guasila".lower(), "E252"),
-    ("Guspini".lower(), "E270"),
-    ("Iglesias".lower(), "E281"),
-    ("Isili".lower(), "E336"),
-    ("Las Plassas".lower(), "E464"),
-    ("Lunamatrona".lower(), "E742"),
-    ("Mandas".lower(), "E877"),
-    ("Masainas".lower(), "M270"),
-    ("Monastir".lower(), "F333"),
-    ("Muravera".lower(), "F808"),
-    ("Musei".lower(), "F822"),
-    ("Narcao".lower(), "F841"),
-    ("Nuragus".lower(), "F981"),
-    ("Nurallao".lower(), "F982"),
-    ("Nuraminis".lower(), "F983"),
-    ("Nurri".lower(), "F986"),
-    ("Nuxis".lower(), "F991"),
-    ("Orroli".lower(), "G122"),
-    ("Ortacesus".lower(), "G133"),
-    ("Pabillonis".lower(), "G207"),
-    ("Pauli Arbarei".lower(), "G382"),
-    ("Perdaxius".lower(), "G446"),
-    ("Pimentel".lower(), "G669"),
-    ("Piscinas".lower(), "M291"),
-    ("Portoscuso".lower(), "G922"),
-    ("Sadali".lower(), "H659"),
-    ("Samassi".lower(), "H738"),
-    ("Samatzai".lower(), "H739"),
-    ("San Basilio".lower(), "H766"),
-    ("San Gavino Monreale".lower(), "H856"),
-    ("San Giovanni Suergiu".lower(), "G287"),
-    ("San Nicolò Gerrei".lower(), "G383"),
-    ("San Sperate".lower(), "I166"),
-    ("San Vito".lower(), "I402"),
-    ("Sanluri".lower(), "H974"),
-    ("Santadi".lower(), "I182"),
-    ("Sant'Andrea Frius".lower(), "I271"),
-    ("Sant'Anna Arresi".lower(), "M209"),
-    ("Sant'Antioco".lower(), "I294"),
-    ("Sardara".lower(), "I428"),
-    ("Segariu".lower(), "I570"),
-    ("Selegas".lower(), "I582"),
-    ("Senorbì".lower(), "I615"),
-    ("Serdiana".lower(), "I624"),
-    ("Serramanna".lower(), "I647"),
-    ("Serrenti".lower(), "I667"),
-    ("Serri".lower(), "I668"),
-    ("Setzu".lower(), "I705"),
-    ("Seui".lower(), "I706"),
-    ("Seulo".lower(), "I707"),
-    ("Siddi".lower(), "I724"),
-    ("Siliqua".lower(), "I734"),
-    ("Silius".lower(), "I735"),
-    ("Siurgus Donigala".lower(), "I765"),
-    ("Soleminis".lower(), "I797"),
-    ("Suelli".lower(), "I995"),
-    ("Teulada".lower(), "L154"),
-    ("Tratalias".lower(), "L337"),
-    ("Tuili".lower(), "L463"),
-    ("Turri".lower(), "L473"),
-    ("Ussana".lower(), "L512"),
-    ("Ussaramanna".lower(), "L513"),
-    ("Vallermosa".lower(), "L613"),
-    ("Villacidro".lower(), "L924"),
-    ("Villamar".lower(), "L966"),
-    ("Villamassargia".lower(), "L968"),
-    ("Villanova Tulo".lower(), "L992"),
-    ("Villanovaforru".lower(), "L986"),
-    ("Villanovafranca".lower(), "L987"),
-    ("Villaperuccio".lower(), "M278"),
-    ("Villaputzu".lower(), "L998"),
-    ("Villasalto".lower(), "M016"),
-    ("Villasimius".lower(), "B738"),
-    ("Villasor".lower(), "M025"),
-    ("Villaspeciosa".lower(), "M026"),
-))
+"""
+Questo modulo contiene l'indice dei comuni italiani e dei loro codici catastali (Belfiore),
+ usati per il codice fiscale.
+
+I dati sono nel file comuni.tsv (nome, codice catastale), letto solo al primo utilizzo (vedi indice_comuni), invece di un dizionario Python eseguito
+ ad ogni avvio. Le ricerche non distinguono maiuscole, accenti ed apostrofi (vedi
+ base.stringhe.normalizza_ricerca):
+ - codice(nome) e comune(codice), con dizionari;
+ - cerca(prefisso), per il completamento automatico, con una ricerca binaria sui nomi ordinati.
+
+COMUNI e' mantenuto per compatibilita': {nome in minuscolo: codice catastale}.
+"""
+import os
+from bisect import bisect_left
+from collections import namedtuple
+from collections.abc import Mapping
+
+from base.stringhe import normalizza_ricerca
+
+FILE_COMUNI = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'comuni.tsv')
+
+Comune = namedtuple('Comune', ['nome', 'codice'])
+
+
+class IndiceComuni(object):
+
+    def __init__(self, percorso=FILE_COMUNI):
+        self.percorso = percorso
+        self._caricato = False
+
+    def _carica(self):
+        if self._caricato:
+            return
+        comuni, per_nome, per_codice = [], {}, {}
+        with open(self.percorso, encoding='utf-8') as f:
+            for riga in f:
+                if riga.startswith('#') or not riga.strip():
+                    continue
+                nome, codice = riga.rstrip('\n').split('\t')
+                comune = Comune(nome, codice or None)
+                comuni.append(comune)
+                normalizzato = normalizza_ricerca(nome)
+                per_nome.setdefault(normalizzato, []).append(comune)
+                if codice:
+                    per_codice[codice] = comune
+
+        ordinati = sorted((normalizza_ricerca(c.nome), i) for i, c in enumerate(comuni))
+        self._comuni = comuni
+        self._per_nome = per_nome
+        self._per_codice = per_codice
+        self._nomi_ordinati = [nome for nome, _ in ordinati]
+        self._posizioni_ordinate = [i for _, i in ordinati]
+        self._caricato = True
+
+    def __len__(self):
+        self._carica()
+        return len(self._comuni)
+
+    def __iter__(self):
+        self._carica()
+        return iter(self._comuni)
+
+    def omonimi(self, nome):
+        """
+        :return: Lista dei comuni con questo nome.
+        """
+        self._carica()
+        return list(self._per_nome.get(normalizza_ricerca(nome), []))
+
+    def codice(self, nome):
+        """
+        :param nome: Il nome del comune.
+        :return: Il codice catastale, o None. Tra omonimi, l'ultimo in elenco, preferendo quelli
+                 scritti esattamente come il nome (es. Paterno' e Paterno).
+        """
+        omonimi = [c for c in self.omonimi(nome) if c.codice]
+        esatti = [c for c in omonimi if c.nome.lower() == (nome or '').lower()]
+        scelto = (esatti or omonimi or [None])[-1]
+        return scelto.codice if scelto else None
+
+    def comune(self, codice):
+        """
+        :param codice: Il codice catastale (es. 'C351').
+        :return: Il Comune (nome, codice), o None.
+        """
+        self._carica()
+        return self._per_codice.get((codice or '').upper())
+
+    def cerca(self, prefisso, limite=10):
+        """
+        :param prefisso: L'inizio del nome del comune.
+        :param limite: Numero massimo di risultati.
+        :return: Lista di comuni il cui nome inizia con il prefisso, in ordine alfabetico.
+        """
+        self._carica()
+        prefisso = normalizza_ricerca(prefisso)
+        if not prefisso:
+            return []
+        risultati = []
+        for i in range(bisect_left(self._nomi_ordinati, prefisso), len(self._nomi_ordinati)):
+            if len(risultati) >= limite or not self._nomi_ordinati[i].startswith(prefisso):
+                break
+            risultati.append(self._comuni[self._posizioni_ordinate[i]])
+        return risultati
+
+    def normalizzati(self):
+        """
+        :return: Insieme dei nomi normalizzati di tutti i comuni.
+        """
+        self._carica()
+        return set(self._per_nome)
+
+
+_indice = IndiceComuni()
+
+
+def indice_comuni():
+    """
+    :return: L'indice dei comuni, caricato al primo utilizzo.
+    """
+    return _indice
+
+
+class _Comuni(Mapping):
+    """
+    Dizionario di sola lettura {nome in minuscolo: codice catastale}, come il vecchio COMUNI.
+    La chiave viene normalizzata: "Sant'Agata", "sant agata" e "SANT'AGATA" sono equivalenti.
+    """
+
+    def __getitem__(self, nome):
+        codice = _indice.codice(nome)
+        if codice is None:
+            raise KeyError(nome)
+        return codice
+
+    def __iter__(self):
+        visti = set()
+        for comune in _indice:
+            nome = comune.nome.lower()
+            if comune.codice and nome not in visti:
+                visti.add(nome)
+                yield nome
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+
+COMUNI = _Comuni()
@@ -0,0 +1,166 @@
+"""
+Questo modulo gestisce i contatori molto frequenti (es. Articolo.visualizzazioni,
+ Documento.downloads) senza leggere e salvare la riga ad ogni incremento.
+
+Gli incrementi vengono accumulati in memoria (incrementa) e scritti insieme (svuota):
+ - sulla colonna del modello, con un UPDATE ... SET campo = campo + n (F()), senza perdere
+   incrementi fatti in parallelo da altri processi;
+ - su ContatoreGiornaliero, un contatore per oggetto e per giorno, per le serie storiche
+   (serie_giornaliera, serie_per_segmento) che non toccano le righe degli oggetti. La riga del
+   giorno viene incrementata con un UPDATE, o creata con un INSERT se non esiste (senza
+   ON CONFLICT, che richiede PostgreSQL 9.5).
+Lo svuotamento avviene al termine di una richiesta o ad un incremento, se sono passati almeno
+ CONTATORI_INTERVALLO secondi dal precedente (0: ad ogni incremento), ed alla chiusura del processo.
+"""
+import atexit
+import logging
+import threading
+import time
+from collections import defaultdict
+from datetime import date
+
+from django.apps import apps
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.core.signals import request_finished
+from django.db import connection, IntegrityError
+from django.db.models import F
+from django.db.transaction import atomic
+
+from base.models import ContatoreGiornaliero
+
+logger = logging.getLogger(__name__)
+
+SQL_GIORNALIERO_AGGIORNA = """
+    UPDATE {tabella} SET valore = valore + %s
+    WHERE oggetto_tipo_id = %s AND oggetto_id = %s AND nome = %s AND giorno = %s
+"""
+
+SQL_GIORNALIERO_INSERISCI = """
+    INSERT INTO {tabella} (oggetto_tipo_id, oggetto_id, nome, giorno, valore) VALUES (%s, %s, %s, %s, %s)
+"""
+
+SQL_SEGMENTI = """
+    SELECT s.segmento, c.giorno, SUM(c.valore) FROM {contatore} c
+    LEFT OUTER JOIN {segmento} s ON s.{campo} = c.oggetto_id
+    WHERE c.oggetto_tipo_id = %s AND c.nome = %s AND c.giorno >= %s
+    GROUP BY s.segmento, c.giorno
+"""
+
+_lock = threading.Lock()
+_accumulati = defaultdict(int)  # {(modello, pk, campo, giorno): incremento}
+_ultimo_svuotamento = time.time()
+
+
+def incrementa(oggetto, campo, quantita=1):
+    """
+    Incrementa il contatore campo dell'oggetto. Anche il valore dell'istanza viene incrementato.
+    :param oggetto: L'istanza (es. un Articolo).
+    :param campo: Il nome del campo intero (es. 'visualizzazioni').
+    :param quantita: L'incremento.
+    """
+    chiave = (oggetto._meta.label, oggetto.pk, campo, date.today())
+    with _lock:
+        _accumulati[chiave] += quantita
+    setattr(oggetto, campo, (getattr(oggetto, campo) or 0) + quantita)
+    svuota_se_scaduto()
+
+
+def svuota_se_scaduto(**kwargs):
+    if time.time() - _ultimo_svuotamento >= settings.CONTATORI_INTERVALLO:
+        svuota()
+
+
+def _scrivi_giornaliero(cursor, tipo_id, pk, campo, giorno, quantita):
+    tabella = ContatoreGiornaliero._meta.db_table
+    aggiorna = SQL_GIORNALIERO_AGGIORNA.format(tabella=tabella)
+    cursor.execute(aggiorna, [quantita, tipo_id, pk, campo, giorno])
+    if cursor.rowcount:
+        return
+    try:
+        with atomic():
+            cursor.execute(SQL_GIORNALIERO_INSERISCI.format(tabella=tabella), [tipo_id, pk, campo, giorno, quantita])
+    except IntegrityError:
+        # La riga e' stata creata nel frattempo da un altro processo
+        cursor.execute(aggiorna, [quantita, tipo_id, pk, campo, giorno])
+
+
+def _scrivi(accumulati):
+    totali = defaultdict(int)  # {(modello, pk, campo): incremento}
+    for (modello, pk, campo, giorno), quantita in accumulati.items():
+        totali[(modello, pk, campo)] += quantita
+
+    with atomic(), connection.cursor() as cursor:
+        # Ordine fisso delle righe, per non bloccarsi a vicenda con altri processi
+        for (modello, pk, campo), quantita in sorted(totali.items()):
+            apps.get_model(modello).objects.filter(pk=pk).update(**{campo: F(campo) + quantita})
+        for (modello, pk, campo, giorno), quantita in sorted(accumulati.items()):
+            tipo = ContentType.objects.get_for_model(apps.get_model(modello))
+            _scrivi_giornaliero(cursor, tipo.pk, pk, campo, giorno, quantita)
+
+
+def svuota():
+    """
+    Scrive gli incrementi accumulati.
+    :return: Il numero di contatori aggiornati.
+    """
+    global _accumulati, _ultimo_svuotamento
+    with _lock:
+        accumulati, _accumulati = _accumulati, defaultdict(int)
+        _ultimo_svuotamento = time.time()
+    if not accumulati:
+        return 0
+
+    try:
+        _scrivi(accumulati)
+    except Exception:
+        # Gli incrementi non scritti vengono ripresi al prossimo svuotamento
+        logger.exception("Errore nella scrittura dei contatori")
+        with _lock:
+            for chiave, quantita in accumulati.items():
+                _accumulati[chiave] += quantita
+        return 0
+    return len(accumulati)
+
+
+def _svuota_in_chiusura():
+    try:
+        svuota()
+    except Exception:
+        pass
+
+
+request_finished.connect(svuota_se_scaduto, dispatch_uid='base.contatori.svuota_se_scaduto')
+atexit.register(_svuota_in_chiusura)
+
+
+def serie_giornaliera(oggetto, campo, dal_giorno):
+    """
+    :return: Dizionario {giorno: incremento} del contatore dell'oggetto dal giorno indicato.
+    """
+    return dict(ContatoreGiornaliero.objects.filter(
+        oggetto_tipo=ContentType.objects.get_for_model(oggetto), oggetto_id=oggetto.pk,
+        nome=campo, giorno__gte=dal_giorno,
+    ).values_list('giorno', 'valore'))
+
+
+def serie_per_segmento(modello, campo, modello_segmento, dal_giorno):
+    """
+    Somma i contatori degli oggetti di un modello per segmento e per giorno.
+    Un oggetto con piu' segmenti viene contato in ognuno, uno senza segmenti sotto None (pubblico).
+    :param modello: Il modello degli oggetti (es. Articolo).
+    :param campo: Il nome del contatore (es. 'visualizzazioni').
+    :param modello_segmento: Il modello dei segmenti degli oggetti (es. ArticoloSegmento).
+    :param dal_giorno: Il primo giorno della serie.
+    :return: Dizionario {segmento: {giorno: incremento}}.
+    """
+    sql = SQL_SEGMENTI.format(
+        contatore=ContatoreGiornaliero._meta.db_table, segmento=modello_segmento._meta.db_table,
+        campo='%s_id' % (modello_segmento._oggetto_collegato.__name__.lower(),),
+    )
+    serie = defaultdict(dict)
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [ContentType.objects.get_for_model(modello).pk, campo, dal_giorno])
+        for segmento, giorno, valore in cursor.fetchall():
+            serie[segmento][giorno] = valore
+    return dict(serie)
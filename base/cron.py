@@ -1,6 +1,7 @@
 from django_cron import CronJobBase, Schedule
 
 from base.models import Allegato, Autorizzazione
+from base.pdf import pulisci_cache as pulisci_cache_pdf
 from formazione.models import Aspirante
 
 
@@ -15,6 +16,8 @@ class CronCancellaFileScaduti(CronJobBase):
     def do(self):
         n = Allegato.pulisci()
         print("Sono stati rimossi %d file scaduti." % n)
+        n = pulisci_cache_pdf()
+        print("Sono stati rimossi %d PDF dalla cache." % n)
 
 
 class CronApprovaNegaAuto(CronJobBase):
@@ -26,7 +29,10 @@ class CronApprovaNegaAuto(CronJobBase):
     code = 'base.autorizzazioni.automatiche'
 
     def do(self):
-        Autorizzazione.gestisci_automatiche()
+        metriche = Autorizzazione.gestisci_automatiche()
+        print("Autorizzazioni automatiche: %(concesse)d concesse, %(negate)d negate, %(saltate)d saltate, "
+              "%(errori)d errori, %(messaggi)d messaggi in %(secondi).1fs (%(al_secondo).1f/s), "
+              "ritardo massimo %(ritardo_massimo)ds, %(in_attesa)d ancora in attesa." % metriche)
 
 
 class CronRichiesteInAttesa(CronJobBase):
@@ -38,7 +44,8 @@ class CronRichiesteInAttesa(CronJobBase):
     code = 'base.estensioni.notifica.manuali'
 
     def do(self):
-        Autorizzazione.notifiche_richieste_in_attesa()
+        n = Autorizzazione.notifiche_richieste_in_attesa()
+        print("Sono stati accodati %d promemoria di richieste in attesa." % n)
 
 
 class PulisciAspirantiVolontari(CronJobBase):
@@ -53,3 +60,20 @@ class PulisciAspirantiVolontari(CronJobBase):
         print('Inizio cancellazione aspiranti con appartenenze come volontari')
         Aspirante.pulisci_volontari()
         print('Fine cancellazione')
+
+
+class CronGeocodifica(CronJobBase):
+    """
+    Cancella le ricerche di indirizzi salvate scadute e ricostruisce il gazzettiere locale
+     dalle locazioni conosciute (vedi base.geocodifica).
+    """
+
+    RUN_AT_TIMES = ['04:00']
+
+    schedule = Schedule(run_at_times=RUN_AT_TIMES)
+    code = 'base.geocodifica'
+
+    def do(self):
+        from base.geocodifica import costruisci_gazzettiere, pulisci_cache
+        print("Sono state cancellate %d ricerche di indirizzi scadute." % pulisci_cache())
+        print("Gazzettiere ricostruito con %d voci." % costruisci_gazzettiere())
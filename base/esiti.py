@@ -0,0 +1,103 @@
+"""
+Questo modulo contiene le operazioni di migrazione e di verifica per la colonna esito
+ del tratto ConAutorizzazioni (vedi base.models).
+
+La colonna esito e' calcolata in ConAutorizzazioni.save() a partire da confermata, ritirata e
+ dalle autorizzazioni dell'oggetto; le modifiche fatte con QuerySet.update() o SQL diretto
+ non la aggiornano, e possono essere riallineate con il comando verifica_esiti --correggi.
+"""
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection, migrations
+
+from base.models import Autorizzazione, ConAutorizzazioni
+
+SQL_ESITO = """
+    CASE
+        WHEN t.ritirata THEN %s
+        WHEN t.confermata THEN %s
+        WHEN EXISTS (
+            SELECT 1 FROM {autorizzazione} a INNER JOIN django_content_type c ON c.id = a.oggetto_tipo_id
+            WHERE c.app_label = %s AND c.model = %s AND a.oggetto_id = t.id AND a.concessa = FALSE
+        ) THEN %s
+        WHEN EXISTS (
+            SELECT 1 FROM {autorizzazione} a INNER JOIN django_content_type c ON c.id = a.oggetto_tipo_id
+            WHERE c.app_label = %s AND c.model = %s AND a.oggetto_id = t.id
+        ) THEN %s
+        ELSE %s
+    END
+"""
+
+
+def _sql_esito(app_label, modello):
+    """
+    :return: Tupla (espressione SQL dell'esito della riga t, parametri).
+    """
+    sql = SQL_ESITO.format(autorizzazione=Autorizzazione._meta.db_table)
+    parametri = [
+        ConAutorizzazioni.ESITO_RITIRATA, ConAutorizzazioni.ESITO_OK,
+        app_label, modello, ConAutorizzazioni.ESITO_NO,
+        app_label, modello, ConAutorizzazioni.ESITO_PENDING,
+        ConAutorizzazioni.ESITO_NO,
+    ]
+    return sql, parametri
+
+
+def _sql_aggiorna(tabella, app_label, modello):
+    esito, parametri = _sql_esito(app_label, modello)
+    # Le righe confermate e non ritirate hanno gia' il valore predefinito
+    sql = "UPDATE {0} t SET esito = {1} WHERE NOT t.confermata OR t.ritirata".format(tabella, esito)
+    return sql, parametri
+
+
+def operazioni_esito(app_label, modello):
+    """
+    Operazioni di migrazione per un modello con ConAutorizzazioni, da eseguire dopo l'aggiunta
+     del campo esito: valorizza l'esito delle righe esistenti.
+    :param app_label: L'applicazione (es. 'attivita').
+    :param modello: Il nome del modello in minuscolo (es. 'partecipazione').
+    :return: Lista di operazioni.
+    """
+    tabella = "%s_%s" % (app_label, modello)
+    return [
+        migrations.RunSQL([_sql_aggiorna(tabella, app_label, modello)], reverse_sql=migrations.RunSQL.noop),
+    ]
+
+
+def modelli_con_autorizzazioni():
+    """
+    :return: Lista dei modelli concreti con il tratto ConAutorizzazioni.
+    """
+    from django.apps import apps
+    return [m for m in apps.get_models() if issubclass(m, ConAutorizzazioni) and not m._meta.proxy]
+
+
+def _parametri_modello(modello):
+    tipo = ContentType.objects.get_for_model(modello)
+    return modello._meta.db_table, tipo.app_label, tipo.model
+
+
+def verifica_esiti(modello):
+    """
+    Conta le righe del modello con la colonna esito non coerente con le autorizzazioni.
+    :param modello: Un modello con ConAutorizzazioni.
+    :return: Il numero di righe non coerenti.
+    """
+    tabella, app_label, nome = _parametri_modello(modello)
+    esito, parametri = _sql_esito(app_label, nome)
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT COUNT(*) FROM {0} t WHERE t.esito <> {1}".format(tabella, esito), parametri)
+        return cursor.fetchone()[0]
+
+
+def ricalcola_esiti(modello):
+    """
+    Ricalcola la colonna esito delle righe non coerenti del modello.
+    :param modello: Un modello con ConAutorizzazioni.
+    :return: Il numero di righe aggiornate.
+    """
+    tabella, app_label, nome = _parametri_modello(modello)
+    esito, parametri = _sql_esito(app_label, nome)
+    with connection.cursor() as cursor:
+        cursor.execute("UPDATE {0} t SET esito = {1} WHERE t.esito <> {1}".format(tabella, esito),
+                       parametri + parametri)
+        return cursor.rowcount
@@ -1,3 +1,4 @@
+import base64
 import os
 from datetime import datetime, date
 from zipfile import ZipFile
@@ -5,14 +6,18 @@ from zipfile import ZipFile
 from barcode import generate
 from barcode.writer import ImageWriter
 from django.core.files import File
+from django.http import StreamingHttpResponse
 from django.template import Context
 from django.template.loader import get_template
+from django.utils.formats import localize
 
+from base.archivi import genera_zip, compressione
 from base.models import Allegato
 from base.stringhe import domani, GeneratoreNomeFile
-from jorvik.settings import MEDIA_ROOT, DOMPDF_ENDPOINT
-from io import StringIO
-import urllib
+from base.pdf import genera, genera_molti, unisci, FORMATO_A4, FORMATO_CR80, ORIENTAMENTO_ORIZZONTALE, \
+    ORIENTAMENTO_VERTICALE
+from jorvik.settings import MEDIA_ROOT
+from io import BytesIO, StringIO
 import xlsxwriter
 
 __author__ = 'alfioemanuele'
@@ -56,11 +61,22 @@ class Zip(Allegato):
         self.prepara_cartelle(MEDIA_ROOT + zname)
         with ZipFile(MEDIA_ROOT + zname, 'w') as zf:
             for f_path, f_nome in self._file_in_attesa:
-                zf.write(f_path, f_nome)
+                zf.write(f_path, f_nome, compress_type=compressione(f_nome))
             zf.close()
 
         self.file = zname
 
+    def risposta_streaming(self, nome='Archivio.zip'):
+        """
+        Invia il file compresso man mano che viene generato (vedi base.archivi), senza salvarlo
+         su disco. Per archivi molto grandi, usare invece comprimi_e_salva.
+        :param nome: Il nome del file scaricato.
+        :return: StreamingHttpResponse.
+        """
+        risposta = StreamingHttpResponse(genera_zip(list(self._file_in_attesa)), content_type='application/zip')
+        risposta['Content-Disposition'] = 'attachment; filename="%s"' % (nome.replace('"', ''),)
+        return risposta
+
     def comprimi_e_salva(self, nome='Archivio.zip', scadenza=None, **kwargs):
         """
         Scorciatoia per comprimi() e effettuare il salvataggio dell'allegato in database.
@@ -84,20 +100,35 @@ class EAN13(Allegato):
     class Meta:
         proxy = True
 
-    def genera_e_salva(self, codice, nome="Immagine.png", scadenza=None):
-        generatore = GeneratoreNomeFile('allegati/')
-        zname = generatore(self, nome)
-        self.prepara_cartelle(MEDIA_ROOT + zname)
-        pngfile = open(MEDIA_ROOT + zname, 'wb')
+    @staticmethod
+    def _genera(codice, output):
         writer = ImageWriter()
         writer.dpi = 400
-        generate("EAN13", codice, writer=writer, output=pngfile, writer_options={
+        generate("EAN13", codice, writer=writer, output=output, writer_options={
             "quiet_zone": 0.5,
             "text_distance": 0.5,
             "module_height": 5.5,
             "font_size": 13,
         })
-        pngfile.close()
+
+    @classmethod
+    def data_uri(cls, codice):
+        """
+        Genera l'immagine in memoria, senza salvarla, per includerla nell'HTML (es. dei PDF).
+         Lo stesso codice produce sempre lo stesso URI.
+        :param codice: Il codice EAN13.
+        :return: L'immagine PNG come URI data:.
+        """
+        png = BytesIO()
+        cls._genera(codice, png)
+        return "data:image/png;base64,%s" % (base64.b64encode(png.getvalue()).decode('ascii'),)
+
+    def genera_e_salva(self, codice, nome="Immagine.png", scadenza=None):
+        generatore = GeneratoreNomeFile('allegati/')
+        zname = generatore(self, nome)
+        self.prepara_cartelle(MEDIA_ROOT + zname)
+        with open(MEDIA_ROOT + zname, 'wb') as pngfile:
+            self._genera(codice, pngfile)
         scadenza = scadenza or domani()
         self.file = zname
         self.nome = nome
@@ -107,17 +138,51 @@ class EAN13(Allegato):
 
 class PDF(Allegato):
     """
-    Rappresenta un file PDF generato al volo.
+    Rappresenta un file PDF generato al volo (vedi base.pdf).
     """
 
     class Meta:
         proxy = True
 
-    ORIENTAMENTO_ORIZZONTALE = 'landscape'
-    ORIENTAMENTO_VERTICALE = 'portrait'
+    ORIENTAMENTO_ORIZZONTALE = ORIENTAMENTO_ORIZZONTALE
+    ORIENTAMENTO_VERTICALE = ORIENTAMENTO_VERTICALE
+
+    FORMATO_A4 = FORMATO_A4
+    FORMATO_CR80 = FORMATO_CR80
+
+    # Segnaposto dell'ora di generazione nell'HTML su cui viene calcolata la chiave della cache
+    SEGNAPOSTO_TIMESTAMP = "__timestamp_pdf__"
+
+    @classmethod
+    def prepara_documento(cls, modello='pdf_vuoto.html', corpo={}, formato=FORMATO_A4,
+                          orientamento=ORIENTAMENTO_VERTICALE):
+        """
+        Popola il modello con il corpo. La chiave della cache (vedi base.pdf) viene calcolata
+         sull'HTML senza l'ora di generazione: un PDF in cache riporta l'ora della prima generazione.
+        :return: Tupla (html, formato, orientamento, html_chiave), come per base.pdf.genera_molti.
+        """
+        html_chiave = get_template(modello).render(dict(corpo, timestamp=cls.SEGNAPOSTO_TIMESTAMP))
+        html = html_chiave.replace(cls.SEGNAPOSTO_TIMESTAMP, localize(datetime.now()))
+        return html, formato, orientamento, html_chiave
+
+    @classmethod
+    def prepara_html(cls, modello='pdf_vuoto.html', corpo={}):
+        """
+        :return: L'HTML del modello, popolato con il corpo.
+        """
+        return cls.prepara_documento(modello, corpo)[0]
+
+    def _salva(self, contenuto, nome, scadenza, posizione):
+        generatore = GeneratoreNomeFile(posizione)
+        zname = generatore(self, nome)
+        self.prepara_cartelle(MEDIA_ROOT + zname)
+        with open(MEDIA_ROOT + zname, 'wb') as pdffile:
+            pdffile.write(contenuto)
 
-    FORMATO_A4 = 'a4'
-    FORMATO_CR80 = 'cr80'
+        self.file = zname
+        self.nome = nome
+        self.scadenza = scadenza or domani()
+        self.save()
 
     def genera_e_salva(self, nome='File.pdf', scadenza=None, corpo={}, modello='pdf_vuoto.html',
                        orientamento=ORIENTAMENTO_VERTICALE, formato=FORMATO_A4,
@@ -133,34 +198,19 @@ class PDF(Allegato):
         :param posizione: Cartella dove salvare il file. Default allegati/.
         :return:
         """
+        self._salva(genera(*self.prepara_documento(modello, corpo, formato, orientamento)), nome, scadenza, posizione)
 
-        scadenza = scadenza or domani()
-
-        url = DOMPDF_ENDPOINT
-        corpo.update({"timestamp": datetime.now()})
-        html = get_template(modello).render(corpo)
-        values = {
-            'paper': formato,
-            'orientation': orientamento,
-            'html': html
-        }
-
-        data = urllib.parse.urlencode(values)
-        data = data.encode('UTF-8')
-        req = urllib.request.Request(url, data)
-        response = urllib.request.urlopen(req)
-
-        generatore = GeneratoreNomeFile(posizione)
-        zname = generatore(self, nome)
-        self.prepara_cartelle(MEDIA_ROOT + zname)
-        pdffile = open(MEDIA_ROOT + zname, 'wb')
-        pdffile.write(response.read())
-        pdffile.close()
-
-        self.file = zname
-        self.nome = nome
-        self.scadenza = scadenza
-        self.save()
+    def genera_e_salva_unico(self, documenti, nome='File.pdf', scadenza=None, posizione='allegati/'):
+        """
+        Genera in parallelo piu' documenti e li salva in un solo file PDF, uno dopo l'altro.
+        :param documenti: Lista di dizionari con i parametri modello, corpo, formato e orientamento
+                          di ogni documento (come genera_e_salva).
+        :param nome: Il nome del file PDF da salvare.
+        :param scadenza: La scadenza del file PDF.
+        :param posizione: Cartella dove salvare il file. Default allegati/.
+        """
+        contenuti = genera_molti([self.prepara_documento(**d) for d in documenti])
+        self._salva(unisci(contenuti), nome, scadenza, posizione)
 
 
 class FoglioExcel:
@@ -214,6 +264,16 @@ class Excel(Allegato):
 
         self.fogli.append(foglio)
 
+    @staticmethod
+    def _testo_cella(testo):
+        if isinstance(testo, datetime):
+            testo = testo.strftime("%d/%m/%Y %H:%M")
+        if isinstance(testo, date):
+            testo = testo.strftime("%d/%m/%Y")
+        if testo == ", ":  # Rimuove campi ', '
+            testo = ""
+        return str(testo)
+
     def genera_e_salva(self, nome='File.xlsx', scadenza=None,
                        ordina_fogli=True, **kwargs):
         """
@@ -246,13 +306,61 @@ class Excel(Allegato):
             for riga, colonne in enumerate(foglio.contenuto):
                 riga += 1  # Indice shiftato per intestazione
                 for colonna, testo in enumerate(colonne):
-                    if isinstance(testo, datetime):
-                        testo = testo.strftime("%d/%m/%Y %H:%M")
-                    if isinstance(testo, date):
-                        testo = testo.strftime("%d/%m/%Y")
-                    if testo == ", ":  # Rimuove campi ', '
-                        testo = ""
-                    worksheet.write(riga, colonna, str(testo))
+                    worksheet.write(riga, colonna, self._testo_cella(testo))
+
+        if ordina_fogli:
+            workbook.worksheets_objs.sort(key=lambda x: x.name)
+        workbook.close()
+
+        self.file = zname
+        self.nome = nome
+        self.scadenza = scadenza
+        self.save()
+
+    def genera_e_salva_streaming(self, intestazione, righe, nome='File.xlsx', scadenza=None,
+                                 ordina_fogli=True):
+        """
+        Genera il file scrivendo le righe man mano che vengono prodotte, e lo salva su database.
+        Il file viene scritto in modalita' constant_memory di xlsxwriter: in memoria viene
+         mantenuta solo la riga attuale di ogni foglio, indipendentemente dal numero di righe.
+        :param intestazione: L'intestazione dei fogli di lavoro (tupla o lista).
+        :param righe: Iterabile di tuple (nome foglio, colonne). I fogli vengono creati al primo utilizzo,
+                      i nomi sono confrontati senza distinzione tra maiuscole e minuscole.
+        :param nome: Il nome del file da allegare (opzionale, default 'File.xlsx').
+        :param scadenza: Scadenza del file. Domani.
+        :param ordina_fogli: Ordina i fogli per nome.
+        :return: Il numero di righe scritte.
+        """
+
+        scadenza = scadenza or domani()
+
+        generatore = GeneratoreNomeFile('allegati/')
+        zname = generatore(self, nome)
+        self.prepara_cartelle(MEDIA_ROOT + zname)
+
+        workbook = xlsxwriter.Workbook(MEDIA_ROOT + zname, {'constant_memory': True})
+        bold = workbook.add_format({'bold': True})
+
+        fogli = {}  # nome foglio => [worksheet, prossima riga]
+        totale = 0
+        for nome_foglio, colonne in righe:
+            chiave = nome_foglio.lower().strip()
+            if chiave not in fogli:
+                worksheet = workbook.add_worksheet(nome_foglio)
+                for col, testo in enumerate(intestazione):
+                    worksheet.write(0, col, str(testo), bold)
+                fogli[chiave] = [worksheet, 1]
+
+            worksheet, riga = fogli[chiave]
+            for colonna, testo in enumerate(colonne):
+                worksheet.write(riga, colonna, self._testo_cella(testo))
+            fogli[chiave][1] += 1
+            totale += 1
+
+        if not fogli:  # Un file Excel deve contenere almeno un foglio
+            worksheet = workbook.add_worksheet()
+            for col, testo in enumerate(intestazione):
+                worksheet.write(0, col, str(testo), bold)
 
         if ordina_fogli:
             workbook.worksheets_objs.sort(key=lambda x: x.name)
@@ -262,3 +370,4 @@ class Excel(Allegato):
         self.nome = nome
         self.scadenza = scadenza
         self.save()
+        return totale
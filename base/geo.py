@@ -75,7 +75,7 @@ class Locazione(ConMarcaTemporale, models.Model):
         return '0'
 
     @classmethod
-    def cerca(cls, indirizzo):
+    def cerca_google(cls, indirizzo):
         """
         Usa le API di Google (Geocode) per cercare l'indirizzo,
         ritorna una stringa (indirizzo formattato) per ogni risultato.
@@ -90,6 +90,17 @@ class Locazione(ConMarcaTemporale, models.Model):
             for x in risultati
         ]
 
+    @classmethod
+    def cerca(cls, indirizzo):
+        """
+        Cerca l'indirizzo tramite il gazzettiere locale, la cache delle ricerche
+         o il fornitore configurato (vedi base.geocodifica).
+        :param indirizzo: Indirizzo da cercare
+        :return: Lista di tuple (indirizzo formattato, coordinate, parti dell'indirizzo).
+        """
+        from base.geocodifica import cerca
+        return cerca(indirizzo)
+
     @classmethod
     def oggetto(self, indirizzo):
         """
@@ -130,8 +141,12 @@ class Locazione(ConMarcaTemporale, models.Model):
         risultati = Locazione.cerca(self.indirizzo)
         if not len(risultati):
             return False
-        risultato = risultati[0]
+        return self.aggiorna_da_risultato(risultati[0])
 
+    def aggiorna_da_risultato(self, risultato):
+        """
+        Aggiorna indirizzo, coordinate e parti dell'indirizzo da un risultato di Locazione.cerca.
+        """
         self.indirizzo = risultato[0]
         self.geo = Point(risultato[1]['lng'], risultato[1]['lat'])
         valori = {k: risultato[2][k] if risultato[2][k] else '' for k in risultato[2]}
@@ -144,6 +159,60 @@ class Locazione(ConMarcaTemporale, models.Model):
         return self.indirizzo.replace("Italy", "Italia")
 
 
+class RicercaGeocodifica(ConMarcaTemporale, models.Model):
+    """
+    Risultati salvati di una ricerca di indirizzo (vedi base.geocodifica).
+    Una ricerca senza risultati viene salvata con una lista vuota ed una scadenza piu' breve.
+    """
+
+    class Meta:
+        verbose_name = "Ricerca di geocodifica"
+        verbose_name_plural = "Ricerche di geocodifica"
+
+    chiave = models.CharField("Chiave", max_length=40, unique=True)
+    ricerca = models.CharField("Ricerca", max_length=255)
+    fornitore = models.CharField("Fornitore", max_length=64)
+    risultati = models.TextField("Risultati", default="[]")
+    scadenza = models.DateTimeField("Scadenza", db_index=True)
+
+    def __str__(self):
+        return self.ricerca
+
+
+class VoceGazzettiere(models.Model):
+    """
+    Voce del gazzettiere locale: comune o CAP, con il centroide delle locazioni conosciute
+     (vedi base.geocodifica.costruisci_gazzettiere).
+    """
+
+    class Meta:
+        verbose_name = "Voce del gazzettiere"
+        verbose_name_plural = "Voci del gazzettiere"
+        unique_together = (('tipo', 'chiave', 'provincia_breve'),)
+
+    COMUNE = 'C'
+    CAP = 'P'
+    TIPO = (
+        (COMUNE, "Comune"),
+        (CAP, "CAP"),
+    )
+    tipo = models.CharField("Tipo", max_length=1, choices=TIPO)
+    chiave = models.CharField("Chiave", max_length=64, db_index=True)
+
+    objects = models.GeoManager()
+    geo = models.PointField(srid=4326, geography=True)
+
+    comune = models.CharField("Comune", max_length=64, blank=True)
+    provincia = models.CharField("Provincia", max_length=64, blank=True)
+    provincia_breve = models.CharField("Provincia (breve)", max_length=64, blank=True)
+    regione = models.CharField("Regione", max_length=64, blank=True)
+    cap = models.CharField("CAP", max_length=32, blank=True)
+    locazioni = models.PositiveIntegerField("Locazioni", default=0)
+
+    def __str__(self):
+        return "%s %s" % (self.get_tipo_display(), self.chiave)
+
+
 class ConGeolocalizzazione(models.Model):
     """
     Aggiunge le funzioni di geolocalizzazione ad un oggetto.
@@ -0,0 +1,310 @@
+"""
+Questo modulo gestisce la ricerca degli indirizzi (vedi Locazione.cerca).
+
+Una ricerca viene risolta, in ordine:
+ - dal gazzettiere locale (VoceGazzettiere), se chiede solo un comune o un CAP italiano
+   (es. "Catania", "95100", "Catania, Province of CT, Italia", "Calliano, TN"): nessuna chiamata
+   esterna. Un comune con omonimi (es. Calliano, TN e AT) viene risolto solo se la ricerca
+   indica anche la provincia;
+ - dalla cache delle ricerche (RicercaGeocodifica), con chiave la ricerca normalizzata
+   (maiuscole, spazi, punteggiatura e accenti non contano). Anche le ricerche senza risultati
+   vengono salvate, con una scadenza piu' breve;
+ - dal fornitore configurato (GEOCODIFICA_FORNITORE, es. FornitoreGoogle). FornitoreFinto
+   risponde da un dizionario in memoria, per i test.
+
+Il gazzettiere viene costruito dalle locazioni gia' conosciute (costruisci_gazzettiere): per
+ ogni comune dell'indice dei comuni (base.comuni) e provincia, e per ogni CAP, il centroide delle
+ locazioni con quel comune e provincia o CAP.
+
+rigeocodifica aggiorna molte locazioni (es. di sedi e aspiranti) rispettando un numero massimo
+ di chiamate al secondo al fornitore.
+"""
+import hashlib
+import json
+import re
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.gis.geos import Point
+from django.db import connection
+from django.db.transaction import atomic
+from django.utils.module_loading import import_string
+from django.utils.timezone import now
+
+from base.comuni import indice_comuni
+from base.geo import Locazione, RicercaGeocodifica, VoceGazzettiere
+from base.stringhe import normalizza_ricerca
+
+# Parti della ricerca ignorate dal gazzettiere
+STATI_ITALIA = ('italia', 'italy', 'it')
+PREFISSI_PROVINCIA = ('province of ', 'provincia di ', 'provincia del ', 'provincia della ')
+
+CAP = re.compile(r'^\d{5}$')
+SIGLA_PROVINCIA = re.compile(r'^[a-z]{2}$')
+
+
+def chiave(indirizzo):
+    return hashlib.sha1(normalizza_ricerca(indirizzo).encode('utf-8')).hexdigest()
+
+
+class FornitoreGeocodifica(object):
+    """
+    Interfaccia dei fornitori di geocodifica.
+    """
+
+    nome = None
+
+    def cerca(self, indirizzo):
+        """
+        :param indirizzo: Indirizzo da cercare.
+        :return: Lista di tuple (indirizzo formattato, {'lat': .., 'lng': ..} o '0', parti dell'indirizzo),
+                 come Locazione.cerca.
+        """
+        raise NotImplementedError()
+
+
+class FornitoreGoogle(FornitoreGeocodifica):
+    """
+    Google Geocoding API.
+    """
+
+    nome = 'google'
+
+    def cerca(self, indirizzo):
+        return Locazione.cerca_google(indirizzo)
+
+
+class FornitoreFinto(FornitoreGeocodifica):
+    """
+    Fornitore per i test: risponde da RISULTATI ({ricerca normalizzata: risultati}) e conta le chiamate.
+    """
+
+    nome = 'finto'
+    RISULTATI = {}
+    chiamate = []
+
+    def cerca(self, indirizzo):
+        FornitoreFinto.chiamate.append(indirizzo)
+        return list(FornitoreFinto.RISULTATI.get(normalizza_ricerca(indirizzo), []))
+
+
+def fornitore():
+    """
+    :return: Un'istanza del fornitore configurato in GEOCODIFICA_FORNITORE.
+    """
+    return import_string(settings.GEOCODIFICA_FORNITORE)()
+
+
+def _risultato_voce(voce):
+    testo = " ".join(x for x in (voce.cap, voce.comune, voce.provincia_breve) if x)
+    parti = {
+        'civico': None, 'via': None, 'comune': voce.comune, 'provincia': voce.provincia,
+        'provincia_breve': voce.provincia_breve, 'regione': voce.regione, 'stato': 'IT', 'cap': voce.cap or None,
+    }
+    return "%s, Italia" % (testo,), {'lat': voce.geo.y, 'lng': voce.geo.x}, parti
+
+
+def _omonimo(comune):
+    """
+    :return: True se piu' comuni hanno questo nome (normalizzato).
+    """
+    return len(indice_comuni().omonimi(comune)) > 1
+
+
+def _voce_comune(comune, provincia=None):
+    """
+    :param provincia: Sigla o nome della provincia (normalizzati), se indicata nella ricerca.
+    :return: La VoceGazzettiere del comune, o None se sconosciuto o, senza provincia, con omonimi.
+    """
+    voci = list(VoceGazzettiere.objects.filter(tipo=VoceGazzettiere.COMUNE, chiave=comune))
+    if provincia:
+        voci = [voce for voce in voci
+                if provincia in (normalizza_ricerca(voce.provincia_breve), normalizza_ricerca(voce.provincia))]
+    elif _omonimo(comune):
+        return None
+    return max(voci, key=lambda voce: voce.locazioni) if voci else None
+
+
+def cerca_gazzettiere(indirizzo):
+    """
+    Risolve dal gazzettiere una ricerca che chiede solo un comune o un CAP, eventualmente con
+     la provincia (es. "Calliano, Province of TN" o "Calliano, TN").
+    :return: Lista di risultati come Locazione.cerca, o None se la ricerca non e' di un comune o CAP conosciuto.
+    """
+    parti, provincia = [], None
+    for parte in (normalizza_ricerca(parte) for parte in (indirizzo or '').split(',')):
+        if not parte or parte in STATI_ITALIA:
+            continue
+        prefisso = [p for p in PREFISSI_PROVINCIA if (parte + ' ').startswith(p)]
+        if prefisso:
+            provincia = parte[len(prefisso[0]):].strip() or provincia
+            continue
+        parti.append(parte)
+    if len(parti) == 2 and provincia is None and SIGLA_PROVINCIA.match(parti[1]):
+        provincia = parti.pop()
+    if len(parti) != 1:
+        return None
+
+    parole = parti[0].split()
+    cap = parole[0] if parole and CAP.match(parole[0]) else None
+    comune = ' '.join(parole[1:] if cap else parole)
+
+    voce = None
+    if comune:
+        voce = _voce_comune(comune, provincia)
+    elif cap:
+        voce = VoceGazzettiere.objects.filter(tipo=VoceGazzettiere.CAP, chiave=cap).first()
+    if voce is None:
+        return None
+
+    risultato = _risultato_voce(voce)
+    if cap and comune:
+        risultato[2]['cap'] = cap
+    return [risultato]
+
+
+def _da_json(testo):
+    return [tuple(risultato) for risultato in json.loads(testo)]
+
+
+def _cerca(indirizzo, usa_cache=True):
+    """
+    :return: Tupla (risultati, True se e' stato interrogato il fornitore).
+    """
+    if settings.GEOCODIFICA_GAZZETTIERE:
+        risultati = cerca_gazzettiere(indirizzo)
+        if risultati is not None:
+            return risultati, False
+
+    k = chiave(indirizzo)
+    adesso = now()
+    if usa_cache:
+        salvata = RicercaGeocodifica.objects.filter(chiave=k, scadenza__gt=adesso).first()
+        if salvata is not None:
+            return _da_json(salvata.risultati), False
+
+    f = fornitore()
+    risultati = f.cerca(indirizzo)
+    giorni = settings.GEOCODIFICA_GIORNI_CACHE if risultati else settings.GEOCODIFICA_GIORNI_CACHE_NEGATIVA
+    RicercaGeocodifica.objects.update_or_create(chiave=k, defaults={
+        'ricerca': indirizzo[:255],
+        'fornitore': f.nome or f.__class__.__name__,
+        'risultati': json.dumps(risultati),
+        'scadenza': adesso + timedelta(days=giorni),
+    })
+    return [tuple(risultato) for risultato in risultati], True
+
+
+def cerca(indirizzo, usa_cache=True):
+    """
+    Cerca un indirizzo (vedi Locazione.cerca).
+    :param indirizzo: Indirizzo da cercare.
+    :param usa_cache: Se False, ignora la cache delle ricerche (ma la aggiorna).
+    :return: Lista di tuple (indirizzo formattato, coordinate, parti dell'indirizzo).
+    """
+    return _cerca(indirizzo, usa_cache=usa_cache)[0]
+
+
+def pulisci_cache():
+    """
+    Cancella le ricerche salvate scadute.
+    :return: Il numero di ricerche cancellate.
+    """
+    return RicercaGeocodifica.objects.filter(scadenza__lte=now()).delete()[0]
+
+
+# I comuni sono raggruppati anche per provincia, per non unire gli omonimi (es. Calliano, TN e AT)
+SQL_GAZZETTIERE = """
+    SELECT valore, ST_Y(c), ST_X(c), numero, comune, provincia, provincia_breve, regione, cap FROM (
+        SELECT {campo} AS valore, ST_Centroid(ST_Collect(geo::geometry)) AS c, COUNT(*) AS numero,
+               mode() WITHIN GROUP (ORDER BY comune) AS comune,
+               mode() WITHIN GROUP (ORDER BY provincia) AS provincia,
+               {provincia_breve} AS provincia_breve,
+               mode() WITHIN GROUP (ORDER BY regione) AS regione,
+               mode() WITHIN GROUP (ORDER BY cap) AS cap
+        FROM {locazione}
+        WHERE stato = 'IT' AND {campo} <> '' AND NOT (ST_X(geo::geometry) = 0 AND ST_Y(geo::geometry) = 0)
+        GROUP BY {gruppo}
+    ) t
+"""
+
+GRUPPI_GAZZETTIERE = (
+    # (tipo, campo, provincia_breve, gruppo)
+    (VoceGazzettiere.COMUNE, 'comune', 'provincia_breve', 'comune, provincia_breve'),
+    (VoceGazzettiere.CAP, 'cap', 'mode() WITHIN GROUP (ORDER BY provincia_breve)', 'cap'),
+)
+
+
+def costruisci_gazzettiere():
+    """
+    Ricostruisce il gazzettiere dalle locazioni conosciute: una voce per ogni comune dell'indice
+     dei comuni (base.comuni) e provincia, ed una per ogni CAP, con il centroide delle locazioni
+     corrispondenti. I comuni senza provincia vengono ignorati.
+    :return: Il numero di voci.
+    """
+    comuni = indice_comuni().normalizzati()
+    voci = {}
+
+    with connection.cursor() as cursor:
+        for tipo, campo, provincia_breve, gruppo in GRUPPI_GAZZETTIERE:
+            cursor.execute(SQL_GAZZETTIERE.format(campo=campo, provincia_breve=provincia_breve, gruppo=gruppo,
+                                                  locazione=Locazione._meta.db_table))
+            for valore, lat, lng, numero, comune, provincia, provincia_breve, regione, cap in cursor.fetchall():
+                k = normalizza_ricerca(valore)
+                if (tipo == VoceGazzettiere.COMUNE and (k not in comuni or not provincia_breve)) or \
+                        (tipo == VoceGazzettiere.CAP and not CAP.match(k)):
+                    continue
+                chiave_voce = (tipo, k, provincia_breve.upper() if tipo == VoceGazzettiere.COMUNE else '')
+                # Stesso comune scritto in modi diversi: vince quello con piu' locazioni
+                if chiave_voce in voci and voci[chiave_voce].locazioni >= numero:
+                    continue
+                voci[chiave_voce] = VoceGazzettiere(
+                    tipo=tipo, chiave=k, geo=Point(lng, lat), comune=comune or '', provincia=provincia or '',
+                    provincia_breve=provincia_breve or '', regione=regione or '',
+                    cap=(cap or '') if tipo == VoceGazzettiere.CAP else '', locazioni=numero,
+                )
+
+    with atomic():
+        VoceGazzettiere.objects.all().delete()
+        VoceGazzettiere.objects.bulk_create(voci.values())
+    return len(voci)
+
+
+def rigeocodifica(locazioni, al_secondo=5, usa_cache=False, progresso=None):
+    """
+    Aggiorna molte locazioni cercandone nuovamente l'indirizzo, con al massimo al_secondo
+     chiamate al secondo al fornitore (le risposte del gazzettiere e della cache non contano).
+    :param locazioni: QuerySet di Locazione.
+    :param al_secondo: Numero massimo di chiamate al fornitore al secondo.
+    :param usa_cache: Se True, usa anche le ricerche salvate.
+    :param progresso: Funzione opzionale chiamata come progresso(elaborate, totale).
+    :return: Dizionario {'aggiornate': .., 'non_trovate': .., 'chiamate': ..}.
+    """
+    pks = list(locazioni.order_by('pk').values_list('pk', flat=True))
+    metriche = {'aggiornate': 0, 'non_trovate': 0, 'chiamate': 0}
+    intervallo = 1.0 / al_secondo if al_secondo else 0
+    ultima = 0
+
+    for numero, pk in enumerate(pks, 1):
+        locazione = Locazione.objects.filter(pk=pk).first()
+        if locazione is None:
+            continue
+
+        attesa = ultima + intervallo - time.time()
+        if attesa > 0:
+            time.sleep(attesa)
+        risultati, chiamata = _cerca(locazione.indirizzo, usa_cache=usa_cache)
+        if chiamata:
+            ultima = time.time()
+            metriche['chiamate'] += 1
+
+        if risultati and risultati[0][1] != '0':
+            locazione.aggiorna_da_risultato(risultati[0])
+            metriche['aggiornate'] += 1
+        else:
+            metriche['non_trovate'] += 1
+
+        if progresso:
+            progresso(numero, len(pks))
+    return metriche
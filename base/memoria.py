@@ -0,0 +1,114 @@
+"""
+Questo modulo implementa una memoria locale alla singola richiesta.
+
+Durante una richiesta, alcuni metodi di Persona (deleghe, sedi, incarichi, permessi)
+ vengono chiamati molte volte, dalla vista, dal menu e dai template. I metodi decorati con
+ @memorizza_per_richiesta calcolano il risultato una sola volta per richiesta.
+
+La memoria viene attivata dai decoratori di vista (vedi autenticazione.funzioni) e svuotata
+ automaticamente quando la richiesta modifica Deleghe o Appartenenze (vedi invalida_memoria).
+Fuori da una richiesta (es. cron, comandi) i metodi decorati vengono sempre eseguiti.
+"""
+import functools
+import logging
+import threading
+from contextlib import contextmanager
+
+from django.conf import settings
+
+logger = logging.getLogger('memoria')
+
+_locale = threading.local()
+
+
+class MemoriaRichiesta(object):
+    """
+    Memoria dei risultati calcolati durante una richiesta, con contatori di utilizzo.
+    """
+
+    def __init__(self):
+        self.valori = {}
+        self.successi = 0
+        self.mancati = 0
+
+    def ottieni(self, chiave, calcola):
+        """
+        Ritorna il valore memorizzato per la chiave, calcolandolo se necessario.
+        :param chiave: Chiave (hashable).
+        :param calcola: Funzione senza parametri che calcola il valore.
+        """
+        if chiave in self.valori:
+            self.successi += 1
+            return self.valori[chiave]
+
+        self.mancati += 1
+        valore = calcola()
+        self.valori[chiave] = valore
+        return valore
+
+    def invalida(self):
+        self.valori.clear()
+
+    def __str__(self):
+        return "successi=%d mancati=%d" % (self.successi, self.mancati)
+
+
+def memoria_attuale():
+    """
+    Ritorna la memoria della richiesta attuale, o None se non attiva.
+    """
+    return getattr(_locale, 'memoria', None)
+
+
+@contextmanager
+def memoria_richiesta():
+    """
+    Attiva la memoria per la durata del blocco. Se gia' attiva (es. viste annidate), la riutilizza.
+    """
+    attuale = memoria_attuale()
+    if attuale is not None:
+        yield attuale
+        return
+
+    memoria = MemoriaRichiesta()
+    _locale.memoria = memoria
+    try:
+        yield memoria
+    finally:
+        _locale.memoria = None
+        if settings.DEBUG:
+            logger.debug('Memoria richiesta: %s' % (memoria,))
+
+
+def invalida_memoria():
+    """
+    Svuota la memoria della richiesta attuale. Da chiamare alla modifica
+     di dati che influenzano i metodi memorizzati (es. Delega, Appartenenza).
+    """
+    memoria = memoria_attuale()
+    if memoria is not None:
+        memoria.invalida()
+
+
+def memorizza_per_richiesta(metodo):
+    """
+    Decoratore per metodi di modelli: memorizza il risultato nella memoria della richiesta,
+     con chiave (modello, pk, metodo, parametri). Se i parametri non sono hashable, o la
+     memoria non e' attiva, il metodo viene semplicemente eseguito.
+    """
+
+    @functools.wraps(metodo)
+    def _metodo(self, *args, **kwargs):
+        memoria = memoria_attuale()
+        if memoria is None or self.pk is None:
+            return metodo(self, *args, **kwargs)
+
+        chiave = (self.__class__.__name__, self.pk, metodo.__name__, args, tuple(sorted(kwargs.items())))
+        try:
+            hash(chiave)
+        except TypeError:
+            return metodo(self, *args, **kwargs)
+
+        return memoria.ottieni(chiave, lambda: metodo(self, *args, **kwargs))
+
+    return _metodo
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.9.12 on 2017-07-12 10:15
+from __future__ import unicode_literals
+
+import django.contrib.gis.db.models.fields
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0018_autorizzazione_automatica'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RicercaGeocodifica',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('creazione', models.DateTimeField(db_index=True, default=django.utils.timezone.now)),
+                ('ultima_modifica', models.DateTimeField(auto_now=True, db_index=True)),
+                ('chiave', models.CharField(max_length=40, unique=True, verbose_name='Chiave')),
+                ('ricerca', models.CharField(max_length=255, verbose_name='Ricerca')),
+                ('fornitore', models.CharField(max_length=64, verbose_name='Fornitore')),
+                ('risultati', models.TextField(default='[]', verbose_name='Risultati')),
+                ('scadenza', models.DateTimeField(db_index=True, verbose_name='Scadenza')),
+            ],
+            options={
+                'verbose_name': 'Ricerca di geocodifica',
+                'verbose_name_plural': 'Ricerche di geocodifica',
+            },
+        ),
+        migrations.CreateModel(
+            name='VoceGazzettiere',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('tipo', models.CharField(choices=[('C', 'Comune'), ('P', 'CAP')], max_length=1, verbose_name='Tipo')),
+                ('chiave', models.CharField(db_index=True, max_length=64, verbose_name='Chiave')),
+                ('geo', django.contrib.gis.db.models.fields.PointField(geography=True, srid=4326)),
+                ('comune', models.CharField(blank=True, max_length=64, verbose_name='Comune')),
+                ('provincia', models.CharField(blank=True, max_length=64, verbose_name='Provincia')),
+                ('provincia_breve', models.CharField(blank=True, max_length=64, verbose_name='Provincia (breve)')),
+                ('regione', models.CharField(blank=True, max_length=64, verbose_name='Regione')),
+                ('cap', models.CharField(blank=True, max_length=32, verbose_name='CAP')),
+                ('locazioni', models.PositiveIntegerField(default=0, verbose_name='Locazioni')),
+            ],
+            options={
+                'verbose_name': 'Voce del gazzettiere',
+                'verbose_name_plural': 'Voci del gazzettiere',
+            },
+        ),
+        migrations.AlterUniqueTogether(
+            name='vocegazzettiere',
+            unique_together=set([('tipo', 'chiave')]),
+        ),
+    ]
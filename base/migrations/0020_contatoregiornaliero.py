@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.9.12 on 2017-07-12 10:15
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('base', '0019_geocodifica'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ContatoreGiornaliero',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('oggetto_id', models.PositiveIntegerField()),
+                ('nome', models.CharField(max_length=32)),
+                ('giorno', models.DateField()),
+                ('valore', models.BigIntegerField(default=0)),
+                ('oggetto_tipo', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='contatori', to='contenttypes.ContentType')),
+            ],
+            options={
+                'verbose_name': 'Contatore giornaliero',
+                'verbose_name_plural': 'Contatori giornalieri',
+            },
+        ),
+        migrations.AlterUniqueTogether(
+            name='contatoregiornaliero',
+            unique_together=set([('oggetto_tipo', 'oggetto_id', 'nome', 'giorno')]),
+        ),
+        migrations.AlterIndexTogether(
+            name='contatoregiornaliero',
+            index_together=set([('oggetto_tipo', 'nome', 'giorno')]),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.9.12 on 2017-07-12 10:15
+from __future__ import unicode_literals
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0020_contatoregiornaliero'),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name='vocegazzettiere',
+            unique_together=set([('tipo', 'chiave', 'provincia_breve')]),
+        ),
+    ]
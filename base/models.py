@@ -6,7 +6,8 @@ from django.contrib.contenttypes.models import ContentType
 from django.core import urlresolvers
 from django.core.exceptions import ObjectDoesNotExist
 from django.db import models
-from django.db.models import Q
+from django.db.transaction import atomic
+from django.db.models import Q, Count, Case, When, F
 from django.utils.timezone import now
 from django.utils.functional import cached_property
 from django.forms import forms
@@ -17,6 +18,7 @@ from anagrafica.permessi.costanti import MODIFICA
 from anagrafica.permessi.incarichi import INCARICHI, INCARICHI_TIPO_DICT
 from anagrafica.validators import crea_validatore_dimensione_file, valida_dimensione_file_10mb
 from base.forms import ModuloMotivoNegazione
+from base.memoria import invalida_memoria
 from base.notifiche import NOTIFICA_NON_INVIARE, NOTIFICA_INVIA
 from base.stringhe import GeneratoreNomeFile, genera_uuid_casuale
 from base.tratti import ConMarcaTemporale
@@ -24,7 +26,6 @@ from datetime import datetime, timezone, timedelta
 
 from base.utils import calcola_scadenza ,concept, iterabile
 
-from jorvik import settings
 
 
 class ModelloSemplice(models.Model):
@@ -173,7 +174,9 @@ class Autorizzazione(ModelloSemplice, ConMarcaTemporale):
         else:
             return None
 
-    def firma(self, firmatario, concedi=True, modulo=None, motivo=None, auto=False, notifiche_attive=True, data=None):
+    @atomic
+    def firma(self, firmatario, concedi=True, modulo=None, motivo=None, auto=False, notifiche_attive=True, data=None,
+              notifiche=None):
         """
         Firma l'autorizzazione.
         :param firmatario: Il firmatario.
@@ -181,6 +184,8 @@ class Autorizzazione(ModelloSemplice, ConMarcaTemporale):
         :param modulo: Se modulo necessario, un modulo valido.
         :param auto: Se la firma avviene con procedura automatica / massiva
         :param notifiche_attive: Se inviare notifiche
+        :param notifiche: Se specificata, lista in cui aggiungere le notifiche da inviare al richiedente,
+                          come tuple (autorizzazione, concessa), invece di inviarle (vedi base.automatiche).
         :return:
         """
         # Controlla che il modulo fornito, se presente, sia valido
@@ -199,6 +204,7 @@ class Autorizzazione(ModelloSemplice, ConMarcaTemporale):
         elif auto:
             self.automatica = True
         self.save()
+        invalida_memoria()  # Cambiano le autorizzazioni in attesa
 
         # Se ha negato, allora avvisa subito della negazione.
         # Nessuna altra firma e' piu' necessaria.
@@ -212,7 +218,10 @@ class Autorizzazione(ModelloSemplice, ConMarcaTemporale):
                     self.save()
             self.oggetto.autorizzazioni_set().update(necessaria=False)
             if self.oggetto.INVIA_NOTIFICA_NEGATA and notifiche_attive:
-                self.notifica_negata(auto=auto)
+                if notifiche is not None:
+                    notifiche.append((self, False))
+                else:
+                    self.notifica_negata(auto=auto)
             return
 
         # Questa concessa, di questo progressivo non e' piu' necessaria
@@ -225,7 +234,10 @@ class Autorizzazione(ModelloSemplice, ConMarcaTemporale):
             self.oggetto.save()
             self.oggetto.autorizzazione_concessa(modulo=modulo, auto=auto, notifiche_attive=notifiche_attive, data=data)
             if self.oggetto.INVIA_NOTIFICA_CONCESSA and notifiche_attive:
-                self.notifica_concessa(auto=auto)
+                if notifiche is not None:
+                    notifiche.append((self, True))
+                else:
+                    self.notifica_concessa(auto=auto)
 
     def concedi(self, firmatario=None, modulo=None, auto=False, notifiche_attive=True, data=None):
         self.firma(firmatario, True, modulo=modulo, auto=auto, notifiche_attive=notifiche_attive, data=data)
@@ -347,72 +359,23 @@ class Autorizzazione(ModelloSemplice, ConMarcaTemporale):
             self.save()
 
     @classmethod
-    def gestisci_automatiche(cls):
-        base = cls.objects.filter(
-            concessa__isnull=True, scadenza__isnull=False, scadenza__lte=now()
-        )
-        da_negare = base.filter(tipo_gestione=cls.NG_AUTO)
-        da_approvare = base.filter(tipo_gestione=cls.AP_AUTO)
-        for autorizzazione in da_negare:
-            autorizzazione.controlla_nega_automatico()
-        for autorizzazione in da_approvare:
-            autorizzazione.controlla_concedi_automatico()
+    def gestisci_automatiche(cls, **kwargs):
+        """
+        Concede o nega le autorizzazioni automatiche scadute, a blocchi (vedi base.automatiche).
+        :return: Dizionario con le metriche dell'elaborazione.
+        """
+        from base.automatiche import gestisci_automatiche
+        return gestisci_automatiche(**kwargs)
 
     @classmethod
     def notifiche_richieste_in_attesa(cls):
-        from anagrafica.models import Estensione,  Trasferimento
-        from posta.models import Messaggio
-
-        oggetto = "Richieste in attesa di approvazione"
-        modello = "email_richieste_pending.html"
-
-        in_attesa = cls.objects.filter(
-            concessa__isnull=True
-        )
-        trasferimenti = in_attesa.filter(oggetto_tipo=ContentType.objects.get_for_model(Trasferimento))
-        estensioni = in_attesa.filter(oggetto_tipo=ContentType.objects.get_for_model(Estensione))
-        trasferimenti_manuali = trasferimenti.filter(scadenza__isnull=True, tipo_gestione=Autorizzazione.MANUALE)
-        trasferimenti_automatici = trasferimenti.filter(
-            scadenza__isnull=False, scadenza__gt=now()
-        ).exclude(tipo_gestione=Autorizzazione.MANUALE)
-
-        autorizzazioni = list(estensioni) + list(trasferimenti_manuali) + list(trasferimenti_automatici)
-
-        persone = dict()
-        for autorizzazione in autorizzazioni:
-            if not autorizzazione.oggetto:
-                print('autorizzazione {} non ha oggetto collegato'.format(autorizzazione.pk))
-                continue
-            if autorizzazione.oggetto and not autorizzazione.oggetto.ritirata and not autorizzazione.oggetto.confermata:
-                destinatari = cls.espandi_notifiche(autorizzazione.destinatario_oggetto, [], True, True)
-                for destinatario in destinatari:
-                    if destinatario.pk not in persone:
-                        persone[destinatario.pk] = {
-                            'persona': None,
-                            'estensioni': [],
-                            'trasferimenti_manuali': [],
-                            'trasferimenti_automatici': [],
-                        }
-                    persone[destinatario.pk]['persona'] = destinatario
-                    if autorizzazione in estensioni:
-                        persone[destinatario.pk]['estensioni'].append(autorizzazione.oggetto)
-                    elif autorizzazione in trasferimenti_manuali:
-                        persone[destinatario.pk]['trasferimenti_manuali'].append(autorizzazione.oggetto)
-                    elif autorizzazione in trasferimenti_automatici:
-                        persone[destinatario.pk]['trasferimenti_automatici'].append(autorizzazione.oggetto)
-
-        for persona in persone.values():
-            corpo = {
-                "persona": persona,
-                "DATA_AVVIO_TRASFERIMENTI_AUTO": settings.DATA_AVVIO_TRASFERIMENTI_AUTO
-            }
-
-            Messaggio.costruisci_e_invia(
-                oggetto=oggetto,
-                modello=modello,
-                corpo=corpo,
-                destinatari=[persona['persona']]
-            )
+        """
+        Accoda il promemoria delle richieste di estensione e trasferimento in attesa ai presidenti
+         e agli uffici soci delle sedi di destinazione (vedi base.riepiloghi).
+        :return: Il numero di messaggi accodati.
+        """
+        from base.riepiloghi import accoda_richieste_in_attesa
+        return accoda_richieste_in_attesa()
 
 
 class Log(ModelloSemplice, ConMarcaTemporale):
@@ -528,14 +491,29 @@ class ConAutorizzazioni(models.Model):
         self.autorizzazioni.all().delete()
         super(ConAutorizzazioni, self).delete()
 
-    confermata = models.BooleanField("Confermata", default=True, db_index=True)
-    ritirata = models.BooleanField("Ritirata", default=False, db_index=True)
-    automatica = models.BooleanField("Automatica", default=False, db_index=True)
+    def save(self, *args, **kwargs):
+        self.esito = self.calcola_esito()
+        super(ConAutorizzazioni, self).save(*args, **kwargs)
 
     ESITO_OK = "Confermato"
     ESITO_NO = "Negato"
     ESITO_RITIRATA = "Ritirata"
     ESITO_PENDING = "In attesa"
+    ESITI = (
+        (ESITO_OK, ESITO_OK),
+        (ESITO_NO, ESITO_NO),
+        (ESITO_RITIRATA, ESITO_RITIRATA),
+        (ESITO_PENDING, ESITO_PENDING),
+    )
+
+    confermata = models.BooleanField("Confermata", default=True, db_index=True)
+    ritirata = models.BooleanField("Ritirata", default=False, db_index=True)
+    automatica = models.BooleanField("Automatica", default=False, db_index=True)
+
+    # Esito (*ConAutorizzazioni.ESITO_OK, .ESITO_NO, .ESITO_PENDING, .ESITO_RITIRATA), calcolato
+    #  al salvataggio da confermata, ritirata e dalle autorizzazioni (vedi calcola_esito).
+    esito = models.CharField("Esito", max_length=16, choices=ESITI, default=ESITO_OK,
+                             db_index=True, editable=False)
 
     # Sovrascrivimi! Invia notifiche e-mail?
     INVIA_NOTIFICHE = True
@@ -554,34 +532,7 @@ class ConAutorizzazioni(models.Model):
         :param esito: L'esito: (*ConAutorizzazioni.ESITO_OK, .ESITO_NO, .ESITO_PENDING, .ESITO_RITIRATA).
         :return: QuerySet filtrato.
         """
-        if esito == cls.ESITO_OK:
-            return Q(confermata=True, ritirata=False, **kwargs)
-
-        elif esito == cls.ESITO_RITIRATA:
-            return Q(ritirata=True, **kwargs)
-
-        elif esito == cls.ESITO_PENDING:
-            # Confermata = False, ma almeno una autorizzazione e nessuna negata
-            tipo = ContentType.objects.get_for_model(cls)
-            return Q(
-                        Q(confermata=False, ritirata=False,
-                          pk__in=Autorizzazione.objects.filter(oggetto_tipo__pk=tipo.id).values_list('oggetto_id', flat=True)),
-                        ~Q(
-                          pk__in=Autorizzazione.objects.filter(oggetto_tipo__pk=tipo.id, concessa=False).values_list('oggetto_id', flat=True)
-                        ),
-                        **kwargs
-                    )
-
-        else:  # ESITO_NO
-            tipo = ContentType.objects.get_for_model(cls)
-            return Q(
-                        Q(
-                            # Confermata = False, ma non pendente
-                            confermata=False,
-                        ),
-                        ~Q(pk__in=cls.con_esito(cls.ESITO_PENDING)),
-                        **kwargs
-                   )
+        return Q(esito=esito, **kwargs)
 
     @classmethod
     def con_esito_ok(cls, **kwargs):
@@ -615,27 +566,42 @@ class ConAutorizzazioni(models.Model):
         """
         return cls.con_esito(cls.ESITO_NO, **kwargs)
 
-    @property
-    def esito(self):
+    def calcola_esito(self):
         """
-        Ottiene l'esito. (*ConAutorizzazioni.ESITO_OK, .ESITO_NO, .ESITO_PENDING, .ESITO_RITIRATA).
+        Calcola l'esito. (*ConAutorizzazioni.ESITO_OK, .ESITO_NO, .ESITO_PENDING, .ESITO_RITIRATA).
+        Usato al salvataggio per valorizzare il campo esito; al piu' una query.
         :return:
         """
-        if self.confermata:  # Se confermata, okay
+        if self.ritirata:  # Ritirata?
+            return self.ESITO_RITIRATA
+
+        elif self.confermata:  # Se confermata, okay
             return self.ESITO_OK
 
-        elif self.ritirata:  # Ritirata?
-            return self.ESITO_RITIRATA
+        elif self.pk is None:  # Non ancora salvato, nessuna richiesta: negato d'ufficio
+            return self.ESITO_NO
 
-        elif self.autorizzazioni.filter(concessa=False).exists():  # Altrimenti, se almeno una negazione, esito negativo
+        conteggi = self.autorizzazioni_set().aggregate(
+            totale=Count('pk'), negate=Count(Case(When(concessa=False, then=F('pk')))),
+        )
+        if conteggi['negate']:  # Altrimenti, se almeno una negazione, esito negativo
             return self.ESITO_NO
 
-        elif not self.autorizzazioni.exists():  # Se non vi e' nessuna richiesta, allora e' negata d'ufficio
+        elif not conteggi['totale']:  # Se non vi e' nessuna richiesta, allora e' negata d'ufficio
             return self.ESITO_NO
 
         else:  # Se non confermata e nessun esito negativo, ancora pendente
             return self.ESITO_PENDING
 
+    @classmethod
+    def esiti_in_blocco(cls, oggetti):
+        """
+        Ritorna l'esito di molti oggetti, senza query (vedi il campo esito).
+        :param oggetti: Elenco di oggetti di questo modello.
+        :return: Dizionario {pk oggetto: esito}.
+        """
+        return {oggetto.pk: oggetto.esito for oggetto in oggetti}
+
     @property
     def autorizzazioni_negate(self):
         return self.autorizzazioni.filter(concessa=False)
@@ -691,6 +657,7 @@ class ConAutorizzazioni(models.Model):
         self.autorizzazione_richiedi(richiedente, (incarico, sede_riferimento), invia_notifiche=invia_notifiche, auto=auto, **kwargs)
         return True
 
+    @atomic
     def autorizzazione_richiedi(self, richiedente, destinatario, invia_notifiche=None, auto=None, scadenza=None, **kwargs):
         """
         Richiede una autorizzazione per l'oggetto attuale
@@ -769,6 +736,7 @@ class ConAutorizzazioni(models.Model):
         # Evita cache per esito
         self.refresh_from_db()
 
+    @atomic
     def autorizzazioni_ritira(self):
         """
         Ritira le autorizzazioni pendenti ed imposta lo stato a ritirato.
@@ -974,3 +942,28 @@ class ConVecchioID(models.Model):
         abstract = True
 
     vecchio_id = models.IntegerField(default=None, null=True, blank=True, db_index=True)
+
+
+class ContatoreGiornaliero(models.Model):
+    """
+    Incrementi giornalieri di un contatore di un oggetto (es. visualizzazioni di un Articolo,
+     downloads di un Documento), scritti da base.contatori.
+    """
+
+    class Meta:
+        verbose_name = "Contatore giornaliero"
+        verbose_name_plural = "Contatori giornalieri"
+        unique_together = (('oggetto_tipo', 'oggetto_id', 'nome', 'giorno'),)
+        index_together = [
+            ['oggetto_tipo', 'nome', 'giorno'],
+        ]
+
+    oggetto_tipo = models.ForeignKey(ContentType, related_name="contatori", on_delete=models.CASCADE)
+    oggetto_id = models.PositiveIntegerField()
+    oggetto = GenericForeignKey('oggetto_tipo', 'oggetto_id')
+    nome = models.CharField(max_length=32)
+    giorno = models.DateField()
+    valore = models.BigIntegerField(default=0)
+
+    def __str__(self):
+        return "%s %s: %d" % (self.nome, self.giorno, self.valore)
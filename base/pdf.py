@@ -0,0 +1,277 @@
+"""
+Questo modulo converte in PDF l'HTML dei modelli (vedi PDF.genera_e_salva), con un motore
+ configurabile (PDF_MOTORE):
+ - MotoreDOMPDF invia l'HTML al servizio DOMPDF_ENDPOINT, riusando la connessione HTTP (una per
+   thread) invece di aprirne una nuova per ogni documento;
+ - MotoreWeasyPrint genera il PDF localmente, con WeasyPrint (dipendenza opzionale);
+ - MotoreFinto genera pagine vuote e conta le chiamate, per i test.
+
+I PDF generati vengono salvati in una cache su disco (CARTELLA_CACHE), con chiave l'hash del
+ contenuto (motore, formato, orientamento ed HTML): documenti identici vengono generati una
+ volta sola. Se l'HTML contiene parti che cambiano ad ogni generazione (es. l'ora, vedi
+ PDF.prepara_documento), la chiave viene calcolata su un HTML senza di esse (html_chiave).
+ I file piu' vecchi di PDF_GIORNI_CACHE giorni vengono cancellati da pulisci_cache.
+
+genera_molti genera piu' documenti in parallelo, con al massimo PDF_PROCESSI thread (motori
+ HTTP) o processi (motori locali); unisci li unisce in un solo PDF con piu' pagine (es. per la
+ stampa di molti tesserini).
+"""
+import hashlib
+import http.client
+import io
+import os
+import tempfile
+import threading
+import time
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.utils.module_loading import import_string
+
+CARTELLA_CACHE = 'cache_pdf/'
+
+FORMATO_A4 = 'a4'
+FORMATO_CR80 = 'cr80'
+ORIENTAMENTO_ORIZZONTALE = 'landscape'
+ORIENTAMENTO_VERTICALE = 'portrait'
+
+PARALLELO_THREAD = 'thread'
+PARALLELO_PROCESSI = 'processi'
+
+
+class ErrorePDF(Exception):
+    pass
+
+
+class MotorePDF(object):
+    """
+    Interfaccia dei motori di generazione dei PDF.
+    """
+
+    nome = None
+    parallelo = PARALLELO_THREAD
+
+    def genera(self, html, formato=FORMATO_A4, orientamento=ORIENTAMENTO_VERTICALE):
+        """
+        :param html: L'HTML del documento.
+        :param formato: FORMATO_A4 o FORMATO_CR80.
+        :param orientamento: ORIENTAMENTO_VERTICALE o ORIENTAMENTO_ORIZZONTALE.
+        :return: Il contenuto del PDF (bytes).
+        """
+        raise NotImplementedError()
+
+
+class MotoreDOMPDF(MotorePDF):
+    """
+    Servizio DOMPDF esterno (DOMPDF_ENDPOINT), con connessioni HTTP persistenti.
+    """
+
+    nome = 'dompdf'
+    TIMEOUT = 60
+
+    _locale = threading.local()
+
+    def _connessione(self, url):
+        connessioni = self._locale.__dict__.setdefault('connessioni', {})
+        connessione = connessioni.get((url.scheme, url.netloc))
+        if connessione is None:
+            classe = http.client.HTTPSConnection if url.scheme == 'https' else http.client.HTTPConnection
+            connessione = classe(url.netloc, timeout=self.TIMEOUT)
+            connessioni[(url.scheme, url.netloc)] = connessione
+        return connessione
+
+    def _chiudi(self, url):
+        connessione = self._locale.__dict__.get('connessioni', {}).pop((url.scheme, url.netloc), None)
+        if connessione is not None:
+            connessione.close()
+
+    def genera(self, html, formato=FORMATO_A4, orientamento=ORIENTAMENTO_VERTICALE):
+        url = urllib.parse.urlsplit(settings.DOMPDF_ENDPOINT)
+        percorso = (url.path or '/') + ('?%s' % (url.query,) if url.query else '')
+        corpo = urllib.parse.urlencode({
+            'paper': formato,
+            'orientation': orientamento,
+            'html': html,
+        }).encode('UTF-8')
+        intestazioni = {'Content-Type': 'application/x-www-form-urlencoded'}
+
+        # Un secondo tentativo, su una nuova connessione, se il servizio ha chiuso quella in uso
+        for tentativo in range(2):
+            connessione = self._connessione(url)
+            try:
+                connessione.request('POST', percorso, corpo, intestazioni)
+                risposta = connessione.getresponse()
+                contenuto = risposta.read()
+            except (http.client.HTTPException, OSError):
+                self._chiudi(url)
+                if tentativo:
+                    raise
+                continue
+            if risposta.status != 200:
+                raise ErrorePDF("DOMPDF ha risposto %d %s" % (risposta.status, risposta.reason))
+            return contenuto
+
+
+class MotoreWeasyPrint(MotorePDF):
+    """
+    Generazione locale con WeasyPrint. Le pagine di FORMATO_CR80 sono di 85,6 x 54 mm.
+    """
+
+    nome = 'weasyprint'
+    parallelo = PARALLELO_PROCESSI
+
+    DIMENSIONI = {
+        FORMATO_A4: 'A4',
+        FORMATO_CR80: '85.6mm 54mm',
+    }
+
+    def genera(self, html, formato=FORMATO_A4, orientamento=ORIENTAMENTO_VERTICALE):
+        try:
+            from weasyprint import HTML, CSS
+        except ImportError:
+            raise ImproperlyConfigured("MotoreWeasyPrint richiede il pacchetto weasyprint")
+        dimensione = self.DIMENSIONI.get(formato, 'A4')
+        if formato != FORMATO_CR80:
+            dimensione = "%s %s" % (dimensione, orientamento)
+        pagina = CSS(string="@page { size: %s; margin: 0; }" % (dimensione,))
+        return HTML(string=html, base_url=settings.MEDIA_ROOT).write_pdf(stylesheets=[pagina])
+
+
+class MotoreFinto(MotorePDF):
+    """
+    Motore per i test: genera una pagina vuota e conta le chiamate. Richiede PyPDF2.
+    """
+
+    nome = 'finto'
+    chiamate = []
+
+    def genera(self, html, formato=FORMATO_A4, orientamento=ORIENTAMENTO_VERTICALE):
+        from PyPDF2 import PdfFileWriter
+        MotoreFinto.chiamate.append(html)
+        scrittore = PdfFileWriter()
+        scrittore.addBlankPage(595, 842)
+        contenuto = io.BytesIO()
+        scrittore.write(contenuto)
+        return contenuto.getvalue()
+
+
+def motore_pdf():
+    """
+    :return: Un'istanza del motore configurato in PDF_MOTORE.
+    """
+    return import_string(settings.PDF_MOTORE)()
+
+
+def _chiave(motore, html, formato, orientamento):
+    contenuto = "\n".join((motore.nome or motore.__class__.__name__, formato, orientamento, html))
+    return hashlib.sha256(contenuto.encode('utf-8')).hexdigest()
+
+
+def _percorso_cache(chiave):
+    return os.path.join(settings.MEDIA_ROOT, CARTELLA_CACHE, chiave[:2], "%s.pdf" % (chiave,))
+
+
+def _leggi_cache(chiave):
+    if not settings.PDF_GIORNI_CACHE:
+        return None
+    try:
+        with open(_percorso_cache(chiave), 'rb') as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def _scrivi_cache(chiave, contenuto):
+    if not settings.PDF_GIORNI_CACHE:
+        return
+    percorso = _percorso_cache(chiave)
+    os.makedirs(os.path.dirname(percorso), exist_ok=True)
+    # Scrive su un file temporaneo e lo rinomina, per non leggere mai un file a meta'
+    descrittore, temporaneo = tempfile.mkstemp(dir=os.path.dirname(percorso), suffix='.tmp')
+    with os.fdopen(descrittore, 'wb') as f:
+        f.write(contenuto)
+    os.replace(temporaneo, percorso)
+
+
+def genera(html, formato=FORMATO_A4, orientamento=ORIENTAMENTO_VERTICALE, html_chiave=None):
+    """
+    Genera un PDF, o lo legge dalla cache se un documento identico e' gia' stato generato.
+    :param html_chiave: L'HTML su cui calcolare la chiave della cache, se diverso da html.
+    :return: Il contenuto del PDF (bytes).
+    """
+    return genera_molti([(html, formato, orientamento, html_chiave)])[0]
+
+
+def genera_molti(documenti, processi=None):
+    """
+    Genera piu' PDF in parallelo. I documenti identici o gia' in cache vengono generati una volta sola.
+    :param documenti: Lista di tuple (html, formato, orientamento), o (html, formato, orientamento,
+                      html_chiave) per calcolare la chiave della cache su html_chiave.
+    :param processi: Numero massimo di generazioni contemporanee (default PDF_PROCESSI).
+    :return: Lista del contenuto dei PDF (bytes), nello stesso ordine dei documenti.
+    """
+    motore = motore_pdf()
+    chiavi = [_chiave(motore, (documento[3:] and documento[3]) or documento[0], documento[1], documento[2])
+              for documento in documenti]
+    generati = {}
+    da_generare = {}
+    for chiave, documento in zip(chiavi, documenti):
+        if chiave in generati or chiave in da_generare:
+            continue
+        contenuto = _leggi_cache(chiave)
+        if contenuto is None:
+            da_generare[chiave] = documento[:3]
+        else:
+            generati[chiave] = contenuto
+
+    processi = min(processi or settings.PDF_PROCESSI, len(da_generare))
+    if processi > 1:
+        esecutore = ProcessPoolExecutor if motore.parallelo == PARALLELO_PROCESSI else ThreadPoolExecutor
+        with esecutore(max_workers=processi) as e:
+            futuri = {chiave: e.submit(motore.genera, *documento) for chiave, documento in da_generare.items()}
+            nuovi = {chiave: futuro.result() for chiave, futuro in futuri.items()}
+    else:
+        nuovi = {chiave: motore.genera(*documento) for chiave, documento in da_generare.items()}
+
+    for chiave, contenuto in nuovi.items():
+        _scrivi_cache(chiave, contenuto)
+    generati.update(nuovi)
+    return [generati[chiave] for chiave in chiavi]
+
+
+def unisci(contenuti):
+    """
+    Unisce piu' PDF in uno solo, con le pagine nell'ordine dato. Richiede PyPDF2.
+    :param contenuti: Lista del contenuto dei PDF (bytes).
+    :return: Il contenuto del PDF unito (bytes).
+    """
+    from PyPDF2 import PdfFileMerger
+    unione = PdfFileMerger()
+    for contenuto in contenuti:
+        unione.append(io.BytesIO(contenuto))
+    risultato = io.BytesIO()
+    unione.write(risultato)
+    unione.close()
+    return risultato.getvalue()
+
+
+def pulisci_cache():
+    """
+    Cancella i PDF in cache piu' vecchi di PDF_GIORNI_CACHE giorni.
+    :return: Il numero di file cancellati.
+    """
+    cartella = os.path.join(settings.MEDIA_ROOT, CARTELLA_CACHE)
+    limite = time.time() - settings.PDF_GIORNI_CACHE * 86400
+    cancellati = 0
+    for radice, _, files in os.walk(cartella):
+        for nome in files:
+            percorso = os.path.join(radice, nome)
+            try:
+                if os.path.getmtime(percorso) < limite:
+                    os.remove(percorso)
+                    cancellati += 1
+            except OSError:
+                pass
+    return cancellati
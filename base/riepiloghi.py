@@ -0,0 +1,145 @@
+"""
+Questo modulo costruisce il promemoria periodico delle richieste di estensione e trasferimento
+ in attesa (vedi Autorizzazione.notifiche_richieste_in_attesa e base.cron.CronRichiesteInAttesa).
+
+Invece di espandere i destinatari per ogni autorizzazione, il calcolo procede per sede:
+ - le autorizzazioni in attesa vengono lette con una query, raggruppate per sede di destinazione;
+ - estensioni e trasferimenti vengono caricati con una query per tipo;
+ - i destinatari di tutte le sedi (presidente e ufficio soci, come Autorizzazione.espandi_notifiche)
+   vengono calcolati da una sola query sulle deleghe attuali.
+I riepiloghi vengono prodotti uno alla volta (vedi riepiloghi_richieste_in_attesa) ed accodati.
+"""
+from collections import OrderedDict, defaultdict
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import Q
+from django.utils.timezone import now
+
+from anagrafica.models import Delega, Estensione, Sede, Trasferimento
+from anagrafica.permessi.applicazioni import PRESIDENTE, UFFICIO_SOCI, UFFICIO_SOCI_UNITA
+from base.models import Autorizzazione
+
+ESTENSIONI = 'estensioni'
+TRASFERIMENTI_MANUALI = 'trasferimenti_manuali'
+TRASFERIMENTI_AUTOMATICI = 'trasferimenti_automatici'
+
+
+def destinatari_sedi(sedi):
+    """
+    Calcola i destinatari delle notifiche di ogni sede, come
+     Autorizzazione.espandi_notifiche(sede, [], True, True), con una query sulle deleghe.
+    :param sedi: Elenco di oggetti Sede.
+    :return: Dizionario {pk sede: [Persona]}.
+    """
+    comitati = {sede.pk: sede.comitato for sede in sedi}
+    pks = set(comitati) | {comitato.pk for comitato in comitati.values() if comitato}
+
+    delegati = defaultdict(lambda: defaultdict(list))  # {pk sede: {tipo: [Persona]}}
+    deleghe = Delega.objects.filter(
+        Delega.query_attuale().q,
+        oggetto_tipo=ContentType.objects.get_for_model(Sede), oggetto_id__in=pks,
+        tipo__in=[PRESIDENTE, UFFICIO_SOCI, UFFICIO_SOCI_UNITA],
+    ).select_related('persona').order_by('persona_id')
+    for delega in deleghe:
+        delegati[delega.oggetto_id][delega.tipo].append(delega.persona)
+
+    def ufficio_soci(pk):
+        return delegati[pk][UFFICIO_SOCI] + delegati[pk][UFFICIO_SOCI_UNITA]
+
+    risultato = {}
+    for pk, comitato in comitati.items():
+        presidenti = delegati[comitato.pk][PRESIDENTE] if comitato else []
+
+        # Come Sede.delegati_ufficio_soci: della sede, altrimenti del comitato, altrimenti il presidente
+        persone = ufficio_soci(pk) or (ufficio_soci(comitato.pk) if comitato else []) or presidenti
+        persone = presidenti[:1] + persone
+
+        unici = OrderedDict((persona.pk, persona) for persona in persone)
+        risultato[pk] = list(unici.values())
+    return risultato
+
+
+def _categoria(tipo_estensione, oggetto_tipo_id, scadenza, tipo_gestione, adesso):
+    if oggetto_tipo_id == tipo_estensione:
+        return ESTENSIONI
+    if scadenza is None and tipo_gestione == Autorizzazione.MANUALE:
+        return TRASFERIMENTI_MANUALI
+    if scadenza is not None and scadenza > adesso and tipo_gestione != Autorizzazione.MANUALE:
+        return TRASFERIMENTI_AUTOMATICI
+    return None
+
+
+def riepiloghi_richieste_in_attesa():
+    """
+    Produce i riepiloghi delle richieste in attesa, uno per destinatario.
+    :return: Generatore di dizionari {'persona': Persona, ESTENSIONI: [...], TRASFERIMENTI_MANUALI: [...],
+             TRASFERIMENTI_AUTOMATICI: [...]}.
+    """
+    adesso = now()
+    tipo_estensione = ContentType.objects.get_for_model(Estensione).pk
+    tipo_trasferimento = ContentType.objects.get_for_model(Trasferimento).pk
+
+    righe = Autorizzazione.objects.filter(
+        Q(oggetto_tipo_id=tipo_estensione)
+        | Q(oggetto_tipo_id=tipo_trasferimento, scadenza__isnull=True, tipo_gestione=Autorizzazione.MANUALE)
+        | (Q(oggetto_tipo_id=tipo_trasferimento, scadenza__gt=adesso) & ~Q(tipo_gestione=Autorizzazione.MANUALE)),
+        concessa__isnull=True,
+        destinatario_oggetto_tipo=ContentType.objects.get_for_model(Sede),
+    ).order_by('pk').values_list('oggetto_tipo_id', 'oggetto_id', 'destinatario_oggetto_id',
+                                 'scadenza', 'tipo_gestione')
+    righe = list(righe)
+
+    oggetti = {}
+    for tipo, modello in ((tipo_estensione, Estensione), (tipo_trasferimento, Trasferimento)):
+        pks = {oggetto_id for oggetto_tipo_id, oggetto_id, _, _, _ in righe if oggetto_tipo_id == tipo}
+        for oggetto in modello.objects.filter(pk__in=pks, ritirata=False, confermata=False)\
+                .select_related('persona', 'destinazione'):
+            oggetti[(tipo, oggetto.pk)] = oggetto
+
+    sedi = Sede.objects.filter(pk__in={riga[2] for riga in righe}).select_related('genitore')
+    destinatari = destinatari_sedi(sedi)
+
+    # L'ordine segue quello originale: estensioni, trasferimenti manuali, trasferimenti automatici
+    riepiloghi = OrderedDict()
+    for categoria in (ESTENSIONI, TRASFERIMENTI_MANUALI, TRASFERIMENTI_AUTOMATICI):
+        for oggetto_tipo_id, oggetto_id, sede_id, scadenza, tipo_gestione in righe:
+            if _categoria(tipo_estensione, oggetto_tipo_id, scadenza, tipo_gestione, adesso) != categoria:
+                continue
+            oggetto = oggetti.get((oggetto_tipo_id, oggetto_id))
+            if oggetto is None:
+                continue
+            for persona in destinatari.get(sede_id, []):
+                if persona.pk not in riepiloghi:
+                    riepiloghi[persona.pk] = {
+                        'persona': persona,
+                        ESTENSIONI: [],
+                        TRASFERIMENTI_MANUALI: [],
+                        TRASFERIMENTI_AUTOMATICI: [],
+                    }
+                riepiloghi[persona.pk][categoria].append(oggetto)
+
+    for riepilogo in riepiloghi.values():
+        yield riepilogo
+
+
+def accoda_richieste_in_attesa():
+    """
+    Accoda un messaggio di promemoria per ogni riepilogo delle richieste in attesa.
+    :return: Il numero di messaggi accodati.
+    """
+    from posta.models import Messaggio
+
+    numero = 0
+    for riepilogo in riepiloghi_richieste_in_attesa():
+        Messaggio.costruisci_e_accoda(
+            oggetto="Richieste in attesa di approvazione",
+            modello="email_richieste_pending.html",
+            corpo={
+                "persona": riepilogo,
+                "DATA_AVVIO_TRASFERIMENTI_AUTO": settings.DATA_AVVIO_TRASFERIMENTI_AUTO,
+            },
+            destinatari=[riepilogo['persona']],
+        )
+        numero += 1
+    return numero
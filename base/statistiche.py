@@ -0,0 +1,71 @@
+"""
+Strumenti per il calcolo di serie statistiche con query aggregate.
+
+Invece di eseguire una query per ogni periodo (es. 53 settimane), i valori vengono raggruppati
+ per giorno con una sola query (vedi conta_per_giorno) e poi sommati per periodo in Python
+ (vedi somma_per_periodi).
+"""
+from datetime import date, datetime, time, timedelta
+
+from django.conf import settings
+from django.db.models import Count, DateField, F, Func, Value
+
+
+class GiornoLocale(Func):
+    """
+    Il giorno (nel fuso orario del sito) di un campo data e ora: date(campo AT TIME ZONE fuso).
+    """
+    template = "date(%(expressions)s)"
+    arg_joiner = " AT TIME ZONE "
+
+    def __init__(self, campo, **extra):
+        super(GiornoLocale, self).__init__(F(campo), Value(settings.TIME_ZONE), output_field=DateField(), **extra)
+
+
+def conta_per_giorno(queryset, campo, dal_giorno=None):
+    """
+    Conta gli oggetti per giorno, con una sola query (GROUP BY).
+    :param queryset: Il QuerySet da contare.
+    :param campo: Il nome del campo data e ora (es. 'creazione').
+    :param dal_giorno: Se specificato, solo dal giorno incluso.
+    :return: Dizionario {date: numero}.
+    """
+    if dal_giorno:
+        queryset = queryset.filter(**{"%s__gte" % (campo,): datetime.combine(dal_giorno, time(0, 0, 0))})
+    righe = queryset.order_by().annotate(giorno_statistica=GiornoLocale(campo))\
+        .values('giorno_statistica').annotate(numero=Count('pk')).values_list('giorno_statistica', 'numero')
+    return dict(righe)
+
+
+def periodi(giorni, numero, oggi=None):
+    """
+    Ritorna i periodi di giorni consecutivi che terminano oggi, dal piu' vecchio al piu' recente.
+    :param giorni: La durata di ogni periodo in giorni (es. 7 per le settimane).
+    :param numero: Il numero di periodi precedenti a quello attuale.
+    :return: Lista di tuple (periodo, inizio, fine), dove periodo e' il numero di periodi fa
+             e inizio/fine sono date (incluse).
+    """
+    oggi = oggi or date.today()
+    risultato = []
+    for periodo in range(numero, -1, -1):
+        fine = oggi - timedelta(days=(giorni * periodo))
+        inizio = fine - timedelta(days=giorni - 1)
+        risultato.append((periodo, inizio, fine))
+    return risultato
+
+
+def somma_per_periodi(valori, elenco_periodi, zero=0):
+    """
+    Somma dei valori giornalieri per periodo.
+    :param valori: Dizionario {date: valore} (es. conta_per_giorno).
+    :param elenco_periodi: Lista di periodi (vedi periodi).
+    :param zero: Il valore iniziale della somma (es. timedelta()).
+    :return: Lista di somme, una per periodo.
+    """
+    somme = []
+    for periodo, inizio, fine in elenco_periodi:
+        somma = zero
+        for giorno in range((fine - inizio).days + 1):
+            somma += valori.get(inizio + timedelta(days=giorno), zero)
+        somme.append(somma)
+    return somme
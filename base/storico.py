@@ -0,0 +1,129 @@
+"""
+Questo modulo contiene le operazioni di migrazione per il tratto ConStoricoIndicizzato
+ (vedi base.tratti) e il benchmark delle query di attualita'.
+
+La colonna periodo contiene tstzrange(inizio, fine, '[)'), vuoto se fine <= inizio, ed e'
+ mantenuta da un trigger: rimane allineata anche con QuerySet.update() e SQL diretto.
+ Le righe con periodo vuoto non si sovrappongono ad alcun intervallo: le query di attualita'
+ le filtrano su inizio e fine, con l'indice parziale creato da operazioni_periodo_vuoto.
+"""
+import time
+
+from django.db import connection, migrations
+
+FUNZIONE_PERIODO = """
+CREATE OR REPLACE FUNCTION storico_periodo() RETURNS trigger AS $$
+BEGIN
+    IF NEW.fine IS NOT NULL AND NEW.fine < NEW.inizio THEN
+        NEW.periodo := 'empty'::tstzrange;
+    ELSE
+        NEW.periodo := tstzrange(NEW.inizio, NEW.fine, '[)');
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+
+def operazioni_periodo(tabella):
+    """
+    Operazioni di migrazione per una tabella con ConStoricoIndicizzato, da eseguire
+     dopo l'aggiunta del campo periodo: trigger, valorizzazione delle righe esistenti e indice GiST.
+    :param tabella: Il nome della tabella (es. 'anagrafica_appartenenza').
+    :return: Lista di operazioni.
+    """
+    return [
+        migrations.RunSQL(FUNZIONE_PERIODO, reverse_sql=migrations.RunSQL.noop),
+        migrations.RunSQL(
+            "CREATE TRIGGER {0}_periodo BEFORE INSERT OR UPDATE OF inizio, fine, periodo ON {0} "
+            "FOR EACH ROW EXECUTE PROCEDURE storico_periodo();".format(tabella),
+            reverse_sql="DROP TRIGGER IF EXISTS {0}_periodo ON {0};".format(tabella),
+        ),
+        migrations.RunSQL(
+            "UPDATE {0} SET periodo = NULL;".format(tabella),  # Valorizzato dal trigger
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.RunSQL(
+            "CREATE INDEX {0}_periodo_gist ON {0} USING gist (periodo);".format(tabella),
+            reverse_sql="DROP INDEX IF EXISTS {0}_periodo_gist;".format(tabella),
+        ),
+    ]
+
+
+def operazioni_periodo_vuoto(tabella):
+    """
+    Operazioni di migrazione per l'indice parziale delle righe con periodo vuoto, da eseguire
+     dopo operazioni_periodo.
+    :param tabella: Il nome della tabella (es. 'anagrafica_appartenenza').
+    :return: Lista di operazioni.
+    """
+    return [
+        migrations.RunSQL(
+            "CREATE INDEX {0}_periodo_vuoto ON {0} (inizio, fine) WHERE isempty(periodo);".format(tabella),
+            reverse_sql="DROP INDEX IF EXISTS {0}_periodo_vuoto;".format(tabella),
+        ),
+    ]
+
+
+def _spiega(cursor, sql, parametri):
+    inizio = time.time()
+    cursor.execute("EXPLAIN (ANALYZE, FORMAT JSON) " + sql, parametri)
+    piano = cursor.fetchone()[0][0]
+    return time.time() - inizio, piano
+
+
+def _nodi(piano):
+    nodi = [piano['Node Type']]
+    for figlio in piano.get('Plans', []):
+        nodi += _nodi(figlio)
+    return nodi
+
+
+def benchmark_periodo(righe=1000000, ripetizioni=5, progresso=print):
+    """
+    Confronta, su una tabella temporanea di appartenenze sintetiche, il filtro di attualita'
+     con inizio/fine (indici btree) e con periodo (indice GiST), usando EXPLAIN ANALYZE.
+    :param righe: Numero di righe sintetiche.
+    :param ripetizioni: Numero di esecuzioni per ogni query.
+    :param progresso: Funzione per i messaggi.
+    :return: Dizionario {nome query: (tempo medio in secondi, tipi di nodo del piano)}.
+    """
+    query = {
+        'inizio/fine': "SELECT count(*) FROM storico_benchmark WHERE inizio <= %s AND (fine IS NULL OR fine > %s)",
+        'periodo': "SELECT count(*) FROM storico_benchmark WHERE periodo && tstzrange(%s, %s, '[]')",
+    }
+
+    risultati = {}
+    with connection.cursor() as cursor:
+        progresso("Creazione di %d appartenenze sintetiche" % (righe,))
+        cursor.execute(
+            "CREATE TEMPORARY TABLE storico_benchmark AS "
+            "SELECT i AS id, (i %% 50000) AS persona_id, "
+            "       now() - (random() * interval '40 years') AS inizio, NULL::timestamptz AS fine "
+            "FROM generate_series(1, %s) AS i", [righe]
+        )
+        # Circa il 90% delle appartenenze e' terminato
+        cursor.execute("UPDATE storico_benchmark SET fine = inizio + (random() * interval '5 years') "
+                       "WHERE random() < 0.9")
+        cursor.execute("ALTER TABLE storico_benchmark ADD COLUMN periodo tstzrange")
+        cursor.execute("UPDATE storico_benchmark SET periodo = tstzrange(inizio, fine, '[)')")
+        cursor.execute("CREATE INDEX ON storico_benchmark (inizio)")
+        cursor.execute("CREATE INDEX ON storico_benchmark (fine)")
+        cursor.execute("CREATE INDEX ON storico_benchmark USING gist (periodo)")
+        cursor.execute("ANALYZE storico_benchmark")
+
+        try:
+            for nome, sql in query.items():
+                tempi = []
+                for _ in range(ripetizioni):
+                    cursor.execute("SELECT now() - (random() * interval '20 years')")
+                    istante = cursor.fetchone()[0]
+                    tempo, piano = _spiega(cursor, sql, [istante, istante])
+                    tempi.append(tempo)
+                risultati[nome] = (sum(tempi) / len(tempi), _nodi(piano['Plan']))
+                progresso("%s: %.1f ms, piano: %s" % (nome, risultati[nome][0] * 1000,
+                                                     ", ".join(risultati[nome][1])))
+        finally:
+            cursor.execute("DROP TABLE storico_benchmark")
+
+    return risultati
@@ -2,10 +2,12 @@
 Funzioni per il trattamento delle stringhe.
 """
 import copy
+import re
 from functools import partial
 
 import string
 import types
+import unicodedata
 import uuid
 import os.path
 from datetime import timedelta, datetime
@@ -21,6 +23,18 @@ def normalizza_nome(stringa):
     return string.capwords(stringa.lower().replace("'", "' ")).replace("' ", "'")
 
 
+def normalizza_ricerca(stringa):
+    """
+    Normalizza una stringa per le ricerche: minuscolo, senza accenti, apostrofi, punteggiatura
+     e spazi ripetuti (es. "Sant'Agata  di Militello" -> "sant agata di militello").
+    :param stringa: La stringa da normalizzare.
+    :return: La stringa normalizzata.
+    """
+    testo = unicodedata.normalize('NFKD', stringa or '')
+    testo = ''.join(c for c in testo if not unicodedata.combining(c)).lower()
+    return ' '.join(re.sub(r'[^\w]+', ' ', testo).split())
+
+
 def genera_uuid_casuale():
     """
     Genera una stringa univoca casuale usando la libreria uuid di python.
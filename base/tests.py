@@ -1,33 +1,42 @@
 import datetime
+import io
 import os
 import tempfile
+import uuid
 
 from unittest import skipIf
 from unittest.mock import patch
-from zipfile import ZipFile
+from zipfile import ZipFile, ZIP_DEFLATED, ZIP_STORED
 from django.contrib.auth.tokens import default_token_generator
 import django.core.files
 from django.core import mail
 from django.core.files.temp import NamedTemporaryFile
+from django.contrib.gis.geos import Point
 from django.core.urlresolvers import reverse
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.utils.encoding import force_bytes, force_text
 from django.utils.timezone import now
 from django.utils.http import urlsafe_base64_encode
 from splinter.exceptions import ElementDoesNotExist
 
 from anagrafica.permessi.applicazioni import UFFICIO_SOCI, UFFICIO_SOCI_UNITA
+from anagrafica.permessi.costanti import GESTIONE_SOCI
 from articoli.models import Articolo
 from anagrafica.models import Persona, Delega, Appartenenza
-from attivita.models import Area, Attivita
+from attivita.models import Area, Attivita, Partecipazione
 from autenticazione.utils_test import TestFunzionale
-from base.files import Zip
+from base.esiti import verifica_esiti, ricalcola_esiti
+from base.comuni import COMUNI, indice_comuni
+from base.files import Zip, PDF
 from base.forms_extra import ModuloRichiestaSupporto
 from base.geo import Locazione
-from base.stringhe import normalizza_nome
+from base.geocodifica import FornitoreFinto, costruisci_gazzettiere, pulisci_cache
+from base.memoria import memoria_richiesta, memoria_attuale
+from base.pdf import MotoreFinto, genera as genera_pdf, genera_molti, unisci
+from base.stringhe import normalizza_nome, normalizza_ricerca
 from base.utils import UpperCaseCharField, poco_fa, TitleCharField, mezzanotte_24, mezzanotte_24_ieri, mezzanotte_00
 from base.utils_tests import crea_appartenenza, crea_persona_sede_appartenenza, crea_persona, crea_area_attivita, crea_utenza, \
-    email_fittizzia, crea_sede
+    email_fittizzia, crea_sede, crea_turno
 from curriculum.models import Titolo
 from formazione.models import CorsoBase, Aspirante
 from gestione_file.models import Documento
@@ -96,6 +105,53 @@ class TestBase(TestCase):
             msg="Allegato associato correttamente alla persona"
         )
 
+    def test_zip_streaming(self):
+        p = crea_persona()
+
+        f1 = NamedTemporaryFile(delete=False, mode='wt', suffix='.txt')
+        f1.write(self.CONTENUTO_1 * 1000)
+        f1.close()
+        f2 = NamedTemporaryFile(delete=False, mode='wb', suffix='.pdf')
+        f2.write(os.urandom(200 * 1024))
+        f2.close()
+
+        z = Zip(oggetto=p)
+        z.aggiungi_file(f1.name, self.NOME_1)
+        z.aggiungi_file(f2.name, 'Documento.pdf')
+        risposta = z.risposta_streaming(nome='TestZip.zip')
+        self.assertTrue(risposta.streaming)
+        self.assertIn('TestZip.zip', risposta['Content-Disposition'])
+        self.assertFalse(p.allegati.exists(), msg="Nessun allegato salvato")
+
+        with ZipFile(io.BytesIO(b''.join(risposta.streaming_content))) as zip:
+            self.assertIsNone(zip.testzip())
+            self.assertEqual(zip.read(self.NOME_1).decode(), self.CONTENUTO_1 * 1000)
+            with open(f2.name, 'rb') as f:
+                self.assertEqual(zip.read('Documento.pdf'), f.read())
+            self.assertEqual(zip.getinfo(self.NOME_1).compress_type, ZIP_DEFLATED)
+            self.assertEqual(zip.getinfo('Documento.pdf').compress_type, ZIP_STORED)
+
+    @override_settings(PDF_MOTORE='base.pdf.MotoreFinto', PDF_GIORNI_CACHE=1, PDF_PROCESSI=2)
+    def test_pdf_cache_unione(self):
+        from PyPDF2 import PdfFileReader
+        p = crea_persona()
+        MotoreFinto.chiamate = []
+        html = ["<p>%s %d</p>" % (uuid.uuid4(), i) for i in range(2)]
+
+        self.assertEqual(genera_pdf(html[0]), genera_pdf(html[0]))
+        self.assertEqual(len(MotoreFinto.chiamate), 1, msg="Documento identico generato una volta")
+
+        contenuti = genera_molti([(html[0], 'a4', 'portrait'), (html[1], 'a4', 'portrait'),
+                                  (html[1], 'a4', 'portrait'), (html[1], 'cr80', 'landscape')])
+        self.assertEqual(len(contenuti), 4)
+        self.assertEqual(len(MotoreFinto.chiamate), 3)
+
+        pdf = PDF(oggetto=p)
+        pdf.genera_e_salva_unico([{'corpo': {}}, {'corpo': {}}, {'corpo': {}}], nome="Unico.pdf")
+        with open(pdf.file.path, 'rb') as f:
+            self.assertEqual(PdfFileReader(f).getNumPages(), 3)
+        self.assertEqual(PdfFileReader(io.BytesIO(unisci(contenuti))).getNumPages(), 4)
+
     def test_mezzanotte24(self):
         """
         Test per verificare il comportamento di mezzanotte24, in particolare la sua idempotenza
@@ -130,6 +186,36 @@ class TestBase(TestCase):
         mezzanotte = mezzanotte_24(mezzanotte)
         self.assertEqual(mezzanotte, datetime.datetime(2017, 3, 22, 23, 59, 59))
 
+    def test_esito_autorizzazioni(self):
+        presidente = crea_persona()
+        persona, sede, appartenenza = crea_persona_sede_appartenenza(presidente=presidente)
+        area, attivita = crea_area_attivita(sede)
+        turno = crea_turno(attivita)
+
+        partecipazione = Partecipazione(turno=turno, persona=persona, confermata=False)
+        partecipazione.save()
+        self.assertEqual(partecipazione.esito, Partecipazione.ESITO_NO,
+                         msg="Senza autorizzazioni l'esito e' negativo")
+
+        partecipazione.richiedi()
+        self.assertEqual(partecipazione.esito, Partecipazione.ESITO_PENDING)
+        self.assertIn(partecipazione, Partecipazione.con_esito_pending())
+        self.assertNotIn(partecipazione, Partecipazione.con_esito_no())
+
+        autorizzazione = partecipazione.autorizzazioni.first()
+        autorizzazione.nega(presidente)
+        partecipazione.refresh_from_db()
+        self.assertEqual(partecipazione.esito, Partecipazione.ESITO_NO)
+        self.assertIn(partecipazione, Partecipazione.con_esito_no())
+        self.assertEqual(verifica_esiti(Partecipazione), 0)
+
+        # Le modifiche con QuerySet.update() sono riallineate da ricalcola_esiti
+        Partecipazione.objects.filter(pk=partecipazione.pk).update(confermata=True)
+        self.assertEqual(verifica_esiti(Partecipazione), 1)
+        self.assertEqual(ricalcola_esiti(Partecipazione), 1)
+        self.assertIn(partecipazione, Partecipazione.con_esito_ok())
+        self.assertEqual(verifica_esiti(Partecipazione), 0)
+
 
 class TestGeo(TestCase):
     """
@@ -334,6 +420,52 @@ class TestGeo(TestCase):
         # Est di Greenwitch, Sud dell'equatore
         # Non c'è nulla :D
 
+    @override_settings(GEOCODIFICA_FORNITORE='base.geocodifica.FornitoreFinto')
+    def test_geocodifica_cache_gazzettiere(self):
+        risultato = ('Via Toscana, 12, 00187 Roma RM, Italia', {'lat': 41.9075, 'lng': 12.4926},
+                     {'comune': 'Roma', 'provincia': 'Roma', 'provincia_breve': 'RM', 'regione': 'Lazio',
+                      'civico': '12', 'via': 'Via Toscana', 'cap': '00187', 'stato': 'IT'})
+        FornitoreFinto.RISULTATI = {normalizza_ricerca('Via Toscana 12, Roma'): [risultato]}
+        FornitoreFinto.chiamate = []
+
+        self.assertEqual(Locazione.cerca('Via Toscana 12, Roma'), [risultato])
+        # Maiuscole, spazi, punteggiatura ed accenti non contano: risposta dalla cache
+        self.assertEqual(Locazione.cerca('  VIA TOSCÀNA, 12 -  roma'), [risultato])
+        self.assertEqual(len(FornitoreFinto.chiamate), 1)
+
+        # Anche le ricerche senza risultati vengono salvate
+        self.assertEqual(Locazione.cerca('Indirizzo inesistente'), [])
+        self.assertEqual(Locazione.cerca('indirizzo inesistente'), [])
+        self.assertEqual(len(FornitoreFinto.chiamate), 2)
+        self.assertEqual(pulisci_cache(), 0)
+
+        # Comuni e CAP conosciuti vengono risolti dal gazzettiere, senza interrogare il fornitore
+        Locazione.objects.create(indirizzo=risultato[0], geo=Point(12.4926, 41.9075), **risultato[2])
+        self.assertEqual(costruisci_gazzettiere(), 2)
+        for ricerca in ('Roma', 'roma, Province of RM, Italia', '00187', '00187 Roma'):
+            risultati = Locazione.cerca(ricerca)
+            self.assertEqual(len(risultati), 1)
+            self.assertEqual(risultati[0][2]['comune'], 'Roma')
+            self.assertAlmostEqual(risultati[0][1]['lat'], 41.9075)
+        self.assertEqual(len(FornitoreFinto.chiamate), 2)
+
+        # Comuni omonimi in province diverse non vengono uniti
+        for provincia_breve, provincia, lat in (('TN', 'Trento', 45.93), ('AT', 'Asti', 44.99)):
+            Locazione.objects.create(indirizzo="Calliano %s, Italia" % (provincia_breve,), geo=Point(11.0, lat),
+                                     comune='Calliano', provincia=provincia, provincia_breve=provincia_breve,
+                                     stato='IT')
+        self.assertEqual(costruisci_gazzettiere(), 4)
+        for ricerca, lat in (('Calliano, Province of TN, Italia', 45.93), ('Calliano, AT', 44.99),
+                             ('calliano, provincia di asti', 44.99)):
+            risultati = Locazione.cerca(ricerca)
+            self.assertEqual(len(risultati), 1)
+            self.assertEqual(risultati[0][2]['comune'], 'Calliano')
+            self.assertAlmostEqual(risultati[0][1]['lat'], lat)
+        self.assertEqual(len(FornitoreFinto.chiamate), 2)
+        # Senza provincia la ricerca e' ambigua: risponde il fornitore
+        Locazione.cerca('Calliano')
+        self.assertEqual(len(FornitoreFinto.chiamate), 3)
+
 
 class TestUtils(TestBase):
 
@@ -373,6 +505,48 @@ class TestUtils(TestBase):
             persona.nome = nome
             self.assertEqual(field_stub.pre_save(persona, False), atteso)
 
+    def test_indice_comuni(self):
+        indice = indice_comuni()
+        self.assertEqual(indice.codice('Roma'), 'H501')
+        self.assertEqual(indice.codice("  SANT'AGATA di militello "), indice.codice('Sant Agata di Militello'))
+        self.assertEqual(indice.comune('h501').nome, 'Roma')
+        self.assertIsNone(indice.codice('Comune inesistente'))
+
+        # Omonimi dopo la normalizzazione: vince il nome scritto esattamente
+        self.assertNotEqual(indice.codice('Paternò'), indice.codice('Paterno'))
+
+        self.assertEqual([c.nome for c in indice.cerca('Rom', limite=3)], ['Roma', 'Romagnano al Monte',
+                                                                          'Romagnano Sesia'])
+        self.assertEqual(COMUNI['agliè'], COMUNI['Aglie'])
+        self.assertNotIn('comune inesistente', COMUNI)
+
+    def test_memoria_richiesta(self):
+        presidente = crea_persona()
+        persona, sede, appartenenza = crea_persona_sede_appartenenza(presidente)
+
+        with memoria_richiesta() as memoria:
+            self.assertTrue(presidente.ha_permesso(GESTIONE_SOCI))
+            with self.assertNumQueries(0):
+                self.assertTrue(presidente.ha_permesso(GESTIONE_SOCI))
+                self.assertTrue(presidente.ha_permesso(GESTIONE_SOCI))
+            self.assertEqual((memoria.successi, memoria.mancati), (2, 1))
+
+            list(persona.sedi_attuali())
+            with self.assertNumQueries(0):
+                self.assertEqual(list(persona.sedi_attuali()), [sede])
+
+            # La modifica di una delega invalida la memoria
+            presidente.deleghe.first().termina(notifica=False)
+            self.assertFalse(presidente.ha_permesso(GESTIONE_SOCI))
+
+            # La modifica di una appartenenza invalida la memoria
+            appartenenza.fine = poco_fa()
+            appartenenza.save()
+            self.assertEqual(list(persona.sedi_attuali()), [])
+
+        # Fuori dalla richiesta, la memoria non e' attiva
+        self.assertIsNone(memoria_attuale())
+
 
 class TestFunzionaleBase(TestFunzionale):
 
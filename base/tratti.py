@@ -9,15 +9,19 @@ utilizzato.
 """
 from datetime import date, datetime, timedelta
 from django.apps import AppConfig, apps
+from django.conf import settings
+from django.contrib.postgres.fields import DateTimeRangeField
 from django.contrib.contenttypes.fields import GenericRelation
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ObjectDoesNotExist
 from django.db import models
 from django.db.models import Q
 from anagrafica.costanti import ESTENSIONE, ESTENSIONE_MINORE
+from base.memoria import invalida_memoria
 from base.stringhe import domani, genera_uuid_casuale
 from base.utils import concept, poco_fa
 from django.utils import timezone
+from psycopg2.extras import DateTimeTZRange
 
 
 class ConMarcaTemporale(models.Model):
@@ -89,6 +93,38 @@ class ConStorico(models.Model):
     inizio = models.DateTimeField("Inizio", db_index=True, null=False)
     fine = models.DateTimeField("Fine", db_index=True, null=True, blank=True, default=None)
 
+    @classmethod
+    def usa_periodo(cls):
+        """
+        Ritorna True se le query di attualita' devono usare la colonna periodo (vedi ConStoricoIndicizzato).
+        """
+        return False
+
+    @staticmethod
+    def _istante(valore):
+        # Date e datetime senza fuso orario, come le interpreterebbe Django per un DateTimeField
+        if not isinstance(valore, datetime):
+            valore = datetime.combine(valore, datetime.min.time())
+        if timezone.is_naive(valore):
+            valore = timezone.make_aware(valore, timezone.get_default_timezone())
+        return valore
+
+    @classmethod
+    def _q_periodo(cls, inizio, fine, q_inizio_fine, fine_inclusa=False):
+        """
+        Q per le entita' il cui periodo [inizio, fine) si sovrappone all'intervallo [inizio, fine].
+        Le entita' con periodo vuoto (fine uguale o precedente all'inizio) vengono filtrate
+         con q_inizio_fine, il filtro equivalente su inizio e fine.
+        :param fine_inclusa: Include anche le entita' la cui fine coincide con l'inizio dell'intervallo.
+        """
+        inizio = cls._istante(inizio)
+        if fine_inclusa:
+            inizio -= timedelta(microseconds=1)
+        return Q(
+            Q(periodo__overlap=DateTimeTZRange(inizio, cls._istante(fine), '[]'))
+            | Q(q_inizio_fine, periodo__isempty=True)
+        )
+
     @classmethod
     @concept
     def query_attuale(cls, *args, al_giorno=None, **kwargs):
@@ -112,13 +148,17 @@ class ConStorico(models.Model):
         #fine += timedelta(seconds=1)  # Anti-bug
         #fine -= timedelta(minutes=5)  # Anti-bug
 
-        risultato = Q(
+        q_inizio_fine = Q(
             Q(inizio__lte=inizio),
             Q(Q(fine__isnull=True) | Q(fine__gt=fine)),
-            *args,
-            **kwargs
         )
 
+        if cls.usa_periodo():
+            risultato = Q(cls._q_periodo(fine, inizio, q_inizio_fine), *args, **kwargs)
+
+        else:
+            risultato = Q(q_inizio_fine, *args, **kwargs)
+
         if cls.CONDIZIONE_ATTUALE_AGGIUNTIVA is not None:
             risultato = Q(risultato, cls.CONDIZIONE_ATTUALE_AGGIUNTIVA)
 
@@ -137,12 +177,17 @@ class ConStorico(models.Model):
         :return: Q!
         """
 
-        risultato = Q(
+        q_inizio_fine = Q(
             Q(Q(fine__gte=inizio) | Q(fine__isnull=True)),
             inizio__lte=fine,
-            **kwargs
         )
 
+        if cls.usa_periodo():
+            risultato = Q(cls._q_periodo(inizio, fine, q_inizio_fine, fine_inclusa=True), **kwargs)
+
+        else:
+            risultato = Q(q_inizio_fine, **kwargs)
+
         if cls.CONDIZIONE_ATTUALE_AGGIUNTIVA is not None:
             risultato = Q(risultato, cls.CONDIZIONE_ATTUALE_AGGIUNTIVA)
 
@@ -164,12 +209,17 @@ class ConStorico(models.Model):
         inizio = date(anno, 1, 1)
         fine = date(anno, 12, 31)
 
-        risultato = Q(
+        q_inizio_fine = Q(
             Q(Q(fine__gte=inizio) | Q(fine__isnull=True)),
             inizio__lte=fine,
-            **kwargs
         )
 
+        if cls.usa_periodo():
+            risultato = Q(cls._q_periodo(inizio, fine, q_inizio_fine, fine_inclusa=True), **kwargs)
+
+        else:
+            risultato = Q(q_inizio_fine, **kwargs)
+
         if cls.CONDIZIONE_ATTUALE_AGGIUNTIVA is not None:
             risultato = Q(risultato, cls.CONDIZIONE_ATTUALE_AGGIUNTIVA)
 
@@ -185,6 +235,30 @@ class ConStorico(models.Model):
         return questo_oggetto_attuale.exists()
 
 
+class ConStoricoIndicizzato(ConStorico):
+    """
+    Come ConStorico, con in piu' la colonna periodo (tstzrange [inizio, fine)) con indice GiST,
+     mantenuta allineata da un trigger del database. Se settings.STORICO_PERIODO_INDICIZZATO,
+     query_attuale, query_attuale_tra_date e query_attuale_in_anno filtrano sul periodo,
+     con un predicato che puo' usare l'indice. Le righe con periodo vuoto (fine uguale o
+     precedente all'inizio, es. trasferimenti nello stesso giorno) vengono filtrate su inizio
+     e fine come in ConStorico, con un indice parziale.
+
+    La migrazione che aggiunge il tratto ad un modello deve includere
+     base.storico.operazioni_periodo(tabella) e base.storico.operazioni_periodo_vuoto(tabella)
+     dopo l'aggiunta del campo.
+    """
+
+    class Meta:
+        abstract = True
+
+    periodo = DateTimeRangeField(null=True, blank=True, editable=False)
+
+    @classmethod
+    def usa_periodo(cls):
+        return settings.STORICO_PERIODO_INDICIZZATO
+
+
 class ConDelegati(models.Model):
     """
     Aggiunge la possibilita' di gestire e aggiungere delegati.
@@ -263,10 +337,63 @@ class ConDelegati(models.Model):
     def sospendi_deleghe(self):
         Delega = apps.get_model(app_label='anagrafica', model_name='Delega')
         self.deleghe_attuali(solo_attive=True).update(stato=Delega.SOSPESA)
+        invalida_memoria()
 
     def attiva_deleghe(self):
         Delega = apps.get_model(app_label='anagrafica', model_name='Delega')
         self.deleghe_attuali(solo_attive=False).update(stato=Delega.ATTIVA)
+        invalida_memoria()
+
+
+class ConIndicePermessi(models.Model):
+    """
+    Mantiene aggiornato l'indice materializzato dei permessi (anagrafica.IndicePermesso)
+     per gli oggetti coperti dai permessi delle deleghe (es. Attivita, Area, CorsoBase, Gruppo).
+
+    L'indice viene aggiornato alla creazione dell'oggetto ed alla modifica dei campi
+     elencati in CAMPI_INDICE_PERMESSI. Il modello deve avere un campo "sede".
+    """
+
+    class Meta:
+        abstract = True
+
+    # Campi che influenzano i permessi sull'oggetto. Il primo deve essere sempre 'sede_id'.
+    CAMPI_INDICE_PERMESSI = ('sede_id',)
+
+    def __init__(self, *args, **kwargs):
+        super(ConIndicePermessi, self).__init__(*args, **kwargs)
+        self._indice_permessi_default = self._stato_indice_permessi()
+
+    def _stato_indice_permessi(self):
+        return (self.pk,) + tuple(getattr(self, campo) for campo in self.CAMPI_INDICE_PERMESSI)
+
+    def modelli_indice_permessi(self):
+        """
+        Ritorna i modelli per cui aggiornare l'indice. Default, solo il modello stesso.
+        """
+        return self.__class__,
+
+    def oggetti_indice_permessi(self):
+        """
+        Ritorna gli oggetti (oltre alle sedi) le cui deleghe coprono questo oggetto. Es. l'Area di una Attivita.
+        """
+        return ()
+
+    def save(self, *args, **kwargs):
+        precedente = self._indice_permessi_default
+        super(ConIndicePermessi, self).save(*args, **kwargs)
+        if precedente == self._stato_indice_permessi():
+            return
+
+        from anagrafica.models import Sede
+        from anagrafica.permessi.indice import aggiorna_indice_sede
+        sedi = [self.sede]
+        if precedente[0] is not None and precedente[1] != self.sede_id:
+            sedi += [Sede.objects.filter(pk=precedente[1]).first()]
+        for sede in sedi:
+            aggiorna_indice_sede(sede, modelli=self.modelli_indice_permessi(),
+                                 altri_oggetti=self.oggetti_indice_permessi())
+        self._indice_permessi_default = self._stato_indice_permessi()
 
 
 class ConPDF():
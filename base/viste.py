@@ -1,5 +1,5 @@
 import mimetypes
-from datetime import date, timedelta, datetime, time
+from datetime import datetime, time
 
 import os
 
@@ -25,6 +25,7 @@ from anagrafica.costanti import LOCALE, PROVINCIALE, REGIONALE
 from anagrafica.models import Sede, Persona
 from anagrafica.permessi.applicazioni import PRESIDENTE, UFFICIO_SOCI, UFFICIO_SOCI_TEMPORANEO, UFFICIO_SOCI_UNITA
 from anagrafica.permessi.costanti import ERRORE_PERMESSI, LETTURA, GESTIONE_SEDE
+from anagrafica.statistiche import registrazioni_aspiranti
 from autenticazione.funzioni import pagina_pubblica, pagina_anonima, pagina_privata
 from autenticazione.models import Utenza
 from base import errori
@@ -33,9 +34,10 @@ from base.forms import ModuloRecuperaPassword, ModuloMotivoNegazione, ModuloLoca
 from base.forms_extra import ModuloRichiestaSupportoPersone
 from base.geo import Locazione
 from base.models import Autorizzazione, Token
+from base.statistiche import periodi, somma_per_periodi
 from base.tratti import ConPDF
 from base.utils import get_drive_file, rimuovi_scelte
-from formazione.models import PartecipazioneCorsoBase, Aspirante
+from formazione.models import PartecipazioneCorsoBase
 from jorvik import settings
 from posta.models import Messaggio
 import json
@@ -668,31 +670,20 @@ def informazioni_statistiche(request, me):
     if not me.utenza.is_staff:
         return redirect(ERRORE_PERMESSI)
 
-    oggi = date.today()
+    giorni, etichetta, numero_periodi = 7, 'sett.', 52
 
-    giorni, etichetta, periodi = 7, 'sett.', 52
+    elenco_periodi = periodi(giorni, numero_periodi)
+    registrazioni = somma_per_periodi(registrazioni_aspiranti(elenco_periodi[0][1]), elenco_periodi)
 
     statistiche = []
     aspiranti = {}
 
-    for periodo in range(periodi, -1, -1):
+    for (periodo, inizio, fine), num_aspiranti in zip(elenco_periodi, registrazioni):
 
         dati = {}
 
-        fine = oggi - timedelta(days=(giorni * periodo))
-        inizio = fine - timedelta(days=giorni - 1)
-
-        fine = datetime.combine(fine, time(23, 59, 59))
-        inizio = datetime.combine(inizio, time(0, 0, 0))
-
-        dati['inizio'] = inizio
-        dati['fine'] = fine
-
-        # Prima, ottiene tutti i queryset.
-        qs_aspiranti = Aspirante.objects.filter(creazione__lte=fine, creazione__gte=inizio)
-        num_aspiranti = qs_aspiranti.aggregate(num_aspiranti=Count('id'))['num_aspiranti'] or 0
-
-        # Poi, associa al dizionario statistiche.
+        dati['inizio'] = datetime.combine(inizio, time(0, 0, 0))
+        dati['fine'] = datetime.combine(fine, time(23, 59, 59))
         dati['etichetta'] = "%d %s fa" % (periodo, etichetta,)
         dati['registrazioni'] = num_aspiranti
 
@@ -0,0 +1,23 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.9.12 on 2017-07-12 10:15
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+from base.esiti import operazioni_esito
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('curriculum', '0005_titolopersonale_automatica'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='titolopersonale',
+            name='esito',
+            field=models.CharField(choices=[('Confermato', 'Confermato'), ('Negato', 'Negato'), ('Ritirata', 'Ritirata'), ('In attesa', 'In attesa')], db_index=True, default='Confermato', editable=False, max_length=16, verbose_name='Esito'),
+        ),
+    ]
+    operations += operazioni_esito('curriculum', 'titolopersonale')
@@ -75,6 +75,17 @@ class TitoloPersonale(ModelloSemplice, ConMarcaTemporale, ConAutorizzazioni):
     def attuale(self):
         return self.data_scadenza is None or timezone.now() >= self.data_scadenza
 
+    def save(self, *args, **kwargs):
+        from segmenti.membri import aggiorna_segmenti_persona, SEGMENTI_TITOLO
+        super(TitoloPersonale, self).save(*args, **kwargs)
+        aggiorna_segmenti_persona(self.persona_id, SEGMENTI_TITOLO)
+
+    def delete(self, *args, **kwargs):
+        from segmenti.membri import aggiorna_segmenti_persona, SEGMENTI_TITOLO
+        risultato = super(TitoloPersonale, self).delete(*args, **kwargs)
+        aggiorna_segmenti_persona(self.persona_id, SEGMENTI_TITOLO)
+        return risultato
+
     def autorizzazione_negata(self, modulo=None, notifiche_attive=True, data=None):
         # Alla negazione, cancella titolo personale.
         self.delete()
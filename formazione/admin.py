@@ -5,6 +5,8 @@ from django.contrib import admin
 from base.admin import InlineAutorizzazione
 from django.contrib.contenttypes.admin import GenericTabularInline
 from formazione.models import CorsoBase, PartecipazioneCorsoBase, AssenzaCorsoBase, Aspirante, LezioneCorsoBase, InvitoCorsoBase
+from formazione.domanda import aggiorna_domanda_vicino
+from formazione.raggio import ricalcola_raggi
 from gruppi.readonly_admin import ReadonlyAdminMixin
 
 
@@ -93,8 +95,8 @@ class AdminAssenzaCorsoBase(ReadonlyAdminMixin, admin.ModelAdmin):
 
 
 def ricalcola_raggio(modeladmin, request, queryset):
-    for a in queryset:
-        a.calcola_raggio()
+    ricalcola_raggi(aspiranti=queryset.values_list('pk', flat=True))
+    aggiorna_domanda_vicino(queryset.values_list('locazione_id', flat=True))
 ricalcola_raggio.short_description = "Ricalcola il raggio per gli aspiranti selezionati"
 
 @admin.register(Aspirante)
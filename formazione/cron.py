@@ -0,0 +1,20 @@
+from django.conf import settings
+from django_cron import CronJobBase, Schedule
+
+from formazione.domanda import aggiorna_domanda_formativa
+
+
+class CronDomandaFormativa(CronJobBase):
+    """
+    Ricalcola ogni notte la domanda formativa di tutte le sedi, per includere le modifiche
+     non intercettate (es. aspiranti cancellati in blocco, raggi ricalcolati con un UPDATE).
+    """
+
+    RUN_AT_TIMES = ['03:00']
+
+    schedule = Schedule(run_at_times=RUN_AT_TIMES)
+    code = 'formazione.domanda_formativa'
+
+    def do(self):
+        if settings.DOMANDA_FORMATIVA_PRECALCOLATA:
+            aggiorna_domanda_formativa()
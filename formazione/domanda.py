@@ -0,0 +1,181 @@
+"""
+Questo modulo precalcola la domanda formativa delle sedi (vedi Sede.domanda_formativa) nella
+ tabella DomandaFormativa: per ogni sede, il numero di aspiranti contattabili
+ (Aspirante.query_contattabili) il cui raggio di ricerca contiene la sede, ed il loro raggio medio.
+
+Il calcolo e' una sola query aggregata per tutte le sedi richieste. Il confronto con il raggio di
+ ogni aspirante (ST_DWithin con distanza variabile) non puo' usare l'indice GiST di Locazione.geo,
+ quindi viene preceduto da un ST_DWithin con il raggio massimo degli aspiranti, che lo usa.
+
+Le righe vengono scritte con una sola istruzione: il calcolo (una CTE, eseguita una volta) aggiorna
+ le righe esistenti con un UPDATE ed inserisce le altre con un INSERT (ON CONFLICT richiede
+ PostgreSQL 9.5). Se un aggiornamento contemporaneo inserisce la stessa sede, l'istruzione
+ viene annullata (in un savepoint) e ripetuta una volta, trovando la riga da aggiornare.
+
+La tabella viene aggiornata:
+ - per le sedi vicine, quando un aspirante cambia locazione o raggio (Aspirante.calcola_raggio,
+   Aspirante.imposta_locazione) o una sua partecipazione ad un corso base viene salvata o cancellata.
+   Dentro una transazione il ricalcolo e' rimandato al commit, una volta sola per tutte le
+   locazioni modificate (vedi aggiorna_domanda_vicino);
+ - per la sede, quando questa cambia locazione;
+ - per tutte le sedi, ogni notte da formazione.cron.CronDomandaFormativa.
+"""
+from django.conf import settings
+from django.db import connection, IntegrityError
+from django.db.models import Max
+from django.db.transaction import atomic, on_commit
+
+from anagrafica.models import Sede
+from base.geo import Locazione
+from base.models import ConAutorizzazioni
+from formazione.models import Aspirante, DomandaFormativa, PartecipazioneCorsoBase
+
+SQL_DOMANDA = """
+    WITH calcolo AS (
+        SELECT s.id AS sede_id, COUNT(a.id) AS aspiranti, COALESCE(AVG(a.raggio), 0) AS raggio_medio
+        FROM {sede} s
+        LEFT OUTER JOIN {locazione} ls ON ls.id = s.locazione_id
+        LEFT OUTER JOIN (
+            SELECT asp.id, asp.raggio, la.geo FROM {aspirante} asp
+            INNER JOIN {locazione} la ON la.id = asp.locazione_id
+            WHERE NOT EXISTS (
+                SELECT 1 FROM {partecipazione} p WHERE p.persona_id = asp.persona_id AND p.esito = %s
+            )
+        ) a ON ST_DWithin(a.geo, ls.geo, %s) AND ST_DWithin(a.geo, ls.geo, a.raggio * 1000)
+        {filtro}
+        GROUP BY s.id
+    ), aggiornate AS (
+        UPDATE {domanda} d SET aspiranti = c.aspiranti, raggio_medio = c.raggio_medio, ultima_modifica = now()
+        FROM calcolo c WHERE d.sede_id = c.sede_id
+        RETURNING d.sede_id
+    ), inserite AS (
+        INSERT INTO {domanda} (sede_id, aspiranti, raggio_medio, creazione, ultima_modifica)
+        SELECT c.sede_id, c.aspiranti, c.raggio_medio, now(), now() FROM calcolo c
+        WHERE NOT EXISTS (SELECT 1 FROM {domanda} d WHERE d.sede_id = c.sede_id)
+        RETURNING sede_id
+    )
+    SELECT (SELECT COUNT(*) FROM aggiornate) + (SELECT COUNT(*) FROM inserite)
+"""
+
+# Sedi con locazione entro la distanza data (in metri) da almeno una delle locazioni date
+SQL_SEDI_VICINE = """
+    SELECT s.id FROM {sede} s
+    INNER JOIN {locazione} ls ON ls.id = s.locazione_id
+    WHERE EXISTS (
+        SELECT 1 FROM {locazione} l WHERE l.id = ANY(%s) AND ST_DWithin(l.geo, ls.geo, %s)
+    )
+"""
+
+
+def _raggio_massimo():
+    """
+    :return: Il raggio massimo degli aspiranti in metri.
+    """
+    raggio = Aspirante.objects.aggregate(raggio=Max('raggio'))['raggio'] or 0
+    return max(raggio, Aspirante.MASSIMO_RAGGIO) * 1000
+
+
+def aggiorna_domanda_formativa(sedi=None):
+    """
+    Ricalcola la domanda formativa, aggiornando le righe salvate.
+    :param sedi: Se specificato, solo le sedi con questi pk. Altrimenti tutte.
+    :return: Il numero di sedi aggiornate.
+    """
+    filtro, parametri_filtro = "", []
+    if sedi is not None:
+        sedi = list(sedi)
+        if not sedi:
+            return 0
+        filtro, parametri_filtro = "WHERE s.id = ANY(%s)", [sedi]
+
+    sql = SQL_DOMANDA.format(
+        domanda=DomandaFormativa._meta.db_table, sede=Sede._meta.db_table, locazione=Locazione._meta.db_table,
+        aspirante=Aspirante._meta.db_table, partecipazione=PartecipazioneCorsoBase._meta.db_table, filtro=filtro,
+    )
+    parametri = [ConAutorizzazioni.ESITO_OK, _raggio_massimo()] + parametri_filtro
+
+    for tentativo in range(2):
+        try:
+            with atomic(), connection.cursor() as cursor:
+                cursor.execute(sql, parametri)
+                return cursor.fetchone()[0]
+        except IntegrityError:
+            if tentativo:
+                raise
+
+
+def _aggiorna_sedi_vicine(locazioni):
+    sql = SQL_SEDI_VICINE.format(sede=Sede._meta.db_table, locazione=Locazione._meta.db_table)
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [list(locazioni), _raggio_massimo()])
+        sedi = [riga[0] for riga in cursor.fetchall()]
+    return aggiorna_domanda_formativa(sedi=sedi)
+
+
+class _AggiornamentoAlCommit(object):
+    """
+    Ricalcolo rimandato al commit della transazione, per tutte le locazioni raccolte.
+    """
+
+    def __init__(self):
+        self.locazioni = set()
+
+    def __call__(self):
+        _aggiorna_sedi_vicine(self.locazioni)
+
+
+def aggiorna_domanda_vicino(locazioni):
+    """
+    Ricalcola la domanda formativa delle sedi che possono trovarsi nel raggio di un aspirante
+     con una delle locazioni date. Non fa nulla se DOMANDA_FORMATIVA_PRECALCOLATA non e' attivo.
+    Dentro una transazione il ricalcolo avviene al commit, una volta sola per tutte le locazioni
+     date fino ad allora (es. per molte partecipazioni salvate nella stessa richiesta).
+    :param locazioni: Elenco di pk di Locazione (i None vengono ignorati).
+    :return: Il numero di sedi aggiornate (0 se il ricalcolo e' rimandato al commit).
+    """
+    if not settings.DOMANDA_FORMATIVA_PRECALCOLATA:
+        return 0
+
+    locazioni = {pk for pk in locazioni if pk is not None}
+    if not locazioni:
+        return 0
+
+    if not connection.in_atomic_block:
+        return _aggiorna_sedi_vicine(locazioni)
+
+    for _, funzione in connection.run_on_commit:
+        if isinstance(funzione, _AggiornamentoAlCommit):
+            funzione.locazioni.update(locazioni)
+            return 0
+
+    aggiornamento = _AggiornamentoAlCommit()
+    aggiornamento.locazioni.update(locazioni)
+    on_commit(aggiornamento)
+    return 0
+
+
+def aggiorna_domanda_persona(persona_id):
+    """
+    Ricalcola la domanda formativa vicino all'aspirante della persona, se presente.
+    :param persona_id: L'ID della persona.
+    :return: Il numero di sedi aggiornate.
+    """
+    if not settings.DOMANDA_FORMATIVA_PRECALCOLATA or persona_id is None:
+        return 0
+    locazioni = Aspirante.objects.filter(persona_id=persona_id).values_list('locazione_id', flat=True)
+    return aggiorna_domanda_vicino(locazioni)
+
+
+def domanda_sede(sede):
+    """
+    Ritorna la domanda formativa salvata della sede, calcolandola se non ancora presente.
+    :param sede: La Sede.
+    :return: Oggetto DomandaFormativa.
+    """
+    try:
+        return sede.domanda
+    except DomandaFormativa.DoesNotExist:
+        aggiorna_domanda_formativa(sedi=[sede.pk])
+        domanda = DomandaFormativa.objects.get(sede_id=sede.pk)
+        sede.domanda = domanda
+        return domanda
@@ -0,0 +1,18 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from formazione.domanda import aggiorna_domanda_formativa
+
+
+class Command(BaseCommand):
+    help = 'Ricalcola la domanda formativa precalcolata di tutte le sedi'
+
+    def handle(self, *args, **options):
+        inizio = time.time()
+        numero = aggiorna_domanda_formativa()
+        print('Domanda formativa ricalcolata per %d sedi in %.1fs' % (numero, time.time() - inizio))
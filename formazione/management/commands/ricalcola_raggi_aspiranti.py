@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from formazione.raggio import benchmark_raggio, ricalcola_raggi
+
+
+class Command(BaseCommand):
+    help = 'Ricalcola il raggio di ricerca degli aspiranti con un solo UPDATE'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--regione', dest='regione', default=None,
+                            help='Solo gli aspiranti con locazione in questa regione (es. "Sicilia")')
+        parser.add_argument('--benchmark', type=int, dest='benchmark', default=0,
+                            help='Confronta il calcolo per passi con quello a query singola su N aspiranti, '
+                                 'senza salvare')
+
+    def handle(self, *args, **options):
+        if options['benchmark']:
+            benchmark_raggio(numero=options['benchmark'])
+            return
+
+        inizio = time.time()
+        numero = ricalcola_raggi(regione=options['regione'])
+        print('Raggio ricalcolato per %d aspiranti in %.1fs' % (numero, time.time() - inizio))
@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.9.12 on 2017-07-12 10:15
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('anagrafica', '0052_esito_autorizzazioni'),
+        ('formazione', '0018_esito_autorizzazioni'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DomandaFormativa',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('creazione', models.DateTimeField(db_index=True, default=django.utils.timezone.now)),
+                ('ultima_modifica', models.DateTimeField(auto_now=True, db_index=True)),
+                ('aspiranti', models.PositiveIntegerField(default=0)),
+                ('raggio_medio', models.FloatField(default=0.0)),
+                ('sede', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='domanda', to='anagrafica.Sede')),
+            ],
+            options={
+                'verbose_name': 'Domanda formativa',
+                'verbose_name_plural': 'Domanda formativa',
+            },
+        ),
+    ]
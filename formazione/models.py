@@ -20,7 +20,7 @@ from base.files import PDF, Zip
 from base.models import ConAutorizzazioni, ConVecchioID, Autorizzazione
 from base.geo import ConGeolocalizzazione, ConGeolocalizzazioneRaggio
 from base.models import ModelloSemplice
-from base.tratti import ConMarcaTemporale, ConDelegati, ConStorico, ConPDF
+from base.tratti import ConMarcaTemporale, ConDelegati, ConStorico, ConPDF, ConIndicePermessi
 from base.utils import concept, poco_fa
 from posta.models import Messaggio
 from social.models import ConCommenti, ConGiudizio
@@ -50,7 +50,7 @@ class Corso(ModelloSemplice, ConDelegati, ConMarcaTemporale, ConGeolocalizzazion
     sede = models.ForeignKey(Sede, related_query_name='%(class)s_corso', help_text="La Sede organizzatrice del Corso.")
 
 
-class CorsoBase(Corso, ConVecchioID, ConPDF):
+class CorsoBase(Corso, ConVecchioID, ConPDF, ConIndicePermessi):
 
     ## Tipologia di corso
     #BASE = 'BA'
@@ -551,6 +551,21 @@ class PartecipazioneCorsoBase(ModelloSemplice, ConMarcaTemporale, ConAutorizzazi
 
     RICHIESTA_NOME = "Iscrizione Corso Base"
 
+    def save(self, *args, **kwargs):
+        from formazione.domanda import aggiorna_domanda_persona
+        from segmenti.membri import aggiorna_segmenti_persona, SEGMENTI_CORSO_BASE
+        super(PartecipazioneCorsoBase, self).save(*args, **kwargs)
+        aggiorna_segmenti_persona(self.persona_id, SEGMENTI_CORSO_BASE)
+        aggiorna_domanda_persona(self.persona_id)
+
+    def delete(self, *args, **kwargs):
+        from formazione.domanda import aggiorna_domanda_persona
+        from segmenti.membri import aggiorna_segmenti_persona, SEGMENTI_CORSO_BASE
+        risultato = super(PartecipazioneCorsoBase, self).delete(*args, **kwargs)
+        aggiorna_segmenti_persona(self.persona_id, SEGMENTI_CORSO_BASE)
+        aggiorna_domanda_persona(self.persona_id)
+        return risultato
+
     def autorizzazione_concessa(self, modulo=None, auto=False, notifiche_attive=True, data=None):
         # Quando un aspirante viene iscritto, tutte le richieste presso altri corsi devono essere cancellati.
 
@@ -794,7 +809,24 @@ class Aspirante(ModelloSemplice, ConGeolocalizzazioneRaggio, ConMarcaTemporale):
 
     def calcola_raggio(self):
         """
-        Calcola il raggio minimo necessario.
+        Calcola il raggio minimo necessario, con una sola query (vedi formazione.raggio).
+        :return: Il nuovo raggio.
+        """
+        from formazione.domanda import aggiorna_domanda_vicino
+        from formazione.raggio import distanza_comitati, raggio_per_distanza
+
+        if not self.locazione:
+            self.raggio = 0
+        else:
+            self.raggio = raggio_per_distanza(distanza_comitati(self.locazione))
+        self.save()
+        aggiorna_domanda_vicino([self.locazione_id])
+        return self.raggio
+
+    def calcola_raggio_iterativo(self):
+        """
+        Calcola il raggio minimo necessario allargandolo per passi. Usato come riferimento
+         per il confronto con calcola_raggio (vedi formazione.raggio.benchmark_raggio).
         :return: Il nuovo raggio.
         """
         if not self.locazione:
@@ -822,6 +854,25 @@ class Aspirante(ModelloSemplice, ConGeolocalizzazioneRaggio, ConMarcaTemporale):
         self.calcola_raggio()
         return super(Aspirante, self).post_locazione()
 
+    def imposta_locazione(self, indirizzo):
+        """
+        Come ConGeolocalizzazione.imposta_locazione; aggiorna anche la domanda formativa
+         vicino alla locazione precedente (quella vicino alla nuova e' aggiornata da calcola_raggio).
+        """
+        from formazione.domanda import aggiorna_domanda_vicino
+        precedente = self.locazione_id
+        locazione = super(Aspirante, self).imposta_locazione(indirizzo)
+        if locazione is not None and precedente != self.locazione_id:
+            aggiorna_domanda_vicino([precedente])
+        return locazione
+
+    def delete(self, *args, **kwargs):
+        from formazione.domanda import aggiorna_domanda_vicino
+        locazione = self.locazione_id
+        risultato = super(Aspirante, self).delete(*args, **kwargs)
+        aggiorna_domanda_vicino([locazione])
+        return risultato
+
     @classmethod
     @concept
     def query_contattabili(cls, *args, **kwargs):
@@ -871,4 +922,21 @@ class Aspirante(ModelloSemplice, ConGeolocalizzazioneRaggio, ConMarcaTemporale):
     def pulisci_volontari(cls):
         volontari = cls._anche_volontari()
         cls._chiudi_partecipazioni(volontari)
-        volontari.delete()
\ No newline at end of file
+        volontari.delete()
+
+class DomandaFormativa(ModelloSemplice, ConMarcaTemporale):
+    """
+    Domanda formativa precalcolata di una sede: gli aspiranti contattabili nel cui raggio
+     si trova la sede, ed il loro raggio medio (vedi formazione.domanda e Sede.domanda_formativa).
+    """
+
+    sede = models.OneToOneField(Sede, related_name='domanda', on_delete=models.CASCADE)
+    aspiranti = models.PositiveIntegerField(default=0)
+    raggio_medio = models.FloatField(default=0.0)
+
+    class Meta:
+        verbose_name = "Domanda formativa"
+        verbose_name_plural = "Domanda formativa"
+
+    def __str__(self):
+        return "Domanda formativa di %s: %d aspiranti" % (self.sede_id, self.aspiranti)
@@ -0,0 +1,150 @@
+"""
+Questo modulo calcola il raggio di ricerca degli aspiranti (vedi Aspirante.calcola_raggio).
+
+Il raggio e' il piu' piccolo tra MINIMO_RAGGIO + n * RAGGIO_STEP (n = 1 .. MASSIMO_ITERAZIONI)
+ che contiene almeno MINIMO_COMITATI comitati, o il massimo se non ve ne sono abbastanza.
+Invece di allargare il raggio contando i comitati ad ogni passo (una query per passo), viene
+ calcolata con una sola query la distanza del MINIMO_COMITATI-esimo comitato piu' vicino, da cui
+ si ricava direttamente il raggio. I valori possibili del raggio (vedi raggi_possibili) sono
+ gli stessi del calcolo per passi, quindi i risultati coincidono.
+
+ricalcola_raggi aggiorna molti aspiranti (es. di una regione) con un solo UPDATE.
+"""
+import time
+
+from django.db import connection
+from django.db.transaction import atomic
+
+from anagrafica.costanti import LOCALE, PROVINCIALE, TERRITORIALE
+from anagrafica.models import Sede
+from base.geo import Locazione
+from formazione.models import Aspirante
+
+# Distanza (in metri) del k-esimo comitato piu' vicino alla locazione {locazione}
+SQL_DISTANZA = """
+    SELECT ST_Distance(lc.geo, {locazione}.geo) FROM {sede} s
+    INNER JOIN {tabella_locazione} lc ON lc.id = s.locazione_id
+    WHERE s.tipo = %s AND s.estensione IN (%s, %s, %s)
+    ORDER BY 1
+    OFFSET %s LIMIT 1
+"""
+
+SQL_RICALCOLA = """
+    UPDATE {aspirante} a SET raggio = CASE
+        WHEN la.id IS NULL THEN 0
+        ELSE COALESCE((SELECT min(r) FROM unnest(%s::float8[]) r WHERE r * 1000 >= ({distanza})), %s)
+    END
+    FROM {aspirante} a2 LEFT OUTER JOIN {tabella_locazione} la ON la.id = a2.locazione_id
+    WHERE a2.id = a.id {filtro}
+"""
+
+
+def raggi_possibili():
+    """
+    :return: Lista dei raggi possibili in km, crescenti, sommati come nel calcolo per passi.
+    """
+    raggi, raggio = [], Aspirante.MINIMO_RAGGIO
+    while True:
+        raggio += Aspirante.RAGGIO_STEP
+        raggi.append(raggio)
+        if len(raggi) >= Aspirante.MASSIMO_ITERAZIONI:
+            return raggi
+
+
+def _sql_distanza(locazione):
+    sql = SQL_DISTANZA.format(locazione=locazione, sede=Sede._meta.db_table,
+                              tabella_locazione=Locazione._meta.db_table)
+    parametri = [Sede.COMITATO, LOCALE, PROVINCIALE, TERRITORIALE, Aspirante.MINIMO_COMITATI - 1]
+    return sql, parametri
+
+
+def distanza_comitati(locazione):
+    """
+    :param locazione: La Locazione.
+    :return: La distanza in metri del MINIMO_COMITATI-esimo comitato piu' vicino, o None se i comitati
+             con una locazione sono meno di MINIMO_COMITATI.
+    """
+    sql, parametri = _sql_distanza('la')
+    sql = "SELECT ({0}) FROM {1} la WHERE la.id = %s".format(sql, Locazione._meta.db_table)
+    with connection.cursor() as cursor:
+        cursor.execute(sql, parametri + [locazione.pk])
+        riga = cursor.fetchone()
+    if riga is None:
+        return None
+    return riga[0]
+
+
+def raggio_per_distanza(distanza):
+    """
+    :param distanza: La distanza in metri del MINIMO_COMITATI-esimo comitato (vedi distanza_comitati).
+    :return: Il raggio in km.
+    """
+    raggi = raggi_possibili()
+    if distanza is None:
+        return raggi[-1]
+    # Come il filtro distance_lte con D(km=raggio)
+    return next((raggio for raggio in raggi if raggio * 1000 >= distanza), raggi[-1])
+
+
+def ricalcola_raggi(regione=None, aspiranti=None):
+    """
+    Ricalcola il raggio di molti aspiranti con un solo UPDATE.
+    :param regione: Se specificata, solo gli aspiranti con locazione in questa regione (Locazione.regione).
+    :param aspiranti: Se specificato, solo gli aspiranti con questi pk.
+    :return: Il numero di aspiranti aggiornati.
+    """
+    filtro, parametri_filtro = "", []
+    if regione is not None:
+        filtro += " AND la.regione = %s"
+        parametri_filtro.append(regione)
+    if aspiranti is not None:
+        filtro += " AND a.id = ANY(%s)"
+        parametri_filtro.append(list(aspiranti))
+
+    distanza, parametri_distanza = _sql_distanza('la')
+    sql = SQL_RICALCOLA.format(aspirante=Aspirante._meta.db_table, tabella_locazione=Locazione._meta.db_table,
+                               distanza=distanza, filtro=filtro)
+    raggi = raggi_possibili()
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [raggi] + parametri_distanza + [raggi[-1]] + parametri_filtro)
+        return cursor.rowcount
+
+
+def benchmark_raggio(numero=100, progresso=print):
+    """
+    Confronta, su un campione di aspiranti con locazione, il calcolo per passi
+     (Aspirante.calcola_raggio_iterativo) con quello a query singola. Le modifiche vengono annullate.
+    :param numero: Numero di aspiranti del campione.
+    :param progresso: Funzione per i messaggi.
+    :return: Dizionario {'iterativo': secondi, 'singolo': secondi, 'blocco': secondi (ricalcola_raggi),
+             'differenze': numero di raggi diversi}.
+    """
+    aspiranti = list(Aspirante.objects.filter(locazione__isnull=False).select_related('locazione')[:numero])
+    progresso("Campione di %d aspiranti" % (len(aspiranti),))
+
+    risultati = {'differenze': 0}
+    with atomic():
+        inizio = time.time()
+        iterativi = {a.pk: a.calcola_raggio_iterativo() for a in aspiranti}
+        risultati['iterativo'] = time.time() - inizio
+
+        inizio = time.time()
+        singoli = {a.pk: raggio_per_distanza(distanza_comitati(a.locazione)) for a in aspiranti}
+        risultati['singolo'] = time.time() - inizio
+
+        inizio = time.time()
+        ricalcola_raggi(aspiranti=[a.pk for a in aspiranti])
+        risultati['blocco'] = time.time() - inizio
+        in_blocco = dict(Aspirante.objects.filter(pk__in=iterativi).values_list('pk', 'raggio'))
+
+        for pk, raggio in iterativi.items():
+            if raggio != singoli[pk] or raggio != in_blocco[pk]:
+                risultati['differenze'] += 1
+                progresso("Aspirante %d: iterativo %s, singolo %s, blocco %s" % (
+                    pk, raggio, singoli[pk], in_blocco[pk]))
+
+        connection.set_rollback(True)
+
+    progresso("Iterativo: %.2fs, query singola: %.2fs, UPDATE unico: %.2fs, %d differenze" % (
+        risultati['iterativo'], risultati['singolo'], risultati['blocco'], risultati['differenze']))
+    return risultati
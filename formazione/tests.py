@@ -5,15 +5,17 @@ from datetime import timedelta
 from unittest import skipIf
 
 from django.conf import settings
+from django.contrib.gis.geos import Point
 from django.contrib.contenttypes.models import ContentType
 from django.core import mail
 from django.core.exceptions import ObjectDoesNotExist
 from django.core.urlresolvers import reverse
-from django.test import TestCase
+from django.db import connection
+from django.test import TestCase, override_settings
 from django.utils import timezone
 from django.utils.encoding import force_text
 
-from anagrafica.models import Appartenenza, Persona, Delega, Estensione
+from anagrafica.models import Appartenenza, Persona, Delega, Estensione, Sede
 from anagrafica.permessi.applicazioni import DIRETTORE_CORSO
 from autenticazione.utils_test import TestFunzionale
 from base.geo import Locazione
@@ -22,9 +24,11 @@ from base.utils import poco_fa
 from base.utils_tests import crea_persona_sede_appartenenza, crea_persona, email_fittizzia, codice_fiscale, crea_utenza, \
     crea_sede, crea_appartenenza
 from base.viste import autorizzazione_nega, autorizzazione_concedi
+from formazione.domanda import aggiorna_domanda_formativa
 from formazione.forms import ModuloVerbaleAspiranteCorsoBase
+from formazione.raggio import ricalcola_raggi
 from jorvik.settings import GOOGLE_KEY
-from .models import CorsoBase, Aspirante, InvitoCorsoBase, PartecipazioneCorsoBase
+from .models import CorsoBase, Aspirante, InvitoCorsoBase, PartecipazioneCorsoBase, DomandaFormativa
 
 
 class TestCorsi(TestCase):
@@ -123,6 +127,68 @@ class TestCorsi(TestCase):
             self.assertFalse(hasattr(persona, 'aspirante'))
             self.assertTrue(persona.partecipazioni_corsi.esito_esame, PartecipazioneCorsoBase.IDONEO)
 
+    def test_calcola_raggio(self):
+        origine = Locazione.objects.create(indirizzo="Origine", geo=Point(15.0, 37.5))
+
+        # Comitati lungo un meridiano, ogni circa 5.5 km
+        for i in range(1, 10):
+            sede = crea_sede(crea_persona())
+            sede.locazione = Locazione.objects.create(indirizzo="Comitato %d" % i, geo=Point(15.0, 37.5 + i * 0.05))
+            sede.save()
+
+        aspiranti = []
+        for _ in range(3):
+            aspirante = Aspirante.objects.create(persona=crea_persona(), locazione=origine)
+            aspiranti.append(aspirante)
+        senza_locazione = Aspirante.objects.create(persona=crea_persona())
+
+        iterativo = aspiranti[0].calcola_raggio_iterativo()
+        self.assertGreater(iterativo, Aspirante.MINIMO_RAGGIO)
+        self.assertLess(iterativo, Aspirante.MASSIMO_RAGGIO)
+        self.assertEqual(aspiranti[1].calcola_raggio(), iterativo)
+        self.assertEqual(aspiranti[1].comitati().count(), Aspirante.MINIMO_COMITATI)
+
+        self.assertEqual(ricalcola_raggi(aspiranti=[aspiranti[2].pk, senza_locazione.pk]), 2)
+        aspiranti[2].refresh_from_db()
+        senza_locazione.refresh_from_db()
+        self.assertEqual(aspiranti[2].raggio, iterativo)
+        self.assertEqual(senza_locazione.raggio, 0)
+
+    def test_domanda_formativa(self):
+        vicina = crea_sede(crea_persona())
+        vicina.locazione = Locazione.objects.create(indirizzo="Vicina", geo=Point(15.0, 37.5))
+        vicina.save()
+        lontana = crea_sede(crea_persona())
+        lontana.locazione = Locazione.objects.create(indirizzo="Lontana", geo=Point(15.0, 38.5))
+        lontana.save()
+
+        aspiranti = [Aspirante.objects.create(persona=crea_persona(), locazione=vicina.locazione, raggio=raggio)
+                     for raggio in (10, 20)]
+        self.assertEqual(aggiorna_domanda_formativa(sedi=[vicina.pk, lontana.pk]), 2)
+        # Un secondo ricalcolo aggiorna le righe esistenti
+        self.assertEqual(aggiorna_domanda_formativa(sedi=[vicina.pk, lontana.pk]), 2)
+        self.assertEqual(DomandaFormativa.objects.filter(sede__in=[vicina, lontana]).count(), 2)
+
+        vicina = Sede.objects.select_related('domanda').get(pk=vicina.pk)
+        self.assertEqual(vicina.domanda_formativa, 2)
+        self.assertEqual(vicina.domanda_formativa_raggio_medio, 15)
+        self.assertEqual(lontana.domanda_formativa, 0)
+        with override_settings(DOMANDA_FORMATIVA_PRECALCOLATA=False):
+            self.assertEqual(vicina.domanda_formativa, 2)
+            self.assertEqual(vicina.domanda_formativa_raggio_medio, 15)
+
+        # L'iscrizione confermata ad un corso aggiorna le sedi vicine
+        oggi = poco_fa()
+        corso = CorsoBase.objects.create(stato=CorsoBase.ATTIVO, sede=vicina, data_inizio=oggi + timedelta(days=7),
+                                         data_esame=oggi + timedelta(days=14), progressivo=1, anno=oggi.year)
+        PartecipazioneCorsoBase.objects.create(persona=aspiranti[0].persona, corso=corso, confermata=True)
+        # Il test e' in una transazione: il ricalcolo e' rimandato al commit
+        self.assertEqual(Sede.objects.get(pk=vicina.pk).domanda_formativa, 2)
+        for _, funzione in connection.run_on_commit:
+            funzione()
+        self.assertEqual(Sede.objects.get(pk=vicina.pk).domanda_formativa, 1)
+        self.assertEqual(Sede.objects.get(pk=lontana.pk).domanda_formativa, 0)
+
     def test_invito_aspirante_automatico(self):
         presidente = crea_persona()
         presidente.email_contatto = email_fittizzia()
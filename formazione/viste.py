@@ -46,7 +46,7 @@ def formazione_corsi_base_elenco(request, me):
 @pagina_privata
 def formazione_corsi_base_domanda(request, me):
     contesto = {
-        "sedi": me.oggetti_permesso(GESTIONE_CORSI_SEDE),
+        "sedi": me.oggetti_permesso(GESTIONE_CORSI_SEDE).select_related('domanda'),
         "min_sedi": Aspirante.MINIMO_COMITATI,
         "max_km": Aspirante.MASSIMO_RAGGIO,
     }
@@ -543,8 +543,7 @@ def aspirante_corso_base_report_schede(request, me, pk):
             attestato = p.genera_attestato()
             archivio.aggiungi_file(attestato.file.path, "%s - Attesato.pdf" % p.persona.nome_completo)
 
-    archivio.comprimi_e_salva(nome="Corso %d-%d.zip" % (corso.progressivo, corso.anno))
-    return redirect(archivio.download_url)
+    return archivio.risposta_streaming(nome="Corso %d-%d.zip" % (corso.progressivo, corso.anno))
 
 
 @pagina_privata
@@ -1,11 +1,12 @@
 # -*- coding: utf-8 -*-
 from django.core.urlresolvers import reverse
-from django.db import models, transaction
+from django.db import models
 from django.utils.encoding import force_text
 from django.utils.timezone import now
 from django.utils.translation import ugettext_lazy as _
 from filer.models import File
 from filer.models.abstract import BaseImage
+from base.contatori import incrementa
 from segmenti.models import BaseSegmento
 
 
@@ -29,10 +30,11 @@ class InterfacciaJorvik(object):
             return self.url_documento
         return super(InterfacciaJorvik, self).path
 
-    @transaction.atomic
     def incrementa_downloads(self):
-        self.downloads += 1
-        self.save()
+        """
+        Incrementa i downloads, senza salvare il file (vedi base.contatori).
+        """
+        incrementa(self, 'downloads')
 
     @property
     def url_scarica(self):
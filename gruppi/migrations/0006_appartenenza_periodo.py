@@ -0,0 +1,24 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.9.12 on 2017-03-03 11:40
+from __future__ import unicode_literals
+
+import django.contrib.postgres.fields.ranges
+from django.db import migrations
+
+from base.storico import operazioni_periodo
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gruppi', '0005_auto_20160906_1702'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='appartenenza',
+            name='periodo',
+            field=django.contrib.postgres.fields.ranges.DateTimeRangeField(blank=True, editable=False, null=True),
+        ),
+    ]
+    operations += operazioni_periodo('gruppi_appartenenza')
@@ -0,0 +1,17 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.9.12 on 2017-07-12 10:15
+from __future__ import unicode_literals
+
+from django.db import migrations
+
+from base.storico import operazioni_periodo_vuoto
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gruppi', '0006_appartenenza_periodo'),
+    ]
+
+    operations = []
+    operations += operazioni_periodo_vuoto('gruppi_appartenenza')
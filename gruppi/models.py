@@ -3,7 +3,7 @@ from django.db import models
 
 from anagrafica.models import Persona
 from base.models import ModelloSemplice, ConAutorizzazioni
-from base.tratti import ConMarcaTemporale, ConEstensione, ConDelegati, ConStorico
+from base.tratti import ConMarcaTemporale, ConEstensione, ConDelegati, ConStoricoIndicizzato, ConIndicePermessi
 
 __author__ = 'alfioemanuele'
 
@@ -13,7 +13,7 @@ def tra_1_e_6(n):
         raise ValidationError("Obiettivo non valido. Scegli un numero tra 1 e 6.")
 
 
-class Gruppo(ModelloSemplice, ConEstensione, ConMarcaTemporale, ConDelegati):
+class Gruppo(ModelloSemplice, ConEstensione, ConMarcaTemporale, ConDelegati, ConIndicePermessi):
     nome = models.CharField("Nome", max_length=255)
 
     obiettivo = models.IntegerField(validators=[tra_1_e_6], db_index=True)
@@ -36,7 +36,7 @@ class Gruppo(ModelloSemplice, ConEstensione, ConMarcaTemporale, ConDelegati):
         return "Gruppo %s" % (self.nome,)
 
 
-class Appartenenza(ModelloSemplice, ConStorico, ConMarcaTemporale):
+class Appartenenza(ModelloSemplice, ConStoricoIndicizzato, ConMarcaTemporale):
 
     class Meta:
         verbose_name_plural = "Appartenenze"
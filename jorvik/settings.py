@@ -87,7 +87,13 @@ CRON_CLASSES = [
     "base.cron.CronApprovaNegaAuto",
     "base.cron.CronRichiesteInAttesa",
     "base.cron.PulisciAspirantiVolontari",
+    "base.cron.CronGeocodifica",
     "anagrafica.cron.CronReportComitati",
+    "anagrafica.cron.CronStatistiche",
+    "segmenti.cron.CronRicalcolaSegmenti",
+    "formazione.cron.CronDomandaFormativa",
+    "ufficio_soci.cron.CronStatoQuote",
+    "ufficio_soci.cron.CronEsportazioniElenchi",
     "centrale_operativa.cron.CronCancellaCoturniInvalidi"
 ]
 
@@ -215,6 +221,11 @@ EMAIL_SSL_CERTFILE = EMAIL_CONF.get('email', 'ssl_certfile')
 
 POSTA_LOG_DEBUG = EMAIL_CONF.getboolean('email', 'log_debug', fallback=True)
 
+# Smaltimento parallelo della coda di posta (vedi posta.coda)
+POSTA_CODA_PARALLELA = EMAIL_CONF.getboolean('coda', 'parallela', fallback=False)
+POSTA_CODA_CONNESSIONI = EMAIL_CONF.getint('coda', 'connessioni', fallback=4)
+POSTA_CODA_LOTTO = EMAIL_CONF.getint('coda', 'lotto', fallback=200)
+
 DEFAULT_FROM_EMAIL = 'Gaia <noreply@gaia.cri.it>'
 GRAVATAR_DEFAULT_IMAGE = 'identicon'
 
@@ -285,7 +296,16 @@ LOGGING = {
         'two_factor': {
             'handlers': ['console'],
             'level': 'INFO',
-        }
+        },
+        'memoria': {
+            'handlers': ['console'],
+            'level': 'DEBUG',
+        },
+        'ufficio_soci': {
+            'handlers': ['file'],
+            'level': 'INFO',
+            'propagate': True,
+        },
     }
 }
 
@@ -366,6 +386,51 @@ NORECAPTCHA_SITE_KEY = APIS_CONF.get('nocaptcha', 'site_key', fallback=os.enviro
 NORECAPTCHA_SECRET_KEY = APIS_CONF.get('nocaptcha', 'secret_key', fallback=os.environ.get('NORECAPTCHA_SITE_KEY'))
 
 SCADENZA_AUTORIZZAZIONE_AUTOMATICA = GENERAL_CONF.getint('autorizzazioni', 'giorni', fallback=30)
+
+# Usa l'indice materializzato dei permessi (anagrafica.IndicePermesso) per le verifiche sulle deleghe.
+#  Disattivato di default: dopo averlo attivato va costruito l'indice (ricostruisci_indice_permessi)
+PERMESSI_INDICE_ATTIVO = GENERAL_CONF.getboolean('permessi', 'indice', fallback=False)
+
+# Usa l'appartenenza precalcolata ai segmenti (segmenti.MembroSegmento) per filtrare articoli e documenti.
+#  Disattivato di default: dopo averlo attivato vanno calcolati i segmenti (ricalcola_segmenti)
+SEGMENTI_PRECALCOLATI = GENERAL_CONF.getboolean('segmenti', 'precalcolati', fallback=False)
+
+# Filtra l'attualita' dei modelli ConStoricoIndicizzato sulla colonna periodo (indice GiST)
+STORICO_PERIODO_INDICIZZATO = GENERAL_CONF.getboolean('storico', 'periodo', fallback=True)
+
+# Ricerca degli indirizzi (vedi base.geocodifica): fornitore, giorni di validita' delle ricerche salvate
+#  (con e senza risultati) e uso del gazzettiere locale per le ricerche di soli comuni o CAP
+GEOCODIFICA_FORNITORE = GENERAL_CONF.get('geocodifica', 'fornitore', fallback='base.geocodifica.FornitoreGoogle')
+GEOCODIFICA_GIORNI_CACHE = GENERAL_CONF.getint('geocodifica', 'giorni_cache', fallback=90)
+GEOCODIFICA_GIORNI_CACHE_NEGATIVA = GENERAL_CONF.getint('geocodifica', 'giorni_cache_negativa', fallback=7)
+GEOCODIFICA_GAZZETTIERE = GENERAL_CONF.getboolean('geocodifica', 'gazzettiere', fallback=True)
+
+# Ogni quanti secondi scrivere gli incrementi accumulati dei contatori (vedi base.contatori), 0 per scriverli subito
+CONTATORI_INTERVALLO = GENERAL_CONF.getint('contatori', 'intervallo', fallback=30)
+
+# Legge la domanda formativa delle sedi dalla tabella precalcolata (vedi formazione.domanda)
+DOMANDA_FORMATIVA_PRECALCOLATA = GENERAL_CONF.getboolean('formazione', 'domanda_precalcolata', fallback=True)
+
+# Legge paganti e non paganti dei tesseramenti dallo stato precalcolato delle quote (vedi ufficio_soci.stato_quote)
+QUOTE_STATO_PRECALCOLATO = GENERAL_CONF.getboolean('quote', 'stato_precalcolato', fallback=True)
+
+# Minuti dopo i quali un'esportazione di un elenco ancora in corso viene considerata interrotta
+#  (es. processo terminato) e segnata come fallita (vedi ufficio_soci.cron.CronEsportazioniElenchi)
+ESPORTAZIONI_DURATA_MASSIMA = GENERAL_CONF.getint('esportazioni', 'durata_massima', fallback=60)
+
+# Generazione dei PDF (vedi base.pdf): motore, numero massimo di generazioni in parallelo,
+#  giorni di conservazione dei PDF generati in cache (0 per non usare la cache)
+PDF_MOTORE = GENERAL_CONF.get('pdf', 'motore', fallback='base.pdf.MotoreDOMPDF')
+PDF_PROCESSI = GENERAL_CONF.getint('pdf', 'processi', fallback=4)
+PDF_GIORNI_CACHE = GENERAL_CONF.getint('pdf', 'giorni_cache', fallback=1)
+# Numero massimo di tesserini scaricabili in un solo PDF: la generazione avviene durante la richiesta
+PDF_TESSERINI_MASSIMO = GENERAL_CONF.getint('pdf', 'tesserini_massimo', fallback=200)
+
+# Mantiene in memoria una copia dell'albero delle sedi (vedi anagrafica.albero)
+SEDI_ALBERO_MEMORIA = GENERAL_CONF.getboolean('sedi', 'albero_memoria', fallback=True)
+# Ogni quanti secondi verificare se l'albero delle sedi e' stato modificato da un altro processo
+SEDI_ALBERO_VERIFICA = GENERAL_CONF.getint('sedi', 'albero_verifica', fallback=30)
+
 DATA_AVVIO_TRASFERIMENTI_AUTO = date(2017, 1, 18)
 
 if os.environ.get('ENABLE_TEST_APPS', False):
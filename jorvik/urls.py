@@ -238,6 +238,10 @@ urlpatterns = [
     url(r'^us/tesserini/emissione/$', ufficio_soci.viste.us_tesserini_emissione),
     url(r'^us/tesserini/emissione/processa/$', ufficio_soci.viste.us_tesserini_emissione_processa),
     url(r'^us/tesserini/emissione/scarica/$', ufficio_soci.viste.us_tesserini_emissione_scarica),
+    url(r'^us/tesserini/emissione/scarica/unico/$', ufficio_soci.viste.us_tesserini_emissione_scarica_unico),
+
+    url(r'^us/esportazione/(?P<esportazione_pk>[0-9]+)/$', ufficio_soci.viste.us_elenco_esportazione),
+    url(r'^us/esportazione/(?P<esportazione_pk>[0-9]+)/stato/$', ufficio_soci.viste.us_elenco_esportazione_stato),
 
     url(r'^us/elenco/(?P<elenco_id>.*)/(?P<pagina>[0-9]+)/$', ufficio_soci.viste.us_elenco),
     url(r'^us/elenco/(?P<elenco_id>.*)/download/$', ufficio_soci.viste.us_elenco_download),
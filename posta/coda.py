@@ -0,0 +1,282 @@
+"""
+Questo modulo implementa lo smaltimento parallelo della coda di posta.
+
+A differenza di Messaggio.smaltisci_coda, che invia un destinatario alla volta su una
+ sola connessione, i destinatari vengono prenotati a lotti (SELECT ... FOR UPDATE SKIP LOCKED,
+ in modo da permettere piu' processi in parallelo) e inviati da un gruppo di thread,
+ ognuno con la propria connessione SMTP. Il corpo MIME di ogni messaggio viene costruito
+ una sola volta e l'esito dei destinatari viene salvato con un aggiornamento per lotto.
+
+Vedi anche posta.smtp_locale per un server SMTP locale da usare nelle prove di carico.
+"""
+import copy
+import logging
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from queue import Queue
+from smtplib import SMTPException, SMTPResponseException, SMTPServerDisconnected, SMTPRecipientsRefused
+
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.core.mail.message import make_msgid
+from django.core.mail.utils import DNS_NAME
+from django.db import connection as db
+from django.db.transaction import atomic
+from django.utils import timezone
+from django.utils.html import strip_tags
+
+from posta.models import Messaggio, Destinatario
+
+logger = logging.getLogger('posta')
+
+
+class EmailPreparata(EmailMultiAlternatives):
+    """
+    E-mail il cui corpo MIME (testo, HTML, allegati) viene costruito una sola volta.
+    Usare EmailPreparata.per() per ottenere una copia per dei destinatari specifici.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(EmailPreparata, self).__init__(*args, **kwargs)
+        self._base = None
+        self._lock = threading.Lock()
+
+    def base(self):
+        with self._lock:
+            if self._base is None:
+                self._base = super(EmailPreparata, self).message()
+            return self._base
+
+    def per(self, destinatari, connection=None):
+        """
+        Ritorna una copia dell'e-mail per i destinatari, che condivide il corpo MIME.
+        """
+        self.base()
+        copia = copy.copy(self)
+        copia.to = list(destinatari)
+        copia.connection = connection
+        return copia
+
+    def message(self):
+        base = self.base()
+        msg = copy.copy(base)
+        msg._headers = list(base._headers)  # Le intestazioni non vanno condivise con il corpo base
+        del msg['To']
+        del msg['Message-ID']
+        msg['To'] = ', '.join(self.to)
+        msg['Message-ID'] = make_msgid(domain=DNS_NAME)
+        return msg
+
+
+def prepara_email(messaggio):
+    """
+    Costruisce l'EmailPreparata per un Messaggio.
+    """
+    mittente, reply_to = messaggio.intestazioni()
+    email = EmailPreparata(
+        subject=messaggio.oggetto,
+        body=strip_tags(messaggio.corpo),
+        from_email=mittente,
+        reply_to=[reply_to],
+        attachments=messaggio.allegati_pronti(),
+    )
+    email.attach_alternative(messaggio.corpo, "text/html")
+    email.base()
+    return email
+
+
+def indirizzi_destinatario(destinatario, utenza=False):
+    """
+    Ritorna gli indirizzi e-mail a cui inviare il messaggio per un destinatario (vedi Messaggio.invia).
+    """
+    indirizzi = []
+    persona = destinatario.persona
+    if persona and persona.email:
+        indirizzi.append(persona.email)
+    if utenza and hasattr(persona, 'utenza') and persona.utenza and persona.utenza.email \
+            and persona.utenza.email != persona.email:
+        indirizzi.append(persona.utenza.email)
+    return indirizzi
+
+
+def esito_errore(errore):
+    """
+    Classifica un errore di invio, come in Messaggio.invia.
+    :return: (inviato, invalido, messaggio di errore)
+    """
+    if isinstance(errore, SMTPRecipientsRefused):
+        try:
+            if any([codice == 250 for email, codice in errore.recipients.items()]):
+                return True, False, str(errore)  # Almeno un'email e' partita
+        except AttributeError:
+            pass
+        return True, True, str(errore)  # E-mail di destinazione rotta: ignora.
+
+    if isinstance(errore, SMTPResponseException) and errore.smtp_code == 501:
+        return True, True, str(errore)
+
+    if isinstance(errore, SMTPException):
+        return False, False, str(errore)  # Riprova piu' tardi.
+
+    if isinstance(errore, TypeError):
+        return True, True, "Nessun indirizzo e-mail. Saltato"
+
+    if isinstance(errore, AttributeError):
+        return True, True, "Destinatario non valido. Saltato"
+
+    if isinstance(errore, UnicodeEncodeError):
+        return True, True, "Indirizzo e-mail non valido. Saltato."
+
+    raise errore
+
+
+class MetricheCoda(object):
+    """
+    Metriche di uno smaltimento della coda.
+    """
+
+    def __init__(self):
+        self.inizio = time.time()
+        self.messaggi = 0
+        self.lotti = 0
+        self.inviati = 0
+        self.invalidi = 0
+        self.falliti = 0
+
+    @property
+    def durata(self):
+        return time.time() - self.inizio
+
+    @property
+    def al_secondo(self):
+        return (self.inviati + self.invalidi) / max(self.durata, 0.001)
+
+    def __str__(self):
+        return "messaggi=%d, lotti=%d, inviati=%d, invalidi=%d, falliti=%d, durata=%.1fs, al secondo=%.1f" % (
+            self.messaggi, self.lotti, self.inviati, self.invalidi, self.falliti, self.durata, self.al_secondo,
+        )
+
+
+def _prenota_lotto(messaggio, dimensione, avvio):
+    """
+    Prenota (blocca) un lotto di destinatari non ancora inviati. Da eseguire in una transazione.
+    I destinatari gia' tentati durante questo smaltimento vengono ignorati.
+    """
+    # SKIP LOCKED e' disponibile da PostgreSQL 9.5; prima, attende i lotti degli altri processi.
+    salta = " SKIP LOCKED" if getattr(db, 'pg_version', 0) >= 90500 else ""
+    sql = "SELECT id FROM {} WHERE messaggio_id = %s AND NOT inviato AND (tentativo IS NULL OR tentativo < %s) " \
+          "ORDER BY id LIMIT %s FOR UPDATE{}".format(Destinatario._meta.db_table, salta)
+    with db.cursor() as cursor:
+        cursor.execute(sql, [messaggio.pk, avvio, dimensione])
+        pks = [riga[0] for riga in cursor.fetchall()]
+    return list(Destinatario.objects.filter(pk__in=pks).select_related('persona', 'persona__utenza'))
+
+
+def _invia(connessioni, email, indirizzi):
+    """
+    Invia l'e-mail usando una connessione libera. Eseguito nei thread: non accede al database.
+    :return: (inviato, invalido, errore)
+    """
+    connessione = connessioni.get()
+    try:
+        connessione.open()
+        email.per(indirizzi, connessione).send()
+        return True, False, None
+    except (SMTPException, TypeError, AttributeError, UnicodeEncodeError) as e:
+        if isinstance(e, SMTPServerDisconnected):
+            connessione.close()  # Verra' riaperta al prossimo invio
+        return esito_errore(e)
+    finally:
+        connessioni.put(connessione)
+
+
+def _smaltisci_messaggio(messaggio, esecutore, connessioni, lotto, avvio, metriche, utenza=False):
+    if not messaggio.oggetti_destinatario.exists():  # E-mail al supporto
+        connessione = connessioni.get()
+        try:
+            messaggio.invia(connessione, utenza=utenza)
+        finally:
+            connessioni.put(connessione)
+        return
+
+    email = prepara_email(messaggio)
+
+    while True:
+        with atomic():
+            destinatari = _prenota_lotto(messaggio, lotto, avvio)
+            if not destinatari:
+                break
+
+            esiti = defaultdict(list)  # (inviato, invalido, errore) => [pk, ...]
+            invii = []
+            for destinatario in destinatari:
+                indirizzi = indirizzi_destinatario(destinatario, utenza=utenza)
+                if not indirizzi:
+                    esiti[(True, True, "Nessun indirizzo e-mail. Saltato")].append(destinatario.pk)
+                    continue
+                invii.append((destinatario.pk, esecutore.submit(_invia, connessioni, email, indirizzi)))
+
+            for pk, invio in invii:
+                esiti[invio.result()].append(pk)
+
+            adesso = timezone.now()
+            for (inviato, invalido, errore), pks in esiti.items():
+                Destinatario.objects.filter(pk__in=pks).update(
+                    inviato=inviato, invalido=invalido, errore=errore[:256] if errore else None, tentativo=adesso,
+                )
+                if not inviato:
+                    metriche.falliti += len(pks)
+                elif invalido:
+                    metriche.invalidi += len(pks)
+                else:
+                    metriche.inviati += len(pks)
+            metriche.lotti += 1
+
+    # Il messaggio e' terminato quando non ci sono piu' destinatari da inviare,
+    #  anche se prenotati da altri processi (che lo termineranno al loro posto).
+    adesso = timezone.now()
+    rimanenti = messaggio.oggetti_destinatario.filter(inviato=False).exists()
+    Messaggio.objects.filter(pk=messaggio.pk).update(
+        ultimo_tentativo=adesso, ultima_modifica=adesso, terminato=None if rimanenti else adesso,
+    )
+
+
+def smaltisci_coda_parallela(connessioni=None, lotto=None, dimensione_massima=None, utenza=False):
+    """
+    Smaltisce la coda di posta con un gruppo di connessioni SMTP in parallelo.
+    Piu' processi possono essere eseguiti contemporaneamente.
+
+    :param connessioni: Numero di connessioni SMTP (e thread). Default, settings.POSTA_CODA_CONNESSIONI.
+    :param lotto: Numero di destinatari prenotati per volta. Default, settings.POSTA_CODA_LOTTO.
+    :param dimensione_massima: Numero massimo di messaggi da elaborare.
+    :param utenza: Invia anche all'indirizzo dell'utenza (vedi Messaggio.invia).
+    :return: MetricheCoda.
+    """
+    connessioni = connessioni or settings.POSTA_CODA_CONNESSIONI
+    lotto = lotto or settings.POSTA_CODA_LOTTO
+    metriche = MetricheCoda()
+    avvio = timezone.now()
+
+    da_smaltire = Messaggio.in_coda()
+    if dimensione_massima:
+        da_smaltire = da_smaltire[:dimensione_massima]
+
+    gruppo = [get_connection() for _ in range(connessioni)]
+    libere = Queue()
+    for connessione in gruppo:
+        libere.put(connessione)
+
+    try:
+        with ThreadPoolExecutor(max_workers=connessioni) as esecutore:
+            for messaggio in da_smaltire:
+                _smaltisci_messaggio(messaggio, esecutore, libere, lotto, avvio, metriche, utenza=utenza)
+                metriche.messaggi += 1
+                logger.debug('Coda: MSG %s elaborato, %s' % (messaggio.pk, metriche))
+    finally:
+        for connessione in gruppo:
+            connessione.close()
+
+    print("%s -- fine elaborazione parallela, %s" % (timezone.now().isoformat(' '), metriche))
+    return metriche
@@ -1,5 +1,7 @@
+from django.conf import settings
 from django_cron import CronJobBase, Schedule
 
+from posta.coda import smaltisci_coda_parallela
 from posta.models import Messaggio
 
 
@@ -11,4 +13,7 @@ class CronSmaltisciCodaPosta(CronJobBase):
     code = 'posta.smaltisci'
 
     def do(self):
-        Messaggio.smaltisci_coda(dimensione_massima=2200)
+        if settings.POSTA_CODA_PARALLELA:
+            smaltisci_coda_parallela(dimensione_massima=2200)
+        else:
+            Messaggio.smaltisci_coda(dimensione_massima=2200)
@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from posta.smtp_locale import ServerSMTPLocale
+
+
+class Command(BaseCommand):
+    help = 'Avvia un server SMTP locale che scarta i messaggi, per le prove di carico della posta'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--porta', type=int, default=1025)
+        parser.add_argument('--latenza', type=float, default=0.0, help='Secondi di attesa per messaggio')
+
+    def handle(self, *args, **options):
+        server = ServerSMTPLocale(porta=options['porta'], latenza=options['latenza']).avvia()
+        print('Server SMTP locale in ascolto sulla porta %d' % server.porta)
+        try:
+            while True:
+                time.sleep(10)
+                print(server)
+        except KeyboardInterrupt:
+            server.ferma()
+            print(server)
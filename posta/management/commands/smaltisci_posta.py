@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+from django.core.management.base import BaseCommand
+
+from posta.coda import smaltisci_coda_parallela
+
+
+class Command(BaseCommand):
+    help = 'Smaltisce la coda di posta con piu\' connessioni SMTP in parallelo'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--connessioni', type=int, default=None, help='Numero di connessioni SMTP')
+        parser.add_argument('--lotto', type=int, default=None, help='Destinatari prenotati per volta')
+        parser.add_argument('--massimo', type=int, default=None, help='Numero massimo di messaggi')
+
+    def handle(self, *args, **options):
+        smaltisci_coda_parallela(connessioni=options['connessioni'], lotto=options['lotto'],
+                                 dimensione_massima=options['massimo'])
@@ -116,15 +116,11 @@ class Messaggio(ModelloSemplice, ConMarcaTemporale, ConGiudizio, ConAllegati):
     def allegati_pronti(self):
         return ()
 
-    def invia(self, connection=None, utenza=False):
+    def intestazioni(self):
         """
-        Salva e invia immediatamente il messaggio.
-        :return:
+        Ritorna il mittente e l'indirizzo di risposta del messaggio.
+        :return: (mittente, reply_to)
         """
-        self.save()  # Assicurati che sia salvato
-
-        connection = connection or get_connection()
-
         if self.mittente is None:
             mittente_nome = self.SUPPORTO_NOME
             mittente_email = self.SUPPORTO_EMAIL
@@ -143,6 +139,18 @@ class Messaggio(ModelloSemplice, ConMarcaTemporale, ConGiudizio, ConAllegati):
             reply_to = "%s <%s>" % (mittente_nome, mittente_email)
 
         mittente = "%s <%s>" % (mittente_nome, self.NOREPLY_EMAIL)
+        return mittente, reply_to
+
+    def invia(self, connection=None, utenza=False):
+        """
+        Salva e invia immediatamente il messaggio.
+        :return:
+        """
+        self.save()  # Assicurati che sia salvato
+
+        connection = connection or get_connection()
+
+        mittente, reply_to = self.intestazioni()
 
         plain_text = strip_tags(self.corpo)
         successo = True
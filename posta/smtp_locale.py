@@ -0,0 +1,62 @@
+"""
+Server SMTP locale che accetta e scarta tutti i messaggi, contandoli.
+
+Da usare al posto del server reale nelle prove di carico della coda di posta (vedi posta.coda),
+ configurando in config/email.cnf il backend SMTP con host e porta del server locale.
+"""
+import asyncore
+import smtpd
+import threading
+import time
+
+
+class ServerSMTPLocale(smtpd.SMTPServer):
+    """
+    Server SMTP che conta i messaggi ricevuti. Opzionalmente simula la latenza di un server reale.
+    """
+
+    def __init__(self, host='127.0.0.1', porta=1025, latenza=0.0):
+        smtpd.SMTPServer.__init__(self, (host, porta), None)
+        self.latenza = latenza
+        self.messaggi = 0
+        self.destinatari = 0
+        self.inizio = time.time()
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def process_message(self, peer, mailfrom, rcpttos, data, **kwargs):
+        if self.latenza:
+            time.sleep(self.latenza)
+        with self._lock:
+            self.messaggi += 1
+            self.destinatari += len(rcpttos)
+
+    @property
+    def porta(self):
+        return self.socket.getsockname()[1]
+
+    def avvia(self):
+        """
+        Avvia il server in un thread separato.
+        """
+        self._thread = threading.Thread(target=asyncore.loop, kwargs={'timeout': 0.1, 'map': self._map})
+        self._thread.daemon = True
+        self._thread.start()
+        return self
+
+    def ferma(self):
+        self.close()
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.avvia()
+
+    def __exit__(self, *args):
+        self.ferma()
+
+    def __str__(self):
+        durata = max(time.time() - self.inizio, 0.001)
+        return "messaggi=%d, destinatari=%d, al secondo=%.1f" % (
+            self.messaggi, self.destinatari, self.messaggi / durata,
+        )
@@ -16,7 +16,9 @@ from freezegun import freeze_time
 from anagrafica.models import Persona
 from base.utils_tests import crea_persona_sede_appartenenza, crea_utenza, email_fittizzia, crea_persona, crea_sede, \
     crea_appartenenza
+from posta.coda import smaltisci_coda_parallela
 from posta.models import Messaggio
+from posta.smtp_locale import ServerSMTPLocale
 from posta.utils import imposta_destinatari_e_scrivi_messaggio
 from posta.viste import posta_scrivi
 
@@ -333,3 +335,47 @@ class TestInviiMassivi(TestCase):
         self._invia_msg_singolo()
         self.assertEqual(Messaggio.in_coda().count(), 1)
         self._reset_coda()
+
+    def test_coda_parallela(self):
+        """
+        La coda parallela invia tutti i destinatari, una sola volta, tramite piu' connessioni
+        """
+        senza_email = crea_persona()
+        destinatari = [p.persona for p in self.persone] + [senza_email]
+        messaggio = Messaggio.costruisci_e_accoda(
+            destinatari=destinatari,
+            oggetto="Email massiva",
+            modello="email.html",
+        )
+
+        with ServerSMTPLocale(porta=0) as server:
+            with override_settings(EMAIL_BACKEND='django.core.mail.backends.smtp.EmailBackend',
+                                   EMAIL_HOST='127.0.0.1', EMAIL_PORT=server.porta,
+                                   EMAIL_USE_TLS=False, EMAIL_USE_SSL=False):
+                metriche = smaltisci_coda_parallela(connessioni=3, lotto=4)
+
+        self.assertEqual(server.messaggi, len(self.persone))
+        self.assertEqual(metriche.inviati, len(self.persone))
+        self.assertEqual(metriche.invalidi, 1)
+        self.assertEqual(Messaggio.in_coda().count(), 0)
+        self.assertFalse(messaggio.oggetti_destinatario.filter(inviato=False).exists())
+        self.assertTrue(messaggio.oggetti_destinatario.get(persona=senza_email).invalido)
+
+    @patch('smtplib.SMTP')
+    def test_coda_parallela_fallimento_disconnect(self, mock_smtp):
+        """
+        In caso di disconessione del server il messaggio resta in coda e i destinatari non sono inviati
+        """
+        instance = mock_smtp.return_value
+        instance.sendmail.side_effect = smtplib.SMTPServerDisconnected({})
+        messaggio = Messaggio.costruisci_e_accoda(
+            destinatari=[p.persona for p in self.persone],
+            oggetto="Email massiva",
+            modello="email.html",
+        )
+        with override_settings(EMAIL_BACKEND='django.core.mail.backends.smtp.EmailBackend'):
+            metriche = smaltisci_coda_parallela(connessioni=2, lotto=2)
+        self.assertEqual(metriche.falliti, len(self.persone))
+        self.assertEqual(Messaggio.in_coda().count(), 1)
+        self.assertFalse(messaggio.oggetti_destinatario.filter(inviato=True).exists())
+        self._reset_coda()
@@ -0,0 +1,18 @@
+from django_cron import CronJobBase, Schedule
+
+from segmenti.membri import ricalcola_segmenti
+
+
+class CronRicalcolaSegmenti(CronJobBase):
+    """
+    Ricalcola ogni notte l'appartenenza ai segmenti, che dipende anche dalla data
+     (es. eta' e anzianita' dei volontari, deleghe scadute).
+    """
+
+    RUN_AT_TIMES = ['02:30']
+
+    schedule = Schedule(run_at_times=RUN_AT_TIMES)
+    code = 'segmenti.ricalcola'
+
+    def do(self):
+        ricalcola_segmenti()
@@ -0,0 +1,19 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+from django.core.management.base import NoArgsCommand
+
+from segmenti.membri import ricalcola_segmenti
+
+
+class Command(NoArgsCommand):
+
+    def handle_noargs(self, **options):
+        print('Inizio calcolo dei segmenti')
+
+        def progresso(numero, totale):
+            print('%d/%d persone calcolate' % (numero, totale))
+
+        righe = ricalcola_segmenti(progresso=progresso)
+        print('Segmenti calcolati (%d righe)' % righe)
@@ -0,0 +1,116 @@
+"""
+Questo modulo calcola l'appartenenza delle persone ai segmenti (vedi segmenti.segmenti)
+ e la salva in MembroSegmento, per permettere a FiltroSegmentoQuerySet.filtra_per_segmenti
+ di filtrare con una singola query.
+
+Ogni filtro di SEGMENTI viene applicato una sola volta all'insieme delle persone da calcolare.
+L'appartenenza viene aggiornata alla modifica di Appartenenza, Delega, TitoloPersonale
+ e PartecipazioneCorsoBase, e ricalcolata completamente ogni notte (vedi segmenti.cron),
+ dato che alcuni segmenti dipendono dalla data (es. eta', anzianita').
+
+Alla modifica di un modello vengono rieseguiti solo i filtri dei segmenti che ne dipendono
+ (es. SEGMENTI_DELEGA): per gli altri l'appartenenza e' letta dalle righe gia' salvate.
+ Le righe per sede vengono comunque ricostruite, perche' dipendono dalle appartenenze attuali.
+"""
+from collections import defaultdict
+
+from django.conf import settings
+from django.db.transaction import atomic
+
+from anagrafica.models import Appartenenza, Persona
+from curriculum.models import TitoloPersonale
+from segmenti.models import MembroSegmento
+from segmenti.segmenti import SEGMENTI
+
+# Segmenti i cui filtri dipendono da ciascun modello
+SEGMENTI_APPARTENENZA = ('B', 'C', 'D', 'E', 'F', 'G', 'AA')
+SEGMENTI_DELEGA = ('I', 'J', 'K', 'L', 'M', 'N', 'O', 'P', 'Q', 'R', 'S', 'T', 'U', 'V', 'W', 'X', 'Y', 'Z')
+SEGMENTI_TITOLO = ('AA',)
+SEGMENTI_CORSO_BASE = ('H',)
+
+
+def righe_segmenti(persone, segmenti=None):
+    """
+    Calcola le righe MembroSegmento per un insieme di persone, senza salvarle.
+    :param persone: QuerySet<Persona>.
+    :param segmenti: Se specificato, solo i filtri di questi segmenti vengono rieseguiti;
+                     per gli altri vale l'appartenenza gia' salvata. Altrimenti tutti.
+    :return: Lista di MembroSegmento non salvati.
+    """
+    salvati = defaultdict(set)
+    if segmenti is not None:
+        for persona_id, segmento in MembroSegmento.objects.filter(persona__in=persone).exclude(
+                segmento__in=segmenti).values_list('persona_id', 'segmento').distinct():
+            salvati[segmento].add(persona_id)
+
+    sedi = defaultdict(set)
+    for persona_id, sede_id in Appartenenza.query_attuale(persona__in=persone).values_list('persona_id', 'sede_id'):
+        sedi[persona_id].add(sede_id)
+
+    titoli = defaultdict(set)
+    for persona_id, titolo_id in TitoloPersonale.objects.filter(
+            persona__in=persone, confermata=True).values_list('persona_id', 'titolo_id'):
+        titoli[persona_id].add(titolo_id)
+
+    righe = []
+    for segmento, filtro in SEGMENTI.items():
+        if segmento == 'A':  # Tutti gli utenti, non viene salvato
+            continue
+
+        if segmenti is None or segmento in segmenti:
+            membri = set(filtro(persone).values_list('pk', flat=True))
+        else:
+            membri = salvati[segmento]
+
+        for persona_id in membri:
+            if segmento == 'AA':
+                righe += [MembroSegmento(persona_id=persona_id, segmento=segmento, titolo_id=titolo_id)
+                          for titolo_id in titoli[persona_id]]
+            else:
+                righe += [MembroSegmento(persona_id=persona_id, segmento=segmento)]
+                righe += [MembroSegmento(persona_id=persona_id, segmento=segmento, sede_id=sede_id)
+                          for sede_id in sedi[persona_id]]
+
+    return righe
+
+
+def aggiorna_segmenti(persone, segmenti=None):
+    """
+    Ricalcola i segmenti per un insieme di persone.
+    :param persone: QuerySet<Persona>.
+    :param segmenti: Se specificato, solo i filtri di questi segmenti vengono rieseguiti (vedi righe_segmenti).
+    :return: Il numero di righe inserite.
+    """
+    with atomic():
+        righe = righe_segmenti(persone, segmenti)
+        MembroSegmento.objects.filter(persona__in=persone).delete()
+        MembroSegmento.objects.bulk_create(righe, batch_size=1000)
+    return len(righe)
+
+
+def aggiorna_segmenti_persona(persona_id, segmenti=None):
+    """
+    Ricalcola i segmenti di una persona. Da chiamare alla modifica dei dati che li influenzano.
+    :param persona_id: L'ID della persona.
+    :param segmenti: I segmenti che dipendono dai dati modificati (es. SEGMENTI_DELEGA). Altrimenti tutti.
+    """
+    if not settings.SEGMENTI_PRECALCOLATI or persona_id is None:
+        return
+    aggiorna_segmenti(Persona.objects.filter(pk=persona_id), segmenti)
+
+
+def ricalcola_segmenti(dimensione=5000, progresso=None):
+    """
+    Ricalcola i segmenti di tutte le persone, a blocchi.
+    :param dimensione: Numero di persone per blocco.
+    :param progresso: Funzione opzionale chiamata come progresso(persone calcolate, totale) dopo ogni blocco.
+    :return: Il numero di righe inserite.
+    """
+    persone = list(Persona.objects.order_by('pk').values_list('pk', flat=True))
+    righe = 0
+    for inizio in range(0, len(persone), dimensione):
+        blocco = persone[inizio:inizio + dimensione]
+        righe += aggiorna_segmenti(Persona.objects.filter(pk__in=blocco))
+        if progresso:
+            progresso(inizio + len(blocco), len(persone))
+    return righe
@@ -1,3 +1,4 @@
+from django.conf import settings
 from django.db import models
 from django.utils import six
 
@@ -26,14 +27,30 @@ class FiltroSegmentoQuerySet(models.QuerySet):
             filtri |= models.Q(**filtro_attivo)
         return filtri
 
+    def _get_filtri_precalcolati(self, utente):
+        membri = MembroSegmento.objects.filter(persona=utente)
+        segmenti = membri.filter(sede__isnull=True, titolo__isnull=True).values('segmento')
+        sedi = membri.filter(sede__isnull=False).values('sede')
+        titoli = membri.filter(segmento='AA', titolo__isnull=False).values('titolo')
+        return (
+            models.Q(segmento='A') |
+            models.Q(segmento='AA', titolo__in=titoli) |
+            models.Q(segmento__in=segmenti, sede__isnull=True) |
+            models.Q(segmento__in=segmenti, sede__in=sedi)
+        )
+
     def filtra_per_segmenti(self, utente):
         """
         Filtra il QuerySet in base  in base ai segmenti di appartenenza dell'utente
         compresi i filtri sulle sedi e sui titoli
 
+        Se i segmenti sono precalcolati (vedi MembroSegmento), il filtro e' una singola query.
+
         :param utente: Utente su cui filtrare gli oggetti
         :return: Queryset filtrato
         """
+        if settings.SEGMENTI_PRECALCOLATI:
+            return self.filter(self._get_filtri_precalcolati(utente))
         filtri = self._get_filtri(utente.segmenti_collegati)
         return self.filter(filtri)
 
@@ -90,3 +107,28 @@ class BaseSegmento(six.with_metaclass(BaseSegmentoBase, models.Model)):
         if self.sede:
             filters['appartenenze__sede'] = self.sede.pk
         return filters
+
+
+class MembroSegmento(models.Model):
+    """
+    Appartenenza precalcolata di una Persona ad un segmento (vedi segmenti.membri).
+
+    Per ogni segmento (escluso 'A', che comprende tutti) contiene una riga senza sede,
+     piu' una riga per ogni sede attuale della persona. Per il segmento 'AA', una riga per
+     ogni titolo confermato della persona.
+    """
+    persona = models.ForeignKey(Persona, related_name='membri_segmenti', on_delete=models.CASCADE)
+    segmento = models.CharField(max_length=256, choices=NOMI_SEGMENTI, db_index=True)
+    sede = models.ForeignKey(Sede, blank=True, null=True, related_name='membri_segmenti', on_delete=models.CASCADE)
+    titolo = models.ForeignKey(Titolo, blank=True, null=True, related_name='membri_segmenti',
+                               on_delete=models.CASCADE)
+
+    class Meta:
+        verbose_name = 'membro segmento'
+        verbose_name_plural = 'membri segmenti'
+        index_together = [
+            ['persona', 'segmento'],
+        ]
+
+    def __str__(self):
+        return '{0} - {1}'.format(self.get_segmento_display(), self.persona_id)
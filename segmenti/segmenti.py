@@ -105,15 +105,13 @@ def sostenitori_cri(queryset):
 
 
 def aspiranti_volontari_iscritti_ad_un_corso(queryset):
-    qs = queryset.filter(
+    from formazione.models import PartecipazioneCorsoBase, CorsoBase
+    # Come Persona.partecipazione_corso_base, ma con una sola query per tutto il queryset
+    partecipazioni = PartecipazioneCorsoBase.con_esito_ok(corso__stato=CorsoBase.ATTIVO)
+    return queryset.filter(
         aspirante__isnull=False,
+        pk__in=partecipazioni.values('persona_id'),
     )
-    aspiranti_filtrati = []
-    for persona in qs:
-        if persona.partecipazione_corso_base():
-            aspiranti_filtrati.append(persona.pk)
-    qs = qs.filter(pk__in=aspiranti_filtrati)
-    return qs
 
 
 def tutti_i_presidenti(queryset):
@@ -3,12 +3,19 @@ from __future__ import absolute_import, print_function, unicode_literals
 
 from datetime import timedelta
 
-from django.test import TestCase
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 
 from anagrafica.models import Appartenenza, Persona
+from anagrafica.permessi.applicazioni import UFFICIO_SOCI, DELEGATO_OBIETTIVO_1, RESPONSABILE_FORMAZIONE
 from base.utils import poco_fa
-from base.utils_tests import crea_persona, crea_persona_sede_appartenenza
-from segmenti.segmenti import volontari_piu_un_anno, volontari_meno_un_anno
+from base.utils_tests import crea_persona, crea_persona_sede_appartenenza, crea_sede, crea_appartenenza
+from curriculum.models import Titolo, TitoloPersonale
+from gestione_file.models import Documento, DocumentoSegmento
+from segmenti.membri import ricalcola_segmenti
+from segmenti.models import MembroSegmento
+from segmenti.segmenti import volontari_piu_un_anno, volontari_meno_un_anno, NOMI_SEGMENTI
 
 
 class TestSegmenti(TestCase):
@@ -58,3 +65,55 @@ class TestSegmenti(TestCase):
         self.assertTrue(presidente in meno_di_due_anni)
         self.assertTrue(persona_1 in meno_di_due_anni)
         self.assertTrue(persona_2 in meno_di_due_anni)
+
+    @override_settings(SEGMENTI_PRECALCOLATI=True)
+    def test_segmenti_precalcolati(self):
+        """
+        Confronta il calcolo dinamico dei segmenti con quello precalcolato,
+         per una persona con molte deleghe e sedi.
+        """
+        persona, sede, _ = crea_persona_sede_appartenenza()
+        titolo = Titolo.objects.create(tipo='PC', nome='Titolo test')
+        TitoloPersonale.objects.create(titolo=titolo, persona=persona, confermata=True)
+
+        sedi = [sede]
+        for i in range(10):
+            altra_sede = crea_sede(presidente=persona)
+            crea_appartenenza(persona, altra_sede)
+            sedi.append(altra_sede)
+            for tipo in (UFFICIO_SOCI, DELEGATO_OBIETTIVO_1, RESPONSABILE_FORMAZIONE):
+                altra_sede.aggiungi_delegato(tipo, persona)
+
+        documento = Documento.objects.create(url_documento='http://www.example.com')
+        for segmento, _ in NOMI_SEGMENTI:
+            DocumentoSegmento.objects.create(segmento=segmento, file=documento)
+            DocumentoSegmento.objects.create(segmento=segmento, file=documento, sede=sedi[-1])
+            DocumentoSegmento.objects.create(segmento=segmento, file=documento, sede=crea_sede())
+        DocumentoSegmento.objects.create(segmento='AA', file=documento, titolo=titolo)
+
+        with override_settings(SEGMENTI_PRECALCOLATI=False):
+            with CaptureQueriesContext(connection) as dinamico:
+                attesi = set(DocumentoSegmento.objects.all().filtra_per_segmenti(
+                    Persona.objects.get(pk=persona.pk)
+                ))
+
+        with CaptureQueriesContext(connection) as precalcolato:
+            risultato = set(DocumentoSegmento.objects.all().filtra_per_segmenti(persona))
+
+        self.assertEqual(risultato, attesi)
+        self.assertEqual(len(precalcolato), 1)
+        self.assertLess(len(precalcolato), len(dinamico))
+
+        # Il ricalcolo completo produce le stesse righe dell'aggiornamento incrementale
+        def _confronta_ricalcolo():
+            righe = set(MembroSegmento.objects.values_list('persona', 'segmento', 'sede', 'titolo'))
+            ricalcola_segmenti()
+            self.assertEqual(righe, set(MembroSegmento.objects.values_list('persona', 'segmento', 'sede', 'titolo')))
+
+        _confronta_ricalcolo()
+
+        # Anche quando vengono rieseguiti solo i segmenti che dipendono dal modello modificato
+        Appartenenza.objects.filter(persona=persona, sede=sedi[-1]).get().delete()
+        _confronta_ricalcolo()
+        TitoloPersonale.objects.filter(persona=persona).get().delete()
+        _confronta_ricalcolo()
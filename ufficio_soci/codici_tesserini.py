@@ -0,0 +1,99 @@
+"""
+Questo modulo assegna i codici EAN-13 dei tesserini (Tesserino.codice): "8016", otto cifre
+ interne (da 10000000 a 99999999) ed il carattere di controllo.
+
+Invece di estrarre un numero casuale e verificare con una query se e' gia' usato, ripetendo ad
+ ogni collisione, i numeri vengono presi da una sequenza PostgreSQL (SEQUENZA, mai lo stesso
+ valore due volte, anche tra processi diversi) e trasformati nelle cifre interne con una
+ permutazione (permuta): i codici restano sparsi e non consecutivi, ma due valori della sequenza
+ non danno mai lo stesso codice. Un blocco di codici viene riservato con una sola query
+ (riserva_codici); i codici gia' assegnati prima della sequenza (casuali) vengono scartati con
+ una sola verifica per blocco.
+
+assegna_codici assegna i codici a molti tesserini con un solo UPDATE, in una transazione.
+"""
+from django.db import connection
+from django.db.models import Case, When, Value, CharField
+from django.db.transaction import atomic
+
+from base.utils import ean13_carattere_di_controllo
+from ufficio_soci.models import Tesserino
+
+SEQUENZA = 'ufficio_soci_tesserino_codice_seq'
+
+PREFISSO = "8016"
+MINIMO = 10000000
+NUMERI = 90000000  # Cifre interne possibili, da MINIMO a 99999999
+
+# Permutazione di Feistel su 28 bit (2^28 >= NUMERI), ripetuta finche' il risultato e' in [0, NUMERI)
+BIT_META = 14
+MASCHERA = (1 << BIT_META) - 1
+CHIAVI = (0x2a5f, 0x1c3b, 0x3e91, 0x0d67)
+
+
+def _giro(valore, chiave):
+    return (((valore ^ chiave) * 0x9e3779b1) >> 11) & MASCHERA
+
+
+def _feistel(numero):
+    sinistra, destra = numero >> BIT_META, numero & MASCHERA
+    for chiave in CHIAVI:
+        sinistra, destra = destra, sinistra ^ _giro(destra, chiave)
+    return (sinistra << BIT_META) | destra
+
+
+def permuta(numero):
+    """
+    :param numero: Un intero in [0, NUMERI).
+    :return: Un intero in [0, NUMERI), diverso per ogni numero diverso.
+    """
+    if not 0 <= numero < NUMERI:
+        raise ValueError("Numero fuori intervallo: %s" % (numero,))
+    numero = _feistel(numero)
+    while numero >= NUMERI:
+        numero = _feistel(numero)
+    return numero
+
+
+def codice(numero):
+    """
+    :param numero: Un valore della sequenza.
+    :return: Il codice EAN-13 corrispondente.
+    """
+    parziale = "%s%d" % (PREFISSO, MINIMO + permuta(numero % NUMERI))
+    return "%s%s" % (parziale, ean13_carattere_di_controllo(parziale))
+
+
+def riserva_codici(quantita):
+    """
+    Riserva dei codici nuovi, non assegnati ad alcun tesserino.
+    :param quantita: Quanti codici riservare.
+    :return: Lista di codici EAN-13.
+    """
+    codici = []
+    with connection.cursor() as cursor:
+        while len(codici) < quantita:
+            mancanti = quantita - len(codici)
+            cursor.execute("SELECT nextval(%s) - 1 FROM generate_series(1, %s)", [SEQUENZA, mancanti])
+            nuovi = [codice(riga[0]) for riga in cursor.fetchall()]
+            usati = set(Tesserino.objects.filter(codice__in=nuovi).values_list('codice', flat=True))
+            codici += [c for c in nuovi if c not in usati]
+    return codici
+
+
+def assegna_codici(tesserini):
+    """
+    Assegna un codice nuovo ai tesserini che ancora non lo hanno. I codici gia' assegnati
+     non vengono mai sovrascritti.
+    :param tesserini: QuerySet di Tesserino.
+    :return: Il numero di tesserini a cui e' stato assegnato un codice.
+    """
+    with atomic():
+        pks = list(tesserini.filter(Tesserino.query_senza_codice().q).select_for_update()
+                   .order_by('pk').values_list('pk', flat=True))
+        if not pks:
+            return 0
+        codici = riserva_codici(len(pks))
+        return Tesserino.objects.filter(pk__in=pks).update(
+            codice=Case(*[When(pk=pk, then=Value(c)) for pk, c in zip(pks, codici)], output_field=CharField())
+        )
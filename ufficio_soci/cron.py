@@ -0,0 +1,34 @@
+from django.conf import settings
+from django_cron import CronJobBase, Schedule
+
+from ufficio_soci.models import EsportazioneElenco, Tesseramento
+from ufficio_soci.stato_quote import ricostruisci_stato_quote
+
+
+class CronEsportazioniElenchi(CronJobBase):
+
+    RUN_EVERY_MINS = 1
+
+    schedule = Schedule(run_every_mins=RUN_EVERY_MINS)
+    code = 'ufficio_soci.esportazioni_elenchi'
+
+    def do(self):
+        EsportazioneElenco.segna_interrotte()
+        EsportazioneElenco.elabora_in_attesa()
+
+
+class CronStatoQuote(CronJobBase):
+    """
+    Ricalcola ogni notte lo stato delle quote dei tesseramenti aperti, per includere le modifiche
+     non intercettate (es. appartenenze terminate in blocco con un UPDATE).
+    """
+
+    RUN_AT_TIMES = ['03:30']
+
+    schedule = Schedule(run_at_times=RUN_AT_TIMES)
+    code = 'ufficio_soci.stato_quote'
+
+    def do(self):
+        if settings.QUOTE_STATO_PRECALCOLATO:
+            for anno in Tesseramento.objects.filter(stato=Tesseramento.APERTO).values_list('anno', flat=True):
+                ricostruisci_stato_quote(anno)
@@ -1,5 +1,7 @@
+from collections import namedtuple, OrderedDict
+
 from django.contrib.admin import ModelAdmin
-from django.db.models import Q, F
+from django.db.models import Q, F, Prefetch
 from django.utils.encoding import force_text
 
 from anagrafica.models import Persona, Appartenenza, Riserva, Sede, Fototessera, ProvvedimentoDisciplinare
@@ -13,11 +15,49 @@ from django.utils.timezone import now
 from ufficio_soci.models import Tesseramento, Quota, Tesserino
 
 
+def semplifica_nome_foglio(nome):
+    """
+    Accorcia il nome di una sede per usarlo come nome di un foglio Excel.
+    """
+    return nome\
+        .replace("/", "")\
+        .replace(": ", "-")\
+        .replace("Comitato ", "")\
+        .replace("Locale ", "")\
+        .replace("Provinciale ", "")\
+        .replace("Di ", "")\
+        .replace("di ", "")\
+        .replace("Della ", "")\
+        .replace("Dell'", "")\
+        .replace("Del ", "")
+
+
+class Colonna(namedtuple('Colonna', ('titolo', 'valore', 'prefetch', 'annotazioni'))):
+    """
+    Rappresenta una colonna di un elenco: il titolo, la funzione che calcola il valore per
+     una persona, e i dati che la funzione utilizza, da caricare insieme ai risultati
+     (vedi Elenco.annota), in modo da non eseguire query per ogni riga.
+
+    Per compatibilita', le colonne possono essere anche semplici tuple (titolo, valore).
+    """
+
+    def __new__(cls, titolo, valore, prefetch=(), annotazioni=None):
+        """
+        :param titolo: Il titolo della colonna.
+        :param valore: Funzione che, data la persona, ritorna il valore.
+        :param prefetch: Lookup (stringhe o Prefetch) da passare a prefetch_related.
+        :param annotazioni: Dizionario di annotazioni da passare ad annotate.
+        """
+        return super(Colonna, cls).__new__(cls, titolo, valore, tuple(prefetch), annotazioni or {})
+
+
 class Elenco:
     """
     Rappresenta un elenco semplice di persone.
     """
 
+    FOGLIO_DEFAULT = "Foglio 1"
+
     def __init__(self, *args, **kwargs):
         self.args = args
         self.kwargs = kwargs
@@ -58,6 +98,71 @@ class Elenco:
         """
         return "Foglio 1"
 
+    def prefetch(self):
+        """
+        Lookup da caricare insieme ai risultati, oltre a quelli delle colonne
+         (es. per excel_foglio o per il template dell'elenco).
+        :return: Tupla di lookup (stringhe o Prefetch).
+        """
+        return ()
+
+    def annota(self, qs):
+        """
+        Aggiunge ai risultati le annotazioni e i prefetch richiesti dalle colonne e da prefetch(),
+         in modo che il calcolo di tutte le colonne richieda un numero costante di query,
+         indipendentemente dal numero di righe.
+        :param qs: QuerySet<Persona>, es. self.ordina(self.risultati()).
+        :return: Il QuerySet annotato.
+        """
+        annotazioni = {}
+        prefetch = OrderedDict()
+        lookup = list(self.prefetch())
+        for colonna in self.excel_colonne():
+            if isinstance(colonna, Colonna):
+                annotazioni.update(colonna.annotazioni)
+                lookup += colonna.prefetch
+
+        for l in lookup:  # Lo stesso lookup puo' essere richiesto da piu' colonne
+            prefetch.setdefault(getattr(l, 'prefetch_to', l), l)
+
+        if annotazioni:
+            qs = qs.annotate(**annotazioni)
+        return qs.prefetch_related(*prefetch.values())
+
+    def excel_righe(self, fogli_multipli=True, dimensione_blocco=1000):
+        """
+        Genera le righe dell'esportazione Excel, senza caricare in memoria l'intero elenco.
+        I risultati vengono letti a blocchi: le relazioni indicate in prefetch_related
+         vengono quindi caricate con una query per blocco.
+        :param fogli_multipli: Se False, tutte le righe vanno nel foglio "Foglio 1", con la colonna "Elenco".
+        :param dimensione_blocco: Numero di persone lette per query.
+        :return: Generatore di tuple (nome foglio, colonne).
+        """
+        colonne = [x[1] for x in self.excel_colonne()]
+        persone = self.annota(self.ordina(self.risultati()))
+
+        inizio = 0
+        while True:
+            blocco = list(persone[inizio:inizio + dimensione_blocco])
+            for persona in blocco:
+                riga = [y if y is not None else "" for y in [x(persona) for x in colonne]]
+                if fogli_multipli:
+                    foglio = semplifica_nome_foglio(self.excel_foglio(persona))[:31]
+                else:
+                    foglio = self.FOGLIO_DEFAULT
+                    riga += [self.excel_foglio(persona)]
+                yield foglio, riga
+
+            if len(blocco) < dimensione_blocco:
+                break
+            inizio += dimensione_blocco
+
+    def excel_intestazione(self, fogli_multipli=True):
+        intestazione = [x[0] for x in self.excel_colonne()]
+        if not fogli_multipli:
+            intestazione += ["Elenco"]
+        return intestazione
+
     def template(self):
         return 'us_elenchi_inc_vuoto.html'
 
@@ -101,7 +206,8 @@ class ElencoVistaAnagrafica(ElencoVistaSemplice):
             ("Provincia di residenza", lambda p: p.provincia_residenza),
             ("Stato di residenza", lambda p: p.stato_residenza),
             ("Email", lambda p: p.email),
-            ("Numeri di telefono", lambda p: ", ".join([str(x) for x in p.numeri_telefono.all()])),
+            Colonna("Numeri di telefono", lambda p: ", ".join([str(x) for x in p.numeri_telefono.all()]),
+                    prefetch=('numeri_telefono',)),
         )
 
 
@@ -110,15 +216,42 @@ class ElencoVistaSoci(ElencoVistaAnagrafica):
     def template(self):
         return 'us_elenchi_inc_soci.html'
 
+    def al_giorno(self):
+        """
+        Il giorno al quale considerare le appartenenze attuali, se specificato nel modulo.
+        """
+        if self.modulo_riempito and 'al_giorno' in self.modulo_riempito.cleaned_data:
+            return self.modulo_riempito.cleaned_data['al_giorno']
+        return None
+
+    def prefetch(self):
+        # Appartenenze attuali con sede, per excel_foglio e la colonna "Sede" del template.
+        #  Ordinate per sede, per raggruppare le appartenenze alla stessa sede.
+        attuali = Appartenenza.objects.filter(
+            Appartenenza.query_attuale(al_giorno=self.al_giorno()).q
+        ).select_related('sede', 'sede__genitore').order_by('sede_id', '-inizio')
+        return super(ElencoVistaSoci, self).prefetch() + (
+            Prefetch('appartenenze', queryset=attuali, to_attr='appartenenze_attuali_elenco'),
+        )
+
     def excel_foglio(self, p):
-        if hasattr(p, 'appartenenza_sede'):
-            sede = Sede.objects.get(pk=p.appartenenza_sede)
+        attuali = getattr(p, 'appartenenze_attuali_elenco', None)
+        if attuali is None:  # Risultati non annotati
+            attuali = list(p.appartenenze_attuali(al_giorno=self.al_giorno()).order_by('sede_id', '-inizio'))
 
-        elif self.modulo_riempito and 'al_giorno' in self.modulo_riempito.cleaned_data \
-                and self.modulo_riempito.cleaned_data['al_giorno']:
-            sede = p.sede_riferimento(al_giorno=self.modulo_riempito.cleaned_data['al_giorno'])
-        else:
-            sede = p.sede_riferimento()
+        if hasattr(p, 'appartenenza_sede'):
+            sede = next((a.sede for a in attuali if a.sede_id == p.appartenenza_sede), None)
+            if sede is None:
+                # Appartenenza non attuale (es. quote di anni precedenti): le sedi sono poche
+                #  rispetto alle persone, evita una query per riga.
+                sedi = self.__dict__.setdefault('_sedi_excel', {})
+                if p.appartenenza_sede not in sedi:
+                    sedi[p.appartenenza_sede] = Sede.objects.get(pk=p.appartenenza_sede)
+                sede = sedi[p.appartenenza_sede]
+
+        else:  # Sede di riferimento (vedi Persona.sede_riferimento)
+            diretti = [a for a in attuali if a.membro in Appartenenza.MEMBRO_DIRETTO]
+            sede = max(diretti, key=lambda a: a.inizio).sede if diretti else None
 
         return sede.nome_completo if sede else 'Altro'
 
@@ -128,9 +261,19 @@ class ElencoVistaSoci(ElencoVistaAnagrafica):
             scelte = dict(Appartenenza._meta.get_field_by_name('membro')[0].flatchoices)
             return force_text(scelte[p.appartenenza_tipo], strings_only=True)
 
+        def _ingresso(p):
+            if hasattr(p, 'appartenenze_confermate'):
+                a = p.appartenenze_confermate[0] if p.appartenenze_confermate else None
+            else:
+                a = p.prima_appartenenza()
+            return a.inizio.date() if a else None
+
         return super(ElencoVistaSoci, self).excel_colonne() + (
             ("Giovane", lambda p: "Si" if p.giovane else "No"),
-            ("Ingresso in CRI", lambda p: p.ingresso().date()),
+            Colonna("Ingresso in CRI", _ingresso, prefetch=(
+                Prefetch('appartenenze', to_attr='appartenenze_confermate',
+                         queryset=Appartenenza.objects.filter(confermata=True).order_by('inizio')),
+            )),
             ("Tipo Attuale", lambda p: _tipo_socio(p) if p.appartenenza_tipo else "N/A"),
             ("A partire dal", lambda p: p.appartenenza_inizio.date() if p.appartenenza_inizio else "N/A")
         )
@@ -465,10 +608,23 @@ class ElencoQuote(ElencoVistaSoci):
 
     def excel_colonne(self):
         anno = self.modulo_riempito.cleaned_data['anno']
+
+        def _quote(p):
+            if hasattr(p, 'quote_elenco'):
+                return p.quote_elenco
+            return p.quote_anno(anno, stato=Quota.REGISTRATA).select_related('registrato_da')
+
+        quote = (
+            Prefetch('quote', to_attr='quote_elenco',
+                     queryset=Quota.objects.filter(anno=anno, stato=Quota.REGISTRATA).select_related('registrato_da')),
+        )
         return super(ElencoQuote, self).excel_colonne() + (
-            ("Importo quota", lambda p: ', '.join([testo_euro(q.importo_totale) for q in p.quote_anno(anno, stato=Quota.REGISTRATA)])),
-            ("Data versamento", lambda p: ', '.join([q.data_versamento.strftime('%d/%m/%y') for q in p.quote_anno(anno, stato=Quota.REGISTRATA)])),
-            ("Registrata da", lambda p: ', '.join([q.registrato_da.nome_completo for q in p.quote_anno(anno, stato=Quota.REGISTRATA)])),
+            Colonna("Importo quota", lambda p: ', '.join([testo_euro(q.importo_totale) for q in _quote(p)]),
+                    prefetch=quote),
+            Colonna("Data versamento", lambda p: ', '.join([q.data_versamento.strftime('%d/%m/%y') for q in _quote(p)]),
+                    prefetch=quote),
+            Colonna("Registrata da", lambda p: ', '.join([q.registrato_da.nome_completo for q in _quote(p)]),
+                    prefetch=quote),
         )
 
     def template(self):
@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from ufficio_soci.models import Tesseramento
+from ufficio_soci.stato_quote import ricostruisci_stato_quote
+
+
+class Command(BaseCommand):
+    help = 'Ricostruisce lo stato precalcolato delle quote associative, per anno di tesseramento'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--anno', type=int, action='append', dest='anni',
+                            help='Anno da ricostruire (ripetibile). Se omesso, tutti gli anni di tesseramento.')
+
+    def handle(self, *args, **options):
+        anni = options['anni'] or Tesseramento.objects.order_by('anno').values_list('anno', flat=True)
+        for anno in anni:
+            inizio = time.time()
+            numero = ricostruisci_stato_quote(anno)
+            print('Anno %d: %d righe in %.1fs' % (anno, numero, time.time() - inizio))
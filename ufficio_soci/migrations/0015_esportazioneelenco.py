@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.9.12 on 2017-03-01 10:12
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('anagrafica', '0049_indicepermesso'),
+        ('base', '0018_autorizzazione_automatica'),
+        ('ufficio_soci', '0014_auto_20170204_2021'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EsportazioneElenco',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('creazione', models.DateTimeField(db_index=True, default=django.utils.timezone.now)),
+                ('ultima_modifica', models.DateTimeField(auto_now=True, db_index=True)),
+                ('stato', models.CharField(choices=[('A', 'In attesa'), ('C', 'In corso'), ('F', 'Completata'), ('E', 'Errore')], db_index=True, default='A', max_length=1)),
+                ('elenco', models.BinaryField(help_text='Elenco (ufficio_soci.elenchi) serializzato con pickle.')),
+                ('modulo', models.BinaryField(help_text="Dati del modulo dell'elenco, serializzati con pickle.", null=True)),
+                ('foglio_singolo', models.BooleanField(default=False)),
+                ('righe', models.PositiveIntegerField(default=0)),
+                ('errore', models.CharField(blank=True, max_length=512, null=True)),
+                ('allegato', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='base.Allegato')),
+                ('richiedente', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='esportazioni_elenchi', to='anagrafica.Persona')),
+            ],
+            options={
+                'verbose_name': 'Esportazione elenco',
+                'verbose_name_plural': 'Esportazioni elenchi',
+            },
+        ),
+    ]
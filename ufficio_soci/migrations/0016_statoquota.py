@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.9.12 on 2017-07-12 10:15
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('anagrafica', '0052_esito_autorizzazioni'),
+        ('ufficio_soci', '0015_esportazioneelenco'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StatoQuota',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('anno', models.SmallIntegerField(db_index=True)),
+                ('membro', models.CharField(choices=[('VO', 'Volontario'), ('ES', 'Volontario in Estensione'), ('OR', 'Socio Ordinario'), ('SO', 'Sostenitore'), ('DI', 'Dipendente')], max_length=2)),
+                ('pagante', models.BooleanField(default=False)),
+                ('importo', models.FloatField(default=0.0)),
+                ('persona', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='stato_quote', to='anagrafica.Persona')),
+                ('quota', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='ufficio_soci.Quota')),
+                ('sede', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='stato_quote', to='anagrafica.Sede')),
+            ],
+            options={
+                'verbose_name': 'Stato quota associativa',
+                'verbose_name_plural': 'Stato quote associative',
+            },
+        ),
+        migrations.AlterUniqueTogether(
+            name='statoquota',
+            unique_together=set([('persona', 'anno', 'sede', 'membro')]),
+        ),
+        migrations.AlterIndexTogether(
+            name='statoquota',
+            index_together=set([('anno', 'pagante', 'membro'), ('anno', 'sede', 'pagante')]),
+        ),
+    ]
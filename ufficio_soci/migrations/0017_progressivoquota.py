@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.9.12 on 2017-07-12 10:15
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('anagrafica', '0052_esito_autorizzazioni'),
+        ('ufficio_soci', '0016_statoquota'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProgressivoQuota',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('anno', models.SmallIntegerField()),
+                ('ultimo', models.IntegerField(default=0)),
+                ('sede', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='progressivi_quote', to='anagrafica.Sede')),
+            ],
+            options={
+                'verbose_name': 'Progressivo ricevute',
+                'verbose_name_plural': 'Progressivi ricevute',
+            },
+        ),
+        migrations.AlterUniqueTogether(
+            name='progressivoquota',
+            unique_together=set([('sede', 'anno')]),
+        ),
+    ]
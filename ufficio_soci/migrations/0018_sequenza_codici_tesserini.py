@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.9.12 on 2017-07-12 10:15
+from __future__ import unicode_literals
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ufficio_soci', '0017_progressivoquota'),
+    ]
+
+    operations = [
+        # Sequenza dei codici dei tesserini (vedi ufficio_soci.codici_tesserini)
+        migrations.RunSQL(
+            "CREATE SEQUENCE ufficio_soci_tesserino_codice_seq",
+            reverse_sql="DROP SEQUENCE ufficio_soci_tesserino_codice_seq",
+        ),
+    ]
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.9.12 on 2017-07-12 10:15
+from __future__ import unicode_literals
+
+from datetime import date
+
+from django.db import migrations
+from django.db.models import Q
+
+# Copia di ufficio_soci.stato_quote al momento della migrazione: la tabella e' vuota,
+#  quindi basta un INSERT ... SELECT per anno.
+SQL_STATO = """
+    INSERT INTO {stato} (persona_id, anno, sede_id, membro, pagante, importo, quota_id)
+    SELECT a.persona_id, %s, a.sede_id, a.membro, q.persona_id IS NOT NULL, COALESCE(q.importo, 0), q.quota_id
+    FROM ({appartenenze}) a
+    LEFT OUTER JOIN (
+        SELECT persona_id, SUM(importo + importo_extra) AS importo, MAX(id) AS quota_id FROM {quota}
+        WHERE anno = %s AND tipo = 'Q' AND stato = 'R'
+        GROUP BY persona_id
+    ) q ON q.persona_id = a.persona_id
+"""
+
+
+def forward_func(apps, schema_editor):
+    # Popola lo stato delle quote di tutti gli anni di tesseramento: con QUOTE_STATO_PRECALCOLATO
+    #  attivo, paganti e non paganti vengono letti dalla tabella, che altrimenti sarebbe vuota.
+    Appartenenza = apps.get_model("anagrafica", "Appartenenza")
+    Quota = apps.get_model("ufficio_soci", "Quota")
+    StatoQuota = apps.get_model("ufficio_soci", "StatoQuota")
+    Tesseramento = apps.get_model("ufficio_soci", "Tesseramento")
+
+    StatoQuota.objects.all().delete()
+    with schema_editor.connection.cursor() as cursor:
+        for anno in Tesseramento.objects.values_list('anno', flat=True).order_by('anno'):
+            # Appartenenze da volontario od ordinario confermate ed attuali nell'anno
+            appartenenze = Appartenenza.objects.filter(
+                Q(fine__gte=date(anno, 1, 1)) | Q(fine__isnull=True),
+                inizio__lte=date(anno, 12, 31), confermata=True, membro__in=('VO', 'OR'),
+            ).order_by().values('persona_id', 'sede_id', 'membro').distinct()
+            sql, parametri = appartenenze.query.sql_with_params()
+            cursor.execute(
+                SQL_STATO.format(stato=StatoQuota._meta.db_table, quota=Quota._meta.db_table, appartenenze=sql),
+                [anno] + list(parametri) + [anno]
+            )
+
+
+def backward_func(apps, schema_editor):
+    StatoQuota = apps.get_model("ufficio_soci", "StatoQuota")
+    StatoQuota.objects.all().delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ufficio_soci', '0018_sequenza_codici_tesserini'),
+        ('anagrafica', '0053_periodo_vuoto'),
+    ]
+
+    operations = [
+        migrations.RunPython(forward_func, backward_func)
+    ]
@@ -1,22 +1,27 @@
-import random
+import logging
+import pickle
 from datetime import timezone, date, timedelta
 from django.utils import timezone as timezone_django
 
 import barcode
 from barcode.writer import ImageWriter
-from django.db import models
-from django.db.models import Q, Max
+from django.conf import settings
+from django.db import models, IntegrityError
+from django.db.models import Q, Count, Case, When, Sum
+from django.db.transaction import atomic
 from django.utils.translation import ugettext_lazy as _
 
 from anagrafica.models import Persona, Appartenenza, Sede
-from base.files import PDF, EAN13
-from base.models import ModelloSemplice, ConAutorizzazioni, ConVecchioID
+from base.files import PDF, EAN13, Excel
+from base.models import ModelloSemplice, ConAutorizzazioni, ConVecchioID, Allegato
 from base.tratti import ConMarcaTemporale, ConPDF
-from base.utils import concept, UpperCaseCharField, ean13_carattere_di_controllo, questo_anno, oggi
+from base.utils import concept, UpperCaseCharField, questo_anno, oggi
 from posta.models import Messaggio
 
 __author__ = 'alfioemanuele'
 
+logger = logging.getLogger('ufficio_soci')
+
 
 class Tesserino(ModelloSemplice, ConMarcaTemporale, ConPDF):
 
@@ -101,17 +106,10 @@ class Tesserino(ModelloSemplice, ConMarcaTemporale, ConPDF):
     @classmethod
     def _genera_nuovo_codice(cls):
         """
-        Ottiene un codice vergine.
+        Ottiene un codice vergine (vedi ufficio_soci.codici_tesserini).
         """
-        while True:
-            # Genera un codice casuale
-            interno = str(random.randint(10000000, 99999999))
-            codice = "8016%s" % (interno,)
-            codice = "%s%s" % (
-                codice, ean13_carattere_di_controllo(codice),
-            )
-            if not cls.objects.filter(codice=codice).exists():
-                return codice
+        from ufficio_soci.codici_tesserini import riserva_codici
+        return riserva_codici(1)[0]
 
     def genera_codice_a_barre_png(self):
         codice = EAN13(oggetto=self)
@@ -130,21 +128,43 @@ class Tesserino(ModelloSemplice, ConMarcaTemporale, ConPDF):
         self.codice = Tesserino._genera_nuovo_codice()
         self.save()
 
-    def genera_pdf(self):
-        codice = self.genera_codice_a_barre_png()
+    def _documento_pdf(self):
+        # Immagine inclusa nell'HTML: lo stesso tesserino produce sempre lo stesso HTML (vedi base.pdf)
+        codice = EAN13.data_uri(self.codice)
         sede = self.persona.sede_riferimento(al_giorno=self.creazione).comitato
-        pdf = PDF(oggetto=self)
-        pdf.genera_e_salva(
-            "Tesserino_%s.pdf" % self.codice,
-            modello='pdf_tesserino.html',
-            corpo={
+        return {
+            "modello": 'pdf_tesserino.html',
+            "corpo": {
                 "tesserino": self,
                 "persona": self.persona,
                 "sede": sede,
                 "codice": codice,
             },
-            formato=PDF.FORMATO_CR80,
-            orientamento=PDF.ORIENTAMENTO_ORIZZONTALE,
+            "formato": PDF.FORMATO_CR80,
+            "orientamento": PDF.ORIENTAMENTO_ORIZZONTALE,
+        }
+
+    def genera_pdf(self):
+        pdf = PDF(oggetto=self)
+        pdf.genera_e_salva(
+            "Tesserino_%s.pdf" % self.codice,
+            posizione="tesserini/",
+            **self._documento_pdf()
+        )
+        return pdf
+
+    @classmethod
+    def genera_pdf_unico(cls, tesserini, oggetto):
+        """
+        Genera i tesserini in parallelo in un solo PDF, un tesserino per pagina, per la stampa in blocco.
+        :param tesserini: I tesserini, nell'ordine di stampa.
+        :param oggetto: L'oggetto a cui allegare il PDF (es. la persona che lo scarica).
+        :return: L'allegato PDF.
+        """
+        pdf = PDF(oggetto=oggetto)
+        pdf.genera_e_salva_unico(
+            [tesserino._documento_pdf() for tesserino in tesserini],
+            nome="Tesserini.pdf",
             posizione="tesserini/",
         )
         return pdf
@@ -312,6 +332,18 @@ class Tesseramento(ModelloSemplice, ConMarcaTemporale):
                     appartenenze__membro=Appartenenza.VOLONTARIO,
                 )
 
+    @staticmethod
+    def _membri(attivi=True, ordinari=True):
+        membri = []
+        if attivi:
+            membri += [Appartenenza.VOLONTARIO]
+        if ordinari:
+            membri += [Appartenenza.ORDINARIO]
+        return membri
+
+    def _stato_quote(self, attivi=True, ordinari=True, **kwargs):
+        return StatoQuota.objects.filter(anno=self.anno, membro__in=self._membri(attivi, ordinari), **kwargs)
+
     def paganti(self, attivi=True, ordinari=True):
         """
         Ritorna un elenco di persone che hanno pagato la quota associativa
@@ -321,10 +353,13 @@ class Tesseramento(ModelloSemplice, ConMarcaTemporale):
         if (not attivi) and (not ordinari):
             return Persona.objects.none()
 
-        a = Q()
+        if settings.QUOTE_STATO_PRECALCOLATO:
+            return Persona.objects.filter(
+                pk__in=self._stato_quote(attivi, ordinari, pagante=True).values('persona_id')
+            )
 
         if attivi and ordinari:
-            q = self._q_ordinari(solo_paganti=True) | self._q_volontari(solo_paganti=True)
+            a = self._q_ordinari(solo_paganti=True) | self._q_volontari(solo_paganti=True)
 
         elif attivi:
             a = self._q_volontari(solo_paganti=True)
@@ -344,19 +379,49 @@ class Tesseramento(ModelloSemplice, ConMarcaTemporale):
          per il tesseramento in essere MA non sono paganti (non hanno gia' pagato).
         :return: QuerySet<Persona>
         """
-        l = []
-        if attivi:
-            l += [Appartenenza.VOLONTARIO]
-        if ordinari:
-            l += [Appartenenza.ORDINARIO]
+        if settings.QUOTE_STATO_PRECALCOLATO:
+            return Persona.objects.filter(
+                pk__in=self._stato_quote(attivi, ordinari, pagante=False,
+                                         sede__tipo=Sede.COMITATO).values('persona_id')
+            )
+
+        l = self._membri(attivi, ordinari)
         return self.passibili_pagamento(membri=l).exclude(pk__in=self.paganti(attivi=attivi, ordinari=ordinari))
 
     def non_pagante(self, persona, **kwargs):
+        if settings.QUOTE_STATO_PRECALCOLATO:
+            return self._stato_quote(pagante=False, sede__tipo=Sede.COMITATO, persona=persona, **kwargs).exists()
         return self.non_paganti(**kwargs).filter(pk=persona.pk).exists()
 
     def pagante(self, persona, **kwargs):
+        if settings.QUOTE_STATO_PRECALCOLATO:
+            return self._stato_quote(pagante=True, persona=persona, **kwargs).exists()
         return self.paganti(**kwargs).filter(pk=persona.pk).exists()
 
+    def totali_per_sede(self, sedi, attivi=True, ordinari=True):
+        """
+        Conta paganti e non paganti del tesseramento per ogni sede, dallo stato precalcolato delle quote.
+        :param sedi: Le sedi (QuerySet o elenco di Sede o pk).
+        :return: Dizionario {sede_id: {'paganti': .., 'non_paganti': .., 'importo': ..}}.
+        """
+        righe = self._stato_quote(attivi, ordinari, sede__in=sedi).order_by().values('sede_id').annotate(
+            paganti=Count(Case(When(pagante=True, then='persona_id')), distinct=True),
+            non_paganti=Count(Case(When(pagante=False, then='persona_id')), distinct=True),
+            importo=Sum(Case(When(pagante=True, then='importo'), default=0.0, output_field=models.FloatField())),
+        )
+        return {
+            riga['sede_id']: {'paganti': riga['paganti'], 'non_paganti': riga['non_paganti'],
+                              'importo': riga['importo'] or 0.0}
+            for riga in righe
+        }
+
+    def save(self, *args, **kwargs):
+        nuovo = self.pk is None
+        super(Tesseramento, self).save(*args, **kwargs)
+        if nuovo and settings.QUOTE_STATO_PRECALCOLATO:
+            from ufficio_soci.stato_quote import ricostruisci_stato_quote
+            ricostruisci_stato_quote(self.anno)
+
     @classmethod
     def anni_scelta(cls):
         return ((y, y) for y in [x['anno'] for x in cls.objects.all().values("anno")])
@@ -424,6 +489,17 @@ class Quota(ModelloSemplice, ConMarcaTemporale, ConVecchioID, ConPDF):
             ("view_quota", "Can view quota"),
         )
 
+    def save(self, *args, **kwargs):
+        from ufficio_soci.stato_quote import aggiorna_stato_persona
+        super(Quota, self).save(*args, **kwargs)
+        aggiorna_stato_persona(self.persona_id, anni=[self.anno])
+
+    def delete(self, *args, **kwargs):
+        from ufficio_soci.stato_quote import aggiorna_stato_persona
+        risultato = super(Quota, self).delete(*args, **kwargs)
+        aggiorna_stato_persona(self.persona_id, anni=[self.anno])
+        return risultato
+
     def tesseramento(self):
         """
         Ottiene l'oggetto tesseramento correlato.
@@ -467,8 +543,25 @@ class Quota(ModelloSemplice, ConMarcaTemporale, ConVecchioID, ConPDF):
             q.causale_extra = "Donazione"
 
         q.anno = data_versamento.year
-        q.progressivo = q._genera_progessivo()
-        q.save()
+        genera_progressivo = q.progressivo is None
+
+        def _salva():
+            # Prenotazione e salvataggio nella stessa transazione: se il salvataggio fallisce,
+            #  il progressivo prenotato non viene consumato
+            with atomic():
+                if genera_progressivo:
+                    q.progressivo = q._genera_progessivo()
+                q.save()
+
+        try:
+            _salva()
+        except IntegrityError as e:
+            # Progressivo gia' usato da una quota registrata senza il contatore: riallinea e riprova
+            from ufficio_soci.progressivi import allinea_progressivo, violato_progressivo_unico
+            if not genera_progressivo or not violato_progressivo_unico(e):
+                raise
+            allinea_progressivo(q.sede, q.anno)
+            _salva()
 
         if invia_notifica:
             q._invia_notifica_registrazione()
@@ -483,12 +576,8 @@ class Quota(ModelloSemplice, ConMarcaTemporale, ConVecchioID, ConPDF):
         )
 
     def _genera_progessivo(self):
-        anno = self.anno
-        sede = self.sede
-
-        prec = Quota.per_sede(sede).filter(anno=anno) \
-                    .aggregate(max=Max('progressivo'))['max'] or 0
-        return prec + 1
+        from ufficio_soci.progressivi import prenota_progressivi
+        return prenota_progressivi(self.sede, self.anno)[0]
 
     @property
     def importo_totale(self):
@@ -534,3 +623,170 @@ class Quota(ModelloSemplice, ConMarcaTemporale, ConVecchioID, ConPDF):
             mittente=self.registrato_da,
             destinatari=[self.persona],
         )
+
+
+class EsportazioneElenco(ModelloSemplice, ConMarcaTemporale):
+    """
+    Rappresenta la richiesta di esportazione in Excel di un elenco (vedi ufficio_soci.elenchi).
+    Le esportazioni vengono generate in background (vedi ufficio_soci.cron), mentre
+     l'utente attende la pagina di scaricamento.
+    """
+
+    class Meta:
+        verbose_name = "Esportazione elenco"
+        verbose_name_plural = "Esportazioni elenchi"
+
+    IN_ATTESA = "A"
+    IN_CORSO = "C"
+    COMPLETATA = "F"
+    ERRORE = "E"
+    STATO = (
+        (IN_ATTESA, "In attesa"),
+        (IN_CORSO, "In corso"),
+        (COMPLETATA, "Completata"),
+        (ERRORE, "Errore"),
+    )
+    stato = models.CharField(max_length=1, choices=STATO, default=IN_ATTESA, db_index=True)
+
+    richiedente = models.ForeignKey('anagrafica.Persona', related_name='esportazioni_elenchi', on_delete=models.CASCADE)
+    elenco = models.BinaryField(help_text="Elenco (ufficio_soci.elenchi) serializzato con pickle.")
+    modulo = models.BinaryField(null=True, help_text="Dati del modulo dell'elenco, serializzati con pickle.")
+    foglio_singolo = models.BooleanField(default=False)
+
+    righe = models.PositiveIntegerField(default=0)
+    allegato = models.ForeignKey(Allegato, null=True, blank=True, on_delete=models.SET_NULL)
+    errore = models.CharField(max_length=512, blank=True, null=True)
+
+    DIMENSIONE_BLOCCO = 1000
+
+    @classmethod
+    def nuova(cls, richiedente, elenco, dati_modulo=None, foglio_singolo=False):
+        """
+        Crea una nuova esportazione in attesa.
+        :param richiedente: La persona che ha richiesto l'esportazione, a cui verra' allegato il file.
+        :param elenco: L'oggetto Elenco, senza modulo riempito.
+        :param dati_modulo: I dati del modulo dell'elenco (es. request.POST), se richiesto.
+        :param foglio_singolo: Esporta tutte le persone in un unico foglio.
+        :return: EsportazioneElenco.
+        """
+        return cls.objects.create(
+            richiedente=richiedente,
+            elenco=pickle.dumps(elenco),
+            modulo=pickle.dumps(dati_modulo) if dati_modulo is not None else None,
+            foglio_singolo=foglio_singolo,
+        )
+
+    @property
+    def terminata(self):
+        return self.stato in (self.COMPLETATA, self.ERRORE)
+
+    def _elenco_da_esportare(self):
+        elenco = pickle.loads(bytes(self.elenco))
+        if elenco.modulo():
+            modulo = elenco.modulo()(pickle.loads(bytes(self.modulo)) if self.modulo else None)
+            if not modulo.is_valid():
+                raise ValueError("Modulo dell'elenco non valido.")
+            elenco.modulo_riempito = modulo
+        return elenco
+
+    def esporta(self):
+        """
+        Genera il file Excel e lo allega al richiedente. Le righe vengono lette a blocchi
+         e scritte direttamente su file, per cui la memoria utilizzata non dipende
+         dalla dimensione dell'elenco.
+        :return: L'allegato Excel.
+        """
+        elenco = self._elenco_da_esportare()
+        fogli_multipli = not self.foglio_singolo
+
+        excel = Excel(oggetto=self.richiedente)
+        self.righe = excel.genera_e_salva_streaming(
+            elenco.excel_intestazione(fogli_multipli=fogli_multipli),
+            elenco.excel_righe(fogli_multipli=fogli_multipli, dimensione_blocco=self.DIMENSIONE_BLOCCO),
+            nome="Elenco.xlsx",
+        )
+        self.allegato = excel
+        self.stato = self.COMPLETATA
+        self.save()
+        return excel
+
+    @classmethod
+    def elabora_in_attesa(cls):
+        """
+        Genera tutte le esportazioni in attesa. Piu' processi possono essere eseguiti
+         contemporaneamente: ogni esportazione viene presa in carico da uno solo.
+        :return: Il numero di esportazioni elaborate.
+        """
+        elaborate = 0
+        for pk in cls.objects.filter(stato=cls.IN_ATTESA).order_by('creazione').values_list('pk', flat=True):
+            if not cls.objects.filter(pk=pk, stato=cls.IN_ATTESA).update(stato=cls.IN_CORSO,
+                                                                        ultima_modifica=timezone_django.now()):
+                continue  # Presa in carico da un altro processo
+
+            esportazione = cls.objects.get(pk=pk)
+            try:
+                esportazione.esporta()
+            except Exception as e:
+                logger.exception("Esportazione elenco %d fallita" % (pk,))
+                cls.objects.filter(pk=pk).update(stato=cls.ERRORE, errore=str(e)[:512])
+            elaborate += 1
+        return elaborate
+
+    @classmethod
+    def segna_interrotte(cls):
+        """
+        Segna come fallite le esportazioni in corso da piu' di settings.ESPORTAZIONI_DURATA_MASSIMA
+         minuti: il processo che le elaborava e' stato terminato, e resterebbero in corso per sempre.
+        :return: Il numero di esportazioni segnate come fallite.
+        """
+        limite = timezone_django.now() - timedelta(minutes=settings.ESPORTAZIONI_DURATA_MASSIMA)
+        return cls.objects.filter(stato=cls.IN_CORSO, ultima_modifica__lt=limite).update(
+            stato=cls.ERRORE, errore="Esportazione interrotta.", ultima_modifica=timezone_django.now(),
+        )
+
+
+class StatoQuota(ModelloSemplice):
+    """
+    Stato della quota associativa di un socio in un anno, per ogni sua appartenenza da socio
+     (volontario od ordinario) nell'anno: se ha pagato la quota socio, l'importo totale versato
+     e l'ultima quota registrata (vedi ufficio_soci.stato_quote e Tesseramento.paganti).
+    """
+
+    class Meta:
+        verbose_name = "Stato quota associativa"
+        verbose_name_plural = "Stato quote associative"
+        unique_together = ('persona', 'anno', 'sede', 'membro',)
+        index_together = [
+            ('anno', 'pagante', 'membro'),
+            ('anno', 'sede', 'pagante'),
+        ]
+
+    persona = models.ForeignKey('anagrafica.Persona', related_name='stato_quote', on_delete=models.CASCADE)
+    anno = models.SmallIntegerField(db_index=True)
+    sede = models.ForeignKey('anagrafica.Sede', related_name='stato_quote', on_delete=models.CASCADE)
+    membro = models.CharField(max_length=2, choices=Appartenenza.MEMBRO)
+    pagante = models.BooleanField(default=False)
+    importo = models.FloatField(default=0.0)
+    quota = models.ForeignKey(Quota, null=True, blank=True, related_name='+', on_delete=models.SET_NULL)
+
+    def __str__(self):
+        return "Quota %d di %s presso %s: %s" % (self.anno, self.persona_id, self.sede_id,
+                                                 "pagata" if self.pagante else "non pagata")
+
+
+class ProgressivoQuota(ModelloSemplice):
+    """
+    Ultimo progressivo delle ricevute assegnato per un comitato ed un anno (vedi ufficio_soci.progressivi).
+    """
+
+    class Meta:
+        verbose_name = "Progressivo ricevute"
+        verbose_name_plural = "Progressivi ricevute"
+        unique_together = ('sede', 'anno',)
+
+    sede = models.ForeignKey('anagrafica.Sede', related_name='progressivi_quote', on_delete=models.CASCADE)
+    anno = models.SmallIntegerField()
+    ultimo = models.IntegerField(default=0)
+
+    def __str__(self):
+        return "Progressivo %d di %s: %d" % (self.anno, self.sede_id, self.ultimo)
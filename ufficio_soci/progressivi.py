@@ -0,0 +1,109 @@
+"""
+Questo modulo assegna i progressivi delle ricevute (Quota.progressivo), unici per comitato ed anno.
+
+Invece di calcolare MAX(progressivo) + 1 sulle quote del comitato ad ogni registrazione (una
+ lettura sempre piu' lunga, che puo' dare lo stesso numero a due registrazioni contemporanee),
+ l'ultimo progressivo assegnato e' salvato in ProgressivoQuota ed incrementato con un solo
+ UPDATE ... RETURNING: il blocco sulla riga dura quanto la transazione che lo esegue (fuori da
+ una transazione, solo l'UPDATE), quindi registrazioni contemporanee ricevono numeri diversi
+ senza attendersi a vicenda.
+
+La riga di un comitato e di un anno viene creata al primo utilizzo, partendo dal progressivo
+ massimo delle quote gia' registrate. Se un altro processo la crea nello stesso momento, l'INSERT
+ fallisce (in un savepoint) e viene ripetuto l'UPDATE: ON CONFLICT richiede PostgreSQL 9.5.
+prenota_progressivi puo' riservare piu' numeri consecutivi in una volta, per le registrazioni
+ in blocco (vedi Quota.nuova, parametro progressivo).
+"""
+from django.db import connection, IntegrityError
+from django.db.transaction import atomic
+
+from ufficio_soci.models import ProgressivoQuota, Quota
+
+SQL_INCREMENTA = """
+    UPDATE {progressivo} SET ultimo = ultimo + %s WHERE sede_id = %s AND anno = %s RETURNING ultimo
+"""
+
+SQL_CREA = """
+    INSERT INTO {progressivo} (sede_id, anno, ultimo)
+    SELECT %s, %s, COALESCE(MAX(progressivo), 0) + %s FROM {quota} WHERE sede_id = %s AND anno = %s
+    RETURNING ultimo
+"""
+
+SQL_ALLINEA = """
+    UPDATE {progressivo} SET ultimo = GREATEST(ultimo, (
+        SELECT COALESCE(MAX(progressivo), 0) FROM {quota} WHERE sede_id = %s AND anno = %s
+    ))
+    WHERE sede_id = %s AND anno = %s
+"""
+
+SQL_CREA_ALLINEATO = """
+    INSERT INTO {progressivo} (sede_id, anno, ultimo)
+    SELECT %s, %s, COALESCE(MAX(progressivo), 0) FROM {quota} WHERE sede_id = %s AND anno = %s
+"""
+
+
+def _tabelle():
+    return {'progressivo': ProgressivoQuota._meta.db_table, 'quota': Quota._meta.db_table}
+
+
+def prenota_progressivi(sede, anno, quantita=1):
+    """
+    Riserva i prossimi progressivi delle ricevute di un comitato.
+    :param sede: La sede (viene usato il suo comitato).
+    :param anno: L'anno delle ricevute.
+    :param quantita: Quanti progressivi riservare.
+    :return: range dei progressivi riservati.
+    """
+    if quantita < 1:
+        raise ValueError("Numero di progressivi non valido: %s" % (quantita,))
+
+    sede_id = sede.comitato.pk
+    incrementa = SQL_INCREMENTA.format(**_tabelle())
+    with connection.cursor() as cursor:
+        cursor.execute(incrementa, [quantita, sede_id, anno])
+        riga = cursor.fetchone()
+        if riga is None:  # Primo progressivo del comitato nell'anno
+            try:
+                with atomic():
+                    cursor.execute(SQL_CREA.format(**_tabelle()), [sede_id, anno, quantita, sede_id, anno])
+                    riga = cursor.fetchone()
+            except IntegrityError:  # Creata nel frattempo da un altro processo
+                cursor.execute(incrementa, [quantita, sede_id, anno])
+                riga = cursor.fetchone()
+    ultimo = riga[0]
+    return range(ultimo - quantita + 1, ultimo + 1)
+
+
+def allinea_progressivo(sede, anno):
+    """
+    Porta l'ultimo progressivo di un comitato almeno al massimo delle quote registrate (es. dopo
+     un'importazione di quote che non ha usato il contatore).
+    :param sede: La sede (viene usato il suo comitato).
+    :param anno: L'anno delle ricevute.
+    """
+    sede_id = sede.comitato.pk
+    allinea = SQL_ALLINEA.format(**_tabelle())
+    with connection.cursor() as cursor:
+        cursor.execute(allinea, [sede_id, anno, sede_id, anno])
+        if cursor.rowcount:
+            return
+        try:
+            with atomic():
+                cursor.execute(SQL_CREA_ALLINEATO.format(**_tabelle()), [sede_id, anno, sede_id, anno])
+        except IntegrityError:  # Creata nel frattempo da un altro processo
+            cursor.execute(allinea, [sede_id, anno, sede_id, anno])
+
+
+def violato_progressivo_unico(errore):
+    """
+    Verifica se un IntegrityError nel salvataggio di una quota e' dovuto al vincolo di unicita'
+     di (progressivo, anno, sede), e non ad un altro vincolo.
+    :param errore: L'IntegrityError.
+    :return: True se il vincolo violato e' quello del progressivo.
+    """
+    nome = getattr(getattr(errore.__cause__, 'diag', None), 'constraint_name', None)
+    if not nome:
+        return False
+    with connection.cursor() as cursor:
+        vincolo = connection.introspection.get_constraints(cursor, Quota._meta.db_table).get(nome)
+    return bool(vincolo and vincolo['unique'] and set(vincolo['columns']) == {'progressivo', 'anno', 'sede_id'})
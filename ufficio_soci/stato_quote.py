@@ -0,0 +1,156 @@
+"""
+Questo modulo precalcola lo stato delle quote associative (vedi Tesseramento.paganti e
+ Tesseramento.non_paganti) nella tabella StatoQuota: per ogni anno di tesseramento, una riga per
+ ogni appartenenza da socio (volontario od ordinario) attuale nell'anno, con l'indicazione se la
+ persona ha una quota socio registrata nell'anno, l'importo totale e l'ultima quota.
+
+Il calcolo di un anno sono tre istruzioni sulla stessa SELECT: DELETE delle righe non piu' valide,
+ UPDATE delle righe esistenti e INSERT ... WHERE NOT EXISTS delle nuove (ON CONFLICT richiede
+ PostgreSQL 9.5). Elenchi di paganti e non paganti, totali per sede e verifiche sulla singola
+ persona diventano ricerche sugli indici della tabella.
+
+NOTA BENE: una persona e' pagante per l'anno se ha una quota socio registrata *in quell'anno*.
+ Il filtro originale (_q_pagante piu' quote__anno) usava due join separati sulle quote, e
+ considerava pagante anche chi aveva una quota socio registrata in un altro anno ed una quota
+ registrata di qualsiasi tipo (es. una ricevuta) nell'anno.
+
+La tabella viene aggiornata:
+ - per la persona e l'anno, quando una sua quota viene salvata (Quota.nuova, Quota.annulla)
+   o cancellata;
+ - per la persona e gli anni con tesseramento aperto a partire dall'inizio, quando una sua
+   appartenenza viene salvata o cancellata;
+ - per le persone importate e gli anni con tesseramento aperto, da anagrafica.importa;
+ - per l'anno, quando viene creato un tesseramento;
+ - per gli anni con tesseramento aperto, ogni notte da ufficio_soci.cron.CronStatoQuote.
+Gli anni chiusi si ricalcolano con il comando ricostruisci_stato_quote.
+"""
+from django.conf import settings
+from django.db import connection, IntegrityError
+from django.db.transaction import atomic
+
+from anagrafica.models import Appartenenza
+from ufficio_soci.models import Quota, StatoQuota, Tesseramento
+
+SQL_SORGENTE = """
+    SELECT a.persona_id, a.sede_id, a.membro, q.persona_id IS NOT NULL AS pagante,
+           COALESCE(q.importo, 0) AS importo, q.quota_id
+    FROM ({appartenenze}) a
+    LEFT OUTER JOIN (
+        SELECT persona_id, SUM(importo + importo_extra) AS importo, MAX(id) AS quota_id FROM {quota}
+        WHERE anno = %s AND tipo = %s AND stato = %s {filtro}
+        GROUP BY persona_id
+    ) q ON q.persona_id = a.persona_id
+"""
+
+SQL_RIMUOVI = """
+    DELETE FROM {stato} s
+    WHERE s.anno = %s {filtro}
+    AND NOT EXISTS (
+        SELECT 1 FROM ({appartenenze}) a
+        WHERE a.persona_id = s.persona_id AND a.sede_id = s.sede_id AND a.membro = s.membro
+    )
+"""
+
+SQL_AGGIORNA = """
+    UPDATE {stato} s SET pagante = n.pagante, importo = n.importo, quota_id = n.quota_id
+    FROM ({sorgente}) n
+    WHERE s.anno = %s AND s.persona_id = n.persona_id AND s.sede_id = n.sede_id AND s.membro = n.membro
+"""
+
+SQL_INSERISCI = """
+    INSERT INTO {stato} (persona_id, anno, sede_id, membro, pagante, importo, quota_id)
+    SELECT n.persona_id, %s, n.sede_id, n.membro, n.pagante, n.importo, n.quota_id
+    FROM ({sorgente}) n
+    WHERE NOT EXISTS (
+        SELECT 1 FROM {stato} s
+        WHERE s.anno = %s AND s.persona_id = n.persona_id AND s.sede_id = n.sede_id AND s.membro = n.membro
+    )
+"""
+
+
+def ricostruisci_stato_quote(anno, persone=None):
+    """
+    Ricalcola lo stato delle quote di un anno, aggiornando le righe salvate.
+    :param anno: L'anno di tesseramento.
+    :param persone: Se specificato, solo le persone con questi pk. Altrimenti tutte.
+    :return: Il numero di righe scritte.
+    """
+    appartenenze = Appartenenza.objects.filter(
+        Appartenenza.query_attuale_in_anno(anno),
+        membro__in=Appartenenza.MEMBRO_SOCIO,
+    )
+    filtro_quote, filtro_stato, parametri_filtro = "", "", []
+    if persone is not None:
+        persone = list(persone)
+        if not persone:
+            return 0
+        appartenenze = appartenenze.filter(persona_id__in=persone)
+        filtro_quote, filtro_stato = "AND persona_id = ANY(%s)", "AND s.persona_id = ANY(%s)"
+        parametri_filtro = [persone]
+
+    sql_appartenenze, parametri_appartenenze = appartenenze.order_by().values(
+        'persona_id', 'sede_id', 'membro'
+    ).distinct().query.sql_with_params()
+    parametri_appartenenze = list(parametri_appartenenze)
+    tabelle = {'stato': StatoQuota._meta.db_table, 'appartenenze': sql_appartenenze}
+    sorgente = SQL_SORGENTE.format(quota=Quota._meta.db_table, filtro=filtro_quote, **tabelle)
+    parametri_sorgente = parametri_appartenenze + [anno, Quota.QUOTA_SOCIO, Quota.REGISTRATA] + parametri_filtro
+
+    istruzioni = (
+        (SQL_RIMUOVI.format(filtro=filtro_stato, **tabelle), [anno] + parametri_filtro + parametri_appartenenze),
+        (SQL_AGGIORNA.format(sorgente=sorgente, **tabelle), parametri_sorgente + [anno]),
+        (SQL_INSERISCI.format(sorgente=sorgente, **tabelle), [anno] + parametri_sorgente + [anno]),
+    )
+
+    # Un aggiornamento concorrente della stessa persona puo' inserire la stessa riga tra
+    #  l'UPDATE e l'INSERT: il savepoint viene annullato ed il calcolo ripetuto una volta.
+    for tentativo in range(2):
+        try:
+            with atomic(), connection.cursor() as cursor:
+                scritte = 0
+                for sql, parametri in istruzioni:
+                    cursor.execute(sql, parametri)
+                    scritte += cursor.rowcount
+                return scritte
+        except IntegrityError:
+            if tentativo:
+                raise
+
+
+def anni_aperti(dal_anno=None):
+    """
+    Gli anni dei tesseramenti aperti.
+    :param dal_anno: Se specificato, solo gli anni da questo in poi.
+    :return: Lista di anni.
+    """
+    tesseramenti = Tesseramento.objects.filter(stato=Tesseramento.APERTO)
+    if dal_anno is not None:
+        tesseramenti = tesseramenti.filter(anno__gte=dal_anno)
+    return list(tesseramenti.values_list('anno', flat=True))
+
+
+def aggiorna_stato_persone(persone, anni=None):
+    """
+    Ricalcola lo stato delle quote di piu' persone, insieme per ogni anno.
+     Non fa nulla se QUOTE_STATO_PRECALCOLATO non e' attivo.
+    :param persone: Lista di pk delle persone.
+    :param anni: Se specificato, solo questi anni. Altrimenti tutti gli anni di tesseramento.
+    :return: Il numero di righe scritte.
+    """
+    if not settings.QUOTE_STATO_PRECALCOLATO:
+        return 0
+    if anni is None:
+        anni = Tesseramento.objects.values_list('anno', flat=True)
+    return sum(ricostruisci_stato_quote(anno, persone=persone) for anno in anni)
+
+
+def aggiorna_stato_persona(persona_id, anni=None):
+    """
+    Ricalcola lo stato delle quote di una persona. Non fa nulla se QUOTE_STATO_PRECALCOLATO non e' attivo.
+    :param persona_id: L'ID della persona.
+    :param anni: Se specificato, solo questi anni. Altrimenti tutti gli anni di tesseramento.
+    :return: Il numero di righe scritte.
+    """
+    if persona_id is None:
+        return 0
+    return aggiorna_stato_persone([persona_id], anni=anni)
@@ -2,16 +2,19 @@ import datetime
 from time import sleep
 from unittest import skip
 import tempfile
+import zipfile
 
 import django.core.files
 from django.core import mail
 from django.core.urlresolvers import reverse
-from django.test import TestCase
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 from freezegun import freeze_time
 
 from anagrafica.models import Appartenenza, Sede, Persona, Fototessera, Dimissione, ProvvedimentoDisciplinare, \
-    Estensione, Trasferimento
+    Estensione, Trasferimento, Telefono
 from anagrafica.costanti import NAZIONALE, PROVINCIALE, REGIONALE, LOCALE
 from anagrafica.permessi.applicazioni import UFFICIO_SOCI
 from anagrafica.permessi.costanti import MODIFICA
@@ -19,13 +22,18 @@ from attivita.models import Area, Partecipazione, Turno
 from attivita.models import Attivita
 from autenticazione.utils_test import TestFunzionale
 from base.geo import Locazione
-from base.utils import poco_fa
+from base.pdf import MotoreFinto
+from base.utils import poco_fa, ean13_carattere_di_controllo
 from base.utils_tests import crea_persona_sede_appartenenza, crea_persona, crea_sede, crea_appartenenza, \
     crea_utenza, crea_locazione, email_fittizzia
 from ufficio_soci.elenchi import ElencoElettoratoAlGiorno, ElencoSociAlGiorno, ElencoSostenitori, ElencoExSostenitori, \
     ElencoVolontari, ElencoTesseriniRichiesti, ElencoTesseriniDaRichiedere, ElencoSenzaTurni
-from ufficio_soci.forms import ModuloElencoElettorato, ModuloReclamaQuota
-from ufficio_soci.models import Tesseramento, Tesserino, Quota, Riduzione
+from ufficio_soci.forms import ModuloElencoElettorato, ModuloReclamaQuota, ModuloElencoVolontari
+from ufficio_soci.models import Tesseramento, Tesserino, Quota, Riduzione, EsportazioneElenco, ProgressivoQuota, \
+    StatoQuota
+from ufficio_soci.progressivi import prenota_progressivi
+from ufficio_soci.stato_quote import ricostruisci_stato_quote
+from ufficio_soci.codici_tesserini import assegna_codici, codice, permuta, SEQUENZA
 
 
 class TestBase(TestCase):
@@ -233,6 +241,203 @@ class TestBase(TestCase):
         self.a.save()
         x.delete()
 
+    def test_esportazione_elenco(self):
+
+        presidente = crea_persona()
+        sede = crea_sede(presidente)
+        persone = [crea_persona() for _ in range(3)]
+        for persona in persone:
+            crea_appartenenza(persona, sede)
+
+        elenco = ElencoVolontari(Sede.objects.filter(pk=sede.pk))
+        esportazione = EsportazioneElenco.nuova(
+            richiedente=presidente, elenco=elenco,
+            dati_modulo={'includi_estesi': ModuloElencoVolontari.SI},
+        )
+        esportazione.DIMENSIONE_BLOCCO = 2  # Verifica la lettura a blocchi
+        esportazione.esporta()
+
+        esportazione.refresh_from_db()
+        self.assertEqual(esportazione.stato, EsportazioneElenco.COMPLETATA)
+        self.assertEqual(esportazione.righe, 3)
+        self.assertEqual(esportazione.allegato.oggetto, presidente)
+
+        with zipfile.ZipFile(esportazione.allegato.file.path) as excel:
+            fogli = [x for x in excel.namelist() if x.startswith('xl/worksheets/sheet')]
+            self.assertEqual(len(fogli), 1, msg="Un foglio per la sede")
+            contenuto = excel.read(fogli[0]).decode('utf-8')
+        for persona in persone:
+            self.assertIn(persona.codice_fiscale, contenuto)
+
+        # Le esportazioni in attesa vengono elaborate dal cron
+        in_attesa = EsportazioneElenco.nuova(
+            richiedente=presidente, elenco=elenco,
+            dati_modulo={'includi_estesi': ModuloElencoVolontari.SI}, foglio_singolo=True,
+        )
+        self.assertFalse(in_attesa.terminata)
+        self.assertEqual(EsportazioneElenco.elabora_in_attesa(), 1)
+        in_attesa.refresh_from_db()
+        self.assertEqual(in_attesa.stato, EsportazioneElenco.COMPLETATA)
+        self.assertEqual(in_attesa.righe, 3)
+        self.assertEqual(EsportazioneElenco.elabora_in_attesa(), 0)
+
+        # Un'esportazione rimasta in corso (processo terminato) viene segnata come fallita
+        interrotta = EsportazioneElenco.nuova(richiedente=presidente, elenco=elenco)
+        EsportazioneElenco.objects.filter(pk=interrotta.pk).update(
+            stato=EsportazioneElenco.IN_CORSO, ultima_modifica=timezone.now() - datetime.timedelta(hours=2),
+        )
+        self.assertEqual(EsportazioneElenco.segna_interrotte(), 1)
+        interrotta.refresh_from_db()
+        self.assertEqual(interrotta.stato, EsportazioneElenco.ERRORE)
+        self.assertTrue(interrotta.terminata)
+
+    def test_elenco_query_costanti(self):
+
+        presidente = crea_persona()
+        sede = crea_sede(presidente)
+        elenco = ElencoVolontari(Sede.objects.filter(pk=sede.pk))
+        elenco.modulo_riempito = ModuloElencoVolontari({'includi_estesi': ModuloElencoVolontari.SI})
+        self.assertTrue(elenco.modulo_riempito.is_valid())
+
+        def _query_per_pagina():
+            with CaptureQueriesContext(connection) as query:
+                pagina = list(elenco.annota(elenco.ordina(elenco.risultati())))
+                for persona in pagina:
+                    [colonna[1](persona) for colonna in elenco.excel_colonne()]
+                    elenco.excel_foglio(persona)
+                    [a.sede for a in persona.appartenenze_attuali_elenco]  # Colonna "Sede" del template
+            return len(pagina), len(query)
+
+        for _ in range(2):
+            persona = crea_persona()
+            crea_appartenenza(persona, sede)
+            Telefono.objects.create(persona=persona, numero="+39 06 1234567")
+        righe, query = _query_per_pagina()
+        self.assertEqual(righe, 2)
+
+        for _ in range(4):
+            crea_appartenenza(crea_persona(), sede)
+        righe, query_piu_righe = _query_per_pagina()
+        self.assertEqual(righe, 6)
+        self.assertEqual(query, query_piu_righe, msg="Numero di query indipendente dal numero di righe")
+
+    def test_stato_quote(self):
+
+        sede = crea_sede()
+        volontari = [crea_persona() for _ in range(3)]
+        appartenenze = [crea_appartenenza(persona, sede) for persona in volontari]
+        ordinario = crea_persona()
+        crea_appartenenza(ordinario, sede, tipo=Appartenenza.ORDINARIO)
+        anno = poco_fa().year
+        tesseramento = Tesseramento.objects.create(stato=Tesseramento.APERTO, anno=anno, inizio=poco_fa().date())
+
+        def _confronta(**kwargs):
+            with self.settings(QUOTE_STATO_PRECALCOLATO=False):
+                paganti = set(tesseramento.paganti(**kwargs))
+                non_paganti = set(tesseramento.non_paganti(**kwargs))
+            self.assertEqual(set(tesseramento.paganti(**kwargs)), paganti)
+            self.assertEqual(set(tesseramento.non_paganti(**kwargs)), non_paganti)
+            return paganti, non_paganti
+
+        paganti, non_paganti = _confronta(attivi=True, ordinari=False)
+        self.assertEqual(paganti, set())
+        self.assertEqual(non_paganti, set(volontari))
+
+        quota = Quota.nuova(appartenenze[0], poco_fa().date(), None, 10, "Quota", invia_notifica=False)
+        Quota.nuova(appartenenze[1], poco_fa().date(), None, 8, "Quota", tipo=Quota.RICEVUTA, invia_notifica=False)
+        paganti, non_paganti = _confronta(attivi=True, ordinari=False)
+        self.assertEqual(paganti, {volontari[0]})
+        self.assertEqual(non_paganti, set(volontari[1:]))
+        _confronta(attivi=False, ordinari=True)
+        self.assertTrue(tesseramento.pagante(volontari[0], attivi=True, ordinari=False))
+        self.assertFalse(tesseramento.non_pagante(volontari[0], attivi=True, ordinari=False))
+        self.assertFalse(tesseramento.pagante(ordinario, attivi=True, ordinari=False))
+
+        totali = tesseramento.totali_per_sede([sede])
+        self.assertEqual(totali[sede.pk]['paganti'], 1)
+        self.assertEqual(totali[sede.pk]['non_paganti'], 3)
+        self.assertEqual(totali[sede.pk]['importo'], 10)
+
+        quota.annulla(None, invia_notifica=False)
+        self.assertFalse(tesseramento.pagante(volontari[0], attivi=True, ordinari=False))
+        self.assertTrue(tesseramento.non_pagante(volontari[0], attivi=True, ordinari=False))
+
+        # La fine dell'appartenenza prima dell'anno esclude il volontario
+        appartenenze[2].fine = datetime.date(anno - 1, 12, 31)
+        appartenenze[2].save()
+        paganti, non_paganti = _confronta(attivi=True, ordinari=False)
+        self.assertEqual(non_paganti, set(volontari[:2]))
+
+        # Il ricalcolo completo aggiorna le righe esistenti senza duplicarle
+        righe = StatoQuota.objects.filter(anno=anno).count()
+        ricostruisci_stato_quote(anno)
+        self.assertEqual(StatoQuota.objects.filter(anno=anno).count(), righe)
+        _confronta(attivi=True, ordinari=False)
+
+    def test_progressivi_quote(self):
+
+        persona, sede, appartenenza = crea_persona_sede_appartenenza()
+        oggi = poco_fa().date()
+        Tesseramento.objects.create(stato=Tesseramento.APERTO, anno=oggi.year, inizio=oggi)
+
+        def _nuova(**kwargs):
+            return Quota.nuova(appartenenza, oggi, None, 8, "Quota", invia_notifica=False, **kwargs).progressivo
+
+        self.assertEqual(_nuova(), 1)
+        self.assertEqual(list(prenota_progressivi(sede, oggi.year, quantita=3)), [2, 3, 4])
+        self.assertEqual(_nuova(), 5)
+        self.assertEqual(_nuova(progressivo=3), 3)
+        self.assertEqual(list(prenota_progressivi(crea_sede(), oggi.year)), [1])
+
+        # Una quota registrata senza il contatore non causa progressivi duplicati
+        Quota.objects.create(persona=persona, sede=sede, anno=oggi.year, progressivo=6, data_versamento=oggi,
+                             importo=8, causale="Quota")
+        self.assertEqual(_nuova(), 7)
+        self.assertEqual(ProgressivoQuota.objects.get(sede=sede, anno=oggi.year).ultimo, 7)
+
+    def test_codici_tesserini(self):
+
+        sede = crea_sede()
+        tesserini = [
+            Tesserino.objects.create(persona=crea_persona(), emesso_da=sede, richiesto_da=crea_persona())
+            for _ in range(4)
+        ]
+        # Un codice assegnato prima della sequenza, che la sequenza darebbe al prossimo tesserino
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT last_value, is_called FROM %s" % (SEQUENZA,))
+            ultimo, chiamata = cursor.fetchone()
+        tesserini[0].codice = codice(ultimo if chiamata else ultimo - 1)
+        tesserini[0].save()
+
+        self.assertEqual(assegna_codici(Tesserino.objects.all()), 3)
+        codici = set(Tesserino.objects.values_list('codice', flat=True))
+        self.assertEqual(len(codici), 4)
+        self.assertIn(tesserini[0].codice, codici)
+        for c in codici:
+            self.assertEqual(len(c), 13)
+            self.assertEqual(c[-1], ean13_carattere_di_controllo(c[:-1]))
+
+        self.assertEqual(assegna_codici(Tesserino.objects.all()), 0)
+        self.assertEqual(len({permuta(n) for n in range(10000)}), 10000)
+
+    @override_settings(PDF_MOTORE='base.pdf.MotoreFinto', PDF_GIORNI_CACHE=1)
+    def test_tesserino_pdf_cache(self):
+
+        persona, sede, _ = crea_persona_sede_appartenenza()
+        tesserino = Tesserino.objects.create(persona=persona, emesso_da=sede, richiesto_da=persona)
+        assegna_codici(Tesserino.objects.filter(pk=tesserino.pk))
+        tesserino.refresh_from_db()
+
+        MotoreFinto.chiamate = []
+        primo = tesserino.genera_pdf()
+        # L'ora di generazione cambia, ma non la chiave della cache
+        with freeze_time(timezone.now() + datetime.timedelta(hours=1)):
+            secondo = tesserino.genera_pdf()
+        self.assertEqual(len(MotoreFinto.chiamate), 1, msg="Tesserino identico generato una volta")
+        self.assertIn('data:image/png;base64,', MotoreFinto.chiamate[0])
+        with open(primo.file.path, 'rb') as f1, open(secondo.file.path, 'rb') as f2:
+            self.assertEqual(f1.read(), f2.read())
+
     def test_zero_turni(self):
 
         presidente = crea_persona()
@@ -2,7 +2,9 @@ import json
 import random
 from collections import OrderedDict
 
+from django.conf import settings
 from django.core.paginator import Paginator
+from django.http import JsonResponse
 from django.db.models import Sum, Q
 from django.shortcuts import redirect, get_object_or_404
 from django.utils.safestring import mark_safe
@@ -16,7 +18,6 @@ from anagrafica.permessi.costanti import GESTIONE_SOCI, ELENCHI_SOCI , ERRORE_PE
 from autenticazione.forms import ModuloCreazioneUtenza
 from autenticazione.funzioni import pagina_privata, pagina_pubblica
 from base.errori import errore_generico, errore_nessuna_appartenenza, messaggio_generico
-from base.files import Excel, FoglioExcel
 from base.notifiche import NOTIFICA_INVIA
 from base.utils import poco_fa, testo_euro, oggi
 from posta.models import Messaggio
@@ -29,7 +30,8 @@ from ufficio_soci.forms import ModuloCreazioneEstensione, ModuloAggiungiPersona,
     ModuloReclamaQuota, ModuloReclama, ModuloCreazioneDimissioni, ModuloVerificaTesserino, ModuloElencoRicevute, \
     ModuloCreazioneRiserva, ModuloCreazioneTrasferimento, ModuloQuotaVolontario, ModuloNuovaRicevuta, ModuloFiltraEmissioneTesserini, \
     ModuloLavoraTesserini, ModuloScaricaTesserini, ModuloDimissioniSostenitore
-from ufficio_soci.models import Quota, Tesseramento, Tesserino, Riduzione
+from ufficio_soci.models import Quota, Tesseramento, Tesserino, Riduzione, EsportazioneElenco
+from ufficio_soci.codici_tesserini import assegna_codici
 
 
 @pagina_privata(permessi=(GESTIONE_SOCI,))
@@ -547,7 +549,7 @@ def us_elenco(request, me, elenco_id=None, pagina=1):
     download_url = "/us/elenco/%s/download/" % (elenco_id,)
     messaggio_url = "/us/elenco/%s/messaggio/" % (elenco_id,)
 
-    risultati = elenco.ordina(elenco.risultati())
+    risultati = elenco.annota(elenco.ordina(elenco.risultati()))
     if filtra:  # Se keyword specificata, filtra i risultati
         risultati = elenco.filtra(risultati, filtra)
 
@@ -619,61 +621,42 @@ def us_elenco_download(request, me, elenco_id):
         if not modulo.is_valid():  # Se il modulo non e' valido, qualcosa e' andato storto
             return redirect("/us/elenco/%s/modulo/" % (elenco_id,))  # Prova nuovamente?
 
-        elenco.modulo_riempito = modulo  # Imposta il modulo
+    # Il file viene generato in background (vedi ufficio_soci.cron), insieme al modulo
+    esportazione = EsportazioneElenco.nuova(
+        richiedente=me, elenco=elenco,
+        dati_modulo=request.session.get("elenco_modulo_%s" % (elenco_id,)),
+        foglio_singolo='foglio_singolo' in request.GET,
+    )
 
-    FOGLIO_DEFAULT = "Foglio 1"
+    return redirect("/us/esportazione/%d/" % (esportazione.pk,))
 
-    fogli_multipli = True
-    if 'foglio_singolo' in request.GET:
-        fogli_multipli = False
 
-    # Ottiene elenco
-    persone = elenco.ordina(elenco.risultati())
+@pagina_privata
+def us_elenco_esportazione(request, me, esportazione_pk):
+    esportazione = get_object_or_404(EsportazioneElenco, pk=esportazione_pk, richiedente=me)
 
-    # Crea nuovo excel
-    excel = Excel(oggetto=me)
-
-    # Ottiene intestazione e funzioni colonne
-    intestazione = [x[0] for x in elenco.excel_colonne()]
-    colonne = [x[1] for x in elenco.excel_colonne()]
-    if not fogli_multipli:
-        intestazione += ["Elenco"]
-
-    fogli = {}
-
-    def __semplifica_nome(nome):
-        return nome\
-            .replace("/", "")\
-            .replace(": ", "-")\
-            .replace("Comitato ", "")\
-            .replace("Locale ", "")\
-            .replace("Provinciale ", "")\
-            .replace("Di ", "")\
-            .replace("di ", "")\
-            .replace("Della ", "")\
-            .replace("Dell'", "")\
-            .replace("Del ", "")
-
-    for persona in persone:
-        foglio = __semplifica_nome(elenco.excel_foglio(persona))[:31] if fogli_multipli else FOGLIO_DEFAULT
-        foglio_key = foglio.lower().strip()
-        if foglio_key not in [x.lower() for x in fogli.keys()]:
-            fogli.update({
-                foglio_key: FoglioExcel(foglio, intestazione)
-            })
-
-        persona_colonne = [y if y is not None else "" for y in [x(persona) for x in colonne]]
-        if not fogli_multipli:
-            persona_colonne += [elenco.excel_foglio(persona)]
-
-        fogli[foglio_key].aggiungi_riga(
-            *persona_colonne
-        )
+    if esportazione.stato == esportazione.COMPLETATA and esportazione.allegato:
+        return redirect(esportazione.allegato.download_url)
 
-    excel.fogli = fogli.values()
-    excel.genera_e_salva("Elenco.xlsx")
+    contesto = {
+        "esportazione": esportazione,
+        "stato_url": "/us/esportazione/%d/stato/" % (esportazione.pk,),
+    }
+    return 'us_elenco_esportazione.html', contesto
 
-    return redirect(excel.download_url)
+
+@pagina_privata
+def us_elenco_esportazione_stato(request, me, esportazione_pk):
+    """
+    Ritorna lo stato di una esportazione in JSON, per l'aggiornamento della pagina di attesa.
+    """
+    esportazione = get_object_or_404(EsportazioneElenco, pk=esportazione_pk, richiedente=me)
+    return JsonResponse({
+        "stato": esportazione.stato,
+        "terminata": esportazione.terminata,
+        "righe": esportazione.righe,
+        "download_url": esportazione.allegato.download_url if esportazione.allegato else None,
+    })
 
 
 @pagina_privata
@@ -1360,9 +1343,7 @@ def us_tesserini_emissione_processa(request, me):
 
             # Assicurati che i tesserini abbiano un codice prima di attivarli
             if stato_richiesta == Tesserino.ACCETTATO:
-                tesserini_senza_codice = tesserini.filter(Tesserino.query_senza_codice().q)
-                for x in tesserini_senza_codice:
-                    x.assicura_presenza_codice()
+                assegna_codici(tesserini)
 
             tesserini.update(valido=valido)
 
@@ -1412,6 +1393,37 @@ def us_tesserini_emissione_scarica(request, me):
         "tesserini_secondi": 3,
         "tesserini_link_json": json.dumps(tesserini_link),
         "tesserini_link": tesserini_link,
+        "pdf_unico": len(tesserini_link) <= settings.PDF_TESSERINI_MASSIMO,
     }
 
     return "us_tesserini_emissione_scarica.html", contesto
+
+
+@pagina_privata
+def us_tesserini_emissione_scarica_unico(request, me):
+    """
+    Scarica i tesserini selezionati in un solo PDF, un tesserino per pagina.
+     Il PDF viene generato durante la richiesta: al massimo settings.PDF_TESSERINI_MASSIMO tesserini.
+    """
+    from base.viste import pdf_forza_scaricamento
+    sedi = me.oggetti_permesso(EMISSIONE_TESSERINI)
+    tesserini_pk = request.session.get('tesserini', default=[])
+    tesserini = Tesserino.objects.filter(
+        pk__in=tesserini_pk, emesso_da__in=sedi
+    ).select_related('persona').order_by('persona__cognome', 'persona__nome', 'pk')
+
+    numero = tesserini.count()
+    if not numero:
+        return redirect("/us/tesserini/emissione/")
+
+    if numero > settings.PDF_TESSERINI_MASSIMO:
+        return errore_generico(
+            request, me, titolo="Troppi tesserini selezionati",
+            messaggio="Possono essere scaricati al massimo %d tesserini in un solo PDF (selezionati: %d). "
+                      "Seleziona meno tesserini, o scaricali singolarmente." % (settings.PDF_TESSERINI_MASSIMO,
+                                                                                  numero),
+            torna_titolo="Torna allo scaricamento", torna_url="/us/tesserini/emissione/scarica/",
+        )
+
+    pdf = Tesserino.genera_pdf_unico(tesserini, oggetto=me)
+    return pdf_forza_scaricamento(request, pdf)
@@ -4,7 +4,7 @@ from django.db import models
 from anagrafica.models import Persona, Sede
 from base.geo import ConGeolocalizzazione
 from base.models import ModelloSemplice
-from base.tratti import ConEstensione, ConStorico
+from base.tratti import ConEstensione, ConStoricoIndicizzato
 from base.tratti import ConMarcaTemporale
 from veicoli.validators import valida_data_manutenzione
 
@@ -213,7 +213,7 @@ class Veicolo(ModelloSemplice, ConMarcaTemporale):
 #     veicolo = models.ForeignKey(Veicolo, related_name='richieste_immatricolazione', on_delete=models.CASCADE)
 
 
-class Collocazione(ModelloSemplice, ConStorico, ConMarcaTemporale):
+class Collocazione(ModelloSemplice, ConStoricoIndicizzato, ConMarcaTemporale):
 
     class Meta:
         verbose_name = "Collocazione veicolo"
@@ -232,7 +232,7 @@ class Collocazione(ModelloSemplice, ConStorico, ConMarcaTemporale):
         self.save()
 
 
-class FermoTecnico(ModelloSemplice, ConStorico, ConMarcaTemporale):
+class FermoTecnico(ModelloSemplice, ConStoricoIndicizzato, ConMarcaTemporale):
 
     class Meta:
         verbose_name = "Fermo tecnico"